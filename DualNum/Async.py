@@ -0,0 +1,116 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .Dual import Dual
+
+
+async def compute_derivative_async(func, xs, dual_class=Dual, max_concurrency=16, timeout=None,
+                                   return_values=False, executor=None):
+    """
+    Computes the derivative of a function at many points concurrently.
+
+    Meant for functions that spend their time waiting (a request to a model
+    server, a file read) rather than computing. Coroutine functions are
+    awaited on the running event loop; plain functions run on a thread
+    pool. At most ``max_concurrency`` evaluations are in flight at a time,
+    and the results are returned in input order whatever order the
+    evaluations finish in.
+
+    If an evaluation raises or times out, or the caller is cancelled, the
+    evaluations still in flight are cancelled and the exception propagates.
+    Evaluations already running on a thread cannot be interrupted; they
+    finish in the background and their results are discarded.
+
+    Parameters
+    ----------
+    func : function or coroutine function
+        The function to differentiate, called with one dual number.
+
+    xs : array_like
+        The points at which to compute the derivative.
+
+    dual_class : Dual or Dual_c, optional
+        The class to use for dual numbers.
+
+    max_concurrency : int, optional
+        The maximum number of evaluations in flight.
+
+    timeout : float, optional
+        The time limit in seconds of each evaluation; unlimited by default.
+
+    return_values : bool, optional
+        If True, also return the function values.
+
+    executor : concurrent.futures.Executor, optional
+        The executor running a synchronous ``func``. By default a thread
+        pool of ``max_concurrency`` threads is created for the call.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        The function values, with the shape of ``xs``. Only returned if
+        ``return_values`` is True.
+
+    derivatives : numpy.ndarray
+        The derivatives, with the shape of ``xs``.
+
+    Raises
+    ------
+    TimeoutError
+        If an evaluation takes longer than ``timeout``.
+
+    ValueError
+        If 'max_concurrency' is not positive.
+
+    Examples
+    --------
+    >>> async def f(x):
+    ...     scale = await fetch_scale()  # doctest: +SKIP
+    ...     return scale * x.sin()
+    >>> asyncio.run(compute_derivative_async(f, np.linspace(0, 1, 100), max_concurrency=8))  # doctest: +SKIP
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"Expected a positive concurrency limit, got {max_concurrency} instead.")
+    xs = np.asarray(xs, dtype=np.float64)
+    values = np.empty(xs.size)
+    derivatives = np.empty(xs.size)
+
+    owned = None
+    if inspect.iscoroutinefunction(func):
+        evaluate = func
+    else:
+        if executor is None:
+            executor = owned = ThreadPoolExecutor(max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        def evaluate(x):
+            return loop.run_in_executor(executor, func, x)
+
+    # A fixed set of workers pulling from one iterator bounds the tasks as well as the concurrency
+    pending = enumerate(xs.ravel().tolist())
+
+    async def worker():
+        for i, x in pending:
+            y = await asyncio.wait_for(evaluate(dual_class(x, 1)), timeout)
+            if isinstance(y, (float, int)):
+                values[i], derivatives[i] = y, 0.0
+            else:
+                values[i], derivatives[i] = y.real, y.dual
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(max_concurrency, xs.size))]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    finally:
+        if owned is not None:
+            owned.shutdown(wait=False, cancel_futures=True)
+
+    values, derivatives = values.reshape(xs.shape), derivatives.reshape(xs.shape)
+    return (values, derivatives) if return_values else derivatives
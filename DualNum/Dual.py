@@ -1,5 +1,103 @@
 import math
 
+import numpy as np
+
+_object_new = object.__new__
+
+# NumPy ufuncs implemented by the methods of every dual-number class, so that
+# np.sin(x) calls x.sin() and np.add(a, x) calls x.__radd__(a).
+UNARY_UFUNCS = {
+    np.sin: "sin", np.cos: "cos", np.tan: "tan", np.exp: "exp", np.log: "log", np.sqrt: "sqrt",
+    np.sinh: "sinh", np.cosh: "cosh", np.tanh: "tanh", np.arcsin: "asin", np.arccos: "acos", np.arctan: "atan",
+}
+BINARY_UFUNCS = {
+    np.add: ("__add__", "__radd__"),
+    np.subtract: ("__sub__", "__rsub__"),
+    np.multiply: ("__mul__", "__rmul__"),
+    np.true_divide: ("__truediv__", "__rtruediv__"),
+    np.power: ("__pow__", "__rpow__"),
+    np.equal: ("__eq__", "__eq__"),
+    np.not_equal: ("__ne__", "__ne__"),
+}
+
+
+def _new(real, dual):
+    """
+    Builds a Dual without going through __init__ (no type checks).
+
+    Operators and elementary functions only ever produce float parts, so
+    their results skip the validation done for user input.
+    """
+    result = _object_new(Dual)
+    result.real = real
+    result.dual = dual
+    return result
+
+
+def _float_pow(base, exponent):
+    """
+    Returns ``base ** exponent`` as a float, with +/-inf on overflow as in C
+    instead of Python's OverflowError.
+    """
+    try:
+        return float(base) ** exponent
+    except OverflowError:
+        return -math.inf if base < 0 and exponent % 2 == 1 else math.inf
+
+
+def _apply_ufunc(cls, ufunc, inputs):
+    """
+    Applies a ufunc of `UNARY_UFUNCS` or `BINARY_UFUNCS` through the methods
+    of the operand of class ``cls``. Returns NotImplemented for other ufuncs
+    or operands the methods do not accept.
+    """
+    if ufunc in UNARY_UFUNCS:
+        return getattr(inputs[0], UNARY_UFUNCS[ufunc])()
+    if ufunc not in BINARY_UFUNCS or len(inputs) != 2:
+        return NotImplemented
+    forward, reflected = BINARY_UFUNCS[ufunc]
+    a, b = inputs
+    if isinstance(a, cls):
+        return getattr(a, forward)(b)
+    method = getattr(b, reflected, None)
+    return NotImplemented if method is None else method(a)
+
+
+def _scalar_array_ufunc(cls, ufunc, method, inputs, kwargs):
+    """
+    Implements ``__array_ufunc__`` for a scalar dual-number class ``cls``.
+
+    Scalar operands go through the methods of ``cls``. With an array
+    operand the dual numbers continue as 0-d `DualArray` objects, which
+    broadcast against it.
+    """
+    if method != "__call__" or kwargs or (ufunc not in UNARY_UFUNCS and ufunc not in BINARY_UFUNCS):
+        return NotImplemented
+    inputs = [float(x) if isinstance(x, np.number) else x for x in inputs]
+    if all(isinstance(x, (cls, float, int)) for x in inputs):
+        return _apply_ufunc(cls, ufunc, inputs)
+    from .DualArray import DualArray
+    return ufunc(*[DualArray(x.real, x.dual) if isinstance(x, cls) else x for x in inputs])
+
+
+def _scalar_array_function(cls, func, args, kwargs):
+    """
+    Implements ``__array_function__`` for a scalar dual-number class ``cls``.
+
+    The dual numbers are passed on as 0-d `DualArray` objects to the
+    `DualArray` implementation, and a scalar result is returned as ``cls``.
+    """
+    from .DualArray import DualArray, ARRAY_FUNCTIONS
+    if func not in ARRAY_FUNCTIONS:
+        return NotImplemented
+    args = [DualArray(x.real, x.dual) if isinstance(x, cls) else x for x in args]
+    kwargs = {k: DualArray(x.real, x.dual) if isinstance(x, cls) else x for k, x in kwargs.items()}
+    result = ARRAY_FUNCTIONS[func](*args, **kwargs)
+    if isinstance(result, (Dual, DualArray)) and np.ndim(result.real) == 0:
+        return cls(float(result.real), float(result.dual))
+    return result
+
+
 class Dual:
     """
     A class to represent a dual number for use in automatic differentiation.
@@ -19,8 +117,16 @@ class Dual:
     >>> z = x.sin() + y.log()
     >>> z
     Dual(real=2.0079097154937915, dual=-0.4161468365471424)
+
+    NumPy functions dispatch to the dual-number methods:
+
+    >>> np.sin(x) * 2
+    Dual(real=1.8185948536513634, dual=-0.8322936730942848)
     """
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("real", "dual")
+
     # Special Methods
     def __init__(self, real, dual):
         """
@@ -59,10 +165,10 @@ class Dual:
             The value to add to the current dual number.
         """
         if isinstance(other, Dual):
-            return Dual(self.real + other.real, self.dual + other.dual)
+            return _new(self.real + other.real, self.dual + other.dual)
         if isinstance(other, (float, int)):
-            return Dual(self.real + other, self.dual)
-        raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
+            return _new(self.real + other, self.dual)
+        return NotImplemented
     
     def __radd__(self, other):
         """
@@ -85,21 +191,23 @@ class Dual:
             The value to subtract from the current dual number.
         """
         if isinstance(other, Dual):
-            return Dual(self.real - other.real, self.dual - other.dual)
+            return _new(self.real - other.real, self.dual - other.dual)
         if isinstance(other, (float, int)):
-            return Dual(self.real - other, self.dual)
-        raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
+            return _new(self.real - other, self.dual)
+        return NotImplemented
     
     def __rsub__(self, other):
         """
-        Subtracts one dual number from another dual or int/float.
+        Subtracts the dual number from an int/float.
 
         Parameters
         ----------
-        other : Dual, int, or float
-            The value to subtract from the current dual number.
+        other : int, or float
+            The value the current dual number is subtracted from.
         """
-        return self.__sub__(other)
+        if isinstance(other, (float, int)):
+            return _new(other - self.real, -self.dual)
+        return NotImplemented
     
     def __mul__(self, other):
         """
@@ -111,10 +219,10 @@ class Dual:
             The value to multiply with the current dual number.
         """
         if isinstance(other, Dual):
-            return Dual(self.real * other.real, self.real * other.dual + self.dual * other.real)
+            return _new(self.real * other.real, self.real * other.dual + self.dual * other.real)
         if isinstance(other, (float, int)):
-            return Dual(self.real * other, self.dual * other)
-        raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
+            return _new(self.real * other, self.dual * other)
+        return NotImplemented
     
     def __rmul__(self, other):
         """
@@ -136,37 +244,105 @@ class Dual:
         other : Dual, int, or float
             The value to divide the current dual number by.
         """
-        if other.real == 0:
-            raise ZeroDivisionError("division by zero is undefined")
         if isinstance(other, Dual):
-            return Dual(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
+            if other.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            # The quotient is reused in the derivative: (a/b)' = (a' - (a/b) b') / b
+            q = self.real / other.real
+            return _new(q, (self.dual - q * other.dual) / other.real)
         if isinstance(other, (float, int)):
-            return Dual(self.real / other, self.dual / other)
-        raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+            if other == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return _new(self.real / other, self.dual / other)
+        return NotImplemented
     
     def __rtruediv__(self, other):
         """
-        Divides one dual number by another dual number or an int/float.
+        Divides an int/float by the dual number.
 
         Parameters
         ----------
-        other : Dual, int, or float
-            The value to divide the current dual number by.
+        other : int, or float
+            The value to divide by the current dual number.
         """
-        return self.__truediv__(other)
+        if isinstance(other, (float, int)):
+            if self.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            q = other / self.real
+            return _new(q, -q * self.dual / self.real)
+        return NotImplemented
     
     def __pow__(self, other):
         """
-        Raises the dual number to the power of another dual number.
+        Raises the dual number to the power of another dual number or an int/float.
+
+        A constant exponent (or a dual one with zero dual part) uses
+        ``n * x ** (n - 1)`` without a logarithm, so negative bases are
+        accepted with integer exponents.
 
         Parameters
         ----------
-        other : Dual
-            The dual number to raise the current dual number to the power of.
+        other : Dual, int, or float
+            The exponent.
+
+        Raises
+        ------
+        ValueError
+            If a negative base is raised to a non-integer power, or a
+            non-positive base to a dual exponent with a non-zero dual part.
+
+        ZeroDivisionError
+            If zero is raised to a negative power, or to a non-integer power
+            below 1 (where the derivative is infinite).
         """
         if isinstance(other, Dual):
-            return Dual(self.real ** other.real, self.real ** other.real * (other.dual * math.log(self.real) + other.real * self.dual / self.real))
-        raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+            if other.dual != 0:
+                if self.real <= 0:
+                    raise ValueError("math domain error")
+                p = self.real ** other.real
+                return _new(p, p * (other.dual * math.log(self.real) + other.real * self.dual / self.real))
+            other = other.real
+        if isinstance(other, int):
+            if other == 0:
+                return _new(1.0, 0.0)
+            if other < 0 and self.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            p = _float_pow(self.real, other - 1)
+            return _new(p * self.real, other * p * self.dual)
+        if isinstance(other, float):
+            r = self.real
+            if r <= 0:
+                if other.is_integer():
+                    return self.__pow__(int(other))
+                if r < 0:
+                    raise ValueError("math domain error")
+                if other < 1:
+                    raise ZeroDivisionError("division by zero is undefined")
+                return _new(0.0, 0.0)
+            p = _float_pow(r, other)
+            return _new(p, other * p / r * self.dual)
+        return NotImplemented
+
+    def __rpow__(self, other):
+        """
+        Raises an int/float to the power of the dual number.
+
+        Parameters
+        ----------
+        other : int, or float
+            The base, which must be positive.
+
+        Raises
+        ------
+        ValueError
+            If the base is not positive.
+        """
+        if isinstance(other, (float, int)):
+            if other <= 0:
+                raise ValueError("math domain error")
+            p = other ** self.real
+            return _new(p, p * math.log(other) * self.dual)
+        return NotImplemented
 
     def __eq__(self, other):
         """
@@ -188,6 +364,21 @@ class Dual:
         Returns a string representation of the dual number.
         """
         return f'Dual(real={self.real}, dual={self.dual})'
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Implements NumPy ufuncs (see `UNARY_UFUNCS` and `BINARY_UFUNCS`) with
+        the dual-number methods, returning a `DualArray` when an operand is
+        an array.
+        """
+        return _scalar_array_ufunc(Dual, ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Implements the NumPy functions supported by `DualArray` (``np.sum``,
+        ``np.dot``, ``np.where``, ...).
+        """
+        return _scalar_array_function(Dual, func, args, kwargs)
     
 
     # Class Methods
@@ -207,25 +398,27 @@ class Dual:
         """
         Returns the sine of the dual number.
         """
-        return Dual(math.sin(self.real), self.dual * math.cos(self.real))
+        return _new(math.sin(self.real), self.dual * math.cos(self.real))
     
     def cos(self):
         """
         Returns the cosine of the dual number.
         """
-        return Dual(math.cos(self.real), -self.dual * math.sin(self.real))
+        return _new(math.cos(self.real), -self.dual * math.sin(self.real))
     
     def tan(self):
         """
         Returns the tangent of the dual number.
         """
-        return Dual(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))
+        t = math.tan(self.real)
+        return _new(t, self.dual * (1 + t * t))
     
     def exp(self):
         """
         Returns the exponential of the dual number.
         """
-        return Dual(math.exp(self.real), self.dual * math.exp(self.real))
+        e = math.exp(self.real)
+        return _new(e, self.dual * e)
     
     def log(self):
         """
@@ -233,49 +426,51 @@ class Dual:
         """
         if self.real <= 0:
             raise ValueError("Logarithm of a non-positive number is undefined.")
-        return Dual(math.log(self.real), self.dual / self.real)
+        return _new(math.log(self.real), self.dual / self.real)
     
     def sqrt(self):
         """
         Returns the square root of the dual number.
         """
-        return Dual(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))
+        s = math.sqrt(self.real)
+        return _new(s, self.dual / (2 * s))
     
     def sinh(self):
         """
         Returns the hyperbolic sine of the dual number.
         """
-        return Dual(math.sinh(self.real), self.dual * math.cosh(self.real))
+        return _new(math.sinh(self.real), self.dual * math.cosh(self.real))
 
     def cosh(self):
         """
         Returns the hyperbolic cosine of the dual number.
         """
-        return Dual(math.cosh(self.real), self.dual * math.sinh(self.real))
+        return _new(math.cosh(self.real), self.dual * math.sinh(self.real))
     
     def tanh(self):
         """
         Returns the hyperbolic tangent of the dual number.
         """
-        return Dual(math.tanh(self.real), self.dual / (math.cosh(self.real) ** 2))
+        c = math.cosh(self.real)
+        return _new(math.tanh(self.real), self.dual / (c * c))
     
     def asin(self):
         """
         Returns the arcsine of the dual number.
         """
-        return Dual(math.asin(self.real), self.dual / math.sqrt(1 - self.real ** 2))
+        return _new(math.asin(self.real), self.dual / math.sqrt(1 - self.real * self.real))
     
     def acos(self):
         """
         Returns the arccosine of the dual number.
         """
-        return Dual(math.acos(self.real), -self.dual / math.sqrt(1 - self.real ** 2))
+        return _new(math.acos(self.real), -self.dual / math.sqrt(1 - self.real * self.real))
     
     def atan(self):
         """
         Returns the arctangent of the dual number.
         """
-        return Dual(math.atan(self.real), self.dual / (1 + self.real ** 2))
+        return _new(math.atan(self.real), self.dual / (1 + self.real * self.real))
     
 
 
@@ -0,0 +1,1209 @@
+import numpy as np
+
+from .Dual import Dual, BINARY_UFUNCS, UNARY_UFUNCS, _apply_ufunc
+
+try:
+    from DualNum_c import Dual_c
+    _SCALAR_DUALS = (Dual, Dual_c)
+except ImportError:
+    Dual_c = None
+    _SCALAR_DUALS = (Dual,)
+
+
+def _float_dtype(*values):
+    """
+    Returns the dtype NumPy promotes the values to if it is a floating one, otherwise float64.
+    """
+    dtype = np.result_type(*values)
+    return dtype if dtype.kind == "f" else np.dtype(np.float64)
+
+
+def _constant(other):
+    """
+    Returns ``other`` if it is a constant (int, float, NumPy scalar or
+    ndarray), otherwise ``None``. Python numbers are returned as floats,
+    which NumPy promotes to the precision of the array they are combined
+    with; integer NumPy scalars and arrays are converted to float64.
+    """
+    if isinstance(other, np.number):
+        return other if isinstance(other, np.floating) else np.float64(other)
+    if isinstance(other, (float, int)):
+        return float(other)
+    if isinstance(other, np.ndarray):
+        return other if other.dtype.kind == "f" else other.astype(np.float64)
+    return None
+
+
+def _check_power(base, exponent, variable):
+    """
+    Raises the errors of `Dual.__pow__` for a power whose base has non-positive elements.
+
+    ``variable`` is true where the exponent's dual part is non-zero.
+    """
+    base, exponent, variable = np.broadcast_arrays(base, exponent, variable)
+    integer = exponent == np.floor(exponent)
+    if np.any((base < 0) & ~integer) or np.any((base <= 0) & variable):
+        raise ValueError("math domain error")
+    if np.any((base == 0) & ((exponent < 0) | (~integer & (exponent < 1)))):
+        raise ZeroDivisionError("division by zero is undefined")
+
+
+def _check_unit_interval(t):
+    """
+    Raises the errors of `Dual.asin` and `Dual.acos` from ``t = 1 - x * x``.
+    """
+    lowest = np.fmin.reduce(t, axis=None, initial=np.inf)
+    if lowest <= 0:
+        if lowest < 0:
+            raise ValueError("math domain error")
+        raise ZeroDivisionError("division by zero is undefined")
+
+
+# The Workspace results and intermediates are drawn from, installed by
+# Workspace.__enter__ through _set_workspace; None allocates with NumPy.
+_workspace = None
+
+
+def _set_workspace(workspace):
+    """
+    Installs the workspace that dual-array buffers are taken from, or removes it if None.
+
+    Returns the previously installed workspace.
+    """
+    global _workspace
+    previous, _workspace = _workspace, workspace
+    return previous
+
+
+def _allocate(shape, dtype):
+    """
+    Returns an uninitialised array, from the active workspace if any.
+    """
+    if _workspace is None:
+        return np.empty(shape, dtype)
+    return _workspace._take(shape, dtype)
+
+
+# Implementations of NumPy functions for dual arrays, keyed by the NumPy function.
+ARRAY_FUNCTIONS = {}
+
+
+def _implements(function):
+    """
+    Registers the decorated function as the dual-array implementation of a NumPy function.
+    """
+    def decorator(implementation):
+        ARRAY_FUNCTIONS[function] = implementation
+        return implementation
+
+    return decorator
+
+
+class DualArray:
+    """
+    A class to represent an array of dual numbers for vectorized automatic differentiation.
+
+    The real and dual parts are stored as two contiguous ndarrays of the
+    same shape and floating dtype (float64 by default; float32 halves the
+    memory and bandwidth, ``np.longdouble`` extends the precision), and
+    every operation is evaluated with NumPy over the whole array at once.
+    The operator set and method names match `Dual`, so the same user
+    function can be applied to a `Dual` or to a `DualArray`.
+
+    Operands broadcast with NumPy rules: a `DualArray` can be combined with
+    another `DualArray`, a single `Dual` (or `Dual_c`), an int/float or a
+    plain ndarray, the last two being treated as constants. Dtypes promote
+    with NumPy rules too: Python numbers and `Dual` keep the precision of
+    the array, while a float64 array or NumPy scalar promotes a float32
+    one.
+
+    NumPy ufuncs for the elementary functions and arithmetic (``np.sin``,
+    ``np.exp``, ``np.add``, ...) and the functions in `ARRAY_FUNCTIONS`
+    (``np.sum``, ``np.dot``, ``np.where``, ...) dispatch to the vectorized
+    dual implementations, so model code written with NumPy functions can be
+    differentiated unchanged.
+
+    The in-place operators (``+=``, ``-=``, ``*=``, ``/=``) and the ``out``
+    parameter of the elementary functions write into existing arrays, and
+    inside a `Workspace` every result and intermediate reuses the buffers of
+    the previous evaluation, so repeated evaluations need not allocate.
+
+    Attributes
+    ----------
+    real : numpy.ndarray
+        The real parts of the dual numbers.
+
+    dual : numpy.ndarray
+        The dual parts of the dual numbers.
+
+    Examples
+    --------
+    >>> x = DualArray([1.0, 2.0, 3.0], [1.0, 1.0, 1.0])
+    >>> y = x * x + x.sin()
+    >>> y.dual
+    array([2.54030231, 3.58385316, 5.0100075 ])
+    """
+
+    # The (workspace, pass) whose buffers hold the parts, or None for arrays allocated by NumPy.
+    _stamp = None
+
+    # Special Methods
+    def __init__(self, real, dual=None, dtype=None):
+        """
+        Constructs all the necessary attributes for the DualArray object.
+
+        Parameters
+        ----------
+        real : array_like
+            The real parts of the dual numbers.
+
+        dual : array_like, optional
+            The dual parts of the dual numbers. Broadcast to the shape of
+            ``real``; defaults to zeros.
+
+        dtype : numpy.dtype, optional
+            The floating dtype of both parts. By default the one NumPy
+            promotes ``real`` and ``dual`` to, or float64 if that is not a
+            floating dtype.
+
+        Raises
+        ------
+        ValueError
+            If 'dual' cannot be broadcast to the shape of 'real', or 'dtype' is not a floating dtype.
+        """
+        real = np.asarray(real)
+        if dual is not None and type(dual) not in (float, int):
+            dual = np.asarray(dual)
+        if dtype is None:
+            dtype = _float_dtype(real) if dual is None else _float_dtype(real, dual)
+        elif np.dtype(dtype).kind != "f":
+            raise ValueError(f"Expected a floating dtype, got {np.dtype(dtype)} instead.")
+        real = np.asarray(real, dtype=dtype, order="C")
+        if dual is None:
+            dual = np.zeros_like(real)
+        else:
+            dual = np.asarray(dual, dtype=dtype, order="C")
+            if dual.shape != real.shape:
+                dual = np.array(np.broadcast_to(dual, real.shape), order="C")
+        self.real = real
+        self.dual = dual
+
+    @classmethod
+    def _from_parts(cls, real, dual):
+        """
+        Builds a DualArray from two ndarrays of equal shape and dtype without validation.
+        """
+        result = object.__new__(cls)
+        result.real = real
+        result.dual = dual
+        return result
+
+    @staticmethod
+    def _parts(other):
+        """
+        Returns the (real, dual) parts of a dual operand, or ``None`` if it is not one.
+        """
+        if isinstance(other, DualArray):
+            other._check_current()
+            return other.real, other.dual
+        if isinstance(other, _SCALAR_DUALS):
+            return float(other.real), float(other.dual)
+        return None
+
+    def _new(self, shape=None, dtype=None):
+        """
+        Returns an uninitialised dual array, by default of the same shape and dtype, from the active workspace if any.
+
+        Raises
+        ------
+        RuntimeError
+            If this array, an operand of the operation, is stale (see `_check_current`).
+        """
+        self._check_current()
+        shape = self.real.shape if shape is None else shape
+        dtype = self.real.dtype if dtype is None else dtype
+        result = DualArray._from_parts(_allocate(shape, dtype), _allocate(shape, dtype))
+        if _workspace is not None:
+            result._stamp = _workspace._stamp
+        return result
+
+    def _check_current(self):
+        """
+        Raises a RuntimeError if the array was computed in an earlier pass of
+        a `Workspace`, whose buffers may since have been handed out again.
+        """
+        stamp = self._stamp
+        if stamp is not None and stamp[1] != stamp[0]._passes:
+            raise RuntimeError(
+                "Expected a dual array computed in the current pass of its Workspace, got one from an earlier pass "
+                "instead; its buffers may have been reused, so copy results out before entering the workspace again."
+            )
+
+    def _result_shape(self, other_real):
+        """
+        Returns the shape of the result of a binary operation with an operand whose real part is given.
+        """
+        shape = np.shape(other_real)
+        if shape == () or shape == self.real.shape:
+            return self.real.shape
+        return np.broadcast_shapes(self.real.shape, shape)
+
+    def _result_dtype(self, other_real):
+        """
+        Returns the dtype of the result of a binary operation with an operand whose real part is given.
+        """
+        if type(other_real) is float or getattr(other_real, "dtype", None) == self.real.dtype:
+            return self.real.dtype
+        return np.result_type(self.real, other_real)
+
+    def _output(self, out):
+        """
+        Returns the output of an elementwise function: ``out`` after validation, or a new dual array.
+
+        Raises
+        ------
+        ValueError
+            If 'out' is not a dual array of the same shape, or partially overlaps this one.
+
+        RuntimeError
+            If this array or 'out' is stale (see `_check_current`).
+        """
+        if out is None:
+            return self._new()
+        if not isinstance(out, DualArray) or out.shape != self.shape:
+            raise ValueError(f"Expected 'out' to be a DualArray of shape {self.shape}.")
+        self._check_current()
+        out._check_current()
+        if out.real is self.real and out.dual is self.dual:
+            return out
+        if any(np.may_share_memory(a, b) for a in (out.real, out.dual) for b in (self.real, self.dual)):
+            raise ValueError("Expected 'out' to be the dual array itself or not to overlap it.")
+        return out
+
+    def _scratch(self, out):
+        """
+        Returns an array for intermediate results: the output's dual part unless it is this array's.
+        """
+        return _allocate(self.real.shape, self.real.dtype) if out.dual is self.dual else out.dual
+
+    def __add__(self, other):
+        """
+        Adds a dual array and another dual array, dual number or constant.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to add to the current dual array.
+        """
+        parts = self._parts(other)
+        if parts is not None:
+            out = self._new(self._result_shape(parts[0]), self._result_dtype(parts[0]))
+            np.add(self.real, parts[0], out=out.real)
+            np.add(self.dual, parts[1], out=out.dual)
+            return out
+        c = _constant(other)
+        if c is not None:
+            out = self._new(self._result_shape(c), self._result_dtype(c))
+            np.add(self.real, c, out=out.real)
+            np.copyto(out.dual, self.dual)
+            return out
+        return NotImplemented
+
+    def __radd__(self, other):
+        """
+        Adds a dual array and another dual array, dual number or constant.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to add to the current dual array.
+        """
+        return self.__add__(other)
+
+    def __iadd__(self, other):
+        """
+        Adds a dual array, dual number or constant to the dual array in place.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to add, broadcasting to the shape of the current dual array.
+        """
+        self._check_current()
+        parts = self._parts(other)
+        if parts is not None:
+            np.add(self.real, parts[0], out=self.real)
+            np.add(self.dual, parts[1], out=self.dual)
+            return self
+        c = _constant(other)
+        if c is not None:
+            np.add(self.real, c, out=self.real)
+            return self
+        return NotImplemented
+
+    def __sub__(self, other):
+        """
+        Subtracts a dual array, dual number or constant from the dual array.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to subtract from the current dual array.
+        """
+        parts = self._parts(other)
+        if parts is not None:
+            out = self._new(self._result_shape(parts[0]), self._result_dtype(parts[0]))
+            np.subtract(self.real, parts[0], out=out.real)
+            np.subtract(self.dual, parts[1], out=out.dual)
+            return out
+        c = _constant(other)
+        if c is not None:
+            out = self._new(self._result_shape(c), self._result_dtype(c))
+            np.subtract(self.real, c, out=out.real)
+            np.copyto(out.dual, self.dual)
+            return out
+        return NotImplemented
+
+    def __rsub__(self, other):
+        """
+        Subtracts the dual array from a dual number or constant.
+
+        Parameters
+        ----------
+        other : Dual, int, float or numpy.ndarray
+            The value the current dual array is subtracted from.
+        """
+        parts = self._parts(other)
+        if parts is not None:
+            out = self._new(self._result_shape(parts[0]), self._result_dtype(parts[0]))
+            np.subtract(parts[0], self.real, out=out.real)
+            np.subtract(parts[1], self.dual, out=out.dual)
+            return out
+        c = _constant(other)
+        if c is not None:
+            out = self._new(self._result_shape(c), self._result_dtype(c))
+            np.subtract(c, self.real, out=out.real)
+            np.negative(self.dual, out=out.dual)
+            return out
+        return NotImplemented
+
+    def __isub__(self, other):
+        """
+        Subtracts a dual array, dual number or constant from the dual array in place.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to subtract, broadcasting to the shape of the current dual array.
+        """
+        self._check_current()
+        parts = self._parts(other)
+        if parts is not None:
+            np.subtract(self.real, parts[0], out=self.real)
+            np.subtract(self.dual, parts[1], out=self.dual)
+            return self
+        c = _constant(other)
+        if c is not None:
+            np.subtract(self.real, c, out=self.real)
+            return self
+        return NotImplemented
+
+    def __mul__(self, other):
+        """
+        Multiplies a dual array with another dual array, dual number or constant.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to multiply with the current dual array.
+        """
+        parts = self._parts(other)
+        if parts is not None:
+            o_real, o_dual = parts
+            out = self._new(self._result_shape(o_real), self._result_dtype(o_real))
+            # The real part holds d * o_real until the end
+            np.multiply(self.dual, o_real, out=out.real)
+            np.multiply(self.real, o_dual, out=out.dual)
+            np.add(out.dual, out.real, out=out.dual)
+            np.multiply(self.real, o_real, out=out.real)
+            return out
+        c = _constant(other)
+        if c is not None:
+            out = self._new(self._result_shape(c), self._result_dtype(c))
+            np.multiply(self.real, c, out=out.real)
+            np.multiply(self.dual, c, out=out.dual)
+            return out
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """
+        Multiplies a dual array with another dual array, dual number or constant.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to multiply with the current dual array.
+        """
+        return self.__mul__(other)
+
+    def __imul__(self, other):
+        """
+        Multiplies the dual array by another dual array, dual number or constant in place.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to multiply by, broadcasting to the shape of the current dual array.
+        """
+        self._check_current()
+        parts = self._parts(other)
+        if parts is not None:
+            o_real, o_dual = parts
+            scratch = _allocate(self.real.shape, self.real.dtype)
+            np.multiply(self.real, o_dual, out=scratch)
+            np.multiply(self.dual, o_real, out=self.dual)
+            np.add(scratch, self.dual, out=self.dual)
+            np.multiply(self.real, o_real, out=self.real)
+            return self
+        c = _constant(other)
+        if c is not None:
+            np.multiply(self.real, c, out=self.real)
+            np.multiply(self.dual, c, out=self.dual)
+            return self
+        return NotImplemented
+
+    def __truediv__(self, other):
+        """
+        Divides the dual array by another dual array, dual number or constant.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to divide the current dual array by.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any element of the divisor has a zero real part.
+        """
+        parts = self._parts(other)
+        if parts is not None:
+            o_real, o_dual = parts
+            if not np.all(o_real):
+                raise ZeroDivisionError("division by zero is undefined")
+            out = self._new(self._result_shape(o_real), self._result_dtype(o_real))
+            np.multiply(self.real, o_dual, out=out.real)
+            np.multiply(self.dual, o_real, out=out.dual)
+            np.subtract(out.dual, out.real, out=out.dual)
+            np.multiply(o_real, o_real, out=out.real)
+            np.divide(out.dual, out.real, out=out.dual)
+            np.divide(self.real, o_real, out=out.real)
+            return out
+        c = _constant(other)
+        if c is not None:
+            if not np.all(c):
+                raise ZeroDivisionError("division by zero is undefined")
+            out = self._new(self._result_shape(c), self._result_dtype(c))
+            np.divide(self.real, c, out=out.real)
+            np.divide(self.dual, c, out=out.dual)
+            return out
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        """
+        Divides a dual number or constant by the dual array.
+
+        Parameters
+        ----------
+        other : Dual, int, float or numpy.ndarray
+            The value to divide by the current dual array.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any element of the dual array has a zero real part.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            c = _constant(other)
+            if c is None:
+                return NotImplemented
+            parts = (c, 0.0)
+        if not np.all(self.real):
+            raise ZeroDivisionError("division by zero is undefined")
+        o_real, o_dual = parts
+        out = self._new(self._result_shape(o_real), self._result_dtype(o_real))
+        np.multiply(o_real, self.dual, out=out.real)
+        np.multiply(o_dual, self.real, out=out.dual)
+        np.subtract(out.dual, out.real, out=out.dual)
+        np.multiply(self.real, self.real, out=out.real)
+        np.divide(out.dual, out.real, out=out.dual)
+        np.divide(o_real, self.real, out=out.real)
+        return out
+
+    def __itruediv__(self, other):
+        """
+        Divides the dual array by another dual array, dual number or constant in place.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The value to divide by, broadcasting to the shape of the current dual array.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any element of the divisor has a zero real part.
+        """
+        self._check_current()
+        parts = self._parts(other)
+        if parts is not None:
+            o_real, o_dual = parts
+            if not np.all(o_real):
+                raise ZeroDivisionError("division by zero is undefined")
+            scratch = _allocate(self.real.shape, self.real.dtype)
+            np.multiply(self.real, o_dual, out=scratch)
+            np.multiply(self.dual, o_real, out=self.dual)
+            np.subtract(self.dual, scratch, out=self.dual)
+            np.multiply(o_real, o_real, out=scratch)
+            np.divide(self.dual, scratch, out=self.dual)
+            np.divide(self.real, o_real, out=self.real)
+            return self
+        c = _constant(other)
+        if c is not None:
+            if not np.all(c):
+                raise ZeroDivisionError("division by zero is undefined")
+            np.divide(self.real, c, out=self.real)
+            np.divide(self.dual, c, out=self.dual)
+            return self
+        return NotImplemented
+
+    def __pow__(self, other):
+        """
+        Raises the dual array to the power of a dual array, dual number or constant.
+
+        As for `Dual`, a constant exponent (or a dual one whose dual part is
+        zero) uses ``n * x ** (n - 1)`` without a logarithm, so negative bases
+        are accepted with integer exponents.
+
+        Parameters
+        ----------
+        other : DualArray, Dual, int, float or numpy.ndarray
+            The exponent.
+
+        Raises
+        ------
+        ValueError
+            If a negative base is raised to a non-integer power, or a
+            non-positive base to a power with a non-zero dual part.
+
+        ZeroDivisionError
+            If zero is raised to a negative power, or to a non-integer power
+            below 1 (where the derivative is infinite).
+        """
+        parts = self._parts(other)
+        if parts is None:
+            c = _constant(other)
+            if c is None:
+                return NotImplemented
+            parts = (c, 0.0)
+        return self._power(self.real, self.dual, parts[0], parts[1], parts[0])
+
+    def __rpow__(self, other):
+        """
+        Raises a dual number or constant to the power of the dual array.
+
+        Parameters
+        ----------
+        other : Dual, int, float or numpy.ndarray
+            The base. A constant base must be positive.
+
+        Raises
+        ------
+        ValueError
+            If a constant base is not positive, or a dual base is not
+            positive where the dual array's dual part is non-zero.
+
+        ZeroDivisionError
+            As for `__pow__`, with the dual array as the exponent.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            c = _constant(other)
+            if c is None:
+                return NotImplemented
+            if np.any(np.less_equal(c, 0)):
+                raise ValueError("math domain error")
+            parts = (c, 0.0)
+        return self._power(parts[0], parts[1], self.real, self.dual, parts[0])
+
+    def _power(self, real, dual, exponent, e_dual, other_real):
+        """
+        Returns the power of a base and an exponent given by their parts, one of them being this dual array's.
+
+        Where the exponent's dual part is zero, the exponent is a constant, as
+        in `Dual.__pow__`; the other elements need a positive base.
+        """
+        variable = np.any(e_dual)
+        if np.fmin.reduce(real, axis=None, initial=np.inf) > 0:
+            out = self._new(self._result_shape(other_real), self._result_dtype(other_real))
+            if variable:
+                np.log(real, out=out.real)
+                np.multiply(e_dual, out.real, out=out.real)
+                np.multiply(exponent, dual, out=out.dual)
+                np.divide(out.dual, real, out=out.dual)
+                np.add(out.real, out.dual, out=out.dual)
+                np.power(real, exponent, out=out.real)
+                np.multiply(out.real, out.dual, out=out.dual)
+            else:
+                np.power(real, exponent - 1, out=out.dual)
+                np.multiply(exponent, out.dual, out=out.dual)
+                np.multiply(out.dual, dual, out=out.dual)
+                np.power(real, exponent, out=out.real)
+            return out
+
+        _check_power(real, exponent, np.not_equal(e_dual, 0))
+        out = self._new(self._result_shape(other_real), self._result_dtype(other_real))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.subtract(exponent, 1, out=out.dual)
+            np.power(real, out.dual, out=out.dual)
+            np.multiply(exponent, out.dual, out=out.dual)
+            np.multiply(out.dual, dual, out=out.dual)
+        # x ** 0 is the constant 1, also at x = 0 where x ** -1 is infinite
+        np.copyto(out.dual, 0, where=np.equal(exponent, 0))
+        np.power(real, exponent, out=out.real)
+        if variable:
+            # The bases are positive wherever the exponent's dual part is non-zero
+            t = _allocate(out.shape, out.dtype)
+            t.fill(0)
+            np.log(real, out=t, where=np.not_equal(e_dual, 0))
+            np.multiply(t, e_dual, out=t)
+            np.multiply(t, out.real, out=t)
+            np.add(out.dual, t, out=out.dual)
+        return out
+
+    def __eq__(self, other):
+        """
+        Checks elementwise if two dual arrays are equal.
+
+        Parameters
+        ----------
+        other : DualArray or Dual
+            The value to compare with the current dual array.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array, true where both the real and dual parts are equal.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return np.zeros(self.shape, dtype=bool)
+        return (self.real == parts[0]) & (self.dual == parts[1])
+
+    def __ne__(self, other):
+        """
+        Checks elementwise if two dual arrays differ.
+
+        Parameters
+        ----------
+        other : DualArray or Dual
+            The value to compare with the current dual array.
+        """
+        return ~self.__eq__(other)
+
+    __hash__ = None
+
+    def __len__(self):
+        """
+        Returns the length of the first dimension of the dual array.
+        """
+        return len(self.real)
+
+    def __getitem__(self, index):
+        """
+        Indexes the dual array like an ndarray.
+
+        Returns a `Dual` for a single element and a `DualArray` otherwise.
+        """
+        self._check_current()
+        real = self.real[index]
+        dual = self.dual[index]
+        if np.ndim(real) == 0:
+            return Dual(float(real), float(dual))
+        result = DualArray(real, dual)
+        result._stamp = self._stamp
+        return result
+
+    def __iter__(self):
+        """
+        Iterates over the first dimension of the dual array.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        """
+        Returns a string representation of the dual array.
+        """
+        return f'DualArray(real={self.real!r}, dual={self.dual!r})'
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Implements NumPy ufuncs with the dual-array methods.
+
+        The elementary functions and arithmetic ufuncs (``np.sin``,
+        ``np.add``, ...) are called directly, and so are ndarray operators
+        with a dual-array operand, instead of building object arrays.
+        ``np.add.reduce`` sums like `np.sum`, returning a `Dual` for a
+        full reduction. The elementary functions accept a dual array as
+        ``out=``, like the ``out`` parameter of the methods. Other ufuncs,
+        methods and ``out=`` arguments raise TypeError.
+        """
+        if method == "reduce" and ufunc is np.add and len(inputs) == 1 and "out" not in kwargs:
+            return _result(np.add.reduce(self.real, **kwargs), np.add.reduce(self.dual, **kwargs))
+        if method == "__call__" and ufunc in UNARY_UFUNCS and kwargs.keys() == {"out"}:
+            out, = kwargs["out"]
+            if not isinstance(out, DualArray) or not isinstance(inputs[0], DualArray):
+                return NotImplemented
+            return getattr(inputs[0], UNARY_UFUNCS[ufunc])(out=out)
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(DualArray, ufunc, inputs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Implements the NumPy functions registered in `ARRAY_FUNCTIONS`; others raise TypeError.
+        """
+        implementation = ARRAY_FUNCTIONS.get(func)
+        if implementation is None:
+            return NotImplemented
+        return implementation(*args, **kwargs)
+
+    # Properties
+    @property
+    def shape(self):
+        """
+        The shape of the dual array.
+        """
+        return self.real.shape
+
+    @property
+    def size(self):
+        """
+        The number of elements in the dual array.
+        """
+        return self.real.size
+
+    @property
+    def ndim(self):
+        """
+        The number of dimensions of the dual array.
+        """
+        return self.real.ndim
+
+    @property
+    def dtype(self):
+        """
+        The floating dtype of the real and dual parts.
+        """
+        return self.real.dtype
+
+    # Class Methods
+    def get_real(self):
+        """
+        Returns the real parts of the dual array.
+        """
+        return self.real
+
+    def get_dual(self):
+        """
+        Returns the dual parts of the dual array.
+        """
+        return self.dual
+
+    def astype(self, dtype):
+        """
+        Returns a copy of the dual array with both parts cast to another floating dtype.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype
+            The floating dtype, e.g. ``np.float32`` or ``np.longdouble``.
+
+        Raises
+        ------
+        ValueError
+            If 'dtype' is not a floating dtype.
+        """
+        self._check_current()
+        return DualArray(self.real, self.dual, dtype=dtype)
+
+    def sin(self, out=None):
+        """
+        Returns the elementwise sine of the dual array.
+
+        Parameters
+        ----------
+        out : DualArray, optional
+            The dual array to write the result to, which may be the current
+            one; a new one by default. The same holds for the other
+            elementary functions.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.cos(self.real, out=t)
+        np.multiply(self.dual, t, out=out.dual)
+        np.sin(self.real, out=out.real)
+        return out
+
+    def cos(self, out=None):
+        """
+        Returns the elementwise cosine of the dual array.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.sin(self.real, out=t)
+        np.multiply(self.dual, t, out=out.dual)
+        np.negative(out.dual, out=out.dual)
+        np.cos(self.real, out=out.real)
+        return out
+
+    def tan(self, out=None):
+        """
+        Returns the elementwise tangent of the dual array.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.cos(self.real, out=t)
+        np.square(t, out=t)
+        np.divide(self.dual, t, out=out.dual)
+        np.tan(self.real, out=out.real)
+        return out
+
+    def exp(self, out=None):
+        """
+        Returns the elementwise exponential of the dual array.
+        """
+        out = self._output(out)
+        np.exp(self.real, out=out.real)
+        np.multiply(self.dual, out.real, out=out.dual)
+        return out
+
+    def log(self, out=None):
+        """
+        Returns the elementwise natural logarithm of the dual array.
+
+        Raises
+        ------
+        ValueError
+            If any element has a non-positive real part.
+        """
+        if np.fmin.reduce(self.real, axis=None, initial=np.inf) <= 0:
+            raise ValueError("Logarithm of a non-positive number is undefined.")
+        out = self._output(out)
+        np.divide(self.dual, self.real, out=out.dual)
+        np.log(self.real, out=out.real)
+        return out
+
+    def sqrt(self, out=None):
+        """
+        Returns the elementwise square root of the dual array.
+
+        Raises
+        ------
+        ValueError
+            If any element has a negative real part.
+
+        ZeroDivisionError
+            If any element has a zero real part, where the derivative is infinite.
+        """
+        lowest = np.fmin.reduce(self.real, axis=None, initial=np.inf)
+        if lowest <= 0:
+            if lowest < 0:
+                raise ValueError("math domain error")
+            raise ZeroDivisionError("division by zero is undefined")
+        out = self._output(out)
+        np.sqrt(self.real, out=out.real)
+        np.divide(self.dual, out.real, out=out.dual)
+        np.multiply(out.dual, 0.5, out=out.dual)
+        return out
+
+    def sinh(self, out=None):
+        """
+        Returns the elementwise hyperbolic sine of the dual array.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.cosh(self.real, out=t)
+        np.multiply(self.dual, t, out=out.dual)
+        np.sinh(self.real, out=out.real)
+        return out
+
+    def cosh(self, out=None):
+        """
+        Returns the elementwise hyperbolic cosine of the dual array.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.sinh(self.real, out=t)
+        np.multiply(self.dual, t, out=out.dual)
+        np.cosh(self.real, out=out.real)
+        return out
+
+    def tanh(self, out=None):
+        """
+        Returns the elementwise hyperbolic tangent of the dual array.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.cosh(self.real, out=t)
+        np.square(t, out=t)
+        np.divide(self.dual, t, out=out.dual)
+        np.tanh(self.real, out=out.real)
+        return out
+
+    def asin(self, out=None):
+        """
+        Returns the elementwise arcsine of the dual array.
+
+        Raises
+        ------
+        ValueError
+            If any element has a real part outside [-1, 1].
+
+        ZeroDivisionError
+            If any element has a real part of -1 or 1, where the derivative is infinite.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.square(self.real, out=t)
+        np.subtract(1, t, out=t)
+        _check_unit_interval(t)
+        np.sqrt(t, out=t)
+        np.divide(self.dual, t, out=out.dual)
+        np.arcsin(self.real, out=out.real)
+        return out
+
+    def acos(self, out=None):
+        """
+        Returns the elementwise arccosine of the dual array.
+
+        Raises
+        ------
+        ValueError
+            If any element has a real part outside [-1, 1].
+
+        ZeroDivisionError
+            If any element has a real part of -1 or 1, where the derivative is infinite.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.square(self.real, out=t)
+        np.subtract(1, t, out=t)
+        _check_unit_interval(t)
+        np.sqrt(t, out=t)
+        np.divide(self.dual, t, out=out.dual)
+        np.negative(out.dual, out=out.dual)
+        np.arccos(self.real, out=out.real)
+        return out
+
+    def atan(self, out=None):
+        """
+        Returns the elementwise arctangent of the dual array.
+        """
+        out = self._output(out)
+        t = self._scratch(out)
+        np.square(self.real, out=t)
+        np.add(1, t, out=t)
+        np.divide(self.dual, t, out=out.dual)
+        np.arctan(self.real, out=out.real)
+        return out
+
+
+def _result(real, dual):
+    """
+    Returns a `Dual` for a 0-d result, as indexing does, and a `DualArray` otherwise.
+    """
+    if np.ndim(real) == 0:
+        return Dual(float(real), float(dual))
+    dtype = _float_dtype(real, dual)
+    return DualArray._from_parts(np.asarray(real, dtype=dtype), np.array(np.broadcast_to(dual, np.shape(real)), dtype=dtype))
+
+
+def _operand_parts(x):
+    """
+    Returns the (real, dual) parts of a dual or constant operand; the dual part of a constant is None.
+    """
+    parts = DualArray._parts(x)
+    if parts is not None:
+        return parts
+    c = _constant(x)
+    return (np.asarray(x, dtype=np.float64) if c is None else c), None
+
+
+@_implements(np.sum)
+def _sum(a, axis=None, keepdims=False):
+    """
+    Sums dual-array elements over an axis.
+    """
+    real, dual = _operand_parts(a)
+    return _result(np.sum(real, axis=axis, keepdims=keepdims),
+                   np.sum(np.broadcast_to(dual, np.shape(real)), axis=axis, keepdims=keepdims))
+
+
+@_implements(np.mean)
+def _mean(a, axis=None, keepdims=False):
+    """
+    Averages dual-array elements over an axis.
+    """
+    real, dual = _operand_parts(a)
+    return _result(np.mean(real, axis=axis, keepdims=keepdims),
+                   np.mean(np.broadcast_to(dual, np.shape(real)), axis=axis, keepdims=keepdims))
+
+
+@_implements(np.dot)
+def _dot(a, b):
+    """
+    Dot product of dual arrays and/or constant arrays, by the product rule.
+    """
+    (a_real, a_dual), (b_real, b_dual) = _operand_parts(a), _operand_parts(b)
+    dual = 0.0
+    if a_dual is not None:
+        dual = dual + np.dot(a_dual, b_real)
+    if b_dual is not None:
+        dual = dual + np.dot(a_real, b_dual)
+    return _result(np.dot(a_real, b_real), dual)
+
+
+@_implements(np.where)
+def _where(condition, x, y):
+    """
+    Selects dual-array elements from ``x`` where ``condition`` holds and from ``y`` elsewhere.
+    """
+    if DualArray._parts(condition) is not None:
+        raise TypeError("np.where needs a boolean condition, got dual numbers; compare their .real instead")
+    (x_real, x_dual), (y_real, y_dual) = _operand_parts(x), _operand_parts(y)
+    return _result(np.where(condition, x_real, y_real),
+                   np.where(condition, 0.0 if x_dual is None else x_dual, 0.0 if y_dual is None else y_dual))
+
+
+@_implements(np.shape)
+def _shape(a):
+    """
+    Returns the shape of a dual array.
+    """
+    return np.shape(_operand_parts(a)[0])
+
+
+@_implements(np.ndim)
+def _ndim(a):
+    """
+    Returns the number of dimensions of a dual array.
+    """
+    return np.ndim(_operand_parts(a)[0])
+
+
+@_implements(np.size)
+def _size(a, axis=None):
+    """
+    Returns the number of elements of a dual array.
+    """
+    return np.size(_operand_parts(a)[0], axis)
+
+
+def _as_points(xs):
+    """
+    Returns the evaluation points as an ndarray, of their own floating dtype or float64.
+    """
+    if isinstance(xs, (np.ndarray, list, tuple, float, int, np.number)):
+        xs = np.asarray(xs)
+        return np.asarray(xs, dtype=_float_dtype(xs))
+    return np.fromiter(xs, dtype=np.float64)
+
+
+def _read_only(a):
+    """
+    Returns a read-only view of an array, so that seeding it cannot let in-place operators modify the caller's data.
+    """
+    view = a.view()
+    view.flags.writeable = False
+    return view
+
+
+def compute_derivative_batch(func, xs, return_values=False, return_backend=False):
+    """
+    Computes the derivative of a function at many points using dual numbers.
+
+    The function is first evaluated once on a `DualArray` seeded with all
+    points. If it cannot be vectorized (for example because it branches on
+    ``x.real`` or converts it to a Python float), it is evaluated point by
+    point with `Dual_c` when the compiled extension is installed, and with
+    `Dual` otherwise, in double precision whatever the dtype of ``xs``.
+    The seeded real parts are read-only, so a function that updates its
+    argument in place (``x *= 2``) also takes the point-by-point path
+    instead of modifying ``xs``.
+
+    Parameters
+    ----------
+    func : function
+        The function to compute the derivative of.
+
+    xs : array_like or iterable of float
+        The points at which to compute the derivative. A floating array
+        keeps its dtype (float32, float64 or ``np.longdouble``), which sets
+        the precision of the vectorized evaluation and of the results;
+        anything else is converted to float64.
+
+    return_values : bool, optional
+        If True, also return the function values at ``xs``.
+
+    return_backend : bool, optional
+        If True, also return the name of the evaluation path that was taken:
+        ``"vectorized"``, ``"compiled"`` or ``"python"``.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        The function values, same shape as ``xs``. Only returned if
+        ``return_values`` is True.
+
+    derivatives : numpy.ndarray
+        The derivatives of the function, same shape as ``xs``.
+
+    backend : str
+        The evaluation path. Only returned if ``return_backend`` is True.
+
+    Examples
+    --------
+    >>> def f(x):
+    ...     return x * x
+    >>> compute_derivative_batch(f, [1.0, 2.0, 3.0])
+    array([2., 4., 6.])
+    """
+    xs = _as_points(xs)
+    result = None
+    try:
+        result = func(DualArray._from_parts(_read_only(xs), np.ones_like(xs)))
+    except (TypeError, ValueError):
+        pass
+
+    if isinstance(result, DualArray) and result.shape == xs.shape:
+        values, derivatives, backend = result.real, result.dual, "vectorized"
+        if not values.flags.writeable:
+            values = values.copy()
+    else:
+        dual_class, backend = (Dual_c, "compiled") if Dual_c is not None else (Dual, "python")
+        values = np.empty(xs.size, dtype=xs.dtype)
+        derivatives = np.empty(xs.size, dtype=xs.dtype)
+        for i, x in enumerate(xs.ravel().tolist()):
+            y = func(dual_class(x, 1.0))
+            values[i] = y.real
+            derivatives[i] = y.dual
+        values = values.reshape(xs.shape)
+        derivatives = derivatives.reshape(xs.shape)
+
+    out = (values, derivatives) if return_values else (derivatives,)
+    if return_backend:
+        out += (backend,)
+    return out if len(out) > 1 else out[0]
@@ -0,0 +1,309 @@
+import numpy as np
+
+from .Dual import Dual
+from .DualArray import DualArray, ARRAY_FUNCTIONS, _SCALAR_DUALS
+
+# Interleaved layout of one dual number: the C struct {double real; double dual;}
+DUAL_DTYPE = np.dtype([("real", np.float64), ("dual", np.float64)])
+
+
+def _dual_view_dtype(dtype, real, dual):
+    """
+    Returns a dtype viewing the ``real`` and ``dual`` float64 fields of a
+    structured dtype under the names "real" and "dual", keeping their offsets
+    and the record size so the view shares memory with the original.
+    """
+    if dtype.names is None or real not in dtype.names or dual not in dtype.names:
+        raise TypeError(f"Expected a structured array with fields {real!r} and {dual!r}, got dtype {dtype} instead.")
+    formats, offsets = [], []
+    for name in (real, dual):
+        field, offset = dtype.fields[name][:2]
+        if field != np.dtype(np.float64):
+            raise TypeError(f"Expected field {name!r} to be native float64, got {field} instead.")
+        formats.append(field)
+        offsets.append(offset)
+    return np.dtype({"names": ["real", "dual"], "formats": formats, "offsets": offsets, "itemsize": dtype.itemsize})
+
+
+class DualBuffer:
+    """
+    A class to represent an array of dual numbers stored as interleaved (real, dual) records.
+
+    The memory layout is an array of the C struct ``{double real; double
+    dual;}`` (`DUAL_DTYPE`), the layout simulation codes and C extensions
+    usually hold. The buffer is shared without copying: NumPy sees it through
+    ``__array_interface__`` (``np.asarray(buffer)``), ``memoryview`` and C
+    code through the buffer protocol (``__buffer__``, Python 3.12+; on older
+    versions use ``memoryview(np.asarray(buffer))``). `from_buffer` wraps
+    existing float64, complex128 or structured memory without copying, and
+    `real` and `dual` are strided views into the records.
+
+    Attributes
+    ----------
+    real : numpy.ndarray
+        A strided view of the real parts.
+
+    dual : numpy.ndarray
+        A strided view of the dual parts.
+
+    Examples
+    --------
+    >>> z = np.array([1 + 1j, 2 + 0j])
+    >>> x = DualBuffer.from_buffer(z)
+    >>> x.dual[1] = 1.0
+    >>> z
+    array([1.+1.j, 2.+1.j])
+    >>> (x.to_dual_array() * 2).dual
+    array([2., 2.])
+    """
+
+    # Special Methods
+    def __init__(self, real, dual=None):
+        """
+        Constructs all the necessary attributes for the DualBuffer object.
+
+        The parts are copied into a new interleaved buffer; use `from_buffer`
+        to wrap existing memory instead.
+
+        Parameters
+        ----------
+        real : array_like
+            The real parts of the dual numbers.
+
+        dual : array_like, optional
+            The dual parts of the dual numbers. Broadcast to the shape of
+            ``real``; defaults to zeros.
+
+        Raises
+        ------
+        ValueError
+            If 'dual' cannot be broadcast to the shape of 'real'.
+        """
+        real = np.asarray(real, dtype=np.float64)
+        data = np.empty(real.shape, dtype=DUAL_DTYPE)
+        data["real"] = real
+        data["dual"] = 0.0 if dual is None else np.broadcast_to(np.asarray(dual, dtype=np.float64), real.shape)
+        self._data = data
+
+    @classmethod
+    def _wrap(cls, data):
+        """
+        Builds a DualBuffer around a structured ndarray with float64 fields "real" and "dual".
+        """
+        result = object.__new__(cls)
+        result._data = data
+        return result
+
+    @classmethod
+    def from_buffer(cls, obj):
+        """
+        Wraps existing memory as a DualBuffer without copying.
+
+        Parameters
+        ----------
+        obj : array_like
+            Any object exposing its memory to NumPy (ndarray, buffer
+            protocol, ``__array_interface__``) holding either
+
+            - complex128 values, read as real + dual ε;
+            - float64 values of shape (..., 2) with contiguous pairs;
+            - structured records with float64 fields "real" and "dual"
+              (see `from_structured` for other field names).
+
+        Returns
+        -------
+        DualBuffer
+            A view sharing memory with ``obj``.
+
+        Raises
+        ------
+        TypeError
+            If the dtype is none of the above.
+
+        ValueError
+            If the memory cannot be viewed as dual records without a copy.
+        """
+        array = np.asarray(obj)
+        if array.dtype.names is not None:
+            return cls.from_structured(array)
+        if array.dtype == np.complex128:
+            # Same 16-byte layout: only the interpretation changes
+            return cls._wrap(array[..., np.newaxis].view(DUAL_DTYPE)[..., 0])
+        if array.dtype == np.float64:
+            if array.ndim == 0 or array.shape[-1] != 2:
+                raise ValueError(f"Expected float64 data of shape (..., 2), got shape {array.shape} instead.")
+            if array.strides[-1] != array.itemsize:
+                raise ValueError("The (real, dual) pairs must be contiguous to be viewed without a copy.")
+            return cls._wrap(array.view(DUAL_DTYPE)[..., 0])
+        raise TypeError(f"Expected complex128, float64 or structured data, got dtype {array.dtype} instead.")
+
+    @classmethod
+    def from_structured(cls, array, real="real", dual="dual"):
+        """
+        Wraps two float64 fields of a structured array as a DualBuffer without copying.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            A structured array; other fields are left in place and skipped.
+
+        real, dual : str, optional
+            The names of the fields holding the real and dual parts.
+
+        Returns
+        -------
+        DualBuffer
+            A view sharing memory with ``array``.
+
+        Raises
+        ------
+        TypeError
+            If the fields are missing or not native float64.
+        """
+        array = np.asarray(array)
+        return cls._wrap(array.view(_dual_view_dtype(array.dtype, real, dual)))
+
+    @classmethod
+    def from_dual_array(cls, array):
+        """
+        Copies a `DualArray` into a new interleaved buffer.
+        """
+        return cls(array.real, array.dual)
+
+    @property
+    def real(self):
+        """
+        A strided view of the real parts.
+        """
+        return self._data["real"]
+
+    @property
+    def dual(self):
+        """
+        A strided view of the dual parts.
+        """
+        return self._data["dual"]
+
+    @property
+    def shape(self):
+        """
+        The shape of the buffer.
+        """
+        return self._data.shape
+
+    @property
+    def ndim(self):
+        """
+        The number of dimensions of the buffer.
+        """
+        return self._data.ndim
+
+    @property
+    def size(self):
+        """
+        The number of dual numbers in the buffer.
+        """
+        return self._data.size
+
+    @property
+    def __array_interface__(self):
+        """
+        The NumPy array interface of the underlying records.
+        """
+        return self._data.__array_interface__
+
+    def __buffer__(self, flags):
+        """
+        Exports the underlying records through the buffer protocol (PEP 688).
+        """
+        return memoryview(self._data)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Applies NumPy ufuncs to the `DualArray` view of the buffer (see `DualArray.__array_ufunc__`).
+        """
+        inputs = [x.to_dual_array() if isinstance(x, DualBuffer) else x for x in inputs]
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Applies the NumPy functions supported by `DualArray` to the `DualArray`
+        view of the buffer; other functions see the underlying records.
+        """
+        if func in ARRAY_FUNCTIONS:
+            args = [x.to_dual_array() if isinstance(x, DualBuffer) else x for x in args]
+        else:
+            args = [x._data if isinstance(x, DualBuffer) else x for x in args]
+        return func(*args, **kwargs)
+
+    def __len__(self):
+        """
+        Returns the length of the first axis.
+        """
+        return len(self._data)
+
+    def __getitem__(self, index):
+        """
+        Returns a `Dual` for a single element, otherwise a DualBuffer view.
+        """
+        item = self._data[index]
+        if isinstance(item, np.void):
+            return Dual(float(item["real"]), float(item["dual"]))
+        return DualBuffer._wrap(item)
+
+    def __setitem__(self, index, value):
+        """
+        Writes dual numbers into the buffer.
+
+        Parameters
+        ----------
+        value : Dual, Dual_c, DualArray, DualBuffer, int or float
+            The values; constants get a zero dual part.
+        """
+        if isinstance(value, (DualArray, DualBuffer) + _SCALAR_DUALS):
+            self._data["real"][index] = value.real
+            self._data["dual"][index] = value.dual
+        else:
+            self._data["real"][index] = value
+            self._data["dual"][index] = 0.0
+
+    def __iter__(self):
+        """
+        Iterates over the first axis.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        """
+        Returns a string representation of the dual buffer.
+        """
+        return f'DualBuffer(real={self.real!r}, dual={self.dual!r})'
+
+    # Class Methods
+    def get_real(self):
+        """
+        Returns a strided view of the real parts.
+        """
+        return self.real
+
+    def get_dual(self):
+        """
+        Returns a strided view of the dual parts.
+        """
+        return self.dual
+
+    def to_dual_array(self):
+        """
+        Returns a `DualArray` whose parts are views of this buffer.
+
+        The result of any operation on it is a new, contiguous `DualArray`;
+        write it back with ``buffer[...] = result``.
+        """
+        return DualArray._from_parts(self.real, self.dual)
+
+    def copy(self):
+        """
+        Returns a copy of the buffer in new, contiguous memory.
+        """
+        return DualBuffer._wrap(self._data.astype(DUAL_DTYPE))
@@ -0,0 +1,667 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from .Dual import _apply_ufunc
+
+
+# Elementary functions under the names used by the math module.
+_NUMPY = SimpleNamespace(
+    sin=np.sin, cos=np.cos, tan=np.tan, exp=np.exp, log=np.log, sqrt=np.sqrt,
+    sinh=np.sinh, cosh=np.cosh, tanh=np.tanh, asin=np.arcsin, acos=np.arccos, atan=np.arctan,
+)
+
+
+class _HyperDualBase:
+    """
+    Operators and elementary functions shared by `HyperDual` and `HyperDualArray`.
+
+    A hyper-dual number a + b1 ε1 + b2 ε2 + b12 ε1ε2 (with ε1² = ε2² = 0)
+    carries exact first derivatives along two directions in ``eps1`` and
+    ``eps2`` and the mixed second derivative in ``eps12``. Every unary
+    primitive is applied through ``_chain`` from its value, first and second
+    derivatives. Subclasses choose the elementary-function library and the
+    accepted constant types.
+    """
+
+    _lib = math
+    _CONSTANTS = (float, int)
+
+    @classmethod
+    def _from_parts(cls, real, eps1, eps2, eps12):
+        """
+        Builds an instance from its four parts without validation.
+        """
+        result = object.__new__(cls)
+        result.real = real
+        result.eps1 = eps1
+        result.eps2 = eps2
+        result.eps12 = eps12
+        return result
+
+    def _chain(self, f, df, d2f):
+        """
+        Returns g(self) given g, g' and g'' evaluated at the real part.
+        """
+        return self._from_parts(f, df * self.eps1, df * self.eps2, df * self.eps12 + d2f * self.eps1 * self.eps2)
+
+    def _mul(self, other):
+        """
+        Multiplies two hyper-dual numbers of the same class.
+        """
+        return self._from_parts(
+            self.real * other.real,
+            self.real * other.eps1 + self.eps1 * other.real,
+            self.real * other.eps2 + self.eps2 * other.real,
+            self.real * other.eps12 + self.eps1 * other.eps2 + self.eps2 * other.eps1 + self.eps12 * other.real,
+        )
+
+    def _reciprocal(self):
+        """
+        Returns 1 / self.
+        """
+        inv = 1 / self.real
+        return self._chain(inv, -inv * inv, 2 * inv * inv * inv)
+
+    def _check_nonzero(self):
+        """
+        Raises a ZeroDivisionError if the real part is zero.
+        """
+        if np.any(self.real == 0):
+            raise ZeroDivisionError("division by zero is undefined")
+
+    @property
+    def dual(self):
+        """
+        The first-direction derivative, so `compute_derivative`-style code can read ``.dual``.
+        """
+        return self.eps1
+
+    def __add__(self, other):
+        """
+        Adds a hyper-dual number and another hyper-dual number or constant.
+        """
+        if isinstance(other, type(self)):
+            return self._from_parts(self.real + other.real, self.eps1 + other.eps1, self.eps2 + other.eps2, self.eps12 + other.eps12)
+        if isinstance(other, self._CONSTANTS):
+            return self._from_parts(self.real + other, self.eps1 + 0 * other, self.eps2 + 0 * other, self.eps12 + 0 * other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        """
+        Adds a hyper-dual number and another hyper-dual number or constant.
+        """
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """
+        Subtracts a hyper-dual number or constant from the hyper-dual number.
+        """
+        if isinstance(other, type(self)):
+            return self._from_parts(self.real - other.real, self.eps1 - other.eps1, self.eps2 - other.eps2, self.eps12 - other.eps12)
+        if isinstance(other, self._CONSTANTS):
+            return self._from_parts(self.real - other, self.eps1 + 0 * other, self.eps2 + 0 * other, self.eps12 + 0 * other)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        """
+        Subtracts the hyper-dual number from a constant.
+        """
+        if isinstance(other, self._CONSTANTS):
+            return self._from_parts(other - self.real, 0 * other - self.eps1, 0 * other - self.eps2, 0 * other - self.eps12)
+        return NotImplemented
+
+    def __mul__(self, other):
+        """
+        Multiplies a hyper-dual number with another hyper-dual number or constant.
+        """
+        if isinstance(other, type(self)):
+            return self._mul(other)
+        if isinstance(other, self._CONSTANTS):
+            return self._from_parts(self.real * other, self.eps1 * other, self.eps2 * other, self.eps12 * other)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """
+        Multiplies a hyper-dual number with another hyper-dual number or constant.
+        """
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        Divides the hyper-dual number by another hyper-dual number or constant.
+        """
+        if isinstance(other, type(self)):
+            other._check_nonzero()
+            return self._mul(other._reciprocal())
+        if isinstance(other, self._CONSTANTS):
+            if np.any(np.asarray(other) == 0):
+                raise ZeroDivisionError("division by zero is undefined")
+            return self._from_parts(self.real / other, self.eps1 / other, self.eps2 / other, self.eps12 / other)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        """
+        Divides a constant by the hyper-dual number.
+        """
+        if isinstance(other, self._CONSTANTS):
+            self._check_nonzero()
+            return self._reciprocal() * other
+        return NotImplemented
+
+    def _where(self, mask, other):
+        """
+        Returns the parts of ``self`` where ``mask`` is true and those of ``other`` elsewhere.
+        """
+        return self._from_parts(*(np.where(mask, a, b) for a, b in (
+            (self.real, other.real), (self.eps1, other.eps1), (self.eps2, other.eps2), (self.eps12, other.eps12))))
+
+    def _constant_power(self, r):
+        """
+        Returns self ** r for a constant r, with the power rule of `Dual.__pow__`.
+        """
+        if np.any((self.real < 0) & (r != np.floor(r))):
+            raise ValueError("math domain error")
+        if np.any((self.real == 0) & ((r < 0) | ((r < 1) & (r != np.floor(r))))):
+            raise ZeroDivisionError("division by zero is undefined")
+        if np.ndim(r) == 0 and r in (0, 1):
+            # Avoid 0 ** -1 in the unused derivative terms at a zero base
+            return self * 0.0 + 1.0 if r == 0 else self * 1.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # At a zero base with 1 < r < 2 the second derivative is infinite, as a value rather than an error
+            d2 = r * (r - 1) * np.power(self.real, r - 2)
+            return self._chain(self.real ** r, r * self.real ** (r - 1), float(d2) if np.ndim(d2) == 0 else d2)
+
+    def __pow__(self, other):
+        """
+        Raises the hyper-dual number to the power of another hyper-dual number or constant.
+
+        As in `Dual.__pow__`, a constant exponent (or a hyper-dual one whose
+        ``eps1``, ``eps2`` and ``eps12`` parts are all zero, element by
+        element for arrays) uses the power rule without a logarithm, so
+        negative bases are accepted with integer exponents.
+
+        Raises
+        ------
+        ValueError
+            If a negative base is raised to a non-integer power, or a
+            non-positive base to an exponent with non-zero infinitesimal parts.
+
+        ZeroDivisionError
+            If zero is raised to a negative power, or to a non-integer power
+            below 1.
+        """
+        if isinstance(other, type(self)):
+            varying = (other.eps1 != 0) | (other.eps2 != 0) | (other.eps12 != 0)
+            if not np.any(varying):
+                return self._constant_power(other.real)
+            if np.any((self.real <= 0) & varying):
+                raise ValueError("math domain error")
+            if np.all(varying):
+                return (other * self.log()).exp()
+            # Mixed lanes: bases of the varying lanes are positive, the other lanes take the power rule
+            one = self * 0.0 + 1.0
+            general = (other * self._where(varying, one).log()).exp()
+            return general._where(varying, self._constant_power(np.where(varying, 1.0, other.real)))
+        if isinstance(other, self._CONSTANTS):
+            return self._constant_power(other)
+        return NotImplemented
+
+    def __rpow__(self, other):
+        """
+        Raises a constant to the power of the hyper-dual number.
+
+        Raises
+        ------
+        ValueError
+            If the base is not positive.
+        """
+        if isinstance(other, self._CONSTANTS):
+            if np.any(np.asarray(other) <= 0):
+                raise ValueError("math domain error")
+            return (self * self._lib.log(other)).exp()
+        return NotImplemented
+
+    def __repr__(self):
+        """
+        Returns a string representation of the hyper-dual number.
+        """
+        return f'{type(self).__name__}(real={self.real!r}, eps1={self.eps1!r}, eps2={self.eps2!r}, eps12={self.eps12!r})'
+
+    # Class Methods
+    def get_real(self):
+        """
+        Returns the real part of the hyper-dual number.
+        """
+        return self.real
+
+    def sin(self):
+        """
+        Returns the sine of the hyper-dual number.
+        """
+        s, c = self._lib.sin(self.real), self._lib.cos(self.real)
+        return self._chain(s, c, -s)
+
+    def cos(self):
+        """
+        Returns the cosine of the hyper-dual number.
+        """
+        s, c = self._lib.sin(self.real), self._lib.cos(self.real)
+        return self._chain(c, -s, -c)
+
+    def tan(self):
+        """
+        Returns the tangent of the hyper-dual number.
+        """
+        t = self._lib.tan(self.real)
+        sec2 = 1 + t * t
+        return self._chain(t, sec2, 2 * t * sec2)
+
+    def exp(self):
+        """
+        Returns the exponential of the hyper-dual number.
+        """
+        e = self._lib.exp(self.real)
+        return self._chain(e, e, e)
+
+    def log(self):
+        """
+        Returns the natural logarithm of the hyper-dual number.
+        """
+        if np.any(self.real <= 0):
+            raise ValueError("Logarithm of a non-positive number is undefined.")
+        inv = 1 / self.real
+        return self._chain(self._lib.log(self.real), inv, -inv * inv)
+
+    def sqrt(self):
+        """
+        Returns the square root of the hyper-dual number.
+        """
+        s = self._lib.sqrt(self.real)
+        return self._chain(s, 0.5 / s, -0.25 / (s * self.real))
+
+    def sinh(self):
+        """
+        Returns the hyperbolic sine of the hyper-dual number.
+        """
+        s, c = self._lib.sinh(self.real), self._lib.cosh(self.real)
+        return self._chain(s, c, s)
+
+    def cosh(self):
+        """
+        Returns the hyperbolic cosine of the hyper-dual number.
+        """
+        s, c = self._lib.sinh(self.real), self._lib.cosh(self.real)
+        return self._chain(c, s, c)
+
+    def tanh(self):
+        """
+        Returns the hyperbolic tangent of the hyper-dual number.
+        """
+        t = self._lib.tanh(self.real)
+        sech2 = 1 - t * t
+        return self._chain(t, sech2, -2 * t * sech2)
+
+    def asin(self):
+        """
+        Returns the arcsine of the hyper-dual number.
+        """
+        q = 1 / (1 - self.real * self.real)
+        d = self._lib.sqrt(q)
+        return self._chain(self._lib.asin(self.real), d, self.real * d * q)
+
+    def acos(self):
+        """
+        Returns the arccosine of the hyper-dual number.
+        """
+        q = 1 / (1 - self.real * self.real)
+        d = self._lib.sqrt(q)
+        return self._chain(self._lib.acos(self.real), -d, -self.real * d * q)
+
+    def atan(self):
+        """
+        Returns the arctangent of the hyper-dual number.
+        """
+        q = 1 / (1 + self.real * self.real)
+        return self._chain(self._lib.atan(self.real), q, -2 * self.real * q * q)
+
+
+class HyperDual(_HyperDualBase):
+    """
+    A class to represent a hyper-dual number for exact second derivatives.
+
+    A hyper-dual number a + b1 ε1 + b2 ε2 + b12 ε1ε2 extends `Dual` with two
+    independent infinitesimal directions. Seeding ``eps1`` along e_i and
+    ``eps2`` along e_j gives the exact mixed derivative d²f / dx_i dx_j in
+    ``eps12``, without truncation or cancellation error.
+
+    Attributes
+    ----------
+    real : float
+        The real part.
+
+    eps1, eps2 : float
+        The first derivatives along the ε1 and ε2 directions.
+
+    eps12 : float
+        The mixed second derivative.
+
+    Examples
+    --------
+    >>> x = HyperDual(2, 1, 1, 0)
+    >>> (x * x * x).eps12
+    12.0
+    """
+
+    # Special Methods
+    def __init__(self, real, eps1=0.0, eps2=0.0, eps12=0.0):
+        """
+        Constructs all the necessary attributes for the HyperDual object.
+
+        Parameters
+        ----------
+        real : float
+            The real part.
+
+        eps1, eps2, eps12 : float, optional
+            The ε1, ε2 and ε1ε2 parts.
+
+        Raises
+        ------
+        TypeError
+            If any part is not of type float or int.
+        """
+        for name, value in (("real", real), ("eps1", eps1), ("eps2", eps2), ("eps12", eps12)):
+            if not isinstance(value, (float, int)):
+                raise TypeError(f"Expected '{name}' to be of type float or int, got {type(value).__name__} instead.")
+
+        self.real = float(real)
+        self.eps1 = float(eps1)
+        self.eps2 = float(eps2)
+        self.eps12 = float(eps12)
+
+    def __eq__(self, other):
+        """
+        Checks if two hyper-dual numbers are equal.
+        """
+        if isinstance(other, HyperDual):
+            return (self.real, self.eps1, self.eps2, self.eps12) == (other.real, other.eps1, other.eps2, other.eps12)
+        return False
+
+    __hash__ = None
+
+
+class HyperDualArray(_HyperDualBase):
+    """
+    A class to represent an array of hyper-dual numbers.
+
+    Batched counterpart of `HyperDual`: the four parts are float64 ndarrays of
+    a common shape and every primitive is evaluated with NumPy over the whole
+    array. Constants may be ints, floats or ndarrays broadcasting against it.
+
+    NumPy ufuncs for the elementary functions and arithmetic dispatch to the
+    hyper-dual methods, and ``np.sum``, ``np.mean``, ``np.shape``,
+    ``np.ndim`` and ``np.size`` have hyper-dual implementations (see
+    `ARRAY_FUNCTIONS`); other NumPy functions raise TypeError.
+
+    Attributes
+    ----------
+    real, eps1, eps2, eps12 : numpy.ndarray
+        The four parts of the hyper-dual numbers.
+
+    Examples
+    --------
+    >>> x = HyperDualArray([1.0, 2.0], 1.0, 1.0)
+    >>> x.sin().eps12
+    array([-0.84147098, -0.90929743])
+    """
+
+    _lib = _NUMPY
+    _CONSTANTS = (float, int, np.number, np.ndarray)
+
+    # Special Methods
+    def __init__(self, real, eps1=0.0, eps2=0.0, eps12=0.0):
+        """
+        Constructs all the necessary attributes for the HyperDualArray object.
+
+        Parameters
+        ----------
+        real : array_like
+            The real parts.
+
+        eps1, eps2, eps12 : array_like, optional
+            The ε1, ε2 and ε1ε2 parts, broadcast to the shape of ``real``.
+        """
+        real = np.asarray(real, dtype=np.float64, order="C")
+        self.real = real
+        self.eps1, self.eps2, self.eps12 = (
+            np.array(np.broadcast_to(np.asarray(part, dtype=np.float64), real.shape), order="C")
+            for part in (eps1, eps2, eps12)
+        )
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Implements NumPy ufuncs with the hyper-dual methods.
+
+        The elementary functions and arithmetic ufuncs (``np.sin``,
+        ``np.add``, ...) call the methods, and ndarray operators with a
+        hyper-dual operand defer to the reflected methods. Other ufuncs,
+        methods and ``out=`` arguments raise TypeError.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(HyperDualArray, ufunc, inputs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Implements the NumPy functions registered in `ARRAY_FUNCTIONS`; others raise TypeError.
+        """
+        implementation = ARRAY_FUNCTIONS.get(func)
+        if implementation is None:
+            return NotImplemented
+        return implementation(*args, **kwargs)
+
+    @property
+    def shape(self):
+        """
+        The shape of the hyper-dual array.
+        """
+        return np.shape(self.real)
+
+
+# Implementations of NumPy functions for hyper-dual arrays, keyed by the NumPy function.
+ARRAY_FUNCTIONS = {}
+
+
+def _implements(function):
+    """
+    Registers the decorated function as the hyper-dual-array implementation of a NumPy function.
+    """
+    def decorator(implementation):
+        ARRAY_FUNCTIONS[function] = implementation
+        return implementation
+
+    return decorator
+
+
+def _result(real, eps1, eps2, eps12):
+    """
+    Returns a `HyperDual` for 0-d parts and a `HyperDualArray` otherwise.
+    """
+    if np.ndim(real) == 0:
+        return HyperDual._from_parts(float(real), float(eps1), float(eps2), float(eps12))
+    return HyperDualArray._from_parts(real, eps1, eps2, eps12)
+
+
+@_implements(np.sum)
+def _sum(a, axis=None, keepdims=False):
+    """
+    Sums hyper-dual-array elements over an axis.
+    """
+    return _result(*(np.sum(part, axis=axis, keepdims=keepdims) for part in (a.real, a.eps1, a.eps2, a.eps12)))
+
+
+@_implements(np.mean)
+def _mean(a, axis=None, keepdims=False):
+    """
+    Averages hyper-dual-array elements over an axis.
+    """
+    return _result(*(np.mean(part, axis=axis, keepdims=keepdims) for part in (a.real, a.eps1, a.eps2, a.eps12)))
+
+
+@_implements(np.shape)
+def _shape(a):
+    """
+    Returns the shape of a hyper-dual array.
+    """
+    return a.shape
+
+
+@_implements(np.ndim)
+def _ndim(a):
+    """
+    Returns the number of dimensions of a hyper-dual array.
+    """
+    return np.ndim(a.real)
+
+
+@_implements(np.size)
+def _size(a, axis=None):
+    """
+    Returns the number of elements of a hyper-dual array.
+    """
+    return np.size(a.real, axis)
+
+
+def _seeded_inputs(xs, eps1, eps2):
+    """
+    Returns one HyperDualArray per coordinate of ``xs``, with lane-wise seeds
+    ``eps1[:, k]`` and ``eps2[:, k]`` for coordinate k.
+    """
+    lanes = eps1.shape[0]
+    return [
+        HyperDualArray._from_parts(np.full(lanes, x), eps1[:, k].copy(), eps2[:, k].copy(), np.zeros(lanes))
+        for k, x in enumerate(xs.tolist())
+    ]
+
+
+def _evaluate(func, inputs, lanes):
+    """
+    Evaluates ``func`` on the seeded inputs and broadcasts the parts of the result to ``lanes``.
+    """
+    y = func(inputs)
+    if isinstance(y, (float, int)):
+        zeros = np.zeros(lanes)
+        return np.full(lanes, float(y)), zeros, zeros
+    return (np.broadcast_to(y.real, (lanes,)), np.broadcast_to(y.eps1, (lanes,)), np.broadcast_to(y.eps12, (lanes,)))
+
+
+def compute_hessian(func, xs, return_gradient=False, batch_size=None):
+    """
+    Computes the exact Hessian of a scalar function of several variables using hyper-dual numbers.
+
+    Each of the n(n + 1) / 2 entries of the upper triangle is one lane of a
+    `HyperDualArray` seeded with ``eps1 = e_i`` and ``eps2 = e_j``, so the whole
+    Hessian is filled from one vectorized evaluation of ``func`` (or one per
+    batch of ``batch_size`` lanes).
+
+    Parameters
+    ----------
+    func : function
+        The function to differentiate. It is called with a list of ``len(xs)``
+        hyper-dual arrays and must return a single one.
+
+    xs : array_like
+        The point at which to compute the Hessian.
+
+    return_gradient : bool, optional
+        If True, also return the function value and gradient.
+
+    batch_size : int, optional
+        The maximum number of lanes per evaluation, to bound memory for large
+        n. By default all n(n + 1) / 2 lanes are evaluated at once.
+
+    Returns
+    -------
+    value : float
+        The function value. Only returned if ``return_gradient`` is True.
+
+    gradient : numpy.ndarray
+        The gradient, shape (n,). Only returned if ``return_gradient`` is True.
+
+    hessian : numpy.ndarray
+        The symmetric Hessian, shape (n, n).
+
+    Raises
+    ------
+    ValueError
+        If ``batch_size`` is less than 1.
+
+    Examples
+    --------
+    >>> def f(x):
+    ...     return x[0] * x[0] * x[1]
+    >>> compute_hessian(f, [1.0, 2.0])
+    array([[4., 2.],
+           [2., 0.]])
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"Expected a positive batch size, got {batch_size} instead.")
+    xs = np.asarray(xs, dtype=np.float64).ravel()
+    n = xs.size
+    rows, cols = np.triu_indices(n)
+    batch_size = rows.size if batch_size is None else batch_size
+    identity = np.eye(n)
+
+    hessian = np.empty((n, n))
+    gradient = np.empty(n)
+    value = None
+    for start in range(0, rows.size, batch_size):
+        i, j = rows[start:start + batch_size], cols[start:start + batch_size]
+        real, eps1, eps12 = _evaluate(func, _seeded_inputs(xs, identity[i], identity[j]), i.size)
+        hessian[i, j] = eps12
+        hessian[j, i] = eps12
+        gradient[i] = eps1
+        value = float(real[0])
+    return (value, gradient, hessian) if return_gradient else hessian
+
+
+def hessian_vector_product(func, xs, v):
+    """
+    Computes the Hessian-vector product H v of a scalar function using hyper-dual numbers.
+
+    Lane i is seeded with ``eps1 = e_i`` and ``eps2 = v``, so its ε1ε2 part is
+    (H v)_i: the product costs n lanes in one vectorized evaluation and never
+    forms the Hessian.
+
+    Parameters
+    ----------
+    func : function
+        The function to differentiate, called as in `compute_hessian`.
+
+    xs : array_like
+        The point at which to evaluate the Hessian.
+
+    v : array_like
+        The vector to multiply by, same length as ``xs``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The product H v, shape (n,).
+
+    Examples
+    --------
+    >>> def f(x):
+    ...     return x[0] * x[0] * x[1]
+    >>> hessian_vector_product(f, [1.0, 2.0], [1.0, 0.0])
+    array([4., 2.])
+    """
+    xs = np.asarray(xs, dtype=np.float64).ravel()
+    v = np.asarray(v, dtype=np.float64).ravel()
+    if v.shape != xs.shape:
+        raise ValueError(f"Expected 'v' of length {xs.size}, got {v.size} instead.")
+    n = xs.size
+    _, _, eps12 = _evaluate(func, _seeded_inputs(xs, np.eye(n), np.broadcast_to(v, (n, n))), n)
+    return np.array(eps12)
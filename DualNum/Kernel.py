@@ -0,0 +1,524 @@
+import hashlib
+import importlib.util
+import math
+import os
+import shutil
+import sys
+import sysconfig
+import tempfile
+import time
+
+import numpy as np
+
+from .Tape import OPCODES
+
+
+# Bumped whenever the generated code changes, so stale kernels are never reused.
+_GENERATOR_VERSION = "3"
+
+_EXT_SUFFIX = sysconfig.get_config_var("EXT_SUFFIX")
+
+_ERRORS = {
+    1: (ZeroDivisionError, "division by zero is undefined"),
+    2: (ValueError, "Logarithm of a non-positive number is undefined."),
+    3: (ValueError, "math domain error"),
+}
+
+# C statements computing (v, d) of a node from its operands (va, da) and (vb, db).
+_TEMPLATES = {
+    "add": ["{v} = {va} + {vb}", "{d} = {da} + {db}"],
+    "sub": ["{v} = {va} - {vb}", "{d} = {da} - {db}"],
+    "mul": ["{v} = {va} * {vb}", "{d} = {da} * {vb} + {va} * {db}"],
+    "truediv": [
+        "if {vb} == 0:", "    err = 1", "    break",
+        "{v} = {va} / {vb}", "{d} = ({da} * {vb} - {va} * {db}) / ({vb} * {vb})",
+    ],
+    # As in Dual.__pow__, an exponent whose dual part is zero is a constant and takes the power rule
+    "pow": [
+        "if {db} != 0:",
+        "    if {va} <= 0:", "        err = 3", "        break",
+        "    {v} = pow({va}, {vb})",
+        "    {d} = {v} * ({db} * log({va}) + {vb} * {da} / {va})",
+        "elif {vb} == 0:",
+        "    {v} = 1.0",
+        "    {d} = 0.0",
+        "else:",
+        "    if {va} < 0 and {vb} != floor({vb}):", "        err = 3", "        break",
+        "    if {va} == 0 and ({vb} < 0 or ({vb} < 1 and {vb} != floor({vb}))):", "        err = 1", "        break",
+        "    {v} = pow({va}, {vb})",
+        "    {d} = {vb} * pow({va}, {vb} - 1) * {da}",
+    ],
+    "sin": ["{v} = sin({va})", "{d} = {da} * cos({va})"],
+    "cos": ["{v} = cos({va})", "{d} = -{da} * sin({va})"],
+    "tan": ["{v} = tan({va})", "t = cos({va})", "{d} = {da} / (t * t)"],
+    "exp": ["{v} = exp({va})", "{d} = {da} * {v}"],
+    "log": ["if {va} <= 0:", "    err = 2", "    break", "{v} = log({va})", "{d} = {da} / {va}"],
+    "sqrt": [
+        "if {va} < 0:", "    err = 3", "    break",
+        "if {va} == 0:", "    err = 1", "    break",
+        "{v} = sqrt({va})", "{d} = {da} / (2 * {v})",
+    ],
+    "sinh": ["{v} = sinh({va})", "{d} = {da} * cosh({va})"],
+    "cosh": ["{v} = cosh({va})", "{d} = {da} * sinh({va})"],
+    "tanh": ["{v} = tanh({va})", "t = cosh({va})", "{d} = {da} / (t * t)"],
+    "asin": [
+        "if {va} < -1 or {va} > 1:", "    err = 3", "    break",
+        "if {va} == 1 or {va} == -1:", "    err = 1", "    break",
+        "{v} = asin({va})", "{d} = {da} / sqrt(1 - {va} * {va})",
+    ],
+    "acos": [
+        "if {va} < -1 or {va} > 1:", "    err = 3", "    break",
+        "if {va} == 1 or {va} == -1:", "    err = 1", "    break",
+        "{v} = acos({va})", "{d} = -{da} / sqrt(1 - {va} * {va})",
+    ],
+    "atan": ["{v} = atan({va})", "{d} = {da} / (1 + {va} * {va})"],
+    "sincos": ["{v} = sin({va})", "c{i} = cos({va})", "{d} = {da} * c{i}"],
+}
+
+_HEADER = '''\
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# Generated by DualNum.Kernel from tape {digest}; do not edit.
+from libc.math cimport sin, cos, tan, exp, log, sqrt, sinh, cosh, tanh, asin, acos, atan, pow, floor, INFINITY, NAN
+
+
+def kernel(size_t x_address, size_t dx_address, size_t out_address, size_t dout_address, Py_ssize_t n):
+    cdef const double* x = <const double*>x_address
+    cdef const double* dx = <const double*>dx_address
+    cdef double* out = <double*>out_address
+    cdef double* dout = <double*>dout_address
+    cdef Py_ssize_t k
+    cdef int err = 0
+    cdef double t
+'''
+
+
+def _literal(value):
+    """
+    Returns a C literal for a float constant.
+    """
+    if math.isnan(value):
+        return "NAN"
+    if math.isinf(value):
+        return "INFINITY" if value > 0 else "-INFINITY"
+    return repr(float(value))
+
+
+def _constant_power(c):
+    """
+    Returns the C statements of a power with the constant exponent ``c``, specialising the domain checks of the ``pow`` template.
+    """
+    if c == 0:
+        return ["{v} = 1.0", "{d} = 0.0"]
+    lines = []
+    if not c.is_integer():
+        lines += ["if {va} < 0:", "    err = 3", "    break"]
+    if c < 0 or (c < 1 and not c.is_integer()):
+        lines += ["if {va} == 0:", "    err = 1", "    break"]
+    return lines + ["{v} = pow({va}, {vb})", "{d} = {vb} * pow({va}, {vb} - 1) * {da}"]
+
+
+def generate_source(tape):
+    """
+    Generates the Cython source of a fused kernel evaluating a tape.
+
+    The kernel loops once over the batch and keeps every node value and
+    derivative in C locals, so no intermediate arrays are allocated. It
+    writes the outputs into preallocated arrays and returns 0, or the
+    error code of the first element hitting a division by zero, the
+    logarithm of a non-positive number, a square root, arcsine or arccosine
+    outside its domain or at a pole of its derivative, or a power outside
+    the domain `Dual.__pow__` accepts.
+
+    Parameters
+    ----------
+    tape : Tape
+        The tape to compile.
+
+    Returns
+    -------
+    str
+        The Cython source of a module defining
+        ``kernel(x_address, dx_address, out_address, dout_address, n)``, which
+        reads C-contiguous float64 arrays of shape (n_inputs, n) and writes
+        arrays of shape (n_outputs, n), all passed by buffer address.
+    """
+    n = len(tape)
+    lines = [_HEADER.format(digest=tape.digest())]
+    lines.append("    cdef double " + ", ".join(f"v{i}, d{i}" for i in range(n)))
+    cosines = [i for i, code in enumerate(tape.opcodes.tolist()) if OPCODES[code] == "sincos"]
+    if cosines:
+        lines.append("    cdef double " + ", ".join(f"c{i}" for i in cosines))
+    lines += ["    with nogil:", "        for k in range(n):"]
+
+    body = []
+    opcodes, args = tape.opcodes.tolist(), tape.args.tolist()
+    for i, (code, (a, b)) in enumerate(zip(opcodes, args)):
+        name = OPCODES[code]
+        if name == "input":
+            body += [f"v{i} = x[{a} * n + k]", f"d{i} = dx[{a} * n + k]"]
+        elif name == "const":
+            body += [f"v{i} = {_literal(tape.constants[a])}", f"d{i} = 0.0"]
+        elif name == "sincos_cos":
+            u = args[a][0]
+            body += [f"v{i} = c{a}", f"d{i} = -d{u} * v{a}"]
+        else:
+            fields = {"v": f"v{i}", "d": f"d{i}", "i": i, "va": f"v{a}", "da": f"d{a}", "vb": f"v{b}", "db": f"d{b}"}
+            if name == "pow" and OPCODES[opcodes[b]] == "const":
+                template = _constant_power(float(tape.constants[args[b][0]]))
+            else:
+                template = _TEMPLATES[name]
+            body += [line.format(**fields) for line in template]
+    for j, k in enumerate(tape.outputs.tolist()):
+        body += [f"out[{j} * n + k] = v{k}", f"dout[{j} * n + k] = d{k}"]
+
+    lines += ["            " + line for line in body]
+    lines.append("    return err")
+    return "\n".join(lines) + "\n"
+
+
+def _python_include_dir():
+    """
+    Returns Python's include directory, detected as in dual_autodiff_x/setup.py.
+    """
+    return os.path.join(os.path.dirname(sysconfig.get_paths()["include"]), "include")
+
+
+def _build(source, module_name, build_dir):
+    """
+    Cythonizes and compiles a kernel module, returning the path of the built extension.
+    """
+    from Cython.Build import cythonize
+    from setuptools import Distribution, Extension
+
+    pyx = os.path.join(build_dir, module_name + ".pyx")
+    with open(pyx, "w") as f:
+        f.write(source)
+    extension = Extension(module_name, [pyx], include_dirs=[_python_include_dir()])
+    distribution = Distribution({
+        "ext_modules": cythonize([extension], compiler_directives={"language_level": "3"}, quiet=True),
+    })
+    command = distribution.get_command_obj("build_ext")
+    command.build_lib = build_dir
+    command.build_temp = os.path.join(build_dir, "build")
+    distribution.verbose = 0
+    distribution.run_command("build_ext")
+    return command.get_ext_fullpath(module_name)
+
+
+def _load(path, module_name):
+    """
+    Imports an extension module from a file path.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Kernel:
+    """
+    A class to represent a tape compiled to a native fused loop.
+
+    Attributes
+    ----------
+    tape : Tape
+        The compiled tape.
+
+    key : str
+        The cache key of the kernel.
+
+    source : str
+        Where the kernel came from: ``"compiled"`` (cold start),
+        ``"disk"`` (warm start from the on-disk cache) or ``"memory"``.
+
+    timings : dict
+        Seconds spent in ``"codegen"``, ``"compile"`` and ``"load"``; the
+        first two are 0 for a warm start.
+
+    Examples
+    --------
+    >>> kernel = compile_tape(trace(lambda x: x.sin() * x))
+    >>> kernel.evaluate([0.0, 1.0])[1]
+    array([0.        , 1.38177329])
+    """
+
+    def __init__(self, tape, key, function, source, timings):
+        """
+        Constructs all the necessary attributes for the Kernel object.
+
+        Parameters
+        ----------
+        tape : Tape
+            The compiled tape.
+
+        key : str
+            The cache key of the kernel.
+
+        function : callable
+            The compiled ``kernel`` function of `generate_source`.
+
+        source : str
+            One of ``"compiled"``, ``"disk"`` or ``"memory"``.
+
+        timings : dict
+            Seconds spent in ``"codegen"``, ``"compile"`` and ``"load"``.
+        """
+        self.tape = tape
+        self.key = key
+        self._function = function
+        self.source = source
+        self.timings = timings
+
+    def __repr__(self):
+        """
+        Returns a string representation of the kernel.
+        """
+        return f'Kernel(key={self.key[:12]}, source={self.source!r})'
+
+    def evaluate(self, inputs, seeds=None):
+        """
+        Evaluates the compiled tape over a batch of points.
+
+        Takes the same arguments and returns the same arrays as `Tape.evaluate`.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If an element divides by zero, raises zero to a negative power,
+            or takes the square root of 0 or the arcsine or arccosine of 1
+            or -1.
+
+        ValueError
+            If an element takes the logarithm of a non-positive number, the
+            square root of a negative number, the arcsine or arccosine of a
+            number outside [-1, 1], or a power outside the domain
+            `Dual.__pow__` accepts.
+        """
+        tape = self.tape
+        inputs, seeds = tape._check_inputs(inputs, seeds)
+        shape = np.broadcast_shapes(*(np.shape(x) for x in inputs), *(np.shape(s) for s in seeds))
+        size = math.prod(shape)
+        x = np.empty((tape.n_inputs, size))
+        dx = np.empty((tape.n_inputs, size))
+        for k in range(tape.n_inputs):
+            x[k] = np.broadcast_to(np.asarray(inputs[k], dtype=np.float64), shape).ravel()
+            dx[k] = np.broadcast_to(np.asarray(seeds[k], dtype=np.float64), shape).ravel()
+        values = np.empty((len(tape.outputs), size))
+        derivatives = np.empty((len(tape.outputs), size))
+
+        err = self._function(x.ctypes.data, dx.ctypes.data, values.ctypes.data, derivatives.ctypes.data, size)
+        if err:
+            error, message = _ERRORS[err]
+            raise error(message)
+
+        values = values.reshape((-1,) + shape)
+        derivatives = derivatives.reshape((-1,) + shape)
+        if not tape.multi_output:
+            return values[0], derivatives[0]
+        return values, derivatives
+
+
+class KernelCache:
+    """
+    A content-addressed on-disk cache of compiled kernels.
+
+    Kernels are keyed on the tape digest, the C compiler, the Python version
+    and the extension ABI, so a restarted worker reuses the kernels compiled
+    by a previous one instead of recompiling. When the cache grows past
+    ``max_bytes`` the least recently used kernels are evicted.
+
+    Attributes
+    ----------
+    directory : str
+        The cache directory.
+
+    max_bytes : int
+        The size cap of the cache in bytes.
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 2 ** 20):
+        """
+        Constructs all the necessary attributes for the KernelCache object.
+
+        Parameters
+        ----------
+        directory : str, optional
+            The cache directory. Defaults to ``$DUALNUM_CACHE_DIR`` or
+            ``~/.cache/dualnum/kernels``.
+
+        max_bytes : int, optional
+            The size cap of the cache in bytes, 256 MiB by default.
+        """
+        if directory is None:
+            directory = os.environ.get("DUALNUM_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "dualnum", "kernels"))
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._loaded = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        """
+        Returns the number of kernels stored on disk.
+        """
+        return len(self._entries())
+
+    def __repr__(self):
+        """
+        Returns a string representation of the cache.
+        """
+        return f'KernelCache(directory={self.directory!r}, n_kernels={len(self)}, size_bytes={self.size_bytes()})'
+
+    def key(self, tape):
+        """
+        Returns the cache key of a tape.
+        """
+        toolchain = "|".join([
+            _GENERATOR_VERSION,
+            str(sysconfig.get_config_var("CC")),
+            sys.version,
+            str(_EXT_SUFFIX),
+        ])
+        return hashlib.sha256((tape.digest() + "|" + toolchain).encode()).hexdigest()
+
+    def path(self, key):
+        """
+        Returns the path of the compiled kernel stored under ``key``.
+        """
+        return os.path.join(self.directory, key + _EXT_SUFFIX)
+
+    def size_bytes(self):
+        """
+        Returns the total size of the kernels stored on disk.
+        """
+        return sum(size for _, _, size in self._entries())
+
+    def get(self, tape):
+        """
+        Returns the compiled kernel of a tape, compiling it on a cache miss.
+
+        Parameters
+        ----------
+        tape : Tape
+            The tape to compile.
+
+        Returns
+        -------
+        Kernel
+            The compiled kernel.
+        """
+        key = self.key(tape)
+        module_name = "_dualnum_kernel_" + key[:32]
+        timings = {"codegen": 0.0, "compile": 0.0, "load": 0.0}
+        path = self.path(key)
+
+        if key in self._loaded:
+            source = "memory"
+        elif os.path.exists(path):
+            source = "disk"
+        else:
+            source = "compiled"
+            start = time.perf_counter()
+            code = generate_source(tape)
+            timings["codegen"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            build_dir = tempfile.mkdtemp(dir=self.directory, prefix=".build-")
+            try:
+                built = _build(code, module_name, build_dir)
+                os.replace(built, path)
+            finally:
+                shutil.rmtree(build_dir, ignore_errors=True)
+            timings["compile"] = time.perf_counter() - start
+
+        if source != "memory":
+            start = time.perf_counter()
+            self._loaded[key] = _load(path, module_name).kernel
+            timings["load"] = time.perf_counter() - start
+        if os.path.exists(path):
+            os.utime(path)
+        if source == "compiled":
+            self.evict(keep=path)
+        return Kernel(tape, key, self._loaded[key], source, timings)
+
+    def evict(self, keep=None):
+        """
+        Removes least recently used kernels until the cache fits in ``max_bytes``.
+
+        Parameters
+        ----------
+        keep : str, optional
+            A kernel path that is never evicted.
+
+        Returns
+        -------
+        int
+            The number of kernels removed.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """
+        Removes every kernel stored on disk.
+        """
+        for path, _, _ in self._entries():
+            os.remove(path)
+
+    def _entries(self):
+        """
+        Returns (path, last use time, size) of every kernel stored on disk.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(_EXT_SUFFIX):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        return entries
+
+
+_DEFAULT_CACHE = None
+
+
+def compile_tape(tape, cache=None):
+    """
+    Compiles a tape to a native fused loop.
+
+    Parameters
+    ----------
+    tape : Tape
+        The tape to compile, e.g. from `trace` and `Tape.optimize`.
+
+    cache : KernelCache, optional
+        The cache to use. Defaults to a `KernelCache` in the default directory.
+
+    Returns
+    -------
+    Kernel
+        The compiled kernel; ``kernel.source`` and ``kernel.timings`` report
+        whether it was a cold or a warm start and how long each step took.
+
+    Examples
+    --------
+    >>> tape = trace(lambda x: x.sin() + x.log()).optimize()
+    >>> kernel = compile_tape(tape)
+    >>> values, derivatives = kernel.evaluate(np.linspace(0.1, 10, 1_000_000))
+    """
+    global _DEFAULT_CACHE
+    if cache is None:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = KernelCache()
+        cache = _DEFAULT_CACHE
+    return cache.get(tape)
@@ -0,0 +1,450 @@
+import math
+
+import numpy as np
+
+
+class MultiDual:
+    """
+    A class to represent a dual number with several tangent components.
+
+    The dual part is a fixed-length float64 array, one component per input
+    direction, and every operation updates all components at once. Seeding
+    each of n inputs with a different unit vector gives the full gradient of
+    an n-input function in a single evaluation.
+
+    Attributes
+    ----------
+    real : float
+        The real part of the dual number.
+
+    dual : numpy.ndarray
+        The tangent components of the dual number.
+
+    Examples
+    --------
+    >>> x = MultiDual(2, [1, 0])
+    >>> y = MultiDual(3, [0, 1])
+    >>> z = x * y + x.sin()
+    >>> z.dual
+    array([2.58385316, 2.        ])
+    """
+
+    # Special Methods
+    def __init__(self, real, dual):
+        """
+        Constructs all the necessary attributes for the MultiDual object.
+
+        Parameters
+        ----------
+        real : float
+            The real part of the dual number.
+
+        dual : array_like
+            The tangent components of the dual number.
+
+        Raises
+        ------
+        TypeError
+            If 'real' is not of type float or int.
+        """
+        if not isinstance(real, (float, int)):
+            raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+
+        self.real = real
+        self.dual = np.array(dual, dtype=np.float64, ndmin=1)
+
+    @classmethod
+    def _from_parts(cls, real, dual):
+        """
+        Builds a MultiDual from a float and a float64 ndarray without validation.
+        """
+        result = object.__new__(cls)
+        result.real = real
+        result.dual = dual
+        return result
+
+    def _check(self, other):
+        """
+        Raises a ValueError if two MultiDuals have a different number of tangents.
+        """
+        if self.dual.shape != other.dual.shape:
+            raise ValueError(f"tangent lengths differ: {self.dual.shape[0]} and {other.dual.shape[0]}")
+
+    def __add__(self, other):
+        """
+        Adds a multi-dual number and another multi-dual number or scalar.
+
+        Parameters
+        ----------
+        other : MultiDual, int, or float
+            The value to add to the current multi-dual number.
+        """
+        if isinstance(other, MultiDual):
+            self._check(other)
+            return MultiDual._from_parts(self.real + other.real, self.dual + other.dual)
+        if isinstance(other, (float, int)):
+            return MultiDual._from_parts(self.real + other, self.dual.copy())
+        return NotImplemented
+
+    def __radd__(self, other):
+        """
+        Adds a multi-dual number and another multi-dual number or scalar.
+
+        Parameters
+        ----------
+        other : MultiDual, int, or float
+            The value to add to the current multi-dual number.
+        """
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """
+        Subtracts a multi-dual number or scalar from the multi-dual number.
+
+        Parameters
+        ----------
+        other : MultiDual, int, or float
+            The value to subtract from the current multi-dual number.
+        """
+        if isinstance(other, MultiDual):
+            self._check(other)
+            return MultiDual._from_parts(self.real - other.real, self.dual - other.dual)
+        if isinstance(other, (float, int)):
+            return MultiDual._from_parts(self.real - other, self.dual.copy())
+        return NotImplemented
+
+    def __rsub__(self, other):
+        """
+        Subtracts the multi-dual number from an int/float.
+
+        Parameters
+        ----------
+        other : int, or float
+            The value the current multi-dual number is subtracted from.
+        """
+        if isinstance(other, (float, int)):
+            return MultiDual._from_parts(other - self.real, -self.dual)
+        return NotImplemented
+
+    def __mul__(self, other):
+        """
+        Multiplies a multi-dual number with another multi-dual number or an int/float.
+
+        Parameters
+        ----------
+        other : MultiDual, int, or float
+            The value to multiply with the current multi-dual number.
+        """
+        if isinstance(other, MultiDual):
+            self._check(other)
+            return MultiDual._from_parts(self.real * other.real, self.real * other.dual + other.real * self.dual)
+        if isinstance(other, (float, int)):
+            return MultiDual._from_parts(self.real * other, self.dual * other)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """
+        Multiplies a multi-dual number with another multi-dual number or an int/float.
+
+        Parameters
+        ----------
+        other : MultiDual, int, or float
+            The value to multiply with the current multi-dual number.
+        """
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        Divides the multi-dual number by another multi-dual number or an int/float.
+
+        Parameters
+        ----------
+        other : MultiDual, int, or float
+            The value to divide the current multi-dual number by.
+        """
+        if isinstance(other, MultiDual):
+            self._check(other)
+            if other.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return MultiDual._from_parts(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
+        if isinstance(other, (float, int)):
+            if other == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return MultiDual._from_parts(self.real / other, self.dual / other)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        """
+        Divides an int/float by the multi-dual number.
+
+        Parameters
+        ----------
+        other : int, or float
+            The value to divide by the current multi-dual number.
+        """
+        if isinstance(other, (float, int)):
+            if self.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return MultiDual._from_parts(other / self.real, (-other / (self.real ** 2)) * self.dual)
+        return NotImplemented
+
+    def __pow__(self, other):
+        """
+        Raises the multi-dual number to the power of another multi-dual number or an int/float.
+
+        As for `Dual`, a constant exponent (or a multi-dual one whose tangent
+        is zero) uses ``n * x ** (n - 1)`` without a logarithm, so negative
+        bases are accepted with integer exponents.
+
+        Parameters
+        ----------
+        other : MultiDual, int, or float
+            The exponent.
+
+        Raises
+        ------
+        ValueError
+            If a negative base is raised to a non-integer power.
+
+        ZeroDivisionError
+            If zero is raised to a negative power, or to a non-integer power
+            below 1 (where the derivative is infinite).
+        """
+        if isinstance(other, MultiDual):
+            self._check(other)
+            if np.any(other.dual):
+                p = self.real ** other.real
+                return MultiDual._from_parts(p, p * (math.log(self.real) * other.dual + (other.real / self.real) * self.dual))
+            other = other.real
+        if isinstance(other, (float, int)):
+            if other == 0:
+                return MultiDual._from_parts(1.0, np.zeros_like(self.dual))
+            r = self.real
+            if r <= 0:
+                if not float(other).is_integer():
+                    if r < 0:
+                        raise ValueError("math domain error")
+                    if other < 1:
+                        raise ZeroDivisionError("division by zero is undefined")
+                    return MultiDual._from_parts(0.0, np.zeros_like(self.dual))
+                if r == 0 and other < 0:
+                    raise ZeroDivisionError("division by zero is undefined")
+            return MultiDual._from_parts(r ** other, (other * r ** (other - 1)) * self.dual)
+        return NotImplemented
+
+    def __eq__(self, other):
+        """
+        Checks if two multi-dual numbers are equal.
+
+        Parameters
+        ----------
+        other : MultiDual
+            The multi-dual number to compare with the current multi-dual number.
+        """
+        if isinstance(other, MultiDual):
+            return self.real == other.real and np.array_equal(self.dual, other.dual)
+        return False
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        Returns a string representation of the multi-dual number.
+        """
+        return f'MultiDual(real={self.real}, dual={self.dual!r})'
+
+    # Class Methods
+    def get_real(self):
+        """
+        Returns the real part of the multi-dual number.
+        """
+        return self.real
+
+    def get_dual(self):
+        """
+        Returns the tangent components of the multi-dual number.
+        """
+        return self.dual
+
+    def _chain(self, value, derivative):
+        """
+        Returns f(self) given f(real) and f'(real), scaling every tangent component.
+        """
+        return MultiDual._from_parts(value, derivative * self.dual)
+
+    def sin(self):
+        """
+        Returns the sine of the multi-dual number.
+        """
+        return self._chain(math.sin(self.real), math.cos(self.real))
+
+    def cos(self):
+        """
+        Returns the cosine of the multi-dual number.
+        """
+        return self._chain(math.cos(self.real), -math.sin(self.real))
+
+    def tan(self):
+        """
+        Returns the tangent of the multi-dual number.
+        """
+        return self._chain(math.tan(self.real), 1 / (math.cos(self.real) ** 2))
+
+    def exp(self):
+        """
+        Returns the exponential of the multi-dual number.
+        """
+        e = math.exp(self.real)
+        return self._chain(e, e)
+
+    def log(self):
+        """
+        Returns the natural logarithm of the multi-dual number.
+        """
+        if self.real <= 0:
+            raise ValueError("Logarithm of a non-positive number is undefined.")
+        return self._chain(math.log(self.real), 1 / self.real)
+
+    def sqrt(self):
+        """
+        Returns the square root of the multi-dual number.
+        """
+        s = math.sqrt(self.real)
+        return self._chain(s, 1 / (2 * s))
+
+    def sinh(self):
+        """
+        Returns the hyperbolic sine of the multi-dual number.
+        """
+        return self._chain(math.sinh(self.real), math.cosh(self.real))
+
+    def cosh(self):
+        """
+        Returns the hyperbolic cosine of the multi-dual number.
+        """
+        return self._chain(math.cosh(self.real), math.sinh(self.real))
+
+    def tanh(self):
+        """
+        Returns the hyperbolic tangent of the multi-dual number.
+        """
+        return self._chain(math.tanh(self.real), 1 / (math.cosh(self.real) ** 2))
+
+    def asin(self):
+        """
+        Returns the arcsine of the multi-dual number.
+        """
+        return self._chain(math.asin(self.real), 1 / math.sqrt(1 - self.real ** 2))
+
+    def acos(self):
+        """
+        Returns the arccosine of the multi-dual number.
+        """
+        return self._chain(math.acos(self.real), -1 / math.sqrt(1 - self.real ** 2))
+
+    def atan(self):
+        """
+        Returns the arctangent of the multi-dual number.
+        """
+        return self._chain(math.atan(self.real), 1 / (1 + self.real ** 2))
+
+
+
+def _seed(xs, dual_class):
+    """
+    Returns one multi-dual input per coordinate of ``xs``, seeded with the unit vectors.
+    """
+    xs = np.asarray(xs, dtype=np.float64).ravel()
+    seeds = np.eye(xs.size)
+    return [dual_class(x, seeds[i]) for i, x in enumerate(xs.tolist())]
+
+
+def _parts(y, n):
+    """
+    Returns the (value, gradient) of one output, treating plain numbers as constants.
+    """
+    if isinstance(y, (float, int)):
+        return float(y), np.zeros(n)
+    return y.real, np.asarray(y.dual, dtype=np.float64)
+
+
+def compute_gradient(func, xs, dual_class=MultiDual, return_values=False):
+    """
+    Computes the gradient of a scalar function of several variables in a single forward pass.
+
+    Parameters
+    ----------
+    func : function
+        The function to differentiate. It is called once with a list of
+        ``len(xs)`` multi-dual numbers and must return a single one.
+
+    xs : array_like
+        The point at which to compute the gradient.
+
+    dual_class : MultiDual or MultiDual_c, optional
+        The class to use for multi-dual numbers.
+
+    return_values : bool, optional
+        If True, also return the function value.
+
+    Returns
+    -------
+    value : float
+        The function value. Only returned if ``return_values`` is True.
+
+    gradient : numpy.ndarray
+        The gradient of the function at ``xs``.
+
+    Examples
+    --------
+    >>> def f(x):
+    ...     return x[0] * x[1] + x[0].sin()
+    >>> compute_gradient(f, [2, 3])
+    array([2.58385316, 2.        ])
+    """
+    inputs = _seed(xs, dual_class)
+    value, gradient = _parts(func(inputs), len(inputs))
+    return (value, gradient) if return_values else gradient
+
+
+def compute_jacobian(func, xs, dual_class=MultiDual, return_values=False):
+    """
+    Computes the Jacobian of a vector function of several variables in a single forward pass.
+
+    Parameters
+    ----------
+    func : function
+        The function to differentiate. It is called once with a list of
+        ``len(xs)`` multi-dual numbers and must return a sequence of them.
+
+    xs : array_like
+        The point at which to compute the Jacobian.
+
+    dual_class : MultiDual or MultiDual_c, optional
+        The class to use for multi-dual numbers.
+
+    return_values : bool, optional
+        If True, also return the function values.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        The function values, shape (m,). Only returned if ``return_values`` is True.
+
+    jacobian : numpy.ndarray
+        The Jacobian, shape (m, n), where ``jacobian[i, j]`` is the derivative
+        of output i with respect to input j.
+
+    Examples
+    --------
+    >>> def f(x):
+    ...     return [x[0] * x[1], x[0] + x[1]]
+    >>> compute_jacobian(f, [2, 3])
+    array([[3., 2.],
+           [1., 1.]])
+    """
+    inputs = _seed(xs, dual_class)
+    outputs = [_parts(y, len(inputs)) for y in func(inputs)]
+    values = np.array([value for value, _ in outputs])
+    jacobian = np.array([gradient for _, gradient in outputs]).reshape(len(outputs), len(inputs))
+    return (values, jacobian) if return_values else jacobian
@@ -0,0 +1,305 @@
+import math
+
+import numpy as np
+
+from .MultiDual import MultiDual
+
+# Butcher tableaus: nodes c, stage coefficients a, weights b and, for the
+# embedded pair, the error weights e = b - b_hat of the lower-order solution.
+_RK4 = {
+    "c": (0.0, 0.5, 0.5, 1.0),
+    "a": ((), (0.5,), (0.0, 0.5), (0.0, 0.0, 1.0)),
+    "b": (1 / 6, 1 / 3, 1 / 3, 1 / 6),
+    "e": None,
+    "order": 4,
+}
+
+_DOPRI5 = {
+    "c": (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0),
+    "a": (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+    ),
+    "b": (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0),
+    "e": (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40),
+    "order": 5,
+}
+
+METHODS = {"rk4": _RK4, "dopri5": _DOPRI5}
+
+
+def _real(value):
+    """
+    Returns the real part of a state component (a number, dual number or dual array).
+    """
+    return np.asarray(getattr(value, "real", value), dtype=np.float64)
+
+
+def _combine(y, h, coefficients, ks):
+    """
+    Returns ``y + h * sum(c * k)`` componentwise, skipping zero coefficients.
+    """
+    result = []
+    for i, yi in enumerate(y):
+        total = None
+        for c, k in zip(coefficients, ks):
+            if c:
+                term = c * k[i]
+                total = term if total is None else total + term
+        result.append(yi if total is None else yi + h * total)
+    return result
+
+
+def _norm(values):
+    """
+    Returns the root-mean-square norm of the real parts of a list of components.
+    """
+    squares = [float(np.sum(_real(v) ** 2)) for v in values]
+    count = sum(_real(v).size for v in values)
+    return math.sqrt(sum(squares) / max(count, 1))
+
+
+def _rhs(rhs, t, y, args):
+    """
+    Calls the right-hand side and returns its result as a list of components.
+    """
+    dy = list(rhs(t, y, *args))
+    if len(dy) != len(y):
+        raise ValueError(f"Expected the right-hand side to return {len(y)} components, got {len(dy)} instead.")
+    return dy
+
+
+def _initial_step(rhs, t0, y0, f0, args, direction, order, rtol, atol):
+    """
+    Returns a starting step size for an adaptive method (Hairer, Nørsett & Wanner, II.4).
+    """
+    scale = [atol + rtol * np.abs(_real(v)) for v in y0]
+    d0 = _norm([_real(v) / s for v, s in zip(y0, scale)])
+    d1 = _norm([_real(v) / s for v, s in zip(f0, scale)])
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    y1 = [_real(v) + direction * h0 * _real(f) for v, f in zip(y0, f0)]
+    f1 = _rhs(rhs, t0 + direction * h0, y1, [getattr(a, "real", a) for a in args])
+    d2 = _norm([(_real(a) - _real(b)) / s for a, b, s in zip(f1, f0, scale)]) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / (order + 1))
+    return min(100 * h0, h1)
+
+
+def integrate(rhs, y0, t_span, args=(), method="dopri5", step=None, rtol=1e-6, atol=1e-9, t_eval=None,
+              max_steps=100_000):
+    """
+    Integrates an ODE system on dual numbers, yielding the solution as it goes.
+
+    The integrator only adds, scales and passes state components to
+    ``rhs``, so they can be floats, `Dual`, `MultiDual`, `DualArray` or any
+    mix: seeding a parameter or an initial condition with a dual part
+    carries the derivative of the solution along with it, from one
+    integration. Adaptive steps are chosen from the real parts only, so
+    the derivative is exact for the discrete solution the real parts
+    follow, with no finite-difference noise.
+
+    The solution is yielded rather than stored, so memory stays bounded
+    however long the trajectory.
+
+    Parameters
+    ----------
+    rhs : function
+        The right-hand side, called as ``rhs(t, y, *args)`` with a float
+        ``t`` and the list of state components ``y``, returning a sequence
+        of the same length.
+
+    y0 : sequence
+        The initial state components.
+
+    t_span : tuple of float
+        The initial and final times ``(t0, t1)``; ``t1 < t0`` integrates backwards.
+
+    args : tuple, optional
+        Extra arguments of ``rhs``, typically the (possibly seeded) parameters.
+
+    method : {"dopri5", "rk4"}, optional
+        Adaptive Dormand–Prince 5(4) or the classical fixed-step
+        Runge–Kutta method.
+
+    step : float, optional
+        The step size; required for "rk4", the initial step for "dopri5"
+        (estimated if not given).
+
+    rtol, atol : float, optional
+        The relative and absolute error tolerances of "dopri5".
+
+    t_eval : array_like, optional
+        Increasing (or, backwards, decreasing) times at which to yield the
+        solution; steps are shortened to land on them. By default every
+        accepted step is yielded, starting with ``t0``.
+
+    max_steps : int, optional
+        The maximum number of accepted and rejected steps.
+
+    Yields
+    ------
+    t : float
+        The time.
+
+    y : list
+        The state components at ``t``.
+
+    Raises
+    ------
+    ValueError
+        If 'method' is unknown, "rk4" is used without 'step', or the step
+        limit is reached.
+
+    Examples
+    --------
+    >>> k = Dual(0.5, 1.0)  # seed the decay rate
+    >>> for t, (y,) in integrate(lambda t, y, k: [-1.0 * k * y[0]], [1.0], (0, 2), args=(k,), t_eval=[2.0]):
+    ...     print(t, y.real, y.dual)  # y = exp(-k t), dy/dk = -t exp(-k t)  # doctest: +SKIP
+    2.0 0.36787944... -0.73575888...
+    """
+    if method not in METHODS:
+        raise ValueError(f"Expected method 'dopri5' or 'rk4', got {method!r} instead.")
+    tableau = METHODS[method]
+    adaptive = tableau["e"] is not None
+    if not adaptive and step is None:
+        raise ValueError("the 'rk4' method needs a step size")
+
+    t0, t1 = map(float, t_span)
+    direction = 1.0 if t1 >= t0 else -1.0
+    stops = [t1] if t_eval is None else [float(t) for t in t_eval]
+    if any(direction * (b - a) < 0 for a, b in zip([t0] + stops, stops)) or direction * (stops[-1] - t1) > 0:
+        raise ValueError("t_eval must be sorted in the direction of integration and lie within t_span")
+
+    t, y = t0, list(y0)
+    f = _rhs(rhs, t, y, args)
+    if t_eval is None:
+        yield t, y
+    elif stops[0] == t0:
+        yield t, y
+        stops = stops[1:]
+
+    h = abs(step) if step is not None else _initial_step(rhs, t, y, f, args, direction, tableau["order"], rtol, atol)
+    steps = 0
+    for stop in stops:
+        while direction * (stop - t) > 0:
+            if steps >= max_steps:
+                raise ValueError(f"reached {max_steps} steps before t={stop}")
+            steps += 1
+            # Shorten the step to land on the next output time
+            dt = direction * min(h, abs(stop - t))
+            landing = abs(stop - t) <= h
+
+            ks = [f]
+            for c, a in zip(tableau["c"][1:], tableau["a"][1:]):
+                stage = _combine(y, dt, a, ks)
+                ks.append(_rhs(rhs, t + c * dt, stage, args))
+            # Dormand-Prince's last stage is taken at the new solution (first same as last)
+            y_new = stage if adaptive else _combine(y, dt, tableau["b"], ks)
+
+            if adaptive:
+                # The step size control only looks at the real parts
+                error = _combine([0.0] * len(y), dt, tableau["e"], [[_real(v) for v in k] for k in ks])
+                scale = [atol + rtol * np.maximum(np.abs(_real(a)), np.abs(_real(b))) for a, b in zip(y, y_new)]
+                norm = _norm([_real(e) / s for e, s in zip(error, scale)])
+                factor = 5.0 if norm == 0 else min(5.0, max(0.2, 0.9 * norm ** (-1 / tableau["order"])))
+                if norm > 1:
+                    h *= factor
+                    continue
+                f = ks[-1]
+                if not landing or factor < 1:
+                    h *= factor
+                else:
+                    h = max(h, abs(dt) * factor)
+            else:
+                f = _rhs(rhs, t + dt, y_new, args)
+
+            t = stop if landing else t + dt
+            y = y_new
+            if t_eval is None:
+                yield t, y
+        if t_eval is not None:
+            yield t, y
+
+
+def compute_sensitivities(rhs, y0, t_span, params, t_eval=None, wrt="params", **options):
+    """
+    Computes the solution of an ODE and its derivatives with respect to all parameters in one integration.
+
+    Every parameter (and, with ``wrt="y0"`` or ``"both"``, every initial
+    condition) is seeded as a `MultiDual` with its own unit tangent, so the
+    full sensitivity matrix comes out of a single `integrate` pass.
+
+    Parameters
+    ----------
+    rhs : function
+        The right-hand side, called as ``rhs(t, y, *params)``.
+
+    y0 : array_like
+        The initial state, shape (n,).
+
+    t_span : tuple of float
+        The initial and final times.
+
+    params : array_like
+        The parameters, shape (k,).
+
+    t_eval : array_like, optional
+        The output times; every accepted step by default.
+
+    wrt : {"params", "y0", "both"}, optional
+        Differentiate with respect to the parameters, the initial state, or
+        both (parameters first).
+
+    **options
+        Passed to `integrate` (``method``, ``step``, ``rtol``, ``atol``, ``max_steps``).
+
+    Returns
+    -------
+    t : numpy.ndarray
+        The output times, shape (m,).
+
+    y : numpy.ndarray
+        The solution, shape (m, n).
+
+    sensitivities : numpy.ndarray
+        ``sensitivities[i, j, l]`` is the derivative of ``y[i, j]`` with
+        respect to parameter (or initial condition) ``l``, shape (m, n, d).
+
+    Raises
+    ------
+    ValueError
+        If 'wrt' is unknown.
+
+    Examples
+    --------
+    >>> def lotka_volterra(t, y, a, b, c, d):
+    ...     return [a * y[0] - b * y[0] * y[1], d * y[0] * y[1] - c * y[1]]
+    >>> t, y, s = compute_sensitivities(lotka_volterra, [10, 5], (0, 15), [1.1, 0.4, 0.4, 0.1],
+    ...                                 t_eval=np.linspace(0, 15, 151))
+    >>> s.shape
+    (151, 2, 4)
+    """
+    if wrt not in ("params", "y0", "both"):
+        raise ValueError(f"Expected wrt 'params', 'y0' or 'both', got {wrt!r} instead.")
+    y0 = np.asarray(y0, dtype=np.float64).ravel().tolist()
+    params = np.asarray(params, dtype=np.float64).ravel().tolist()
+    k = len(params) if wrt != "y0" else 0
+    dims = k + (len(y0) if wrt != "params" else 0)
+    seeds = np.eye(dims)
+    zeros = np.zeros(dims)
+    seeded_params = [MultiDual(p, seeds[i] if wrt != "y0" else zeros) for i, p in enumerate(params)]
+    seeded_y0 = [MultiDual(v, seeds[k + i] if wrt != "params" else zeros) for i, v in enumerate(y0)]
+
+    times, values, sensitivities = [], [], []
+    for t, y in integrate(rhs, seeded_y0, t_span, args=tuple(seeded_params), t_eval=t_eval, **options):
+        times.append(t)
+        values.append([float(v.real) if isinstance(v, MultiDual) else float(v) for v in y])
+        sensitivities.append([v.dual if isinstance(v, MultiDual) else zeros for v in y])
+    return np.array(times), np.array(values), np.array(sensitivities).reshape(len(times), len(y0), dims)
@@ -0,0 +1,283 @@
+import math
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .Dual import Dual
+
+
+def _attach(name, shape):
+    """
+    Attaches to a shared-memory block and returns it with a float64 array view of it.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+
+
+def _derivative_task(func, dual_class, layout, start, stop):
+    """
+    Evaluates ``func`` and its derivative at the points ``start:stop`` of a shared batch.
+
+    ``layout`` holds the shared-memory names of the points, values and
+    derivatives and the batch size; the results are written in place.
+    """
+    points_name, values_name, derivatives_name, n = layout
+    names = (points_name, values_name, derivatives_name)
+    blocks, (xs, values, derivatives) = zip(*(_attach(name, (n,)) for name in names))
+    try:
+        for i, x in enumerate(xs[start:stop].tolist(), start):
+            y = func(dual_class(x, 1))
+            if isinstance(y, (float, int)):
+                values[i], derivatives[i] = y, 0.0
+            else:
+                values[i], derivatives[i] = y.real, y.dual
+        del xs, values, derivatives
+    finally:
+        for block in blocks:
+            block.close()
+    return stop - start
+
+
+def _column(func, dual_class, xs, j):
+    """
+    Returns the values of a vector function and its derivatives with respect to input ``j``.
+    """
+    inputs = [dual_class(x, 1.0 if i == j else 0.0) for i, x in enumerate(xs)]
+    outputs = func(inputs)
+    values = [float(y) if isinstance(y, (float, int)) else y.real for y in outputs]
+    column = [0.0 if isinstance(y, (float, int)) else y.dual for y in outputs]
+    return values, column
+
+
+def _jacobian_task(func, dual_class, layout, start, stop):
+    """
+    Computes the Jacobian columns ``start:stop`` and writes them to the shared transposed Jacobian.
+    """
+    points_name, columns_name, n, m = layout
+    points, xs = _attach(points_name, (n,))
+    columns_block, columns = _attach(columns_name, (n, m))
+    try:
+        xs = xs.tolist()
+        for j in range(start, stop):
+            columns[j] = _column(func, dual_class, xs, j)[1]
+        del columns
+    finally:
+        points.close()
+        columns_block.close()
+    return stop - start
+
+
+class ParallelExecutor:
+    """
+    A pool of worker processes evaluating derivatives of expensive functions in parallel.
+
+    Batches of points (`derivative`) or the columns of a Jacobian
+    (`jacobian`) are split into chunks handed to the workers. Points and
+    results are exchanged through `multiprocessing.shared_memory` buffers,
+    so only the function, the dual class and a few names and offsets are
+    pickled per chunk. Each point is evaluated exactly as by the serial
+    `compute_derivative`, and the results are bitwise identical to it.
+
+    Workers are started on first use and reused across calls until `close`
+    (or the end of a ``with`` block). The function must be picklable, i.e.
+    defined at module level rather than a lambda.
+
+    Attributes
+    ----------
+    processes : int
+        The number of worker processes.
+
+    chunks_per_worker : int
+        The load-balancing granularity. With 1 every worker gets one
+        contiguous share of the work (static scheduling, least overhead);
+        larger values hand out smaller chunks to whichever worker is free
+        (dynamic scheduling), which balances work whose cost varies across
+        points.
+
+    dual_class : Dual or Dual_c
+        The class to use for dual numbers.
+
+    Examples
+    --------
+    >>> with ParallelExecutor(processes=4) as executor:  # doctest: +SKIP
+    ...     derivatives = executor.derivative(expensive_model, np.linspace(0, 1, 10_000))
+    ...     jacobian = executor.jacobian(expensive_vector_model, x0)
+    """
+
+    def __init__(self, processes=None, chunks_per_worker=4, dual_class=Dual, start_method=None):
+        """
+        Constructs all the necessary attributes for the ParallelExecutor object.
+
+        Parameters
+        ----------
+        processes : int, optional
+            The number of worker processes, by default the number of CPUs.
+
+        chunks_per_worker : int, optional
+            The number of chunks per worker each call is split into.
+
+        dual_class : Dual or Dual_c, optional
+            The class to use for dual numbers.
+
+        start_method : str, optional
+            The `multiprocessing` start method ("fork", "spawn" or
+            "forkserver"); the platform default if not given.
+
+        Raises
+        ------
+        ValueError
+            If 'processes' or 'chunks_per_worker' is not positive.
+        """
+        processes = processes or os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError(f"Expected a positive number of processes, got {processes} instead.")
+        if chunks_per_worker < 1:
+            raise ValueError(f"Expected a positive number of chunks per worker, got {chunks_per_worker} instead.")
+        self.processes = processes
+        self.chunks_per_worker = chunks_per_worker
+        self.dual_class = dual_class
+        self._context = multiprocessing.get_context(start_method)
+        self._pool = None
+
+    def __enter__(self):
+        """
+        Returns the executor; its workers are closed on exit.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Shuts the worker processes down.
+        """
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Shuts the worker processes down; they are restarted by the next call.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _run(self, task, func, layout, first, n, chunk_size):
+        """
+        Runs ``task`` over ``range(first, n)`` in chunks on the workers.
+        """
+        if self._pool is None:
+            self._pool = self._context.Pool(self.processes)
+        if chunk_size is None:
+            chunk_size = math.ceil((n - first) / (self.processes * self.chunks_per_worker))
+        chunk_size = max(1, chunk_size)
+        tasks = [(func, self.dual_class, layout, start, min(start + chunk_size, n))
+                 for start in range(first, n, chunk_size)]
+        # Chunks are claimed by free workers one at a time, so faster workers take more
+        for _ in self._pool.imap_unordered(_star, [(task, args) for args in tasks], chunksize=1):
+            pass
+
+    def derivative(self, func, xs, return_values=False, chunk_size=None):
+        """
+        Computes the derivative of a scalar function at a batch of points in parallel.
+
+        Parameters
+        ----------
+        func : function
+            A picklable function of one dual number.
+
+        xs : array_like
+            The points at which to compute the derivative.
+
+        return_values : bool, optional
+            If True, also return the function values.
+
+        chunk_size : int, optional
+            The number of points per chunk, overriding ``chunks_per_worker``.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            The function values, with the shape of ``xs``. Only returned if
+            ``return_values`` is True.
+
+        derivatives : numpy.ndarray
+            The derivatives, with the shape of ``xs``.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        n = xs.size
+        blocks = [shared_memory.SharedMemory(create=True, size=max(n, 1) * 8) for _ in range(3)]
+        try:
+            arrays = [np.ndarray((n,), dtype=np.float64, buffer=block.buf) for block in blocks]
+            arrays[0][:] = xs.ravel()
+            layout = (blocks[0].name, blocks[1].name, blocks[2].name, n)
+            self._run(_derivative_task, func, layout, 0, n, chunk_size)
+            values, derivatives = (array.reshape(xs.shape).copy() for array in arrays[1:])
+            del arrays
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return (values, derivatives) if return_values else derivatives
+
+    def jacobian(self, func, xs, return_values=False, chunk_size=None):
+        """
+        Computes the Jacobian of a vector function column by column in parallel.
+
+        Column j is one forward pass with input j seeded, so the work is
+        split over the ``len(xs)`` columns. The first column is computed
+        while the workers start, which also gives the number of outputs.
+
+        Parameters
+        ----------
+        func : function
+            A picklable function called with a list of ``len(xs)`` dual
+            numbers and returning a sequence of them.
+
+        xs : array_like
+            The point at which to compute the Jacobian.
+
+        return_values : bool, optional
+            If True, also return the function values.
+
+        chunk_size : int, optional
+            The number of columns per chunk, overriding ``chunks_per_worker``.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            The function values, shape (m,). Only returned if ``return_values`` is True.
+
+        jacobian : numpy.ndarray
+            The Jacobian, shape (m, n), where ``jacobian[i, j]`` is the
+            derivative of output i with respect to input j.
+        """
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        n = xs.size
+        values, first = _column(func, self.dual_class, xs.tolist(), 0)
+        m = len(values)
+        points = shared_memory.SharedMemory(create=True, size=max(n, 1) * 8)
+        columns_block = shared_memory.SharedMemory(create=True, size=max(n * m, 1) * 8)
+        try:
+            np.ndarray((n,), dtype=np.float64, buffer=points.buf)[:] = xs
+            columns = np.ndarray((n, m), dtype=np.float64, buffer=columns_block.buf)
+            columns[0] = first
+            if n > 1:
+                layout = (points.name, columns_block.name, n, m)
+                self._run(_jacobian_task, func, layout, 1, n, chunk_size)
+            jacobian = columns.T.copy()
+            del columns
+        finally:
+            for block in (points, columns_block):
+                block.close()
+                block.unlink()
+        return (np.array(values), jacobian) if return_values else jacobian
+
+
+def _star(item):
+    """
+    Calls ``task(*args)`` for an item of ``imap_unordered``.
+    """
+    task, args = item
+    return task(*args)
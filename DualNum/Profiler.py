@@ -0,0 +1,193 @@
+import importlib
+import sys
+from time import perf_counter_ns
+
+from .Dual import Dual
+
+try:
+    # The module, not the class re-exported under the same name by DualNum_c
+    _dual_c_module = importlib.import_module("DualNum_c.Dual_c")
+except ImportError:
+    _dual_c_module = None
+
+
+# The primitives instrumented on every dual-number class that defines them.
+PRIMITIVES = (
+    "__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__",
+    "__truediv__", "__rtruediv__", "__pow__", "__rpow__",
+    "sin", "cos", "tan", "exp", "log", "sqrt",
+    "sinh", "cosh", "tanh", "asin", "acos", "atan",
+)
+
+
+class Profiler:
+    """
+    A context manager recording how `Dual` and `Dual_c` primitives are used.
+
+    While active, every call of an operator or elementary function (see
+    `PRIMITIVES`) records its call count, the dual numbers it constructed
+    and its cumulative wall time. Only outermost calls are recorded: a
+    primitive implemented with another (``__radd__`` calling ``__add__``)
+    counts once, and its time and allocations include the inner call.
+
+    `Dual` is instrumented by swapping wrapped methods and constructors
+    onto the class and its module on entry and restoring the originals on
+    exit, so it runs its usual code
+    when no profiler is active. `Dual_c` checks a C flag in each primitive.
+
+    Only one profiler can be active at a time, and it is not thread-safe.
+
+    Attributes
+    ----------
+    stats : dict
+        Maps ``"Class.primitive"`` to ``[calls, constructed, nanoseconds]``.
+
+    Examples
+    --------
+    >>> with Profiler() as profiler:
+    ...     compute_derivative(lambda x: x.sin() * x.exp() + x, 1.0, Dual)
+    >>> profiler.to_dict()["Dual.sin"]["calls"]
+    1
+    >>> print(profiler.report())  # doctest: +SKIP
+    """
+
+    _active = None
+
+    def __init__(self):
+        """
+        Constructs all the necessary attributes for the Profiler object.
+        """
+        self.stats = {}
+        self._patched = []
+        self._busy = False
+        self._constructed = 0
+
+    def __enter__(self):
+        """
+        Starts recording.
+
+        Raises
+        ------
+        RuntimeError
+            If another profiler is already active.
+        """
+        if Profiler._active is not None:
+            raise RuntimeError("a Profiler is already active")
+        Profiler._active = self
+        self._patch(Dual, "Dual")
+        if _dual_c_module is not None:
+            _dual_c_module._set_profiler(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Stops recording and restores the uninstrumented classes.
+        """
+        if _dual_c_module is not None:
+            _dual_c_module._set_profiler(None)
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched = []
+        Profiler._active = None
+        return False
+
+    def _patch(self, cls, label):
+        """
+        Replaces the primitives and the constructors of a Python class with recording wrappers.
+        """
+        for name in PRIMITIVES:
+            if name in cls.__dict__:
+                self._replace(cls, name, self._wrap(f"{label}.{name}", cls.__dict__[name]))
+        self._replace(cls, "__init__", self._counting(cls.__dict__["__init__"]))
+        # Results built by the module's validation-free constructor skip __init__
+        module = sys.modules[cls.__module__]
+        if hasattr(module, "_new"):
+            self._replace(module, "_new", self._counting(module._new))
+
+    def _replace(self, owner, name, function):
+        """
+        Sets an attribute of a class or module, remembering the original for `__exit__`.
+        """
+        self._patched.append((owner, name, vars(owner)[name]))
+        setattr(owner, name, function)
+
+    def _counting(self, constructor):
+        """
+        Returns a wrapper counting the objects built by ``constructor``.
+        """
+        def wrapper(*args, **kwargs):
+            self._constructed += 1
+            return constructor(*args, **kwargs)
+
+        return wrapper
+
+    def _wrap(self, key, method):
+        """
+        Returns a wrapper recording the outermost calls of ``method``.
+        """
+        def wrapper(*args):
+            if self._busy:
+                return method(*args)
+            self._busy = True
+            self._constructed = 0
+            start = perf_counter_ns()
+            try:
+                return method(*args)
+            finally:
+                elapsed = perf_counter_ns() - start
+                self._busy = False
+                self._add(key, elapsed, self._constructed)
+
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def _record(self, label, name, elapsed, constructed):
+        """
+        Records one call reported by the compiled extension.
+        """
+        self._add(f"{label}.{name}", elapsed, constructed)
+
+    def _add(self, key, elapsed, constructed):
+        """
+        Adds one call to the statistics of a primitive.
+        """
+        entry = self.stats.get(key)
+        if entry is None:
+            self.stats[key] = [1, constructed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += constructed
+            entry[2] += elapsed
+
+    def reset(self):
+        """
+        Clears the recorded statistics.
+        """
+        self.stats = {}
+
+    def to_dict(self):
+        """
+        Returns the statistics sorted by decreasing total time.
+
+        Returns
+        -------
+        dict
+            Maps ``"Class.primitive"`` to a dict with ``calls``,
+            ``constructed`` and ``time`` (seconds).
+        """
+        rows = sorted(self.stats.items(), key=lambda item: item[1][2], reverse=True)
+        return {key: {"calls": calls, "constructed": constructed, "time": ns * 1e-9}
+                for key, (calls, constructed, ns) in rows}
+
+    def report(self):
+        """
+        Returns a table of the statistics sorted by decreasing total time.
+        """
+        rows = self.to_dict()
+        total = sum(row["time"] for row in rows.values()) or 1.0
+        lines = [f"{'primitive':<20}{'calls':>10}{'objects':>10}{'time [ms]':>12}{'per call [ns]':>15}{'share':>8}"]
+        for key, row in rows.items():
+            lines.append(f"{key:<20}{row['calls']:>10}{row['constructed']:>10}{row['time'] * 1e3:>12.3f}"
+                         f"{row['time'] * 1e9 / row['calls']:>15.1f}{row['time'] / total:>8.1%}")
+        return "\n".join(lines)
@@ -0,0 +1,198 @@
+import numpy as np
+
+from .DualArray import DualArray, _read_only
+from .HyperDual import HyperDualArray
+
+
+class RootResults:
+    """
+    A class to represent the per-element outcome of `find_roots`.
+
+    Attributes
+    ----------
+    roots : numpy.ndarray
+        The last iterate of every element, the root where ``converged``.
+
+    values : numpy.ndarray
+        The function value at the last evaluated iterate.
+
+    iterations : numpy.ndarray
+        The number of function evaluations of every element, dtype int64.
+
+    converged : numpy.ndarray
+        Whether every element met the tolerance, dtype bool.
+    """
+
+    def __init__(self, roots, values, iterations, converged):
+        """
+        Constructs all the necessary attributes for the RootResults object.
+        """
+        self.roots = roots
+        self.values = values
+        self.iterations = iterations
+        self.converged = converged
+
+    def __repr__(self):
+        """
+        Returns a string representation of the results.
+        """
+        return (f'RootResults(size={self.roots.size}, converged={int(self.converged.sum())}, '
+                f'max_iterations={int(self.iterations.max(initial=0))})')
+
+
+def _derivatives(func, x, args, method):
+    """
+    Returns [f(x), f'(x)] and, for Halley's method, f''(x) over a 1-D array of points.
+    """
+    if method == "newton":
+        y = func(DualArray._from_parts(_read_only(x), np.ones_like(x)), *args)
+        parts = ("real", "dual")
+    else:
+        y = func(HyperDualArray(x, 1.0, 1.0), *args)
+        parts = ("real", "eps1", "eps12")
+    if isinstance(y, (float, int, np.number)):
+        return [np.full_like(x, float(y))] + [np.zeros_like(x)] * (len(parts) - 1)
+    return [np.broadcast_to(getattr(y, part), x.shape) for part in parts]
+
+
+def _values(func, x, args):
+    """
+    Returns f(x) over a 1-D array of points.
+    """
+    y = func(DualArray._from_parts(_read_only(x), np.zeros_like(x)), *args)
+    return np.broadcast_to(y.real if not isinstance(y, (float, int, np.number)) else float(y), x.shape)
+
+
+def find_roots(func, x0, args=(), bracket=None, method="newton", xtol=1e-12, rtol=4 * np.finfo(float).eps,
+               ftol=0.0, maxiter=50):
+    """
+    Solves many independent scalar equations f(x) = 0 at once.
+
+    Every element of ``x0`` starts its own Newton (or Halley) iteration and
+    all of them are advanced together: ``func`` is called once per
+    iteration on a `DualArray` (a `HyperDualArray` for Halley) holding
+    only the elements that have not converged yet, so finished elements
+    stop costing work. Derivatives are exact, from the dual parts.
+
+    With a ``bracket`` the iteration is safeguarded: each element keeps an
+    interval on which f changes sign, shrunk at every step, and whenever
+    the Newton step would leave it (or f' vanishes) a bisection step is
+    taken instead, so bracketed elements always converge.
+
+    Parameters
+    ----------
+    func : function
+        The function, written with dual-number operations and called as
+        ``func(x, *args)``. It must be vectorizable (see
+        `compute_derivative_batch`).
+
+    x0 : array_like
+        The starting points, one per equation.
+
+    args : tuple, optional
+        Extra arguments of ``func``. Arrays with the shape of ``x0`` are
+        per-element parameters and are sliced to the active elements;
+        anything else is passed unchanged.
+
+    bracket : tuple of array_like, optional
+        ``(lo, hi)`` bounds broadcasting against ``x0``. Elements whose
+        bounds do not change the sign of f run unsafeguarded.
+
+    method : {"newton", "halley"}, optional
+        Newton's method uses f and f'; Halley's cubically convergent
+        method also uses f'', computed with hyper-dual numbers.
+
+    xtol, rtol : float, optional
+        An element converges when its step is at most ``xtol + rtol * |x|``.
+
+    ftol : float, optional
+        An element also converges when ``|f(x)| <= ftol``.
+
+    maxiter : int, optional
+        The maximum number of iterations.
+
+    Returns
+    -------
+    RootResults
+        The roots, function values, iteration counts and convergence flags,
+        each with the shape of ``x0``.
+
+    Raises
+    ------
+    ValueError
+        If 'method' is unknown.
+
+    Examples
+    --------
+    >>> def kepler(E, M, e):
+    ...     return E - e * E.sin() - M
+    >>> M = np.linspace(0, 2 * np.pi, 1_000_000)
+    >>> result = find_roots(kepler, M, args=(M, 0.3), bracket=(M - 1, M + 1))
+    >>> bool(result.converged.all())
+    True
+    """
+    if method not in ("newton", "halley"):
+        raise ValueError(f"Expected method 'newton' or 'halley', got {method!r} instead.")
+    x0 = np.asarray(x0, dtype=np.float64)
+    shape = x0.shape
+    x = x0.ravel().copy()
+    n = x.size
+    per_element = [isinstance(a, np.ndarray) and a.shape == shape for a in args]
+    args = [a.ravel() if flag else a for a, flag in zip(args, per_element)]
+
+    values = np.full(n, np.nan)
+    iterations = np.zeros(n, dtype=np.int64)
+    converged = np.zeros(n, dtype=bool)
+    active = np.arange(n)
+
+    def lane_args(idx):
+        return [a[idx] if flag else a for a, flag in zip(args, per_element)]
+
+    if bracket is not None:
+        lo, hi = (np.broadcast_to(np.asarray(b, dtype=np.float64), shape).ravel().copy() for b in bracket)
+        lo, hi = np.minimum(lo, hi), np.maximum(lo, hi)
+        f_lo = np.asarray(_values(func, lo, lane_args(active)))
+        f_hi = np.asarray(_values(func, hi, lane_args(active)))
+        bracketed = np.sign(f_lo) * np.sign(f_hi) <= 0
+        sign_lo = np.sign(f_lo)
+        # Start inside the bracket
+        outside = bracketed & ~((lo <= x) & (x <= hi))
+        x[outside] = 0.5 * (lo[outside] + hi[outside])
+
+    for _ in range(maxiter):
+        if active.size == 0:
+            break
+        xa = x[active]
+        f, df, *d2f = _derivatives(func, xa, lane_args(active), method)
+        iterations[active] += 1
+        values[active] = f
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if method == "newton":
+                step = f / df
+            else:
+                step = 2 * f * df / (2 * df * df - f * d2f[0])
+        tol = xtol + rtol * np.abs(xa)
+        hit = np.abs(f) <= ftol
+        done = hit | (np.abs(step) <= tol)
+        new = np.where(hit, xa, xa - step)
+
+        if bracket is not None:
+            b = bracketed[active]
+            la, ha = lo[active], hi[active]
+            # Shrink the bracket to the side of xa where f keeps changing sign
+            same = np.sign(f) == sign_lo[active]
+            la = np.where(b & same, xa, la)
+            ha = np.where(b & ~same, xa, ha)
+            lo[active], hi[active] = la, ha
+            bisect = b & ~done & ~((la <= new) & (new <= ha))
+            new = np.where(bisect, 0.5 * (la + ha), new)
+            done |= bisect & (ha - la <= 2 * tol)
+
+        finite = np.isfinite(new)
+        x[active] = np.where(finite, new, xa)
+        converged[active[done]] = True
+        # Elements whose step blew up (f' = 0 without a bracket) stop unconverged
+        active = active[~done & finite]
+
+    return RootResults(x.reshape(shape), values.reshape(shape), iterations.reshape(shape), converged.reshape(shape))
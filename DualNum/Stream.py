@@ -0,0 +1,275 @@
+import json
+import mmap
+import os
+import tracemalloc
+
+import numpy as np
+
+from .DualArray import compute_derivative_batch
+
+# Points evaluated under tracemalloc to measure the memory cost of one point.
+_PROBE_POINTS = 4096
+
+
+def _open_points(xs):
+    """
+    Returns the input points as a float64 array, memory-mapping ``.npy`` paths.
+    """
+    if isinstance(xs, (str, os.PathLike)):
+        xs = np.load(xs, mmap_mode="r")
+    elif not isinstance(xs, np.ndarray):
+        xs = np.asarray(xs)
+    if xs.dtype != np.float64:
+        raise TypeError(f"Expected float64 input points, got dtype {xs.dtype} instead.")
+    if not (xs.flags.c_contiguous or xs.flags.f_contiguous):
+        raise ValueError("Streamed input points must be contiguous; a strided view would be copied whole.")
+    return xs
+
+
+def _flat(array):
+    """
+    Returns a 1-D view of a contiguous array in memory order.
+    """
+    return array.ravel(order="K")
+
+
+def _drop_pages(array, start, stop):
+    """
+    Asks the kernel to drop the pages holding ``array.flat[start:stop]`` of a
+    memory map opened by this module, so finished chunks do not accumulate in
+    the resident set. Pages are flushed first; this is a no-op elsewhere.
+    """
+    mm = getattr(array, "_mmap", None)
+    if mm is None or not hasattr(mm, "madvise") or not hasattr(mmap, "MADV_DONTNEED"):
+        return
+    if array.mode == "c":
+        # Dropping copy-on-write pages would discard their private changes
+        return
+    # np.memmap maps from the allocation boundary below its offset
+    base = array.offset % mmap.ALLOCATIONGRANULARITY
+    first = base + start * array.itemsize
+    last = base + stop * array.itemsize
+    first -= first % mmap.PAGESIZE
+    last -= last % mmap.PAGESIZE
+    if last > first:
+        mm.madvise(mmap.MADV_DONTNEED, first, last - first)
+
+
+def _evaluate(func, xs):
+    """
+    Returns the values and derivatives of ``func`` at a 1-D array of points.
+    """
+    return compute_derivative_batch(func, np.array(xs), return_values=True)
+
+
+def _probe(func, xs):
+    """
+    Evaluates ``func`` at a few points under tracemalloc.
+
+    Returns
+    -------
+    values, derivatives : numpy.ndarray
+        The results at ``xs``.
+
+    bytes_per_point : float
+        The peak traced memory of the evaluation divided by the number of points.
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    try:
+        current = tracemalloc.get_traced_memory()[0]
+        values, derivatives = _evaluate(func, xs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return values, derivatives, max(peak - current, 1) / len(xs)
+
+
+def iter_derivative_chunks(func, xs, memory_budget=256 * 2 ** 20, chunk_size=None, start=0):
+    """
+    Evaluates a function and its derivative chunk by chunk.
+
+    The points are read in memory order in chunks sized so that evaluating
+    one chunk stays within ``memory_budget``: a first chunk of a few
+    thousand points is evaluated under ``tracemalloc`` to measure the memory
+    used per point, including every temporary the function creates, and
+    the chunk size is set from it.
+
+    Parameters
+    ----------
+    func : function
+        The function to differentiate, applied as in `compute_derivative_batch`.
+
+    xs : str, os.PathLike or numpy.ndarray
+        A ``.npy`` path (memory-mapped read-only) or a contiguous float64
+        array or ``np.memmap`` of points.
+
+    memory_budget : int, optional
+        The memory in bytes one chunk may use, 256 MiB by default.
+
+    chunk_size : int, optional
+        A fixed number of points per chunk, overriding the budget.
+
+    start : int, optional
+        The flat index of the first point to evaluate, to resume a stream.
+
+    Yields
+    ------
+    values, derivatives : numpy.ndarray
+        1-D arrays for the next ``len(values)`` points.
+
+    Examples
+    --------
+    >>> for values, derivatives in iter_derivative_chunks(lambda x: x.sin(), "grid.npy"):  # doctest: +SKIP
+    ...     histogram.update(derivatives)
+    """
+    flat = _flat(_open_points(xs))
+    n = flat.size
+    if chunk_size is None and start < n:
+        probe = slice(start, min(start + _PROBE_POINTS, n))
+        values, derivatives, bytes_per_point = _probe(func, flat[probe])
+        chunk_size = max(1, int(memory_budget // bytes_per_point))
+        yield values, derivatives
+        _drop_pages(flat, probe.start, probe.stop)
+        start = probe.stop
+    elif chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"Expected a positive chunk size, got {chunk_size} instead.")
+
+    for i in range(start, n, chunk_size or 1):
+        stop = min(i + chunk_size, n)
+        yield _evaluate(func, flat[i:stop])
+        _drop_pages(flat, i, stop)
+
+
+def _open_output(out, shape, fortran_order, resume):
+    """
+    Returns an output array: ``.npy`` paths are opened (or created) as memory maps.
+    """
+    if not isinstance(out, (str, os.PathLike)):
+        if out.shape != shape or out.dtype != np.float64:
+            raise ValueError(f"Expected a float64 output of shape {shape}, got {out.dtype} {out.shape} instead.")
+        return out
+    if resume and os.path.exists(out):
+        array = np.load(out, mmap_mode="r+")
+        if array.shape == shape and array.dtype == np.float64:
+            return array
+    return np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=shape, fortran_order=fortran_order)
+
+
+def _checkpoint_path(derivatives_out):
+    """
+    Returns the default progress file of a stream writing ``derivatives_out``.
+    """
+    if isinstance(derivatives_out, (str, os.PathLike)):
+        return os.fspath(derivatives_out) + ".progress.json"
+    filename = getattr(derivatives_out, "filename", None)
+    return filename + ".progress.json" if filename else None
+
+
+def _read_checkpoint(path, total):
+    """
+    Returns the number of points already written according to a progress file.
+    """
+    if path is None or not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        state = json.load(f)
+    return state["done"] if state.get("total") == total else 0
+
+
+def _write_checkpoint(path, done, total):
+    """
+    Atomically records that the first ``done`` points have been written.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"done": done, "total": total}, f)
+    os.replace(tmp, path)
+
+
+def compute_derivative_stream(func, xs, values_out, derivatives_out, memory_budget=256 * 2 ** 20,
+                              chunk_size=None, checkpoint=None, resume=True, progress=None):
+    """
+    Computes values and derivatives of a function over a dataset larger than memory.
+
+    Points are read from a memory-mapped input chunk by chunk (see
+    `iter_derivative_chunks`) and the results written straight into
+    memory-mapped outputs, so the memory used stays bounded by
+    ``memory_budget`` whatever the size of the input. Each flushed chunk is
+    recorded in a progress file; after an interruption, calling the
+    function again with the same arguments resumes after the last chunk
+    that was written.
+
+    Parameters
+    ----------
+    func : function
+        The function to differentiate, applied as in `compute_derivative_batch`.
+
+    xs : str, os.PathLike or numpy.ndarray
+        A ``.npy`` path or a contiguous float64 array or ``np.memmap`` of points.
+
+    values_out, derivatives_out : str, os.PathLike, numpy.ndarray or None
+        Where to write the values and derivatives: ``.npy`` paths (created
+        as memory maps with the shape of ``xs``) or float64 arrays/memmaps of
+        that shape. ``values_out`` may be None to skip the values.
+
+    memory_budget : int, optional
+        The memory in bytes one chunk may use, 256 MiB by default.
+
+    chunk_size : int, optional
+        A fixed number of points per chunk, overriding the budget.
+
+    checkpoint : str, optional
+        The progress file. Defaults to ``<derivatives_out>.progress.json``
+        when ``derivatives_out`` is a path or a file-backed memmap; without
+        one the stream cannot resume.
+
+    resume : bool, optional
+        If False, ignore existing progress and start over.
+
+    progress : callable, optional
+        Called as ``progress(done, total)`` after each chunk.
+
+    Returns
+    -------
+    values, derivatives : numpy.ndarray
+        The output arrays (memmaps for path outputs); ``values`` is None if
+        ``values_out`` is None.
+
+    Examples
+    --------
+    >>> compute_derivative_stream(lambda x: x.sin() * x.exp(), "grid.npy",
+    ...                           "values.npy", "derivatives.npy",
+    ...                           memory_budget=64 * 2 ** 20)  # doctest: +SKIP
+    """
+    xs = _open_points(xs)
+    fortran_order = xs.flags.f_contiguous and not xs.flags.c_contiguous
+    checkpoint = checkpoint if checkpoint is not None else _checkpoint_path(derivatives_out)
+    total = xs.size
+    done = _read_checkpoint(checkpoint, total) if resume else 0
+
+    outputs = [None if values_out is None else _open_output(values_out, xs.shape, fortran_order, done > 0),
+               _open_output(derivatives_out, xs.shape, fortran_order, done > 0)]
+    flats = [None if out is None else _flat(out) for out in outputs]
+
+    for chunk in iter_derivative_chunks(func, xs, memory_budget=memory_budget, chunk_size=chunk_size, start=done):
+        stop = done + len(chunk[1])
+        for flat, result in zip(flats, chunk):
+            if flat is not None:
+                flat[done:stop] = result
+                if isinstance(flat, np.memmap):
+                    flat.flush()
+                    _drop_pages(flat, done, stop)
+        done = stop
+        if checkpoint is not None:
+            _write_checkpoint(checkpoint, done, total)
+        if progress is not None:
+            progress(done, total)
+
+    if checkpoint is not None and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    return outputs[0], outputs[1]
@@ -0,0 +1,688 @@
+import hashlib
+
+import numpy as np
+
+from .DualArray import DualArray
+
+
+# Opcode table: the opcode of an operation is its index in OPCODES.
+#
+# ``sincos`` and ``sincos_cos`` are only produced by `Tape.optimize`: a
+# ``sincos`` node holds sin(u) and also computes cos(u) for the
+# ``sincos_cos`` node that immediately follows it and refers to it.
+OPCODES = (
+    "input", "const",
+    "add", "sub", "mul", "truediv", "pow",
+    "sin", "cos", "tan", "exp", "log", "sqrt",
+    "sinh", "cosh", "tanh", "asin", "acos", "atan",
+    "sincos", "sincos_cos",
+)
+OPCODE = {name: code for code, name in enumerate(OPCODES)}
+BINARY_OPS = ("add", "sub", "mul", "truediv", "pow")
+UNARY_OPS = ("sin", "cos", "tan", "exp", "log", "sqrt", "sinh", "cosh", "tanh", "asin", "acos", "atan")
+COMMUTATIVE_OPS = ("add", "mul")
+
+# Vectorized kernel of every operation, applied to DualArray operands on replay.
+_KERNELS = {name: getattr(DualArray, f"__{name}__") for name in BINARY_OPS}
+_KERNELS.update({name: getattr(DualArray, name) for name in UNARY_OPS})
+
+
+def _sincos(x):
+    """
+    Returns (sin(x), cos(x)) of a DualArray, evaluating each transcendental once.
+    """
+    s = np.sin(x.real)
+    c = np.cos(x.real)
+    return DualArray._from_parts(s, x.dual * c), DualArray._from_parts(c, -x.dual * s)
+
+
+class TracingError(RuntimeError):
+    """
+    Raised when a traced function depends on the value of a traced input.
+
+    A tape records one path through the function; branching on ``.real``,
+    comparing traced values or converting them to Python numbers would make
+    the tape silently wrong for inputs that take another path.
+    """
+
+
+class _Recorder:
+    """
+    Collects the nodes of a tape while a function is being traced.
+    """
+
+    def __init__(self):
+        self.opcodes = []
+        self.args = []
+        self.constants = []
+
+    def node(self, name, a=-1, b=-1):
+        """
+        Appends a node and returns its index.
+        """
+        self.opcodes.append(OPCODE[name])
+        self.args.append((a, b))
+        return len(self.opcodes) - 1
+
+    def constant(self, value):
+        """
+        Appends a constant node and returns its index.
+        """
+        self.constants.append(float(value))
+        return self.node("const", len(self.constants) - 1)
+
+
+class Tracer:
+    """
+    A placeholder for a dual number that records the operations applied to it.
+
+    A `Tracer` supports the same operators and methods as `Dual`; each call
+    appends one node to the tape being recorded instead of computing a value.
+    Reading ``real`` or ``dual``, comparing or converting a tracer raises a
+    `TracingError`, because the recorded tape would not follow that branch.
+
+    Attributes
+    ----------
+    index : int
+        The index of the node holding this value on the tape.
+    """
+
+    __slots__ = ("_recorder", "index")
+
+    def __init__(self, recorder, index):
+        """
+        Constructs all the necessary attributes for the Tracer object.
+
+        Parameters
+        ----------
+        recorder : _Recorder
+            The recorder of the tape being built.
+
+        index : int
+            The index of the node holding this value.
+        """
+        self._recorder = recorder
+        self.index = index
+
+    def _operand(self, other):
+        """
+        Returns the node index of a tracer or constant operand, or ``None``.
+        """
+        if isinstance(other, Tracer):
+            if other._recorder is not self._recorder:
+                raise TracingError("cannot combine values from different traces")
+            return other.index
+        if isinstance(other, (float, int, np.number)):
+            return self._recorder.constant(other)
+        return None
+
+    def _binary(self, name, other, reflected=False):
+        """
+        Records a binary operation with ``other`` and returns its tracer.
+        """
+        b = self._operand(other)
+        if b is None:
+            return NotImplemented
+        a = self.index
+        if reflected:
+            a, b = b, a
+        return Tracer(self._recorder, self._recorder.node(name, a, b))
+
+    def _unary(self, name):
+        """
+        Records a unary operation and returns its tracer.
+        """
+        return Tracer(self._recorder, self._recorder.node(name, self.index))
+
+    def _data_dependent(self, *args, **kwargs):
+        """
+        Raises a TracingError: the value of a traced input is not known while tracing.
+        """
+        raise TracingError(
+            "the traced function depends on the value of a traced input (e.g. branching on "
+            "'.real', comparing or converting to float); the tape would only be valid for one branch"
+        )
+
+    real = property(_data_dependent)
+    dual = property(_data_dependent)
+    get_real = get_dual = _data_dependent
+    __bool__ = __float__ = __int__ = __index__ = _data_dependent
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _data_dependent
+    __hash__ = object.__hash__
+
+    def __add__(self, other):
+        """
+        Records an addition.
+        """
+        return self._binary("add", other)
+
+    def __radd__(self, other):
+        """
+        Records an addition with the operands swapped.
+        """
+        return self._binary("add", other, reflected=True)
+
+    def __sub__(self, other):
+        """
+        Records a subtraction.
+        """
+        return self._binary("sub", other)
+
+    def __rsub__(self, other):
+        """
+        Records a subtraction with the operands swapped.
+        """
+        return self._binary("sub", other, reflected=True)
+
+    def __mul__(self, other):
+        """
+        Records a multiplication.
+        """
+        return self._binary("mul", other)
+
+    def __rmul__(self, other):
+        """
+        Records a multiplication with the operands swapped.
+        """
+        return self._binary("mul", other, reflected=True)
+
+    def __truediv__(self, other):
+        """
+        Records a division.
+        """
+        return self._binary("truediv", other)
+
+    def __rtruediv__(self, other):
+        """
+        Records a division with the operands swapped.
+        """
+        return self._binary("truediv", other, reflected=True)
+
+    def __pow__(self, other):
+        """
+        Records a power.
+        """
+        return self._binary("pow", other)
+
+    def __rpow__(self, other):
+        """
+        Records a power with the operands swapped.
+        """
+        return self._binary("pow", other, reflected=True)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the tracer.
+        """
+        return f'Tracer(index={self.index})'
+
+    def sin(self):
+        """
+        Records the sine.
+        """
+        return self._unary("sin")
+
+    def cos(self):
+        """
+        Records the cosine.
+        """
+        return self._unary("cos")
+
+    def tan(self):
+        """
+        Records the tangent.
+        """
+        return self._unary("tan")
+
+    def exp(self):
+        """
+        Records the exponential.
+        """
+        return self._unary("exp")
+
+    def log(self):
+        """
+        Records the natural logarithm.
+        """
+        return self._unary("log")
+
+    def sqrt(self):
+        """
+        Records the square root.
+        """
+        return self._unary("sqrt")
+
+    def sinh(self):
+        """
+        Records the hyperbolic sine.
+        """
+        return self._unary("sinh")
+
+    def cosh(self):
+        """
+        Records the hyperbolic cosine.
+        """
+        return self._unary("cosh")
+
+    def tanh(self):
+        """
+        Records the hyperbolic tangent.
+        """
+        return self._unary("tanh")
+
+    def asin(self):
+        """
+        Records the arcsine.
+        """
+        return self._unary("asin")
+
+    def acos(self):
+        """
+        Records the arccosine.
+        """
+        return self._unary("acos")
+
+    def atan(self):
+        """
+        Records the arctangent.
+        """
+        return self._unary("atan")
+
+
+class Tape:
+    """
+    A class to represent a recorded sequence of dual-number operations.
+
+    A tape is a flat program in static single-assignment form: node ``i``
+    applies ``OPCODES[opcodes[i]]`` to the values of nodes ``args[i, 0]`` and
+    ``args[i, 1]`` (-1 when unused). ``input`` nodes read input ``args[i, 0]``
+    and ``const`` nodes read ``constants[args[i, 0]]``. Replaying the tape
+    evaluates every node once over a whole NumPy batch, so values and
+    derivatives at millions of points cost one vectorized kernel per node and
+    no per-element Python calls. Tapes are immutable and can be replayed any
+    number of times.
+
+    Attributes
+    ----------
+    opcodes : numpy.ndarray
+        The opcode of every node, dtype uint8.
+
+    args : numpy.ndarray
+        The operand node indices of every node, shape (n_nodes, 2), dtype int32.
+
+    constants : numpy.ndarray
+        The constants referenced by ``const`` nodes.
+
+    outputs : numpy.ndarray
+        The node indices of the outputs.
+
+    n_inputs : int
+        The number of inputs of the traced function.
+
+    Examples
+    --------
+    >>> tape = trace(lambda x: x.sin() * x + 1)
+    >>> len(tape)
+    5
+    >>> tape.evaluate([0.0, 1.0])[1]
+    array([0.        , 1.38177329])
+    """
+
+    def __init__(self, opcodes, args, constants, outputs, n_inputs, multi_input=False, multi_output=False):
+        """
+        Constructs all the necessary attributes for the Tape object.
+
+        Parameters
+        ----------
+        opcodes : array_like of int
+            The opcode of every node.
+
+        args : array_like of int
+            The operand node indices of every node, shape (n_nodes, 2).
+
+        constants : array_like of float
+            The constants referenced by ``const`` nodes.
+
+        outputs : array_like of int
+            The node indices of the outputs.
+
+        n_inputs : int
+            The number of inputs.
+
+        multi_input, multi_output : bool, optional
+            Whether the traced function took a list of inputs / returned a
+            sequence of outputs, which decides the shapes used by `evaluate`.
+        """
+        self.opcodes = np.asarray(opcodes, dtype=np.uint8)
+        self.args = np.asarray(args, dtype=np.int32).reshape(-1, 2)
+        self.constants = np.asarray(constants, dtype=np.float64)
+        self.outputs = np.asarray(outputs, dtype=np.int32).ravel()
+        self.n_inputs = n_inputs
+        self.multi_input = multi_input
+        self.multi_output = multi_output
+        for array in (self.opcodes, self.args, self.constants, self.outputs):
+            array.setflags(write=False)
+
+    def __len__(self):
+        """
+        Returns the number of nodes on the tape.
+        """
+        return len(self.opcodes)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the tape.
+        """
+        return f'Tape(n_nodes={len(self)}, n_inputs={self.n_inputs}, n_outputs={len(self.outputs)})'
+
+    def listing(self):
+        """
+        Returns a human-readable listing of the tape, one node per line.
+        """
+        lines = []
+        for i, (code, (a, b)) in enumerate(zip(self.opcodes.tolist(), self.args.tolist())):
+            name = OPCODES[code]
+            if name == "input":
+                operands = f"x{a}"
+            elif name == "const":
+                operands = repr(float(self.constants[a]))
+            else:
+                operands = ", ".join(f"%{k}" for k in (a, b) if k >= 0)
+            lines.append(f"%{i} = {name} {operands}")
+        lines.append("return " + ", ".join(f"%{k}" for k in self.outputs.tolist()))
+        return "\n".join(lines)
+
+    def evaluate(self, inputs, seeds=None):
+        """
+        Replays the tape over a batch of points.
+
+        Parameters
+        ----------
+        inputs : array_like
+            The input values. For a function of one input, an array of
+            points; for a function of a list of inputs, a sequence of
+            ``n_inputs`` arrays (or scalars) broadcasting together.
+
+        seeds : array_like, optional
+            The dual parts of the inputs, in the same layout as ``inputs``.
+            Defaults to 1 for a function of one input; required otherwise.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            The output values, shape (*batch,) or (n_outputs, *batch).
+
+        derivatives : numpy.ndarray
+            The output dual parts, in the same layout as ``values``.
+        """
+        inputs, seeds = self._check_inputs(inputs, seeds)
+        slots = self._replay(
+            [DualArray(x, s) for x, s in zip(inputs, seeds)],
+        )
+        outputs = [slots[k] for k in self.outputs.tolist()]
+        shape = np.broadcast_shapes(*(np.shape(x) for x in inputs), *(y.shape for y in outputs))
+        values = np.array([np.broadcast_to(y.real, shape) for y in outputs])
+        derivatives = np.array([np.broadcast_to(y.dual, shape) for y in outputs])
+        if not self.multi_output:
+            return values[0], derivatives[0]
+        return values, derivatives
+
+    def digest(self):
+        """
+        Returns a SHA-256 hex digest identifying the tape.
+
+        Two tapes with the same digest evaluate the same program, so the
+        digest can key caches of compiled kernels.
+        """
+        h = hashlib.sha256()
+        for array in (self.opcodes, self.args, self.constants, self.outputs):
+            h.update(array.tobytes())
+            h.update(b"|")
+        h.update(f"{self.n_inputs},{self.multi_input:d},{self.multi_output:d}".encode())
+        return h.hexdigest()
+
+    def _check_inputs(self, inputs, seeds):
+        """
+        Returns the inputs and seeds of `evaluate` as lists of length ``n_inputs``.
+        """
+        if not self.multi_input:
+            inputs = [inputs]
+            seeds = [1.0 if seeds is None else seeds]
+        elif seeds is None:
+            raise ValueError("seeds are required for a tape with a list of inputs")
+        if len(inputs) != self.n_inputs or len(seeds) != self.n_inputs:
+            raise ValueError(f"Expected {self.n_inputs} inputs and seeds, got {len(inputs)} and {len(seeds)} instead.")
+        return list(inputs), list(seeds)
+
+    def _replay(self, inputs):
+        """
+        Evaluates every node in order and returns the list of node values.
+        """
+        slots = [None] * len(self)
+        opcodes, args, constants = self.opcodes.tolist(), self.args.tolist(), self.constants.tolist()
+        cosines = {}
+        for i, (code, (a, b)) in enumerate(zip(opcodes, args)):
+            name = OPCODES[code]
+            if name == "input":
+                slots[i] = inputs[a]
+            elif name == "const":
+                slots[i] = DualArray._from_parts(np.float64(constants[a]), np.float64(0.0))
+            elif name == "sincos":
+                slots[i], cosines[i] = _sincos(slots[a])
+            elif name == "sincos_cos":
+                slots[i] = cosines.pop(a)
+            elif name == "pow" and opcodes[b] == OPCODE["const"]:
+                # A constant exponent takes the power rule, which accepts negative and zero bases
+                slots[i] = slots[a] ** constants[args[b][0]]
+            elif b >= 0:
+                slots[i] = _KERNELS[name](slots[a], slots[b])
+            else:
+                slots[i] = _KERNELS[name](slots[a])
+        return slots
+
+    def optimize(self, return_stats=False):
+        """
+        Returns an equivalent, smaller tape.
+
+        The optimisation runs four passes:
+
+        - constant folding: nodes whose operands are all constants (and whose
+          dual part is therefore zero) are evaluated once and replaced by a
+          constant;
+        - common-subexpression elimination: identical nodes, up to operand
+          order for ``add`` and ``mul``, are hash-consed into one;
+        - dead-code elimination: nodes that do not reach an output are dropped;
+        - sin/cos fusion: ``sin(u)`` and ``cos(u)`` of the same operand are
+          replaced by one ``sincos`` evaluation.
+
+        Parameters
+        ----------
+        return_stats : bool, optional
+            If True, also return a dict of node counts before and after the
+            optimisation and of what each pass removed.
+
+        Returns
+        -------
+        Tape
+            The optimised tape.
+
+        stats : dict
+            Only returned if ``return_stats`` is True. Keys are
+            ``nodes_before``, ``nodes_after``, ``folded``, ``merged``,
+            ``dead`` and ``sincos_fused``.
+
+        Examples
+        --------
+        >>> tape = trace(lambda x: x.sin() * x.sin() + x.cos())
+        >>> tape.optimize(return_stats=True)[1]["nodes_after"]
+        5
+        """
+        stats = {"nodes_before": len(self), "folded": 0, "merged": 0, "dead": 0, "sincos_fused": 0}
+        opcodes, args, constants, outputs = self._fold_and_merge(stats)
+        tape = self._compact(opcodes, args, constants, outputs, stats)
+        stats["nodes_after"] = len(tape)
+        return (tape, stats) if return_stats else tape
+
+    def _fold_and_merge(self, stats):
+        """
+        Forward pass doing constant folding and hash-consing.
+
+        Returns the new (opcodes, args, constants, outputs) as lists.
+        """
+        opcodes, args, constants = [], [], []
+        table = {}
+        values = {}
+        remap = [0] * len(self)
+
+        def emit(key, code, a=-1, b=-1):
+            if key in table:
+                stats["merged"] += 1
+                return table[key]
+            opcodes.append(code)
+            args.append((a, b))
+            table[key] = len(opcodes) - 1
+            return table[key]
+
+        def emit_constant(value):
+            key = ("const", float(value).hex())
+            if key not in table:
+                constants.append(float(value))
+                values[len(opcodes)] = float(value)
+                return emit(key, OPCODE["const"], len(constants) - 1)
+            return emit(key, OPCODE["const"])
+
+        for i, (code, (a, b)) in enumerate(zip(self.opcodes.tolist(), self.args.tolist())):
+            name = OPCODES[code]
+            if name == "input":
+                remap[i] = emit(("input", a), code, a)
+                continue
+            if name == "const":
+                remap[i] = emit_constant(self.constants[a])
+                continue
+            if name == "sincos_cos":
+                remap[i] = emit((name, remap[a]), code, remap[a])
+                continue
+            a = remap[a]
+            b = remap[b] if b >= 0 else -1
+            if name != "sincos" and a in values and (b < 0 or b in values):
+                folded = self._fold(name, values[a], values.get(b))
+                if folded is not None:
+                    stats["folded"] += 1
+                    remap[i] = emit_constant(folded)
+                    continue
+            if name in COMMUTATIVE_OPS and b < a:
+                a, b = b, a
+            remap[i] = emit((name, a, b), code, a, b)
+        return opcodes, args, constants, [remap[k] for k in self.outputs.tolist()]
+
+    @staticmethod
+    def _fold(name, a, b):
+        """
+        Evaluates an operation on constants, or returns None if it raises
+        (the error is then left to surface on replay).
+        """
+        x = DualArray._from_parts(np.float64(a), np.float64(0.0))
+        try:
+            with np.errstate(all="ignore"):
+                if b is None:
+                    return float(_KERNELS[name](x).real)
+                return float(_KERNELS[name](x, DualArray._from_parts(np.float64(b), np.float64(0.0))).real)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return None
+
+    def _compact(self, opcodes, args, constants, outputs, stats):
+        """
+        Backward liveness pass, sin/cos fusion and renumbering.
+        """
+        live = [False] * len(opcodes)
+        for k in outputs:
+            live[k] = True
+        for i in range(len(opcodes) - 1, -1, -1):
+            if live[i]:
+                for k in args[i]:
+                    if k >= 0 and OPCODES[opcodes[i]] not in ("input", "const"):
+                        live[k] = True
+        stats["dead"] = len(opcodes) - sum(live)
+
+        sin_of, cos_of = {}, {}
+        for i, code in enumerate(opcodes):
+            if live[i] and OPCODES[code] == "sin":
+                sin_of.setdefault(args[i][0], i)
+            elif live[i] and OPCODES[code] == "cos":
+                cos_of.setdefault(args[i][0], i)
+        pairs = {u: (sin_of[u], cos_of[u]) for u in sin_of.keys() & cos_of.keys()}
+        stats["sincos_fused"] = len(pairs)
+        fused = {}
+        for u, (i_sin, i_cos) in pairs.items():
+            fused[i_sin] = fused[i_cos] = u
+
+        new_opcodes, new_args, used_constants = [], [], []
+        remap = {}
+        for i, (code, (a, b)) in enumerate(zip(opcodes, args)):
+            if not live[i] or i in remap:
+                continue
+            name = OPCODES[code]
+            if i in fused:
+                i_sin, i_cos = pairs[fused[i]]
+                new_opcodes += [OPCODE["sincos"], OPCODE["sincos_cos"]]
+                new_args += [(remap[fused[i]], -1), (len(new_opcodes) - 2, -1)]
+                remap[i_sin], remap[i_cos] = len(new_opcodes) - 2, len(new_opcodes) - 1
+                continue
+            if name == "input":
+                new_args.append((a, -1))
+            elif name == "const":
+                used_constants.append(constants[a])
+                new_args.append((len(used_constants) - 1, -1))
+            else:
+                new_args.append((remap[a], remap[b] if b >= 0 else -1))
+            new_opcodes.append(code)
+            remap[i] = len(new_opcodes) - 1
+        return Tape(new_opcodes, new_args, used_constants, [remap[k] for k in outputs], self.n_inputs,
+                    multi_input=self.multi_input, multi_output=self.multi_output)
+
+
+def trace(func, n_inputs=None):
+    """
+    Records the dual-number operations of a function on a reusable tape.
+
+    Parameters
+    ----------
+    func : function
+        The function to trace. It is called once, with a single `Tracer` if
+        ``n_inputs`` is None and with a list of ``n_inputs`` tracers
+        otherwise, and may return one value or a sequence of values.
+
+    n_inputs : int, optional
+        The number of inputs of a function taking a list, as for `compute_gradient`.
+
+    Returns
+    -------
+    Tape
+        The recorded tape.
+
+    Raises
+    ------
+    TracingError
+        If the function depends on the value of a traced input.
+
+    Examples
+    --------
+    >>> tape = trace(lambda x: x.sin() + x.log())
+    >>> values, derivatives = tape.evaluate(np.linspace(1, 2, 1_000_000))
+    """
+    recorder = _Recorder()
+    count = 1 if n_inputs is None else n_inputs
+    tracers = [Tracer(recorder, recorder.node("input", k)) for k in range(count)]
+    result = func(tracers[0] if n_inputs is None else tracers)
+
+    multi_output = isinstance(result, (list, tuple))
+    outputs = []
+    for y in (result if multi_output else [result]):
+        if isinstance(y, Tracer):
+            outputs.append(y.index)
+        elif isinstance(y, (float, int, np.number)):
+            outputs.append(recorder.constant(y))
+        else:
+            raise TypeError(f"traced function returned {type(y).__name__}, expected a traced value or a number")
+    return Tape(recorder.opcodes, recorder.args, recorder.constants, outputs, count,
+                multi_input=n_inputs is not None, multi_output=multi_output)
@@ -0,0 +1,727 @@
+import math
+
+import numpy as np
+
+from .Dual import _apply_ufunc
+
+
+# Recurrences on normalised Taylor coefficients.
+#
+# A truncated Taylor polynomial of order K is stored as an array ``c`` of
+# shape (K + 1, *batch) with c[k] = f^(k)(x0) / k!. Every function below maps
+# the coefficient arrays of its operands to the coefficients of the result in
+# O(K^2) vectorized operations, using the standard recurrences obtained by
+# differentiating w = f(u) once (e.g. w' = w u' for exp) and matching powers.
+
+def _weights(k, like):
+    """
+    Returns [1, 2, ..., k] shaped to broadcast against ``like[1:k + 1]``.
+    """
+    return np.arange(1, k + 1, dtype=np.float64).reshape((k,) + (1,) * (like.ndim - 1))
+
+
+def _mul(a, b):
+    """
+    Coefficients of a * b (Cauchy product).
+    """
+    w = np.empty(np.broadcast_shapes(a.shape, b.shape))
+    for k in range(w.shape[0]):
+        w[k] = (a[:k + 1] * b[k::-1]).sum(axis=0)
+    return w
+
+
+def _div(a, b):
+    """
+    Coefficients of a / b, from a = b * w.
+    """
+    w = np.empty(np.broadcast_shapes(a.shape, b.shape))
+    w[0] = a[0] / b[0]
+    for k in range(1, w.shape[0]):
+        w[k] = (a[k] - (b[1:k + 1] * w[k - 1::-1]).sum(axis=0)) / b[0]
+    return w
+
+
+def _integrate_ratio(w0, u, q):
+    """
+    Coefficients of w with w(x0) = w0 and q * w' = u'.
+
+    Used for log (q = u), asin/acos (q = sqrt(1 - u^2)) and atan (q = 1 + u^2).
+    """
+    w = np.empty(np.broadcast_shapes(u.shape, q.shape))
+    w[0] = w0
+    for k in range(1, w.shape[0]):
+        j = _weights(k - 1, w)
+        w[k] = (k * u[k] - (j * w[1:k] * q[k - 1:0:-1]).sum(axis=0)) / (k * q[0])
+    return w
+
+
+def _exp(u):
+    """
+    Coefficients of exp(u), from w' = w u'.
+    """
+    w = np.empty_like(u)
+    w[0] = np.exp(u[0])
+    for k in range(1, u.shape[0]):
+        w[k] = (_weights(k, u) * u[1:k + 1] * w[k - 1::-1]).sum(axis=0) / k
+    return w
+
+
+def _sqrt(u):
+    """
+    Coefficients of sqrt(u), from u = w * w.
+    """
+    w = np.empty_like(u)
+    w[0] = np.sqrt(u[0])
+    for k in range(1, u.shape[0]):
+        w[k] = (u[k] - (w[1:k] * w[k - 1:0:-1]).sum(axis=0)) / (2 * w[0])
+    return w
+
+
+def _pow(u, r):
+    """
+    Coefficients of u ** r for a constant r, from u w' = r w u'.
+
+    Where u(x0) = 0, r must exceed the order K unless it is a non-negative
+    integer: u ** r = O((x - x0) ** r) there, so every coefficient is zero.
+    """
+    if float(r).is_integer() and 0 <= r <= max(64, u.shape[0] - 1):
+        # Binary powering only multiplies, so it is also valid at u(x0) = 0
+        n = int(r)
+        w = np.zeros_like(u)
+        w[0] = 1.0
+        base = u
+        while n:
+            if n & 1:
+                w = _mul(w, base)
+            n >>= 1
+            if n:
+                base = _mul(base, base)
+        return w
+    w = np.empty_like(u)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w[0] = u[0] ** r
+        for k in range(1, u.shape[0]):
+            j = _weights(k, u)
+            w[k] = (((r + 1) * j - k) * u[1:k + 1] * w[k - 1::-1]).sum(axis=0) / (k * u[0])
+    return np.where(u[0] == 0, 0.0, w)
+
+
+def _sincos(u, hyperbolic=False):
+    """
+    Coefficients of (sin(u), cos(u)), or (sinh(u), cosh(u)) if ``hyperbolic``.
+    """
+    s = np.empty_like(u)
+    c = np.empty_like(u)
+    s[0], c[0] = (np.sinh(u[0]), np.cosh(u[0])) if hyperbolic else (np.sin(u[0]), np.cos(u[0]))
+    sign = 1.0 if hyperbolic else -1.0
+    for k in range(1, u.shape[0]):
+        ju = _weights(k, u) * u[1:k + 1]
+        s[k] = (ju * c[k - 1::-1]).sum(axis=0) / k
+        c[k] = sign * (ju * s[k - 1::-1]).sum(axis=0) / k
+    return s, c
+
+
+def _tan(u, hyperbolic=False):
+    """
+    Coefficients of tan(u), from w' = (1 + w^2) u', or tanh(u) with w' = (1 - w^2) u'.
+    """
+    sign = -1.0 if hyperbolic else 1.0
+    w = np.empty_like(u)
+    v = np.empty_like(u)
+    w[0] = np.tanh(u[0]) if hyperbolic else np.tan(u[0])
+    v[0] = 1 + sign * w[0] * w[0]
+    for k in range(1, u.shape[0]):
+        w[k] = (_weights(k, u) * u[1:k + 1] * v[k - 1::-1]).sum(axis=0) / k
+        v[k] = sign * (w[:k + 1] * w[k::-1]).sum(axis=0)
+    return w
+
+
+def _one(u):
+    """
+    Coefficients of the constant 1, shaped like ``u``.
+    """
+    one = np.zeros_like(u)
+    one[0] = 1.0
+    return one
+
+
+class _TaylorBase:
+    """
+    Operators and elementary functions shared by `Taylor` and `TaylorArray`.
+
+    Subclasses define the accepted constant types and how real parts are returned.
+    """
+
+    _CONSTANTS = (float, int)
+
+    @classmethod
+    def _from_coeffs(cls, coeffs):
+        """
+        Builds an instance from a float64 coefficient array without validation.
+        """
+        result = object.__new__(cls)
+        result.coeffs = coeffs
+        return result
+
+    def _lift(self, c):
+        """
+        Returns the coefficient array of the constant ``c``.
+        """
+        c = np.asarray(c, dtype=np.float64)
+        coeffs = np.zeros((self.coeffs.shape[0],) + np.broadcast_shapes(self.coeffs.shape[1:], c.shape))
+        coeffs[0] = c
+        return coeffs
+
+    def _coeffs_of(self, other):
+        """
+        Returns the coefficient array of a Taylor operand or constant, or ``None``.
+        """
+        if isinstance(other, type(self)):
+            if other.order != self.order:
+                raise ValueError(f"Taylor orders differ: {self.order} and {other.order}")
+            return other.coeffs
+        if isinstance(other, self._CONSTANTS):
+            return self._lift(other)
+        return None
+
+    @property
+    def order(self):
+        """
+        The truncation order K (the number of coefficients is K + 1).
+        """
+        return self.coeffs.shape[0] - 1
+
+    @property
+    def real(self):
+        """
+        The value of the function, i.e. the zeroth coefficient.
+        """
+        return self.coeffs[0]
+
+    @property
+    def dual(self):
+        """
+        The first derivative, i.e. the first coefficient.
+
+        Raises
+        ------
+        ValueError
+            If the order is 0, where the first derivative is truncated away.
+        """
+        if self.coeffs.shape[0] < 2:
+            raise ValueError(f"Expected a Taylor polynomial of order 1 or more for 'dual', got order {self.order} instead.")
+        return self.coeffs[1]
+
+    def derivatives(self):
+        """
+        Returns the derivatives of orders 0 to K, i.e. the coefficients scaled by k!.
+        """
+        factorials = np.array([math.factorial(k) for k in range(self.order + 1)], dtype=np.float64)
+        return self.coeffs * factorials.reshape((-1,) + (1,) * (self.coeffs.ndim - 1))
+
+    def __add__(self, other):
+        """
+        Adds a Taylor polynomial and another Taylor polynomial or constant.
+        """
+        b = self._coeffs_of(other)
+        if b is None:
+            return NotImplemented
+        return self._from_coeffs(self.coeffs + b)
+
+    def __radd__(self, other):
+        """
+        Adds a Taylor polynomial and another Taylor polynomial or constant.
+        """
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """
+        Subtracts a Taylor polynomial or constant from the Taylor polynomial.
+        """
+        b = self._coeffs_of(other)
+        if b is None:
+            return NotImplemented
+        return self._from_coeffs(self.coeffs - b)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the Taylor polynomial from a constant.
+        """
+        b = self._coeffs_of(other)
+        if b is None:
+            return NotImplemented
+        return self._from_coeffs(b - self.coeffs)
+
+    def __mul__(self, other):
+        """
+        Multiplies a Taylor polynomial with another Taylor polynomial or constant.
+        """
+        if isinstance(other, self._CONSTANTS):
+            return self._from_coeffs(self.coeffs * np.asarray(other, dtype=np.float64))
+        b = self._coeffs_of(other)
+        if b is None:
+            return NotImplemented
+        return self._from_coeffs(_mul(self.coeffs, b))
+
+    def __rmul__(self, other):
+        """
+        Multiplies a Taylor polynomial with another Taylor polynomial or constant.
+        """
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        Divides the Taylor polynomial by another Taylor polynomial or constant.
+        """
+        b = self._coeffs_of(other)
+        if b is None:
+            return NotImplemented
+        if np.any(b[0] == 0):
+            raise ZeroDivisionError("division by zero is undefined")
+        if isinstance(other, self._CONSTANTS):
+            return self._from_coeffs(self.coeffs / b[0])
+        return self._from_coeffs(_div(self.coeffs, b))
+
+    def __rtruediv__(self, other):
+        """
+        Divides a constant by the Taylor polynomial.
+        """
+        a = self._coeffs_of(other)
+        if a is None:
+            return NotImplemented
+        if np.any(self.coeffs[0] == 0):
+            raise ZeroDivisionError("division by zero is undefined")
+        return self._from_coeffs(_div(a, self.coeffs))
+
+    def __pow__(self, other):
+        """
+        Raises the Taylor polynomial to the power of another Taylor polynomial or constant.
+
+        A constant exponent uses the power recurrence (repeated squaring for
+        small non-negative integers); a Taylor exponent uses exp(v log(u)).
+
+        Raises
+        ------
+        ValueError
+            If a negative base is raised to a non-integer power, or a
+            non-positive base to a Taylor exponent.
+
+        ZeroDivisionError
+            If zero is raised to a negative power, or to a non-integer power
+            below the order (where a derivative is infinite), as
+            `Dual.__pow__` does at order 1.
+        """
+        if isinstance(other, self._CONSTANTS) and np.ndim(other) == 0:
+            r = float(other)
+            u0 = self.coeffs[0]
+            if not r.is_integer() and np.any(u0 < 0):
+                raise ValueError("math domain error")
+            if np.any(u0 == 0) and (r < 0 or (not r.is_integer() and r < self.order)):
+                raise ZeroDivisionError("division by zero is undefined")
+            return self._from_coeffs(_pow(self.coeffs, r))
+        b = self._coeffs_of(other)
+        if b is None:
+            return NotImplemented
+        return self._from_coeffs(_exp(_mul(b, self.log().coeffs)))
+
+    def __rpow__(self, other):
+        """
+        Raises a constant to the power of the Taylor polynomial.
+
+        Raises
+        ------
+        ValueError
+            If the base is not positive.
+        """
+        if not isinstance(other, self._CONSTANTS):
+            return NotImplemented
+        if np.any(np.asarray(other) <= 0):
+            raise ValueError("math domain error")
+        return self._from_coeffs(_exp(self.coeffs * np.log(np.asarray(other, dtype=np.float64))))
+
+    def __repr__(self):
+        """
+        Returns a string representation of the Taylor polynomial.
+        """
+        return f'{type(self).__name__}(coeffs={self.coeffs!r})'
+
+    def sin(self):
+        """
+        Returns the sine of the Taylor polynomial.
+        """
+        return self._from_coeffs(_sincos(self.coeffs)[0])
+
+    def cos(self):
+        """
+        Returns the cosine of the Taylor polynomial.
+        """
+        return self._from_coeffs(_sincos(self.coeffs)[1])
+
+    def tan(self):
+        """
+        Returns the tangent of the Taylor polynomial.
+        """
+        return self._from_coeffs(_tan(self.coeffs))
+
+    def exp(self):
+        """
+        Returns the exponential of the Taylor polynomial.
+        """
+        return self._from_coeffs(_exp(self.coeffs))
+
+    def log(self):
+        """
+        Returns the natural logarithm of the Taylor polynomial.
+        """
+        u = self.coeffs
+        if np.any(u[0] <= 0):
+            raise ValueError("Logarithm of a non-positive number is undefined.")
+        return self._from_coeffs(_integrate_ratio(np.log(u[0]), u, u))
+
+    def sqrt(self):
+        """
+        Returns the square root of the Taylor polynomial.
+
+        Raises
+        ------
+        ValueError
+            If the value is negative.
+
+        ZeroDivisionError
+            If the value is zero and the order is 1 or more, where the
+            derivative is infinite.
+        """
+        u = self.coeffs
+        if np.any(u[0] < 0):
+            raise ValueError("math domain error")
+        if self.order > 0 and np.any(u[0] == 0):
+            raise ZeroDivisionError("division by zero is undefined")
+        return self._from_coeffs(_sqrt(u))
+
+    def sinh(self):
+        """
+        Returns the hyperbolic sine of the Taylor polynomial.
+        """
+        return self._from_coeffs(_sincos(self.coeffs, hyperbolic=True)[0])
+
+    def cosh(self):
+        """
+        Returns the hyperbolic cosine of the Taylor polynomial.
+        """
+        return self._from_coeffs(_sincos(self.coeffs, hyperbolic=True)[1])
+
+    def tanh(self):
+        """
+        Returns the hyperbolic tangent of the Taylor polynomial.
+        """
+        return self._from_coeffs(_tan(self.coeffs, hyperbolic=True))
+
+    def asin(self):
+        """
+        Returns the arcsine of the Taylor polynomial.
+        """
+        u = self.coeffs
+        q = _sqrt(_one(u) - _mul(u, u))
+        return self._from_coeffs(_integrate_ratio(np.arcsin(u[0]), u, q))
+
+    def acos(self):
+        """
+        Returns the arccosine of the Taylor polynomial.
+        """
+        w = -self.asin().coeffs
+        w[0] = np.arccos(self.coeffs[0])
+        return self._from_coeffs(w)
+
+    def atan(self):
+        """
+        Returns the arctangent of the Taylor polynomial.
+        """
+        u = self.coeffs
+        return self._from_coeffs(_integrate_ratio(np.arctan(u[0]), u, _one(u) + _mul(u, u)))
+
+
+class Taylor(_TaylorBase):
+    """
+    A class to represent a truncated Taylor polynomial for higher-order automatic differentiation.
+
+    The polynomial is stored as its K + 1 normalised coefficients
+    ``c[k] = f^(k)(x0) / k!``. Every elementary function of `Dual` propagates
+    all coefficients with the standard O(K^2) recurrences, so derivatives up
+    to order K come out of a single evaluation. ``real`` and ``dual`` are the
+    value and first derivative, as for `Dual`.
+
+    Attributes
+    ----------
+    coeffs : numpy.ndarray
+        The normalised Taylor coefficients, shape (K + 1,).
+
+    Examples
+    --------
+    >>> x = Taylor.variable(0.0, order=4)
+    >>> x.exp().derivatives()
+    array([1., 1., 1., 1., 1.])
+    """
+
+    # Special Methods
+    def __init__(self, coeffs):
+        """
+        Constructs all the necessary attributes for the Taylor object.
+
+        Parameters
+        ----------
+        coeffs : sequence of float
+            The normalised Taylor coefficients c[0], ..., c[K].
+
+        Raises
+        ------
+        ValueError
+            If 'coeffs' is empty or not one-dimensional.
+        """
+        coeffs = np.array(coeffs, dtype=np.float64)
+        if coeffs.ndim != 1 or coeffs.size == 0:
+            raise ValueError(f"Expected a non-empty 1-D sequence of coefficients, got shape {coeffs.shape} instead.")
+        self.coeffs = coeffs
+
+    @classmethod
+    def variable(cls, x, order):
+        """
+        Returns the independent variable at ``x``, truncated at ``order``.
+        """
+        coeffs = np.zeros(order + 1)
+        coeffs[0] = x
+        if order >= 1:
+            coeffs[1] = 1.0
+        return cls(coeffs)
+
+    def __eq__(self, other):
+        """
+        Checks if two Taylor polynomials are equal.
+        """
+        if isinstance(other, Taylor):
+            return np.array_equal(self.coeffs, other.coeffs)
+        return False
+
+    __hash__ = None
+
+    @property
+    def real(self):
+        """
+        The value of the function, i.e. the zeroth coefficient.
+        """
+        return float(self.coeffs[0])
+
+    @property
+    def dual(self):
+        """
+        The first derivative, i.e. the first coefficient.
+
+        Raises
+        ------
+        ValueError
+            If the order is 0, where the first derivative is truncated away.
+        """
+        if self.coeffs.shape[0] < 2:
+            raise ValueError(f"Expected a Taylor polynomial of order 1 or more for 'dual', got order {self.order} instead.")
+        return float(self.coeffs[1])
+
+
+class TaylorArray(_TaylorBase):
+    """
+    A class to represent an array of truncated Taylor polynomials.
+
+    Batched counterpart of `Taylor`: the coefficients are stored as one array
+    of shape (K + 1, *shape) and every recurrence step is vectorized over the
+    batch. Constants may be ints, floats or ndarrays broadcasting against the
+    batch shape.
+
+    NumPy ufuncs for the elementary functions and arithmetic dispatch to the
+    Taylor methods, and ``np.sum``, ``np.mean``, ``np.shape``, ``np.ndim``
+    and ``np.size`` have Taylor implementations over the batch axes (see
+    `ARRAY_FUNCTIONS`); other NumPy functions raise TypeError.
+
+    Attributes
+    ----------
+    coeffs : numpy.ndarray
+        The normalised Taylor coefficients, shape (K + 1, *shape).
+
+    Examples
+    --------
+    >>> x = TaylorArray.variable([0.0, 1.0], order=2)
+    >>> (x * x).derivatives()
+    array([[0., 1.],
+           [0., 2.],
+           [2., 2.]])
+    """
+
+    _CONSTANTS = (float, int, np.number, np.ndarray)
+
+    # Special Methods
+    def __init__(self, coeffs):
+        """
+        Constructs all the necessary attributes for the TaylorArray object.
+
+        Parameters
+        ----------
+        coeffs : array_like
+            The normalised Taylor coefficients, shape (K + 1, *shape).
+
+        Raises
+        ------
+        ValueError
+            If 'coeffs' has no coefficient axis.
+        """
+        coeffs = np.array(coeffs, dtype=np.float64)
+        if coeffs.ndim == 0 or coeffs.shape[0] == 0:
+            raise ValueError(f"Expected coefficients of shape (K + 1, ...), got shape {coeffs.shape} instead.")
+        self.coeffs = coeffs
+
+    @classmethod
+    def variable(cls, x, order):
+        """
+        Returns the independent variable at every point of ``x``, truncated at ``order``.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        coeffs = np.zeros((order + 1,) + x.shape)
+        coeffs[0] = x
+        if order >= 1:
+            coeffs[1] = 1.0
+        return cls(coeffs)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Implements NumPy ufuncs with the Taylor methods.
+
+        The elementary functions and arithmetic ufuncs (``np.sin``,
+        ``np.add``, ...) call the methods, and ndarray operators with a
+        Taylor operand defer to the reflected methods. Other ufuncs, methods
+        and ``out=`` arguments raise TypeError.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(TaylorArray, ufunc, inputs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Implements the NumPy functions registered in `ARRAY_FUNCTIONS`; others raise TypeError.
+        """
+        implementation = ARRAY_FUNCTIONS.get(func)
+        if implementation is None:
+            return NotImplemented
+        return implementation(*args, **kwargs)
+
+    @property
+    def shape(self):
+        """
+        The batch shape of the Taylor array.
+        """
+        return self.coeffs.shape[1:]
+
+
+# Implementations of NumPy functions for Taylor arrays, keyed by the NumPy function.
+ARRAY_FUNCTIONS = {}
+
+
+def _implements(function):
+    """
+    Registers the decorated function as the Taylor-array implementation of a NumPy function.
+    """
+    def decorator(implementation):
+        ARRAY_FUNCTIONS[function] = implementation
+        return implementation
+
+    return decorator
+
+
+def _coefficient_axes(axis, ndim):
+    """
+    Returns the axes of the coefficient array for batch axes ``axis`` (None for all of them).
+    """
+    axes = range(ndim) if axis is None else (axis if isinstance(axis, tuple) else (axis,))
+    for a in axes:
+        if not -ndim <= a < ndim:
+            raise np.exceptions.AxisError(a, ndim)
+    return tuple(a % ndim + 1 for a in axes)
+
+
+def _result(coeffs):
+    """
+    Returns a `Taylor` for a 0-d batch and a `TaylorArray` otherwise.
+    """
+    if coeffs.ndim == 1:
+        return Taylor._from_coeffs(coeffs)
+    return TaylorArray._from_coeffs(coeffs)
+
+
+@_implements(np.sum)
+def _sum(a, axis=None, keepdims=False):
+    """
+    Sums Taylor-array elements over a batch axis.
+    """
+    return _result(np.sum(a.coeffs, axis=_coefficient_axes(axis, len(a.shape)), keepdims=keepdims))
+
+
+@_implements(np.mean)
+def _mean(a, axis=None, keepdims=False):
+    """
+    Averages Taylor-array elements over a batch axis.
+    """
+    return _result(np.mean(a.coeffs, axis=_coefficient_axes(axis, len(a.shape)), keepdims=keepdims))
+
+
+@_implements(np.shape)
+def _shape(a):
+    """
+    Returns the batch shape of a Taylor array.
+    """
+    return a.shape
+
+
+@_implements(np.ndim)
+def _ndim(a):
+    """
+    Returns the number of batch dimensions of a Taylor array.
+    """
+    return len(a.shape)
+
+
+@_implements(np.size)
+def _size(a, axis=None):
+    """
+    Returns the number of elements of a Taylor array.
+    """
+    return np.size(a.coeffs[0], axis)
+
+
+def compute_derivatives(func, x, order=2):
+    """
+    Computes the derivatives of a function up to a given order using Taylor polynomials.
+
+    Parameters
+    ----------
+    func : function
+        The function to differentiate.
+
+    x : float or array_like
+        The point (or points) at which to compute the derivatives.
+
+    order : int, optional
+        The highest derivative order K.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``[f(x), f'(x), ..., f^(K)(x)]``, shape (K + 1,) for a scalar ``x``
+        and (K + 1, *x.shape) for an array of points.
+
+    Examples
+    --------
+    >>> def f(x):
+    ...     return x.sin()
+    >>> compute_derivatives(f, 0.0, order=3)
+    array([ 0.,  1.,  0., -1.])
+    """
+    if np.ndim(x) == 0:
+        result = func(Taylor.variable(float(x), order))
+    else:
+        result = func(TaylorArray.variable(x, order))
+    return result.derivatives()
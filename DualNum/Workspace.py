@@ -0,0 +1,136 @@
+import math
+
+import numpy as np
+
+from .DualArray import _set_workspace
+
+
+class Workspace:
+    """
+    A context manager recycling the buffers of `DualArray` results and intermediates.
+
+    While active, every array a dual-array operation needs (its result and
+    any scratch space) is taken from the workspace instead of being
+    allocated by NumPy. Buffers are handed out in order, and each entry of
+    the ``with`` block starts again from the first one, so a computation
+    that repeats the same sequence of operations on arrays of the same
+    shapes (a time step, an optimizer iteration, a residual evaluation)
+    allocates nothing after its first evaluation.
+
+    The results of one evaluation live in the workspace's buffers and are
+    overwritten by the next: copy out (or accumulate in place into an array
+    created outside the workspace) whatever must outlive the ``with`` block.
+    Each result is stamped with the pass (entry of the ``with`` block) that
+    computed it, and an operation reading a result of an earlier pass
+    raises RuntimeError instead of silently using overwritten data.
+    Together with the in-place operators (``+=``, ``-=``, ``*=``, ``/=``)
+    and the ``out`` parameter of the elementary functions, this keeps the
+    steady state of a loop free of allocations.
+
+    Workspaces can be nested, the inner one being used until it exits, but
+    the same workspace cannot be entered twice at once, and it is not
+    thread-safe.
+
+    Attributes
+    ----------
+    allocations : int
+        The number of buffers allocated so far.
+
+    requests : int
+        The number of buffers handed out so far.
+
+    Raises
+    ------
+    RuntimeError
+        From a dual-array operation reading a result of an earlier pass.
+
+    Examples
+    --------
+    >>> state = DualArray(np.ones(1000), np.zeros(1000))
+    >>> workspace = Workspace()
+    >>> for _ in range(100):
+    ...     with workspace:
+    ...         state += state.sin() * 0.01
+    >>> workspace.allocations  # the buffers of the first step only
+    4
+    """
+
+    def __init__(self):
+        """
+        Constructs all the necessary attributes for the Workspace object.
+        """
+        self._buffers = []
+        self._cursor = 0
+        self._previous = None
+        self._active = False
+        self._passes = 0
+        self._stamp = None
+        self.allocations = 0
+        self.requests = 0
+
+    def __enter__(self):
+        """
+        Makes the workspace the source of dual-array buffers, starting from its first buffer.
+
+        Raises
+        ------
+        RuntimeError
+            If the workspace is already active.
+        """
+        if self._active:
+            raise RuntimeError("the Workspace is already active")
+        self._active = True
+        self._cursor = 0
+        self._passes += 1
+        self._stamp = (self, self._passes)
+        self._previous = _set_workspace(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Restores the previously active workspace, if any.
+        """
+        _set_workspace(self._previous)
+        self._previous = None
+        self._active = False
+        return False
+
+    def _take(self, shape, dtype):
+        """
+        Returns the next buffer, viewed with the given shape and dtype, allocating it if there is none large enough.
+        """
+        dtype = np.dtype(dtype)
+        size = math.prod(shape) if isinstance(shape, tuple) else shape
+        nbytes = size * dtype.itemsize
+        self.requests += 1
+        if self._cursor == len(self._buffers):
+            self._buffers.append(np.empty(nbytes, dtype=np.uint8))
+            self.allocations += 1
+        elif self._buffers[self._cursor].size < nbytes:
+            self._buffers[self._cursor] = np.empty(nbytes, dtype=np.uint8)
+            self.allocations += 1
+        buffer = self._buffers[self._cursor]
+        self._cursor += 1
+        return buffer[:nbytes].view(dtype).reshape(shape)
+
+    @property
+    def nbytes(self):
+        """
+        The total size of the workspace's buffers in bytes.
+        """
+        return sum(buffer.nbytes for buffer in self._buffers)
+
+    def reset(self):
+        """
+        Releases the buffers and clears the counters.
+
+        Raises
+        ------
+        RuntimeError
+            If the workspace is active.
+        """
+        if self._active:
+            raise RuntimeError("cannot reset an active Workspace")
+        self._buffers = []
+        self.allocations = 0
+        self.requests = 0
@@ -1,3 +1,18 @@
 from .Dual import Dual, compute_derivative
+from .DualArray import DualArray, compute_derivative_batch
+from .DualBuffer import DualBuffer
+from .Workspace import Workspace
+from .Stream import compute_derivative_stream, iter_derivative_chunks
+from .MultiDual import MultiDual, compute_gradient, compute_jacobian
+from .Taylor import Taylor, TaylorArray, compute_derivatives
+from .HyperDual import HyperDual, HyperDualArray, compute_hessian, hessian_vector_product
+from .Tape import Tape, Tracer, TracingError, trace
+from .Kernel import Kernel, KernelCache, compile_tape
+from .Profiler import Profiler
+from .ParallelExecutor import ParallelExecutor
+from .Async import compute_derivative_async
+from .ODE import compute_sensitivities, integrate
+from .RootFinding import RootResults, find_roots
+from .Sparse import color_columns, compute_sparse_jacobian, jacobian_sparsity
 
-__all__ = ["Dual"]
\ No newline at end of file
+__all__ = ["Dual", "DualArray", "DualBuffer", "Workspace", "compute_derivative_stream", "iter_derivative_chunks", "MultiDual", "Taylor", "TaylorArray", "HyperDual", "HyperDualArray", "Tape", "trace", "Kernel", "KernelCache", "compile_tape", "Profiler", "ParallelExecutor", "compute_derivative_async", "compute_sparse_jacobian", "jacobian_sparsity", "color_columns", "RootResults", "find_roots", "integrate", "compute_sensitivities"]
\ No newline at end of file
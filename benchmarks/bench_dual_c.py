@@ -0,0 +1,56 @@
+"""
+Per-operation benchmark of the compiled Dual_c against the pure Python Dual.
+
+Run from the repository root after building the extension::
+
+    python benchmarks/bench_dual_c.py
+"""
+import timeit
+
+from DualNum import Dual
+from DualNum_c import Dual_c
+
+
+OPERATIONS = {
+    "__add__": "x + y",
+    "__add__ (scalar)": "x + 2.0",
+    "__sub__": "x - y",
+    "__mul__": "x * y",
+    "__mul__ (scalar)": "x * 2.0",
+    "__truediv__": "x / y",
+    "__pow__": "x ** y",
+    "sin": "x.sin()",
+    "cos": "x.cos()",
+    "tan": "x.tan()",
+    "exp": "x.exp()",
+    "log": "x.log()",
+    "sqrt": "x.sqrt()",
+    "sinh": "x.sinh()",
+    "cosh": "x.cosh()",
+    "tanh": "x.tanh()",
+    "asin": "z.asin()",
+    "acos": "z.acos()",
+    "atan": "x.atan()",
+    "f(x) = sin(x) + log(x)": "x.sin() + x.log()",
+}
+
+
+def time_per_op(stmt, dual_class, number=200_000, repeat=5):
+    """
+    Returns the best-of-``repeat`` time in nanoseconds of one evaluation of ``stmt``.
+    """
+    namespace = {"x": dual_class(1.5, 1.0), "y": dual_class(2.5, 0.5), "z": dual_class(0.5, 1.0)}
+    timings = timeit.repeat(stmt, globals=namespace, number=number, repeat=repeat)
+    return min(timings) / number * 1e9
+
+
+def main():
+    print(f"{'operation':<26}{'Dual [ns]':>12}{'Dual_c [ns]':>14}{'speedup':>10}")
+    for name, stmt in OPERATIONS.items():
+        t_py = time_per_op(stmt, Dual)
+        t_c = time_per_op(stmt, Dual_c)
+        print(f"{name:<26}{t_py:>12.1f}{t_c:>14.1f}{t_py / t_c:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
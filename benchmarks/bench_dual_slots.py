@@ -0,0 +1,100 @@
+"""
+Memory and latency benchmark of the ``__slots__`` layout of `Dual`.
+
+`Dual` stores its parts in slots and builds operation results with a
+validation-free constructor. `DictDual` below reproduces the previous layout
+(per-instance ``__dict__``, every result validated by ``__init__``) for
+comparison.
+
+Run from the repository root::
+
+    python benchmarks/bench_dual_slots.py
+"""
+import math
+import timeit
+import tracemalloc
+
+from DualNum import Dual
+
+
+class DictDual:
+    """
+    The previous `Dual` layout, reduced to the operations benchmarked here.
+    """
+
+    def __init__(self, real, dual):
+        if not isinstance(real, (float, int)):
+            raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+        if not isinstance(dual, (float, int)):
+            raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
+        self.real = real
+        self.dual = dual
+
+    def __add__(self, other):
+        if isinstance(other, DictDual):
+            return DictDual(self.real + other.real, self.dual + other.dual)
+        if isinstance(other, (float, int)):
+            return DictDual(self.real + other, self.dual)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, DictDual):
+            return DictDual(self.real * other.real, self.dual * other.real + self.real * other.dual)
+        if isinstance(other, (float, int)):
+            return DictDual(self.real * other, self.dual * other)
+        return NotImplemented
+
+    def sin(self):
+        return DictDual(math.sin(self.real), self.dual * math.cos(self.real))
+
+    def exp(self):
+        return DictDual(math.exp(self.real), self.dual * math.exp(self.real))
+
+
+OPERATIONS = {
+    "__add__": "x + y",
+    "__mul__": "x * y",
+    "__mul__ (scalar)": "x * 2.0",
+    "sin": "x.sin()",
+    "exp": "x.exp()",
+    "f(x) = sin(x) * x + exp(x)": "x.sin() * x + x.exp()",
+}
+
+
+def bytes_per_object(dual_class, n=1_000_000):
+    """
+    Returns the traced memory per instance when holding ``n`` instances in a list.
+
+    This includes the list slot and the float objects, which are the same
+    for both layouts.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = [dual_class(i * 1e-6, 1.0) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del values
+    return (after - before) / n
+
+
+def time_per_op(stmt, dual_class, number=200_000, repeat=5):
+    """
+    Returns the best-of-``repeat`` time in nanoseconds of one evaluation of ``stmt``.
+    """
+    namespace = {"x": dual_class(1.5, 1.0), "y": dual_class(2.5, 0.5)}
+    return min(timeit.repeat(stmt, globals=namespace, number=number, repeat=repeat)) / number * 1e9
+
+
+def main():
+    slots, legacy = bytes_per_object(Dual), bytes_per_object(DictDual)
+    print(f"memory per object (1e6 in a list): Dual {slots:.0f} B, __dict__ layout {legacy:.0f} B "
+          f"({1 - slots / legacy:.0%} less)")
+    print(f"{'operation':<30}{'__dict__ [ns]':>15}{'slots [ns]':>12}{'speedup':>10}")
+    for name, stmt in OPERATIONS.items():
+        t_legacy = time_per_op(stmt, DictDual)
+        t_slots = time_per_op(stmt, Dual)
+        print(f"{name:<30}{t_legacy:>15.1f}{t_slots:>12.1f}{t_legacy / t_slots:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Thread-scaling benchmark of the parallel elementwise kernels in Kernels_c.
+
+Run from the repository root after building the extension::
+
+    python benchmarks/bench_kernels_c.py
+"""
+import os
+import timeit
+
+import numpy as np
+
+from DualNum_c import Kernels_c
+
+
+KERNELS = ["add", "mul", "truediv", "sin", "exp", "log", "atan"]
+
+
+def time_kernel(name, real, dual, number=5, repeat=3):
+    """
+    Returns the best-of-``repeat`` time in milliseconds of one kernel call.
+    """
+    kernel = getattr(Kernels_c, name)
+    out_real, out_dual = np.empty_like(real), np.empty_like(real)
+    if name in ("add", "mul", "truediv"):
+        call = lambda: kernel(real, dual, real, dual, out_real, out_dual)
+    else:
+        call = lambda: kernel(real, dual, out_real, out_dual)
+    return min(timeit.repeat(call, number=number, repeat=repeat)) / number * 1e3
+
+
+def main(size=10_000_000):
+    real = np.linspace(0.1, 0.9, size)
+    dual = np.ones(size)
+    counts = sorted({1, 2, 4, 8, 16, 32, os.cpu_count() or 1})
+    print(f"OpenMP: {Kernels_c.OPENMP}, CPUs: {os.cpu_count()}, size: {size}")
+    print(f"{'kernel':<10}" + "".join(f"{f'{n} thr [ms]':>14}" for n in counts))
+    Kernels_c.set_serial_threshold(0)
+    for name in KERNELS:
+        timings = []
+        for n in counts:
+            Kernels_c.set_num_threads(n)
+            timings.append(time_kernel(name, real, dual))
+        print(f"{name:<10}" + "".join(f"{t:>14.2f}" for t in timings))
+    Kernels_c.set_num_threads(0)
+
+
+if __name__ == "__main__":
+    main()
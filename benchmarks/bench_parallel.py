@@ -0,0 +1,64 @@
+"""
+Scaling benchmark of `ParallelExecutor` on an expensive scalar function.
+
+Compares the serial `compute_derivative` loop, a plain `multiprocessing.Pool`
+mapping over the points (pickling every point and result), and the executor
+with 1 to ``os.cpu_count()`` workers exchanging data through shared memory.
+
+Run from the repository root::
+
+    python benchmarks/bench_parallel.py [n_points]
+"""
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+from DualNum import Dual, ParallelExecutor, compute_derivative
+
+
+def expensive(x):
+    """
+    A scalar function costing a few hundred primitives per evaluation.
+    """
+    y = x
+    for _ in range(100):
+        y = (y.sin() + x * 0.5).tanh()
+    return y
+
+
+def serial_derivative(x):
+    return compute_derivative(expensive, x, Dual)
+
+
+def best_of(call, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(n=20_000):
+    xs = np.linspace(-1.0, 1.0, n)
+    serial = best_of(lambda: [serial_derivative(x) for x in xs.tolist()], repeat=1)
+    print(f"{'serial':<28}{serial:>8.3f} s")
+
+    workers = os.cpu_count() or 1
+    with multiprocessing.Pool(workers) as pool:
+        pool.map(serial_derivative, xs[:workers].tolist())
+        elapsed = best_of(lambda: pool.map(serial_derivative, xs.tolist()))
+    print(f"{f'Pool.map ({workers} workers)':<28}{elapsed:>8.3f} s{serial / elapsed:>8.2f}x")
+
+    for processes in sorted({1, 2, 4, workers} & set(range(1, workers + 1))):
+        with ParallelExecutor(processes=processes) as executor:
+            executor.derivative(expensive, xs[:processes])
+            elapsed = best_of(lambda: executor.derivative(expensive, xs))
+        print(f"{f'ParallelExecutor ({processes})':<28}{elapsed:>8.3f} s{serial / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
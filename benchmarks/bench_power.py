@@ -0,0 +1,98 @@
+"""
+Power fast paths and fused primitives versus the generic forms they replace.
+
+The first table times constant exponents (integer powers by repeated
+squaring in Dual_c, real powers by ``n * x ** (n - 1)``) against the
+generic dual-exponent rule, with its logarithm, that a constant had to be
+wrapped into before. The second table times the fused pure Python
+primitives against their previous bodies, which recomputed ``cos``,
+``exp``, ``sqrt`` or a square.
+
+Run from the repository root after building the extension::
+
+    python benchmarks/bench_power.py
+"""
+import math
+import timeit
+
+from DualNum import Dual
+from DualNum.Dual import _new
+from DualNum_c import Dual_c
+
+# (fast path, generic form it replaces); the generic form has a nonzero dual exponent
+POWERS = {
+    "x ** 2": ("x ** 2", "x ** two"),
+    "x ** 7": ("x ** 7", "x ** seven"),
+    "x ** -3": ("x ** -3", "x ** minus_three"),
+    "x ** 2.5": ("x ** 2.5", "x ** two_and_a_half"),
+}
+
+
+class UnfusedDual(Dual):
+    """
+    Dual with the previous bodies of the primitives that are now fused.
+    """
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            if other.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return _new(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
+        return super().__truediv__(other)
+
+    def tan(self):
+        return _new(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))
+
+    def exp(self):
+        return _new(math.exp(self.real), self.dual * math.exp(self.real))
+
+    def sqrt(self):
+        return _new(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))
+
+
+FUSED = {"tan": "x.tan()", "exp": "x.exp()", "sqrt": "x.sqrt()", "__truediv__": "x / y"}
+
+
+def time_pair(first, second, number=100_000, repeat=15):
+    """
+    Returns the best-of-``repeat`` times in nanoseconds of two ``(stmt, namespace)`` pairs.
+
+    The two are timed alternately, so drift in the machine's speed affects both alike.
+    """
+    best = [float("inf"), float("inf")]
+    for _ in range(repeat):
+        for i, (stmt, names) in enumerate((first, second)):
+            best[i] = min(best[i], timeit.timeit(stmt, globals=names, number=number))
+    return [t / number * 1e9 for t in best]
+
+
+def namespace(dual_class):
+    """
+    Returns the operands of the benchmarked statements for a dual class.
+    """
+    tiny = 1e-300  # a nonzero dual part keeps the exponent on the generic path
+    return {
+        "x": dual_class(1.5, 1.0), "y": dual_class(2.5, 0.5),
+        "two": dual_class(2.0, tiny), "seven": dual_class(7.0, tiny), "minus_three": dual_class(-3.0, tiny),
+        "two_and_a_half": dual_class(2.5, tiny),
+    }
+
+
+def main():
+    print(f"{'power':<12}{'class':<8}{'fast [ns]':>11}{'generic [ns]':>14}{'speedup':>10}")
+    for dual_class in (Dual, Dual_c):
+        names = namespace(dual_class)
+        for label, (fast, generic) in POWERS.items():
+            t_fast, t_generic = time_pair((fast, names), (generic, names))
+            print(f"{label:<12}{dual_class.__name__:<8}{t_fast:>11.1f}{t_generic:>14.1f}{t_generic / t_fast:>9.1f}x")
+
+    print()
+    print(f"{'primitive':<14}{'fused [ns]':>12}{'unfused [ns]':>14}{'speedup':>10}")
+    fused, unfused = namespace(Dual), namespace(UnfusedDual)
+    for label, stmt in FUSED.items():
+        t_fused, t_unfused = time_pair((stmt, fused), (stmt, unfused))
+        print(f"{label:<14}{t_fused:>12.1f}{t_unfused:>14.1f}{t_unfused / t_fused:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
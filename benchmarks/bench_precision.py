@@ -0,0 +1,126 @@
+"""
+Throughput and accuracy of float32 and long double dual arrays against float64.
+
+Every operator and elementary function of `Dual` is evaluated on
+`DualArray` and, when the extension is built, on the ``Kernels_c``
+kernels, in each precision. The inputs are representable in float32, so
+every precision sees the same values. Throughput is reported relative
+to float64. The error is the largest relative error of the real and dual
+parts against a long double evaluation. Where long double is no wider than
+float64 (MSVC, some ARM targets), that reference is float64 itself.
+
+Run from the repository root after building the extension::
+
+    python benchmarks/bench_precision.py
+    python benchmarks/bench_precision.py --size 100000 --filter sin
+"""
+import argparse
+import operator
+import timeit
+
+import numpy as np
+
+from DualNum import DualArray
+
+try:
+    from DualNum_c import Kernels_c
+except ImportError:
+    Kernels_c = None
+
+
+OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "pow": operator.pow,
+}
+FUNCTIONS = ["sin", "cos", "tan", "exp", "log", "sqrt", "sinh", "cosh", "tanh", "asin", "acos", "atan"]
+PRIMITIVES = list(OPERATORS) + FUNCTIONS
+
+DTYPES = [np.float32, np.float64, np.longdouble]
+
+
+def operands(size, dtype):
+    """
+    Returns two dual arrays of ``size`` float32-representable points inside every primitive's domain.
+    """
+    x = np.linspace(0.1, 0.9, size, dtype=np.float32)
+    y = np.linspace(1.1, 1.9, size, dtype=np.float32)
+    return DualArray(x, 1.0, dtype=dtype), DualArray(y, 0.5, dtype=dtype)
+
+
+def vectorized(name, a, b):
+    """
+    Returns a callable applying a primitive to dual arrays, and its result.
+    """
+    if name in OPERATORS:
+        op = OPERATORS[name]
+        call = lambda: op(a, b)
+    else:
+        method = getattr(DualArray, name)
+        call = lambda: method(a)
+    result = call()
+    return call, (result.real, result.dual)
+
+
+def kernels(name, a, b):
+    """
+    Returns a callable applying a primitive with the Kernels_c kernels into preallocated buffers, and its result.
+    """
+    kernel = getattr(Kernels_c, name)
+    out_real, out_dual = np.empty_like(a.real), np.empty_like(a.dual)
+    if name in OPERATORS:
+        call = lambda: kernel(a.real, a.dual, b.real, b.dual, out_real, out_dual)
+    else:
+        call = lambda: kernel(a.real, a.dual, out_real, out_dual)
+    call()
+    return call, (out_real, out_dual)
+
+
+BACKENDS = {"vectorized": vectorized, "kernels": kernels}
+
+
+def relative_error(value, reference):
+    """
+    Returns the largest elementwise relative error of ``value``, computed in long double.
+    """
+    value = np.asarray(value, dtype=np.longdouble)
+    scale = np.maximum(np.abs(reference), np.finfo(np.float32).tiny)
+    return float(np.max(np.abs(value - reference) / scale))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default=None, help="only run primitives whose name contains this")
+    args = parser.parse_args(argv)
+
+    backends = [name for name in BACKENDS if name != "kernels" or Kernels_c is not None]
+    print(f"size: {args.size}, long double: {np.finfo(np.longdouble).bits} bits "
+          f"({np.finfo(np.longdouble).precision} digits)")
+    print(f"{'primitive':<10}{'backend':<12}{'dtype':<12}{'Mops/s':>10}{'vs float64':>12}"
+          f"{'real err':>11}{'dual err':>11}")
+    for name in PRIMITIVES:
+        if args.filter and args.filter not in name:
+            continue
+        reference = vectorized(name, *operands(args.size, np.longdouble))[1]
+        for backend in backends:
+            calls, errors = {}, {}
+            for dtype in DTYPES:
+                call, (real, dual) = BACKENDS[backend](name, *operands(args.size, dtype))
+                calls[dtype] = call
+                errors[dtype] = (relative_error(real, reference[0]), relative_error(dual, reference[1]))
+            # Interleave the precisions, so drift in the machine's speed affects them alike
+            best = dict.fromkeys(DTYPES, float("inf"))
+            for _ in range(args.repeat):
+                for dtype in DTYPES:
+                    best[dtype] = min(best[dtype], timeit.timeit(calls[dtype], number=1))
+            for dtype in DTYPES:
+                print(f"{name:<10}{backend:<12}{np.dtype(dtype).name:<12}{args.size / best[dtype] / 1e6:>10.1f}"
+                      f"{best[np.float64] / best[dtype]:>11.2f}x{errors[dtype][0]:>11.1e}{errors[dtype][1]:>11.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Batched root finding versus a per-point Newton loop.
+
+Solves Kepler's equation E - e sin(E) = M for a million mean anomalies M,
+with `find_roots` (Newton and Halley, with and without a bracket) and with
+the scalar loop over `compute_derivative` it replaces, timed on a sample
+and extrapolated.
+
+Run from the repository root::
+
+    python benchmarks/bench_root_finding.py [n_equations]
+"""
+import sys
+import time
+
+import numpy as np
+
+from DualNum import Dual, compute_derivative, find_roots
+
+ECCENTRICITY = 0.9
+
+
+def kepler(E, M, e):
+    return E - e * E.sin() - M
+
+
+def scalar_newton(M, tol=1e-12):
+    E = M
+    for _ in range(50):
+        f = lambda x: kepler(x, M, ECCENTRICITY)
+        step = f(Dual(E, 0)).real / compute_derivative(f, E, Dual)
+        E -= step
+        if abs(step) <= tol:
+            break
+    return E
+
+
+def main(n=1_000_000):
+    M = np.linspace(0.0, 2 * np.pi, n)
+    sample = M[:: max(1, n // 20_000)]
+    start = time.perf_counter()
+    for m in sample.tolist():
+        scalar_newton(m)
+    loop = (time.perf_counter() - start) * n / sample.size
+    print(f"{'scalar Newton loop (extrapolated)':<36}{loop:>9.2f} s")
+
+    for method in ("newton", "halley"):
+        for bracket in (None, (M - 1, M + 1)):
+            start = time.perf_counter()
+            result = find_roots(kepler, M, args=(M, ECCENTRICITY), method=method, bracket=bracket)
+            elapsed = time.perf_counter() - start
+            label = f"find_roots {method}{' + bracket' if bracket else ''}"
+            print(f"{label:<36}{elapsed:>9.2f} s{loop / elapsed:>8.0f}x  "
+                  f"max {result.iterations.max()} iterations, {result.converged.mean():.0%} converged")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""
+Dense versus colouring-compressed sparse Jacobians of a banded system.
+
+The dense `compute_jacobian` carries one tangent component per input, and a
+column-by-column `Dual` Jacobian needs one pass per input; the sparse
+Jacobian needs one `Dual` pass per colour (3 for this tridiagonal system),
+plus one traced pass when the pattern is detected rather than given.
+
+Run from the repository root::
+
+    python benchmarks/bench_sparse_jacobian.py
+"""
+import time
+
+import numpy as np
+
+from DualNum import Dual, color_columns, compute_jacobian, compute_sparse_jacobian, jacobian_sparsity
+
+
+def residual(x):
+    """
+    A nonlinear tridiagonal system, as from a finite-difference discretisation.
+    """
+    return [x[i - 1] - 2 * x[i] * x[i].sin() + x[i + 1].exp() for i in range(1, len(x) - 1)]
+
+
+def columns(func, xs):
+    """
+    The dense Jacobian from one seeded `Dual` pass per input.
+    """
+    return np.array([[y.dual for y in func([Dual(x, float(i == j)) for i, x in enumerate(xs)])]
+                     for j in range(len(xs))]).T
+
+
+def timed(call):
+    start = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'n':>6}{'colours':>9}{'dense [s]':>12}{'columns [s]':>13}{'sparse [s]':>12}"
+          f"{'pattern given [s]':>19}{'speedup':>9}")
+    for n in (100, 300, 1000, 3000):
+        xs = np.linspace(0.5, 2.0, n)
+        rows, cols, _ = jacobian_sparsity(residual, n)
+        colours = color_columns(rows, cols, n).max() + 1
+        dense, t_dense = timed(lambda: compute_jacobian(residual, xs))
+        _, t_columns = timed(lambda: columns(residual, xs.tolist())) if n <= 300 else (None, float("nan"))
+        sparse, t_sparse = timed(lambda: compute_sparse_jacobian(residual, xs))
+        _, t_given = timed(lambda: compute_sparse_jacobian(residual, xs, sparsity=(rows, cols)))
+        assert np.allclose(sparse.toarray(), dense)
+        print(f"{n:>6}{colours:>9}{t_dense:>12.3f}{t_columns:>13.3f}{t_sparse:>12.3f}"
+              f"{t_given:>19.3f}{t_dense / t_given:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,573 @@
+"""
+Benchmark suite covering every primitive and backend.
+
+Every operator and elementary function, and end-to-end ``compute_derivative``
+workloads, are timed on each available backend over a grid of input sizes.
+Each benchmark is warmed up, calibrated so that one sample lasts at least
+``--min-time`` seconds, then sampled ``--repeat`` times. Results report
+operations (elements) per second with a 95% confidence interval, the
+peak memory traced during one call and the dual numbers (scalar backends)
+or array buffers (``vectorized``, ``workspace``) one call allocates, and
+are saved to JSON. The ``workspace`` backend evaluates `DualArray`
+operations in a persistent `Workspace`, so its allocations show the
+steady state of a repeated evaluation. A saved run can
+be compared with a baseline; throughput drops above ``--threshold`` are
+listed and make the command exit with status 1.
+
+Run from the repository root after building the extension::
+
+    python benchmarks/bench_suite.py run --output results.json
+    python benchmarks/bench_suite.py run --sizes 1,1000 --backends python,compiled --filter sin
+    python benchmarks/bench_suite.py compare results.json baseline.json --threshold 0.1
+    python benchmarks/bench_suite.py run --baseline baseline.json
+
+New backends are added by registering a `Backend` subclass in `BACKENDS`.
+"""
+import argparse
+import datetime
+import json
+import math
+import operator
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from DualNum import Dual, DualArray, Profiler, Workspace, compute_derivative, compute_derivative_batch, trace
+
+
+OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "pow": operator.pow,
+}
+FUNCTIONS = ["sin", "cos", "tan", "exp", "log", "sqrt", "sinh", "cosh", "tanh", "asin", "acos", "atan"]
+PRIMITIVES = list(OPERATORS) + FUNCTIONS
+
+WORKLOADS = {
+    "sin+log": lambda x: x.sin() + x.log(),
+    "composite": lambda x: (x.sin() * x.exp() + 2) / (1 + x * x) - x.log() * x.sqrt() + x.atan(),
+}
+
+DEFAULT_SIZES = [1, 100, 10_000, 1_000_000, 10_000_000]
+
+# Two-sided 95% Student t quantiles by degrees of freedom; 1.96 beyond the table.
+_T95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+        10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042}
+
+
+def _t95(df):
+    """
+    Returns the two-sided 95% Student t quantile for ``df`` degrees of freedom.
+    """
+    for k in sorted(_T95):
+        if df <= k:
+            return _T95[k]
+    return 1.96
+
+
+def _points(size):
+    """
+    Returns two float64 arrays of ``size`` points inside every primitive's domain.
+    """
+    return np.linspace(0.1, 0.9, size), np.linspace(1.1, 1.9, size)
+
+
+class Backend:
+    """
+    A way of evaluating dual-number primitives and derivatives over a batch.
+
+    Subclasses return zero-argument callables processing ``size`` elements,
+    or None when they do not support a benchmark.
+    """
+
+    name = None
+    scalar = False
+
+    def available(self):
+        """
+        Returns whether the backend can run in this environment.
+        """
+        return True
+
+    def primitive(self, name, size):
+        """
+        Returns a callable applying primitive ``name`` to ``size`` elements.
+        """
+        raise NotImplementedError
+
+    def workload(self, func, size):
+        """
+        Returns a callable computing the derivative of ``func`` at ``size`` points.
+        """
+        raise NotImplementedError
+
+    def allocations(self, call):
+        """
+        Returns the number of objects or buffers allocated by one call, or None if not counted.
+        """
+        return None
+
+
+class ScalarBackend(Backend):
+    """
+    One scalar dual-number object per element, evaluated in a Python loop.
+    """
+
+    scalar = True
+    dual_class = None
+
+    def primitive(self, name, size):
+        x, y = _points(size)
+        xs = [self.dual_class(float(v), 1.0) for v in x]
+        if name in OPERATORS:
+            op = OPERATORS[name]
+            ys = [self.dual_class(float(v), 0.0) for v in y]
+            return lambda: [op(a, b) for a, b in zip(xs, ys)]
+        # Looked up at call time, so a Profiler can instrument it
+        method = operator.methodcaller(name)
+        return lambda: [method(a) for a in xs]
+
+    def workload(self, func, size):
+        points = _points(size)[0].tolist()
+        dual_class = self.dual_class
+        return lambda: [compute_derivative(func, x, dual_class) for x in points]
+
+    def allocations(self, call):
+        with Profiler() as profiler:
+            call()
+        return sum(row["constructed"] for row in profiler.to_dict().values())
+
+
+class PythonBackend(ScalarBackend):
+    name = "python"
+    dual_class = Dual
+
+
+class CompiledBackend(ScalarBackend):
+    name = "compiled"
+
+    def available(self):
+        try:
+            from DualNum_c import Dual_c
+        except ImportError:
+            return False
+        self.dual_class = Dual_c
+        return True
+
+
+class VectorizedBackend(Backend):
+    """
+    `DualArray`: one NumPy kernel per operation over the whole batch.
+    """
+
+    name = "vectorized"
+
+    def primitive(self, name, size):
+        x, y = _points(size)
+        a, b = DualArray(x, 1.0), DualArray(y, 0.0)
+        if name in OPERATORS:
+            op = OPERATORS[name]
+            return lambda: op(a, b)
+        method = getattr(DualArray, name)
+        return lambda: method(a)
+
+    def workload(self, func, size):
+        x = _points(size)[0]
+        return lambda: compute_derivative_batch(func, x)
+
+    def allocations(self, call):
+        with Workspace() as workspace:
+            call()
+        return workspace.allocations
+
+
+class WorkspaceBackend(VectorizedBackend):
+    """
+    `DualArray` evaluated in a persistent `Workspace`, reusing its buffers from one call to the next.
+    """
+
+    name = "workspace"
+
+    @staticmethod
+    def _in_workspace(evaluate):
+        workspace = Workspace()
+
+        def call():
+            with workspace:
+                return evaluate()
+
+        call.workspace = workspace
+        return call
+
+    def primitive(self, name, size):
+        evaluate = super().primitive(name, size)
+        return self._in_workspace(evaluate)
+
+    def workload(self, func, size):
+        seed = DualArray(_points(size)[0], 1.0)
+        derivatives = np.empty(size)
+        return self._in_workspace(lambda: np.copyto(derivatives, func(seed).dual))
+
+    def allocations(self, call):
+        # The steady state: buffers allocated by a call after the first
+        call()
+        before = call.workspace.allocations
+        call()
+        return call.workspace.allocations - before
+
+
+class KernelsBackend(Backend):
+    """
+    The parallel elementwise kernels of ``DualNum_c.Kernels_c``.
+    """
+
+    name = "kernels"
+
+    def available(self):
+        try:
+            from DualNum_c import Kernels_c
+        except ImportError:
+            return False
+        self.kernels = Kernels_c
+        return True
+
+    def primitive(self, name, size):
+        x, y = _points(size)
+        ones, zeros = np.ones(size), np.zeros(size)
+        kernel = getattr(self.kernels, name)
+        if name in OPERATORS:
+            return lambda: kernel(x, ones, y, zeros)
+        return lambda: kernel(x, ones)
+
+    def workload(self, func, size):
+        return None
+
+
+class TapeBackend(Backend):
+    """
+    A traced and optimized `Tape` replayed with vectorized kernels.
+    """
+
+    name = "tape"
+
+    def _tape(self, name):
+        if name in OPERATORS:
+            op = OPERATORS[name]
+            return trace(lambda xs: op(xs[0], xs[1]), n_inputs=2)
+        return trace(lambda x: getattr(x, name)())
+
+    def _evaluate(self, runner, name, size):
+        x, y = _points(size)
+        if name in OPERATORS:
+            return lambda: runner.evaluate([x, y], [1.0, 0.0])
+        return lambda: runner.evaluate(x)
+
+    def primitive(self, name, size):
+        return self._evaluate(self._tape(name), name, size)
+
+    def workload(self, func, size):
+        tape = trace(func).optimize()
+        x = _points(size)[0]
+        return lambda: tape.evaluate(x)
+
+
+class NativeBackend(TapeBackend):
+    """
+    A traced tape compiled to a fused native loop with `compile_tape`.
+    """
+
+    name = "native"
+
+    def available(self):
+        try:
+            import Cython  # noqa: F401
+        except ImportError:
+            return False
+        from DualNum import compile_tape
+        self.compile = compile_tape
+        return True
+
+    def primitive(self, name, size):
+        return self._evaluate(self.compile(self._tape(name)), name, size)
+
+    def workload(self, func, size):
+        kernel = self.compile(trace(func).optimize())
+        x = _points(size)[0]
+        return lambda: kernel.evaluate(x)
+
+
+BACKENDS = {backend.name: backend for backend in
+            (PythonBackend(), CompiledBackend(), VectorizedBackend(), WorkspaceBackend(), KernelsBackend(), TapeBackend(),
+              NativeBackend())}
+
+
+def measure(call, size, warmup=1, repeat=7, min_time=0.05):
+    """
+    Times a callable and returns its throughput statistics.
+
+    Parameters
+    ----------
+    call : callable
+        Processes ``size`` elements per call.
+
+    size : int
+        The number of elements processed per call.
+
+    warmup : int, optional
+        Untimed calls made first.
+
+    repeat : int, optional
+        The number of timed samples.
+
+    min_time : float, optional
+        The minimum duration in seconds of one sample; the number of calls
+        per sample is doubled until it is reached.
+
+    Returns
+    -------
+    dict
+        ``ops_per_sec`` (mean), ``ci95`` (low, high), ``stdev``,
+        ``seconds_per_call``, ``number``, ``repeat`` and ``peak_bytes``.
+    """
+    for _ in range(warmup):
+        call()
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        rates.append(size * number / elapsed)
+
+    mean = statistics.fmean(rates)
+    stdev = statistics.stdev(rates) if repeat > 1 else 0.0
+    half = _t95(repeat - 1) * stdev / math.sqrt(repeat) if repeat > 1 else 0.0
+
+    tracemalloc.start()
+    try:
+        call()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": mean,
+        "ci95": [mean - half, mean + half],
+        "stdev": stdev,
+        "seconds_per_call": size / mean,
+        "number": number,
+        "repeat": repeat,
+        "peak_bytes": peak,
+    }
+
+
+def metadata():
+    """
+    Returns a description of the environment the suite runs in.
+    """
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+    }
+
+
+def run(sizes=DEFAULT_SIZES, backends=None, pattern=None, max_scalar_size=100_000,
+        warmup=1, repeat=7, min_time=0.05, verbose=True):
+    """
+    Runs the suite and returns the results document.
+
+    Parameters
+    ----------
+    sizes : list of int
+        The input sizes.
+
+    backends : list of str, optional
+        The backends to run; defaults to every available one.
+
+    pattern : str, optional
+        Only benchmarks whose name contains this substring are run.
+
+    max_scalar_size : int, optional
+        The largest size run on scalar (one object per element) backends.
+
+    warmup, repeat, min_time
+        Passed to `measure`.
+
+    verbose : bool, optional
+        Print one line per benchmark.
+
+    Returns
+    -------
+    dict
+        ``{"metadata": {...}, "results": [...]}``, ready for `json.dump`.
+        Each result also holds ``allocations``, the objects or buffers
+        allocated by one call (None where the backend does not count them).
+    """
+    selected = [BACKENDS[name] for name in (backends or BACKENDS)]
+    selected = [backend for backend in selected if backend.available()]
+    benchmarks = [("primitive", name) for name in PRIMITIVES] + [("workload", name) for name in WORKLOADS]
+    results = []
+    for group, name in benchmarks:
+        if pattern and pattern not in name:
+            continue
+        for size in sizes:
+            for backend in selected:
+                if backend.scalar and size > max_scalar_size:
+                    continue
+                if group == "primitive":
+                    call = backend.primitive(name, size)
+                else:
+                    call = backend.workload(WORKLOADS[name], size)
+                if call is None:
+                    continue
+                stats = measure(call, size, warmup=warmup, repeat=repeat, min_time=min_time)
+                result = {"id": f"{group}/{name}/{backend.name}/{size}", "group": group, "name": name,
+                          "backend": backend.name, "size": size, **stats,
+                          "allocations": backend.allocations(call)}
+                results.append(result)
+                if verbose:
+                    low, high = result["ci95"]
+                    allocations = "-" if result["allocations"] is None else result["allocations"]
+                    print(f"{result['id']:<40}{result['ops_per_sec']:>14.4g} ops/s "
+                          f"[{low:.4g}, {high:.4g}]{result['peak_bytes'] / 2 ** 20:>10.2f} MiB"
+                          f"{allocations:>10} allocs", flush=True)
+    return {"metadata": metadata(), "results": results}
+
+
+def winners(document):
+    """
+    Returns the fastest backend of every (benchmark, size) pair.
+
+    Returns
+    -------
+    dict
+        Maps ``"group/name"`` to a dict of size -> (backend, ops_per_sec).
+    """
+    table = {}
+    for result in document["results"]:
+        key = f"{result['group']}/{result['name']}"
+        best = table.setdefault(key, {}).get(result["size"])
+        if best is None or result["ops_per_sec"] > best[1]:
+            table[key][result["size"]] = (result["backend"], result["ops_per_sec"])
+    return table
+
+
+def compare(current, baseline, threshold=0.1):
+    """
+    Compares a results document with a baseline.
+
+    Parameters
+    ----------
+    current, baseline : dict
+        Results documents returned by `run` (or loaded from JSON).
+
+    threshold : float, optional
+        The relative throughput drop flagged as a regression.
+
+    Returns
+    -------
+    list of dict
+        One entry per regressed benchmark with ``id``, ``baseline``,
+        ``current`` (ops/sec) and ``change`` (relative).
+    """
+    reference = {result["id"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        base = reference.get(result["id"])
+        if base is None:
+            continue
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions.append({"id": result["id"], "baseline": base["ops_per_sec"],
+                                "current": result["ops_per_sec"], "change": change})
+    return regressions
+
+
+def _report(regressions, threshold):
+    """
+    Prints regressions and returns the exit status.
+    """
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}.")
+        return 0
+    print(f"{len(regressions)} regression(s) above {threshold:.0%}:")
+    for entry in regressions:
+        print(f"  {entry['id']:<40}{entry['baseline']:>12.4g} -> {entry['current']:<12.4g}{entry['change']:+.1%}")
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    run_parser.add_argument("--backends", default=None, help=f"comma-separated subset of {','.join(BACKENDS)}")
+    run_parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this")
+    run_parser.add_argument("--max-scalar-size", type=int, default=100_000)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--repeat", type=int, default=7)
+    run_parser.add_argument("--min-time", type=float, default=0.05)
+    run_parser.add_argument("--output", default=None, help="write results to this JSON file")
+    run_parser.add_argument("--baseline", default=None, help="compare against this JSON file")
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        with open(args.current) as f:
+            current = json.load(f)
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        return _report(compare(current, baseline, args.threshold), args.threshold)
+
+    document = run(
+        sizes=[int(float(size)) for size in args.sizes.split(",")],
+        backends=args.backends.split(",") if args.backends else None,
+        pattern=args.filter,
+        max_scalar_size=args.max_scalar_size,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        min_time=args.min_time,
+    )
+    print("\nFastest backend by size:")
+    for key, by_size in winners(document).items():
+        print(f"  {key:<24}" + "  ".join(f"{size}: {backend}" for size, (backend, _) in sorted(by_size.items())))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        return _report(compare(document, baseline, args.threshold), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
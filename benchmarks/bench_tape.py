@@ -0,0 +1,52 @@
+"""
+Replay benchmark of a traced tape before and after `Tape.optimize`, and of
+the optimized tape compiled to a native kernel.
+
+Run from the repository root::
+
+    python benchmarks/bench_tape.py
+"""
+import tempfile
+import timeit
+
+import numpy as np
+
+from DualNum import KernelCache, compile_tape, trace
+
+
+def f(x):
+    s = x.sin()
+    return (s * s + x.cos()) / (1 + x * x) + (x * x.sin()).exp() - (x.sin() * x).exp() * x.cos()
+
+
+def time_evaluate(tape, xs, number, repeat=5):
+    """
+    Returns the best-of-``repeat`` time in microseconds of one ``tape.evaluate(xs)``.
+    """
+    timings = timeit.repeat(lambda: tape.evaluate(xs), number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def main():
+    tape = trace(f)
+    optimized, stats = tape.optimize(return_stats=True)
+    print(f"nodes: {stats['nodes_before']} -> {stats['nodes_after']} "
+          f"(merged {stats['merged']}, folded {stats['folded']}, dead {stats['dead']}, "
+          f"sincos fused {stats['sincos_fused']})")
+    cache = KernelCache(tempfile.mkdtemp(prefix="dualnum-bench-"))
+    cold = compile_tape(optimized, cache)
+    warm = KernelCache(cache.directory).get(optimized)
+    print(f"kernel cold start: {sum(cold.timings.values()):.3f} s "
+          f"(codegen {cold.timings['codegen']:.4f}, compile {cold.timings['compile']:.3f}, load {cold.timings['load']:.4f})")
+    print(f"kernel warm start: {sum(warm.timings.values()):.4f} s")
+
+    print(f"{'batch':>10}{'tape [us]':>14}{'optimized [us]':>16}{'kernel [us]':>14}{'speedup':>10}")
+    for size, number in ((1, 2000), (1_000, 500), (1_000_000, 3)):
+        xs = 1.5 if size == 1 else np.linspace(0.1, 3.0, size)
+        t_tape = time_evaluate(tape, xs, number)
+        t_opt = time_evaluate(optimized, xs, number)
+        t_kernel = time_evaluate(warm, xs, number)
+        print(f"{size:>10}{t_tape:>14.1f}{t_opt:>16.1f}{t_kernel:>14.1f}{t_tape / t_kernel:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,9 @@
 /* BEGIN: Cython Metadata
 {
     "distutils": {
+        "depends": [],
         "include_dirs": [
-            "/usr/local/Cellar/python@3.12/3.12.7_1/Frameworks/Python.framework/Versions/3.12/include/include"
+            "/root/.pyenv/versions/3.11.7/include/include"
         ],
         "name": "DualNum_c.Dual_c",
         "sources": [
@@ -1234,6 +1235,8 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __PYX_HAVE__DualNum_c__Dual_c
 #define __PYX_HAVE_API__DualNum_c__Dual_c
 /* Early includes */
+#include <math.h>
+#include <limits.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1483,6 +1486,8 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "DualNum_c/Dual_c.pyx",
+  "DualNum_c/Dual_c.pxd",
+  "<stringsource>",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* ForceInitThreads.proto */
@@ -1495,6 +1500,35 @@ static const char *__pyx_f[] = {
 /* #### Code section: type_declarations ### */
 
 /*--- Type declarations ---*/
+struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c;
+struct __pyx_t_9DualNum_c_6Dual_c_dual_t;
+typedef struct __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_t_9DualNum_c_6Dual_c_dual_t;
+
+/* "DualNum_c/Dual_c.pxd":29
+ * 
+ * 
+ * ctypedef struct dual_t:             # <<<<<<<<<<<<<<
+ *     double real
+ *     double dual
+ */
+struct __pyx_t_9DualNum_c_6Dual_c_dual_t {
+  double real;
+  double dual;
+};
+
+/* "DualNum_c/Dual_c.pxd":34
+ * 
+ * 
+ * cdef class Dual_c:             # <<<<<<<<<<<<<<
+ *     cdef readonly double real
+ *     cdef readonly double dual
+ */
+struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c {
+  PyObject_HEAD
+  double real;
+  double dual;
+};
+
 /* #### Code section: utility_code_proto ### */
 
 /* --- Runtime support code (head) --- */
@@ -1705,10 +1739,6 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
 #define __Pyx_ArgsSlice_FASTCALL(args, start, stop) PyTuple_GetSlice(args, start, stop)
 #endif
 
-/* RaiseArgTupleInvalid.proto */
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
-
 /* RaiseDoubleKeywords.proto */
 static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
@@ -1718,31 +1748,56 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject *const *kwvalues
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,
     const char* function_name);
 
-/* PyObjectFormatSimple.proto */
-#if CYTHON_COMPILING_IN_PYPY
-    #define __Pyx_PyObject_FormatSimple(s, f) (\
-        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
-        PyObject_Format(s, f))
-#elif PY_MAJOR_VERSION < 3
-    #define __Pyx_PyObject_FormatSimple(s, f) (\
-        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
-        likely(PyString_CheckExact(s)) ? PyUnicode_FromEncodedObject(s, NULL, "strict") :\
-        PyObject_Format(s, f))
-#elif CYTHON_USE_TYPE_SLOTS
-    #define __Pyx_PyObject_FormatSimple(s, f) (\
-        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
-        likely(PyLong_CheckExact(s)) ? PyLong_Type.tp_repr(s) :\
-        likely(PyFloat_CheckExact(s)) ? PyFloat_Type.tp_repr(s) :\
-        PyObject_Format(s, f))
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
 #else
-    #define __Pyx_PyObject_FormatSimple(s, f) (\
-        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
-        PyObject_Format(s, f))
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
 #endif
 
-/* JoinPyUnicode.proto */
-static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
-                                      Py_UCS4 max_char);
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
 
 /* PyFunctionFastCall.proto */
 #if CYTHON_FAST_PYCALL
@@ -1795,103 +1850,96 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 #define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
 static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs);
 
-/* PyObjectCallOneArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
-
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
-/* PyObjectSetAttrStr.proto */
-#if CYTHON_USE_TYPE_SLOTS
-#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
-static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
 #else
-#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
-#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
 #endif
 
-/* PyDictVersioning.proto */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
-#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
-    (version_var) = __PYX_GET_DICT_VERSION(dict);\
-    (cache_var) = (value);
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
-        (VAR) = __pyx_dict_cached_value;\
-    } else {\
-        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
-        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
-    }\
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
 #else
-#define __PYX_GET_DICT_VERSION(dict)  (0)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
 #endif
 
-/* GetModuleGlobalName.proto */
-#if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  do {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
-        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
-        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-} while(0)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
-    PY_UINT64_T __pyx_dict_version;\
-    PyObject *__pyx_dict_cached_value;\
-    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-} while(0)
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
-#else
-#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
 #endif
 
-/* PyIntCompare.proto */
-static CYTHON_INLINE int __Pyx_PyInt_BoolEqObjC(PyObject *op1, PyObject *op2, long intval, long inplace);
-
-/* PyIntBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_MultiplyCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
 #else
-#define __Pyx_PyInt_MultiplyCObj(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceMultiply(op1, op2) : PyNumber_Multiply(op1, op2))
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
 #endif
 
-/* PyIntBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_SubtractCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
-#else
-#define __Pyx_PyInt_SubtractCObj(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
-#endif
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* PyIntBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+/* PyObjectFormatSimple.proto */
+#if CYTHON_COMPILING_IN_PYPY
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#elif PY_MAJOR_VERSION < 3
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyString_CheckExact(s)) ? PyUnicode_FromEncodedObject(s, NULL, "strict") :\
+        PyObject_Format(s, f))
+#elif CYTHON_USE_TYPE_SLOTS
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyLong_CheckExact(s)) ? PyLong_Type.tp_repr(s) :\
+        likely(PyFloat_CheckExact(s)) ? PyFloat_Type.tp_repr(s) :\
+        PyObject_Format(s, f))
 #else
-#define __Pyx_PyInt_AddCObj(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
 #endif
 
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
-/* ImportDottedModule.proto */
-static PyObject *__Pyx_ImportDottedModule(PyObject *name, PyObject *parts_tuple);
-#if PY_MAJOR_VERSION >= 3
-static PyObject *__Pyx_ImportDottedModule_WalkParts(PyObject *module, PyObject *name, PyObject *parts_tuple);
-#endif
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kw, const char* function_name, int kw_allowed);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* RaiseUnexpectedTypeError.proto */
+static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
 
 /* IncludeStructmemberH.proto */
 #include <structmember.h>
@@ -1901,6 +1949,42 @@ static PyObject *__Pyx_ImportDottedModule_WalkParts(PyObject *module, PyObject *
 static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type);
 #endif
 
+/* PyObjectCallNoArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* ValidateBasesTuple.proto */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases);
+#endif
+
+/* PyType_Ready.proto */
+CYTHON_UNUSED static int __Pyx_PyType_Ready(PyTypeObject *t);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetupReduce.proto */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_setup_reduce(PyObject* type_obj);
+#endif
+
 /* FetchSharedCythonModule.proto */
 static PyObject *__Pyx_FetchSharedCythonABIModule(void);
 
@@ -2041,39 +2125,6 @@ static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
                                       PyObject *module, PyObject *globals,
                                       PyObject* code);
 
-/* SetNameInClass.proto */
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && PY_VERSION_HEX < 0x030d0000
-#define __Pyx_SetNameInClass(ns, name, value)\
-    (likely(PyDict_CheckExact(ns)) ? _PyDict_SetItem_KnownHash(ns, name, value, ((PyASCIIObject *) name)->hash) : PyObject_SetItem(ns, name, value))
-#elif CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_SetNameInClass(ns, name, value)\
-    (likely(PyDict_CheckExact(ns)) ? PyDict_SetItem(ns, name, value) : PyObject_SetItem(ns, name, value))
-#else
-#define __Pyx_SetNameInClass(ns, name, value)  PyObject_SetItem(ns, name, value)
-#endif
-
-/* CalculateMetaclass.proto */
-static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases);
-
-/* PyObjectCall2Args.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
-
-/* PyObjectLookupSpecial.proto */
-#if CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-#define __Pyx_PyObject_LookupSpecialNoError(obj, attr_name)  __Pyx__PyObject_LookupSpecial(obj, attr_name, 0)
-#define __Pyx_PyObject_LookupSpecial(obj, attr_name)  __Pyx__PyObject_LookupSpecial(obj, attr_name, 1)
-static CYTHON_INLINE PyObject* __Pyx__PyObject_LookupSpecial(PyObject* obj, PyObject* attr_name, int with_error);
-#else
-#define __Pyx_PyObject_LookupSpecialNoError(o,n) __Pyx_PyObject_GetAttrStrNoError(o,n)
-#define __Pyx_PyObject_LookupSpecial(o,n) __Pyx_PyObject_GetAttrStr(o,n)
-#endif
-
-/* Py3ClassCreate.proto */
-static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name, PyObject *qualname,
-                                           PyObject *mkw, PyObject *modname, PyObject *doc);
-static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases, PyObject *dict,
-                                      PyObject *mkw, int calculate_metaclass, int allow_py2_metaclass);
-
 /* CLineInTraceback.proto */
 #ifdef CYTHON_CLINE_IN_TRACEBACK
 #define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
@@ -2102,6 +2153,17 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
 /* FormatTypeName.proto */
 #if CYTHON_COMPILING_IN_LIMITED_API
 typedef PyObject *__Pyx_TypeName;
@@ -2115,17 +2177,6 @@ typedef const char *__Pyx_TypeName;
 #define __Pyx_DECREF_TypeName(obj)
 #endif
 
-/* GCCDiagnostics.proto */
-#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
-#define __Pyx_HAS_GCC_DIAGNOSTIC
-#endif
-
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
-
-/* CIntFromPy.proto */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
-
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
@@ -2150,12 +2201,62 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 static unsigned long __Pyx_get_runtime_version(void);
 static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
 
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig);
+
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 /* #### Code section: module_declarations ### */
 
+/* Module declarations from "libc.math" */
+
+/* Module declarations from "cython" */
+
+/* Module declarations from "cpython.long" */
+
+/* Module declarations from "libc.limits" */
+
 /* Module declarations from "DualNum_c.Dual_c" */
+static int __pyx_v_9DualNum_c_6Dual_c__profiling;
+static int __pyx_v_9DualNum_c_6Dual_c__counting;
+static PyObject *__pyx_v_9DualNum_c_6Dual_c__profiler = 0;
+static Py_ssize_t __pyx_v_9DualNum_c_6Dual_c__constructed;
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_make_dual(double, double); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_as_dual(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_add(__pyx_t_9DualNum_c_6Dual_c_dual_t, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_add_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t, double); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sub(__pyx_t_9DualNum_c_6Dual_c_dual_t, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sub_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t, double); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_rsub_scalar(double, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_mul(__pyx_t_9DualNum_c_6Dual_c_dual_t, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_mul_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t, double); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_div(__pyx_t_9DualNum_c_6Dual_c_dual_t, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_div_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t, double); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_rdiv_scalar(double, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_pow(__pyx_t_9DualNum_c_6Dual_c_dual_t, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE double __pyx_f_9DualNum_c_6Dual_c_int_pow(double, long); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_pow_int(__pyx_t_9DualNum_c_6Dual_c_dual_t, long); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_pow_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t, double); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_rpow_scalar(double, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_9DualNum_c_6Dual_c_dual_eq(__pyx_t_9DualNum_c_6Dual_c_dual_t, __pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sin(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_cos(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_tan(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_exp(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_log(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sqrt(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sinh(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_cosh(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_tanh(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_asin(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_acos(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_atan(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static PyObject *__pyx_f_9DualNum_c_6Dual_c__profiled(PyObject *, PyObject *, PyObject *); /*proto*/
+static CYTHON_INLINE struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_f_9DualNum_c_6Dual_c__new(double, double); /*proto*/
+static CYTHON_INLINE struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_f_9DualNum_c_6Dual_c__box(__pyx_t_9DualNum_c_6Dual_c_dual_t); /*proto*/
+static struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_f_9DualNum_c_6Dual_c__pow_int(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *, long); /*proto*/
+static PyObject *__pyx_f_9DualNum_c_6Dual_c___pyx_unpickle_Dual_c__set_state(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *, PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "DualNum_c.Dual_c"
@@ -2164,65 +2265,79 @@ int __pyx_module_is_main_DualNum_c__Dual_c = 0;
 
 /* Implementation of "DualNum_c.Dual_c" */
 /* #### Code section: global_var ### */
-static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_ZeroDivisionError;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_NotImplemented;
 static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_ImportError;
 /* #### Code section: string_decls ### */
 static const char __pyx_k_x[] = "x";
-static const char __pyx_k__2[] = ")";
-static const char __pyx_k__4[] = "*";
+static const char __pyx_k__3[] = ")";
+static const char __pyx_k__4[] = ".";
 static const char __pyx_k_eq[] = "__eq__";
+static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k__36[] = "?";
 static const char __pyx_k_add[] = "__add__";
 static const char __pyx_k_cos[] = "cos";
-static const char __pyx_k_doc[] = "__doc__";
 static const char __pyx_k_exp[] = "exp";
 static const char __pyx_k_log[] = "log";
 static const char __pyx_k_mul[] = "__mul__";
+static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_pow[] = "__pow__";
 static const char __pyx_k_sin[] = "sin";
 static const char __pyx_k_sub[] = "__sub__";
 static const char __pyx_k_tan[] = "tan";
 static const char __pyx_k_acos[] = "acos";
+static const char __pyx_k_args[] = "args";
 static const char __pyx_k_asin[] = "asin";
 static const char __pyx_k_atan[] = "atan";
 static const char __pyx_k_cosh[] = "cosh";
 static const char __pyx_k_dict[] = "__dict__";
 static const char __pyx_k_dual[] = "dual";
 static const char __pyx_k_func[] = "func";
-static const char __pyx_k_init[] = "__init__";
 static const char __pyx_k_main[] = "__main__";
-static const char __pyx_k_math[] = "math";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_radd[] = "__radd__";
 static const char __pyx_k_real[] = "real";
-static const char __pyx_k_repr[] = "__repr__";
 static const char __pyx_k_rmul[] = "__rmul__";
+static const char __pyx_k_rpow[] = "__rpow__";
 static const char __pyx_k_rsub[] = "__rsub__";
 static const char __pyx_k_self[] = "self";
 static const char __pyx_k_sinh[] = "sinh";
-static const char __pyx_k_spec[] = "__spec__";
 static const char __pyx_k_sqrt[] = "sqrt";
 static const char __pyx_k_tanh[] = "tanh";
 static const char __pyx_k_test[] = "__test__";
-static const char __pyx_k_other[] = "other";
-static const char __pyx_k_super[] = "super";
+static const char __pyx_k_time[] = "time";
+static const char __pyx_k_state[] = "state";
+static const char __pyx_k_types[] = "types";
+static const char __pyx_k_ufunc[] = "ufunc";
 static const char __pyx_k_Dual_c[] = "Dual_c";
+static const char __pyx_k_dict_2[] = "_dict";
 static const char __pyx_k_dual_2[] = ", dual=";
-static const char __pyx_k_format[] = "format";
+static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_import[] = "__import__";
-static const char __pyx_k_module[] = "__module__";
+static const char __pyx_k_inputs[] = "inputs";
+static const char __pyx_k_kwargs[] = "kwargs";
+static const char __pyx_k_method[] = "method";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_record[] = "_record";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_disable[] = "disable";
 static const char __pyx_k_instead[] = " instead.";
-static const char __pyx_k_prepare[] = "__prepare__";
 static const char __pyx_k_truediv[] = "__truediv__";
 static const char __pyx_k_get_dual[] = "get_dual";
 static const char __pyx_k_get_real[] = "get_real";
-static const char __pyx_k_qualname[] = "__qualname__";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_profiler[] = "profiler";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_rtruediv[] = "__rtruediv__";
-static const char __pyx_k_set_name[] = "__set_name__";
+static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_Dual_real[] = "Dual(real=";
 static const char __pyx_k_TypeError[] = "TypeError";
-static const char __pyx_k_metaclass[] = "__metaclass__";
+static const char __pyx_k_isenabled[] = "isenabled";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_Dual_c_cos[] = "Dual_c.cos";
 static const char __pyx_k_Dual_c_exp[] = "Dual_c.exp";
 static const char __pyx_k_Dual_c_log[] = "Dual_c.log";
@@ -2230,7 +2345,7 @@ static const char __pyx_k_Dual_c_sin[] = "Dual_c.sin";
 static const char __pyx_k_Dual_c_tan[] = "Dual_c.tan";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_dual_class[] = "dual_class";
-static const char __pyx_k_Dual_c___eq[] = "Dual_c.__eq__";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_Dual_c_acos[] = "Dual_c.acos";
 static const char __pyx_k_Dual_c_asin[] = "Dual_c.asin";
 static const char __pyx_k_Dual_c_atan[] = "Dual_c.atan";
@@ -2238,68 +2353,83 @@ static const char __pyx_k_Dual_c_cosh[] = "Dual_c.cosh";
 static const char __pyx_k_Dual_c_sinh[] = "Dual_c.sinh";
 static const char __pyx_k_Dual_c_sqrt[] = "Dual_c.sqrt";
 static const char __pyx_k_Dual_c_tanh[] = "Dual_c.tanh";
-static const char __pyx_k_Dual_c___add[] = "Dual_c.__add__";
-static const char __pyx_k_Dual_c___mul[] = "Dual_c.__mul__";
-static const char __pyx_k_Dual_c___pow[] = "Dual_c.__pow__";
-static const char __pyx_k_Dual_c___sub[] = "Dual_c.__sub__";
-static const char __pyx_k_initializing[] = "_initializing";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_array_ufunc[] = "__array_ufunc__";
+static const char __pyx_k_DualNum_Dual[] = "DualNum.Dual";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
-static const char __pyx_k_Dual_c___init[] = "Dual_c.__init__";
-static const char __pyx_k_Dual_c___radd[] = "Dual_c.__radd__";
-static const char __pyx_k_Dual_c___repr[] = "Dual_c.__repr__";
-static const char __pyx_k_Dual_c___rmul[] = "Dual_c.__rmul__";
-static const char __pyx_k_Dual_c___rsub[] = "Dual_c.__rsub__";
-static const char __pyx_k_init_subclass[] = "__init_subclass__";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_set_profiler[] = "_set_profiler";
+static const char __pyx_k_stringsource[] = "<stringsource>";
+static const char __pyx_k_use_setstate[] = "use_setstate";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_NotImplemented[] = "NotImplemented";
+static const char __pyx_k_array_function[] = "__array_function__";
 static const char __pyx_k_Dual_c_get_dual[] = "Dual_c.get_dual";
 static const char __pyx_k_Dual_c_get_real[] = "Dual_c.get_real";
+static const char __pyx_k_perf_counter_ns[] = "perf_counter_ns";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_DualNum_c_Dual_c[] = "DualNum_c.Dual_c";
-static const char __pyx_k_Dual_c___truediv[] = "Dual_c.__truediv__";
-static const char __pyx_k_Dual_c___rtruediv[] = "Dual_c.__rtruediv__";
 static const char __pyx_k_ZeroDivisionError[] = "ZeroDivisionError";
+static const char __pyx_k_math_domain_error[] = "math domain error";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_compute_derivative[] = "compute_derivative";
+static const char __pyx_k_scalar_array_ufunc[] = "_scalar_array_ufunc";
+static const char __pyx_k_pyx_unpickle_Dual_c[] = "__pyx_unpickle_Dual_c";
 static const char __pyx_k_DualNum_c_Dual_c_pyx[] = "DualNum_c/Dual_c.pyx";
-static const char __pyx_k_compute_derivative_line_282[] = "compute_derivative (line 282)";
+static const char __pyx_k_Dual_c___array_ufunc[] = "Dual_c.__array_ufunc__";
+static const char __pyx_k_scalar_array_function[] = "_scalar_array_function";
+static const char __pyx_k_Dual_c___reduce_cython[] = "Dual_c.__reduce_cython__";
+static const char __pyx_k_Dual_c___array_function[] = "Dual_c.__array_function__";
+static const char __pyx_k_Dual_c___setstate_cython[] = "Dual_c.__setstate_cython__";
+static const char __pyx_k_compute_derivative_line_543[] = "compute_derivative (line 543)";
 static const char __pyx_k_division_by_zero_is_undefined[] = "division by zero is undefined";
-static const char __pyx_k_A_class_to_represent_a_dual_num[] = "\n    A class to represent a dual number for use in automatic differentiation.\n    \n    Attributes\n    ----------\n    real : float\n        The real part of the dual number.\n        \n    dual : float\n        The dual part of the dual number.\n\n    Examples\n    --------\n    >>> x = Dual_c(2, 1)\n    >>> y = Dual_c(3, 0)\n    >>> z = x.sin() + y.log()\n    >>> z\n    Dual(real=2.0079097154937915, dual=-0.4161468365471424)\n    ";
-static const char __pyx_k_Computes_the_derivative_of_a_fu[] = "\n    Computes the derivative of a function at a given point using dual numbers.\n\n    Parameters\n    ----------\n    func : function\n        The function to compute the derivative of.\n    \n    x : float\n        The point at which to compute the derivative.\n    \n    dual_class : Dual or Dual_c\n        The class to use for dual numbers.\n\n    Returns\n    -------\n    float\n        The derivative of the function at the given point.\n\n    Examples\n    --------\n    >>> def f(x):\n    ...     return x ** 2\n    >>> compute_derivative(f, 2, Dual_c)\n    4.0\n    ";
+static const char __pyx_k_Computes_the_derivative_of_a_fu[] = "\n    Computes the derivative of a function at a given point using dual numbers.\n\n    Parameters\n    ----------\n    func : function\n        The function to compute the derivative of.\n\n    x : float\n        The point at which to compute the derivative.\n\n    dual_class : Dual or Dual_c\n        The class to use for dual numbers.\n\n    Returns\n    -------\n    float\n        The derivative of the function at the given point.\n\n    Examples\n    --------\n    >>> def f(x):\n    ...     return x ** 2\n    >>> compute_derivative(f, 2, Dual)\n    4.0\n    ";
 static const char __pyx_k_Expected_dual_to_be_of_type_floa[] = "Expected 'dual' to be of type float or int, got ";
 static const char __pyx_k_Expected_real_to_be_of_type_floa[] = "Expected 'real' to be of type float or int, got ";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))";
 static const char __pyx_k_Logarithm_of_a_non_positive_numb[] = "Logarithm of a non-positive number is undefined.";
-static const char __pyx_k_unsupported_operand_type_s_for_a[] = "unsupported operand type(s) for +: '{}' and '{}'";
-static const char __pyx_k_unsupported_operand_type_s_for_a_2[] = "unsupported operand type(s) for -: '{}' and '{}'";
-static const char __pyx_k_unsupported_operand_type_s_for_a_3[] = "unsupported operand type(s) for *: '{}' and '{}'";
-static const char __pyx_k_unsupported_operand_type_s_for_a_4[] = "unsupported operand type(s) for /: '{}' and '{}'";
-static const char __pyx_k_unsupported_operand_type_s_for_a_5[] = "unsupported operand type(s) for **: '{}' and '{}'";
 /* #### Code section: decls ### */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_real, PyObject *__pyx_v_dual); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_2__add__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4__radd__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_6__sub__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_8__rsub__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_10__mul__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_12__rmul__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_14__truediv__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_18__pow__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_20__eq__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_22__repr__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_24get_real(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_26get_dual(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28sin(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_30cos(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32tan(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_34exp(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_36log(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_38sqrt(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40sinh(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42cosh(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_44tanh(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_46asin(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_48acos(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_50atan(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_compute_derivative(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_func, PyObject *__pyx_v_x, PyObject *__pyx_v_dual_class); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c__set_profiler(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_profiler); /* proto */
+static int __pyx_pf_9DualNum_c_6Dual_c_6Dual_c___init__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_real, PyObject *__pyx_v_dual); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_2__add__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4__radd__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_6__sub__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_8__rsub__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_10__mul__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_12__rmul__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_14__truediv__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_18__pow__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other, CYTHON_UNUSED PyObject *__pyx_v_modulo); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_20__rpow__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other, CYTHON_UNUSED PyObject *__pyx_v_modulo); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_22__eq__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_24__ne__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_26__repr__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28__array_ufunc__(CYTHON_UNUSED struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_ufunc, PyObject *__pyx_v_method, PyObject *__pyx_v_inputs, PyObject *__pyx_v_kwargs); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_30__array_function__(CYTHON_UNUSED struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_func, CYTHON_UNUSED PyObject *__pyx_v_types, PyObject *__pyx_v_args, PyObject *__pyx_v_kwargs); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32get_real(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_34get_dual(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_36sin(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_38cos(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40tan(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42exp(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_44log(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_46sqrt(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_48sinh(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_50cosh(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_52tanh(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_54asin(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_56acos(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_58atan(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4real___get__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4dual___get__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_60__reduce_cython__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_62__setstate_cython__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_2compute_derivative(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_func, PyObject *__pyx_v_x, PyObject *__pyx_v_dual_class); /* proto */
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_4__pyx_unpickle_Dual_c(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_9DualNum_c_6Dual_c_Dual_c(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
 typedef struct {
@@ -2329,23 +2459,26 @@ typedef struct {
   #endif
   #if CYTHON_USE_MODULE_STATE
   #endif
-  PyObject *__pyx_kp_s_A_class_to_represent_a_dual_num;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  PyObject *__pyx_type_9DualNum_c_6Dual_c_Dual_c;
+  #endif
+  PyTypeObject *__pyx_ptype_9DualNum_c_6Dual_c_Dual_c;
   PyObject *__pyx_kp_u_Computes_the_derivative_of_a_fu;
+  PyObject *__pyx_n_s_DualNum_Dual;
   PyObject *__pyx_n_s_DualNum_c_Dual_c;
   PyObject *__pyx_kp_s_DualNum_c_Dual_c_pyx;
   PyObject *__pyx_n_s_Dual_c;
-  PyObject *__pyx_n_s_Dual_c___add;
-  PyObject *__pyx_n_s_Dual_c___eq;
-  PyObject *__pyx_n_s_Dual_c___init;
-  PyObject *__pyx_n_s_Dual_c___mul;
-  PyObject *__pyx_n_s_Dual_c___pow;
-  PyObject *__pyx_n_s_Dual_c___radd;
-  PyObject *__pyx_n_s_Dual_c___repr;
-  PyObject *__pyx_n_s_Dual_c___rmul;
-  PyObject *__pyx_n_s_Dual_c___rsub;
-  PyObject *__pyx_n_s_Dual_c___rtruediv;
-  PyObject *__pyx_n_s_Dual_c___sub;
-  PyObject *__pyx_n_s_Dual_c___truediv;
+  PyObject *__pyx_n_u_Dual_c;
+  PyObject *__pyx_n_s_Dual_c___array_function;
+  PyObject *__pyx_n_s_Dual_c___array_ufunc;
+  PyObject *__pyx_n_s_Dual_c___reduce_cython;
+  PyObject *__pyx_n_s_Dual_c___setstate_cython;
   PyObject *__pyx_n_s_Dual_c_acos;
   PyObject *__pyx_n_s_Dual_c_asin;
   PyObject *__pyx_n_s_Dual_c_atan;
@@ -2363,96 +2496,146 @@ typedef struct {
   PyObject *__pyx_kp_u_Dual_real;
   PyObject *__pyx_kp_u_Expected_dual_to_be_of_type_floa;
   PyObject *__pyx_kp_u_Expected_real_to_be_of_type_floa;
+  PyObject *__pyx_n_s_ImportError;
+  PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
   PyObject *__pyx_kp_u_Logarithm_of_a_non_positive_numb;
+  PyObject *__pyx_n_s_NotImplemented;
+  PyObject *__pyx_n_s_PickleError;
   PyObject *__pyx_n_s_TypeError;
   PyObject *__pyx_n_s_ValueError;
   PyObject *__pyx_n_s_ZeroDivisionError;
-  PyObject *__pyx_kp_u__2;
+  PyObject *__pyx_kp_u__3;
   PyObject *__pyx_n_s__36;
-  PyObject *__pyx_n_s__4;
+  PyObject *__pyx_kp_u__4;
   PyObject *__pyx_n_s_acos;
+  PyObject *__pyx_n_u_acos;
   PyObject *__pyx_n_s_add;
+  PyObject *__pyx_n_u_add;
+  PyObject *__pyx_n_s_args;
+  PyObject *__pyx_n_s_array_function;
+  PyObject *__pyx_n_s_array_ufunc;
   PyObject *__pyx_n_s_asin;
+  PyObject *__pyx_n_u_asin;
   PyObject *__pyx_n_s_asyncio_coroutines;
   PyObject *__pyx_n_s_atan;
+  PyObject *__pyx_n_u_atan;
   PyObject *__pyx_n_s_cline_in_traceback;
   PyObject *__pyx_n_s_compute_derivative;
-  PyObject *__pyx_kp_u_compute_derivative_line_282;
+  PyObject *__pyx_kp_u_compute_derivative_line_543;
   PyObject *__pyx_n_s_cos;
+  PyObject *__pyx_n_u_cos;
   PyObject *__pyx_n_s_cosh;
+  PyObject *__pyx_n_u_cosh;
   PyObject *__pyx_n_s_dict;
+  PyObject *__pyx_n_s_dict_2;
+  PyObject *__pyx_kp_u_disable;
   PyObject *__pyx_kp_u_division_by_zero_is_undefined;
-  PyObject *__pyx_n_s_doc;
   PyObject *__pyx_n_s_dual;
   PyObject *__pyx_kp_u_dual_2;
   PyObject *__pyx_n_s_dual_class;
+  PyObject *__pyx_kp_u_enable;
   PyObject *__pyx_n_s_eq;
   PyObject *__pyx_n_s_exp;
-  PyObject *__pyx_n_s_format;
+  PyObject *__pyx_n_u_exp;
   PyObject *__pyx_n_s_func;
+  PyObject *__pyx_kp_u_gc;
   PyObject *__pyx_n_s_get_dual;
   PyObject *__pyx_n_s_get_real;
+  PyObject *__pyx_n_s_getstate;
   PyObject *__pyx_n_s_import;
-  PyObject *__pyx_n_s_init;
-  PyObject *__pyx_n_s_init_subclass;
-  PyObject *__pyx_n_s_initializing;
+  PyObject *__pyx_n_s_inputs;
   PyObject *__pyx_kp_u_instead;
   PyObject *__pyx_n_s_is_coroutine;
+  PyObject *__pyx_kp_u_isenabled;
+  PyObject *__pyx_n_s_kwargs;
   PyObject *__pyx_n_s_log;
+  PyObject *__pyx_n_u_log;
   PyObject *__pyx_n_s_main;
-  PyObject *__pyx_n_s_math;
-  PyObject *__pyx_n_s_metaclass;
-  PyObject *__pyx_n_s_module;
+  PyObject *__pyx_kp_u_math_domain_error;
+  PyObject *__pyx_n_s_method;
   PyObject *__pyx_n_s_mul;
+  PyObject *__pyx_n_u_mul;
   PyObject *__pyx_n_s_name;
-  PyObject *__pyx_n_s_other;
+  PyObject *__pyx_n_s_new;
+  PyObject *__pyx_n_s_perf_counter_ns;
+  PyObject *__pyx_n_s_pickle;
   PyObject *__pyx_n_s_pow;
-  PyObject *__pyx_n_s_prepare;
-  PyObject *__pyx_n_s_qualname;
+  PyObject *__pyx_n_u_pow;
+  PyObject *__pyx_n_s_profiler;
+  PyObject *__pyx_n_s_pyx_PickleError;
+  PyObject *__pyx_n_s_pyx_checksum;
+  PyObject *__pyx_n_s_pyx_result;
+  PyObject *__pyx_n_s_pyx_state;
+  PyObject *__pyx_n_s_pyx_type;
+  PyObject *__pyx_n_s_pyx_unpickle_Dual_c;
   PyObject *__pyx_n_s_radd;
+  PyObject *__pyx_n_u_radd;
   PyObject *__pyx_n_s_real;
-  PyObject *__pyx_n_s_repr;
+  PyObject *__pyx_n_s_record;
+  PyObject *__pyx_n_s_reduce;
+  PyObject *__pyx_n_s_reduce_cython;
+  PyObject *__pyx_n_s_reduce_ex;
   PyObject *__pyx_n_s_rmul;
+  PyObject *__pyx_n_u_rmul;
+  PyObject *__pyx_n_s_rpow;
+  PyObject *__pyx_n_u_rpow;
   PyObject *__pyx_n_s_rsub;
+  PyObject *__pyx_n_u_rsub;
   PyObject *__pyx_n_s_rtruediv;
+  PyObject *__pyx_n_u_rtruediv;
+  PyObject *__pyx_n_s_scalar_array_function;
+  PyObject *__pyx_n_s_scalar_array_ufunc;
   PyObject *__pyx_n_s_self;
-  PyObject *__pyx_n_s_set_name;
+  PyObject *__pyx_n_s_set_profiler;
+  PyObject *__pyx_n_s_setstate;
+  PyObject *__pyx_n_s_setstate_cython;
   PyObject *__pyx_n_s_sin;
+  PyObject *__pyx_n_u_sin;
   PyObject *__pyx_n_s_sinh;
-  PyObject *__pyx_n_s_spec;
+  PyObject *__pyx_n_u_sinh;
   PyObject *__pyx_n_s_sqrt;
+  PyObject *__pyx_n_u_sqrt;
+  PyObject *__pyx_n_s_state;
+  PyObject *__pyx_kp_s_stringsource;
   PyObject *__pyx_n_s_sub;
-  PyObject *__pyx_n_s_super;
+  PyObject *__pyx_n_u_sub;
   PyObject *__pyx_n_s_tan;
+  PyObject *__pyx_n_u_tan;
   PyObject *__pyx_n_s_tanh;
+  PyObject *__pyx_n_u_tanh;
   PyObject *__pyx_n_s_test;
+  PyObject *__pyx_n_s_time;
   PyObject *__pyx_n_s_truediv;
-  PyObject *__pyx_kp_u_unsupported_operand_type_s_for_a;
-  PyObject *__pyx_kp_u_unsupported_operand_type_s_for_a_2;
-  PyObject *__pyx_kp_u_unsupported_operand_type_s_for_a_3;
-  PyObject *__pyx_kp_u_unsupported_operand_type_s_for_a_4;
-  PyObject *__pyx_kp_u_unsupported_operand_type_s_for_a_5;
+  PyObject *__pyx_n_u_truediv;
+  PyObject *__pyx_n_s_types;
+  PyObject *__pyx_n_s_ufunc;
+  PyObject *__pyx_n_s_update;
+  PyObject *__pyx_n_s_use_setstate;
   PyObject *__pyx_n_s_x;
-  PyObject *__pyx_int_0;
   PyObject *__pyx_int_1;
-  PyObject *__pyx_int_2;
+  PyObject *__pyx_int_74701559;
+  PyObject *__pyx_int_142668208;
+  PyObject *__pyx_int_180996988;
   PyObject *__pyx_tuple_;
-  PyObject *__pyx_tuple__3;
+  PyObject *__pyx_tuple__2;
   PyObject *__pyx_tuple__5;
+  PyObject *__pyx_tuple__6;
   PyObject *__pyx_tuple__7;
-  PyObject *__pyx_tuple__18;
+  PyObject *__pyx_tuple__9;
+  PyObject *__pyx_tuple__11;
+  PyObject *__pyx_tuple__13;
+  PyObject *__pyx_tuple__28;
+  PyObject *__pyx_tuple__30;
+  PyObject *__pyx_tuple__32;
   PyObject *__pyx_tuple__34;
-  PyObject *__pyx_codeobj__6;
   PyObject *__pyx_codeobj__8;
-  PyObject *__pyx_codeobj__9;
   PyObject *__pyx_codeobj__10;
-  PyObject *__pyx_codeobj__11;
   PyObject *__pyx_codeobj__12;
-  PyObject *__pyx_codeobj__13;
   PyObject *__pyx_codeobj__14;
   PyObject *__pyx_codeobj__15;
   PyObject *__pyx_codeobj__16;
   PyObject *__pyx_codeobj__17;
+  PyObject *__pyx_codeobj__18;
   PyObject *__pyx_codeobj__19;
   PyObject *__pyx_codeobj__20;
   PyObject *__pyx_codeobj__21;
@@ -2462,11 +2645,8 @@ typedef struct {
   PyObject *__pyx_codeobj__25;
   PyObject *__pyx_codeobj__26;
   PyObject *__pyx_codeobj__27;
-  PyObject *__pyx_codeobj__28;
   PyObject *__pyx_codeobj__29;
-  PyObject *__pyx_codeobj__30;
   PyObject *__pyx_codeobj__31;
-  PyObject *__pyx_codeobj__32;
   PyObject *__pyx_codeobj__33;
   PyObject *__pyx_codeobj__35;
 } __pyx_mstate;
@@ -2511,23 +2691,18 @@ static int __pyx_m_clear(PyObject *m) {
   #ifdef __Pyx_FusedFunction_USED
   Py_CLEAR(clear_module_state->__pyx_FusedFunctionType);
   #endif
-  Py_CLEAR(clear_module_state->__pyx_kp_s_A_class_to_represent_a_dual_num);
+  Py_CLEAR(clear_module_state->__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+  Py_CLEAR(clear_module_state->__pyx_type_9DualNum_c_6Dual_c_Dual_c);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Computes_the_derivative_of_a_fu);
+  Py_CLEAR(clear_module_state->__pyx_n_s_DualNum_Dual);
   Py_CLEAR(clear_module_state->__pyx_n_s_DualNum_c_Dual_c);
   Py_CLEAR(clear_module_state->__pyx_kp_s_DualNum_c_Dual_c_pyx);
   Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___add);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___eq);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___init);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___mul);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___pow);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___radd);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___repr);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___rmul);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___rsub);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___rtruediv);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___sub);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___truediv);
+  Py_CLEAR(clear_module_state->__pyx_n_u_Dual_c);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___array_function);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___array_ufunc);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___reduce_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c___setstate_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c_acos);
   Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c_asin);
   Py_CLEAR(clear_module_state->__pyx_n_s_Dual_c_atan);
@@ -2545,96 +2720,146 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_u_Dual_real);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Expected_dual_to_be_of_type_floa);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Expected_real_to_be_of_type_floa);
+  Py_CLEAR(clear_module_state->__pyx_n_s_ImportError);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Logarithm_of_a_non_positive_numb);
+  Py_CLEAR(clear_module_state->__pyx_n_s_NotImplemented);
+  Py_CLEAR(clear_module_state->__pyx_n_s_PickleError);
   Py_CLEAR(clear_module_state->__pyx_n_s_TypeError);
   Py_CLEAR(clear_module_state->__pyx_n_s_ValueError);
   Py_CLEAR(clear_module_state->__pyx_n_s_ZeroDivisionError);
-  Py_CLEAR(clear_module_state->__pyx_kp_u__2);
+  Py_CLEAR(clear_module_state->__pyx_kp_u__3);
   Py_CLEAR(clear_module_state->__pyx_n_s__36);
-  Py_CLEAR(clear_module_state->__pyx_n_s__4);
+  Py_CLEAR(clear_module_state->__pyx_kp_u__4);
   Py_CLEAR(clear_module_state->__pyx_n_s_acos);
+  Py_CLEAR(clear_module_state->__pyx_n_u_acos);
   Py_CLEAR(clear_module_state->__pyx_n_s_add);
+  Py_CLEAR(clear_module_state->__pyx_n_u_add);
+  Py_CLEAR(clear_module_state->__pyx_n_s_args);
+  Py_CLEAR(clear_module_state->__pyx_n_s_array_function);
+  Py_CLEAR(clear_module_state->__pyx_n_s_array_ufunc);
   Py_CLEAR(clear_module_state->__pyx_n_s_asin);
+  Py_CLEAR(clear_module_state->__pyx_n_u_asin);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
   Py_CLEAR(clear_module_state->__pyx_n_s_atan);
+  Py_CLEAR(clear_module_state->__pyx_n_u_atan);
   Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
   Py_CLEAR(clear_module_state->__pyx_n_s_compute_derivative);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_compute_derivative_line_282);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_compute_derivative_line_543);
   Py_CLEAR(clear_module_state->__pyx_n_s_cos);
+  Py_CLEAR(clear_module_state->__pyx_n_u_cos);
   Py_CLEAR(clear_module_state->__pyx_n_s_cosh);
+  Py_CLEAR(clear_module_state->__pyx_n_u_cosh);
   Py_CLEAR(clear_module_state->__pyx_n_s_dict);
+  Py_CLEAR(clear_module_state->__pyx_n_s_dict_2);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_disable);
   Py_CLEAR(clear_module_state->__pyx_kp_u_division_by_zero_is_undefined);
-  Py_CLEAR(clear_module_state->__pyx_n_s_doc);
   Py_CLEAR(clear_module_state->__pyx_n_s_dual);
   Py_CLEAR(clear_module_state->__pyx_kp_u_dual_2);
   Py_CLEAR(clear_module_state->__pyx_n_s_dual_class);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_enable);
   Py_CLEAR(clear_module_state->__pyx_n_s_eq);
   Py_CLEAR(clear_module_state->__pyx_n_s_exp);
-  Py_CLEAR(clear_module_state->__pyx_n_s_format);
+  Py_CLEAR(clear_module_state->__pyx_n_u_exp);
   Py_CLEAR(clear_module_state->__pyx_n_s_func);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_gc);
   Py_CLEAR(clear_module_state->__pyx_n_s_get_dual);
   Py_CLEAR(clear_module_state->__pyx_n_s_get_real);
+  Py_CLEAR(clear_module_state->__pyx_n_s_getstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_import);
-  Py_CLEAR(clear_module_state->__pyx_n_s_init);
-  Py_CLEAR(clear_module_state->__pyx_n_s_init_subclass);
-  Py_CLEAR(clear_module_state->__pyx_n_s_initializing);
+  Py_CLEAR(clear_module_state->__pyx_n_s_inputs);
   Py_CLEAR(clear_module_state->__pyx_kp_u_instead);
   Py_CLEAR(clear_module_state->__pyx_n_s_is_coroutine);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_isenabled);
+  Py_CLEAR(clear_module_state->__pyx_n_s_kwargs);
   Py_CLEAR(clear_module_state->__pyx_n_s_log);
+  Py_CLEAR(clear_module_state->__pyx_n_u_log);
   Py_CLEAR(clear_module_state->__pyx_n_s_main);
-  Py_CLEAR(clear_module_state->__pyx_n_s_math);
-  Py_CLEAR(clear_module_state->__pyx_n_s_metaclass);
-  Py_CLEAR(clear_module_state->__pyx_n_s_module);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_math_domain_error);
+  Py_CLEAR(clear_module_state->__pyx_n_s_method);
   Py_CLEAR(clear_module_state->__pyx_n_s_mul);
+  Py_CLEAR(clear_module_state->__pyx_n_u_mul);
   Py_CLEAR(clear_module_state->__pyx_n_s_name);
-  Py_CLEAR(clear_module_state->__pyx_n_s_other);
+  Py_CLEAR(clear_module_state->__pyx_n_s_new);
+  Py_CLEAR(clear_module_state->__pyx_n_s_perf_counter_ns);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pickle);
   Py_CLEAR(clear_module_state->__pyx_n_s_pow);
-  Py_CLEAR(clear_module_state->__pyx_n_s_prepare);
-  Py_CLEAR(clear_module_state->__pyx_n_s_qualname);
+  Py_CLEAR(clear_module_state->__pyx_n_u_pow);
+  Py_CLEAR(clear_module_state->__pyx_n_s_profiler);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_PickleError);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_checksum);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_result);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_state);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_type);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_unpickle_Dual_c);
   Py_CLEAR(clear_module_state->__pyx_n_s_radd);
+  Py_CLEAR(clear_module_state->__pyx_n_u_radd);
   Py_CLEAR(clear_module_state->__pyx_n_s_real);
-  Py_CLEAR(clear_module_state->__pyx_n_s_repr);
+  Py_CLEAR(clear_module_state->__pyx_n_s_record);
+  Py_CLEAR(clear_module_state->__pyx_n_s_reduce);
+  Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
   Py_CLEAR(clear_module_state->__pyx_n_s_rmul);
+  Py_CLEAR(clear_module_state->__pyx_n_u_rmul);
+  Py_CLEAR(clear_module_state->__pyx_n_s_rpow);
+  Py_CLEAR(clear_module_state->__pyx_n_u_rpow);
   Py_CLEAR(clear_module_state->__pyx_n_s_rsub);
+  Py_CLEAR(clear_module_state->__pyx_n_u_rsub);
   Py_CLEAR(clear_module_state->__pyx_n_s_rtruediv);
+  Py_CLEAR(clear_module_state->__pyx_n_u_rtruediv);
+  Py_CLEAR(clear_module_state->__pyx_n_s_scalar_array_function);
+  Py_CLEAR(clear_module_state->__pyx_n_s_scalar_array_ufunc);
   Py_CLEAR(clear_module_state->__pyx_n_s_self);
-  Py_CLEAR(clear_module_state->__pyx_n_s_set_name);
+  Py_CLEAR(clear_module_state->__pyx_n_s_set_profiler);
+  Py_CLEAR(clear_module_state->__pyx_n_s_setstate);
+  Py_CLEAR(clear_module_state->__pyx_n_s_setstate_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_sin);
+  Py_CLEAR(clear_module_state->__pyx_n_u_sin);
   Py_CLEAR(clear_module_state->__pyx_n_s_sinh);
-  Py_CLEAR(clear_module_state->__pyx_n_s_spec);
+  Py_CLEAR(clear_module_state->__pyx_n_u_sinh);
   Py_CLEAR(clear_module_state->__pyx_n_s_sqrt);
+  Py_CLEAR(clear_module_state->__pyx_n_u_sqrt);
+  Py_CLEAR(clear_module_state->__pyx_n_s_state);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_stringsource);
   Py_CLEAR(clear_module_state->__pyx_n_s_sub);
-  Py_CLEAR(clear_module_state->__pyx_n_s_super);
+  Py_CLEAR(clear_module_state->__pyx_n_u_sub);
   Py_CLEAR(clear_module_state->__pyx_n_s_tan);
+  Py_CLEAR(clear_module_state->__pyx_n_u_tan);
   Py_CLEAR(clear_module_state->__pyx_n_s_tanh);
+  Py_CLEAR(clear_module_state->__pyx_n_u_tanh);
   Py_CLEAR(clear_module_state->__pyx_n_s_test);
+  Py_CLEAR(clear_module_state->__pyx_n_s_time);
   Py_CLEAR(clear_module_state->__pyx_n_s_truediv);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_2);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_3);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_4);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_5);
+  Py_CLEAR(clear_module_state->__pyx_n_u_truediv);
+  Py_CLEAR(clear_module_state->__pyx_n_s_types);
+  Py_CLEAR(clear_module_state->__pyx_n_s_ufunc);
+  Py_CLEAR(clear_module_state->__pyx_n_s_update);
+  Py_CLEAR(clear_module_state->__pyx_n_s_use_setstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_x);
-  Py_CLEAR(clear_module_state->__pyx_int_0);
   Py_CLEAR(clear_module_state->__pyx_int_1);
-  Py_CLEAR(clear_module_state->__pyx_int_2);
+  Py_CLEAR(clear_module_state->__pyx_int_74701559);
+  Py_CLEAR(clear_module_state->__pyx_int_142668208);
+  Py_CLEAR(clear_module_state->__pyx_int_180996988);
   Py_CLEAR(clear_module_state->__pyx_tuple_);
-  Py_CLEAR(clear_module_state->__pyx_tuple__3);
+  Py_CLEAR(clear_module_state->__pyx_tuple__2);
   Py_CLEAR(clear_module_state->__pyx_tuple__5);
+  Py_CLEAR(clear_module_state->__pyx_tuple__6);
   Py_CLEAR(clear_module_state->__pyx_tuple__7);
-  Py_CLEAR(clear_module_state->__pyx_tuple__18);
+  Py_CLEAR(clear_module_state->__pyx_tuple__9);
+  Py_CLEAR(clear_module_state->__pyx_tuple__11);
+  Py_CLEAR(clear_module_state->__pyx_tuple__13);
+  Py_CLEAR(clear_module_state->__pyx_tuple__28);
+  Py_CLEAR(clear_module_state->__pyx_tuple__30);
+  Py_CLEAR(clear_module_state->__pyx_tuple__32);
   Py_CLEAR(clear_module_state->__pyx_tuple__34);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__6);
   Py_CLEAR(clear_module_state->__pyx_codeobj__8);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__9);
   Py_CLEAR(clear_module_state->__pyx_codeobj__10);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__11);
   Py_CLEAR(clear_module_state->__pyx_codeobj__12);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__13);
   Py_CLEAR(clear_module_state->__pyx_codeobj__14);
   Py_CLEAR(clear_module_state->__pyx_codeobj__15);
   Py_CLEAR(clear_module_state->__pyx_codeobj__16);
   Py_CLEAR(clear_module_state->__pyx_codeobj__17);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__18);
   Py_CLEAR(clear_module_state->__pyx_codeobj__19);
   Py_CLEAR(clear_module_state->__pyx_codeobj__20);
   Py_CLEAR(clear_module_state->__pyx_codeobj__21);
@@ -2644,11 +2869,8 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_codeobj__25);
   Py_CLEAR(clear_module_state->__pyx_codeobj__26);
   Py_CLEAR(clear_module_state->__pyx_codeobj__27);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__28);
   Py_CLEAR(clear_module_state->__pyx_codeobj__29);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__30);
   Py_CLEAR(clear_module_state->__pyx_codeobj__31);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__32);
   Py_CLEAR(clear_module_state->__pyx_codeobj__33);
   Py_CLEAR(clear_module_state->__pyx_codeobj__35);
   return 0;
@@ -2671,23 +2893,18 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   #ifdef __Pyx_FusedFunction_USED
   Py_VISIT(traverse_module_state->__pyx_FusedFunctionType);
   #endif
-  Py_VISIT(traverse_module_state->__pyx_kp_s_A_class_to_represent_a_dual_num);
+  Py_VISIT(traverse_module_state->__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+  Py_VISIT(traverse_module_state->__pyx_type_9DualNum_c_6Dual_c_Dual_c);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Computes_the_derivative_of_a_fu);
+  Py_VISIT(traverse_module_state->__pyx_n_s_DualNum_Dual);
   Py_VISIT(traverse_module_state->__pyx_n_s_DualNum_c_Dual_c);
   Py_VISIT(traverse_module_state->__pyx_kp_s_DualNum_c_Dual_c_pyx);
   Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___add);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___eq);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___init);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___mul);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___pow);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___radd);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___repr);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___rmul);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___rsub);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___rtruediv);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___sub);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___truediv);
+  Py_VISIT(traverse_module_state->__pyx_n_u_Dual_c);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___array_function);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___array_ufunc);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___reduce_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c___setstate_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c_acos);
   Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c_asin);
   Py_VISIT(traverse_module_state->__pyx_n_s_Dual_c_atan);
@@ -2705,96 +2922,146 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_u_Dual_real);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Expected_dual_to_be_of_type_floa);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Expected_real_to_be_of_type_floa);
+  Py_VISIT(traverse_module_state->__pyx_n_s_ImportError);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Logarithm_of_a_non_positive_numb);
+  Py_VISIT(traverse_module_state->__pyx_n_s_NotImplemented);
+  Py_VISIT(traverse_module_state->__pyx_n_s_PickleError);
   Py_VISIT(traverse_module_state->__pyx_n_s_TypeError);
   Py_VISIT(traverse_module_state->__pyx_n_s_ValueError);
   Py_VISIT(traverse_module_state->__pyx_n_s_ZeroDivisionError);
-  Py_VISIT(traverse_module_state->__pyx_kp_u__2);
+  Py_VISIT(traverse_module_state->__pyx_kp_u__3);
   Py_VISIT(traverse_module_state->__pyx_n_s__36);
-  Py_VISIT(traverse_module_state->__pyx_n_s__4);
+  Py_VISIT(traverse_module_state->__pyx_kp_u__4);
   Py_VISIT(traverse_module_state->__pyx_n_s_acos);
+  Py_VISIT(traverse_module_state->__pyx_n_u_acos);
   Py_VISIT(traverse_module_state->__pyx_n_s_add);
+  Py_VISIT(traverse_module_state->__pyx_n_u_add);
+  Py_VISIT(traverse_module_state->__pyx_n_s_args);
+  Py_VISIT(traverse_module_state->__pyx_n_s_array_function);
+  Py_VISIT(traverse_module_state->__pyx_n_s_array_ufunc);
   Py_VISIT(traverse_module_state->__pyx_n_s_asin);
+  Py_VISIT(traverse_module_state->__pyx_n_u_asin);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
   Py_VISIT(traverse_module_state->__pyx_n_s_atan);
+  Py_VISIT(traverse_module_state->__pyx_n_u_atan);
   Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
   Py_VISIT(traverse_module_state->__pyx_n_s_compute_derivative);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_compute_derivative_line_282);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_compute_derivative_line_543);
   Py_VISIT(traverse_module_state->__pyx_n_s_cos);
+  Py_VISIT(traverse_module_state->__pyx_n_u_cos);
   Py_VISIT(traverse_module_state->__pyx_n_s_cosh);
+  Py_VISIT(traverse_module_state->__pyx_n_u_cosh);
   Py_VISIT(traverse_module_state->__pyx_n_s_dict);
+  Py_VISIT(traverse_module_state->__pyx_n_s_dict_2);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_disable);
   Py_VISIT(traverse_module_state->__pyx_kp_u_division_by_zero_is_undefined);
-  Py_VISIT(traverse_module_state->__pyx_n_s_doc);
   Py_VISIT(traverse_module_state->__pyx_n_s_dual);
   Py_VISIT(traverse_module_state->__pyx_kp_u_dual_2);
   Py_VISIT(traverse_module_state->__pyx_n_s_dual_class);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_enable);
   Py_VISIT(traverse_module_state->__pyx_n_s_eq);
   Py_VISIT(traverse_module_state->__pyx_n_s_exp);
-  Py_VISIT(traverse_module_state->__pyx_n_s_format);
+  Py_VISIT(traverse_module_state->__pyx_n_u_exp);
   Py_VISIT(traverse_module_state->__pyx_n_s_func);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_gc);
   Py_VISIT(traverse_module_state->__pyx_n_s_get_dual);
   Py_VISIT(traverse_module_state->__pyx_n_s_get_real);
+  Py_VISIT(traverse_module_state->__pyx_n_s_getstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_import);
-  Py_VISIT(traverse_module_state->__pyx_n_s_init);
-  Py_VISIT(traverse_module_state->__pyx_n_s_init_subclass);
-  Py_VISIT(traverse_module_state->__pyx_n_s_initializing);
+  Py_VISIT(traverse_module_state->__pyx_n_s_inputs);
   Py_VISIT(traverse_module_state->__pyx_kp_u_instead);
   Py_VISIT(traverse_module_state->__pyx_n_s_is_coroutine);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_isenabled);
+  Py_VISIT(traverse_module_state->__pyx_n_s_kwargs);
   Py_VISIT(traverse_module_state->__pyx_n_s_log);
+  Py_VISIT(traverse_module_state->__pyx_n_u_log);
   Py_VISIT(traverse_module_state->__pyx_n_s_main);
-  Py_VISIT(traverse_module_state->__pyx_n_s_math);
-  Py_VISIT(traverse_module_state->__pyx_n_s_metaclass);
-  Py_VISIT(traverse_module_state->__pyx_n_s_module);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_math_domain_error);
+  Py_VISIT(traverse_module_state->__pyx_n_s_method);
   Py_VISIT(traverse_module_state->__pyx_n_s_mul);
+  Py_VISIT(traverse_module_state->__pyx_n_u_mul);
   Py_VISIT(traverse_module_state->__pyx_n_s_name);
-  Py_VISIT(traverse_module_state->__pyx_n_s_other);
+  Py_VISIT(traverse_module_state->__pyx_n_s_new);
+  Py_VISIT(traverse_module_state->__pyx_n_s_perf_counter_ns);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pickle);
   Py_VISIT(traverse_module_state->__pyx_n_s_pow);
-  Py_VISIT(traverse_module_state->__pyx_n_s_prepare);
-  Py_VISIT(traverse_module_state->__pyx_n_s_qualname);
+  Py_VISIT(traverse_module_state->__pyx_n_u_pow);
+  Py_VISIT(traverse_module_state->__pyx_n_s_profiler);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_PickleError);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_checksum);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_result);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_state);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_type);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_unpickle_Dual_c);
   Py_VISIT(traverse_module_state->__pyx_n_s_radd);
+  Py_VISIT(traverse_module_state->__pyx_n_u_radd);
   Py_VISIT(traverse_module_state->__pyx_n_s_real);
-  Py_VISIT(traverse_module_state->__pyx_n_s_repr);
+  Py_VISIT(traverse_module_state->__pyx_n_s_record);
+  Py_VISIT(traverse_module_state->__pyx_n_s_reduce);
+  Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
   Py_VISIT(traverse_module_state->__pyx_n_s_rmul);
+  Py_VISIT(traverse_module_state->__pyx_n_u_rmul);
+  Py_VISIT(traverse_module_state->__pyx_n_s_rpow);
+  Py_VISIT(traverse_module_state->__pyx_n_u_rpow);
   Py_VISIT(traverse_module_state->__pyx_n_s_rsub);
+  Py_VISIT(traverse_module_state->__pyx_n_u_rsub);
   Py_VISIT(traverse_module_state->__pyx_n_s_rtruediv);
+  Py_VISIT(traverse_module_state->__pyx_n_u_rtruediv);
+  Py_VISIT(traverse_module_state->__pyx_n_s_scalar_array_function);
+  Py_VISIT(traverse_module_state->__pyx_n_s_scalar_array_ufunc);
   Py_VISIT(traverse_module_state->__pyx_n_s_self);
-  Py_VISIT(traverse_module_state->__pyx_n_s_set_name);
+  Py_VISIT(traverse_module_state->__pyx_n_s_set_profiler);
+  Py_VISIT(traverse_module_state->__pyx_n_s_setstate);
+  Py_VISIT(traverse_module_state->__pyx_n_s_setstate_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_sin);
+  Py_VISIT(traverse_module_state->__pyx_n_u_sin);
   Py_VISIT(traverse_module_state->__pyx_n_s_sinh);
-  Py_VISIT(traverse_module_state->__pyx_n_s_spec);
+  Py_VISIT(traverse_module_state->__pyx_n_u_sinh);
   Py_VISIT(traverse_module_state->__pyx_n_s_sqrt);
+  Py_VISIT(traverse_module_state->__pyx_n_u_sqrt);
+  Py_VISIT(traverse_module_state->__pyx_n_s_state);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_stringsource);
   Py_VISIT(traverse_module_state->__pyx_n_s_sub);
-  Py_VISIT(traverse_module_state->__pyx_n_s_super);
+  Py_VISIT(traverse_module_state->__pyx_n_u_sub);
   Py_VISIT(traverse_module_state->__pyx_n_s_tan);
+  Py_VISIT(traverse_module_state->__pyx_n_u_tan);
   Py_VISIT(traverse_module_state->__pyx_n_s_tanh);
+  Py_VISIT(traverse_module_state->__pyx_n_u_tanh);
   Py_VISIT(traverse_module_state->__pyx_n_s_test);
+  Py_VISIT(traverse_module_state->__pyx_n_s_time);
   Py_VISIT(traverse_module_state->__pyx_n_s_truediv);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_2);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_3);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_4);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_unsupported_operand_type_s_for_a_5);
+  Py_VISIT(traverse_module_state->__pyx_n_u_truediv);
+  Py_VISIT(traverse_module_state->__pyx_n_s_types);
+  Py_VISIT(traverse_module_state->__pyx_n_s_ufunc);
+  Py_VISIT(traverse_module_state->__pyx_n_s_update);
+  Py_VISIT(traverse_module_state->__pyx_n_s_use_setstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_x);
-  Py_VISIT(traverse_module_state->__pyx_int_0);
   Py_VISIT(traverse_module_state->__pyx_int_1);
-  Py_VISIT(traverse_module_state->__pyx_int_2);
+  Py_VISIT(traverse_module_state->__pyx_int_74701559);
+  Py_VISIT(traverse_module_state->__pyx_int_142668208);
+  Py_VISIT(traverse_module_state->__pyx_int_180996988);
   Py_VISIT(traverse_module_state->__pyx_tuple_);
-  Py_VISIT(traverse_module_state->__pyx_tuple__3);
+  Py_VISIT(traverse_module_state->__pyx_tuple__2);
   Py_VISIT(traverse_module_state->__pyx_tuple__5);
+  Py_VISIT(traverse_module_state->__pyx_tuple__6);
   Py_VISIT(traverse_module_state->__pyx_tuple__7);
-  Py_VISIT(traverse_module_state->__pyx_tuple__18);
+  Py_VISIT(traverse_module_state->__pyx_tuple__9);
+  Py_VISIT(traverse_module_state->__pyx_tuple__11);
+  Py_VISIT(traverse_module_state->__pyx_tuple__13);
+  Py_VISIT(traverse_module_state->__pyx_tuple__28);
+  Py_VISIT(traverse_module_state->__pyx_tuple__30);
+  Py_VISIT(traverse_module_state->__pyx_tuple__32);
   Py_VISIT(traverse_module_state->__pyx_tuple__34);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__6);
   Py_VISIT(traverse_module_state->__pyx_codeobj__8);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__9);
   Py_VISIT(traverse_module_state->__pyx_codeobj__10);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__11);
   Py_VISIT(traverse_module_state->__pyx_codeobj__12);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__13);
   Py_VISIT(traverse_module_state->__pyx_codeobj__14);
   Py_VISIT(traverse_module_state->__pyx_codeobj__15);
   Py_VISIT(traverse_module_state->__pyx_codeobj__16);
   Py_VISIT(traverse_module_state->__pyx_codeobj__17);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__18);
   Py_VISIT(traverse_module_state->__pyx_codeobj__19);
   Py_VISIT(traverse_module_state->__pyx_codeobj__20);
   Py_VISIT(traverse_module_state->__pyx_codeobj__21);
@@ -2804,11 +3071,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_codeobj__25);
   Py_VISIT(traverse_module_state->__pyx_codeobj__26);
   Py_VISIT(traverse_module_state->__pyx_codeobj__27);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__28);
   Py_VISIT(traverse_module_state->__pyx_codeobj__29);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__30);
   Py_VISIT(traverse_module_state->__pyx_codeobj__31);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__32);
   Py_VISIT(traverse_module_state->__pyx_codeobj__33);
   Py_VISIT(traverse_module_state->__pyx_codeobj__35);
   return 0;
@@ -2841,23 +3105,26 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #endif
 #if CYTHON_USE_MODULE_STATE
 #endif
-#define __pyx_kp_s_A_class_to_represent_a_dual_num __pyx_mstate_global->__pyx_kp_s_A_class_to_represent_a_dual_num
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#define __pyx_type_9DualNum_c_6Dual_c_Dual_c __pyx_mstate_global->__pyx_type_9DualNum_c_6Dual_c_Dual_c
+#endif
+#define __pyx_ptype_9DualNum_c_6Dual_c_Dual_c __pyx_mstate_global->__pyx_ptype_9DualNum_c_6Dual_c_Dual_c
 #define __pyx_kp_u_Computes_the_derivative_of_a_fu __pyx_mstate_global->__pyx_kp_u_Computes_the_derivative_of_a_fu
+#define __pyx_n_s_DualNum_Dual __pyx_mstate_global->__pyx_n_s_DualNum_Dual
 #define __pyx_n_s_DualNum_c_Dual_c __pyx_mstate_global->__pyx_n_s_DualNum_c_Dual_c
 #define __pyx_kp_s_DualNum_c_Dual_c_pyx __pyx_mstate_global->__pyx_kp_s_DualNum_c_Dual_c_pyx
 #define __pyx_n_s_Dual_c __pyx_mstate_global->__pyx_n_s_Dual_c
-#define __pyx_n_s_Dual_c___add __pyx_mstate_global->__pyx_n_s_Dual_c___add
-#define __pyx_n_s_Dual_c___eq __pyx_mstate_global->__pyx_n_s_Dual_c___eq
-#define __pyx_n_s_Dual_c___init __pyx_mstate_global->__pyx_n_s_Dual_c___init
-#define __pyx_n_s_Dual_c___mul __pyx_mstate_global->__pyx_n_s_Dual_c___mul
-#define __pyx_n_s_Dual_c___pow __pyx_mstate_global->__pyx_n_s_Dual_c___pow
-#define __pyx_n_s_Dual_c___radd __pyx_mstate_global->__pyx_n_s_Dual_c___radd
-#define __pyx_n_s_Dual_c___repr __pyx_mstate_global->__pyx_n_s_Dual_c___repr
-#define __pyx_n_s_Dual_c___rmul __pyx_mstate_global->__pyx_n_s_Dual_c___rmul
-#define __pyx_n_s_Dual_c___rsub __pyx_mstate_global->__pyx_n_s_Dual_c___rsub
-#define __pyx_n_s_Dual_c___rtruediv __pyx_mstate_global->__pyx_n_s_Dual_c___rtruediv
-#define __pyx_n_s_Dual_c___sub __pyx_mstate_global->__pyx_n_s_Dual_c___sub
-#define __pyx_n_s_Dual_c___truediv __pyx_mstate_global->__pyx_n_s_Dual_c___truediv
+#define __pyx_n_u_Dual_c __pyx_mstate_global->__pyx_n_u_Dual_c
+#define __pyx_n_s_Dual_c___array_function __pyx_mstate_global->__pyx_n_s_Dual_c___array_function
+#define __pyx_n_s_Dual_c___array_ufunc __pyx_mstate_global->__pyx_n_s_Dual_c___array_ufunc
+#define __pyx_n_s_Dual_c___reduce_cython __pyx_mstate_global->__pyx_n_s_Dual_c___reduce_cython
+#define __pyx_n_s_Dual_c___setstate_cython __pyx_mstate_global->__pyx_n_s_Dual_c___setstate_cython
 #define __pyx_n_s_Dual_c_acos __pyx_mstate_global->__pyx_n_s_Dual_c_acos
 #define __pyx_n_s_Dual_c_asin __pyx_mstate_global->__pyx_n_s_Dual_c_asin
 #define __pyx_n_s_Dual_c_atan __pyx_mstate_global->__pyx_n_s_Dual_c_atan
@@ -2875,96 +3142,146 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_u_Dual_real __pyx_mstate_global->__pyx_kp_u_Dual_real
 #define __pyx_kp_u_Expected_dual_to_be_of_type_floa __pyx_mstate_global->__pyx_kp_u_Expected_dual_to_be_of_type_floa
 #define __pyx_kp_u_Expected_real_to_be_of_type_floa __pyx_mstate_global->__pyx_kp_u_Expected_real_to_be_of_type_floa
+#define __pyx_n_s_ImportError __pyx_mstate_global->__pyx_n_s_ImportError
+#define __pyx_kp_s_Incompatible_checksums_0x_x_vs_0 __pyx_mstate_global->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0
 #define __pyx_kp_u_Logarithm_of_a_non_positive_numb __pyx_mstate_global->__pyx_kp_u_Logarithm_of_a_non_positive_numb
+#define __pyx_n_s_NotImplemented __pyx_mstate_global->__pyx_n_s_NotImplemented
+#define __pyx_n_s_PickleError __pyx_mstate_global->__pyx_n_s_PickleError
 #define __pyx_n_s_TypeError __pyx_mstate_global->__pyx_n_s_TypeError
 #define __pyx_n_s_ValueError __pyx_mstate_global->__pyx_n_s_ValueError
 #define __pyx_n_s_ZeroDivisionError __pyx_mstate_global->__pyx_n_s_ZeroDivisionError
-#define __pyx_kp_u__2 __pyx_mstate_global->__pyx_kp_u__2
+#define __pyx_kp_u__3 __pyx_mstate_global->__pyx_kp_u__3
 #define __pyx_n_s__36 __pyx_mstate_global->__pyx_n_s__36
-#define __pyx_n_s__4 __pyx_mstate_global->__pyx_n_s__4
+#define __pyx_kp_u__4 __pyx_mstate_global->__pyx_kp_u__4
 #define __pyx_n_s_acos __pyx_mstate_global->__pyx_n_s_acos
+#define __pyx_n_u_acos __pyx_mstate_global->__pyx_n_u_acos
 #define __pyx_n_s_add __pyx_mstate_global->__pyx_n_s_add
+#define __pyx_n_u_add __pyx_mstate_global->__pyx_n_u_add
+#define __pyx_n_s_args __pyx_mstate_global->__pyx_n_s_args
+#define __pyx_n_s_array_function __pyx_mstate_global->__pyx_n_s_array_function
+#define __pyx_n_s_array_ufunc __pyx_mstate_global->__pyx_n_s_array_ufunc
 #define __pyx_n_s_asin __pyx_mstate_global->__pyx_n_s_asin
+#define __pyx_n_u_asin __pyx_mstate_global->__pyx_n_u_asin
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
 #define __pyx_n_s_atan __pyx_mstate_global->__pyx_n_s_atan
+#define __pyx_n_u_atan __pyx_mstate_global->__pyx_n_u_atan
 #define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
 #define __pyx_n_s_compute_derivative __pyx_mstate_global->__pyx_n_s_compute_derivative
-#define __pyx_kp_u_compute_derivative_line_282 __pyx_mstate_global->__pyx_kp_u_compute_derivative_line_282
+#define __pyx_kp_u_compute_derivative_line_543 __pyx_mstate_global->__pyx_kp_u_compute_derivative_line_543
 #define __pyx_n_s_cos __pyx_mstate_global->__pyx_n_s_cos
+#define __pyx_n_u_cos __pyx_mstate_global->__pyx_n_u_cos
 #define __pyx_n_s_cosh __pyx_mstate_global->__pyx_n_s_cosh
+#define __pyx_n_u_cosh __pyx_mstate_global->__pyx_n_u_cosh
 #define __pyx_n_s_dict __pyx_mstate_global->__pyx_n_s_dict
+#define __pyx_n_s_dict_2 __pyx_mstate_global->__pyx_n_s_dict_2
+#define __pyx_kp_u_disable __pyx_mstate_global->__pyx_kp_u_disable
 #define __pyx_kp_u_division_by_zero_is_undefined __pyx_mstate_global->__pyx_kp_u_division_by_zero_is_undefined
-#define __pyx_n_s_doc __pyx_mstate_global->__pyx_n_s_doc
 #define __pyx_n_s_dual __pyx_mstate_global->__pyx_n_s_dual
 #define __pyx_kp_u_dual_2 __pyx_mstate_global->__pyx_kp_u_dual_2
 #define __pyx_n_s_dual_class __pyx_mstate_global->__pyx_n_s_dual_class
+#define __pyx_kp_u_enable __pyx_mstate_global->__pyx_kp_u_enable
 #define __pyx_n_s_eq __pyx_mstate_global->__pyx_n_s_eq
 #define __pyx_n_s_exp __pyx_mstate_global->__pyx_n_s_exp
-#define __pyx_n_s_format __pyx_mstate_global->__pyx_n_s_format
+#define __pyx_n_u_exp __pyx_mstate_global->__pyx_n_u_exp
 #define __pyx_n_s_func __pyx_mstate_global->__pyx_n_s_func
+#define __pyx_kp_u_gc __pyx_mstate_global->__pyx_kp_u_gc
 #define __pyx_n_s_get_dual __pyx_mstate_global->__pyx_n_s_get_dual
 #define __pyx_n_s_get_real __pyx_mstate_global->__pyx_n_s_get_real
+#define __pyx_n_s_getstate __pyx_mstate_global->__pyx_n_s_getstate
 #define __pyx_n_s_import __pyx_mstate_global->__pyx_n_s_import
-#define __pyx_n_s_init __pyx_mstate_global->__pyx_n_s_init
-#define __pyx_n_s_init_subclass __pyx_mstate_global->__pyx_n_s_init_subclass
-#define __pyx_n_s_initializing __pyx_mstate_global->__pyx_n_s_initializing
+#define __pyx_n_s_inputs __pyx_mstate_global->__pyx_n_s_inputs
 #define __pyx_kp_u_instead __pyx_mstate_global->__pyx_kp_u_instead
 #define __pyx_n_s_is_coroutine __pyx_mstate_global->__pyx_n_s_is_coroutine
+#define __pyx_kp_u_isenabled __pyx_mstate_global->__pyx_kp_u_isenabled
+#define __pyx_n_s_kwargs __pyx_mstate_global->__pyx_n_s_kwargs
 #define __pyx_n_s_log __pyx_mstate_global->__pyx_n_s_log
+#define __pyx_n_u_log __pyx_mstate_global->__pyx_n_u_log
 #define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
-#define __pyx_n_s_math __pyx_mstate_global->__pyx_n_s_math
-#define __pyx_n_s_metaclass __pyx_mstate_global->__pyx_n_s_metaclass
-#define __pyx_n_s_module __pyx_mstate_global->__pyx_n_s_module
+#define __pyx_kp_u_math_domain_error __pyx_mstate_global->__pyx_kp_u_math_domain_error
+#define __pyx_n_s_method __pyx_mstate_global->__pyx_n_s_method
 #define __pyx_n_s_mul __pyx_mstate_global->__pyx_n_s_mul
+#define __pyx_n_u_mul __pyx_mstate_global->__pyx_n_u_mul
 #define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
-#define __pyx_n_s_other __pyx_mstate_global->__pyx_n_s_other
+#define __pyx_n_s_new __pyx_mstate_global->__pyx_n_s_new
+#define __pyx_n_s_perf_counter_ns __pyx_mstate_global->__pyx_n_s_perf_counter_ns
+#define __pyx_n_s_pickle __pyx_mstate_global->__pyx_n_s_pickle
 #define __pyx_n_s_pow __pyx_mstate_global->__pyx_n_s_pow
-#define __pyx_n_s_prepare __pyx_mstate_global->__pyx_n_s_prepare
-#define __pyx_n_s_qualname __pyx_mstate_global->__pyx_n_s_qualname
+#define __pyx_n_u_pow __pyx_mstate_global->__pyx_n_u_pow
+#define __pyx_n_s_profiler __pyx_mstate_global->__pyx_n_s_profiler
+#define __pyx_n_s_pyx_PickleError __pyx_mstate_global->__pyx_n_s_pyx_PickleError
+#define __pyx_n_s_pyx_checksum __pyx_mstate_global->__pyx_n_s_pyx_checksum
+#define __pyx_n_s_pyx_result __pyx_mstate_global->__pyx_n_s_pyx_result
+#define __pyx_n_s_pyx_state __pyx_mstate_global->__pyx_n_s_pyx_state
+#define __pyx_n_s_pyx_type __pyx_mstate_global->__pyx_n_s_pyx_type
+#define __pyx_n_s_pyx_unpickle_Dual_c __pyx_mstate_global->__pyx_n_s_pyx_unpickle_Dual_c
 #define __pyx_n_s_radd __pyx_mstate_global->__pyx_n_s_radd
+#define __pyx_n_u_radd __pyx_mstate_global->__pyx_n_u_radd
 #define __pyx_n_s_real __pyx_mstate_global->__pyx_n_s_real
-#define __pyx_n_s_repr __pyx_mstate_global->__pyx_n_s_repr
+#define __pyx_n_s_record __pyx_mstate_global->__pyx_n_s_record
+#define __pyx_n_s_reduce __pyx_mstate_global->__pyx_n_s_reduce
+#define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
+#define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
 #define __pyx_n_s_rmul __pyx_mstate_global->__pyx_n_s_rmul
+#define __pyx_n_u_rmul __pyx_mstate_global->__pyx_n_u_rmul
+#define __pyx_n_s_rpow __pyx_mstate_global->__pyx_n_s_rpow
+#define __pyx_n_u_rpow __pyx_mstate_global->__pyx_n_u_rpow
 #define __pyx_n_s_rsub __pyx_mstate_global->__pyx_n_s_rsub
+#define __pyx_n_u_rsub __pyx_mstate_global->__pyx_n_u_rsub
 #define __pyx_n_s_rtruediv __pyx_mstate_global->__pyx_n_s_rtruediv
+#define __pyx_n_u_rtruediv __pyx_mstate_global->__pyx_n_u_rtruediv
+#define __pyx_n_s_scalar_array_function __pyx_mstate_global->__pyx_n_s_scalar_array_function
+#define __pyx_n_s_scalar_array_ufunc __pyx_mstate_global->__pyx_n_s_scalar_array_ufunc
 #define __pyx_n_s_self __pyx_mstate_global->__pyx_n_s_self
-#define __pyx_n_s_set_name __pyx_mstate_global->__pyx_n_s_set_name
+#define __pyx_n_s_set_profiler __pyx_mstate_global->__pyx_n_s_set_profiler
+#define __pyx_n_s_setstate __pyx_mstate_global->__pyx_n_s_setstate
+#define __pyx_n_s_setstate_cython __pyx_mstate_global->__pyx_n_s_setstate_cython
 #define __pyx_n_s_sin __pyx_mstate_global->__pyx_n_s_sin
+#define __pyx_n_u_sin __pyx_mstate_global->__pyx_n_u_sin
 #define __pyx_n_s_sinh __pyx_mstate_global->__pyx_n_s_sinh
-#define __pyx_n_s_spec __pyx_mstate_global->__pyx_n_s_spec
+#define __pyx_n_u_sinh __pyx_mstate_global->__pyx_n_u_sinh
 #define __pyx_n_s_sqrt __pyx_mstate_global->__pyx_n_s_sqrt
+#define __pyx_n_u_sqrt __pyx_mstate_global->__pyx_n_u_sqrt
+#define __pyx_n_s_state __pyx_mstate_global->__pyx_n_s_state
+#define __pyx_kp_s_stringsource __pyx_mstate_global->__pyx_kp_s_stringsource
 #define __pyx_n_s_sub __pyx_mstate_global->__pyx_n_s_sub
-#define __pyx_n_s_super __pyx_mstate_global->__pyx_n_s_super
+#define __pyx_n_u_sub __pyx_mstate_global->__pyx_n_u_sub
 #define __pyx_n_s_tan __pyx_mstate_global->__pyx_n_s_tan
+#define __pyx_n_u_tan __pyx_mstate_global->__pyx_n_u_tan
 #define __pyx_n_s_tanh __pyx_mstate_global->__pyx_n_s_tanh
+#define __pyx_n_u_tanh __pyx_mstate_global->__pyx_n_u_tanh
 #define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
+#define __pyx_n_s_time __pyx_mstate_global->__pyx_n_s_time
 #define __pyx_n_s_truediv __pyx_mstate_global->__pyx_n_s_truediv
-#define __pyx_kp_u_unsupported_operand_type_s_for_a __pyx_mstate_global->__pyx_kp_u_unsupported_operand_type_s_for_a
-#define __pyx_kp_u_unsupported_operand_type_s_for_a_2 __pyx_mstate_global->__pyx_kp_u_unsupported_operand_type_s_for_a_2
-#define __pyx_kp_u_unsupported_operand_type_s_for_a_3 __pyx_mstate_global->__pyx_kp_u_unsupported_operand_type_s_for_a_3
-#define __pyx_kp_u_unsupported_operand_type_s_for_a_4 __pyx_mstate_global->__pyx_kp_u_unsupported_operand_type_s_for_a_4
-#define __pyx_kp_u_unsupported_operand_type_s_for_a_5 __pyx_mstate_global->__pyx_kp_u_unsupported_operand_type_s_for_a_5
+#define __pyx_n_u_truediv __pyx_mstate_global->__pyx_n_u_truediv
+#define __pyx_n_s_types __pyx_mstate_global->__pyx_n_s_types
+#define __pyx_n_s_ufunc __pyx_mstate_global->__pyx_n_s_ufunc
+#define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
+#define __pyx_n_s_use_setstate __pyx_mstate_global->__pyx_n_s_use_setstate
 #define __pyx_n_s_x __pyx_mstate_global->__pyx_n_s_x
-#define __pyx_int_0 __pyx_mstate_global->__pyx_int_0
 #define __pyx_int_1 __pyx_mstate_global->__pyx_int_1
-#define __pyx_int_2 __pyx_mstate_global->__pyx_int_2
+#define __pyx_int_74701559 __pyx_mstate_global->__pyx_int_74701559
+#define __pyx_int_142668208 __pyx_mstate_global->__pyx_int_142668208
+#define __pyx_int_180996988 __pyx_mstate_global->__pyx_int_180996988
 #define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
-#define __pyx_tuple__3 __pyx_mstate_global->__pyx_tuple__3
+#define __pyx_tuple__2 __pyx_mstate_global->__pyx_tuple__2
 #define __pyx_tuple__5 __pyx_mstate_global->__pyx_tuple__5
+#define __pyx_tuple__6 __pyx_mstate_global->__pyx_tuple__6
 #define __pyx_tuple__7 __pyx_mstate_global->__pyx_tuple__7
-#define __pyx_tuple__18 __pyx_mstate_global->__pyx_tuple__18
+#define __pyx_tuple__9 __pyx_mstate_global->__pyx_tuple__9
+#define __pyx_tuple__11 __pyx_mstate_global->__pyx_tuple__11
+#define __pyx_tuple__13 __pyx_mstate_global->__pyx_tuple__13
+#define __pyx_tuple__28 __pyx_mstate_global->__pyx_tuple__28
+#define __pyx_tuple__30 __pyx_mstate_global->__pyx_tuple__30
+#define __pyx_tuple__32 __pyx_mstate_global->__pyx_tuple__32
 #define __pyx_tuple__34 __pyx_mstate_global->__pyx_tuple__34
-#define __pyx_codeobj__6 __pyx_mstate_global->__pyx_codeobj__6
 #define __pyx_codeobj__8 __pyx_mstate_global->__pyx_codeobj__8
-#define __pyx_codeobj__9 __pyx_mstate_global->__pyx_codeobj__9
 #define __pyx_codeobj__10 __pyx_mstate_global->__pyx_codeobj__10
-#define __pyx_codeobj__11 __pyx_mstate_global->__pyx_codeobj__11
 #define __pyx_codeobj__12 __pyx_mstate_global->__pyx_codeobj__12
-#define __pyx_codeobj__13 __pyx_mstate_global->__pyx_codeobj__13
 #define __pyx_codeobj__14 __pyx_mstate_global->__pyx_codeobj__14
 #define __pyx_codeobj__15 __pyx_mstate_global->__pyx_codeobj__15
 #define __pyx_codeobj__16 __pyx_mstate_global->__pyx_codeobj__16
 #define __pyx_codeobj__17 __pyx_mstate_global->__pyx_codeobj__17
+#define __pyx_codeobj__18 __pyx_mstate_global->__pyx_codeobj__18
 #define __pyx_codeobj__19 __pyx_mstate_global->__pyx_codeobj__19
 #define __pyx_codeobj__20 __pyx_mstate_global->__pyx_codeobj__20
 #define __pyx_codeobj__21 __pyx_mstate_global->__pyx_codeobj__21
@@ -2974,2003 +3291,1348 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_codeobj__25 __pyx_mstate_global->__pyx_codeobj__25
 #define __pyx_codeobj__26 __pyx_mstate_global->__pyx_codeobj__26
 #define __pyx_codeobj__27 __pyx_mstate_global->__pyx_codeobj__27
-#define __pyx_codeobj__28 __pyx_mstate_global->__pyx_codeobj__28
 #define __pyx_codeobj__29 __pyx_mstate_global->__pyx_codeobj__29
-#define __pyx_codeobj__30 __pyx_mstate_global->__pyx_codeobj__30
 #define __pyx_codeobj__31 __pyx_mstate_global->__pyx_codeobj__31
-#define __pyx_codeobj__32 __pyx_mstate_global->__pyx_codeobj__32
 #define __pyx_codeobj__33 __pyx_mstate_global->__pyx_codeobj__33
 #define __pyx_codeobj__35 __pyx_mstate_global->__pyx_codeobj__35
 /* #### Code section: module_code ### */
 
-/* "DualNum_c/Dual_c.pyx":25
+/* "DualNum_c/Dual_c.pxd":42
  * 
- *     # Special Methods
- *     def __init__(self, real, dual):             # <<<<<<<<<<<<<<
- *         """
- *         Constructs all the necessary attributes for the Dual object.
+ * 
+ * cdef inline dual_t make_dual(double real, double dual) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef dual_t result
+ *     result.real = real
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_1__init__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c___init__, "\n        Constructs all the necessary attributes for the Dual object.\n        \n        Parameters\n        ----------\n        \n        real : float\n            The real part of the dual number.\n        \n        dual : float\n            The dual part of the dual number.\n\n        Raises\n        ------\n        TypeError\n            If 'real' or 'dual' is not of type float or int.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_1__init__ = {"__init__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_1__init__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c___init__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_1__init__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_real = 0;
-  PyObject *__pyx_v_dual = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_real,&__pyx_n_s_dual,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 25, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_real)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 25, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 1); __PYX_ERR(0, 25, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_dual)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 25, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 2); __PYX_ERR(0, 25, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 25, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_real = values[1];
-    __pyx_v_dual = values[2];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 25, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c___init__(__pyx_self, __pyx_v_self, __pyx_v_real, __pyx_v_dual);
-
-  /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_make_dual(double __pyx_v_real, double __pyx_v_dual) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_result;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_real, PyObject *__pyx_v_dual) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  Py_UCS4 __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__init__", 1);
+  /* "DualNum_c/Dual_c.pxd":44
+ * cdef inline dual_t make_dual(double real, double dual) noexcept nogil:
+ *     cdef dual_t result
+ *     result.real = real             # <<<<<<<<<<<<<<
+ *     result.dual = dual
+ *     return result
+ */
+  __pyx_v_result.real = __pyx_v_real;
 
-  /* "DualNum_c/Dual_c.pyx":43
- *             If 'real' or 'dual' is not of type float or int.
- *         """
- *         if not isinstance(real, (float, int)):             # <<<<<<<<<<<<<<
- *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+  /* "DualNum_c/Dual_c.pxd":45
+ *     cdef dual_t result
+ *     result.real = real
+ *     result.dual = dual             # <<<<<<<<<<<<<<
+ *     return result
  * 
  */
-  __pyx_t_2 = PyFloat_Check(__pyx_v_real); 
-  if (!__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_2 = PyInt_Check(__pyx_v_real); 
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
-  __pyx_t_2 = (!__pyx_t_1);
-  if (unlikely(__pyx_t_2)) {
+  __pyx_v_result.dual = __pyx_v_dual;
 
-    /* "DualNum_c/Dual_c.pyx":44
- *         """
- *         if not isinstance(real, (float, int)):
- *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")             # <<<<<<<<<<<<<<
+  /* "DualNum_c/Dual_c.pxd":46
+ *     result.real = real
+ *     result.dual = dual
+ *     return result             # <<<<<<<<<<<<<<
+ * 
  * 
- *         if not isinstance(dual, (float, int)):
  */
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = 0;
-    __pyx_t_5 = 127;
-    __Pyx_INCREF(__pyx_kp_u_Expected_real_to_be_of_type_floa);
-    __pyx_t_4 += 48;
-    __Pyx_GIVEREF(__pyx_kp_u_Expected_real_to_be_of_type_floa);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_Expected_real_to_be_of_type_floa);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)Py_TYPE(__pyx_v_real)), __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 44, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = __Pyx_PyObject_FormatSimple(__pyx_t_6, __pyx_empty_unicode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 44, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_5 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_7) > __pyx_t_5) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_7) : __pyx_t_5;
-    __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_7);
-    __Pyx_GIVEREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_7);
-    __pyx_t_7 = 0;
-    __Pyx_INCREF(__pyx_kp_u_instead);
-    __pyx_t_4 += 9;
-    __Pyx_GIVEREF(__pyx_kp_u_instead);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_kp_u_instead);
-    __pyx_t_7 = __Pyx_PyUnicode_Join(__pyx_t_3, 3, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 44, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 44, __pyx_L1_error)
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":43
- *             If 'real' or 'dual' is not of type float or int.
- *         """
- *         if not isinstance(real, (float, int)):             # <<<<<<<<<<<<<<
- *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+  /* "DualNum_c/Dual_c.pxd":42
  * 
+ * 
+ * cdef inline dual_t make_dual(double real, double dual) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef dual_t result
+ *     result.real = real
  */
-  }
 
-  /* "DualNum_c/Dual_c.pyx":46
- *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":49
  * 
- *         if not isinstance(dual, (float, int)):             # <<<<<<<<<<<<<<
- *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
+ * 
+ * cdef inline dual_t as_dual(Dual_c x) noexcept:             # <<<<<<<<<<<<<<
+ *     return make_dual(x.real, x.dual)
  * 
  */
-  __pyx_t_1 = PyFloat_Check(__pyx_v_dual); 
-  if (!__pyx_t_1) {
-  } else {
-    __pyx_t_2 = __pyx_t_1;
-    goto __pyx_L7_bool_binop_done;
-  }
-  __pyx_t_1 = PyInt_Check(__pyx_v_dual); 
-  __pyx_t_2 = __pyx_t_1;
-  __pyx_L7_bool_binop_done:;
-  __pyx_t_1 = (!__pyx_t_2);
-  if (unlikely(__pyx_t_1)) {
 
-    /* "DualNum_c/Dual_c.pyx":47
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_as_dual(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_x) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":50
+ * 
+ * cdef inline dual_t as_dual(Dual_c x) noexcept:
+ *     return make_dual(x.real, x.dual)             # <<<<<<<<<<<<<<
  * 
- *         if not isinstance(dual, (float, int)):
- *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")             # <<<<<<<<<<<<<<
  * 
- *         self.real = real
  */
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = 0;
-    __pyx_t_5 = 127;
-    __Pyx_INCREF(__pyx_kp_u_Expected_dual_to_be_of_type_floa);
-    __pyx_t_4 += 48;
-    __Pyx_GIVEREF(__pyx_kp_u_Expected_dual_to_be_of_type_floa);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_Expected_dual_to_be_of_type_floa);
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)Py_TYPE(__pyx_v_dual)), __pyx_n_s_name); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_t_7, __pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_5 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) > __pyx_t_5) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) : __pyx_t_5;
-    __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_6);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_6);
-    __pyx_t_6 = 0;
-    __Pyx_INCREF(__pyx_kp_u_instead);
-    __pyx_t_4 += 9;
-    __Pyx_GIVEREF(__pyx_kp_u_instead);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_kp_u_instead);
-    __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_3, 3, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_x->real, __pyx_v_x->dual);
+  goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":46
- *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+  /* "DualNum_c/Dual_c.pxd":49
  * 
- *         if not isinstance(dual, (float, int)):             # <<<<<<<<<<<<<<
- *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
+ * 
+ * cdef inline dual_t as_dual(Dual_c x) noexcept:             # <<<<<<<<<<<<<<
+ *     return make_dual(x.real, x.dual)
  * 
  */
-  }
 
-  /* "DualNum_c/Dual_c.pyx":49
- *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":54
  * 
- *         self.real = real             # <<<<<<<<<<<<<<
- *         self.dual = dual
+ * # Arithmetic: dual op dual, and the scalar forms of Dual_c's reflected operators
+ * cdef inline dual_t dual_add(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real + b.real, a.dual + b.dual)
  * 
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_real, __pyx_v_real) < 0) __PYX_ERR(0, 49, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":50
- * 
- *         self.real = real
- *         self.dual = dual             # <<<<<<<<<<<<<<
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_add(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_b) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":55
+ * # Arithmetic: dual op dual, and the scalar forms of Dual_c's reflected operators
+ * cdef inline dual_t dual_add(dual_t a, dual_t b) noexcept nogil:
+ *     return make_dual(a.real + b.real, a.dual + b.dual)             # <<<<<<<<<<<<<<
  * 
- *     def __add__(self, other):
+ * cdef inline dual_t dual_add_scalar(dual_t a, double c) noexcept nogil:
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_dual, __pyx_v_dual) < 0) __PYX_ERR(0, 50, __pyx_L1_error)
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_a.real + __pyx_v_b.real), (__pyx_v_a.dual + __pyx_v_b.dual));
+  goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":25
+  /* "DualNum_c/Dual_c.pxd":54
+ * 
+ * # Arithmetic: dual op dual, and the scalar forms of Dual_c's reflected operators
+ * cdef inline dual_t dual_add(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real + b.real, a.dual + b.dual)
  * 
- *     # Special Methods
- *     def __init__(self, real, dual):             # <<<<<<<<<<<<<<
- *         """
- *         Constructs all the necessary attributes for the Dual object.
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":52
- *         self.dual = dual
+/* "DualNum_c/Dual_c.pxd":57
+ *     return make_dual(a.real + b.real, a.dual + b.dual)
+ * 
+ * cdef inline dual_t dual_add_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real + c, a.dual)
  * 
- *     def __add__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Adds a dual number and another dual number or scalar.
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_3__add__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_2__add__, "\n        Adds a dual number and another dual number or scalar.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to add to the current dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_3__add__ = {"__add__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_3__add__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_2__add__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_3__add__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__add__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 52, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 52, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__add__", 1, 2, 2, 1); __PYX_ERR(0, 52, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__add__") < 0)) __PYX_ERR(0, 52, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__add__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 52, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__add__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_2__add__(__pyx_self, __pyx_v_self, __pyx_v_other);
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_add_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, double __pyx_v_c) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":58
+ * 
+ * cdef inline dual_t dual_add_scalar(dual_t a, double c) noexcept nogil:
+ *     return make_dual(a.real + c, a.dual)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_sub(dual_t a, dual_t b) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_a.real + __pyx_v_c), __pyx_v_a.dual);
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":57
+ *     return make_dual(a.real + b.real, a.dual + b.dual)
+ * 
+ * cdef inline dual_t dual_add_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real + c, a.dual)
+ * 
+ */
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
+  __pyx_L0:;
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_2__add__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  unsigned int __pyx_t_8;
-  int __pyx_t_9;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__add__", 1);
+/* "DualNum_c/Dual_c.pxd":60
+ *     return make_dual(a.real + c, a.dual)
+ * 
+ * cdef inline dual_t dual_sub(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real - b.real, a.dual - b.dual)
+ * 
+ */
 
-  /* "DualNum_c/Dual_c.pyx":61
- *             The value to add to the current dual number.
- *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real + other.real, self.dual + other.dual)
- *         if isinstance(other, (float, int)):
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sub(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_b) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":61
+ * 
+ * cdef inline dual_t dual_sub(dual_t a, dual_t b) noexcept nogil:
+ *     return make_dual(a.real - b.real, a.dual - b.dual)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_sub_scalar(dual_t a, double c) noexcept nogil:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_IsInstance(__pyx_v_other, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_a.real - __pyx_v_b.real), (__pyx_v_a.dual - __pyx_v_b.dual));
+  goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":62
- *         """
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real + other.real, self.dual + other.dual)             # <<<<<<<<<<<<<<
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real + other, self.dual)
+  /* "DualNum_c/Dual_c.pxd":60
+ *     return make_dual(a.real + c, a.dual)
+ * 
+ * cdef inline dual_t dual_sub(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real - b.real, a.dual - b.dual)
+ * 
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyNumber_Add(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_dual); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PyNumber_Add(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = NULL;
-    __pyx_t_8 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_8 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_6, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":61
- *             The value to add to the current dual number.
- *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real + other.real, self.dual + other.dual)
- *         if isinstance(other, (float, int)):
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":63
+ *     return make_dual(a.real - b.real, a.dual - b.dual)
+ * 
+ * cdef inline dual_t dual_sub_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real - c, a.dual)
+ * 
  */
-  }
 
-  /* "DualNum_c/Dual_c.pyx":63
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real + other.real, self.dual + other.dual)
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real + other, self.dual)
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sub_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, double __pyx_v_c) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":64
+ * 
+ * cdef inline dual_t dual_sub_scalar(dual_t a, double c) noexcept nogil:
+ *     return make_dual(a.real - c, a.dual)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_rsub_scalar(double c, dual_t a) noexcept nogil:
  */
-  __pyx_t_9 = PyFloat_Check(__pyx_v_other); 
-  if (!__pyx_t_9) {
-  } else {
-    __pyx_t_2 = __pyx_t_9;
-    goto __pyx_L5_bool_binop_done;
-  }
-  __pyx_t_9 = PyInt_Check(__pyx_v_other); 
-  __pyx_t_2 = __pyx_t_9;
-  __pyx_L5_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_a.real - __pyx_v_c), __pyx_v_a.dual);
+  goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":64
- *             return Dual_c(self.real + other.real, self.dual + other.dual)
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real + other, self.dual)             # <<<<<<<<<<<<<<
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":63
+ *     return make_dual(a.real - b.real, a.dual - b.dual)
+ * 
+ * cdef inline dual_t dual_sub_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real - c, a.dual)
  * 
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_6 = PyNumber_Add(__pyx_t_7, __pyx_v_other); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_4 = NULL;
-    __pyx_t_8 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_8 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_6, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":63
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real + other.real, self.dual + other.dual)
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real + other, self.dual)
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":66
+ *     return make_dual(a.real - c, a.dual)
+ * 
+ * cdef inline dual_t dual_rsub_scalar(double c, dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(c - a.real, -a.dual)
+ * 
  */
-  }
 
-  /* "DualNum_c/Dual_c.pyx":65
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real + other, self.dual)
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))             # <<<<<<<<<<<<<<
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_rsub_scalar(double __pyx_v_c, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":67
  * 
- *     def __radd__(self, other):
+ * cdef inline dual_t dual_rsub_scalar(double c, dual_t a) noexcept nogil:
+ *     return make_dual(c - a.real, -a.dual)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_mul(dual_t a, dual_t b) noexcept nogil:
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_unsupported_operand_type_s_for_a, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = NULL;
-  __pyx_t_8 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_8 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_7, ((PyObject *)Py_TYPE(__pyx_v_self)), ((PyObject *)Py_TYPE(__pyx_v_other))};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_c - __pyx_v_a.real), (-__pyx_v_a.dual));
+  goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":52
- *         self.dual = dual
+  /* "DualNum_c/Dual_c.pxd":66
+ *     return make_dual(a.real - c, a.dual)
+ * 
+ * cdef inline dual_t dual_rsub_scalar(double c, dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(c - a.real, -a.dual)
  * 
- *     def __add__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Adds a dual number and another dual number or scalar.
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__add__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":67
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
+/* "DualNum_c/Dual_c.pxd":69
+ *     return make_dual(c - a.real, -a.dual)
+ * 
+ * cdef inline dual_t dual_mul(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real * b.real, a.real * b.dual + a.dual * b.real)
  * 
- *     def __radd__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Adds a dual number and another dual number or scalar.
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_5__radd__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_4__radd__, "\n        Adds a dual number and another dual number or scalar.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to add to the current dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_5__radd__ = {"__radd__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_5__radd__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_4__radd__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_5__radd__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__radd__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__radd__", 1, 2, 2, 1); __PYX_ERR(0, 67, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__radd__") < 0)) __PYX_ERR(0, 67, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__radd__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 67, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__radd__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4__radd__(__pyx_self, __pyx_v_self, __pyx_v_other);
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_mul(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_b) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":70
+ * 
+ * cdef inline dual_t dual_mul(dual_t a, dual_t b) noexcept nogil:
+ *     return make_dual(a.real * b.real, a.real * b.dual + a.dual * b.real)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_mul_scalar(dual_t a, double c) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_a.real * __pyx_v_b.real), ((__pyx_v_a.real * __pyx_v_b.dual) + (__pyx_v_a.dual * __pyx_v_b.real)));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":69
+ *     return make_dual(c - a.real, -a.dual)
+ * 
+ * cdef inline dual_t dual_mul(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real * b.real, a.real * b.dual + a.dual * b.real)
+ * 
+ */
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
+  __pyx_L0:;
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4__radd__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  unsigned int __pyx_t_4;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__radd__", 1);
+/* "DualNum_c/Dual_c.pxd":72
+ *     return make_dual(a.real * b.real, a.real * b.dual + a.dual * b.real)
+ * 
+ * cdef inline dual_t dual_mul_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real * c, a.dual * c)
+ * 
+ */
 
-  /* "DualNum_c/Dual_c.pyx":76
- *             The value to add to the current dual number.
- *         """
- *         return self.__add__(other)             # <<<<<<<<<<<<<<
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_mul_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, double __pyx_v_c) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":73
  * 
- *     def __sub__(self, other):
+ * cdef inline dual_t dual_mul_scalar(dual_t a, double c) noexcept nogil:
+ *     return make_dual(a.real * c, a.dual * c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_div(dual_t a, dual_t b) noexcept nogil:
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_add); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  __pyx_t_4 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_4 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_other};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_a.real * __pyx_v_c), (__pyx_v_a.dual * __pyx_v_c));
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":67
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":72
+ *     return make_dual(a.real * b.real, a.real * b.dual + a.dual * b.real)
+ * 
+ * cdef inline dual_t dual_mul_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real * c, a.dual * c)
  * 
- *     def __radd__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Adds a dual number and another dual number or scalar.
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__radd__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":78
- *         return self.__add__(other)
+/* "DualNum_c/Dual_c.pxd":75
+ *     return make_dual(a.real * c, a.dual * c)
  * 
- *     def __sub__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Subtracts one dual number from another dual or int/float.
+ * cdef inline dual_t dual_div(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double q = a.real / b.real
+ *     return make_dual(q, (a.dual - q * b.dual) / b.real)
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_7__sub__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_6__sub__, "\n        Subtracts one dual number from another dual or int/float.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to subtract from the current dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_7__sub__ = {"__sub__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_7__sub__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_6__sub__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_7__sub__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__sub__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 78, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 78, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__sub__", 1, 2, 2, 1); __PYX_ERR(0, 78, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__sub__") < 0)) __PYX_ERR(0, 78, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__sub__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 78, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__sub__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_6__sub__(__pyx_self, __pyx_v_self, __pyx_v_other);
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_div(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_b) {
+  double __pyx_v_q;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
 
-  /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "DualNum_c/Dual_c.pxd":76
+ * 
+ * cdef inline dual_t dual_div(dual_t a, dual_t b) noexcept nogil:
+ *     cdef double q = a.real / b.real             # <<<<<<<<<<<<<<
+ *     return make_dual(q, (a.dual - q * b.dual) / b.real)
+ * 
+ */
+  __pyx_v_q = (__pyx_v_a.real / __pyx_v_b.real);
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_6__sub__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  unsigned int __pyx_t_8;
-  int __pyx_t_9;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__sub__", 1);
+  /* "DualNum_c/Dual_c.pxd":77
+ * cdef inline dual_t dual_div(dual_t a, dual_t b) noexcept nogil:
+ *     cdef double q = a.real / b.real
+ *     return make_dual(q, (a.dual - q * b.dual) / b.real)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_div_scalar(dual_t a, double c) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_q, ((__pyx_v_a.dual - (__pyx_v_q * __pyx_v_b.dual)) / __pyx_v_b.real));
+  goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":87
- *             The value to subtract from the current dual number.
- *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real - other.real, self.dual - other.dual)
- *         if isinstance(other, (float, int)):
+  /* "DualNum_c/Dual_c.pxd":75
+ *     return make_dual(a.real * c, a.dual * c)
+ * 
+ * cdef inline dual_t dual_div(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double q = a.real / b.real
+ *     return make_dual(q, (a.dual - q * b.dual) / b.real)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_IsInstance(__pyx_v_other, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 87, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":79
+ *     return make_dual(q, (a.dual - q * b.dual) / b.real)
+ * 
+ * cdef inline dual_t dual_div_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real / c, a.dual / c)
+ * 
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_div_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, double __pyx_v_c) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":80
+ * 
+ * cdef inline dual_t dual_div_scalar(dual_t a, double c) noexcept nogil:
+ *     return make_dual(a.real / c, a.dual / c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_rdiv_scalar(double c, dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_a.real / __pyx_v_c), (__pyx_v_a.dual / __pyx_v_c));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":79
+ *     return make_dual(q, (a.dual - q * b.dual) / b.real)
+ * 
+ * cdef inline dual_t dual_div_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(a.real / c, a.dual / c)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":82
+ *     return make_dual(a.real / c, a.dual / c)
+ * 
+ * cdef inline dual_t dual_rdiv_scalar(double c, dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double q = c / a.real
+ *     return make_dual(q, -q * a.dual / a.real)
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_rdiv_scalar(double __pyx_v_c, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  double __pyx_v_q;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":83
+ * 
+ * cdef inline dual_t dual_rdiv_scalar(double c, dual_t a) noexcept nogil:
+ *     cdef double q = c / a.real             # <<<<<<<<<<<<<<
+ *     return make_dual(q, -q * a.dual / a.real)
+ * 
+ */
+  __pyx_v_q = (__pyx_v_c / __pyx_v_a.real);
+
+  /* "DualNum_c/Dual_c.pxd":84
+ * cdef inline dual_t dual_rdiv_scalar(double c, dual_t a) noexcept nogil:
+ *     cdef double q = c / a.real
+ *     return make_dual(q, -q * a.dual / a.real)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_pow(dual_t a, dual_t b) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_q, (((-__pyx_v_q) * __pyx_v_a.dual) / __pyx_v_a.real));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":82
+ *     return make_dual(a.real / c, a.dual / c)
+ * 
+ * cdef inline dual_t dual_rdiv_scalar(double c, dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double q = c / a.real
+ *     return make_dual(q, -q * a.dual / a.real)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":86
+ *     return make_dual(q, -q * a.dual / a.real)
+ * 
+ * cdef inline dual_t dual_pow(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = pow(a.real, b.real)
+ *     return make_dual(p, p * (b.dual * log(a.real) + b.real * a.dual / a.real))
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_pow(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_b) {
+  double __pyx_v_p;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":87
+ * 
+ * cdef inline dual_t dual_pow(dual_t a, dual_t b) noexcept nogil:
+ *     cdef double p = pow(a.real, b.real)             # <<<<<<<<<<<<<<
+ *     return make_dual(p, p * (b.dual * log(a.real) + b.real * a.dual / a.real))
+ * 
+ */
+  __pyx_v_p = pow(__pyx_v_a.real, __pyx_v_b.real);
+
+  /* "DualNum_c/Dual_c.pxd":88
+ * cdef inline dual_t dual_pow(dual_t a, dual_t b) noexcept nogil:
+ *     cdef double p = pow(a.real, b.real)
+ *     return make_dual(p, p * (b.dual * log(a.real) + b.real * a.dual / a.real))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double int_pow(double x, long n) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_p, (__pyx_v_p * ((__pyx_v_b.dual * log(__pyx_v_a.real)) + ((__pyx_v_b.real * __pyx_v_a.dual) / __pyx_v_a.real))));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":86
+ *     return make_dual(q, -q * a.dual / a.real)
+ * 
+ * cdef inline dual_t dual_pow(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = pow(a.real, b.real)
+ *     return make_dual(p, p * (b.dual * log(a.real) + b.real * a.dual / a.real))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":90
+ *     return make_dual(p, p * (b.dual * log(a.real) + b.real * a.dual / a.real))
+ * 
+ * cdef inline double int_pow(double x, long n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Repeated squaring: about log2(|n|) multiplications instead of a pow() call
+ *     cdef unsigned long m = <unsigned long>(-n) if n < 0 else <unsigned long>n
+ */
+
+static CYTHON_INLINE double __pyx_f_9DualNum_c_6Dual_c_int_pow(double __pyx_v_x, long __pyx_v_n) {
+  unsigned long __pyx_v_m;
+  double __pyx_v_result;
+  double __pyx_r;
+  unsigned long __pyx_t_1;
+  int __pyx_t_2;
+  double __pyx_t_3;
+
+  /* "DualNum_c/Dual_c.pxd":92
+ * cdef inline double int_pow(double x, long n) noexcept nogil:
+ *     # Repeated squaring: about log2(|n|) multiplications instead of a pow() call
+ *     cdef unsigned long m = <unsigned long>(-n) if n < 0 else <unsigned long>n             # <<<<<<<<<<<<<<
+ *     cdef double result = 1.0
+ *     while m:
+ */
+  __pyx_t_2 = (__pyx_v_n < 0);
   if (__pyx_t_2) {
+    __pyx_t_1 = ((unsigned long)(-__pyx_v_n));
+  } else {
+    __pyx_t_1 = ((unsigned long)__pyx_v_n);
+  }
+  __pyx_v_m = __pyx_t_1;
+
+  /* "DualNum_c/Dual_c.pxd":93
+ *     # Repeated squaring: about log2(|n|) multiplications instead of a pow() call
+ *     cdef unsigned long m = <unsigned long>(-n) if n < 0 else <unsigned long>n
+ *     cdef double result = 1.0             # <<<<<<<<<<<<<<
+ *     while m:
+ *         if m & 1:
+ */
+  __pyx_v_result = 1.0;
+
+  /* "DualNum_c/Dual_c.pxd":94
+ *     cdef unsigned long m = <unsigned long>(-n) if n < 0 else <unsigned long>n
+ *     cdef double result = 1.0
+ *     while m:             # <<<<<<<<<<<<<<
+ *         if m & 1:
+ *             result *= x
+ */
+  while (1) {
+    __pyx_t_2 = (__pyx_v_m != 0);
+    if (!__pyx_t_2) break;
+
+    /* "DualNum_c/Dual_c.pxd":95
+ *     cdef double result = 1.0
+ *     while m:
+ *         if m & 1:             # <<<<<<<<<<<<<<
+ *             result *= x
+ *         x *= x
+ */
+    __pyx_t_2 = ((__pyx_v_m & 1) != 0);
+    if (__pyx_t_2) {
 
-    /* "DualNum_c/Dual_c.pyx":88
- *         """
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real - other.real, self.dual - other.dual)             # <<<<<<<<<<<<<<
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real - other, self.dual)
+      /* "DualNum_c/Dual_c.pxd":96
+ *     while m:
+ *         if m & 1:
+ *             result *= x             # <<<<<<<<<<<<<<
+ *         x *= x
+ *         m >>= 1
+ */
+      __pyx_v_result = (__pyx_v_result * __pyx_v_x);
+
+      /* "DualNum_c/Dual_c.pxd":95
+ *     cdef double result = 1.0
+ *     while m:
+ *         if m & 1:             # <<<<<<<<<<<<<<
+ *             result *= x
+ *         x *= x
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyNumber_Subtract(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_dual); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PyNumber_Subtract(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = NULL;
-    __pyx_t_8 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_8 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_6, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":87
- *             The value to subtract from the current dual number.
- *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real - other.real, self.dual - other.dual)
- *         if isinstance(other, (float, int)):
+    /* "DualNum_c/Dual_c.pxd":97
+ *         if m & 1:
+ *             result *= x
+ *         x *= x             # <<<<<<<<<<<<<<
+ *         m >>= 1
+ *     return 1.0 / result if n < 0 else result
+ */
+    __pyx_v_x = (__pyx_v_x * __pyx_v_x);
+
+    /* "DualNum_c/Dual_c.pxd":98
+ *             result *= x
+ *         x *= x
+ *         m >>= 1             # <<<<<<<<<<<<<<
+ *     return 1.0 / result if n < 0 else result
+ * 
  */
+    __pyx_v_m = (__pyx_v_m >> 1);
   }
 
-  /* "DualNum_c/Dual_c.pyx":89
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real - other.real, self.dual - other.dual)
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real - other, self.dual)
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":99
+ *         x *= x
+ *         m >>= 1
+ *     return 1.0 / result if n < 0 else result             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_pow_int(dual_t a, long n) noexcept nogil:
  */
-  __pyx_t_9 = PyFloat_Check(__pyx_v_other); 
-  if (!__pyx_t_9) {
+  __pyx_t_2 = (__pyx_v_n < 0);
+  if (__pyx_t_2) {
+    __pyx_t_3 = (1.0 / __pyx_v_result);
   } else {
-    __pyx_t_2 = __pyx_t_9;
-    goto __pyx_L5_bool_binop_done;
+    __pyx_t_3 = __pyx_v_result;
   }
-  __pyx_t_9 = PyInt_Check(__pyx_v_other); 
-  __pyx_t_2 = __pyx_t_9;
-  __pyx_L5_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":90
- *             return Dual_c(self.real - other.real, self.dual - other.dual)
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real - other, self.dual)             # <<<<<<<<<<<<<<
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":90
+ *     return make_dual(p, p * (b.dual * log(a.real) + b.real * a.dual / a.real))
  * 
+ * cdef inline double int_pow(double x, long n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Repeated squaring: about log2(|n|) multiplications instead of a pow() call
+ *     cdef unsigned long m = <unsigned long>(-n) if n < 0 else <unsigned long>n
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 90, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 90, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_6 = PyNumber_Subtract(__pyx_t_7, __pyx_v_other); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 90, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 90, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_4 = NULL;
-    __pyx_t_8 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_8 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_6, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":101
+ *     return 1.0 / result if n < 0 else result
+ * 
+ * cdef inline dual_t dual_pow_int(dual_t a, long n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if n == 0:
+ *         return make_dual(1.0, 0.0)
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_pow_int(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, long __pyx_v_n) {
+  double __pyx_v_p;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+  int __pyx_t_1;
+
+  /* "DualNum_c/Dual_c.pxd":102
+ * 
+ * cdef inline dual_t dual_pow_int(dual_t a, long n) noexcept nogil:
+ *     if n == 0:             # <<<<<<<<<<<<<<
+ *         return make_dual(1.0, 0.0)
+ *     cdef double p = int_pow(a.real, n - 1)
+ */
+  __pyx_t_1 = (__pyx_v_n == 0);
+  if (__pyx_t_1) {
+
+    /* "DualNum_c/Dual_c.pxd":103
+ * cdef inline dual_t dual_pow_int(dual_t a, long n) noexcept nogil:
+ *     if n == 0:
+ *         return make_dual(1.0, 0.0)             # <<<<<<<<<<<<<<
+ *     cdef double p = int_pow(a.real, n - 1)
+ *     return make_dual(p * a.real, n * p * a.dual)
+ */
+    __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(1.0, 0.0);
     goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":89
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real - other.real, self.dual - other.dual)
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real - other, self.dual)
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
+    /* "DualNum_c/Dual_c.pxd":102
+ * 
+ * cdef inline dual_t dual_pow_int(dual_t a, long n) noexcept nogil:
+ *     if n == 0:             # <<<<<<<<<<<<<<
+ *         return make_dual(1.0, 0.0)
+ *     cdef double p = int_pow(a.real, n - 1)
  */
   }
 
-  /* "DualNum_c/Dual_c.pyx":91
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real - other, self.dual)
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))             # <<<<<<<<<<<<<<
+  /* "DualNum_c/Dual_c.pxd":104
+ *     if n == 0:
+ *         return make_dual(1.0, 0.0)
+ *     cdef double p = int_pow(a.real, n - 1)             # <<<<<<<<<<<<<<
+ *     return make_dual(p * a.real, n * p * a.dual)
  * 
- *     def __rsub__(self, other):
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_unsupported_operand_type_s_for_a_2, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 91, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = NULL;
-  __pyx_t_8 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_8 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_7, ((PyObject *)Py_TYPE(__pyx_v_self)), ((PyObject *)Py_TYPE(__pyx_v_other))};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_p = __pyx_f_9DualNum_c_6Dual_c_int_pow(__pyx_v_a.real, (__pyx_v_n - 1));
+
+  /* "DualNum_c/Dual_c.pxd":105
+ *         return make_dual(1.0, 0.0)
+ *     cdef double p = int_pow(a.real, n - 1)
+ *     return make_dual(p * a.real, n * p * a.dual)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_pow_scalar(dual_t a, double c) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual((__pyx_v_p * __pyx_v_a.real), ((__pyx_v_n * __pyx_v_p) * __pyx_v_a.dual));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":101
+ *     return 1.0 / result if n < 0 else result
+ * 
+ * cdef inline dual_t dual_pow_int(dual_t a, long n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if n == 0:
+ *         return make_dual(1.0, 0.0)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":107
+ *     return make_dual(p * a.real, n * p * a.dual)
+ * 
+ * cdef inline dual_t dual_pow_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = pow(a.real, c)
+ *     if a.real == 0:
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_pow_scalar(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, double __pyx_v_c) {
+  double __pyx_v_p;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+  int __pyx_t_1;
+
+  /* "DualNum_c/Dual_c.pxd":108
+ * 
+ * cdef inline dual_t dual_pow_scalar(dual_t a, double c) noexcept nogil:
+ *     cdef double p = pow(a.real, c)             # <<<<<<<<<<<<<<
+ *     if a.real == 0:
+ *         return make_dual(p, c * pow(a.real, c - 1) * a.dual)
+ */
+  __pyx_v_p = pow(__pyx_v_a.real, __pyx_v_c);
+
+  /* "DualNum_c/Dual_c.pxd":109
+ * cdef inline dual_t dual_pow_scalar(dual_t a, double c) noexcept nogil:
+ *     cdef double p = pow(a.real, c)
+ *     if a.real == 0:             # <<<<<<<<<<<<<<
+ *         return make_dual(p, c * pow(a.real, c - 1) * a.dual)
+ *     return make_dual(p, c * p / a.real * a.dual)
+ */
+  __pyx_t_1 = (__pyx_v_a.real == 0.0);
+  if (__pyx_t_1) {
+
+    /* "DualNum_c/Dual_c.pxd":110
+ *     cdef double p = pow(a.real, c)
+ *     if a.real == 0:
+ *         return make_dual(p, c * pow(a.real, c - 1) * a.dual)             # <<<<<<<<<<<<<<
+ *     return make_dual(p, c * p / a.real * a.dual)
+ * 
+ */
+    __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_p, ((__pyx_v_c * pow(__pyx_v_a.real, (__pyx_v_c - 1.0))) * __pyx_v_a.dual));
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pxd":109
+ * cdef inline dual_t dual_pow_scalar(dual_t a, double c) noexcept nogil:
+ *     cdef double p = pow(a.real, c)
+ *     if a.real == 0:             # <<<<<<<<<<<<<<
+ *         return make_dual(p, c * pow(a.real, c - 1) * a.dual)
+ *     return make_dual(p, c * p / a.real * a.dual)
+ */
   }
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 91, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __PYX_ERR(0, 91, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":78
- *         return self.__add__(other)
+  /* "DualNum_c/Dual_c.pxd":111
+ *     if a.real == 0:
+ *         return make_dual(p, c * pow(a.real, c - 1) * a.dual)
+ *     return make_dual(p, c * p / a.real * a.dual)             # <<<<<<<<<<<<<<
  * 
- *     def __sub__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Subtracts one dual number from another dual or int/float.
+ * cdef inline dual_t dual_rpow_scalar(double c, dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_p, (((__pyx_v_c * __pyx_v_p) / __pyx_v_a.real) * __pyx_v_a.dual));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":107
+ *     return make_dual(p * a.real, n * p * a.dual)
+ * 
+ * cdef inline dual_t dual_pow_scalar(dual_t a, double c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = pow(a.real, c)
+ *     if a.real == 0:
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__sub__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":93
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
+/* "DualNum_c/Dual_c.pxd":113
+ *     return make_dual(p, c * p / a.real * a.dual)
  * 
- *     def __rsub__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Subtracts one dual number from another dual or int/float.
+ * cdef inline dual_t dual_rpow_scalar(double c, dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = pow(c, a.real)
+ *     return make_dual(p, p * log(c) * a.dual)
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_9__rsub__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_8__rsub__, "\n        Subtracts one dual number from another dual or int/float.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to subtract from the current dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_9__rsub__ = {"__rsub__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_9__rsub__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_8__rsub__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_9__rsub__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__rsub__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 93, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 93, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__rsub__", 1, 2, 2, 1); __PYX_ERR(0, 93, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__rsub__") < 0)) __PYX_ERR(0, 93, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__rsub__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 93, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rsub__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_8__rsub__(__pyx_self, __pyx_v_self, __pyx_v_other);
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_rpow_scalar(double __pyx_v_c, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  double __pyx_v_p;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":114
+ * 
+ * cdef inline dual_t dual_rpow_scalar(double c, dual_t a) noexcept nogil:
+ *     cdef double p = pow(c, a.real)             # <<<<<<<<<<<<<<
+ *     return make_dual(p, p * log(c) * a.dual)
+ * 
+ */
+  __pyx_v_p = pow(__pyx_v_c, __pyx_v_a.real);
+
+  /* "DualNum_c/Dual_c.pxd":115
+ * cdef inline dual_t dual_rpow_scalar(double c, dual_t a) noexcept nogil:
+ *     cdef double p = pow(c, a.real)
+ *     return make_dual(p, p * log(c) * a.dual)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint dual_eq(dual_t a, dual_t b) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_p, ((__pyx_v_p * log(__pyx_v_c)) * __pyx_v_a.dual));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":113
+ *     return make_dual(p, c * p / a.real * a.dual)
+ * 
+ * cdef inline dual_t dual_rpow_scalar(double c, dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = pow(c, a.real)
+ *     return make_dual(p, p * log(c) * a.dual)
+ */
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
+  __pyx_L0:;
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_8__rsub__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  unsigned int __pyx_t_4;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__rsub__", 1);
+/* "DualNum_c/Dual_c.pxd":117
+ *     return make_dual(p, p * log(c) * a.dual)
+ * 
+ * cdef inline bint dual_eq(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return a.real == b.real and a.dual == b.dual
+ * 
+ */
 
-  /* "DualNum_c/Dual_c.pyx":102
- *             The value to subtract from the current dual number.
- *         """
- *         return self.__sub__(other)             # <<<<<<<<<<<<<<
+static CYTHON_INLINE int __pyx_f_9DualNum_c_6Dual_c_dual_eq(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a, __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_b) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "DualNum_c/Dual_c.pxd":118
+ * 
+ * cdef inline bint dual_eq(dual_t a, dual_t b) noexcept nogil:
+ *     return a.real == b.real and a.dual == b.dual             # <<<<<<<<<<<<<<
+ * 
  * 
- *     def __mul__(self, other):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_sub); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  __pyx_t_4 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_4 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_other};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = (__pyx_v_a.real == __pyx_v_b.real);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
   }
+  __pyx_t_2 = (__pyx_v_a.dual == __pyx_v_b.dual);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
   __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":93
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":117
+ *     return make_dual(p, p * log(c) * a.dual)
+ * 
+ * cdef inline bint dual_eq(dual_t a, dual_t b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return a.real == b.real and a.dual == b.dual
  * 
- *     def __rsub__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Subtracts one dual number from another dual or int/float.
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rsub__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":104
- *         return self.__sub__(other)
+/* "DualNum_c/Dual_c.pxd":122
+ * 
+ * # Elementary functions
+ * cdef inline dual_t dual_sin(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(sin(a.real), a.dual * cos(a.real))
  * 
- *     def __mul__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Multiplies a dual number with another dual number or an int/float.
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_11__mul__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_10__mul__, "\n        Multiplies a dual number with another dual number or an int/float.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to multiply with the current dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_11__mul__ = {"__mul__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_11__mul__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_10__mul__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_11__mul__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__mul__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__mul__", 1, 2, 2, 1); __PYX_ERR(0, 104, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__mul__") < 0)) __PYX_ERR(0, 104, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__mul__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 104, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__mul__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_10__mul__(__pyx_self, __pyx_v_self, __pyx_v_other);
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sin(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":123
+ * # Elementary functions
+ * cdef inline dual_t dual_sin(dual_t a) noexcept nogil:
+ *     return make_dual(sin(a.real), a.dual * cos(a.real))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_cos(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(sin(__pyx_v_a.real), (__pyx_v_a.dual * cos(__pyx_v_a.real)));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":122
+ * 
+ * # Elementary functions
+ * cdef inline dual_t dual_sin(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(sin(a.real), a.dual * cos(a.real))
+ * 
+ */
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
+  __pyx_L0:;
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_10__mul__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  unsigned int __pyx_t_9;
-  int __pyx_t_10;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__mul__", 1);
+/* "DualNum_c/Dual_c.pxd":125
+ *     return make_dual(sin(a.real), a.dual * cos(a.real))
+ * 
+ * cdef inline dual_t dual_cos(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(cos(a.real), -a.dual * sin(a.real))
+ * 
+ */
 
-  /* "DualNum_c/Dual_c.pyx":113
- *             The value to multiply with the current dual number.
- *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real * other.real, self.real * other.dual + self.dual * other.real)
- *         if isinstance(other, (float, int)):
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_cos(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":126
+ * 
+ * cdef inline dual_t dual_cos(dual_t a) noexcept nogil:
+ *     return make_dual(cos(a.real), -a.dual * sin(a.real))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_tan(dual_t a) noexcept nogil:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_IsInstance(__pyx_v_other, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 113, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(cos(__pyx_v_a.real), ((-__pyx_v_a.dual) * sin(__pyx_v_a.real)));
+  goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":114
- *         """
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real * other.real, self.real * other.dual + self.dual * other.real)             # <<<<<<<<<<<<<<
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real * other, self.dual * other)
+  /* "DualNum_c/Dual_c.pxd":125
+ *     return make_dual(sin(a.real), a.dual * cos(a.real))
+ * 
+ * cdef inline dual_t dual_cos(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(cos(a.real), -a.dual * sin(a.real))
+ * 
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyNumber_Multiply(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_dual); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = PyNumber_Multiply(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyNumber_Add(__pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = NULL;
-    __pyx_t_9 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_8);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_9 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_8, __pyx_t_6, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_9, 2+__pyx_t_9);
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":113
- *             The value to multiply with the current dual number.
- *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real * other.real, self.real * other.dual + self.dual * other.real)
- *         if isinstance(other, (float, int)):
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":128
+ *     return make_dual(cos(a.real), -a.dual * sin(a.real))
+ * 
+ * cdef inline dual_t dual_tan(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double t = tan(a.real)
+ *     return make_dual(t, a.dual * (1 + t * t))
  */
-  }
 
-  /* "DualNum_c/Dual_c.pyx":115
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real * other.real, self.real * other.dual + self.dual * other.real)
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real * other, self.dual * other)
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_tan(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  double __pyx_v_t;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":129
+ * 
+ * cdef inline dual_t dual_tan(dual_t a) noexcept nogil:
+ *     cdef double t = tan(a.real)             # <<<<<<<<<<<<<<
+ *     return make_dual(t, a.dual * (1 + t * t))
+ * 
  */
-  __pyx_t_10 = PyFloat_Check(__pyx_v_other); 
-  if (!__pyx_t_10) {
-  } else {
-    __pyx_t_2 = __pyx_t_10;
-    goto __pyx_L5_bool_binop_done;
-  }
-  __pyx_t_10 = PyInt_Check(__pyx_v_other); 
-  __pyx_t_2 = __pyx_t_10;
-  __pyx_L5_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_v_t = tan(__pyx_v_a.real);
 
-    /* "DualNum_c/Dual_c.pyx":116
- *             return Dual_c(self.real * other.real, self.real * other.dual + self.dual * other.real)
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real * other, self.dual * other)             # <<<<<<<<<<<<<<
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":130
+ * cdef inline dual_t dual_tan(dual_t a) noexcept nogil:
+ *     cdef double t = tan(a.real)
+ *     return make_dual(t, a.dual * (1 + t * t))             # <<<<<<<<<<<<<<
  * 
+ * cdef inline dual_t dual_exp(dual_t a) noexcept nogil:
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 116, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyNumber_Multiply(__pyx_t_5, __pyx_v_other); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 116, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 116, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = PyNumber_Multiply(__pyx_t_5, __pyx_v_other); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 116, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = NULL;
-    __pyx_t_9 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_5);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_9 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_6, __pyx_t_8};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_9, 2+__pyx_t_9);
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_t, (__pyx_v_a.dual * (1.0 + (__pyx_v_t * __pyx_v_t))));
+  goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":115
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real * other.real, self.real * other.dual + self.dual * other.real)
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real * other, self.dual * other)
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":128
+ *     return make_dual(cos(a.real), -a.dual * sin(a.real))
+ * 
+ * cdef inline dual_t dual_tan(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double t = tan(a.real)
+ *     return make_dual(t, a.dual * (1 + t * t))
  */
-  }
 
-  /* "DualNum_c/Dual_c.pyx":117
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real * other, self.dual * other)
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":132
+ *     return make_dual(t, a.dual * (1 + t * t))
  * 
- *     def __rmul__(self, other):
+ * cdef inline dual_t dual_exp(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double e = exp(a.real)
+ *     return make_dual(e, a.dual * e)
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_unsupported_operand_type_s_for_a_3, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_8 = NULL;
-  __pyx_t_9 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_8)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_8);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_9 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_8, ((PyObject *)Py_TYPE(__pyx_v_self)), ((PyObject *)Py_TYPE(__pyx_v_other))};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_9, 2+__pyx_t_9);
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __PYX_ERR(0, 117, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":104
- *         return self.__sub__(other)
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_exp(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  double __pyx_v_e;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":133
  * 
- *     def __mul__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Multiplies a dual number with another dual number or an int/float.
+ * cdef inline dual_t dual_exp(dual_t a) noexcept nogil:
+ *     cdef double e = exp(a.real)             # <<<<<<<<<<<<<<
+ *     return make_dual(e, a.dual * e)
+ * 
+ */
+  __pyx_v_e = exp(__pyx_v_a.real);
+
+  /* "DualNum_c/Dual_c.pxd":134
+ * cdef inline dual_t dual_exp(dual_t a) noexcept nogil:
+ *     cdef double e = exp(a.real)
+ *     return make_dual(e, a.dual * e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_log(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_e, (__pyx_v_a.dual * __pyx_v_e));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":132
+ *     return make_dual(t, a.dual * (1 + t * t))
+ * 
+ * cdef inline dual_t dual_exp(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double e = exp(a.real)
+ *     return make_dual(e, a.dual * e)
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__mul__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":119
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
+/* "DualNum_c/Dual_c.pxd":136
+ *     return make_dual(e, a.dual * e)
+ * 
+ * cdef inline dual_t dual_log(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(log(a.real), a.dual / a.real)
  * 
- *     def __rmul__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Multiplies a dual number with another dual number or an int/float.
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_13__rmul__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_12__rmul__, "\n        Multiplies a dual number with another dual number or an int/float.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to multiply with the current dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_13__rmul__ = {"__rmul__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_13__rmul__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_12__rmul__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_13__rmul__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__rmul__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 119, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 119, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__rmul__", 1, 2, 2, 1); __PYX_ERR(0, 119, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__rmul__") < 0)) __PYX_ERR(0, 119, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__rmul__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 119, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rmul__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_12__rmul__(__pyx_self, __pyx_v_self, __pyx_v_other);
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_log(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":137
+ * 
+ * cdef inline dual_t dual_log(dual_t a) noexcept nogil:
+ *     return make_dual(log(a.real), a.dual / a.real)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_sqrt(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(log(__pyx_v_a.real), (__pyx_v_a.dual / __pyx_v_a.real));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":136
+ *     return make_dual(e, a.dual * e)
+ * 
+ * cdef inline dual_t dual_log(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(log(a.real), a.dual / a.real)
+ * 
+ */
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
+  __pyx_L0:;
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_12__rmul__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  unsigned int __pyx_t_4;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__rmul__", 1);
-
-  /* "DualNum_c/Dual_c.pyx":128
- *             The value to multiply with the current dual number.
- *         """
- *         return self.__mul__(other)             # <<<<<<<<<<<<<<
+/* "DualNum_c/Dual_c.pxd":139
+ *     return make_dual(log(a.real), a.dual / a.real)
  * 
- *     def __truediv__(self, other):
+ * cdef inline dual_t dual_sqrt(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double s = sqrt(a.real)
+ *     return make_dual(s, a.dual / (2 * s))
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mul); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  __pyx_t_4 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_4 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_other};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sqrt(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  double __pyx_v_s;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":140
+ * 
+ * cdef inline dual_t dual_sqrt(dual_t a) noexcept nogil:
+ *     cdef double s = sqrt(a.real)             # <<<<<<<<<<<<<<
+ *     return make_dual(s, a.dual / (2 * s))
+ * 
+ */
+  __pyx_v_s = sqrt(__pyx_v_a.real);
+
+  /* "DualNum_c/Dual_c.pxd":141
+ * cdef inline dual_t dual_sqrt(dual_t a) noexcept nogil:
+ *     cdef double s = sqrt(a.real)
+ *     return make_dual(s, a.dual / (2 * s))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_sinh(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(__pyx_v_s, (__pyx_v_a.dual / (2.0 * __pyx_v_s)));
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":119
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pxd":139
+ *     return make_dual(log(a.real), a.dual / a.real)
  * 
- *     def __rmul__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Multiplies a dual number with another dual number or an int/float.
+ * cdef inline dual_t dual_sqrt(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double s = sqrt(a.real)
+ *     return make_dual(s, a.dual / (2 * s))
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rmul__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":130
- *         return self.__mul__(other)
+/* "DualNum_c/Dual_c.pxd":143
+ *     return make_dual(s, a.dual / (2 * s))
  * 
- *     def __truediv__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Divides one dual number by another dual number or an int/float.
+ * cdef inline dual_t dual_sinh(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(sinh(a.real), a.dual * cosh(a.real))
+ * 
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_sinh(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":144
+ * 
+ * cdef inline dual_t dual_sinh(dual_t a) noexcept nogil:
+ *     return make_dual(sinh(a.real), a.dual * cosh(a.real))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_cosh(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(sinh(__pyx_v_a.real), (__pyx_v_a.dual * cosh(__pyx_v_a.real)));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":143
+ *     return make_dual(s, a.dual / (2 * s))
+ * 
+ * cdef inline dual_t dual_sinh(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(sinh(a.real), a.dual * cosh(a.real))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":146
+ *     return make_dual(sinh(a.real), a.dual * cosh(a.real))
+ * 
+ * cdef inline dual_t dual_cosh(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(cosh(a.real), a.dual * sinh(a.real))
+ * 
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_cosh(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":147
+ * 
+ * cdef inline dual_t dual_cosh(dual_t a) noexcept nogil:
+ *     return make_dual(cosh(a.real), a.dual * sinh(a.real))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_tanh(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(cosh(__pyx_v_a.real), (__pyx_v_a.dual * sinh(__pyx_v_a.real)));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":146
+ *     return make_dual(sinh(a.real), a.dual * cosh(a.real))
+ * 
+ * cdef inline dual_t dual_cosh(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(cosh(a.real), a.dual * sinh(a.real))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":149
+ *     return make_dual(cosh(a.real), a.dual * sinh(a.real))
+ * 
+ * cdef inline dual_t dual_tanh(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double c = cosh(a.real)
+ *     return make_dual(tanh(a.real), a.dual / (c * c))
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_tanh(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  double __pyx_v_c;
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":150
+ * 
+ * cdef inline dual_t dual_tanh(dual_t a) noexcept nogil:
+ *     cdef double c = cosh(a.real)             # <<<<<<<<<<<<<<
+ *     return make_dual(tanh(a.real), a.dual / (c * c))
+ * 
+ */
+  __pyx_v_c = cosh(__pyx_v_a.real);
+
+  /* "DualNum_c/Dual_c.pxd":151
+ * cdef inline dual_t dual_tanh(dual_t a) noexcept nogil:
+ *     cdef double c = cosh(a.real)
+ *     return make_dual(tanh(a.real), a.dual / (c * c))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_asin(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(tanh(__pyx_v_a.real), (__pyx_v_a.dual / (__pyx_v_c * __pyx_v_c)));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":149
+ *     return make_dual(cosh(a.real), a.dual * sinh(a.real))
+ * 
+ * cdef inline dual_t dual_tanh(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double c = cosh(a.real)
+ *     return make_dual(tanh(a.real), a.dual / (c * c))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":153
+ *     return make_dual(tanh(a.real), a.dual / (c * c))
+ * 
+ * cdef inline dual_t dual_asin(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(asin(a.real), a.dual / sqrt(1 - a.real * a.real))
+ * 
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_asin(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":154
+ * 
+ * cdef inline dual_t dual_asin(dual_t a) noexcept nogil:
+ *     return make_dual(asin(a.real), a.dual / sqrt(1 - a.real * a.real))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_acos(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(asin(__pyx_v_a.real), (__pyx_v_a.dual / sqrt((1.0 - (__pyx_v_a.real * __pyx_v_a.real)))));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":153
+ *     return make_dual(tanh(a.real), a.dual / (c * c))
+ * 
+ * cdef inline dual_t dual_asin(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(asin(a.real), a.dual / sqrt(1 - a.real * a.real))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":156
+ *     return make_dual(asin(a.real), a.dual / sqrt(1 - a.real * a.real))
+ * 
+ * cdef inline dual_t dual_acos(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(acos(a.real), -a.dual / sqrt(1 - a.real * a.real))
+ * 
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_acos(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":157
+ * 
+ * cdef inline dual_t dual_acos(dual_t a) noexcept nogil:
+ *     return make_dual(acos(a.real), -a.dual / sqrt(1 - a.real * a.real))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dual_t dual_atan(dual_t a) noexcept nogil:
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(acos(__pyx_v_a.real), ((-__pyx_v_a.dual) / sqrt((1.0 - (__pyx_v_a.real * __pyx_v_a.real)))));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":156
+ *     return make_dual(asin(a.real), a.dual / sqrt(1 - a.real * a.real))
+ * 
+ * cdef inline dual_t dual_acos(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(acos(a.real), -a.dual / sqrt(1 - a.real * a.real))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":159
+ *     return make_dual(acos(a.real), -a.dual / sqrt(1 - a.real * a.real))
+ * 
+ * cdef inline dual_t dual_atan(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(atan(a.real), a.dual / (1 + a.real * a.real))
+ */
+
+static CYTHON_INLINE __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_f_9DualNum_c_6Dual_c_dual_atan(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_a) {
+  __pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_r;
+
+  /* "DualNum_c/Dual_c.pxd":160
+ * 
+ * cdef inline dual_t dual_atan(dual_t a) noexcept nogil:
+ *     return make_dual(atan(a.real), a.dual / (1 + a.real * a.real))             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = __pyx_f_9DualNum_c_6Dual_c_make_dual(atan(__pyx_v_a.real), (__pyx_v_a.dual / (1.0 + (__pyx_v_a.real * __pyx_v_a.real))));
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pxd":159
+ *     return make_dual(acos(a.real), -a.dual / sqrt(1 - a.real * a.real))
+ * 
+ * cdef inline dual_t dual_atan(dual_t a) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return make_dual(atan(a.real), a.dual / (1 + a.real * a.real))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":21
+ * 
+ * 
+ * def _set_profiler(profiler):             # <<<<<<<<<<<<<<
+ *     """
+ *     Installs the profiler notified of every primitive call, or removes it if None.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_15__truediv__(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_1_set_profiler(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_14__truediv__, "\n        Divides one dual number by another dual number or an int/float.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to divide the current dual number by.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_15__truediv__ = {"__truediv__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_15__truediv__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_14__truediv__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_15__truediv__(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c__set_profiler, "\n    Installs the profiler notified of every primitive call, or removes it if None.\n    ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_1_set_profiler = {"_set_profiler", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_1_set_profiler, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c__set_profiler};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_1_set_profiler(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
+  PyObject *__pyx_v_profiler = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__truediv__ (wrapper)", 0);
+  __Pyx_RefNannySetupContext("_set_profiler (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -4980,12 +4642,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_profiler,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -4994,39 +4654,27 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_profiler)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 21, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__truediv__", 1, 2, 2, 1); __PYX_ERR(0, 130, __pyx_L3_error)
-        }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__truediv__") < 0)) __PYX_ERR(0, 130, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_set_profiler") < 0)) __PYX_ERR(0, 21, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 2)) {
+    } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
     }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
+    __pyx_v_profiler = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__truediv__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 130, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("_set_profiler", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 21, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5036,11 +4684,11 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__truediv__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c._set_profiler", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_14__truediv__(__pyx_self, __pyx_v_self, __pyx_v_other);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c__set_profiler(__pyx_self, __pyx_v_profiler);
 
   /* function exit code */
   {
@@ -5053,1232 +4701,1341 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_14__truediv__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c__set_profiler(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_profiler) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_set_profiler", 1);
+
+  /* "DualNum_c/Dual_c.pyx":26
+ *     """
+ *     global _profiler, _profiling, _counting
+ *     _profiler = profiler             # <<<<<<<<<<<<<<
+ *     _profiling = _counting = profiler is not None
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_profiler);
+  __Pyx_XGOTREF(__pyx_v_9DualNum_c_6Dual_c__profiler);
+  __Pyx_DECREF_SET(__pyx_v_9DualNum_c_6Dual_c__profiler, __pyx_v_profiler);
+  __Pyx_GIVEREF(__pyx_v_profiler);
+
+  /* "DualNum_c/Dual_c.pyx":27
+ *     global _profiler, _profiling, _counting
+ *     _profiler = profiler
+ *     _profiling = _counting = profiler is not None             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_profiler != Py_None);
+  __pyx_v_9DualNum_c_6Dual_c__profiling = __pyx_t_1;
+  __pyx_v_9DualNum_c_6Dual_c__counting = __pyx_t_1;
+
+  /* "DualNum_c/Dual_c.pyx":21
+ * 
+ * 
+ * def _set_profiler(profiler):             # <<<<<<<<<<<<<<
+ *     """
+ *     Installs the profiler notified of every primitive call, or removes it if None.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":30
+ * 
+ * 
+ * cdef object _profiled(str name, object method, tuple args):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calls a primitive with profiling suspended and reports its time and allocations.
+ */
+
+static PyObject *__pyx_f_9DualNum_c_6Dual_c__profiled(PyObject *__pyx_v_name, PyObject *__pyx_v_method, PyObject *__pyx_v_args) {
+  PyObject *__pyx_v_start = NULL;
+  PyObject *__pyx_v_elapsed = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
+  unsigned int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  char const *__pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
-  unsigned int __pyx_t_9;
-  int __pyx_t_10;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__truediv__", 1);
+  __Pyx_RefNannySetupContext("_profiled", 1);
 
-  /* "DualNum_c/Dual_c.pyx":139
- *             The value to divide the current dual number by.
- *         """
- *         if other.real == 0:             # <<<<<<<<<<<<<<
- *             raise ZeroDivisionError("division by zero is undefined")
- *         if isinstance(other, Dual_c):
+  /* "DualNum_c/Dual_c.pyx":35
+ *     """
+ *     global _profiling, _constructed
+ *     _profiling = False             # <<<<<<<<<<<<<<
+ *     _constructed = 0
+ *     start = perf_counter_ns()
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_1, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 139, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(__pyx_t_2)) {
-
-    /* "DualNum_c/Dual_c.pyx":140
- *         """
- *         if other.real == 0:
- *             raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
+  __pyx_v_9DualNum_c_6Dual_c__profiling = 0;
+
+  /* "DualNum_c/Dual_c.pyx":36
+ *     global _profiling, _constructed
+ *     _profiling = False
+ *     _constructed = 0             # <<<<<<<<<<<<<<
+ *     start = perf_counter_ns()
+ *     try:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 140, __pyx_L1_error)
-
-    /* "DualNum_c/Dual_c.pyx":139
- *             The value to divide the current dual number by.
- *         """
- *         if other.real == 0:             # <<<<<<<<<<<<<<
- *             raise ZeroDivisionError("division by zero is undefined")
- *         if isinstance(other, Dual_c):
+  __pyx_v_9DualNum_c_6Dual_c__constructed = 0;
+
+  /* "DualNum_c/Dual_c.pyx":37
+ *     _profiling = False
+ *     _constructed = 0
+ *     start = perf_counter_ns()             # <<<<<<<<<<<<<<
+ *     try:
+ *         return method(*args)
  */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_perf_counter_ns); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 0+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
+  __pyx_v_start = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-  /* "DualNum_c/Dual_c.pyx":141
- *         if other.real == 0:
- *             raise ZeroDivisionError("division by zero is undefined")
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
- *         if isinstance(other, (float, int)):
+  /* "DualNum_c/Dual_c.pyx":38
+ *     _constructed = 0
+ *     start = perf_counter_ns()
+ *     try:             # <<<<<<<<<<<<<<
+ *         return method(*args)
+ *     finally:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_IsInstance(__pyx_v_other, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 141, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
-
-    /* "DualNum_c/Dual_c.pyx":142
- *             raise ZeroDivisionError("division by zero is undefined")
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))             # <<<<<<<<<<<<<<
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real / other, self.dual / other)
+  /*try:*/ {
+
+    /* "DualNum_c/Dual_c.pyx":39
+ *     start = perf_counter_ns()
+ *     try:
+ *         return method(*args)             # <<<<<<<<<<<<<<
+ *     finally:
+ *         elapsed = perf_counter_ns() - start
  */
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyNumber_Divide(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = PyNumber_Multiply(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyNumber_Subtract(__pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_7 = PyNumber_Power(__pyx_t_8, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = NULL;
-    __pyx_t_9 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_7)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_7);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_9 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_7, __pyx_t_6, __pyx_t_8};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_9, 2+__pyx_t_9);
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(__pyx_v_args == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 39, __pyx_L4_error)
     }
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_method, __pyx_v_args, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L4_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __pyx_r = __pyx_t_1;
     __pyx_t_1 = 0;
-    goto __pyx_L0;
-
-    /* "DualNum_c/Dual_c.pyx":141
- *         if other.real == 0:
- *             raise ZeroDivisionError("division by zero is undefined")
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
- *         if isinstance(other, (float, int)):
- */
+    goto __pyx_L3_return;
   }
 
-  /* "DualNum_c/Dual_c.pyx":143
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real / other, self.dual / other)
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pyx":41
+ *         return method(*args)
+ *     finally:
+ *         elapsed = perf_counter_ns() - start             # <<<<<<<<<<<<<<
+ *         _profiling = True
+ *         _profiler._record("Dual_c", name, elapsed, _constructed)
  */
-  __pyx_t_10 = PyFloat_Check(__pyx_v_other); 
-  if (!__pyx_t_10) {
-  } else {
-    __pyx_t_2 = __pyx_t_10;
-    goto __pyx_L6_bool_binop_done;
-  }
-  __pyx_t_10 = PyInt_Check(__pyx_v_other); 
-  __pyx_t_2 = __pyx_t_10;
-  __pyx_L6_bool_binop_done:;
-  if (__pyx_t_2) {
+  /*finally:*/ {
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10) < 0)) __Pyx_ErrFetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __pyx_t_5 = __pyx_lineno; __pyx_t_6 = __pyx_clineno; __pyx_t_7 = __pyx_filename;
+      {
+        __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_perf_counter_ns); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_3 = NULL;
+        __pyx_t_4 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_2))) {
+          __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+          if (likely(__pyx_t_3)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+            __Pyx_INCREF(__pyx_t_3);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_2, function);
+            __pyx_t_4 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
+          __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 0+__pyx_t_4);
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        }
+        __pyx_t_2 = PyNumber_Subtract(__pyx_t_1, __pyx_v_start); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_v_elapsed = __pyx_t_2;
+        __pyx_t_2 = 0;
+
+        /* "DualNum_c/Dual_c.pyx":42
+ *     finally:
+ *         elapsed = perf_counter_ns() - start
+ *         _profiling = True             # <<<<<<<<<<<<<<
+ *         _profiler._record("Dual_c", name, elapsed, _constructed)
+ * 
+ */
+        __pyx_v_9DualNum_c_6Dual_c__profiling = 1;
 
-    /* "DualNum_c/Dual_c.pyx":144
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real / other, self.dual / other)             # <<<<<<<<<<<<<<
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+        /* "DualNum_c/Dual_c.pyx":43
+ *         elapsed = perf_counter_ns() - start
+ *         _profiling = True
+ *         _profiler._record("Dual_c", name, elapsed, _constructed)             # <<<<<<<<<<<<<<
+ * 
  * 
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 144, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 144, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_6 = __Pyx_PyNumber_Divide(__pyx_t_8, __pyx_v_other); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 144, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 144, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_7 = __Pyx_PyNumber_Divide(__pyx_t_8, __pyx_v_other); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 144, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = NULL;
-    __pyx_t_9 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_8);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_9 = 1;
+        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_9DualNum_c_6Dual_c__profiler, __pyx_n_s_record); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 43, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_9DualNum_c_6Dual_c__constructed); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 43, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_14 = NULL;
+        __pyx_t_4 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (likely(PyMethod_Check(__pyx_t_1))) {
+          __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_1);
+          if (likely(__pyx_t_14)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+            __Pyx_INCREF(__pyx_t_14);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_1, function);
+            __pyx_t_4 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[5] = {__pyx_t_14, __pyx_n_u_Dual_c, __pyx_v_name, __pyx_v_elapsed, __pyx_t_3};
+          __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_1, __pyx_callargs+1-__pyx_t_4, 4+__pyx_t_4);
+          __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 43, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+      }
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_ErrRestore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0;
+      __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_6; __pyx_filename = __pyx_t_7;
+      goto __pyx_L1_error;
+      __pyx_L7_error:;
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
       }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_8, __pyx_t_6, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_9, 2+__pyx_t_9);
       __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0;
+      goto __pyx_L1_error;
+    }
+    __pyx_L3_return: {
+      __pyx_t_13 = __pyx_r;
+      __pyx_r = 0;
+
+      /* "DualNum_c/Dual_c.pyx":41
+ *         return method(*args)
+ *     finally:
+ *         elapsed = perf_counter_ns() - start             # <<<<<<<<<<<<<<
+ *         _profiling = True
+ *         _profiler._record("Dual_c", name, elapsed, _constructed)
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_perf_counter_ns); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
-
-    /* "DualNum_c/Dual_c.pyx":143
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
- *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real / other, self.dual / other)
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+      __pyx_t_3 = NULL;
+      __pyx_t_4 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (unlikely(PyMethod_Check(__pyx_t_1))) {
+        __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+        if (likely(__pyx_t_3)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+          __Pyx_INCREF(__pyx_t_3);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_1, function);
+          __pyx_t_4 = 1;
+        }
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
+        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_1, __pyx_callargs+1-__pyx_t_4, 0+__pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      }
+      __pyx_t_1 = PyNumber_Subtract(__pyx_t_2, __pyx_v_start); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_v_elapsed = __pyx_t_1;
+      __pyx_t_1 = 0;
+
+      /* "DualNum_c/Dual_c.pyx":42
+ *     finally:
+ *         elapsed = perf_counter_ns() - start
+ *         _profiling = True             # <<<<<<<<<<<<<<
+ *         _profiler._record("Dual_c", name, elapsed, _constructed)
+ * 
  */
-  }
+      __pyx_v_9DualNum_c_6Dual_c__profiling = 1;
 
-  /* "DualNum_c/Dual_c.pyx":145
- *         if isinstance(other, (float, int)):
- *             return Dual_c(self.real / other, self.dual / other)
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))             # <<<<<<<<<<<<<<
+      /* "DualNum_c/Dual_c.pyx":43
+ *         elapsed = perf_counter_ns() - start
+ *         _profiling = True
+ *         _profiler._record("Dual_c", name, elapsed, _constructed)             # <<<<<<<<<<<<<<
+ * 
  * 
- *     def __rtruediv__(self, other):
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_unsupported_operand_type_s_for_a_4, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = NULL;
-  __pyx_t_9 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_9 = 1;
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_9DualNum_c_6Dual_c__profiler, __pyx_n_s_record); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 43, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_9DualNum_c_6Dual_c__constructed); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 43, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_14 = NULL;
+      __pyx_t_4 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (likely(PyMethod_Check(__pyx_t_2))) {
+        __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_2);
+        if (likely(__pyx_t_14)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+          __Pyx_INCREF(__pyx_t_14);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_2, function);
+          __pyx_t_4 = 1;
+        }
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[5] = {__pyx_t_14, __pyx_n_u_Dual_c, __pyx_v_name, __pyx_v_elapsed, __pyx_t_3};
+        __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 4+__pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 43, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_r = __pyx_t_13;
+      __pyx_t_13 = 0;
+      goto __pyx_L0;
     }
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_7, ((PyObject *)Py_TYPE(__pyx_v_self)), ((PyObject *)Py_TYPE(__pyx_v_other))};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_9, 2+__pyx_t_9);
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 145, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __PYX_ERR(0, 145, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":130
- *         return self.__mul__(other)
+  /* "DualNum_c/Dual_c.pyx":30
  * 
- *     def __truediv__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Divides one dual number by another dual number or an int/float.
+ * 
+ * cdef object _profiled(str name, object method, tuple args):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calls a primitive with profiling suspended and reports its time and allocations.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__truediv__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("DualNum_c.Dual_c._profiled", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_start);
+  __Pyx_XDECREF(__pyx_v_elapsed);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":147
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+/* "DualNum_c/Dual_c.pyx":46
  * 
- *     def __rtruediv__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Divides one dual number by another dual number or an int/float.
+ * 
+ * cdef inline Dual_c _new(double real, double dual):             # <<<<<<<<<<<<<<
+ *     """
+ *     Builds a Dual_c without going through __init__ (no type checks).
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__, "\n        Divides one dual number by another dual number or an int/float.\n\n        Parameters\n        ----------\n        other : Dual, int, or float\n            The value to divide the current dual number by.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__ = {"__rtruediv__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+static CYTHON_INLINE struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_f_9DualNum_c_6Dual_c__new(double __pyx_v_real, double __pyx_v_dual) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_result = 0;
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__rtruediv__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__rtruediv__", 1, 2, 2, 1); __PYX_ERR(0, 147, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__rtruediv__") < 0)) __PYX_ERR(0, 147, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__rtruediv__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 147, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
+  __Pyx_RefNannySetupContext("_new", 1);
+
+  /* "DualNum_c/Dual_c.pyx":51
+ *     """
+ *     global _constructed
+ *     cdef Dual_c result = Dual_c.__new__(Dual_c)             # <<<<<<<<<<<<<<
+ *     result.real = real
+ *     result.dual = dual
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_tp_new_9DualNum_c_6Dual_c_Dual_c(((PyTypeObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF((PyObject *)__pyx_t_1);
+  __pyx_v_result = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":52
+ *     global _constructed
+ *     cdef Dual_c result = Dual_c.__new__(Dual_c)
+ *     result.real = real             # <<<<<<<<<<<<<<
+ *     result.dual = dual
+ *     if _counting:
+ */
+  __pyx_v_result->real = __pyx_v_real;
+
+  /* "DualNum_c/Dual_c.pyx":53
+ *     cdef Dual_c result = Dual_c.__new__(Dual_c)
+ *     result.real = real
+ *     result.dual = dual             # <<<<<<<<<<<<<<
+ *     if _counting:
+ *         _constructed += 1
+ */
+  __pyx_v_result->dual = __pyx_v_dual;
+
+  /* "DualNum_c/Dual_c.pyx":54
+ *     result.real = real
+ *     result.dual = dual
+ *     if _counting:             # <<<<<<<<<<<<<<
+ *         _constructed += 1
+ *     return result
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__counting) {
+
+    /* "DualNum_c/Dual_c.pyx":55
+ *     result.dual = dual
+ *     if _counting:
+ *         _constructed += 1             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+ */
+    __pyx_v_9DualNum_c_6Dual_c__constructed = (__pyx_v_9DualNum_c_6Dual_c__constructed + 1);
+
+    /* "DualNum_c/Dual_c.pyx":54
+ *     result.real = real
+ *     result.dual = dual
+ *     if _counting:             # <<<<<<<<<<<<<<
+ *         _constructed += 1
+ *     return result
+ */
   }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rtruediv__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__(__pyx_self, __pyx_v_self, __pyx_v_other);
+
+  /* "DualNum_c/Dual_c.pyx":56
+ *     if _counting:
+ *         _constructed += 1
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __Pyx_INCREF((PyObject *)__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":46
+ * 
+ * 
+ * cdef inline Dual_c _new(double real, double dual):             # <<<<<<<<<<<<<<
+ *     """
+ *     Builds a Dual_c without going through __init__ (no type checks).
+ */
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("DualNum_c.Dual_c._new", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_result);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
+/* "DualNum_c/Dual_c.pyx":59
+ * 
+ * 
+ * cdef inline Dual_c _box(dual_t x):             # <<<<<<<<<<<<<<
+ *     """
+ *     Builds a Dual_c holding a C dual number.
+ */
+
+static CYTHON_INLINE struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_f_9DualNum_c_6Dual_c__box(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_x) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  unsigned int __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__rtruediv__", 1);
+  __Pyx_RefNannySetupContext("_box", 1);
 
-  /* "DualNum_c/Dual_c.pyx":156
- *             The value to divide the current dual number by.
- *         """
- *         return self.__truediv__(other)             # <<<<<<<<<<<<<<
+  /* "DualNum_c/Dual_c.pyx":63
+ *     Builds a Dual_c holding a C dual number.
+ *     """
+ *     return _new(x.real, x.dual)             # <<<<<<<<<<<<<<
+ * 
  * 
- *     def __pow__(self, other):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_truediv); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  __pyx_t_4 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_4 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_other};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __pyx_r = __pyx_t_1;
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __pyx_t_1 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__new(__pyx_v_x.real, __pyx_v_x.dual)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_1);
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":147
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pyx":59
  * 
- *     def __rtruediv__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Divides one dual number by another dual number or an int/float.
+ * 
+ * cdef inline Dual_c _box(dual_t x):             # <<<<<<<<<<<<<<
+ *     """
+ *     Builds a Dual_c holding a C dual number.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("DualNum_c.Dual_c._box", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":66
+ * 
+ * 
+ * cdef Dual_c from_dual(dual_t x):             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns a Dual_c holding a C dual number; part of the C-level interface in Dual_c.pxd.
+ */
+
+static struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_f_9DualNum_c_6Dual_c_from_dual(__pyx_t_9DualNum_c_6Dual_c_dual_t __pyx_v_x) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("from_dual", 1);
+
+  /* "DualNum_c/Dual_c.pyx":70
+ *     Returns a Dual_c holding a C dual number; part of the C-level interface in Dual_c.pxd.
+ *     """
+ *     return _box(x)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __pyx_t_1 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_v_x)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":66
+ * 
+ * 
+ * cdef Dual_c from_dual(dual_t x):             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns a Dual_c holding a C dual number; part of the C-level interface in Dual_c.pxd.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.from_dual", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":73
+ * 
+ * 
+ * cdef Dual_c _pow_int(Dual_c x, long n):             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns x ** n for an integer n.
+ */
+
+static struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_f_9DualNum_c_6Dual_c__pow_int(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_x, long __pyx_v_n) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_pow_int", 1);
+
+  /* "DualNum_c/Dual_c.pyx":77
+ *     Returns x ** n for an integer n.
+ *     """
+ *     if n < 0 and x.real == 0:             # <<<<<<<<<<<<<<
+ *         raise ZeroDivisionError("division by zero is undefined")
+ *     return _box(dual_pow_int(as_dual(x), n))
+ */
+  __pyx_t_2 = (__pyx_v_n < 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_x->real == 0.0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "DualNum_c/Dual_c.pyx":78
+ *     """
+ *     if n < 0 and x.real == 0:
+ *         raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *     return _box(dual_pow_int(as_dual(x), n))
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 78, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":77
+ *     Returns x ** n for an integer n.
+ *     """
+ *     if n < 0 and x.real == 0:             # <<<<<<<<<<<<<<
+ *         raise ZeroDivisionError("division by zero is undefined")
+ *     return _box(dual_pow_int(as_dual(x), n))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":79
+ *     if n < 0 and x.real == 0:
+ *         raise ZeroDivisionError("division by zero is undefined")
+ *     return _box(dual_pow_int(as_dual(x), n))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_pow_int(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_x), __pyx_v_n))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_3);
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":73
+ * 
+ * 
+ * cdef Dual_c _pow_int(Dual_c x, long n):             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns x ** n for an integer n.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rtruediv__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_AddTraceback("DualNum_c.Dual_c._pow_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":158
- *         return self.__truediv__(other)
+/* "DualNum_c/Dual_c.pyx":112
  * 
- *     def __pow__(self, other):             # <<<<<<<<<<<<<<
+ *     # Special Methods
+ *     def __init__(self, real, dual):             # <<<<<<<<<<<<<<
  *         """
- *         Raises the dual number to the power of another dual number.
+ *         Constructs all the necessary attributes for the Dual object.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_19__pow__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_18__pow__, "\n        Raises the dual number to the power of another dual number.\n\n        Parameters\n        ----------\n        other : Dual\n            The dual number to raise the current dual number to the power of.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_19__pow__ = {"__pow__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_19__pow__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_18__pow__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_19__pow__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static int __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c___init__, "\n        Constructs all the necessary attributes for the Dual object.\n\n        Parameters\n        ----------\n\n        real : float\n            The real part of the dual number.\n\n        dual : float\n            The dual part of the dual number.\n\n        Raises\n        ------\n        TypeError\n            If 'real' or 'dual' is not of type float or int.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c___init__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
+static int __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_real = 0;
+  PyObject *__pyx_v_dual = 0;
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject* values[2] = {0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pow__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
   #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_real,&__pyx_n_s_dual,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        case  2: values[1] = __Pyx_Arg_VARARGS(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        case  1: values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      kw_args = __Pyx_NumKwargs_VARARGS(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+        if (likely((values[0] = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_real)) != 0)) {
+          (void)__Pyx_Arg_NewRef_VARARGS(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 112, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+        if (likely((values[1] = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_dual)) != 0)) {
+          (void)__Pyx_Arg_NewRef_VARARGS(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 112, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("__pow__", 1, 2, 2, 1); __PYX_ERR(0, 158, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 112, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__pow__") < 0)) __PYX_ERR(0, 158, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 112, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
+      values[1] = __Pyx_Arg_VARARGS(__pyx_args, 1);
     }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
+    __pyx_v_real = values[0];
+    __pyx_v_dual = values[1];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pow__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 158, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 112, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__pow__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
-  return NULL;
+  return -1;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_18__pow__(__pyx_self, __pyx_v_self, __pyx_v_other);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c___init__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), __pyx_v_real, __pyx_v_dual);
 
   /* function exit code */
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
     }
   }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_18__pow__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
+static int __pyx_pf_9DualNum_c_6Dual_c_6Dual_c___init__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_real, PyObject *__pyx_v_dual) {
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
   int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  unsigned int __pyx_t_11;
+  double __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pow__", 1);
+  __Pyx_RefNannySetupContext("__init__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":167
- *             The dual number to raise the current dual number to the power of.
+  /* "DualNum_c/Dual_c.pyx":130
+ *             If 'real' or 'dual' is not of type float or int.
  *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real ** other.real, self.real ** other.real * (other.dual * math.log(self.real) + other.real * self.dual / self.real))
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+ *         if not isinstance(real, (float, int)):             # <<<<<<<<<<<<<<
+ *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+ * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_IsInstance(__pyx_v_other, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
+  __pyx_t_2 = PyFloat_Check(__pyx_v_real); 
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = PyInt_Check(__pyx_v_real); 
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  __pyx_t_2 = (!__pyx_t_1);
+  if (unlikely(__pyx_t_2)) {
 
-    /* "DualNum_c/Dual_c.pyx":168
+    /* "DualNum_c/Dual_c.pyx":131
  *         """
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real ** other.real, self.real ** other.real * (other.dual * math.log(self.real) + other.real * self.dual / self.real))             # <<<<<<<<<<<<<<
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+ *         if not isinstance(real, (float, int)):
+ *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")             # <<<<<<<<<<<<<<
  * 
+ *         if not isinstance(dual, (float, int)):
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyNumber_Power(__pyx_t_4, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 127;
+    __Pyx_INCREF(__pyx_kp_u_Expected_real_to_be_of_type_floa);
+    __pyx_t_4 += 48;
+    __Pyx_GIVEREF(__pyx_kp_u_Expected_real_to_be_of_type_floa);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_Expected_real_to_be_of_type_floa);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)Py_TYPE(__pyx_v_real)), __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PyNumber_Power(__pyx_t_5, __pyx_t_4, Py_None); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_FormatSimple(__pyx_t_6, __pyx_empty_unicode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_dual); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_math); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_log); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_10 = NULL;
-    __pyx_t_11 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_9))) {
-      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
-      if (likely(__pyx_t_10)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
-        __Pyx_INCREF(__pyx_t_10);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_9, function);
-        __pyx_t_11 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_10, __pyx_t_8};
-      __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_9, __pyx_callargs+1-__pyx_t_11, 1+__pyx_t_11);
-      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    }
-    __pyx_t_9 = PyNumber_Multiply(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_8 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyNumber_Divide(__pyx_t_8, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyNumber_Add(__pyx_t_9, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyNumber_Multiply(__pyx_t_7, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_5 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_7) > __pyx_t_5) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_7) : __pyx_t_5;
+    __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_7);
+    __pyx_t_7 = 0;
+    __Pyx_INCREF(__pyx_kp_u_instead);
+    __pyx_t_4 += 9;
+    __Pyx_GIVEREF(__pyx_kp_u_instead);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_kp_u_instead);
+    __pyx_t_7 = __Pyx_PyUnicode_Join(__pyx_t_3, 3, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = NULL;
-    __pyx_t_11 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_11 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_6, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_11, 2+__pyx_t_11);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 131, __pyx_L1_error)
 
-    /* "DualNum_c/Dual_c.pyx":167
- *             The dual number to raise the current dual number to the power of.
+    /* "DualNum_c/Dual_c.pyx":130
+ *             If 'real' or 'dual' is not of type float or int.
  *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return Dual_c(self.real ** other.real, self.real ** other.real * (other.dual * math.log(self.real) + other.real * self.dual / self.real))
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+ *         if not isinstance(real, (float, int)):             # <<<<<<<<<<<<<<
+ *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+ * 
  */
   }
 
-  /* "DualNum_c/Dual_c.pyx":169
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real ** other.real, self.real ** other.real * (other.dual * math.log(self.real) + other.real * self.dual / self.real))
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))             # <<<<<<<<<<<<<<
+  /* "DualNum_c/Dual_c.pyx":133
+ *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
  * 
- *     def __eq__(self, other):
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_unsupported_operand_type_s_for_a_5, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 169, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = NULL;
-  __pyx_t_11 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_11 = 1;
-    }
+ *         if not isinstance(dual, (float, int)):             # <<<<<<<<<<<<<<
+ *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
+ * 
+ */
+  __pyx_t_1 = PyFloat_Check(__pyx_v_dual); 
+  if (!__pyx_t_1) {
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+    goto __pyx_L7_bool_binop_done;
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_5, ((PyObject *)Py_TYPE(__pyx_v_self)), ((PyObject *)Py_TYPE(__pyx_v_other))};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_11, 2+__pyx_t_11);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_1 = PyInt_Check(__pyx_v_dual); 
+  __pyx_t_2 = __pyx_t_1;
+  __pyx_L7_bool_binop_done:;
+  __pyx_t_1 = (!__pyx_t_2);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "DualNum_c/Dual_c.pyx":134
+ * 
+ *         if not isinstance(dual, (float, int)):
+ *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")             # <<<<<<<<<<<<<<
+ * 
+ *         self.real = real
+ */
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 127;
+    __Pyx_INCREF(__pyx_kp_u_Expected_dual_to_be_of_type_floa);
+    __pyx_t_4 += 48;
+    __Pyx_GIVEREF(__pyx_kp_u_Expected_dual_to_be_of_type_floa);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_Expected_dual_to_be_of_type_floa);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)Py_TYPE(__pyx_v_dual)), __pyx_n_s_name); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_t_7, __pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_5 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) > __pyx_t_5) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) : __pyx_t_5;
+    __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __Pyx_INCREF(__pyx_kp_u_instead);
+    __pyx_t_4 += 9;
+    __Pyx_GIVEREF(__pyx_kp_u_instead);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_kp_u_instead);
+    __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_3, 3, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 134, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":133
+ *             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+ * 
+ *         if not isinstance(dual, (float, int)):             # <<<<<<<<<<<<<<
+ *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
+ * 
+ */
   }
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 169, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __PYX_ERR(0, 169, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":158
- *         return self.__truediv__(other)
+  /* "DualNum_c/Dual_c.pyx":136
+ *             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
+ * 
+ *         self.real = real             # <<<<<<<<<<<<<<
+ *         self.dual = dual
+ * 
+ */
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_real); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 136, __pyx_L1_error)
+  __pyx_v_self->real = __pyx_t_8;
+
+  /* "DualNum_c/Dual_c.pyx":137
+ * 
+ *         self.real = real
+ *         self.dual = dual             # <<<<<<<<<<<<<<
+ * 
+ *     def __add__(Dual_c self, other):
+ */
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_dual); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_v_self->dual = __pyx_t_8;
+
+  /* "DualNum_c/Dual_c.pyx":112
  * 
- *     def __pow__(self, other):             # <<<<<<<<<<<<<<
+ *     # Special Methods
+ *     def __init__(self, real, dual):             # <<<<<<<<<<<<<<
  *         """
- *         Raises the dual number to the power of another dual number.
+ *         Constructs all the necessary attributes for the Dual object.
  */
 
   /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__pow__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":171
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+/* "DualNum_c/Dual_c.pyx":139
+ *         self.dual = dual
  * 
- *     def __eq__(self, other):             # <<<<<<<<<<<<<<
+ *     def __add__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Checks if two dual numbers are equal.
+ *         Adds a dual number and another dual number or scalar.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_21__eq__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_20__eq__, "\n        Checks if two dual numbers are equal.\n\n        Parameters\n        ----------\n        other : Dual\n            The dual number to compare with the current dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_21__eq__ = {"__eq__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_21__eq__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_20__eq__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_21__eq__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_3__add__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_2__add__, "\n        Adds a dual number and another dual number or scalar.\n\n        Parameters\n        ----------\n        other : Dual_c, int, or float\n            The value to add to the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_2__add__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_other = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_3__add__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__eq__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_other,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 171, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_other)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 171, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("__eq__", 1, 2, 2, 1); __PYX_ERR(0, 171, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__eq__") < 0)) __PYX_ERR(0, 171, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_other = values[1];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__eq__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 171, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__eq__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_20__eq__(__pyx_self, __pyx_v_self, __pyx_v_other);
+  __Pyx_RefNannySetupContext("__add__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_2__add__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_20__eq__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_2__add__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_o = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__eq__", 1);
+  __Pyx_RefNannySetupContext("__add__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":180
- *             The dual number to compare with the current dual number.
+  /* "DualNum_c/Dual_c.pyx":148
+ *             The value to add to the current dual number.
  *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return self.real == other.real and self.dual == other.dual
- *         return False
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__add__", Dual_c.__add__, (self, other))
+ *         cdef Dual_c o
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_IsInstance(__pyx_v_other, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
 
-    /* "DualNum_c/Dual_c.pyx":181
+    /* "DualNum_c/Dual_c.pyx":149
  *         """
+ *         if _profiling:
+ *             return _profiled("__add__", Dual_c.__add__, (self, other))             # <<<<<<<<<<<<<<
+ *         cdef Dual_c o
  *         if isinstance(other, Dual_c):
- *             return self.real == other.real and self.dual == other.dual             # <<<<<<<<<<<<<<
- *         return False
- * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_add); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 149, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 149, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_add, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 181, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyObject_RichCompare(__pyx_t_3, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 181, __pyx_L1_error)
-    if (__pyx_t_2) {
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else {
-      __Pyx_INCREF(__pyx_t_5);
-      __pyx_t_1 = __pyx_t_5;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      goto __pyx_L4_bool_binop_done;
-    }
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_other, __pyx_n_s_dual); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 181, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyObject_RichCompare(__pyx_t_5, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 181, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_INCREF(__pyx_t_3);
-    __pyx_t_1 = __pyx_t_3;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_L4_bool_binop_done:;
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":180
- *             The dual number to compare with the current dual number.
+    /* "DualNum_c/Dual_c.pyx":148
+ *             The value to add to the current dual number.
  *         """
- *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
- *             return self.real == other.real and self.dual == other.dual
- *         return False
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__add__", Dual_c.__add__, (self, other))
+ *         cdef Dual_c o
  */
   }
 
-  /* "DualNum_c/Dual_c.pyx":182
+  /* "DualNum_c/Dual_c.pyx":151
+ *             return _profiled("__add__", Dual_c.__add__, (self, other))
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return _box(dual_add(as_dual(self), as_dual(o)))
+ */
+  __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_other, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c); 
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":152
+ *         cdef Dual_c o
  *         if isinstance(other, Dual_c):
- *             return self.real == other.real and self.dual == other.dual
- *         return False             # <<<<<<<<<<<<<<
- * 
- * 
+ *             o = <Dual_c>other             # <<<<<<<<<<<<<<
+ *             return _box(dual_add(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(Py_False);
-  __pyx_r = Py_False;
-  goto __pyx_L0;
+    __pyx_t_3 = __pyx_v_other;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_o = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_3);
+    __pyx_t_3 = 0;
 
-  /* "DualNum_c/Dual_c.pyx":171
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
- * 
- *     def __eq__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Checks if two dual numbers are equal.
+    /* "DualNum_c/Dual_c.pyx":153
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             return _box(dual_add(as_dual(self), as_dual(o)))             # <<<<<<<<<<<<<<
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_add_scalar(as_dual(self), other))
  */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_add(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_o)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__eq__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+    /* "DualNum_c/Dual_c.pyx":151
+ *             return _profiled("__add__", Dual_c.__add__, (self, other))
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return _box(dual_add(as_dual(self), as_dual(o)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":154
+ *             o = <Dual_c>other
+ *             return _box(dual_add(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             return _box(dual_add_scalar(as_dual(self), other))
+ *         return NotImplemented
+ */
+  __pyx_t_5 = PyFloat_Check(__pyx_v_other); 
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_5 = PyInt_Check(__pyx_v_other); 
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":155
+ *             return _box(dual_add(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_add_scalar(as_dual(self), other))             # <<<<<<<<<<<<<<
+ *         return NotImplemented
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_add_scalar(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_t_6))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":154
+ *             o = <Dual_c>other
+ *             return _box(dual_add(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             return _box(dual_add_scalar(as_dual(self), other))
+ *         return NotImplemented
+ */
+  }
 
-/* "DualNum_c/Dual_c.pyx":186
+  /* "DualNum_c/Dual_c.pyx":156
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_add_scalar(as_dual(self), other))
+ *         return NotImplemented             # <<<<<<<<<<<<<<
  * 
+ *     def __radd__(Dual_c self, other):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_builtin_NotImplemented);
+  __pyx_r = __pyx_builtin_NotImplemented;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":139
+ *         self.dual = dual
  * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *     def __add__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns a string representation of the dual number.
+ *         Adds a dual number and another dual number or scalar.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__add__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_o);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":158
+ *         return NotImplemented
+ * 
+ *     def __radd__(Dual_c self, other):             # <<<<<<<<<<<<<<
+ *         """
+ *         Adds a dual number and another dual number or scalar.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_23__repr__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_22__repr__, "\n        Returns a string representation of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_23__repr__ = {"__repr__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_23__repr__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_22__repr__};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_23__repr__(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_5__radd__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_4__radd__, "\n        Adds a dual number and another dual number or scalar.\n\n        Parameters\n        ----------\n        other : Dual_c, int, or float\n            The value to add to the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_4__radd__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_5__radd__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 186, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__repr__") < 0)) __PYX_ERR(0, 186, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__repr__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 186, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_22__repr__(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__radd__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4__radd__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_22__repr__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4__radd__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  Py_UCS4 __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  unsigned int __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__repr__", 1);
+  __Pyx_RefNannySetupContext("__radd__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":190
- *         Returns a string representation of the dual number.
+  /* "DualNum_c/Dual_c.pyx":167
+ *             The value to add to the current dual number.
  *         """
- *         return f'Dual(real={self.real}, dual={self.dual})'             # <<<<<<<<<<<<<<
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__radd__", Dual_c.__radd__, (self, other))
+ *         return self.__add__(other)
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":168
+ *         """
+ *         if _profiling:
+ *             return _profiled("__radd__", Dual_c.__radd__, (self, other))             # <<<<<<<<<<<<<<
+ *         return self.__add__(other)
  * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_radd); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 168, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 168, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_radd, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":167
+ *             The value to add to the current dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__radd__", Dual_c.__radd__, (self, other))
+ *         return self.__add__(other)
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":169
+ *         if _profiling:
+ *             return _profiled("__radd__", Dual_c.__radd__, (self, other))
+ *         return self.__add__(other)             # <<<<<<<<<<<<<<
  * 
+ *     def __sub__(Dual_c self, other):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = 0;
-  __pyx_t_3 = 127;
-  __Pyx_INCREF(__pyx_kp_u_Dual_real);
-  __pyx_t_2 += 10;
-  __Pyx_GIVEREF(__pyx_kp_u_Dual_real);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Dual_real);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_4, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_3;
-  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_5);
-  __pyx_t_5 = 0;
-  __Pyx_INCREF(__pyx_kp_u_dual_2);
-  __pyx_t_2 += 7;
-  __Pyx_GIVEREF(__pyx_kp_u_dual_2);
-  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_dual_2);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_FormatSimple(__pyx_t_5, __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_3;
-  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_4);
-  __pyx_t_4 = 0;
-  __Pyx_INCREF(__pyx_kp_u__2);
-  __pyx_t_2 += 1;
-  __Pyx_GIVEREF(__pyx_kp_u__2);
-  PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_kp_u__2);
-  __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_1, 5, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_4;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_add); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = NULL;
   __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_other};
+    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 169, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":186
- * 
+  /* "DualNum_c/Dual_c.pyx":158
+ *         return NotImplemented
  * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *     def __radd__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns a string representation of the dual number.
+ *         Adds a dual number and another dual number or scalar.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__radd__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6286,532 +6043,358 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_22__repr__(CYTHON_UNUSED Py
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":194
+/* "DualNum_c/Dual_c.pyx":171
+ *         return self.__add__(other)
  * 
- *     # Class Methods
- *     def get_real(self):             # <<<<<<<<<<<<<<
+ *     def __sub__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the real part of the dual number.
+ *         Subtracts one dual number from another dual or int/float.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_25get_real(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_24get_real, "\n        Returns the real part of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_25get_real = {"get_real", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_25get_real, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_24get_real};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_25get_real(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_7__sub__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_6__sub__, "\n        Subtracts one dual number from another dual or int/float.\n\n        Parameters\n        ----------\n        other : Dual_c, int, or float\n            The value to subtract from the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_6__sub__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_7__sub__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_real (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 194, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_real") < 0)) __PYX_ERR(0, 194, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_real", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 194, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.get_real", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_24get_real(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__sub__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_6__sub__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_24get_real(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_6__sub__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_o = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_real", 1);
+  __Pyx_RefNannySetupContext("__sub__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":198
- *         Returns the real part of the dual number.
+  /* "DualNum_c/Dual_c.pyx":180
+ *             The value to subtract from the current dual number.
  *         """
- *         return self.real             # <<<<<<<<<<<<<<
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__sub__", Dual_c.__sub__, (self, other))
+ *         cdef Dual_c o
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":181
+ *         """
+ *         if _profiling:
+ *             return _profiled("__sub__", Dual_c.__sub__, (self, other))             # <<<<<<<<<<<<<<
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_sub); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 181, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 181, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_sub, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":180
+ *             The value to subtract from the current dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__sub__", Dual_c.__sub__, (self, other))
+ *         cdef Dual_c o
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":183
+ *             return _profiled("__sub__", Dual_c.__sub__, (self, other))
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return _box(dual_sub(as_dual(self), as_dual(o)))
+ */
+  __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_other, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c); 
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":184
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other             # <<<<<<<<<<<<<<
+ *             return _box(dual_sub(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
+ */
+    __pyx_t_3 = __pyx_v_other;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_o = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "DualNum_c/Dual_c.pyx":185
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             return _box(dual_sub(as_dual(self), as_dual(o)))             # <<<<<<<<<<<<<<
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_sub_scalar(as_dual(self), other))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_sub(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_o)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":183
+ *             return _profiled("__sub__", Dual_c.__sub__, (self, other))
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return _box(dual_sub(as_dual(self), as_dual(o)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":186
+ *             o = <Dual_c>other
+ *             return _box(dual_sub(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             return _box(dual_sub_scalar(as_dual(self), other))
+ *         return NotImplemented
+ */
+  __pyx_t_5 = PyFloat_Check(__pyx_v_other); 
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_5 = PyInt_Check(__pyx_v_other); 
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":187
+ *             return _box(dual_sub(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_sub_scalar(as_dual(self), other))             # <<<<<<<<<<<<<<
+ *         return NotImplemented
  * 
- *     def get_dual(self):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 187, __pyx_L1_error)
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_sub_scalar(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_t_6))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":186
+ *             o = <Dual_c>other
+ *             return _box(dual_sub(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             return _box(dual_sub_scalar(as_dual(self), other))
+ *         return NotImplemented
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":188
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_sub_scalar(as_dual(self), other))
+ *         return NotImplemented             # <<<<<<<<<<<<<<
+ * 
+ *     def __rsub__(Dual_c self, other):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __Pyx_INCREF(__pyx_builtin_NotImplemented);
+  __pyx_r = __pyx_builtin_NotImplemented;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":194
+  /* "DualNum_c/Dual_c.pyx":171
+ *         return self.__add__(other)
  * 
- *     # Class Methods
- *     def get_real(self):             # <<<<<<<<<<<<<<
+ *     def __sub__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the real part of the dual number.
+ *         Subtracts one dual number from another dual or int/float.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.get_real", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__sub__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_o);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":200
- *         return self.real
+/* "DualNum_c/Dual_c.pyx":190
+ *         return NotImplemented
  * 
- *     def get_dual(self):             # <<<<<<<<<<<<<<
+ *     def __rsub__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the dual part of the dual number.
+ *         Subtracts the dual number from an int/float.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27get_dual(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_9__rsub__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_8__rsub__, "\n        Subtracts the dual number from an int/float.\n\n        Parameters\n        ----------\n        other : int, or float\n            The value the current dual number is subtracted from.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_8__rsub__;
 #endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_26get_dual, "\n        Returns the dual part of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_27get_dual = {"get_dual", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27get_dual, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_26get_dual};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27get_dual(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_9__rsub__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_dual (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_dual") < 0)) __PYX_ERR(0, 200, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_dual", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 200, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.get_dual", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_26get_dual(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__rsub__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_8__rsub__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_26get_dual(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_8__rsub__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_dual", 1);
+  __Pyx_RefNannySetupContext("__rsub__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":204
- *         Returns the dual part of the dual number.
+  /* "DualNum_c/Dual_c.pyx":199
+ *             The value the current dual number is subtracted from.
  *         """
- *         return self.dual             # <<<<<<<<<<<<<<
- * 
- *     def sin(self):
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rsub__", Dual_c.__rsub__, (self, other))
+ *         if isinstance(other, (float, int)):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 204, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
 
-  /* "DualNum_c/Dual_c.pyx":200
- *         return self.real
- * 
- *     def get_dual(self):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":200
  *         """
- *         Returns the dual part of the dual number.
+ *         if _profiling:
+ *             return _profiled("__rsub__", Dual_c.__rsub__, (self, other))             # <<<<<<<<<<<<<<
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_rsub_scalar(other, as_dual(self)))
  */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_rsub); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 200, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 200, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_rsub, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.get_dual", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "DualNum_c/Dual_c.pyx":206
- *         return self.dual
- * 
- *     def sin(self):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":199
+ *             The value the current dual number is subtracted from.
  *         """
- *         Returns the sine of the dual number.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rsub__", Dual_c.__rsub__, (self, other))
+ *         if isinstance(other, (float, int)):
  */
+  }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_29sin(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_28sin, "\n        Returns the sine of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_29sin = {"sin", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_29sin, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_28sin};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_29sin(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("sin (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 206, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "sin") < 0)) __PYX_ERR(0, 206, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("sin", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 206, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
+  /* "DualNum_c/Dual_c.pyx":201
+ *         if _profiling:
+ *             return _profiled("__rsub__", Dual_c.__rsub__, (self, other))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             return _box(dual_rsub_scalar(other, as_dual(self)))
+ *         return NotImplemented
+ */
+  __pyx_t_5 = PyFloat_Check(__pyx_v_other); 
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L5_bool_binop_done;
   }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sin", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28sin(__pyx_self, __pyx_v_self);
+  __pyx_t_5 = PyInt_Check(__pyx_v_other); 
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_4) {
 
-  /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+    /* "DualNum_c/Dual_c.pyx":202
+ *             return _profiled("__rsub__", Dual_c.__rsub__, (self, other))
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_rsub_scalar(other, as_dual(self)))             # <<<<<<<<<<<<<<
+ *         return NotImplemented
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L1_error)
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_rsub_scalar(__pyx_t_6, __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 202, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28sin(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("sin", 1);
+    /* "DualNum_c/Dual_c.pyx":201
+ *         if _profiling:
+ *             return _profiled("__rsub__", Dual_c.__rsub__, (self, other))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             return _box(dual_rsub_scalar(other, as_dual(self)))
+ *         return NotImplemented
+ */
+  }
 
-  /* "DualNum_c/Dual_c.pyx":210
- *         Returns the sine of the dual number.
- *         """
- *         return Dual_c(math.sin(self.real), self.dual * math.cos(self.real))             # <<<<<<<<<<<<<<
+  /* "DualNum_c/Dual_c.pyx":203
+ *         if isinstance(other, (float, int)):
+ *             return _box(dual_rsub_scalar(other, as_dual(self)))
+ *         return NotImplemented             # <<<<<<<<<<<<<<
  * 
- *     def cos(self):
+ *     def __mul__(Dual_c self, other):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_sin); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_cos); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 210, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  }
-  __pyx_t_8 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_3, __pyx_t_8};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __Pyx_INCREF(__pyx_builtin_NotImplemented);
+  __pyx_r = __pyx_builtin_NotImplemented;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":206
- *         return self.dual
+  /* "DualNum_c/Dual_c.pyx":190
+ *         return NotImplemented
  * 
- *     def sin(self):             # <<<<<<<<<<<<<<
+ *     def __rsub__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the sine of the dual number.
+ *         Subtracts the dual number from an int/float.
  */
 
   /* function exit code */
@@ -6819,12 +6402,7 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28sin(CYTHON_UNUSED PyObjec
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sin", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rsub__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6832,241 +6410,207 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28sin(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":212
- *         return Dual_c(math.sin(self.real), self.dual * math.cos(self.real))
+/* "DualNum_c/Dual_c.pyx":205
+ *         return NotImplemented
  * 
- *     def cos(self):             # <<<<<<<<<<<<<<
+ *     def __mul__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the cosine of the dual number.
+ *         Multiplies a dual number with another dual number or an int/float.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_31cos(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_30cos, "\n        Returns the cosine of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_31cos = {"cos", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_31cos, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_30cos};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_31cos(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_11__mul__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_10__mul__, "\n        Multiplies a dual number with another dual number or an int/float.\n\n        Parameters\n        ----------\n        other : Dual_c, int, or float\n            The value to multiply with the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_10__mul__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_11__mul__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("cos (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 212, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "cos") < 0)) __PYX_ERR(0, 212, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cos", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 212, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.cos", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_30cos(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__mul__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_10__mul__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_30cos(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_10__mul__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_o = 0;
+  double __pyx_v_c;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("cos", 1);
+  __Pyx_RefNannySetupContext("__mul__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":216
- *         Returns the cosine of the dual number.
+  /* "DualNum_c/Dual_c.pyx":214
+ *             The value to multiply with the current dual number.
  *         """
- *         return Dual_c(math.cos(self.real), -self.dual * math.sin(self.real))             # <<<<<<<<<<<<<<
- * 
- *     def tan(self):
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__mul__", Dual_c.__mul__, (self, other))
+ *         cdef Dual_c o
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_cos); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":215
+ *         """
+ *         if _profiling:
+ *             return _profiled("__mul__", Dual_c.__mul__, (self, other))             # <<<<<<<<<<<<<<
+ *         cdef Dual_c o
+ *         cdef double c
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_mul); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 215, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 215, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_mul, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyNumber_Negative(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sin); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
-    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":214
+ *             The value to multiply with the current dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__mul__", Dual_c.__mul__, (self, other))
+ *         cdef Dual_c o
+ */
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":218
+ *         cdef Dual_c o
+ *         cdef double c
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return _box(dual_mul(as_dual(self), as_dual(o)))
+ */
+  __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_other, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c); 
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":219
+ *         cdef double c
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other             # <<<<<<<<<<<<<<
+ *             return _box(dual_mul(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
+ */
+    __pyx_t_3 = __pyx_v_other;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_o = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "DualNum_c/Dual_c.pyx":220
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             return _box(dual_mul(as_dual(self), as_dual(o)))             # <<<<<<<<<<<<<<
+ *         if isinstance(other, (float, int)):
+ *             c = other
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_mul(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_o)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 220, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":218
+ *         cdef Dual_c o
+ *         cdef double c
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return _box(dual_mul(as_dual(self), as_dual(o)))
+ */
   }
-  __pyx_t_8 = PyNumber_Multiply(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
-    }
+
+  /* "DualNum_c/Dual_c.pyx":221
+ *             o = <Dual_c>other
+ *             return _box(dual_mul(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             c = other
+ *             return _box(dual_mul_scalar(as_dual(self), c))
+ */
+  __pyx_t_5 = PyFloat_Check(__pyx_v_other); 
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L6_bool_binop_done;
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_8};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = PyInt_Check(__pyx_v_other); 
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":222
+ *             return _box(dual_mul(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
+ *             c = other             # <<<<<<<<<<<<<<
+ *             return _box(dual_mul_scalar(as_dual(self), c))
+ *         return NotImplemented
+ */
+    __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_6;
+
+    /* "DualNum_c/Dual_c.pyx":223
+ *         if isinstance(other, (float, int)):
+ *             c = other
+ *             return _box(dual_mul_scalar(as_dual(self), c))             # <<<<<<<<<<<<<<
+ *         return NotImplemented
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_mul_scalar(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_v_c))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":221
+ *             o = <Dual_c>other
+ *             return _box(dual_mul(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             c = other
+ *             return _box(dual_mul_scalar(as_dual(self), c))
+ */
   }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":224
+ *             c = other
+ *             return _box(dual_mul_scalar(as_dual(self), c))
+ *         return NotImplemented             # <<<<<<<<<<<<<<
+ * 
+ *     def __rmul__(Dual_c self, other):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_builtin_NotImplemented);
+  __pyx_r = __pyx_builtin_NotImplemented;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":212
- *         return Dual_c(math.sin(self.real), self.dual * math.cos(self.real))
+  /* "DualNum_c/Dual_c.pyx":205
+ *         return NotImplemented
  * 
- *     def cos(self):             # <<<<<<<<<<<<<<
+ *     def __mul__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the cosine of the dual number.
+ *         Multiplies a dual number with another dual number or an int/float.
  */
 
   /* function exit code */
@@ -7074,254 +6618,140 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_30cos(CYTHON_UNUSED PyObjec
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.cos", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__mul__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_o);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":218
- *         return Dual_c(math.cos(self.real), -self.dual * math.sin(self.real))
+/* "DualNum_c/Dual_c.pyx":226
+ *         return NotImplemented
  * 
- *     def tan(self):             # <<<<<<<<<<<<<<
+ *     def __rmul__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the tangent of the dual number.
+ *         Multiplies a dual number with another dual number or an int/float.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_33tan(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_32tan, "\n        Returns the tangent of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_33tan = {"tan", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_33tan, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_32tan};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_33tan(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_13__rmul__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_12__rmul__, "\n        Multiplies a dual number with another dual number or an int/float.\n\n        Parameters\n        ----------\n        other : Dual_c, int, or float\n            The value to multiply with the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_12__rmul__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_13__rmul__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("tan (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 218, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "tan") < 0)) __PYX_ERR(0, 218, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("tan", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 218, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.tan", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32tan(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__rmul__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_12__rmul__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32tan(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_12__rmul__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  unsigned int __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("tan", 1);
+  __Pyx_RefNannySetupContext("__rmul__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":222
- *         Returns the tangent of the dual number.
+  /* "DualNum_c/Dual_c.pyx":235
+ *             The value to multiply with the current dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rmul__", Dual_c.__rmul__, (self, other))
+ *         return self.__mul__(other)
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":236
  *         """
- *         return Dual_c(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))             # <<<<<<<<<<<<<<
+ *         if _profiling:
+ *             return _profiled("__rmul__", Dual_c.__rmul__, (self, other))             # <<<<<<<<<<<<<<
+ *         return self.__mul__(other)
  * 
- *     def exp(self):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_tan); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_rmul); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 236, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 236, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_rmul, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 236, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_cos); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 222, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":235
+ *             The value to multiply with the current dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rmul__", Dual_c.__rmul__, (self, other))
+ *         return self.__mul__(other)
+ */
   }
-  __pyx_t_8 = PyNumber_Power(__pyx_t_4, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = NULL;
-  __pyx_t_7 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":237
+ *         if _profiling:
+ *             return _profiled("__rmul__", Dual_c.__rmul__, (self, other))
+ *         return self.__mul__(other)             # <<<<<<<<<<<<<<
+ * 
+ *     def __truediv__(Dual_c self, other):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_mul); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = NULL;
+  __pyx_t_4 = 0;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_8)) {
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_1)) {
       PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(__pyx_t_1);
       __Pyx_INCREF(function);
       __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
+      __pyx_t_4 = 1;
     }
   }
   #endif
   {
-    PyObject *__pyx_callargs[3] = {__pyx_t_8, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 222, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_other};
+    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 237, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":218
- *         return Dual_c(math.cos(self.real), -self.dual * math.sin(self.real))
+  /* "DualNum_c/Dual_c.pyx":226
+ *         return NotImplemented
  * 
- *     def tan(self):             # <<<<<<<<<<<<<<
+ *     def __rmul__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the tangent of the dual number.
+ *         Multiplies a dual number with another dual number or an int/float.
  */
 
   /* function exit code */
@@ -7329,12 +6759,7 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32tan(CYTHON_UNUSED PyObjec
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.tan", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rmul__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -7342,238 +6767,271 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32tan(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":224
- *         return Dual_c(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))
+/* "DualNum_c/Dual_c.pyx":239
+ *         return self.__mul__(other)
  * 
- *     def exp(self):             # <<<<<<<<<<<<<<
+ *     def __truediv__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the exponential of the dual number.
+ *         Divides one dual number by another dual number or an int/float.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_35exp(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_34exp, "\n        Returns the exponential of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_35exp = {"exp", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_35exp, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_34exp};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_35exp(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_15__truediv__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_14__truediv__, "\n        Divides one dual number by another dual number or an int/float.\n\n        Parameters\n        ----------\n        other : Dual_c, int, or float\n            The value to divide the current dual number by.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_14__truediv__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_15__truediv__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("exp (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 224, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "exp") < 0)) __PYX_ERR(0, 224, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("exp", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 224, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.exp", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_34exp(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__truediv__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_14__truediv__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_34exp(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_14__truediv__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_o = 0;
+  double __pyx_v_c;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("exp", 1);
+  __Pyx_RefNannySetupContext("__truediv__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":228
- *         Returns the exponential of the dual number.
+  /* "DualNum_c/Dual_c.pyx":248
+ *             The value to divide the current dual number by.
  *         """
- *         return Dual_c(math.exp(self.real), self.dual * math.exp(self.real))             # <<<<<<<<<<<<<<
- * 
- *     def log(self):
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__truediv__", Dual_c.__truediv__, (self, other))
+ *         cdef Dual_c o
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_exp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 228, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":249
+ *         """
+ *         if _profiling:
+ *             return _profiled("__truediv__", Dual_c.__truediv__, (self, other))             # <<<<<<<<<<<<<<
+ *         cdef Dual_c o
+ *         cdef double c
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_truediv); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 249, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 249, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 249, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_truediv, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 249, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":248
+ *             The value to divide the current dual number by.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__truediv__", Dual_c.__truediv__, (self, other))
+ *         cdef Dual_c o
+ */
   }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_exp); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
+
+  /* "DualNum_c/Dual_c.pyx":252
+ *         cdef Dual_c o
+ *         cdef double c
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             if o.real == 0:
+ */
+  __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_other, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c); 
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":253
+ *         cdef double c
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other             # <<<<<<<<<<<<<<
+ *             if o.real == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ */
+    __pyx_t_3 = __pyx_v_other;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_o = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "DualNum_c/Dual_c.pyx":254
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             if o.real == 0:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div(as_dual(self), as_dual(o)))
+ */
+    __pyx_t_4 = (__pyx_v_o->real == 0.0);
+    if (unlikely(__pyx_t_4)) {
+
+      /* "DualNum_c/Dual_c.pyx":255
+ *             o = <Dual_c>other
+ *             if o.real == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *             return _box(dual_div(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 255, __pyx_L1_error)
+
+      /* "DualNum_c/Dual_c.pyx":254
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             if o.real == 0:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div(as_dual(self), as_dual(o)))
+ */
     }
+
+    /* "DualNum_c/Dual_c.pyx":256
+ *             if o.real == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div(as_dual(self), as_dual(o)))             # <<<<<<<<<<<<<<
+ *         if isinstance(other, (float, int)):
+ *             c = other
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_div(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_o)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 256, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":252
+ *         cdef Dual_c o
+ *         cdef double c
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             if o.real == 0:
+ */
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 228, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":257
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             c = other
+ *             if c == 0:
+ */
+  __pyx_t_5 = PyFloat_Check(__pyx_v_other); 
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L7_bool_binop_done;
   }
-  __pyx_t_8 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
+  __pyx_t_5 = PyInt_Check(__pyx_v_other); 
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":258
+ *             return _box(dual_div(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):
+ *             c = other             # <<<<<<<<<<<<<<
+ *             if c == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ */
+    __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 258, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_6;
+
+    /* "DualNum_c/Dual_c.pyx":259
+ *         if isinstance(other, (float, int)):
+ *             c = other
+ *             if c == 0:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div_scalar(as_dual(self), c))
+ */
+    __pyx_t_4 = (__pyx_v_c == 0.0);
+    if (unlikely(__pyx_t_4)) {
+
+      /* "DualNum_c/Dual_c.pyx":260
+ *             c = other
+ *             if c == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *             return _box(dual_div_scalar(as_dual(self), c))
+ *         return NotImplemented
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 260, __pyx_L1_error)
+
+      /* "DualNum_c/Dual_c.pyx":259
+ *         if isinstance(other, (float, int)):
+ *             c = other
+ *             if c == 0:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div_scalar(as_dual(self), c))
+ */
     }
+
+    /* "DualNum_c/Dual_c.pyx":261
+ *             if c == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div_scalar(as_dual(self), c))             # <<<<<<<<<<<<<<
+ *         return NotImplemented
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_div_scalar(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_v_c))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":257
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div(as_dual(self), as_dual(o)))
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             c = other
+ *             if c == 0:
+ */
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_3, __pyx_t_8};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 228, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":262
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             return _box(dual_div_scalar(as_dual(self), c))
+ *         return NotImplemented             # <<<<<<<<<<<<<<
+ * 
+ *     def __rtruediv__(Dual_c self, other):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_builtin_NotImplemented);
+  __pyx_r = __pyx_builtin_NotImplemented;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":224
- *         return Dual_c(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))
+  /* "DualNum_c/Dual_c.pyx":239
+ *         return self.__mul__(other)
  * 
- *     def exp(self):             # <<<<<<<<<<<<<<
+ *     def __truediv__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the exponential of the dual number.
+ *         Divides one dual number by another dual number or an int/float.
  */
 
   /* function exit code */
@@ -7581,270 +7039,210 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_34exp(CYTHON_UNUSED PyObjec
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.exp", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__truediv__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_o);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":230
- *         return Dual_c(math.exp(self.real), self.dual * math.exp(self.real))
+/* "DualNum_c/Dual_c.pyx":264
+ *         return NotImplemented
  * 
- *     def log(self):             # <<<<<<<<<<<<<<
+ *     def __rtruediv__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the natural logarithm of the dual number.
+ *         Divides an int/float by the dual number.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_37log(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__, "\n        Divides an int/float by the dual number.\n\n        Parameters\n        ----------\n        other : int, or float\n            The value to divide by the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__;
 #endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_36log, "\n        Returns the natural logarithm of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_37log = {"log", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_37log, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_36log};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_37log(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("log (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 230, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "log") < 0)) __PYX_ERR(0, 230, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("log", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 230, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.log", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_36log(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__rtruediv__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_36log(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
+  double __pyx_v_c;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  unsigned int __pyx_t_8;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("log", 1);
+  __Pyx_RefNannySetupContext("__rtruediv__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":234
- *         Returns the natural logarithm of the dual number.
+  /* "DualNum_c/Dual_c.pyx":273
+ *             The value to divide by the current dual number.
  *         """
- *         if self.real <= 0:             # <<<<<<<<<<<<<<
- *             raise ValueError("Logarithm of a non-positive number is undefined.")
- *         return Dual_c(math.log(self.real), self.dual / self.real)
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rtruediv__", Dual_c.__rtruediv__, (self, other))
+ *         cdef double c
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_int_0, Py_LE); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_3)) {
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
 
-    /* "DualNum_c/Dual_c.pyx":235
+    /* "DualNum_c/Dual_c.pyx":274
  *         """
- *         if self.real <= 0:
- *             raise ValueError("Logarithm of a non-positive number is undefined.")             # <<<<<<<<<<<<<<
- *         return Dual_c(math.log(self.real), self.dual / self.real)
- * 
+ *         if _profiling:
+ *             return _profiled("__rtruediv__", Dual_c.__rtruediv__, (self, other))             # <<<<<<<<<<<<<<
+ *         cdef double c
+ *         if isinstance(other, (float, int)):
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_rtruediv); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 274, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 274, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 274, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_rtruediv, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 235, __pyx_L1_error)
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-    /* "DualNum_c/Dual_c.pyx":234
- *         Returns the natural logarithm of the dual number.
+    /* "DualNum_c/Dual_c.pyx":273
+ *             The value to divide by the current dual number.
  *         """
- *         if self.real <= 0:             # <<<<<<<<<<<<<<
- *             raise ValueError("Logarithm of a non-positive number is undefined.")
- *         return Dual_c(math.log(self.real), self.dual / self.real)
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rtruediv__", Dual_c.__rtruediv__, (self, other))
+ *         cdef double c
  */
   }
 
-  /* "DualNum_c/Dual_c.pyx":236
- *         if self.real <= 0:
- *             raise ValueError("Logarithm of a non-positive number is undefined.")
- *         return Dual_c(math.log(self.real), self.dual / self.real)             # <<<<<<<<<<<<<<
- * 
- *     def sqrt(self):
+  /* "DualNum_c/Dual_c.pyx":276
+ *             return _profiled("__rtruediv__", Dual_c.__rtruediv__, (self, other))
+ *         cdef double c
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             if self.real == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_math); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_log); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_7 = NULL;
-  __pyx_t_8 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_6))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_6, function);
-      __pyx_t_8 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_t_5};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_5 = PyFloat_Check(__pyx_v_other); 
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L5_bool_binop_done;
   }
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_7 = __Pyx_PyNumber_Divide(__pyx_t_6, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = NULL;
-  __pyx_t_8 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_1, function);
-      __pyx_t_8 = 1;
+  __pyx_t_5 = PyInt_Check(__pyx_v_other); 
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":277
+ *         cdef double c
+ *         if isinstance(other, (float, int)):
+ *             if self.real == 0:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             c = other
+ */
+    __pyx_t_4 = (__pyx_v_self->real == 0.0);
+    if (unlikely(__pyx_t_4)) {
+
+      /* "DualNum_c/Dual_c.pyx":278
+ *         if isinstance(other, (float, int)):
+ *             if self.real == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *             c = other
+ *             return _box(dual_rdiv_scalar(c, as_dual(self)))
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 278, __pyx_L1_error)
+
+      /* "DualNum_c/Dual_c.pyx":277
+ *         cdef double c
+ *         if isinstance(other, (float, int)):
+ *             if self.real == 0:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             c = other
+ */
     }
+
+    /* "DualNum_c/Dual_c.pyx":279
+ *             if self.real == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             c = other             # <<<<<<<<<<<<<<
+ *             return _box(dual_rdiv_scalar(c, as_dual(self)))
+ *         return NotImplemented
+ */
+    __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 279, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_6;
+
+    /* "DualNum_c/Dual_c.pyx":280
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *             c = other
+ *             return _box(dual_rdiv_scalar(c, as_dual(self)))             # <<<<<<<<<<<<<<
+ *         return NotImplemented
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_rdiv_scalar(__pyx_v_c, __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":276
+ *             return _profiled("__rtruediv__", Dual_c.__rtruediv__, (self, other))
+ *         cdef double c
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             if self.real == 0:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ */
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_t_7};
-    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_1, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":281
+ *             c = other
+ *             return _box(dual_rdiv_scalar(c, as_dual(self)))
+ *         return NotImplemented             # <<<<<<<<<<<<<<
+ * 
+ *     def __pow__(Dual_c self, other, modulo=None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_builtin_NotImplemented);
+  __pyx_r = __pyx_builtin_NotImplemented;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":230
- *         return Dual_c(math.exp(self.real), self.dual * math.exp(self.real))
+  /* "DualNum_c/Dual_c.pyx":264
+ *         return NotImplemented
  * 
- *     def log(self):             # <<<<<<<<<<<<<<
+ *     def __rtruediv__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the natural logarithm of the dual number.
+ *         Divides an int/float by the dual number.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.log", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rtruediv__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -7852,241 +7250,484 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_36log(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":238
- *         return Dual_c(math.log(self.real), self.dual / self.real)
+/* "DualNum_c/Dual_c.pyx":283
+ *         return NotImplemented
  * 
- *     def sqrt(self):             # <<<<<<<<<<<<<<
+ *     def __pow__(Dual_c self, other, modulo=None):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the square root of the dual number.
+ *         Raises the dual number to the power of another dual number or an int/float.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_39sqrt(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_38sqrt, "\n        Returns the square root of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_39sqrt = {"sqrt", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_39sqrt, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_38sqrt};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_39sqrt(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_19__pow__(PyObject *__pyx_v_self, PyObject *__pyx_v_other, PyObject *__pyx_v_modulo); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_18__pow__, "\n        Raises the dual number to the power of another dual number or an int/float.\n\n        A constant exponent (or a dual one with zero dual part) uses\n        ``n * x ** (n - 1)`` without a logarithm, with integer powers\n        computed by repeated squaring, so negative bases are accepted with\n        integer exponents.\n\n        Parameters\n        ----------\n        other : Dual_c, int, or float\n            The exponent.\n\n        Raises\n        ------\n        ValueError\n            If a negative base is raised to a non-integer power, or a\n            non-positive base to a dual exponent with a non-zero dual part.\n\n        ZeroDivisionError\n            If zero is raised to a negative power, or to a non-integer power\n            below 1 (where the derivative is infinite).\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_18__pow__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_19__pow__(PyObject *__pyx_v_self, PyObject *__pyx_v_other, PyObject *__pyx_v_modulo) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("sqrt (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 238, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "sqrt") < 0)) __PYX_ERR(0, 238, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("sqrt", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 238, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sqrt", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_38sqrt(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__pow__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_18__pow__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other), ((PyObject *)__pyx_v_modulo));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_38sqrt(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_18__pow__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other, CYTHON_UNUSED PyObject *__pyx_v_modulo) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_o = 0;
+  double __pyx_v_c;
+  long __pyx_v_n;
+  int __pyx_v_overflow;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_4;
+  double __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("sqrt", 1);
+  __Pyx_RefNannySetupContext("__pow__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":242
- *         Returns the square root of the dual number.
+  /* "DualNum_c/Dual_c.pyx":307
+ *             below 1 (where the derivative is infinite).
  *         """
- *         return Dual_c(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))             # <<<<<<<<<<<<<<
- * 
- *     def sinh(self):
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__pow__", Dual_c.__pow__, (self, other))
+ *         cdef Dual_c o
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 242, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":308
+ *         """
+ *         if _profiling:
+ *             return _profiled("__pow__", Dual_c.__pow__, (self, other))             # <<<<<<<<<<<<<<
+ *         cdef Dual_c o
+ *         cdef double c
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_pow); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 308, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 308, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 308, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_pow, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 308, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
-    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":307
+ *             below 1 (where the derivative is infinite).
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__pow__", Dual_c.__pow__, (self, other))
+ *         cdef Dual_c o
+ */
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":313
+ *         cdef long n
+ *         cdef int overflow
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             if o.dual != 0:
+ */
+  __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_other, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c); 
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":314
+ *         cdef int overflow
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other             # <<<<<<<<<<<<<<
+ *             if o.dual != 0:
+ *                 if self.real <= 0:
+ */
+    __pyx_t_3 = __pyx_v_other;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_o = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "DualNum_c/Dual_c.pyx":315
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             if o.dual != 0:             # <<<<<<<<<<<<<<
+ *                 if self.real <= 0:
+ *                     raise ValueError("math domain error")
+ */
+    __pyx_t_4 = (__pyx_v_o->dual != 0.0);
+    if (__pyx_t_4) {
+
+      /* "DualNum_c/Dual_c.pyx":316
+ *             o = <Dual_c>other
+ *             if o.dual != 0:
+ *                 if self.real <= 0:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("math domain error")
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))
+ */
+      __pyx_t_4 = (__pyx_v_self->real <= 0.0);
+      if (unlikely(__pyx_t_4)) {
+
+        /* "DualNum_c/Dual_c.pyx":317
+ *             if o.dual != 0:
+ *                 if self.real <= 0:
+ *                     raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))
+ *             c = o.real
+ */
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __PYX_ERR(0, 317, __pyx_L1_error)
+
+        /* "DualNum_c/Dual_c.pyx":316
+ *             o = <Dual_c>other
+ *             if o.dual != 0:
+ *                 if self.real <= 0:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("math domain error")
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))
+ */
+      }
+
+      /* "DualNum_c/Dual_c.pyx":318
+ *                 if self.real <= 0:
+ *                     raise ValueError("math domain error")
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))             # <<<<<<<<<<<<<<
+ *             c = o.real
+ *         elif isinstance(other, int):
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_pow(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_o)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 318, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_r = __pyx_t_3;
+      __pyx_t_3 = 0;
+      goto __pyx_L0;
+
+      /* "DualNum_c/Dual_c.pyx":315
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             if o.dual != 0:             # <<<<<<<<<<<<<<
+ *                 if self.real <= 0:
+ *                     raise ValueError("math domain error")
+ */
+    }
+
+    /* "DualNum_c/Dual_c.pyx":319
+ *                     raise ValueError("math domain error")
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))
+ *             c = o.real             # <<<<<<<<<<<<<<
+ *         elif isinstance(other, int):
+ *             n = PyLong_AsLongAndOverflow(other, &overflow)
+ */
+    __pyx_t_5 = __pyx_v_o->real;
+    __pyx_v_c = __pyx_t_5;
+
+    /* "DualNum_c/Dual_c.pyx":313
+ *         cdef long n
+ *         cdef int overflow
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             if o.dual != 0:
+ */
+    goto __pyx_L4;
   }
-  __pyx_t_8 = __Pyx_PyInt_MultiplyCObj(__pyx_int_2, __pyx_t_4, 2, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_8)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_8);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
+
+  /* "DualNum_c/Dual_c.pyx":320
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))
+ *             c = o.real
+ *         elif isinstance(other, int):             # <<<<<<<<<<<<<<
+ *             n = PyLong_AsLongAndOverflow(other, &overflow)
+ *             if not overflow:
+ */
+  __pyx_t_4 = PyInt_Check(__pyx_v_other); 
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":321
+ *             c = o.real
+ *         elif isinstance(other, int):
+ *             n = PyLong_AsLongAndOverflow(other, &overflow)             # <<<<<<<<<<<<<<
+ *             if not overflow:
+ *                 return _pow_int(self, n)
+ */
+    __pyx_t_6 = PyLong_AsLongAndOverflow(__pyx_v_other, (&__pyx_v_overflow)); if (unlikely(__pyx_t_6 == ((long)-1L) && PyErr_Occurred())) __PYX_ERR(0, 321, __pyx_L1_error)
+    __pyx_v_n = __pyx_t_6;
+
+    /* "DualNum_c/Dual_c.pyx":322
+ *         elif isinstance(other, int):
+ *             n = PyLong_AsLongAndOverflow(other, &overflow)
+ *             if not overflow:             # <<<<<<<<<<<<<<
+ *                 return _pow_int(self, n)
+ *             c = other
+ */
+    __pyx_t_4 = (!(__pyx_v_overflow != 0));
+    if (__pyx_t_4) {
+
+      /* "DualNum_c/Dual_c.pyx":323
+ *             n = PyLong_AsLongAndOverflow(other, &overflow)
+ *             if not overflow:
+ *                 return _pow_int(self, n)             # <<<<<<<<<<<<<<
+ *             c = other
+ *         elif isinstance(other, float):
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__pow_int(__pyx_v_self, __pyx_v_n)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 323, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_r = __pyx_t_3;
+      __pyx_t_3 = 0;
+      goto __pyx_L0;
+
+      /* "DualNum_c/Dual_c.pyx":322
+ *         elif isinstance(other, int):
+ *             n = PyLong_AsLongAndOverflow(other, &overflow)
+ *             if not overflow:             # <<<<<<<<<<<<<<
+ *                 return _pow_int(self, n)
+ *             c = other
+ */
     }
+
+    /* "DualNum_c/Dual_c.pyx":324
+ *             if not overflow:
+ *                 return _pow_int(self, n)
+ *             c = other             # <<<<<<<<<<<<<<
+ *         elif isinstance(other, float):
+ *             c = other
+ */
+    __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 324, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_5;
+
+    /* "DualNum_c/Dual_c.pyx":320
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))
+ *             c = o.real
+ *         elif isinstance(other, int):             # <<<<<<<<<<<<<<
+ *             n = PyLong_AsLongAndOverflow(other, &overflow)
+ *             if not overflow:
+ */
+    goto __pyx_L4;
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_8, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":325
+ *                 return _pow_int(self, n)
+ *             c = other
+ *         elif isinstance(other, float):             # <<<<<<<<<<<<<<
+ *             c = other
+ *         else:
+ */
+  __pyx_t_4 = PyFloat_Check(__pyx_v_other); 
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":326
+ *             c = other
+ *         elif isinstance(other, float):
+ *             c = other             # <<<<<<<<<<<<<<
+ *         else:
+ *             return NotImplemented
+ */
+    __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 326, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_5;
+
+    /* "DualNum_c/Dual_c.pyx":325
+ *                 return _pow_int(self, n)
+ *             c = other
+ *         elif isinstance(other, float):             # <<<<<<<<<<<<<<
+ *             c = other
+ *         else:
+ */
+    goto __pyx_L4;
   }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":328
+ *             c = other
+ *         else:
+ *             return NotImplemented             # <<<<<<<<<<<<<<
+ *         if self.real <= 0:
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_builtin_NotImplemented);
+    __pyx_r = __pyx_builtin_NotImplemented;
+    goto __pyx_L0;
+  }
+  __pyx_L4:;
+
+  /* "DualNum_c/Dual_c.pyx":329
+ *         else:
+ *             return NotImplemented
+ *         if self.real <= 0:             # <<<<<<<<<<<<<<
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:
+ *                 return _pow_int(self, <long>c)
+ */
+  __pyx_t_4 = (__pyx_v_self->real <= 0.0);
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":330
+ *             return NotImplemented
+ *         if self.real <= 0:
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:             # <<<<<<<<<<<<<<
+ *                 return _pow_int(self, <long>c)
+ *             if self.real < 0 and c != floor(c):
+ */
+    __pyx_t_7 = (__pyx_v_c == floor(__pyx_v_c));
+    if (__pyx_t_7) {
+    } else {
+      __pyx_t_4 = __pyx_t_7;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_7 = ((-((double)LONG_MAX)) < __pyx_v_c);
+    if (__pyx_t_7) {
+      __pyx_t_7 = (__pyx_v_c < ((double)LONG_MAX));
+    }
+    __pyx_t_4 = __pyx_t_7;
+    __pyx_L10_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "DualNum_c/Dual_c.pyx":331
+ *         if self.real <= 0:
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:
+ *                 return _pow_int(self, <long>c)             # <<<<<<<<<<<<<<
+ *             if self.real < 0 and c != floor(c):
+ *                 raise ValueError("math domain error")
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__pow_int(__pyx_v_self, ((long)__pyx_v_c))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_r = __pyx_t_3;
+      __pyx_t_3 = 0;
+      goto __pyx_L0;
+
+      /* "DualNum_c/Dual_c.pyx":330
+ *             return NotImplemented
+ *         if self.real <= 0:
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:             # <<<<<<<<<<<<<<
+ *                 return _pow_int(self, <long>c)
+ *             if self.real < 0 and c != floor(c):
+ */
+    }
+
+    /* "DualNum_c/Dual_c.pyx":332
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:
+ *                 return _pow_int(self, <long>c)
+ *             if self.real < 0 and c != floor(c):             # <<<<<<<<<<<<<<
+ *                 raise ValueError("math domain error")
+ *             if self.real == 0 and c < 1:
+ */
+    __pyx_t_7 = (__pyx_v_self->real < 0.0);
+    if (__pyx_t_7) {
+    } else {
+      __pyx_t_4 = __pyx_t_7;
+      goto __pyx_L13_bool_binop_done;
+    }
+    __pyx_t_7 = (__pyx_v_c != floor(__pyx_v_c));
+    __pyx_t_4 = __pyx_t_7;
+    __pyx_L13_bool_binop_done:;
+    if (unlikely(__pyx_t_4)) {
+
+      /* "DualNum_c/Dual_c.pyx":333
+ *                 return _pow_int(self, <long>c)
+ *             if self.real < 0 and c != floor(c):
+ *                 raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *             if self.real == 0 and c < 1:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 333, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 333, __pyx_L1_error)
+
+      /* "DualNum_c/Dual_c.pyx":332
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:
+ *                 return _pow_int(self, <long>c)
+ *             if self.real < 0 and c != floor(c):             # <<<<<<<<<<<<<<
+ *                 raise ValueError("math domain error")
+ *             if self.real == 0 and c < 1:
+ */
+    }
+
+    /* "DualNum_c/Dual_c.pyx":334
+ *             if self.real < 0 and c != floor(c):
+ *                 raise ValueError("math domain error")
+ *             if self.real == 0 and c < 1:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_pow_scalar(as_dual(self), c))
+ */
+    __pyx_t_7 = (__pyx_v_self->real == 0.0);
+    if (__pyx_t_7) {
+    } else {
+      __pyx_t_4 = __pyx_t_7;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_7 = (__pyx_v_c < 1.0);
+    __pyx_t_4 = __pyx_t_7;
+    __pyx_L16_bool_binop_done:;
+    if (unlikely(__pyx_t_4)) {
+
+      /* "DualNum_c/Dual_c.pyx":335
+ *                 raise ValueError("math domain error")
+ *             if self.real == 0 and c < 1:
+ *                 raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *         return _box(dual_pow_scalar(as_dual(self), c))
+ * 
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 335, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 335, __pyx_L1_error)
+
+      /* "DualNum_c/Dual_c.pyx":334
+ *             if self.real < 0 and c != floor(c):
+ *                 raise ValueError("math domain error")
+ *             if self.real == 0 and c < 1:             # <<<<<<<<<<<<<<
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_pow_scalar(as_dual(self), c))
+ */
+    }
+
+    /* "DualNum_c/Dual_c.pyx":329
+ *         else:
+ *             return NotImplemented
+ *         if self.real <= 0:             # <<<<<<<<<<<<<<
+ *             if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:
+ *                 return _pow_int(self, <long>c)
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":336
+ *             if self.real == 0 and c < 1:
+ *                 raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_pow_scalar(as_dual(self), c))             # <<<<<<<<<<<<<<
+ * 
+ *     def __rpow__(Dual_c self, other, modulo=None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_pow_scalar(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_v_c))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":238
- *         return Dual_c(math.log(self.real), self.dual / self.real)
+  /* "DualNum_c/Dual_c.pyx":283
+ *         return NotImplemented
  * 
- *     def sqrt(self):             # <<<<<<<<<<<<<<
+ *     def __pow__(Dual_c self, other, modulo=None):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the square root of the dual number.
+ *         Raises the dual number to the power of another dual number or an int/float.
  */
 
   /* function exit code */
@@ -8094,251 +7735,202 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_38sqrt(CYTHON_UNUSED PyObje
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sqrt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__pow__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_o);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":244
- *         return Dual_c(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))
+/* "DualNum_c/Dual_c.pyx":338
+ *         return _box(dual_pow_scalar(as_dual(self), c))
  * 
- *     def sinh(self):             # <<<<<<<<<<<<<<
+ *     def __rpow__(Dual_c self, other, modulo=None):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the hyperbolic sine of the dual number.
+ *         Raises an int/float to the power of the dual number.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_41sinh(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_21__rpow__(PyObject *__pyx_v_self, PyObject *__pyx_v_other, PyObject *__pyx_v_modulo); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_20__rpow__, "\n        Raises an int/float to the power of the dual number.\n\n        Parameters\n        ----------\n        other : int, or float\n            The base, which must be positive.\n\n        Raises\n        ------\n        ValueError\n            If the base is not positive.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_20__rpow__;
 #endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_40sinh, "\n        Returns the hyperbolic sine of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_41sinh = {"sinh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_41sinh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_40sinh};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_41sinh(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_21__rpow__(PyObject *__pyx_v_self, PyObject *__pyx_v_other, PyObject *__pyx_v_modulo) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("sinh (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 244, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "sinh") < 0)) __PYX_ERR(0, 244, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("sinh", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 244, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sinh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40sinh(__pyx_self, __pyx_v_self);
+  __Pyx_RefNannySetupContext("__rpow__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_20__rpow__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other), ((PyObject *)__pyx_v_modulo));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40sinh(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_20__rpow__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other, CYTHON_UNUSED PyObject *__pyx_v_modulo) {
+  double __pyx_v_c;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("sinh", 1);
+  __Pyx_RefNannySetupContext("__rpow__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":248
- *         Returns the hyperbolic sine of the dual number.
+  /* "DualNum_c/Dual_c.pyx":352
+ *             If the base is not positive.
  *         """
- *         return Dual_c(math.sinh(self.real), self.dual * math.cosh(self.real))             # <<<<<<<<<<<<<<
- * 
- *     def cosh(self):
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rpow__", Dual_c.__rpow__, (self, other))
+ *         cdef double c
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_sinh); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 248, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":353
+ *         """
+ *         if _profiling:
+ *             return _profiled("__rpow__", Dual_c.__rpow__, (self, other))             # <<<<<<<<<<<<<<
+ *         cdef double c
+ *         if isinstance(other, (float, int)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_rpow); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 353, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_other);
+    __Pyx_GIVEREF(__pyx_v_other);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_other)) __PYX_ERR(0, 353, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_rpow, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 353, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_cosh); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
-    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":352
+ *             If the base is not positive.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("__rpow__", Dual_c.__rpow__, (self, other))
+ *         cdef double c
+ */
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 248, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":355
+ *             return _profiled("__rpow__", Dual_c.__rpow__, (self, other))
+ *         cdef double c
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             c = other
+ *             if c <= 0:
+ */
+  __pyx_t_5 = PyFloat_Check(__pyx_v_other); 
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L5_bool_binop_done;
   }
-  __pyx_t_8 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 248, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
+  __pyx_t_5 = PyInt_Check(__pyx_v_other); 
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "DualNum_c/Dual_c.pyx":356
+ *         cdef double c
+ *         if isinstance(other, (float, int)):
+ *             c = other             # <<<<<<<<<<<<<<
+ *             if c <= 0:
+ *                 raise ValueError("math domain error")
+ */
+    __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_other); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 356, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_6;
+
+    /* "DualNum_c/Dual_c.pyx":357
+ *         if isinstance(other, (float, int)):
+ *             c = other
+ *             if c <= 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("math domain error")
+ *             return _box(dual_rpow_scalar(c, as_dual(self)))
+ */
+    __pyx_t_4 = (__pyx_v_c <= 0.0);
+    if (unlikely(__pyx_t_4)) {
+
+      /* "DualNum_c/Dual_c.pyx":358
+ *             c = other
+ *             if c <= 0:
+ *                 raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *             return _box(dual_rpow_scalar(c, as_dual(self)))
+ *         return NotImplemented
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 358, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 358, __pyx_L1_error)
+
+      /* "DualNum_c/Dual_c.pyx":357
+ *         if isinstance(other, (float, int)):
+ *             c = other
+ *             if c <= 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("math domain error")
+ *             return _box(dual_rpow_scalar(c, as_dual(self)))
+ */
     }
+
+    /* "DualNum_c/Dual_c.pyx":359
+ *             if c <= 0:
+ *                 raise ValueError("math domain error")
+ *             return _box(dual_rpow_scalar(c, as_dual(self)))             # <<<<<<<<<<<<<<
+ *         return NotImplemented
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_rpow_scalar(__pyx_v_c, __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":355
+ *             return _profiled("__rpow__", Dual_c.__rpow__, (self, other))
+ *         cdef double c
+ *         if isinstance(other, (float, int)):             # <<<<<<<<<<<<<<
+ *             c = other
+ *             if c <= 0:
+ */
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_3, __pyx_t_8};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":360
+ *                 raise ValueError("math domain error")
+ *             return _box(dual_rpow_scalar(c, as_dual(self)))
+ *         return NotImplemented             # <<<<<<<<<<<<<<
+ * 
+ *     def __eq__(Dual_c self, other):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_builtin_NotImplemented);
+  __pyx_r = __pyx_builtin_NotImplemented;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":244
- *         return Dual_c(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))
+  /* "DualNum_c/Dual_c.pyx":338
+ *         return _box(dual_pow_scalar(as_dual(self), c))
  * 
- *     def sinh(self):             # <<<<<<<<<<<<<<
+ *     def __rpow__(Dual_c self, other, modulo=None):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the hyperbolic sine of the dual number.
+ *         Raises an int/float to the power of the dual number.
  */
 
   /* function exit code */
@@ -8346,12 +7938,7 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40sinh(CYTHON_UNUSED PyObje
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sinh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__rpow__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8359,238 +7946,207 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40sinh(CYTHON_UNUSED PyObje
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":250
- *         return Dual_c(math.sinh(self.real), self.dual * math.cosh(self.real))
+/* "DualNum_c/Dual_c.pyx":362
+ *         return NotImplemented
  * 
- *     def cosh(self):             # <<<<<<<<<<<<<<
+ *     def __eq__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the hyperbolic cosine of the dual number.
+ *         Checks if two dual numbers are equal.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_43cosh(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_42cosh, "\n        Returns the hyperbolic cosine of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_43cosh = {"cosh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_43cosh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_42cosh};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_43cosh(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_23__eq__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_22__eq__, "\n        Checks if two dual numbers are equal.\n\n        Parameters\n        ----------\n        other : Dual_c\n            The dual number to compare with the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_22__eq__;
 #endif
-) {
-  PyObject *__pyx_v_self = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_23__eq__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__eq__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_22__eq__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_22__eq__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
+  struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_o = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("cosh (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 250, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "cosh") < 0)) __PYX_ERR(0, 250, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cosh", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 250, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
+  __Pyx_RefNannySetupContext("__eq__", 1);
+
+  /* "DualNum_c/Dual_c.pyx":372
+ *         """
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return dual_eq(as_dual(self), as_dual(o))
+ */
+  __pyx_t_1 = __Pyx_TypeCheck(__pyx_v_other, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c); 
+  if (__pyx_t_1) {
+
+    /* "DualNum_c/Dual_c.pyx":373
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other             # <<<<<<<<<<<<<<
+ *             return dual_eq(as_dual(self), as_dual(o))
+ *         return False
+ */
+    __pyx_t_2 = __pyx_v_other;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_v_o = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "DualNum_c/Dual_c.pyx":374
+ *         if isinstance(other, Dual_c):
+ *             o = <Dual_c>other
+ *             return dual_eq(as_dual(self), as_dual(o))             # <<<<<<<<<<<<<<
+ *         return False
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_f_9DualNum_c_6Dual_c_dual_eq(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self), __pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_o))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":372
+ *         """
+ *         cdef Dual_c o
+ *         if isinstance(other, Dual_c):             # <<<<<<<<<<<<<<
+ *             o = <Dual_c>other
+ *             return dual_eq(as_dual(self), as_dual(o))
+ */
   }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.cosh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+
+  /* "DualNum_c/Dual_c.pyx":375
+ *             o = <Dual_c>other
+ *             return dual_eq(as_dual(self), as_dual(o))
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     def __ne__(Dual_c self, other):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(Py_False);
+  __pyx_r = Py_False;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":362
+ *         return NotImplemented
+ * 
+ *     def __eq__(Dual_c self, other):             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks if two dual numbers are equal.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__eq__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_o);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42cosh(__pyx_self, __pyx_v_self);
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":377
+ *         return False
+ * 
+ *     def __ne__(Dual_c self, other):             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks if two dual numbers differ.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_25__ne__(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_24__ne__, "\n        Checks if two dual numbers differ.\n\n        Parameters\n        ----------\n        other : Dual_c\n            The dual number to compare with the current dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_24__ne__;
+#endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_25__ne__(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__ne__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_24__ne__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), ((PyObject *)__pyx_v_other));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42cosh(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_24__ne__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_other) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  unsigned int __pyx_t_4;
+  int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("cosh", 1);
+  __Pyx_RefNannySetupContext("__ne__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":254
- *         Returns the hyperbolic cosine of the dual number.
+  /* "DualNum_c/Dual_c.pyx":386
+ *             The dual number to compare with the current dual number.
  *         """
- *         return Dual_c(math.cosh(self.real), self.dual * math.sinh(self.real))             # <<<<<<<<<<<<<<
+ *         return not self.__eq__(other)             # <<<<<<<<<<<<<<
  * 
- *     def tanh(self):
+ *     def __repr__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 254, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_eq); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_cosh); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sinh); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  }
-  __pyx_t_8 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
       PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
       __Pyx_INCREF(function);
       __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
+      __pyx_t_4 = 1;
     }
   }
   #endif
   {
-    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_3, __pyx_t_8};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_other};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 386, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 386, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyBool_FromLong((!__pyx_t_5)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 386, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":250
- *         return Dual_c(math.sinh(self.real), self.dual * math.cosh(self.real))
+  /* "DualNum_c/Dual_c.pyx":377
+ *         return False
  * 
- *     def cosh(self):             # <<<<<<<<<<<<<<
+ *     def __ne__(Dual_c self, other):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the hyperbolic cosine of the dual number.
+ *         Checks if two dual numbers differ.
  */
 
   /* function exit code */
@@ -8598,12 +8154,7 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42cosh(CYTHON_UNUSED PyObje
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.cosh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__ne__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8611,43 +8162,158 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42cosh(CYTHON_UNUSED PyObje
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":256
- *         return Dual_c(math.cosh(self.real), self.dual * math.sinh(self.real))
+/* "DualNum_c/Dual_c.pyx":388
+ *         return not self.__eq__(other)
  * 
- *     def tanh(self):             # <<<<<<<<<<<<<<
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the hyperbolic tangent of the dual number.
+ *         Returns a string representation of the dual number.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_45tanh(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27__repr__(PyObject *__pyx_v_self); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_26__repr__, "\n        Returns a string representation of the dual number.\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_26__repr__;
+#endif
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27__repr__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_26__repr__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_26__repr__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_UCS4 __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 1);
+
+  /* "DualNum_c/Dual_c.pyx":392
+ *         Returns a string representation of the dual number.
+ *         """
+ *         return f'Dual(real={self.real}, dual={self.dual})'             # <<<<<<<<<<<<<<
+ * 
+ *     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 127;
+  __Pyx_INCREF(__pyx_kp_u_Dual_real);
+  __pyx_t_2 += 10;
+  __Pyx_GIVEREF(__pyx_kp_u_Dual_real);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Dual_real);
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_4, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_3;
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __Pyx_INCREF(__pyx_kp_u_dual_2);
+  __pyx_t_2 += 7;
+  __Pyx_GIVEREF(__pyx_kp_u_dual_2);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_dual_2);
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_self->dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_FormatSimple(__pyx_t_5, __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_3;
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __Pyx_INCREF(__pyx_kp_u__3);
+  __pyx_t_2 += 1;
+  __Pyx_GIVEREF(__pyx_kp_u__3);
+  PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_kp_u__3);
+  __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_1, 5, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":388
+ *         return not self.__eq__(other)
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns a string representation of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":394
+ *         return f'Dual(real={self.real}, dual={self.dual})'
+ * 
+ *     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Implements NumPy ufuncs (``np.sin``, ``np.add``, ...) with the
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_29__array_ufunc__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_44tanh, "\n        Returns the hyperbolic tangent of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_45tanh = {"tanh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_45tanh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_44tanh};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_45tanh(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_28__array_ufunc__, "\n        Implements NumPy ufuncs (``np.sin``, ``np.add``, ...) with the\n        dual-number methods, returning a ``DualNum.DualArray`` when an\n        operand is an array. Needs the DualNum package.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_29__array_ufunc__ = {"__array_ufunc__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_29__array_ufunc__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_28__array_ufunc__};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_29__array_ufunc__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_ufunc = 0;
+  PyObject *__pyx_v_method = 0;
+  PyObject *__pyx_v_inputs = 0;
+  PyObject *__pyx_v_kwargs = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
+  PyObject* values[2] = {0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("tanh (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__array_ufunc__ (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -8656,40 +8322,64 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  __pyx_v_inputs = __Pyx_ArgsSlice_FASTCALL(__pyx_args, 2, __pyx_nargs);
+  if (unlikely(!__pyx_v_inputs)) {
+    __Pyx_DECREF(__pyx_v_kwargs); __pyx_v_kwargs = 0;
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __Pyx_GOTREF(__pyx_v_inputs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ufunc,&__pyx_n_s_method,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
+        default:
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
-        default: goto __pyx_L5_argtuple_error;
       }
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_ufunc)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 256, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 394, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_method)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 394, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__array_ufunc__", 0, 2, 2, 1); __PYX_ERR(0, 394, __pyx_L3_error)
+        }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "tanh") < 0)) __PYX_ERR(0, 256, __pyx_L3_error)
+        const Py_ssize_t used_pos_args = (kwd_pos_args < 2) ? kwd_pos_args : 2;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, __pyx_v_kwargs, values + 0, used_pos_args, "__array_ufunc__") < 0)) __PYX_ERR(0, 394, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 1)) {
+    } else if (unlikely(__pyx_nargs < 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
     }
-    __pyx_v_self = values[0];
+    __pyx_v_ufunc = values[0];
+    __pyx_v_method = values[1];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("tanh", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 256, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__array_ufunc__", 0, 2, 2, __pyx_nargs); __PYX_ERR(0, 394, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8699,13 +8389,17 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.tanh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_DECREF(__pyx_v_inputs); __pyx_v_inputs = 0;
+  __Pyx_DECREF(__pyx_v_kwargs); __pyx_v_kwargs = 0;
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__array_ufunc__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_44tanh(__pyx_self, __pyx_v_self);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28__array_ufunc__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), __pyx_v_ufunc, __pyx_v_method, __pyx_v_inputs, __pyx_v_kwargs);
 
   /* function exit code */
+  __Pyx_DECREF(__pyx_v_inputs);
+  __Pyx_DECREF(__pyx_v_kwargs);
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -8716,7 +8410,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_44tanh(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_28__array_ufunc__(CYTHON_UNUSED struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_ufunc, PyObject *__pyx_v_method, PyObject *__pyx_v_inputs, PyObject *__pyx_v_kwargs) {
+  PyObject *__pyx_v__scalar_array_ufunc = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -8724,185 +8419,219 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_44tanh(CYTHON_UNUSED PyObje
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  unsigned int __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("tanh", 1);
+  __Pyx_RefNannySetupContext("__array_ufunc__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":260
- *         Returns the hyperbolic tangent of the dual number.
+  /* "DualNum_c/Dual_c.pyx":400
+ *         operand is an array. Needs the DualNum package.
  *         """
- *         return Dual_c(math.tanh(self.real), self.dual / (math.cosh(self.real) ** 2))             # <<<<<<<<<<<<<<
- * 
- *     def asin(self):
+ *         try:             # <<<<<<<<<<<<<<
+ *             from DualNum.Dual import _scalar_array_ufunc
+ *         except ImportError:
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_tanh); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
   {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_cosh); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "DualNum_c/Dual_c.pyx":401
+ *         """
+ *         try:
+ *             from DualNum.Dual import _scalar_array_ufunc             # <<<<<<<<<<<<<<
+ *         except ImportError:
+ *             return NotImplemented
+ */
+      __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 401, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_n_s_scalar_array_ufunc);
+      __Pyx_GIVEREF(__pyx_n_s_scalar_array_ufunc);
+      if (__Pyx_PyList_SET_ITEM(__pyx_t_4, 0, __pyx_n_s_scalar_array_ufunc)) __PYX_ERR(0, 401, __pyx_L3_error);
+      __pyx_t_5 = __Pyx_Import(__pyx_n_s_DualNum_Dual, __pyx_t_4, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 401, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_5, __pyx_n_s_scalar_array_ufunc); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 401, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_v__scalar_array_ufunc = __pyx_t_4;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "DualNum_c/Dual_c.pyx":400
+ *         operand is an array. Needs the DualNum package.
+ *         """
+ *         try:             # <<<<<<<<<<<<<<
+ *             from DualNum.Dual import _scalar_array_ufunc
+ *         except ImportError:
+ */
     }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "DualNum_c/Dual_c.pyx":402
+ *         try:
+ *             from DualNum.Dual import _scalar_array_ufunc
+ *         except ImportError:             # <<<<<<<<<<<<<<
+ *             return NotImplemented
+ *         return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)
+ */
+    __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_ImportError);
+    if (__pyx_t_6) {
+      __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__array_ufunc__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_4, &__pyx_t_7) < 0) __PYX_ERR(0, 402, __pyx_L5_except_error)
+      __Pyx_XGOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_4);
+      __Pyx_XGOTREF(__pyx_t_7);
+
+      /* "DualNum_c/Dual_c.pyx":403
+ *             from DualNum.Dual import _scalar_array_ufunc
+ *         except ImportError:
+ *             return NotImplemented             # <<<<<<<<<<<<<<
+ *         return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_builtin_NotImplemented);
+      __pyx_r = __pyx_builtin_NotImplemented;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      goto __pyx_L6_except_return;
+    }
+    goto __pyx_L5_except_error;
+
+    /* "DualNum_c/Dual_c.pyx":400
+ *         operand is an array. Needs the DualNum package.
+ *         """
+ *         try:             # <<<<<<<<<<<<<<
+ *             from DualNum.Dual import _scalar_array_ufunc
+ *         except ImportError:
+ */
+    __pyx_L5_except_error:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L6_except_return:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L0;
+    __pyx_L8_try_end:;
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 260, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  }
-  __pyx_t_8 = PyNumber_Power(__pyx_t_4, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = NULL;
-  __pyx_t_7 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":404
+ *         except ImportError:
+ *             return NotImplemented
+ *         return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)             # <<<<<<<<<<<<<<
+ * 
+ *     def __array_function__(self, func, types, args, kwargs):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v__scalar_array_ufunc);
+  __pyx_t_4 = __pyx_v__scalar_array_ufunc; __pyx_t_5 = NULL;
+  __pyx_t_8 = 0;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_8)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_8);
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_8 = 1;
     }
   }
   #endif
   {
-    PyObject *__pyx_callargs[3] = {__pyx_t_8, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    PyObject *__pyx_callargs[6] = {__pyx_t_5, ((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_v_ufunc, __pyx_v_method, __pyx_v_inputs, __pyx_v_kwargs};
+    __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_8, 5+__pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 404, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":256
- *         return Dual_c(math.cosh(self.real), self.dual * math.sinh(self.real))
+  /* "DualNum_c/Dual_c.pyx":394
+ *         return f'Dual(real={self.real}, dual={self.dual})'
  * 
- *     def tanh(self):             # <<<<<<<<<<<<<<
+ *     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the hyperbolic tangent of the dual number.
+ *         Implements NumPy ufuncs (``np.sin``, ``np.add``, ...) with the
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.tanh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__array_ufunc__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v__scalar_array_ufunc);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":262
- *         return Dual_c(math.tanh(self.real), self.dual / (math.cosh(self.real) ** 2))
+/* "DualNum_c/Dual_c.pyx":406
+ *         return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)
  * 
- *     def asin(self):             # <<<<<<<<<<<<<<
+ *     def __array_function__(self, func, types, args, kwargs):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the arcsine of the dual number.
+ *         Implements the NumPy functions supported by ``DualNum.DualArray``
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_47asin(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_31__array_function__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_46asin, "\n        Returns the arcsine of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_47asin = {"asin", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_47asin, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_46asin};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_47asin(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_30__array_function__, "\n        Implements the NumPy functions supported by ``DualNum.DualArray``\n        (``np.sum``, ``np.dot``, ``np.where``, ...). Needs the DualNum package.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_31__array_function__ = {"__array_function__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_31__array_function__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_30__array_function__};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_31__array_function__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_func = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_types = 0;
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
+  PyObject* values[4] = {0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("asin (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__array_function__ (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -8912,10 +8641,16 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_func,&__pyx_n_s_types,&__pyx_n_s_args,&__pyx_n_s_kwargs,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
+        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -8924,27 +8659,63 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_func)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 262, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_types)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__array_function__", 1, 4, 4, 1); __PYX_ERR(0, 406, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_args)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__array_function__", 1, 4, 4, 2); __PYX_ERR(0, 406, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_kwargs)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__array_function__", 1, 4, 4, 3); __PYX_ERR(0, 406, __pyx_L3_error)
+        }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "asin") < 0)) __PYX_ERR(0, 262, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__array_function__") < 0)) __PYX_ERR(0, 406, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 1)) {
+    } else if (unlikely(__pyx_nargs != 4)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+      values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
     }
-    __pyx_v_self = values[0];
+    __pyx_v_func = values[0];
+    __pyx_v_types = values[1];
+    __pyx_v_args = values[2];
+    __pyx_v_kwargs = values[3];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("asin", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 262, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__array_function__", 1, 4, 4, __pyx_nargs); __PYX_ERR(0, 406, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8954,11 +8725,11 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.asin", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__array_function__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_46asin(__pyx_self, __pyx_v_self);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_30__array_function__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), __pyx_v_func, __pyx_v_types, __pyx_v_args, __pyx_v_kwargs);
 
   /* function exit code */
   {
@@ -8971,7 +8742,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_46asin(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_30__array_function__(CYTHON_UNUSED struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v_func, CYTHON_UNUSED PyObject *__pyx_v_types, PyObject *__pyx_v_args, PyObject *__pyx_v_kwargs) {
+  PyObject *__pyx_v__scalar_array_function = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -8979,188 +8751,211 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_46asin(CYTHON_UNUSED PyObje
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  unsigned int __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("asin", 1);
+  __Pyx_RefNannySetupContext("__array_function__", 1);
 
-  /* "DualNum_c/Dual_c.pyx":266
- *         Returns the arcsine of the dual number.
+  /* "DualNum_c/Dual_c.pyx":411
+ *         (``np.sum``, ``np.dot``, ``np.where``, ...). Needs the DualNum package.
  *         """
- *         return Dual_c(math.asin(self.real), self.dual / math.sqrt(1 - self.real ** 2))             # <<<<<<<<<<<<<<
- * 
- *     def acos(self):
+ *         try:             # <<<<<<<<<<<<<<
+ *             from DualNum.Dual import _scalar_array_function
+ *         except ImportError:
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_asin); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
   {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 266, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = PyNumber_Power(__pyx_t_6, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_SubtractCObj(__pyx_int_1, __pyx_t_9, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "DualNum_c/Dual_c.pyx":412
+ *         """
+ *         try:
+ *             from DualNum.Dual import _scalar_array_function             # <<<<<<<<<<<<<<
+ *         except ImportError:
+ *             return NotImplemented
+ */
+      __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 412, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_n_s_scalar_array_function);
+      __Pyx_GIVEREF(__pyx_n_s_scalar_array_function);
+      if (__Pyx_PyList_SET_ITEM(__pyx_t_4, 0, __pyx_n_s_scalar_array_function)) __PYX_ERR(0, 412, __pyx_L3_error);
+      __pyx_t_5 = __Pyx_Import(__pyx_n_s_DualNum_Dual, __pyx_t_4, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 412, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_5, __pyx_n_s_scalar_array_function); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 412, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_v__scalar_array_function = __pyx_t_4;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "DualNum_c/Dual_c.pyx":411
+ *         (``np.sum``, ``np.dot``, ``np.where``, ...). Needs the DualNum package.
+ *         """
+ *         try:             # <<<<<<<<<<<<<<
+ *             from DualNum.Dual import _scalar_array_function
+ *         except ImportError:
+ */
     }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "DualNum_c/Dual_c.pyx":413
+ *         try:
+ *             from DualNum.Dual import _scalar_array_function
+ *         except ImportError:             # <<<<<<<<<<<<<<
+ *             return NotImplemented
+ *         return _scalar_array_function(Dual_c, func, args, kwargs)
+ */
+    __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_ImportError);
+    if (__pyx_t_6) {
+      __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__array_function__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_4, &__pyx_t_7) < 0) __PYX_ERR(0, 413, __pyx_L5_except_error)
+      __Pyx_XGOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_4);
+      __Pyx_XGOTREF(__pyx_t_7);
+
+      /* "DualNum_c/Dual_c.pyx":414
+ *             from DualNum.Dual import _scalar_array_function
+ *         except ImportError:
+ *             return NotImplemented             # <<<<<<<<<<<<<<
+ *         return _scalar_array_function(Dual_c, func, args, kwargs)
+ * 
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_builtin_NotImplemented);
+      __pyx_r = __pyx_builtin_NotImplemented;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      goto __pyx_L6_except_return;
+    }
+    goto __pyx_L5_except_error;
+
+    /* "DualNum_c/Dual_c.pyx":411
+ *         (``np.sum``, ``np.dot``, ``np.where``, ...). Needs the DualNum package.
+ *         """
+ *         try:             # <<<<<<<<<<<<<<
+ *             from DualNum.Dual import _scalar_array_function
+ *         except ImportError:
+ */
+    __pyx_L5_except_error:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L6_except_return:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L0;
+    __pyx_L8_try_end:;
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 266, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  }
-  __pyx_t_8 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
+
+  /* "DualNum_c/Dual_c.pyx":415
+ *         except ImportError:
+ *             return NotImplemented
+ *         return _scalar_array_function(Dual_c, func, args, kwargs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v__scalar_array_function);
+  __pyx_t_4 = __pyx_v__scalar_array_function; __pyx_t_5 = NULL;
+  __pyx_t_8 = 0;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_8 = 1;
     }
   }
   #endif
   {
-    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_3, __pyx_t_8};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    PyObject *__pyx_callargs[5] = {__pyx_t_5, ((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_v_func, __pyx_v_args, __pyx_v_kwargs};
+    __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_8, 4+__pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 415, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":262
- *         return Dual_c(math.tanh(self.real), self.dual / (math.cosh(self.real) ** 2))
+  /* "DualNum_c/Dual_c.pyx":406
+ *         return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)
  * 
- *     def asin(self):             # <<<<<<<<<<<<<<
+ *     def __array_function__(self, func, types, args, kwargs):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the arcsine of the dual number.
+ *         Implements the NumPy functions supported by ``DualNum.DualArray``
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.asin", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__array_function__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v__scalar_array_function);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":268
- *         return Dual_c(math.asin(self.real), self.dual / math.sqrt(1 - self.real ** 2))
+/* "DualNum_c/Dual_c.pyx":419
  * 
- *     def acos(self):             # <<<<<<<<<<<<<<
+ *     # Class Methods
+ *     def get_real(self):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the arccosine of the dual number.
+ *         Returns the real part of the dual number.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_49acos(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_33get_real(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_48acos, "\n        Returns the arccosine of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_49acos = {"acos", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_49acos, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_48acos};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_49acos(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_32get_real, "\n        Returns the real part of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_33get_real = {"get_real", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_33get_real, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_32get_real};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_33get_real(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_self = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("acos (wrapper)", 0);
+  __Pyx_RefNannySetupContext("get_real (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -9169,215 +8964,51 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 268, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "acos") < 0)) __PYX_ERR(0, 268, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("acos", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 268, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.acos", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_48acos(__pyx_self, __pyx_v_self);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("get_real", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "get_real", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32get_real(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_48acos(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_32get_real(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("acos", 1);
+  __Pyx_RefNannySetupContext("get_real", 1);
 
-  /* "DualNum_c/Dual_c.pyx":272
- *         Returns the arccosine of the dual number.
+  /* "DualNum_c/Dual_c.pyx":423
+ *         Returns the real part of the dual number.
  *         """
- *         return Dual_c(math.acos(self.real), -self.dual / math.sqrt(1 - self.real ** 2))             # <<<<<<<<<<<<<<
+ *         return self.real             # <<<<<<<<<<<<<<
  * 
- *     def atan(self):
+ *     def get_dual(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_acos); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyNumber_Negative(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_math); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = PyNumber_Power(__pyx_t_6, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_SubtractCObj(__pyx_int_1, __pyx_t_9, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_9)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_t_6};
-    __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  }
-  __pyx_t_8 = __Pyx_PyNumber_Divide(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_8};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->real); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":268
- *         return Dual_c(math.asin(self.real), self.dual / math.sqrt(1 - self.real ** 2))
+  /* "DualNum_c/Dual_c.pyx":419
  * 
- *     def acos(self):             # <<<<<<<<<<<<<<
+ *     # Class Methods
+ *     def get_real(self):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the arccosine of the dual number.
+ *         Returns the real part of the dual number.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.acos", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.get_real", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -9385,43 +9016,38 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_48acos(CYTHON_UNUSED PyObje
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":274
- *         return Dual_c(math.acos(self.real), -self.dual / math.sqrt(1 - self.real ** 2))
+/* "DualNum_c/Dual_c.pyx":425
+ *         return self.real
  * 
- *     def atan(self):             # <<<<<<<<<<<<<<
+ *     def get_dual(self):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the arctangent of the dual number.
+ *         Returns the dual part of the dual number.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_51atan(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_35get_dual(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_50atan, "\n        Returns the arctangent of the dual number.\n        ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_51atan = {"atan", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_51atan, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_50atan};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_51atan(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_34get_dual, "\n        Returns the dual part of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_35get_dual = {"get_dual", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_35get_dual, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_34get_dual};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_35get_dual(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_self = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("atan (wrapper)", 0);
+  __Pyx_RefNannySetupContext("get_dual (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -9430,180 +9056,51 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_self)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 274, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "atan") < 0)) __PYX_ERR(0, 274, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_self = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("atan", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 274, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.atan", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_50atan(__pyx_self, __pyx_v_self);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("get_dual", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "get_dual", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_34get_dual(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_50atan(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_34get_dual(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  unsigned int __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("atan", 1);
+  __Pyx_RefNannySetupContext("get_dual", 1);
 
-  /* "DualNum_c/Dual_c.pyx":278
- *         Returns the arctangent of the dual number.
+  /* "DualNum_c/Dual_c.pyx":429
+ *         Returns the dual part of the dual number.
  *         """
- *         return Dual_c(math.atan(self.real), self.dual / (1 + self.real ** 2))             # <<<<<<<<<<<<<<
- * 
+ *         return self.dual             # <<<<<<<<<<<<<<
  * 
+ *     def sin(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_atan); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_dual); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_real); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = PyNumber_Power(__pyx_t_4, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyInt_AddCObj(__pyx_int_1, __pyx_t_6, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_3, __pyx_t_6};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->dual); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":274
- *         return Dual_c(math.acos(self.real), -self.dual / math.sqrt(1 - self.real ** 2))
+  /* "DualNum_c/Dual_c.pyx":425
+ *         return self.real
  * 
- *     def atan(self):             # <<<<<<<<<<<<<<
+ *     def get_dual(self):             # <<<<<<<<<<<<<<
  *         """
- *         Returns the arctangent of the dual number.
+ *         Returns the dual part of the dual number.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.atan", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.get_dual", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -9611,45 +9108,38 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_50atan(CYTHON_UNUSED PyObje
   return __pyx_r;
 }
 
-/* "DualNum_c/Dual_c.pyx":282
- * 
+/* "DualNum_c/Dual_c.pyx":431
+ *         return self.dual
  * 
- * def compute_derivative(func, x, dual_class):             # <<<<<<<<<<<<<<
- *     """
- *     Computes the derivative of a function at a given point using dual numbers.
+ *     def sin(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the sine of the dual number.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_1compute_derivative(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_37sin(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_compute_derivative, "\n    Computes the derivative of a function at a given point using dual numbers.\n\n    Parameters\n    ----------\n    func : function\n        The function to compute the derivative of.\n    \n    x : float\n        The point at which to compute the derivative.\n    \n    dual_class : Dual or Dual_c\n        The class to use for dual numbers.\n\n    Returns\n    -------\n    float\n        The derivative of the function at the given point.\n\n    Examples\n    --------\n    >>> def f(x):\n    ...     return x ** 2\n    >>> compute_derivative(f, 2, Dual_c)\n    4.0\n    ");
-static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_1compute_derivative = {"compute_derivative", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_1compute_derivative, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_compute_derivative};
-static PyObject *__pyx_pw_9DualNum_c_6Dual_c_1compute_derivative(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_36sin, "\n        Returns the sine of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_37sin = {"sin", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_37sin, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_36sin};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_37sin(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_func = 0;
-  PyObject *__pyx_v_x = 0;
-  PyObject *__pyx_v_dual_class = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("compute_derivative (wrapper)", 0);
+  __Pyx_RefNannySetupContext("sin (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -9658,173 +9148,88 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_func,&__pyx_n_s_x,&__pyx_n_s_dual_class,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_func)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_x)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("compute_derivative", 1, 3, 3, 1); __PYX_ERR(0, 282, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_dual_class)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("compute_derivative", 1, 3, 3, 2); __PYX_ERR(0, 282, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "compute_derivative") < 0)) __PYX_ERR(0, 282, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-    }
-    __pyx_v_func = values[0];
-    __pyx_v_x = values[1];
-    __pyx_v_dual_class = values[2];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("compute_derivative", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 282, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("DualNum_c.Dual_c.compute_derivative", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_compute_derivative(__pyx_self, __pyx_v_func, __pyx_v_x, __pyx_v_dual_class);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("sin", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "sin", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_36sin(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9DualNum_c_6Dual_c_compute_derivative(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_func, PyObject *__pyx_v_x, PyObject *__pyx_v_dual_class) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_36sin(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  unsigned int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("compute_derivative", 1);
+  __Pyx_RefNannySetupContext("sin", 1);
 
-  /* "DualNum_c/Dual_c.pyx":309
- *     4.0
- *     """
- *     return func(dual_class(x, 1)).dual             # <<<<<<<<<<<<<<
+  /* "DualNum_c/Dual_c.pyx":435
+ *         Returns the sine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("sin", Dual_c.sin, (self,))
+ *         return _box(dual_sin(as_dual(self)))
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_dual_class);
-  __pyx_t_3 = __pyx_v_dual_class; __pyx_t_4 = NULL;
-  __pyx_t_5 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_5 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_v_x, __pyx_int_1};
-    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 2+__pyx_t_5);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":436
+ *         """
+ *         if _profiling:
+ *             return _profiled("sin", Dual_c.sin, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_sin(as_dual(self)))
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_sin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 436, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 436, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __Pyx_INCREF(__pyx_v_func);
-  __pyx_t_3 = __pyx_v_func; __pyx_t_4 = NULL;
-  __pyx_t_5 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_5 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 436, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_sin, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 436, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":435
+ *         Returns the sine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("sin", Dual_c.sin, (self,))
+ *         return _box(dual_sin(as_dual(self)))
+ */
   }
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_dual); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":437
+ *         if _profiling:
+ *             return _profiled("sin", Dual_c.sin, (self,))
+ *         return _box(dual_sin(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ *     def cos(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_sin(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 437, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":282
- * 
+  /* "DualNum_c/Dual_c.pyx":431
+ *         return self.dual
  * 
- * def compute_derivative(func, x, dual_class):             # <<<<<<<<<<<<<<
- *     """
- *     Computes the derivative of a function at a given point using dual numbers.
+ *     def sin(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the sine of the dual number.
  */
 
   /* function exit code */
@@ -9832,8 +9237,7 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_compute_derivative(CYTHON_UNUSED Py
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("DualNum_c.Dual_c.compute_derivative", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sin", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -9841,442 +9245,3848 @@ static PyObject *__pyx_pf_9DualNum_c_6Dual_c_compute_derivative(CYTHON_UNUSED Py
   return __pyx_r;
 }
 
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-#ifndef CYTHON_SMALL_CODE
-#if defined(__clang__)
-    #define CYTHON_SMALL_CODE
-#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
-    #define CYTHON_SMALL_CODE __attribute__((cold))
-#else
-    #define CYTHON_SMALL_CODE
-#endif
-#endif
-/* #### Code section: pystring_table ### */
+/* "DualNum_c/Dual_c.pyx":439
+ *         return _box(dual_sin(as_dual(self)))
+ * 
+ *     def cos(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the cosine of the dual number.
+ */
 
-static int __Pyx_CreateStringTabAndInitStrings(void) {
-  __Pyx_StringTabEntry __pyx_string_tab[] = {
-    {&__pyx_kp_s_A_class_to_represent_a_dual_num, __pyx_k_A_class_to_represent_a_dual_num, sizeof(__pyx_k_A_class_to_represent_a_dual_num), 0, 0, 1, 0},
-    {&__pyx_kp_u_Computes_the_derivative_of_a_fu, __pyx_k_Computes_the_derivative_of_a_fu, sizeof(__pyx_k_Computes_the_derivative_of_a_fu), 0, 1, 0, 0},
-    {&__pyx_n_s_DualNum_c_Dual_c, __pyx_k_DualNum_c_Dual_c, sizeof(__pyx_k_DualNum_c_Dual_c), 0, 0, 1, 1},
-    {&__pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_k_DualNum_c_Dual_c_pyx, sizeof(__pyx_k_DualNum_c_Dual_c_pyx), 0, 0, 1, 0},
-    {&__pyx_n_s_Dual_c, __pyx_k_Dual_c, sizeof(__pyx_k_Dual_c), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___add, __pyx_k_Dual_c___add, sizeof(__pyx_k_Dual_c___add), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___eq, __pyx_k_Dual_c___eq, sizeof(__pyx_k_Dual_c___eq), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___init, __pyx_k_Dual_c___init, sizeof(__pyx_k_Dual_c___init), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___mul, __pyx_k_Dual_c___mul, sizeof(__pyx_k_Dual_c___mul), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___pow, __pyx_k_Dual_c___pow, sizeof(__pyx_k_Dual_c___pow), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___radd, __pyx_k_Dual_c___radd, sizeof(__pyx_k_Dual_c___radd), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___repr, __pyx_k_Dual_c___repr, sizeof(__pyx_k_Dual_c___repr), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___rmul, __pyx_k_Dual_c___rmul, sizeof(__pyx_k_Dual_c___rmul), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___rsub, __pyx_k_Dual_c___rsub, sizeof(__pyx_k_Dual_c___rsub), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___rtruediv, __pyx_k_Dual_c___rtruediv, sizeof(__pyx_k_Dual_c___rtruediv), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___sub, __pyx_k_Dual_c___sub, sizeof(__pyx_k_Dual_c___sub), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c___truediv, __pyx_k_Dual_c___truediv, sizeof(__pyx_k_Dual_c___truediv), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_acos, __pyx_k_Dual_c_acos, sizeof(__pyx_k_Dual_c_acos), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_asin, __pyx_k_Dual_c_asin, sizeof(__pyx_k_Dual_c_asin), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_atan, __pyx_k_Dual_c_atan, sizeof(__pyx_k_Dual_c_atan), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_cos, __pyx_k_Dual_c_cos, sizeof(__pyx_k_Dual_c_cos), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_cosh, __pyx_k_Dual_c_cosh, sizeof(__pyx_k_Dual_c_cosh), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_exp, __pyx_k_Dual_c_exp, sizeof(__pyx_k_Dual_c_exp), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_get_dual, __pyx_k_Dual_c_get_dual, sizeof(__pyx_k_Dual_c_get_dual), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_get_real, __pyx_k_Dual_c_get_real, sizeof(__pyx_k_Dual_c_get_real), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_log, __pyx_k_Dual_c_log, sizeof(__pyx_k_Dual_c_log), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_sin, __pyx_k_Dual_c_sin, sizeof(__pyx_k_Dual_c_sin), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_sinh, __pyx_k_Dual_c_sinh, sizeof(__pyx_k_Dual_c_sinh), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_sqrt, __pyx_k_Dual_c_sqrt, sizeof(__pyx_k_Dual_c_sqrt), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_tan, __pyx_k_Dual_c_tan, sizeof(__pyx_k_Dual_c_tan), 0, 0, 1, 1},
-    {&__pyx_n_s_Dual_c_tanh, __pyx_k_Dual_c_tanh, sizeof(__pyx_k_Dual_c_tanh), 0, 0, 1, 1},
-    {&__pyx_kp_u_Dual_real, __pyx_k_Dual_real, sizeof(__pyx_k_Dual_real), 0, 1, 0, 0},
-    {&__pyx_kp_u_Expected_dual_to_be_of_type_floa, __pyx_k_Expected_dual_to_be_of_type_floa, sizeof(__pyx_k_Expected_dual_to_be_of_type_floa), 0, 1, 0, 0},
-    {&__pyx_kp_u_Expected_real_to_be_of_type_floa, __pyx_k_Expected_real_to_be_of_type_floa, sizeof(__pyx_k_Expected_real_to_be_of_type_floa), 0, 1, 0, 0},
-    {&__pyx_kp_u_Logarithm_of_a_non_positive_numb, __pyx_k_Logarithm_of_a_non_positive_numb, sizeof(__pyx_k_Logarithm_of_a_non_positive_numb), 0, 1, 0, 0},
-    {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
-    {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-    {&__pyx_n_s_ZeroDivisionError, __pyx_k_ZeroDivisionError, sizeof(__pyx_k_ZeroDivisionError), 0, 0, 1, 1},
-    {&__pyx_kp_u__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0, 0},
-    {&__pyx_n_s__36, __pyx_k__36, sizeof(__pyx_k__36), 0, 0, 1, 1},
-    {&__pyx_n_s__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 0, 1, 1},
-    {&__pyx_n_s_acos, __pyx_k_acos, sizeof(__pyx_k_acos), 0, 0, 1, 1},
-    {&__pyx_n_s_add, __pyx_k_add, sizeof(__pyx_k_add), 0, 0, 1, 1},
-    {&__pyx_n_s_asin, __pyx_k_asin, sizeof(__pyx_k_asin), 0, 0, 1, 1},
-    {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
-    {&__pyx_n_s_atan, __pyx_k_atan, sizeof(__pyx_k_atan), 0, 0, 1, 1},
-    {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
-    {&__pyx_n_s_compute_derivative, __pyx_k_compute_derivative, sizeof(__pyx_k_compute_derivative), 0, 0, 1, 1},
-    {&__pyx_kp_u_compute_derivative_line_282, __pyx_k_compute_derivative_line_282, sizeof(__pyx_k_compute_derivative_line_282), 0, 1, 0, 0},
-    {&__pyx_n_s_cos, __pyx_k_cos, sizeof(__pyx_k_cos), 0, 0, 1, 1},
-    {&__pyx_n_s_cosh, __pyx_k_cosh, sizeof(__pyx_k_cosh), 0, 0, 1, 1},
-    {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
-    {&__pyx_kp_u_division_by_zero_is_undefined, __pyx_k_division_by_zero_is_undefined, sizeof(__pyx_k_division_by_zero_is_undefined), 0, 1, 0, 0},
-    {&__pyx_n_s_doc, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
-    {&__pyx_n_s_dual, __pyx_k_dual, sizeof(__pyx_k_dual), 0, 0, 1, 1},
-    {&__pyx_kp_u_dual_2, __pyx_k_dual_2, sizeof(__pyx_k_dual_2), 0, 1, 0, 0},
-    {&__pyx_n_s_dual_class, __pyx_k_dual_class, sizeof(__pyx_k_dual_class), 0, 0, 1, 1},
-    {&__pyx_n_s_eq, __pyx_k_eq, sizeof(__pyx_k_eq), 0, 0, 1, 1},
-    {&__pyx_n_s_exp, __pyx_k_exp, sizeof(__pyx_k_exp), 0, 0, 1, 1},
-    {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
-    {&__pyx_n_s_func, __pyx_k_func, sizeof(__pyx_k_func), 0, 0, 1, 1},
-    {&__pyx_n_s_get_dual, __pyx_k_get_dual, sizeof(__pyx_k_get_dual), 0, 0, 1, 1},
-    {&__pyx_n_s_get_real, __pyx_k_get_real, sizeof(__pyx_k_get_real), 0, 0, 1, 1},
-    {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
-    {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
-    {&__pyx_n_s_init_subclass, __pyx_k_init_subclass, sizeof(__pyx_k_init_subclass), 0, 0, 1, 1},
-    {&__pyx_n_s_initializing, __pyx_k_initializing, sizeof(__pyx_k_initializing), 0, 0, 1, 1},
-    {&__pyx_kp_u_instead, __pyx_k_instead, sizeof(__pyx_k_instead), 0, 1, 0, 0},
-    {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
-    {&__pyx_n_s_log, __pyx_k_log, sizeof(__pyx_k_log), 0, 0, 1, 1},
-    {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-    {&__pyx_n_s_math, __pyx_k_math, sizeof(__pyx_k_math), 0, 0, 1, 1},
-    {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
-    {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
-    {&__pyx_n_s_mul, __pyx_k_mul, sizeof(__pyx_k_mul), 0, 0, 1, 1},
-    {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
-    {&__pyx_n_s_other, __pyx_k_other, sizeof(__pyx_k_other), 0, 0, 1, 1},
-    {&__pyx_n_s_pow, __pyx_k_pow, sizeof(__pyx_k_pow), 0, 0, 1, 1},
-    {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
-    {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
-    {&__pyx_n_s_radd, __pyx_k_radd, sizeof(__pyx_k_radd), 0, 0, 1, 1},
-    {&__pyx_n_s_real, __pyx_k_real, sizeof(__pyx_k_real), 0, 0, 1, 1},
-    {&__pyx_n_s_repr, __pyx_k_repr, sizeof(__pyx_k_repr), 0, 0, 1, 1},
-    {&__pyx_n_s_rmul, __pyx_k_rmul, sizeof(__pyx_k_rmul), 0, 0, 1, 1},
-    {&__pyx_n_s_rsub, __pyx_k_rsub, sizeof(__pyx_k_rsub), 0, 0, 1, 1},
-    {&__pyx_n_s_rtruediv, __pyx_k_rtruediv, sizeof(__pyx_k_rtruediv), 0, 0, 1, 1},
-    {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
-    {&__pyx_n_s_set_name, __pyx_k_set_name, sizeof(__pyx_k_set_name), 0, 0, 1, 1},
-    {&__pyx_n_s_sin, __pyx_k_sin, sizeof(__pyx_k_sin), 0, 0, 1, 1},
-    {&__pyx_n_s_sinh, __pyx_k_sinh, sizeof(__pyx_k_sinh), 0, 0, 1, 1},
-    {&__pyx_n_s_spec, __pyx_k_spec, sizeof(__pyx_k_spec), 0, 0, 1, 1},
-    {&__pyx_n_s_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 0, 1, 1},
-    {&__pyx_n_s_sub, __pyx_k_sub, sizeof(__pyx_k_sub), 0, 0, 1, 1},
-    {&__pyx_n_s_super, __pyx_k_super, sizeof(__pyx_k_super), 0, 0, 1, 1},
-    {&__pyx_n_s_tan, __pyx_k_tan, sizeof(__pyx_k_tan), 0, 0, 1, 1},
-    {&__pyx_n_s_tanh, __pyx_k_tanh, sizeof(__pyx_k_tanh), 0, 0, 1, 1},
-    {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-    {&__pyx_n_s_truediv, __pyx_k_truediv, sizeof(__pyx_k_truediv), 0, 0, 1, 1},
-    {&__pyx_kp_u_unsupported_operand_type_s_for_a, __pyx_k_unsupported_operand_type_s_for_a, sizeof(__pyx_k_unsupported_operand_type_s_for_a), 0, 1, 0, 0},
-    {&__pyx_kp_u_unsupported_operand_type_s_for_a_2, __pyx_k_unsupported_operand_type_s_for_a_2, sizeof(__pyx_k_unsupported_operand_type_s_for_a_2), 0, 1, 0, 0},
-    {&__pyx_kp_u_unsupported_operand_type_s_for_a_3, __pyx_k_unsupported_operand_type_s_for_a_3, sizeof(__pyx_k_unsupported_operand_type_s_for_a_3), 0, 1, 0, 0},
-    {&__pyx_kp_u_unsupported_operand_type_s_for_a_4, __pyx_k_unsupported_operand_type_s_for_a_4, sizeof(__pyx_k_unsupported_operand_type_s_for_a_4), 0, 1, 0, 0},
-    {&__pyx_kp_u_unsupported_operand_type_s_for_a_5, __pyx_k_unsupported_operand_type_s_for_a_5, sizeof(__pyx_k_unsupported_operand_type_s_for_a_5), 0, 1, 0, 0},
-    {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
-    {0, 0, 0, 0, 0, 0, 0}
-  };
-  return __Pyx_InitStrings(__pyx_string_tab);
-}
-/* #### Code section: cached_builtins ### */
-static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 44, __pyx_L1_error)
-  __pyx_builtin_ZeroDivisionError = __Pyx_GetBuiltinName(__pyx_n_s_ZeroDivisionError); if (!__pyx_builtin_ZeroDivisionError) __PYX_ERR(0, 140, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 235, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_39cos(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_38cos, "\n        Returns the cosine of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_39cos = {"cos", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_39cos, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_38cos};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_39cos(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("cos (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("cos", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "cos", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_38cos(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-/* #### Code section: cached_constants ### */
 
-static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_38cos(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("cos", 1);
 
-  /* "DualNum_c/Dual_c.pyx":140
+  /* "DualNum_c/Dual_c.pyx":443
+ *         Returns the cosine of the dual number.
  *         """
- *         if other.real == 0:
- *             raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
- *         if isinstance(other, Dual_c):
- *             return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("cos", Dual_c.cos, (self,))
+ *         return _box(dual_cos(as_dual(self)))
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_division_by_zero_is_undefined); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple_);
-  __Pyx_GIVEREF(__pyx_tuple_);
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
 
-  /* "DualNum_c/Dual_c.pyx":235
+    /* "DualNum_c/Dual_c.pyx":444
  *         """
- *         if self.real <= 0:
- *             raise ValueError("Logarithm of a non-positive number is undefined.")             # <<<<<<<<<<<<<<
- *         return Dual_c(math.log(self.real), self.dual / self.real)
+ *         if _profiling:
+ *             return _profiled("cos", Dual_c.cos, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_cos(as_dual(self)))
  * 
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Logarithm_of_a_non_positive_numb); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 235, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_cos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 444, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_cos, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":25
- * 
- *     # Special Methods
- *     def __init__(self, real, dual):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":443
+ *         Returns the cosine of the dual number.
  *         """
- *         Constructs all the necessary attributes for the Dual object.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("cos", Dual_c.cos, (self,))
+ *         return _box(dual_cos(as_dual(self)))
  */
-  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_real, __pyx_n_s_dual); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
-  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_init, 25, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 25, __pyx_L1_error)
+  }
 
-  /* "DualNum_c/Dual_c.pyx":52
- *         self.dual = dual
+  /* "DualNum_c/Dual_c.pyx":445
+ *         if _profiling:
+ *             return _profiled("cos", Dual_c.cos, (self,))
+ *         return _box(dual_cos(as_dual(self)))             # <<<<<<<<<<<<<<
  * 
- *     def __add__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Adds a dual number and another dual number or scalar.
+ *     def tan(self):
  */
-  __pyx_tuple__7 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_other); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 52, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_add, 52, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_cos(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":67
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pyx":439
+ *         return _box(dual_sin(as_dual(self)))
  * 
- *     def __radd__(self, other):             # <<<<<<<<<<<<<<
+ *     def cos(self):             # <<<<<<<<<<<<<<
  *         """
- *         Adds a dual number and another dual number or scalar.
+ *         Returns the cosine of the dual number.
  */
-  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_radd, 67, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 67, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":78
- *         return self.__add__(other)
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.cos", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":447
+ *         return _box(dual_cos(as_dual(self)))
  * 
- *     def __sub__(self, other):             # <<<<<<<<<<<<<<
+ *     def tan(self):             # <<<<<<<<<<<<<<
  *         """
- *         Subtracts one dual number from another dual or int/float.
+ *         Returns the tangent of the dual number.
  */
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_sub, 78, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 78, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":93
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
- * 
- *     def __rsub__(self, other):             # <<<<<<<<<<<<<<
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_41tan(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_40tan, "\n        Returns the tangent of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_41tan = {"tan", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_41tan, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_40tan};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_41tan(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("tan (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("tan", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "tan", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40tan(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_40tan(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("tan", 1);
+
+  /* "DualNum_c/Dual_c.pyx":451
+ *         Returns the tangent of the dual number.
  *         """
- *         Subtracts one dual number from another dual or int/float.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("tan", Dual_c.tan, (self,))
+ *         return _box(dual_tan(as_dual(self)))
  */
-  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_rsub, 93, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 93, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
 
-  /* "DualNum_c/Dual_c.pyx":104
- *         return self.__sub__(other)
- * 
- *     def __mul__(self, other):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":452
  *         """
- *         Multiplies a dual number with another dual number or an int/float.
+ *         if _profiling:
+ *             return _profiled("tan", Dual_c.tan, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_tan(as_dual(self)))
+ * 
  */
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_mul, 104, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 104, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_tan); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 452, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 452, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 452, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_tan, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 452, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":119
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
- * 
- *     def __rmul__(self, other):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":451
+ *         Returns the tangent of the dual number.
  *         """
- *         Multiplies a dual number with another dual number or an int/float.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("tan", Dual_c.tan, (self,))
+ *         return _box(dual_tan(as_dual(self)))
  */
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_rmul, 119, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 119, __pyx_L1_error)
+  }
 
-  /* "DualNum_c/Dual_c.pyx":130
- *         return self.__mul__(other)
+  /* "DualNum_c/Dual_c.pyx":453
+ *         if _profiling:
+ *             return _profiled("tan", Dual_c.tan, (self,))
+ *         return _box(dual_tan(as_dual(self)))             # <<<<<<<<<<<<<<
  * 
- *     def __truediv__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Divides one dual number by another dual number or an int/float.
+ *     def exp(self):
  */
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_truediv, 130, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_tan(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":147
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pyx":447
+ *         return _box(dual_cos(as_dual(self)))
  * 
- *     def __rtruediv__(self, other):             # <<<<<<<<<<<<<<
+ *     def tan(self):             # <<<<<<<<<<<<<<
  *         """
- *         Divides one dual number by another dual number or an int/float.
+ *         Returns the tangent of the dual number.
  */
-  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_rtruediv, 147, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 147, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":158
- *         return self.__truediv__(other)
- * 
- *     def __pow__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Raises the dual number to the power of another dual number.
- */
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_pow, 158, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 158, __pyx_L1_error)
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.tan", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "DualNum_c/Dual_c.pyx":171
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+/* "DualNum_c/Dual_c.pyx":455
+ *         return _box(dual_tan(as_dual(self)))
  * 
- *     def __eq__(self, other):             # <<<<<<<<<<<<<<
+ *     def exp(self):             # <<<<<<<<<<<<<<
  *         """
- *         Checks if two dual numbers are equal.
+ *         Returns the exponential of the dual number.
  */
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_eq, 171, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 171, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":186
- * 
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         """
- *         Returns a string representation of the dual number.
- */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 186, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_repr, 186, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 186, __pyx_L1_error)
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_43exp(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_42exp, "\n        Returns the exponential of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_43exp = {"exp", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_43exp, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_42exp};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_43exp(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("exp (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("exp", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "exp", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42exp(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
 
-  /* "DualNum_c/Dual_c.pyx":194
- * 
- *     # Class Methods
- *     def get_real(self):             # <<<<<<<<<<<<<<
- *         """
- *         Returns the real part of the dual number.
- */
-  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_get_real, 194, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 194, __pyx_L1_error)
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "DualNum_c/Dual_c.pyx":200
- *         return self.real
- * 
- *     def get_dual(self):             # <<<<<<<<<<<<<<
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_42exp(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("exp", 1);
+
+  /* "DualNum_c/Dual_c.pyx":459
+ *         Returns the exponential of the dual number.
  *         """
- *         Returns the dual part of the dual number.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("exp", Dual_c.exp, (self,))
+ *         return _box(dual_exp(as_dual(self)))
  */
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_get_dual, 200, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 200, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
 
-  /* "DualNum_c/Dual_c.pyx":206
- *         return self.dual
- * 
- *     def sin(self):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":460
  *         """
- *         Returns the sine of the dual number.
+ *         if _profiling:
+ *             return _profiled("exp", Dual_c.exp, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_exp(as_dual(self)))
+ * 
  */
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_sin, 206, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 206, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_exp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 460, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 460, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 460, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_exp, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 460, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":212
- *         return Dual_c(math.sin(self.real), self.dual * math.cos(self.real))
- * 
- *     def cos(self):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":459
+ *         Returns the exponential of the dual number.
  *         """
- *         Returns the cosine of the dual number.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("exp", Dual_c.exp, (self,))
+ *         return _box(dual_exp(as_dual(self)))
  */
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_cos, 212, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 212, __pyx_L1_error)
+  }
 
-  /* "DualNum_c/Dual_c.pyx":218
- *         return Dual_c(math.cos(self.real), -self.dual * math.sin(self.real))
+  /* "DualNum_c/Dual_c.pyx":461
+ *         if _profiling:
+ *             return _profiled("exp", Dual_c.exp, (self,))
+ *         return _box(dual_exp(as_dual(self)))             # <<<<<<<<<<<<<<
  * 
- *     def tan(self):             # <<<<<<<<<<<<<<
- *         """
- *         Returns the tangent of the dual number.
+ *     def log(self):
  */
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_tan, 218, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_exp(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 461, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":224
- *         return Dual_c(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))
+  /* "DualNum_c/Dual_c.pyx":455
+ *         return _box(dual_tan(as_dual(self)))
  * 
  *     def exp(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the exponential of the dual number.
  */
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_exp, 224, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 224, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":230
- *         return Dual_c(math.exp(self.real), self.dual * math.exp(self.real))
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.exp", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":463
+ *         return _box(dual_exp(as_dual(self)))
  * 
  *     def log(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the natural logarithm of the dual number.
  */
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_log, 230, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 230, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":238
- *         return Dual_c(math.log(self.real), self.dual / self.real)
- * 
- *     def sqrt(self):             # <<<<<<<<<<<<<<
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_45log(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_44log, "\n        Returns the natural logarithm of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_45log = {"log", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_45log, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_44log};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_45log(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("log (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("log", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "log", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_44log(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_44log(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("log", 1);
+
+  /* "DualNum_c/Dual_c.pyx":467
+ *         Returns the natural logarithm of the dual number.
  *         """
- *         Returns the square root of the dual number.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("log", Dual_c.log, (self,))
+ *         if self.real <= 0:
  */
-  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_sqrt, 238, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 238, __pyx_L1_error)
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
 
-  /* "DualNum_c/Dual_c.pyx":244
- *         return Dual_c(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))
- * 
- *     def sinh(self):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":468
  *         """
- *         Returns the hyperbolic sine of the dual number.
+ *         if _profiling:
+ *             return _profiled("log", Dual_c.log, (self,))             # <<<<<<<<<<<<<<
+ *         if self.real <= 0:
+ *             raise ValueError("Logarithm of a non-positive number is undefined.")
  */
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_sinh, 244, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 244, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 468, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 468, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 468, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_log, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 468, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":250
- *         return Dual_c(math.sinh(self.real), self.dual * math.cosh(self.real))
- * 
- *     def cosh(self):             # <<<<<<<<<<<<<<
+    /* "DualNum_c/Dual_c.pyx":467
+ *         Returns the natural logarithm of the dual number.
  *         """
- *         Returns the hyperbolic cosine of the dual number.
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("log", Dual_c.log, (self,))
+ *         if self.real <= 0:
  */
-  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_cosh, 250, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 250, __pyx_L1_error)
+  }
 
-  /* "DualNum_c/Dual_c.pyx":256
- *         return Dual_c(math.cosh(self.real), self.dual * math.sinh(self.real))
- * 
- *     def tanh(self):             # <<<<<<<<<<<<<<
- *         """
- *         Returns the hyperbolic tangent of the dual number.
+  /* "DualNum_c/Dual_c.pyx":469
+ *         if _profiling:
+ *             return _profiled("log", Dual_c.log, (self,))
+ *         if self.real <= 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Logarithm of a non-positive number is undefined.")
+ *         return _box(dual_log(as_dual(self)))
  */
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_tanh, 256, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_t_4 = (__pyx_v_self->real <= 0.0);
+  if (unlikely(__pyx_t_4)) {
 
-  /* "DualNum_c/Dual_c.pyx":262
- *         return Dual_c(math.tanh(self.real), self.dual / (math.cosh(self.real) ** 2))
+    /* "DualNum_c/Dual_c.pyx":470
+ *             return _profiled("log", Dual_c.log, (self,))
+ *         if self.real <= 0:
+ *             raise ValueError("Logarithm of a non-positive number is undefined.")             # <<<<<<<<<<<<<<
+ *         return _box(dual_log(as_dual(self)))
  * 
- *     def asin(self):             # <<<<<<<<<<<<<<
- *         """
- *         Returns the arcsine of the dual number.
  */
-  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_asin, 262, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 262, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 470, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 470, __pyx_L1_error)
 
-  /* "DualNum_c/Dual_c.pyx":268
- *         return Dual_c(math.asin(self.real), self.dual / math.sqrt(1 - self.real ** 2))
- * 
- *     def acos(self):             # <<<<<<<<<<<<<<
- *         """
- *         Returns the arccosine of the dual number.
+    /* "DualNum_c/Dual_c.pyx":469
+ *         if _profiling:
+ *             return _profiled("log", Dual_c.log, (self,))
+ *         if self.real <= 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Logarithm of a non-positive number is undefined.")
+ *         return _box(dual_log(as_dual(self)))
  */
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_acos, 268, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 268, __pyx_L1_error)
+  }
 
-  /* "DualNum_c/Dual_c.pyx":274
- *         return Dual_c(math.acos(self.real), -self.dual / math.sqrt(1 - self.real ** 2))
+  /* "DualNum_c/Dual_c.pyx":471
+ *         if self.real <= 0:
+ *             raise ValueError("Logarithm of a non-positive number is undefined.")
+ *         return _box(dual_log(as_dual(self)))             # <<<<<<<<<<<<<<
  * 
- *     def atan(self):             # <<<<<<<<<<<<<<
- *         """
- *         Returns the arctangent of the dual number.
+ *     def sqrt(self):
  */
-  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_atan, 274, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_log(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 471, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
 
-  /* "DualNum_c/Dual_c.pyx":282
+  /* "DualNum_c/Dual_c.pyx":463
+ *         return _box(dual_exp(as_dual(self)))
  * 
- * 
- * def compute_derivative(func, x, dual_class):             # <<<<<<<<<<<<<<
- *     """
- *     Computes the derivative of a function at a given point using dual numbers.
+ *     def log(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the natural logarithm of the dual number.
  */
-  __pyx_tuple__34 = PyTuple_Pack(3, __pyx_n_s_func, __pyx_n_s_x, __pyx_n_s_dual_class); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 282, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__34);
-  __Pyx_GIVEREF(__pyx_tuple__34);
-  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_compute_derivative, 282, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 282, __pyx_L1_error)
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-/* #### Code section: init_constants ### */
 
-static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
-  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  return 0;
+  /* function exit code */
   __pyx_L1_error:;
-  return -1;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.log", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-/* #### Code section: init_globals ### */
 
-static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  return 0;
+/* "DualNum_c/Dual_c.pyx":473
+ *         return _box(dual_log(as_dual(self)))
+ * 
+ *     def sqrt(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the square root of the dual number.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_47sqrt(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_46sqrt, "\n        Returns the square root of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_47sqrt = {"sqrt", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_47sqrt, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_46sqrt};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_47sqrt(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sqrt (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("sqrt", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "sqrt", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_46sqrt(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_46sqrt(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sqrt", 1);
+
+  /* "DualNum_c/Dual_c.pyx":477
+ *         Returns the square root of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("sqrt", Dual_c.sqrt, (self,))
+ *         if self.real < 0:
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":478
+ *         """
+ *         if _profiling:
+ *             return _profiled("sqrt", Dual_c.sqrt, (self,))             # <<<<<<<<<<<<<<
+ *         if self.real < 0:
+ *             raise ValueError("math domain error")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_sqrt); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 478, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 478, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 478, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_sqrt, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 478, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":477
+ *         Returns the square root of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("sqrt", Dual_c.sqrt, (self,))
+ *         if self.real < 0:
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":479
+ *         if _profiling:
+ *             return _profiled("sqrt", Dual_c.sqrt, (self,))
+ *         if self.real < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("math domain error")
+ *         if self.real == 0:
+ */
+  __pyx_t_4 = (__pyx_v_self->real < 0.0);
+  if (unlikely(__pyx_t_4)) {
+
+    /* "DualNum_c/Dual_c.pyx":480
+ *             return _profiled("sqrt", Dual_c.sqrt, (self,))
+ *         if self.real < 0:
+ *             raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *         if self.real == 0:
+ *             raise ZeroDivisionError("division by zero is undefined")
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 480, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 480, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":479
+ *         if _profiling:
+ *             return _profiled("sqrt", Dual_c.sqrt, (self,))
+ *         if self.real < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("math domain error")
+ *         if self.real == 0:
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":481
+ *         if self.real < 0:
+ *             raise ValueError("math domain error")
+ *         if self.real == 0:             # <<<<<<<<<<<<<<
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_sqrt(as_dual(self)))
+ */
+  __pyx_t_4 = (__pyx_v_self->real == 0.0);
+  if (unlikely(__pyx_t_4)) {
+
+    /* "DualNum_c/Dual_c.pyx":482
+ *             raise ValueError("math domain error")
+ *         if self.real == 0:
+ *             raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *         return _box(dual_sqrt(as_dual(self)))
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 482, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 482, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":481
+ *         if self.real < 0:
+ *             raise ValueError("math domain error")
+ *         if self.real == 0:             # <<<<<<<<<<<<<<
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_sqrt(as_dual(self)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":483
+ *         if self.real == 0:
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_sqrt(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ *     def sinh(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_sqrt(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":473
+ *         return _box(dual_log(as_dual(self)))
+ * 
+ *     def sqrt(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the square root of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sqrt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":485
+ *         return _box(dual_sqrt(as_dual(self)))
+ * 
+ *     def sinh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic sine of the dual number.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_49sinh(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_48sinh, "\n        Returns the hyperbolic sine of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_49sinh = {"sinh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_49sinh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_48sinh};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_49sinh(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sinh (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("sinh", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "sinh", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_48sinh(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_48sinh(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sinh", 1);
+
+  /* "DualNum_c/Dual_c.pyx":489
+ *         Returns the hyperbolic sine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("sinh", Dual_c.sinh, (self,))
+ *         return _box(dual_sinh(as_dual(self)))
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":490
+ *         """
+ *         if _profiling:
+ *             return _profiled("sinh", Dual_c.sinh, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_sinh(as_dual(self)))
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_sinh); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 490, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 490, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 490, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_sinh, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 490, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":489
+ *         Returns the hyperbolic sine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("sinh", Dual_c.sinh, (self,))
+ *         return _box(dual_sinh(as_dual(self)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":491
+ *         if _profiling:
+ *             return _profiled("sinh", Dual_c.sinh, (self,))
+ *         return _box(dual_sinh(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ *     def cosh(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_sinh(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":485
+ *         return _box(dual_sqrt(as_dual(self)))
+ * 
+ *     def sinh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic sine of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.sinh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":493
+ *         return _box(dual_sinh(as_dual(self)))
+ * 
+ *     def cosh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic cosine of the dual number.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_51cosh(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_50cosh, "\n        Returns the hyperbolic cosine of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_51cosh = {"cosh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_51cosh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_50cosh};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_51cosh(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("cosh (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("cosh", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "cosh", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_50cosh(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_50cosh(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("cosh", 1);
+
+  /* "DualNum_c/Dual_c.pyx":497
+ *         Returns the hyperbolic cosine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("cosh", Dual_c.cosh, (self,))
+ *         return _box(dual_cosh(as_dual(self)))
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":498
+ *         """
+ *         if _profiling:
+ *             return _profiled("cosh", Dual_c.cosh, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_cosh(as_dual(self)))
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_cosh); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 498, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 498, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 498, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_cosh, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 498, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":497
+ *         Returns the hyperbolic cosine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("cosh", Dual_c.cosh, (self,))
+ *         return _box(dual_cosh(as_dual(self)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":499
+ *         if _profiling:
+ *             return _profiled("cosh", Dual_c.cosh, (self,))
+ *         return _box(dual_cosh(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ *     def tanh(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_cosh(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 499, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":493
+ *         return _box(dual_sinh(as_dual(self)))
+ * 
+ *     def cosh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic cosine of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.cosh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":501
+ *         return _box(dual_cosh(as_dual(self)))
+ * 
+ *     def tanh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic tangent of the dual number.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_53tanh(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_52tanh, "\n        Returns the hyperbolic tangent of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_53tanh = {"tanh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_53tanh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_52tanh};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_53tanh(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("tanh (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("tanh", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "tanh", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_52tanh(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_52tanh(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("tanh", 1);
+
+  /* "DualNum_c/Dual_c.pyx":505
+ *         Returns the hyperbolic tangent of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("tanh", Dual_c.tanh, (self,))
+ *         return _box(dual_tanh(as_dual(self)))
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":506
+ *         """
+ *         if _profiling:
+ *             return _profiled("tanh", Dual_c.tanh, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_tanh(as_dual(self)))
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_tanh); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 506, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_tanh, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":505
+ *         Returns the hyperbolic tangent of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("tanh", Dual_c.tanh, (self,))
+ *         return _box(dual_tanh(as_dual(self)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":507
+ *         if _profiling:
+ *             return _profiled("tanh", Dual_c.tanh, (self,))
+ *         return _box(dual_tanh(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ *     def asin(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_tanh(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 507, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":501
+ *         return _box(dual_cosh(as_dual(self)))
+ * 
+ *     def tanh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic tangent of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.tanh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":509
+ *         return _box(dual_tanh(as_dual(self)))
+ * 
+ *     def asin(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arcsine of the dual number.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_55asin(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_54asin, "\n        Returns the arcsine of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_55asin = {"asin", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_55asin, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_54asin};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_55asin(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("asin (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("asin", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "asin", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_54asin(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_54asin(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("asin", 1);
+
+  /* "DualNum_c/Dual_c.pyx":513
+ *         Returns the arcsine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("asin", Dual_c.asin, (self,))
+ *         if self.real < -1 or self.real > 1:
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":514
+ *         """
+ *         if _profiling:
+ *             return _profiled("asin", Dual_c.asin, (self,))             # <<<<<<<<<<<<<<
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_asin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 514, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 514, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 514, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_asin, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 514, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":513
+ *         Returns the arcsine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("asin", Dual_c.asin, (self,))
+ *         if self.real < -1 or self.real > 1:
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":515
+ *         if _profiling:
+ *             return _profiled("asin", Dual_c.asin, (self,))
+ *         if self.real < -1 or self.real > 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:
+ */
+  __pyx_t_5 = (__pyx_v_self->real < -1.0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_5 = (__pyx_v_self->real > 1.0);
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L5_bool_binop_done:;
+  if (unlikely(__pyx_t_4)) {
+
+    /* "DualNum_c/Dual_c.pyx":516
+ *             return _profiled("asin", Dual_c.asin, (self,))
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *         if fabs(self.real) == 1:
+ *             raise ZeroDivisionError("division by zero is undefined")
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 516, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 516, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":515
+ *         if _profiling:
+ *             return _profiled("asin", Dual_c.asin, (self,))
+ *         if self.real < -1 or self.real > 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":517
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:             # <<<<<<<<<<<<<<
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_asin(as_dual(self)))
+ */
+  __pyx_t_4 = (fabs(__pyx_v_self->real) == 1.0);
+  if (unlikely(__pyx_t_4)) {
+
+    /* "DualNum_c/Dual_c.pyx":518
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:
+ *             raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *         return _box(dual_asin(as_dual(self)))
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 518, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 518, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":517
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:             # <<<<<<<<<<<<<<
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_asin(as_dual(self)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":519
+ *         if fabs(self.real) == 1:
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_asin(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ *     def acos(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_asin(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":509
+ *         return _box(dual_tanh(as_dual(self)))
+ * 
+ *     def asin(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arcsine of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.asin", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":521
+ *         return _box(dual_asin(as_dual(self)))
+ * 
+ *     def acos(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arccosine of the dual number.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_57acos(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_56acos, "\n        Returns the arccosine of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_57acos = {"acos", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_57acos, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_56acos};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_57acos(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("acos (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("acos", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "acos", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_56acos(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_56acos(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("acos", 1);
+
+  /* "DualNum_c/Dual_c.pyx":525
+ *         Returns the arccosine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("acos", Dual_c.acos, (self,))
+ *         if self.real < -1 or self.real > 1:
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":526
+ *         """
+ *         if _profiling:
+ *             return _profiled("acos", Dual_c.acos, (self,))             # <<<<<<<<<<<<<<
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_acos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 526, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 526, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 526, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_acos, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 526, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":525
+ *         Returns the arccosine of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("acos", Dual_c.acos, (self,))
+ *         if self.real < -1 or self.real > 1:
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":527
+ *         if _profiling:
+ *             return _profiled("acos", Dual_c.acos, (self,))
+ *         if self.real < -1 or self.real > 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:
+ */
+  __pyx_t_5 = (__pyx_v_self->real < -1.0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_5 = (__pyx_v_self->real > 1.0);
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L5_bool_binop_done:;
+  if (unlikely(__pyx_t_4)) {
+
+    /* "DualNum_c/Dual_c.pyx":528
+ *             return _profiled("acos", Dual_c.acos, (self,))
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *         if fabs(self.real) == 1:
+ *             raise ZeroDivisionError("division by zero is undefined")
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 528, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 528, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":527
+ *         if _profiling:
+ *             return _profiled("acos", Dual_c.acos, (self,))
+ *         if self.real < -1 or self.real > 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":529
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:             # <<<<<<<<<<<<<<
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_acos(as_dual(self)))
+ */
+  __pyx_t_4 = (fabs(__pyx_v_self->real) == 1.0);
+  if (unlikely(__pyx_t_4)) {
+
+    /* "DualNum_c/Dual_c.pyx":530
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:
+ *             raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *         return _box(dual_acos(as_dual(self)))
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ZeroDivisionError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 530, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 530, __pyx_L1_error)
+
+    /* "DualNum_c/Dual_c.pyx":529
+ *         if self.real < -1 or self.real > 1:
+ *             raise ValueError("math domain error")
+ *         if fabs(self.real) == 1:             # <<<<<<<<<<<<<<
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_acos(as_dual(self)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":531
+ *         if fabs(self.real) == 1:
+ *             raise ZeroDivisionError("division by zero is undefined")
+ *         return _box(dual_acos(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ *     def atan(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_acos(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":521
+ *         return _box(dual_asin(as_dual(self)))
+ * 
+ *     def acos(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arccosine of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.acos", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":533
+ *         return _box(dual_acos(as_dual(self)))
+ * 
+ *     def atan(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arctangent of the dual number.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_59atan(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_6Dual_c_58atan, "\n        Returns the arctangent of the dual number.\n        ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_59atan = {"atan", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_59atan, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_58atan};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_59atan(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("atan (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("atan", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "atan", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_58atan(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_58atan(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("atan", 1);
+
+  /* "DualNum_c/Dual_c.pyx":537
+ *         Returns the arctangent of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("atan", Dual_c.atan, (self,))
+ *         return _box(dual_atan(as_dual(self)))
+ */
+  if (__pyx_v_9DualNum_c_6Dual_c__profiling) {
+
+    /* "DualNum_c/Dual_c.pyx":538
+ *         """
+ *         if _profiling:
+ *             return _profiled("atan", Dual_c.atan, (self,))             # <<<<<<<<<<<<<<
+ *         return _box(dual_atan(as_dual(self)))
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_atan); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 538, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 538, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF((PyObject *)__pyx_v_self);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 538, __pyx_L1_error);
+    __pyx_t_3 = __pyx_f_9DualNum_c_6Dual_c__profiled(__pyx_n_u_atan, __pyx_t_1, ((PyObject*)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 538, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "DualNum_c/Dual_c.pyx":537
+ *         Returns the arctangent of the dual number.
+ *         """
+ *         if _profiling:             # <<<<<<<<<<<<<<
+ *             return _profiled("atan", Dual_c.atan, (self,))
+ *         return _box(dual_atan(as_dual(self)))
+ */
+  }
+
+  /* "DualNum_c/Dual_c.pyx":539
+ *         if _profiling:
+ *             return _profiled("atan", Dual_c.atan, (self,))
+ *         return _box(dual_atan(as_dual(self)))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = ((PyObject *)__pyx_f_9DualNum_c_6Dual_c__box(__pyx_f_9DualNum_c_6Dual_c_dual_atan(__pyx_f_9DualNum_c_6Dual_c_as_dual(__pyx_v_self)))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":533
+ *         return _box(dual_acos(as_dual(self)))
+ * 
+ *     def atan(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arctangent of the dual number.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.atan", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":35
+ * 
+ * cdef class Dual_c:
+ *     cdef readonly double real             # <<<<<<<<<<<<<<
+ *     cdef readonly double dual
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_4real_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_4real_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4real___get__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4real___get__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 1);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->real); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.real.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pxd":36
+ * cdef class Dual_c:
+ *     cdef readonly double real
+ *     cdef readonly double dual             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_4dual_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_4dual_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4dual___get__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_4dual___get__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 1);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->dual); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 36, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.dual.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_61__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_61__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_61__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_61__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_60__reduce_cython__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_60__reduce_cython__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 1);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.dual, self.real)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->dual); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->real); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1)) __PYX_ERR(2, 5, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2)) __PYX_ERR(2, 5, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.dual, self.real)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.dual, self.real)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict)) __PYX_ERR(2, 8, __pyx_L1_error);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = False
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.dual, self.real)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = False             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, None), state
+ */
+  /*else*/ {
+    __pyx_v_use_setstate = 0;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, None), state
+ *     else:
+ */
+  if (__pyx_v_use_setstate) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = False
+ *     if use_setstate:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_Dual_c); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))))) __PYX_ERR(2, 13, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_int_142668208);
+    __Pyx_GIVEREF(__pyx_int_142668208);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_142668208)) __PYX_ERR(2, 13, __pyx_L1_error);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None)) __PYX_ERR(2, 13, __pyx_L1_error);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2)) __PYX_ERR(2, 13, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_3);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3)) __PYX_ERR(2, 13, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state)) __PYX_ERR(2, 13, __pyx_L1_error);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, None), state
+ *     else:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_Dual_c__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_Dual_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))))) __PYX_ERR(2, 15, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_int_142668208);
+    __Pyx_GIVEREF(__pyx_int_142668208);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_142668208)) __PYX_ERR(2, 15, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state)) __PYX_ERR(2, 15, __pyx_L1_error);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1)) __PYX_ERR(2, 15, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_3);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3)) __PYX_ERR(2, 15, __pyx_L1_error);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Dual_c__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_63__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_63__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_63__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_63__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_state,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_state)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(2, 16, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__setstate_cython__") < 0)) __PYX_ERR(2, 16, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(2, 16, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_6Dual_c_62__setstate_cython__(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_6Dual_c_62__setstate_cython__(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 1);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_Dual_c__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_v___pyx_state))) __PYX_ERR(2, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_9DualNum_c_6Dual_c___pyx_unpickle_Dual_c__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Dual_c__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.Dual_c.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "DualNum_c/Dual_c.pyx":543
+ * 
+ * 
+ * def compute_derivative(func, x, dual_class):             # <<<<<<<<<<<<<<
+ *     """
+ *     Computes the derivative of a function at a given point using dual numbers.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_3compute_derivative(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9DualNum_c_6Dual_c_2compute_derivative, "\n    Computes the derivative of a function at a given point using dual numbers.\n\n    Parameters\n    ----------\n    func : function\n        The function to compute the derivative of.\n\n    x : float\n        The point at which to compute the derivative.\n\n    dual_class : Dual or Dual_c\n        The class to use for dual numbers.\n\n    Returns\n    -------\n    float\n        The derivative of the function at the given point.\n\n    Examples\n    --------\n    >>> def f(x):\n    ...     return x ** 2\n    >>> compute_derivative(f, 2, Dual)\n    4.0\n    ");
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_3compute_derivative = {"compute_derivative", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_3compute_derivative, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_2compute_derivative};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_3compute_derivative(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_func = 0;
+  PyObject *__pyx_v_x = 0;
+  PyObject *__pyx_v_dual_class = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("compute_derivative (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_func,&__pyx_n_s_x,&__pyx_n_s_dual_class,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_func)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 543, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_x)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 543, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("compute_derivative", 1, 3, 3, 1); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_dual_class)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 543, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("compute_derivative", 1, 3, 3, 2); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "compute_derivative") < 0)) __PYX_ERR(0, 543, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+    }
+    __pyx_v_func = values[0];
+    __pyx_v_x = values[1];
+    __pyx_v_dual_class = values[2];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("compute_derivative", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 543, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("DualNum_c.Dual_c.compute_derivative", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_2compute_derivative(__pyx_self, __pyx_v_func, __pyx_v_x, __pyx_v_dual_class);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_2compute_derivative(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_func, PyObject *__pyx_v_x, PyObject *__pyx_v_dual_class) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("compute_derivative", 1);
+
+  /* "DualNum_c/Dual_c.pyx":570
+ *     4.0
+ *     """
+ *     return func(dual_class(x, 1)).dual             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_dual_class);
+  __pyx_t_3 = __pyx_v_dual_class; __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_v_x, __pyx_int_1};
+    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 2+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 570, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __Pyx_INCREF(__pyx_v_func);
+  __pyx_t_3 = __pyx_v_func; __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_2};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 570, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_dual); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 570, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "DualNum_c/Dual_c.pyx":543
+ * 
+ * 
+ * def compute_derivative(func, x, dual_class):             # <<<<<<<<<<<<<<
+ *     """
+ *     Computes the derivative of a function at a given point using dual numbers.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.compute_derivative", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_Dual_c(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_5__pyx_unpickle_Dual_c(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_9DualNum_c_6Dual_c_5__pyx_unpickle_Dual_c = {"__pyx_unpickle_Dual_c", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_5__pyx_unpickle_Dual_c, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9DualNum_c_6Dual_c_5__pyx_unpickle_Dual_c(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Dual_c (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_type)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(2, 1, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_checksum)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(2, 1, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Dual_c", 1, 3, 3, 1); __PYX_ERR(2, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_state)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(2, 1, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Dual_c", 1, 3, 3, 2); __PYX_ERR(2, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__pyx_unpickle_Dual_c") < 0)) __PYX_ERR(2, 1, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(2, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Dual_c", 1, 3, 3, __pyx_nargs); __PYX_ERR(2, 1, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("DualNum_c.Dual_c.__pyx_unpickle_Dual_c", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9DualNum_c_6Dual_c_4__pyx_unpickle_Dual_c(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9DualNum_c_6Dual_c_4__pyx_unpickle_Dual_c(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Dual_c", 1);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x880f1b0, 0x473daf7, 0xac9cb7c):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__6, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x880f1b0, 0x473daf7, 0xac9cb7c):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum
+ *     __pyx_result = Dual_c.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    if (__Pyx_PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError)) __PYX_ERR(2, 5, __pyx_L1_error);
+    __pyx_t_3 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x880f1b0, 0x473daf7, 0xac9cb7c):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum             # <<<<<<<<<<<<<<
+ *     __pyx_result = Dual_c.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_3 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_v___pyx_PickleError, __pyx_t_1, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(2, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x880f1b0, 0x473daf7, 0xac9cb7c):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum
+ *     __pyx_result = Dual_c.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Dual_c__set_state(<Dual_c> __pyx_result, __pyx_state)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c), __pyx_n_s_new); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v___pyx_type};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_v___pyx_result = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum
+ *     __pyx_result = Dual_c.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_Dual_c__set_state(<Dual_c> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_2 = (__pyx_v___pyx_state != Py_None);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = Dual_c.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Dual_c__set_state(<Dual_c> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Dual_c__set_state(Dual_c __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_v___pyx_state))) __PYX_ERR(2, 9, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_9DualNum_c_6Dual_c___pyx_unpickle_Dual_c__set_state(((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum
+ *     __pyx_result = Dual_c.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_Dual_c__set_state(<Dual_c> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Dual_c__set_state(<Dual_c> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_Dual_c__set_state(Dual_c __pyx_result, tuple __pyx_state):
+ *     __pyx_result.dual = __pyx_state[0]; __pyx_result.real = __pyx_state[1]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Dual_c(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.__pyx_unpickle_Dual_c", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_Dual_c__set_state(<Dual_c> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Dual_c__set_state(Dual_c __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.dual = __pyx_state[0]; __pyx_result.real = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_9DualNum_c_6Dual_c___pyx_unpickle_Dual_c__set_state(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  unsigned int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Dual_c__set_state", 1);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Dual_c__set_state(Dual_c __pyx_result, tuple __pyx_state):
+ *     __pyx_result.dual = __pyx_state[0]; __pyx_result.real = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(2, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 0)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->dual = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(2, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 1)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->real = __pyx_t_1;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_Dual_c__set_state(Dual_c __pyx_result, tuple __pyx_state):
+ *     __pyx_result.dual = __pyx_state[0]; __pyx_result.real = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(2, 13, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(2, 13, __pyx_L1_error)
+  __pyx_t_4 = (__pyx_t_3 > 2);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 13, __pyx_L1_error)
+  __pyx_t_2 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.dual = __pyx_state[0]; __pyx_result.real = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_update); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(2, 14, __pyx_L1_error)
+    }
+    __pyx_t_6 = NULL;
+    __pyx_t_8 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+        __pyx_t_8 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_6, PyTuple_GET_ITEM(__pyx_v___pyx_state, 2)};
+      __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 14, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_Dual_c__set_state(Dual_c __pyx_result, tuple __pyx_state):
+ *     __pyx_result.dual = __pyx_state[0]; __pyx_result.real = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_Dual_c__set_state(<Dual_c> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Dual_c__set_state(Dual_c __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.dual = __pyx_state[0]; __pyx_result.real = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("DualNum_c.Dual_c.__pyx_unpickle_Dual_c__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+#if CYTHON_USE_FREELISTS
+static struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *__pyx_freelist_9DualNum_c_6Dual_c_Dual_c[64];
+static int __pyx_freecount_9DualNum_c_6Dual_c_Dual_c = 0;
+#endif
+
+static PyObject *__pyx_tp_new_9DualNum_c_6Dual_c_Dual_c(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  #if CYTHON_USE_FREELISTS
+  if (likely((int)(__pyx_freecount_9DualNum_c_6Dual_c_Dual_c > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c)) & (int)(!__Pyx_PyType_HasFeature(t, (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE))))) {
+    o = (PyObject*)__pyx_freelist_9DualNum_c_6Dual_c_Dual_c[--__pyx_freecount_9DualNum_c_6Dual_c_Dual_c];
+    memset(o, 0, sizeof(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c));
+    (void) PyObject_INIT(o, t);
+  } else
+  #endif
+  {
+    if (likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
+      o = (*t->tp_alloc)(t, 0);
+    } else {
+      o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+    }
+    if (unlikely(!o)) return 0;
+  }
+  #endif
+  return o;
+}
+
+static void __pyx_tp_dealloc_9DualNum_c_6Dual_c_Dual_c(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_9DualNum_c_6Dual_c_Dual_c) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  #if CYTHON_USE_FREELISTS
+  if (((int)(__pyx_freecount_9DualNum_c_6Dual_c_Dual_c < 64) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c)) & (int)(!__Pyx_PyType_HasFeature(Py_TYPE(o), (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE))))) {
+    __pyx_freelist_9DualNum_c_6Dual_c_Dual_c[__pyx_freecount_9DualNum_c_6Dual_c_Dual_c++] = ((struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *)o);
+  } else
+  #endif
+  {
+    #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+    (*Py_TYPE(o)->tp_free)(o);
+    #else
+    {
+      freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+      if (tp_free) tp_free(o);
+    }
+    #endif
+  }
+}
+
+static PyObject *__pyx_tp_richcompare_9DualNum_c_6Dual_c_Dual_c(PyObject *o1, PyObject *o2, int op) {
+  switch (op) {
+    case Py_EQ: {
+      return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_23__eq__(o1, o2);
+    }
+    case Py_NE: {
+      return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_25__ne__(o1, o2);
+    }
+    default: {
+      return __Pyx_NewRef(Py_NotImplemented);
+    }
+  }
+}
+
+static CYTHON_INLINE PyObject *__pyx_nb_add_9DualNum_c_6Dual_c_Dual_c_maybe_call_slot(PyTypeObject* type, PyObject *left, PyObject *right ) {
+    binaryfunc slot;
+#if CYTHON_USE_TYPE_SLOTS || PY_MAJOR_VERSION < 3 || CYTHON_COMPILING_IN_PYPY
+    slot = type->tp_as_number ? type->tp_as_number->nb_add : NULL;
+#else
+    slot = (binaryfunc) PyType_GetSlot(type, Py_nb_add);
+#endif
+    return slot ? slot(left, right ) : __Pyx_NewRef(Py_NotImplemented);
+}
+static PyObject *__pyx_nb_add_9DualNum_c_6Dual_c_Dual_c(PyObject *left, PyObject *right ) {
+    int maybe_self_is_left, maybe_self_is_right = 0;
+    maybe_self_is_left = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(left)->tp_as_number && Py_TYPE(left)->tp_as_number->nb_add == &__pyx_nb_add_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || __Pyx_TypeCheck(left, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_left) {
+        PyObject *res;
+        res = __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_3__add__(left, right);
+        if (res != Py_NotImplemented) return res;
+        Py_DECREF(res);
+    }
+    maybe_self_is_right = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(right)->tp_as_number && Py_TYPE(right)->tp_as_number->nb_add == &__pyx_nb_add_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || PyType_IsSubtype(Py_TYPE(right), __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_right) {
+        return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_5__radd__(right, left);
+    }
+    return __Pyx_NewRef(Py_NotImplemented);
+}
+
+
+
+static CYTHON_INLINE PyObject *__pyx_nb_subtract_9DualNum_c_6Dual_c_Dual_c_maybe_call_slot(PyTypeObject* type, PyObject *left, PyObject *right ) {
+    binaryfunc slot;
+#if CYTHON_USE_TYPE_SLOTS || PY_MAJOR_VERSION < 3 || CYTHON_COMPILING_IN_PYPY
+    slot = type->tp_as_number ? type->tp_as_number->nb_subtract : NULL;
+#else
+    slot = (binaryfunc) PyType_GetSlot(type, Py_nb_subtract);
+#endif
+    return slot ? slot(left, right ) : __Pyx_NewRef(Py_NotImplemented);
+}
+static PyObject *__pyx_nb_subtract_9DualNum_c_6Dual_c_Dual_c(PyObject *left, PyObject *right ) {
+    int maybe_self_is_left, maybe_self_is_right = 0;
+    maybe_self_is_left = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(left)->tp_as_number && Py_TYPE(left)->tp_as_number->nb_subtract == &__pyx_nb_subtract_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || __Pyx_TypeCheck(left, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_left) {
+        PyObject *res;
+        res = __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_7__sub__(left, right);
+        if (res != Py_NotImplemented) return res;
+        Py_DECREF(res);
+    }
+    maybe_self_is_right = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(right)->tp_as_number && Py_TYPE(right)->tp_as_number->nb_subtract == &__pyx_nb_subtract_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || PyType_IsSubtype(Py_TYPE(right), __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_right) {
+        return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_9__rsub__(right, left);
+    }
+    return __Pyx_NewRef(Py_NotImplemented);
+}
+
+
+
+static CYTHON_INLINE PyObject *__pyx_nb_multiply_9DualNum_c_6Dual_c_Dual_c_maybe_call_slot(PyTypeObject* type, PyObject *left, PyObject *right ) {
+    binaryfunc slot;
+#if CYTHON_USE_TYPE_SLOTS || PY_MAJOR_VERSION < 3 || CYTHON_COMPILING_IN_PYPY
+    slot = type->tp_as_number ? type->tp_as_number->nb_multiply : NULL;
+#else
+    slot = (binaryfunc) PyType_GetSlot(type, Py_nb_multiply);
+#endif
+    return slot ? slot(left, right ) : __Pyx_NewRef(Py_NotImplemented);
+}
+static PyObject *__pyx_nb_multiply_9DualNum_c_6Dual_c_Dual_c(PyObject *left, PyObject *right ) {
+    int maybe_self_is_left, maybe_self_is_right = 0;
+    maybe_self_is_left = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(left)->tp_as_number && Py_TYPE(left)->tp_as_number->nb_multiply == &__pyx_nb_multiply_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || __Pyx_TypeCheck(left, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_left) {
+        PyObject *res;
+        res = __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_11__mul__(left, right);
+        if (res != Py_NotImplemented) return res;
+        Py_DECREF(res);
+    }
+    maybe_self_is_right = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(right)->tp_as_number && Py_TYPE(right)->tp_as_number->nb_multiply == &__pyx_nb_multiply_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || PyType_IsSubtype(Py_TYPE(right), __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_right) {
+        return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_13__rmul__(right, left);
+    }
+    return __Pyx_NewRef(Py_NotImplemented);
+}
+
+
+
+static CYTHON_INLINE PyObject *__pyx_nb_power_9DualNum_c_6Dual_c_Dual_c_maybe_call_slot(PyTypeObject* type, PyObject *left, PyObject *right , PyObject* extra_arg) {
+    ternaryfunc slot;
+#if CYTHON_USE_TYPE_SLOTS || PY_MAJOR_VERSION < 3 || CYTHON_COMPILING_IN_PYPY
+    slot = type->tp_as_number ? type->tp_as_number->nb_power : NULL;
+#else
+    slot = (ternaryfunc) PyType_GetSlot(type, Py_nb_power);
+#endif
+    return slot ? slot(left, right , extra_arg) : __Pyx_NewRef(Py_NotImplemented);
+}
+static PyObject *__pyx_nb_power_9DualNum_c_6Dual_c_Dual_c(PyObject *left, PyObject *right , PyObject* extra_arg) {
+    int maybe_self_is_left, maybe_self_is_right = 0;
+    maybe_self_is_left = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(left)->tp_as_number && Py_TYPE(left)->tp_as_number->nb_power == &__pyx_nb_power_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || __Pyx_TypeCheck(left, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_left) {
+        PyObject *res;
+        res = __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_19__pow__(left, right, extra_arg);
+        if (res != Py_NotImplemented) return res;
+        Py_DECREF(res);
+    }
+    maybe_self_is_right = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(right)->tp_as_number && Py_TYPE(right)->tp_as_number->nb_power == &__pyx_nb_power_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || PyType_IsSubtype(Py_TYPE(right), __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_right) {
+        return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_21__rpow__(right, left, extra_arg);
+    }
+    return __Pyx_NewRef(Py_NotImplemented);
+}
+
+
+
+static CYTHON_INLINE PyObject *__pyx_nb_true_divide_9DualNum_c_6Dual_c_Dual_c_maybe_call_slot(PyTypeObject* type, PyObject *left, PyObject *right ) {
+    binaryfunc slot;
+#if CYTHON_USE_TYPE_SLOTS || PY_MAJOR_VERSION < 3 || CYTHON_COMPILING_IN_PYPY
+    slot = type->tp_as_number ? type->tp_as_number->nb_true_divide : NULL;
+#else
+    slot = (binaryfunc) PyType_GetSlot(type, Py_nb_true_divide);
+#endif
+    return slot ? slot(left, right ) : __Pyx_NewRef(Py_NotImplemented);
+}
+static PyObject *__pyx_nb_true_divide_9DualNum_c_6Dual_c_Dual_c(PyObject *left, PyObject *right ) {
+    int maybe_self_is_left, maybe_self_is_right = 0;
+    maybe_self_is_left = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(left)->tp_as_number && Py_TYPE(left)->tp_as_number->nb_true_divide == &__pyx_nb_true_divide_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || __Pyx_TypeCheck(left, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_left) {
+        PyObject *res;
+        res = __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_15__truediv__(left, right);
+        if (res != Py_NotImplemented) return res;
+        Py_DECREF(res);
+    }
+    maybe_self_is_right = Py_TYPE(left) == Py_TYPE(right)
+#if CYTHON_USE_TYPE_SLOTS
+            || (Py_TYPE(right)->tp_as_number && Py_TYPE(right)->tp_as_number->nb_true_divide == &__pyx_nb_true_divide_9DualNum_c_6Dual_c_Dual_c)
+#endif
+            || PyType_IsSubtype(Py_TYPE(right), __pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+    if (maybe_self_is_right) {
+        return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__(right, left);
+    }
+    return __Pyx_NewRef(Py_NotImplemented);
+}
+
+
+
+static PyObject *__pyx_getprop_9DualNum_c_6Dual_c_6Dual_c_real(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_4real_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_9DualNum_c_6Dual_c_6Dual_c_dual(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_4dual_1__get__(o);
+}
+
+static PyObject *__pyx_specialmethod___pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27__repr__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
+  return __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27__repr__(self);
+}
+
+static PyMethodDef __pyx_methods_9DualNum_c_6Dual_c_Dual_c[] = {
+  {"__radd__", (PyCFunction)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_5__radd__, METH_O|METH_COEXIST, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_4__radd__},
+  {"__rsub__", (PyCFunction)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_9__rsub__, METH_O|METH_COEXIST, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_8__rsub__},
+  {"__rmul__", (PyCFunction)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_13__rmul__, METH_O|METH_COEXIST, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_12__rmul__},
+  {"__rtruediv__", (PyCFunction)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__, METH_O|METH_COEXIST, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__},
+  {"__repr__", (PyCFunction)__pyx_specialmethod___pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27__repr__, METH_NOARGS|METH_COEXIST, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_26__repr__},
+  {"__array_ufunc__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_29__array_ufunc__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_28__array_ufunc__},
+  {"__array_function__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_31__array_function__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_30__array_function__},
+  {"get_real", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_33get_real, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_32get_real},
+  {"get_dual", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_35get_dual, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_34get_dual},
+  {"sin", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_37sin, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_36sin},
+  {"cos", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_39cos, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_38cos},
+  {"tan", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_41tan, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_40tan},
+  {"exp", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_43exp, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_42exp},
+  {"log", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_45log, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_44log},
+  {"sqrt", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_47sqrt, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_46sqrt},
+  {"sinh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_49sinh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_48sinh},
+  {"cosh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_51cosh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_50cosh},
+  {"tanh", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_53tanh, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_52tanh},
+  {"asin", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_55asin, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_54asin},
+  {"acos", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_57acos, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_56acos},
+  {"atan", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_59atan, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_58atan},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_61__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_63__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_9DualNum_c_6Dual_c_Dual_c[] = {
+  {(char *)"real", __pyx_getprop_9DualNum_c_6Dual_c_6Dual_c_real, 0, (char *)0, 0},
+  {(char *)"dual", __pyx_getprop_9DualNum_c_6Dual_c_6Dual_c_dual, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_9DualNum_c_6Dual_c_Dual_c_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_9DualNum_c_6Dual_c_Dual_c},
+  {Py_tp_repr, (void *)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27__repr__},
+  {Py_nb_add, (void *)__pyx_nb_add_9DualNum_c_6Dual_c_Dual_c},
+  {Py_nb_subtract, (void *)__pyx_nb_subtract_9DualNum_c_6Dual_c_Dual_c},
+  {Py_nb_multiply, (void *)__pyx_nb_multiply_9DualNum_c_6Dual_c_Dual_c},
+  {Py_nb_power, (void *)__pyx_nb_power_9DualNum_c_6Dual_c_Dual_c},
+  {Py_nb_true_divide, (void *)__pyx_nb_true_divide_9DualNum_c_6Dual_c_Dual_c},
+  {Py_tp_doc, (void *)PyDoc_STR("\n    A class to represent a dual number for use in automatic differentiation.\n\n    The real and dual parts are stored as C doubles and every operation is\n    evaluated with ``libc.math``, so no Python-level arithmetic is involved\n    once the operands have been unboxed.\n\n    Attributes\n    ----------\n    real : float\n        The real part of the dual number.\n\n    dual : float\n        The dual part of the dual number.\n\n    Examples\n    --------\n    >>> x = Dual_c(2, 1)\n    >>> y = Dual_c(3, 0)\n    >>> z = x.sin() + y.log()\n    >>> z\n    Dual(real=2.0079097154937915, dual=-0.4161468365471424)\n\n    The struct, attributes and inline functions behind these methods are\n    declared in ``Dual_c.pxd`` for other Cython extensions to cimport.\n    ")},
+  {Py_tp_richcompare, (void *)__pyx_tp_richcompare_9DualNum_c_6Dual_c_Dual_c},
+  {Py_tp_methods, (void *)__pyx_methods_9DualNum_c_6Dual_c_Dual_c},
+  {Py_tp_getset, (void *)__pyx_getsets_9DualNum_c_6Dual_c_Dual_c},
+  {Py_tp_init, (void *)__pyx_pw_9DualNum_c_6Dual_c_6Dual_c_1__init__},
+  {Py_tp_new, (void *)__pyx_tp_new_9DualNum_c_6Dual_c_Dual_c},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_9DualNum_c_6Dual_c_Dual_c_spec = {
+  "DualNum_c.Dual_c.Dual_c",
+  sizeof(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE,
+  __pyx_type_9DualNum_c_6Dual_c_Dual_c_slots,
+};
+#else
+
+static PyNumberMethods __pyx_tp_as_number_Dual_c = {
+  __pyx_nb_add_9DualNum_c_6Dual_c_Dual_c, /*nb_add*/
+  __pyx_nb_subtract_9DualNum_c_6Dual_c_Dual_c, /*nb_subtract*/
+  __pyx_nb_multiply_9DualNum_c_6Dual_c_Dual_c, /*nb_multiply*/
+  #if PY_MAJOR_VERSION < 3 || (CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x03050000)
+  0, /*nb_divide*/
+  #endif
+  0, /*nb_remainder*/
+  0, /*nb_divmod*/
+  __pyx_nb_power_9DualNum_c_6Dual_c_Dual_c, /*nb_power*/
+  0, /*nb_negative*/
+  0, /*nb_positive*/
+  0, /*nb_absolute*/
+  0, /*nb_bool*/
+  0, /*nb_invert*/
+  0, /*nb_lshift*/
+  0, /*nb_rshift*/
+  0, /*nb_and*/
+  0, /*nb_xor*/
+  0, /*nb_or*/
+  #if PY_MAJOR_VERSION < 3 || (CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x03050000)
+  0, /*nb_coerce*/
+  #endif
+  0, /*nb_int*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_long*/
+  #else
+  0, /*reserved*/
+  #endif
+  0, /*nb_float*/
+  #if PY_MAJOR_VERSION < 3 || (CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x03050000)
+  0, /*nb_oct*/
+  #endif
+  #if PY_MAJOR_VERSION < 3 || (CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x03050000)
+  0, /*nb_hex*/
+  #endif
+  0, /*nb_inplace_add*/
+  0, /*nb_inplace_subtract*/
+  0, /*nb_inplace_multiply*/
+  #if PY_MAJOR_VERSION < 3 || (CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x03050000)
+  0, /*nb_inplace_divide*/
+  #endif
+  0, /*nb_inplace_remainder*/
+  0, /*nb_inplace_power*/
+  0, /*nb_inplace_lshift*/
+  0, /*nb_inplace_rshift*/
+  0, /*nb_inplace_and*/
+  0, /*nb_inplace_xor*/
+  0, /*nb_inplace_or*/
+  0, /*nb_floor_divide*/
+  __pyx_nb_true_divide_9DualNum_c_6Dual_c_Dual_c, /*nb_true_divide*/
+  0, /*nb_inplace_floor_divide*/
+  0, /*nb_inplace_true_divide*/
+  0, /*nb_index*/
+  #if PY_VERSION_HEX >= 0x03050000
+  0, /*nb_matrix_multiply*/
+  #endif
+  #if PY_VERSION_HEX >= 0x03050000
+  0, /*nb_inplace_matrix_multiply*/
+  #endif
+};
+
+static PyTypeObject __pyx_type_9DualNum_c_6Dual_c_Dual_c = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "DualNum_c.Dual_c.""Dual_c", /*tp_name*/
+  sizeof(struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_9DualNum_c_6Dual_c_Dual_c, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_27__repr__, /*tp_repr*/
+  &__pyx_tp_as_number_Dual_c, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  PyDoc_STR("\n    A class to represent a dual number for use in automatic differentiation.\n\n    The real and dual parts are stored as C doubles and every operation is\n    evaluated with ``libc.math``, so no Python-level arithmetic is involved\n    once the operands have been unboxed.\n\n    Attributes\n    ----------\n    real : float\n        The real part of the dual number.\n\n    dual : float\n        The dual part of the dual number.\n\n    Examples\n    --------\n    >>> x = Dual_c(2, 1)\n    >>> y = Dual_c(3, 0)\n    >>> z = x.sin() + y.log()\n    >>> z\n    Dual(real=2.0079097154937915, dual=-0.4161468365471424)\n\n    The struct, attributes and inline functions behind these methods are\n    declared in ``Dual_c.pxd`` for other Cython extensions to cimport.\n    "), /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  __pyx_tp_richcompare_9DualNum_c_6Dual_c_Dual_c, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_9DualNum_c_6Dual_c_Dual_c, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_9DualNum_c_6Dual_c_Dual_c, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  __pyx_pw_9DualNum_c_6Dual_c_6Dual_c_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_9DualNum_c_6Dual_c_Dual_c, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+/* #### Code section: pystring_table ### */
+
+static int __Pyx_CreateStringTabAndInitStrings(void) {
+  __Pyx_StringTabEntry __pyx_string_tab[] = {
+    {&__pyx_kp_u_Computes_the_derivative_of_a_fu, __pyx_k_Computes_the_derivative_of_a_fu, sizeof(__pyx_k_Computes_the_derivative_of_a_fu), 0, 1, 0, 0},
+    {&__pyx_n_s_DualNum_Dual, __pyx_k_DualNum_Dual, sizeof(__pyx_k_DualNum_Dual), 0, 0, 1, 1},
+    {&__pyx_n_s_DualNum_c_Dual_c, __pyx_k_DualNum_c_Dual_c, sizeof(__pyx_k_DualNum_c_Dual_c), 0, 0, 1, 1},
+    {&__pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_k_DualNum_c_Dual_c_pyx, sizeof(__pyx_k_DualNum_c_Dual_c_pyx), 0, 0, 1, 0},
+    {&__pyx_n_s_Dual_c, __pyx_k_Dual_c, sizeof(__pyx_k_Dual_c), 0, 0, 1, 1},
+    {&__pyx_n_u_Dual_c, __pyx_k_Dual_c, sizeof(__pyx_k_Dual_c), 0, 1, 0, 1},
+    {&__pyx_n_s_Dual_c___array_function, __pyx_k_Dual_c___array_function, sizeof(__pyx_k_Dual_c___array_function), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c___array_ufunc, __pyx_k_Dual_c___array_ufunc, sizeof(__pyx_k_Dual_c___array_ufunc), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c___reduce_cython, __pyx_k_Dual_c___reduce_cython, sizeof(__pyx_k_Dual_c___reduce_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c___setstate_cython, __pyx_k_Dual_c___setstate_cython, sizeof(__pyx_k_Dual_c___setstate_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_acos, __pyx_k_Dual_c_acos, sizeof(__pyx_k_Dual_c_acos), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_asin, __pyx_k_Dual_c_asin, sizeof(__pyx_k_Dual_c_asin), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_atan, __pyx_k_Dual_c_atan, sizeof(__pyx_k_Dual_c_atan), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_cos, __pyx_k_Dual_c_cos, sizeof(__pyx_k_Dual_c_cos), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_cosh, __pyx_k_Dual_c_cosh, sizeof(__pyx_k_Dual_c_cosh), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_exp, __pyx_k_Dual_c_exp, sizeof(__pyx_k_Dual_c_exp), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_get_dual, __pyx_k_Dual_c_get_dual, sizeof(__pyx_k_Dual_c_get_dual), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_get_real, __pyx_k_Dual_c_get_real, sizeof(__pyx_k_Dual_c_get_real), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_log, __pyx_k_Dual_c_log, sizeof(__pyx_k_Dual_c_log), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_sin, __pyx_k_Dual_c_sin, sizeof(__pyx_k_Dual_c_sin), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_sinh, __pyx_k_Dual_c_sinh, sizeof(__pyx_k_Dual_c_sinh), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_sqrt, __pyx_k_Dual_c_sqrt, sizeof(__pyx_k_Dual_c_sqrt), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_tan, __pyx_k_Dual_c_tan, sizeof(__pyx_k_Dual_c_tan), 0, 0, 1, 1},
+    {&__pyx_n_s_Dual_c_tanh, __pyx_k_Dual_c_tanh, sizeof(__pyx_k_Dual_c_tanh), 0, 0, 1, 1},
+    {&__pyx_kp_u_Dual_real, __pyx_k_Dual_real, sizeof(__pyx_k_Dual_real), 0, 1, 0, 0},
+    {&__pyx_kp_u_Expected_dual_to_be_of_type_floa, __pyx_k_Expected_dual_to_be_of_type_floa, sizeof(__pyx_k_Expected_dual_to_be_of_type_floa), 0, 1, 0, 0},
+    {&__pyx_kp_u_Expected_real_to_be_of_type_floa, __pyx_k_Expected_real_to_be_of_type_floa, sizeof(__pyx_k_Expected_real_to_be_of_type_floa), 0, 1, 0, 0},
+    {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+    {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+    {&__pyx_kp_u_Logarithm_of_a_non_positive_numb, __pyx_k_Logarithm_of_a_non_positive_numb, sizeof(__pyx_k_Logarithm_of_a_non_positive_numb), 0, 1, 0, 0},
+    {&__pyx_n_s_NotImplemented, __pyx_k_NotImplemented, sizeof(__pyx_k_NotImplemented), 0, 0, 1, 1},
+    {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+    {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+    {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+    {&__pyx_n_s_ZeroDivisionError, __pyx_k_ZeroDivisionError, sizeof(__pyx_k_ZeroDivisionError), 0, 0, 1, 1},
+    {&__pyx_kp_u__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0, 0},
+    {&__pyx_n_s__36, __pyx_k__36, sizeof(__pyx_k__36), 0, 0, 1, 1},
+    {&__pyx_kp_u__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0, 0},
+    {&__pyx_n_s_acos, __pyx_k_acos, sizeof(__pyx_k_acos), 0, 0, 1, 1},
+    {&__pyx_n_u_acos, __pyx_k_acos, sizeof(__pyx_k_acos), 0, 1, 0, 1},
+    {&__pyx_n_s_add, __pyx_k_add, sizeof(__pyx_k_add), 0, 0, 1, 1},
+    {&__pyx_n_u_add, __pyx_k_add, sizeof(__pyx_k_add), 0, 1, 0, 1},
+    {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
+    {&__pyx_n_s_array_function, __pyx_k_array_function, sizeof(__pyx_k_array_function), 0, 0, 1, 1},
+    {&__pyx_n_s_array_ufunc, __pyx_k_array_ufunc, sizeof(__pyx_k_array_ufunc), 0, 0, 1, 1},
+    {&__pyx_n_s_asin, __pyx_k_asin, sizeof(__pyx_k_asin), 0, 0, 1, 1},
+    {&__pyx_n_u_asin, __pyx_k_asin, sizeof(__pyx_k_asin), 0, 1, 0, 1},
+    {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
+    {&__pyx_n_s_atan, __pyx_k_atan, sizeof(__pyx_k_atan), 0, 0, 1, 1},
+    {&__pyx_n_u_atan, __pyx_k_atan, sizeof(__pyx_k_atan), 0, 1, 0, 1},
+    {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+    {&__pyx_n_s_compute_derivative, __pyx_k_compute_derivative, sizeof(__pyx_k_compute_derivative), 0, 0, 1, 1},
+    {&__pyx_kp_u_compute_derivative_line_543, __pyx_k_compute_derivative_line_543, sizeof(__pyx_k_compute_derivative_line_543), 0, 1, 0, 0},
+    {&__pyx_n_s_cos, __pyx_k_cos, sizeof(__pyx_k_cos), 0, 0, 1, 1},
+    {&__pyx_n_u_cos, __pyx_k_cos, sizeof(__pyx_k_cos), 0, 1, 0, 1},
+    {&__pyx_n_s_cosh, __pyx_k_cosh, sizeof(__pyx_k_cosh), 0, 0, 1, 1},
+    {&__pyx_n_u_cosh, __pyx_k_cosh, sizeof(__pyx_k_cosh), 0, 1, 0, 1},
+    {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+    {&__pyx_n_s_dict_2, __pyx_k_dict_2, sizeof(__pyx_k_dict_2), 0, 0, 1, 1},
+    {&__pyx_kp_u_disable, __pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0, 0},
+    {&__pyx_kp_u_division_by_zero_is_undefined, __pyx_k_division_by_zero_is_undefined, sizeof(__pyx_k_division_by_zero_is_undefined), 0, 1, 0, 0},
+    {&__pyx_n_s_dual, __pyx_k_dual, sizeof(__pyx_k_dual), 0, 0, 1, 1},
+    {&__pyx_kp_u_dual_2, __pyx_k_dual_2, sizeof(__pyx_k_dual_2), 0, 1, 0, 0},
+    {&__pyx_n_s_dual_class, __pyx_k_dual_class, sizeof(__pyx_k_dual_class), 0, 0, 1, 1},
+    {&__pyx_kp_u_enable, __pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0, 0},
+    {&__pyx_n_s_eq, __pyx_k_eq, sizeof(__pyx_k_eq), 0, 0, 1, 1},
+    {&__pyx_n_s_exp, __pyx_k_exp, sizeof(__pyx_k_exp), 0, 0, 1, 1},
+    {&__pyx_n_u_exp, __pyx_k_exp, sizeof(__pyx_k_exp), 0, 1, 0, 1},
+    {&__pyx_n_s_func, __pyx_k_func, sizeof(__pyx_k_func), 0, 0, 1, 1},
+    {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
+    {&__pyx_n_s_get_dual, __pyx_k_get_dual, sizeof(__pyx_k_get_dual), 0, 0, 1, 1},
+    {&__pyx_n_s_get_real, __pyx_k_get_real, sizeof(__pyx_k_get_real), 0, 0, 1, 1},
+    {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+    {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+    {&__pyx_n_s_inputs, __pyx_k_inputs, sizeof(__pyx_k_inputs), 0, 0, 1, 1},
+    {&__pyx_kp_u_instead, __pyx_k_instead, sizeof(__pyx_k_instead), 0, 1, 0, 0},
+    {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
+    {&__pyx_kp_u_isenabled, __pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0, 0},
+    {&__pyx_n_s_kwargs, __pyx_k_kwargs, sizeof(__pyx_k_kwargs), 0, 0, 1, 1},
+    {&__pyx_n_s_log, __pyx_k_log, sizeof(__pyx_k_log), 0, 0, 1, 1},
+    {&__pyx_n_u_log, __pyx_k_log, sizeof(__pyx_k_log), 0, 1, 0, 1},
+    {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+    {&__pyx_kp_u_math_domain_error, __pyx_k_math_domain_error, sizeof(__pyx_k_math_domain_error), 0, 1, 0, 0},
+    {&__pyx_n_s_method, __pyx_k_method, sizeof(__pyx_k_method), 0, 0, 1, 1},
+    {&__pyx_n_s_mul, __pyx_k_mul, sizeof(__pyx_k_mul), 0, 0, 1, 1},
+    {&__pyx_n_u_mul, __pyx_k_mul, sizeof(__pyx_k_mul), 0, 1, 0, 1},
+    {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+    {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+    {&__pyx_n_s_perf_counter_ns, __pyx_k_perf_counter_ns, sizeof(__pyx_k_perf_counter_ns), 0, 0, 1, 1},
+    {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+    {&__pyx_n_s_pow, __pyx_k_pow, sizeof(__pyx_k_pow), 0, 0, 1, 1},
+    {&__pyx_n_u_pow, __pyx_k_pow, sizeof(__pyx_k_pow), 0, 1, 0, 1},
+    {&__pyx_n_s_profiler, __pyx_k_profiler, sizeof(__pyx_k_profiler), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_unpickle_Dual_c, __pyx_k_pyx_unpickle_Dual_c, sizeof(__pyx_k_pyx_unpickle_Dual_c), 0, 0, 1, 1},
+    {&__pyx_n_s_radd, __pyx_k_radd, sizeof(__pyx_k_radd), 0, 0, 1, 1},
+    {&__pyx_n_u_radd, __pyx_k_radd, sizeof(__pyx_k_radd), 0, 1, 0, 1},
+    {&__pyx_n_s_real, __pyx_k_real, sizeof(__pyx_k_real), 0, 0, 1, 1},
+    {&__pyx_n_s_record, __pyx_k_record, sizeof(__pyx_k_record), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+    {&__pyx_n_s_rmul, __pyx_k_rmul, sizeof(__pyx_k_rmul), 0, 0, 1, 1},
+    {&__pyx_n_u_rmul, __pyx_k_rmul, sizeof(__pyx_k_rmul), 0, 1, 0, 1},
+    {&__pyx_n_s_rpow, __pyx_k_rpow, sizeof(__pyx_k_rpow), 0, 0, 1, 1},
+    {&__pyx_n_u_rpow, __pyx_k_rpow, sizeof(__pyx_k_rpow), 0, 1, 0, 1},
+    {&__pyx_n_s_rsub, __pyx_k_rsub, sizeof(__pyx_k_rsub), 0, 0, 1, 1},
+    {&__pyx_n_u_rsub, __pyx_k_rsub, sizeof(__pyx_k_rsub), 0, 1, 0, 1},
+    {&__pyx_n_s_rtruediv, __pyx_k_rtruediv, sizeof(__pyx_k_rtruediv), 0, 0, 1, 1},
+    {&__pyx_n_u_rtruediv, __pyx_k_rtruediv, sizeof(__pyx_k_rtruediv), 0, 1, 0, 1},
+    {&__pyx_n_s_scalar_array_function, __pyx_k_scalar_array_function, sizeof(__pyx_k_scalar_array_function), 0, 0, 1, 1},
+    {&__pyx_n_s_scalar_array_ufunc, __pyx_k_scalar_array_ufunc, sizeof(__pyx_k_scalar_array_ufunc), 0, 0, 1, 1},
+    {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+    {&__pyx_n_s_set_profiler, __pyx_k_set_profiler, sizeof(__pyx_k_set_profiler), 0, 0, 1, 1},
+    {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+    {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_sin, __pyx_k_sin, sizeof(__pyx_k_sin), 0, 0, 1, 1},
+    {&__pyx_n_u_sin, __pyx_k_sin, sizeof(__pyx_k_sin), 0, 1, 0, 1},
+    {&__pyx_n_s_sinh, __pyx_k_sinh, sizeof(__pyx_k_sinh), 0, 0, 1, 1},
+    {&__pyx_n_u_sinh, __pyx_k_sinh, sizeof(__pyx_k_sinh), 0, 1, 0, 1},
+    {&__pyx_n_s_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 0, 1, 1},
+    {&__pyx_n_u_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 1, 0, 1},
+    {&__pyx_n_s_state, __pyx_k_state, sizeof(__pyx_k_state), 0, 0, 1, 1},
+    {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+    {&__pyx_n_s_sub, __pyx_k_sub, sizeof(__pyx_k_sub), 0, 0, 1, 1},
+    {&__pyx_n_u_sub, __pyx_k_sub, sizeof(__pyx_k_sub), 0, 1, 0, 1},
+    {&__pyx_n_s_tan, __pyx_k_tan, sizeof(__pyx_k_tan), 0, 0, 1, 1},
+    {&__pyx_n_u_tan, __pyx_k_tan, sizeof(__pyx_k_tan), 0, 1, 0, 1},
+    {&__pyx_n_s_tanh, __pyx_k_tanh, sizeof(__pyx_k_tanh), 0, 0, 1, 1},
+    {&__pyx_n_u_tanh, __pyx_k_tanh, sizeof(__pyx_k_tanh), 0, 1, 0, 1},
+    {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+    {&__pyx_n_s_time, __pyx_k_time, sizeof(__pyx_k_time), 0, 0, 1, 1},
+    {&__pyx_n_s_truediv, __pyx_k_truediv, sizeof(__pyx_k_truediv), 0, 0, 1, 1},
+    {&__pyx_n_u_truediv, __pyx_k_truediv, sizeof(__pyx_k_truediv), 0, 1, 0, 1},
+    {&__pyx_n_s_types, __pyx_k_types, sizeof(__pyx_k_types), 0, 0, 1, 1},
+    {&__pyx_n_s_ufunc, __pyx_k_ufunc, sizeof(__pyx_k_ufunc), 0, 0, 1, 1},
+    {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+    {&__pyx_n_s_use_setstate, __pyx_k_use_setstate, sizeof(__pyx_k_use_setstate), 0, 0, 1, 1},
+    {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+    {0, 0, 0, 0, 0, 0, 0}
+  };
+  return __Pyx_InitStrings(__pyx_string_tab);
+}
+/* #### Code section: cached_builtins ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_ZeroDivisionError = __Pyx_GetBuiltinName(__pyx_n_s_ZeroDivisionError); if (!__pyx_builtin_ZeroDivisionError) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_builtin_NotImplemented = __Pyx_GetBuiltinName(__pyx_n_s_NotImplemented); if (!__pyx_builtin_NotImplemented) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 317, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(0, 402, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cached_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "DualNum_c/Dual_c.pyx":78
+ *     """
+ *     if n < 0 and x.real == 0:
+ *         raise ZeroDivisionError("division by zero is undefined")             # <<<<<<<<<<<<<<
+ *     return _box(dual_pow_int(as_dual(x), n))
+ * 
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_division_by_zero_is_undefined); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "DualNum_c/Dual_c.pyx":317
+ *             if o.dual != 0:
+ *                 if self.real <= 0:
+ *                     raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *                 return _box(dual_pow(as_dual(self), as_dual(o)))
+ *             c = o.real
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_math_domain_error); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "DualNum_c/Dual_c.pyx":470
+ *             return _profiled("log", Dual_c.log, (self,))
+ *         if self.real <= 0:
+ *             raise ValueError("Logarithm of a non-positive number is undefined.")             # <<<<<<<<<<<<<<
+ *         return _box(dual_log(as_dual(self)))
+ * 
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Logarithm_of_a_non_positive_numb); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 470, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x880f1b0, 0x473daf7, 0xac9cb7c):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x880f1b0, 0x473daf7, 0xac9cb7c) = (dual, real))" % __pyx_checksum
+ */
+  __pyx_tuple__6 = PyTuple_Pack(3, __pyx_int_142668208, __pyx_int_74701559, __pyx_int_180996988); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "DualNum_c/Dual_c.pyx":21
+ * 
+ * 
+ * def _set_profiler(profiler):             # <<<<<<<<<<<<<<
+ *     """
+ *     Installs the profiler notified of every primitive call, or removes it if None.
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_n_s_profiler); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 21, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_set_profiler, 21, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 21, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":394
+ *         return f'Dual(real={self.real}, dual={self.dual})'
+ * 
+ *     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Implements NumPy ufuncs (``np.sin``, ``np.add``, ...) with the
+ */
+  __pyx_tuple__9 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_ufunc, __pyx_n_s_method, __pyx_n_s_inputs, __pyx_n_s_kwargs, __pyx_n_s_scalar_array_ufunc); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_VARARGS|CO_VARKEYWORDS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_array_ufunc, 394, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 394, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":406
+ *         return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)
+ * 
+ *     def __array_function__(self, func, types, args, kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Implements the NumPy functions supported by ``DualNum.DualArray``
+ */
+  __pyx_tuple__11 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_func, __pyx_n_s_types, __pyx_n_s_args, __pyx_n_s_kwargs, __pyx_n_s_scalar_array_function); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(5, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_array_function, 406, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 406, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":419
+ * 
+ *     # Class Methods
+ *     def get_real(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the real part of the dual number.
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 419, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_get_real, 419, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 419, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":425
+ *         return self.real
+ * 
+ *     def get_dual(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the dual part of the dual number.
+ */
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_get_dual, 425, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 425, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":431
+ *         return self.dual
+ * 
+ *     def sin(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the sine of the dual number.
+ */
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_sin, 431, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 431, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":439
+ *         return _box(dual_sin(as_dual(self)))
+ * 
+ *     def cos(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the cosine of the dual number.
+ */
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_cos, 439, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 439, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":447
+ *         return _box(dual_cos(as_dual(self)))
+ * 
+ *     def tan(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the tangent of the dual number.
+ */
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_tan, 447, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 447, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":455
+ *         return _box(dual_tan(as_dual(self)))
+ * 
+ *     def exp(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the exponential of the dual number.
+ */
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_exp, 455, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 455, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":463
+ *         return _box(dual_exp(as_dual(self)))
+ * 
+ *     def log(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the natural logarithm of the dual number.
+ */
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_log, 463, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 463, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":473
+ *         return _box(dual_log(as_dual(self)))
+ * 
+ *     def sqrt(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the square root of the dual number.
+ */
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_sqrt, 473, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 473, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":485
+ *         return _box(dual_sqrt(as_dual(self)))
+ * 
+ *     def sinh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic sine of the dual number.
+ */
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_sinh, 485, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 485, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":493
+ *         return _box(dual_sinh(as_dual(self)))
+ * 
+ *     def cosh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic cosine of the dual number.
+ */
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_cosh, 493, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 493, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":501
+ *         return _box(dual_cosh(as_dual(self)))
+ * 
+ *     def tanh(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the hyperbolic tangent of the dual number.
+ */
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_tanh, 501, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 501, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":509
+ *         return _box(dual_tanh(as_dual(self)))
+ * 
+ *     def asin(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arcsine of the dual number.
+ */
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_asin, 509, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 509, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":521
+ *         return _box(dual_asin(as_dual(self)))
+ * 
+ *     def acos(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arccosine of the dual number.
+ */
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_acos, 521, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 521, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":533
+ *         return _box(dual_acos(as_dual(self)))
+ * 
+ *     def atan(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the arctangent of the dual number.
+ */
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_atan, 533, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 533, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+  __pyx_tuple__28 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_state, __pyx_n_s_dict_2, __pyx_n_s_use_setstate); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(2, 1, __pyx_L1_error)
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Dual_c__set_state(self, __pyx_state)
+ */
+  __pyx_tuple__30 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(2, 16, __pyx_L1_error)
+
+  /* "DualNum_c/Dual_c.pyx":543
+ * 
+ * 
+ * def compute_derivative(func, x, dual_class):             # <<<<<<<<<<<<<<
+ *     """
+ *     Computes the derivative of a function at a given point using dual numbers.
+ */
+  __pyx_tuple__32 = PyTuple_Pack(3, __pyx_n_s_func, __pyx_n_s_x, __pyx_n_s_dual_class); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 543, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_DualNum_c_Dual_c_pyx, __pyx_n_s_compute_derivative, 543, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 543, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Dual_c(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__34 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Dual_c, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+/* #### Code section: init_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
+  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_74701559 = PyInt_FromLong(74701559L); if (unlikely(!__pyx_int_74701559)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_142668208 = PyInt_FromLong(142668208L); if (unlikely(!__pyx_int_142668208)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_180996988 = PyInt_FromLong(180996988L); if (unlikely(!__pyx_int_180996988)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_globals ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  return 0;
 }
 /* #### Code section: init_module ### */
 
@@ -10292,6 +13102,7 @@ static int __Pyx_modinit_global_init_code(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
   /*--- Global init code ---*/
+  __pyx_v_9DualNum_c_6Dual_c__profiler = Py_None; Py_INCREF(Py_None);
   __Pyx_RefNannyFinishContext();
   return 0;
 }
@@ -10306,18 +13117,194 @@ static int __Pyx_modinit_variable_export_code(void) {
 
 static int __Pyx_modinit_function_export_code(void) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
   /*--- Function export code ---*/
+  if (__Pyx_ExportFunction("from_dual", (void (*)(void))__pyx_f_9DualNum_c_6Dual_c_from_dual, "struct __pyx_obj_9DualNum_c_6Dual_c_Dual_c *(__pyx_t_9DualNum_c_6Dual_c_dual_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
 }
 
 static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_9DualNum_c_6Dual_c_Dual_c = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_9DualNum_c_6Dual_c_Dual_c_spec, NULL); if (unlikely(!__pyx_ptype_9DualNum_c_6Dual_c_Dual_c)) __PYX_ERR(0, 83, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_9DualNum_c_6Dual_c_Dual_c_spec, __pyx_ptype_9DualNum_c_6Dual_c_Dual_c) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  #else
+  __pyx_ptype_9DualNum_c_6Dual_c_Dual_c = &__pyx_type_9DualNum_c_6Dual_c_Dual_c;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_9DualNum_c_6Dual_c_Dual_c->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_9DualNum_c_6Dual_c_Dual_c->tp_dictoffset && __pyx_ptype_9DualNum_c_6Dual_c_Dual_c->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_9DualNum_c_6Dual_c_Dual_c->tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c___init__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c___init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c___init__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__add__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_2__add__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_2__add__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_2__add__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_2__add__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__radd__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_4__radd__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_4__radd__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_4__radd__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_4__radd__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__sub__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_6__sub__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_6__sub__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_6__sub__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_6__sub__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__rsub__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_8__rsub__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_8__rsub__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_8__rsub__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_8__rsub__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__mul__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_10__mul__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_10__mul__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_10__mul__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_10__mul__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__rmul__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_12__rmul__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_12__rmul__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_12__rmul__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_12__rmul__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__truediv__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_14__truediv__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_14__truediv__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_14__truediv__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_14__truediv__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__rtruediv__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_16__rtruediv__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__pow__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_18__pow__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_18__pow__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_18__pow__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_18__pow__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__rpow__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_20__rpow__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_20__rpow__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_20__rpow__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_20__rpow__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__eq__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_22__eq__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_22__eq__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_22__eq__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_22__eq__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__ne__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_24__ne__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_24__ne__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_24__ne__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_24__ne__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, "__repr__"); if (unlikely(!wrapper)) __PYX_ERR(0, 83, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_26__repr__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_26__repr__.doc = __pyx_doc_9DualNum_c_6Dual_c_6Dual_c_26__repr__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_9DualNum_c_6Dual_c_6Dual_c_26__repr__;
+    }
+  }
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Dual_c, (PyObject *) __pyx_ptype_9DualNum_c_6Dual_c_Dual_c) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_9DualNum_c_6Dual_c_Dual_c) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  #endif
   __Pyx_RefNannyFinishContext();
   return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
 }
 
 static int __Pyx_modinit_type_import_code(void) {
@@ -10613,383 +13600,351 @@ if (!__Pyx_RefNanny) {
   /*--- Global type/function init code ---*/
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
-  (void)__Pyx_modinit_function_export_code();
-  (void)__Pyx_modinit_type_init_code();
+  if (unlikely((__Pyx_modinit_function_export_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_type_init_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_type_import_code();
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
-  /*--- Execution code ---*/
-  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-
-  /* "DualNum_c/Dual_c.pyx":1
- * import math             # <<<<<<<<<<<<<<
- * 
- * class Dual_c:
- */
-  __pyx_t_2 = __Pyx_ImportDottedModule(__pyx_n_s_math, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_math, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "DualNum_c/Dual_c.pyx":3
- * import math
- * 
- * class Dual_c:             # <<<<<<<<<<<<<<
- *     """
- *     A class to represent a dual number for use in automatic differentiation.
- */
-  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_empty_tuple, __pyx_n_s_Dual_c, __pyx_n_s_Dual_c, (PyObject *) NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_kp_s_A_class_to_represent_a_dual_num); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 3, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
 
-  /* "DualNum_c/Dual_c.pyx":25
+  /* "DualNum_c/Dual_c.pyx":8
+ * from libc.math cimport fabs, floor
  * 
- *     # Special Methods
- *     def __init__(self, real, dual):             # <<<<<<<<<<<<<<
- *         """
- *         Constructs all the necessary attributes for the Dual object.
- */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_1__init__, 0, __pyx_n_s_Dual_c___init, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__6)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_init, __pyx_t_3) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "DualNum_c/Dual_c.pyx":52
- *         self.dual = dual
+ * from time import perf_counter_ns             # <<<<<<<<<<<<<<
  * 
- *     def __add__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Adds a dual number and another dual number or scalar.
- */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_3__add__, 0, __pyx_n_s_Dual_c___add, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__8)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 52, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_add, __pyx_t_3) < 0) __PYX_ERR(0, 52, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "DualNum_c/Dual_c.pyx":67
- *         raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
  * 
- *     def __radd__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Adds a dual number and another dual number or scalar.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_5__radd__, 0, __pyx_n_s_Dual_c___radd, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_perf_counter_ns);
+  __Pyx_GIVEREF(__pyx_n_s_perf_counter_ns);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_perf_counter_ns)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_time, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_radd, __pyx_t_3) < 0) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_perf_counter_ns); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_perf_counter_ns, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "DualNum_c/Dual_c.pyx":78
- *         return self.__add__(other)
- * 
- *     def __sub__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Subtracts one dual number from another dual or int/float.
+  /* "DualNum_c/Dual_c.pyx":15
+ * # C flag _profiling; while one is installed the outermost primitive call is
+ * # timed and the objects built by _new during it are counted.
+ * cdef bint _profiling = False             # <<<<<<<<<<<<<<
+ * cdef bint _counting = False
+ * cdef object _profiler = None
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_7__sub__, 0, __pyx_n_s_Dual_c___sub, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 78, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_sub, __pyx_t_3) < 0) __PYX_ERR(0, 78, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "DualNum_c/Dual_c.pyx":93
- *         raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
- * 
- *     def __rsub__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Subtracts one dual number from another dual or int/float.
+  __pyx_v_9DualNum_c_6Dual_c__profiling = 0;
+
+  /* "DualNum_c/Dual_c.pyx":16
+ * # timed and the objects built by _new during it are counted.
+ * cdef bint _profiling = False
+ * cdef bint _counting = False             # <<<<<<<<<<<<<<
+ * cdef object _profiler = None
+ * cdef Py_ssize_t _constructed = 0
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_9__rsub__, 0, __pyx_n_s_Dual_c___rsub, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_rsub, __pyx_t_3) < 0) __PYX_ERR(0, 93, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_9DualNum_c_6Dual_c__counting = 0;
 
-  /* "DualNum_c/Dual_c.pyx":104
- *         return self.__sub__(other)
+  /* "DualNum_c/Dual_c.pyx":17
+ * cdef bint _profiling = False
+ * cdef bint _counting = False
+ * cdef object _profiler = None             # <<<<<<<<<<<<<<
+ * cdef Py_ssize_t _constructed = 0
  * 
- *     def __mul__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Multiplies a dual number with another dual number or an int/float.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_11__mul__, 0, __pyx_n_s_Dual_c___mul, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_mul, __pyx_t_3) < 0) __PYX_ERR(0, 104, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "DualNum_c/Dual_c.pyx":119
- *         raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
+  __Pyx_INCREF(Py_None);
+  __Pyx_XGOTREF(__pyx_v_9DualNum_c_6Dual_c__profiler);
+  __Pyx_DECREF_SET(__pyx_v_9DualNum_c_6Dual_c__profiler, Py_None);
+  __Pyx_GIVEREF(Py_None);
+
+  /* "DualNum_c/Dual_c.pyx":18
+ * cdef bint _counting = False
+ * cdef object _profiler = None
+ * cdef Py_ssize_t _constructed = 0             # <<<<<<<<<<<<<<
  * 
- *     def __rmul__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Multiplies a dual number with another dual number or an int/float.
- */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_13__rmul__, 0, __pyx_n_s_Dual_c___rmul, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 119, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_rmul, __pyx_t_3) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "DualNum_c/Dual_c.pyx":130
- *         return self.__mul__(other)
  * 
- *     def __truediv__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Divides one dual number by another dual number or an int/float.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_15__truediv__, 0, __pyx_n_s_Dual_c___truediv, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 130, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_truediv, __pyx_t_3) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_9DualNum_c_6Dual_c__constructed = 0;
 
-  /* "DualNum_c/Dual_c.pyx":147
- *         raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pyx":21
  * 
- *     def __rtruediv__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Divides one dual number by another dual number or an int/float.
- */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_17__rtruediv__, 0, __pyx_n_s_Dual_c___rtruediv, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 147, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_rtruediv, __pyx_t_3) < 0) __PYX_ERR(0, 147, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "DualNum_c/Dual_c.pyx":158
- *         return self.__truediv__(other)
  * 
- *     def __pow__(self, other):             # <<<<<<<<<<<<<<
- *         """
- *         Raises the dual number to the power of another dual number.
+ * def _set_profiler(profiler):             # <<<<<<<<<<<<<<
+ *     """
+ *     Installs the profiler notified of every primitive call, or removes it if None.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_19__pow__, 0, __pyx_n_s_Dual_c___pow, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_1_set_profiler, 0, __pyx_n_s_set_profiler, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__8)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 21, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_pow, __pyx_t_3) < 0) __PYX_ERR(0, 158, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_set_profiler, __pyx_t_3) < 0) __PYX_ERR(0, 21, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "DualNum_c/Dual_c.pyx":171
- *         raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+  /* "DualNum_c/Dual_c.pyx":394
+ *         return f'Dual(real={self.real}, dual={self.dual})'
  * 
- *     def __eq__(self, other):             # <<<<<<<<<<<<<<
+ *     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):             # <<<<<<<<<<<<<<
  *         """
- *         Checks if two dual numbers are equal.
+ *         Implements NumPy ufuncs (``np.sin``, ``np.add``, ...) with the
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_21__eq__, 0, __pyx_n_s_Dual_c___eq, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_29__array_ufunc__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c___array_ufunc, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 394, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_eq, __pyx_t_3) < 0) __PYX_ERR(0, 171, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_array_ufunc, __pyx_t_3) < 0) __PYX_ERR(0, 394, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":186
+  /* "DualNum_c/Dual_c.pyx":406
+ *         return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)
  * 
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *     def __array_function__(self, func, types, args, kwargs):             # <<<<<<<<<<<<<<
  *         """
- *         Returns a string representation of the dual number.
+ *         Implements the NumPy functions supported by ``DualNum.DualArray``
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_23__repr__, 0, __pyx_n_s_Dual_c___repr, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_31__array_function__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c___array_function, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 406, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_repr, __pyx_t_3) < 0) __PYX_ERR(0, 186, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_array_function, __pyx_t_3) < 0) __PYX_ERR(0, 406, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":194
+  /* "DualNum_c/Dual_c.pyx":419
  * 
  *     # Class Methods
  *     def get_real(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the real part of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_25get_real, 0, __pyx_n_s_Dual_c_get_real, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 194, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_33get_real, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_get_real, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 419, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_get_real, __pyx_t_3) < 0) __PYX_ERR(0, 194, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_get_real, __pyx_t_3) < 0) __PYX_ERR(0, 419, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":200
+  /* "DualNum_c/Dual_c.pyx":425
  *         return self.real
  * 
  *     def get_dual(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the dual part of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_27get_dual, 0, __pyx_n_s_Dual_c_get_dual, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_35get_dual, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_get_dual, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 425, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_get_dual, __pyx_t_3) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_get_dual, __pyx_t_3) < 0) __PYX_ERR(0, 425, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":206
+  /* "DualNum_c/Dual_c.pyx":431
  *         return self.dual
  * 
  *     def sin(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the sine of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_29sin, 0, __pyx_n_s_Dual_c_sin, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 206, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_37sin, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_sin, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_sin, __pyx_t_3) < 0) __PYX_ERR(0, 206, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_sin, __pyx_t_3) < 0) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":212
- *         return Dual_c(math.sin(self.real), self.dual * math.cos(self.real))
+  /* "DualNum_c/Dual_c.pyx":439
+ *         return _box(dual_sin(as_dual(self)))
  * 
  *     def cos(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the cosine of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_31cos, 0, __pyx_n_s_Dual_c_cos, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_39cos, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_cos, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 439, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_cos, __pyx_t_3) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_cos, __pyx_t_3) < 0) __PYX_ERR(0, 439, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":218
- *         return Dual_c(math.cos(self.real), -self.dual * math.sin(self.real))
+  /* "DualNum_c/Dual_c.pyx":447
+ *         return _box(dual_cos(as_dual(self)))
  * 
  *     def tan(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the tangent of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_33tan, 0, __pyx_n_s_Dual_c_tan, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_41tan, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_tan, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 447, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_tan, __pyx_t_3) < 0) __PYX_ERR(0, 218, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_tan, __pyx_t_3) < 0) __PYX_ERR(0, 447, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":224
- *         return Dual_c(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))
+  /* "DualNum_c/Dual_c.pyx":455
+ *         return _box(dual_tan(as_dual(self)))
  * 
  *     def exp(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the exponential of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_35exp, 0, __pyx_n_s_Dual_c_exp, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_43exp, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_exp, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 455, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_exp, __pyx_t_3) < 0) __PYX_ERR(0, 224, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_exp, __pyx_t_3) < 0) __PYX_ERR(0, 455, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":230
- *         return Dual_c(math.exp(self.real), self.dual * math.exp(self.real))
+  /* "DualNum_c/Dual_c.pyx":463
+ *         return _box(dual_exp(as_dual(self)))
  * 
  *     def log(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the natural logarithm of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_37log, 0, __pyx_n_s_Dual_c_log, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_45log, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_log, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 463, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_log, __pyx_t_3) < 0) __PYX_ERR(0, 230, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_log, __pyx_t_3) < 0) __PYX_ERR(0, 463, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":238
- *         return Dual_c(math.log(self.real), self.dual / self.real)
+  /* "DualNum_c/Dual_c.pyx":473
+ *         return _box(dual_log(as_dual(self)))
  * 
  *     def sqrt(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the square root of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_39sqrt, 0, __pyx_n_s_Dual_c_sqrt, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_47sqrt, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_sqrt, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 473, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_sqrt, __pyx_t_3) < 0) __PYX_ERR(0, 238, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_sqrt, __pyx_t_3) < 0) __PYX_ERR(0, 473, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":244
- *         return Dual_c(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))
+  /* "DualNum_c/Dual_c.pyx":485
+ *         return _box(dual_sqrt(as_dual(self)))
  * 
  *     def sinh(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the hyperbolic sine of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_41sinh, 0, __pyx_n_s_Dual_c_sinh, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_49sinh, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_sinh, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 485, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_sinh, __pyx_t_3) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_sinh, __pyx_t_3) < 0) __PYX_ERR(0, 485, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":250
- *         return Dual_c(math.sinh(self.real), self.dual * math.cosh(self.real))
+  /* "DualNum_c/Dual_c.pyx":493
+ *         return _box(dual_sinh(as_dual(self)))
  * 
  *     def cosh(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the hyperbolic cosine of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_43cosh, 0, __pyx_n_s_Dual_c_cosh, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_51cosh, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_cosh, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 493, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_cosh, __pyx_t_3) < 0) __PYX_ERR(0, 250, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_cosh, __pyx_t_3) < 0) __PYX_ERR(0, 493, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":256
- *         return Dual_c(math.cosh(self.real), self.dual * math.sinh(self.real))
+  /* "DualNum_c/Dual_c.pyx":501
+ *         return _box(dual_cosh(as_dual(self)))
  * 
  *     def tanh(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the hyperbolic tangent of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_45tanh, 0, __pyx_n_s_Dual_c_tanh, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_53tanh, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_tanh, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 501, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_tanh, __pyx_t_3) < 0) __PYX_ERR(0, 256, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_tanh, __pyx_t_3) < 0) __PYX_ERR(0, 501, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":262
- *         return Dual_c(math.tanh(self.real), self.dual / (math.cosh(self.real) ** 2))
+  /* "DualNum_c/Dual_c.pyx":509
+ *         return _box(dual_tanh(as_dual(self)))
  * 
  *     def asin(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the arcsine of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_47asin, 0, __pyx_n_s_Dual_c_asin, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_55asin, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_asin, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 509, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_asin, __pyx_t_3) < 0) __PYX_ERR(0, 262, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_asin, __pyx_t_3) < 0) __PYX_ERR(0, 509, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":268
- *         return Dual_c(math.asin(self.real), self.dual / math.sqrt(1 - self.real ** 2))
+  /* "DualNum_c/Dual_c.pyx":521
+ *         return _box(dual_asin(as_dual(self)))
  * 
  *     def acos(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the arccosine of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_49acos, 0, __pyx_n_s_Dual_c_acos, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_57acos, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_acos, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 521, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_acos, __pyx_t_3) < 0) __PYX_ERR(0, 268, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_acos, __pyx_t_3) < 0) __PYX_ERR(0, 521, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":274
- *         return Dual_c(math.acos(self.real), -self.dual / math.sqrt(1 - self.real ** 2))
+  /* "DualNum_c/Dual_c.pyx":533
+ *         return _box(dual_acos(as_dual(self)))
  * 
  *     def atan(self):             # <<<<<<<<<<<<<<
  *         """
  *         Returns the arctangent of the dual number.
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_51atan, 0, __pyx_n_s_Dual_c_atan, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_59atan, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c_atan, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_atan, __pyx_t_3) < 0) __PYX_ERR(0, 274, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_atan, __pyx_t_3) < 0) __PYX_ERR(0, 533, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":3
- * import math
- * 
- * class Dual_c:             # <<<<<<<<<<<<<<
- *     """
- *     A class to represent a dual number for use in automatic differentiation.
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
  */
-  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_n_s_Dual_c, __pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_61__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c___reduce_cython, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Dual_c, __pyx_t_3) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Dual_c, (type(self), 0x880f1b0, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Dual_c__set_state(self, __pyx_state)
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_6Dual_c_63__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Dual_c___setstate_cython, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9DualNum_c_6Dual_c_Dual_c, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(2, 16, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9DualNum_c_6Dual_c_Dual_c);
 
-  /* "DualNum_c/Dual_c.pyx":282
+  /* "DualNum_c/Dual_c.pyx":543
  * 
  * 
  * def compute_derivative(func, x, dual_class):             # <<<<<<<<<<<<<<
  *     """
  *     Computes the derivative of a function at a given point using dual numbers.
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_1compute_derivative, 0, __pyx_n_s_compute_derivative, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_compute_derivative, __pyx_t_2) < 0) __PYX_ERR(0, 282, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_3compute_derivative, 0, __pyx_n_s_compute_derivative, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 543, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_compute_derivative, __pyx_t_3) < 0) __PYX_ERR(0, 543, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Dual_c(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9DualNum_c_6Dual_c_5__pyx_unpickle_Dual_c, 0, __pyx_n_s_pyx_unpickle_Dual_c, NULL, __pyx_n_s_DualNum_c_Dual_c, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Dual_c, __pyx_t_3) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "DualNum_c/Dual_c.pyx":1
- * import math             # <<<<<<<<<<<<<<
+ * # cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True             # <<<<<<<<<<<<<<
  * 
- * class Dual_c:
+ * cimport cython
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_kp_u_compute_derivative_line_282, __pyx_kp_u_Computes_the_derivative_of_a_fu) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_kp_u_compute_derivative_line_543, __pyx_kp_u_Computes_the_derivative_of_a_fu) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /*--- Wrapped vars code ---*/
 
@@ -11444,32 +14399,6 @@ bad:
 #endif
 #endif
 
-/* RaiseArgTupleInvalid */
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
-}
-
 /* RaiseDoubleKeywords */
 static void __Pyx_RaiseDoubleKeywordsError(
     const char* func_name,
@@ -11640,73 +14569,99 @@ bad:
     return -1;
 }
 
-/* JoinPyUnicode */
-static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
-                                      Py_UCS4 max_char) {
-#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    PyObject *result_uval;
-    int result_ukind, kind_shift;
-    Py_ssize_t i, char_pos;
-    void *result_udata;
-    CYTHON_MAYBE_UNUSED_VAR(max_char);
-#if CYTHON_PEP393_ENABLED
-    result_uval = PyUnicode_New(result_ulength, max_char);
-    if (unlikely(!result_uval)) return NULL;
-    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
-    kind_shift = (result_ukind == PyUnicode_4BYTE_KIND) ? 2 : result_ukind - 1;
-    result_udata = PyUnicode_DATA(result_uval);
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
 #else
-    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
-    if (unlikely(!result_uval)) return NULL;
-    result_ukind = sizeof(Py_UNICODE);
-    kind_shift = (result_ukind == 4) ? 2 : result_ukind - 1;
-    result_udata = PyUnicode_AS_UNICODE(result_uval);
+        dictptr = _PyObject_GetDictPtr(obj);
 #endif
-    assert(kind_shift == 2 || kind_shift == 1 || kind_shift == 0);
-    char_pos = 0;
-    for (i=0; i < value_count; i++) {
-        int ukind;
-        Py_ssize_t ulength;
-        void *udata;
-        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
-        if (unlikely(__Pyx_PyUnicode_READY(uval)))
-            goto bad;
-        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
-        if (unlikely(!ulength))
-            continue;
-        if (unlikely((PY_SSIZE_T_MAX >> kind_shift) - ulength < char_pos))
-            goto overflow;
-        ukind = __Pyx_PyUnicode_KIND(uval);
-        udata = __Pyx_PyUnicode_DATA(uval);
-        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
-            memcpy((char *)result_udata + (char_pos << kind_shift), udata, (size_t) (ulength << kind_shift));
-        } else {
-            #if PY_VERSION_HEX >= 0x030d0000
-            if (unlikely(PyUnicode_CopyCharacters(result_uval, char_pos, uval, 0, ulength) < 0)) goto bad;
-            #elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
-            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
-            #else
-            Py_ssize_t j;
-            for (j=0; j < ulength; j++) {
-                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
-                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
-            }
-            #endif
-        }
-        char_pos += ulength;
     }
-    return result_uval;
-overflow:
-    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
-bad:
-    Py_DECREF(result_uval);
-    return NULL;
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && PY_VERSION_HEX < 0x030d0000
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
 #else
-    CYTHON_UNUSED_VAR(max_char);
-    CYTHON_UNUSED_VAR(result_ulength);
-    CYTHON_UNUSED_VAR(value_count);
-    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
 #endif
+    return __Pyx_GetBuiltinName(name);
 }
 
 /* PyFunctionFastCall */
@@ -11878,822 +14833,554 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
             PyExc_SystemError,
             "NULL result without error in PyObject_Call");
     }
-    return result;
-}
-#endif
-
-/* PyObjectFastCall */
-#if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
-static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs) {
-    PyObject *argstuple;
-    PyObject *result = 0;
-    size_t i;
-    argstuple = PyTuple_New((Py_ssize_t)nargs);
-    if (unlikely(!argstuple)) return NULL;
-    for (i = 0; i < nargs; i++) {
-        Py_INCREF(args[i]);
-        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) < 0) goto bad;
-    }
-    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
-  bad:
-    Py_DECREF(argstuple);
-    return result;
-}
-#endif
-static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t _nargs, PyObject *kwargs) {
-    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (nargs == 0 && kwargs == NULL) {
-        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
-            return __Pyx_PyObject_CallMethO(func, NULL);
-    }
-    else if (nargs == 1 && kwargs == NULL) {
-        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
-            return __Pyx_PyObject_CallMethO(func, args[0]);
-    }
-#endif
-    #if PY_VERSION_HEX < 0x030800B1
-    #if CYTHON_FAST_PYCCALL
-    if (PyCFunction_Check(func)) {
-        if (kwargs) {
-            return _PyCFunction_FastCallDict(func, args, nargs, kwargs);
-        } else {
-            return _PyCFunction_FastCallKeywords(func, args, nargs, NULL);
-        }
-    }
-    #if PY_VERSION_HEX >= 0x030700A1
-    if (!kwargs && __Pyx_IS_TYPE(func, &PyMethodDescr_Type)) {
-        return _PyMethodDescr_FastCallKeywords(func, args, nargs, NULL);
-    }
-    #endif
-    #endif
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs);
-    }
-    #endif
-    #endif
-    if (kwargs == NULL) {
-        #if CYTHON_VECTORCALL
-        #if PY_VERSION_HEX < 0x03090000
-        vectorcallfunc f = _PyVectorcall_Function(func);
-        #else
-        vectorcallfunc f = PyVectorcall_Function(func);
-        #endif
-        if (f) {
-            return f(func, args, (size_t)nargs, NULL);
-        }
-        #elif defined(__Pyx_CyFunction_USED) && CYTHON_BACKPORT_VECTORCALL
-        if (__Pyx_CyFunction_CheckExact(func)) {
-            __pyx_vectorcallfunc f = __Pyx_CyFunction_func_vectorcall(func);
-            if (f) return f(func, args, (size_t)nargs, NULL);
-        }
-        #endif
-    }
-    if (nargs == 0) {
-        return __Pyx_PyObject_Call(func, __pyx_empty_tuple, kwargs);
-    }
-    #if PY_VERSION_HEX >= 0x03090000 && !CYTHON_COMPILING_IN_LIMITED_API
-    return PyObject_VectorcallDict(func, args, (size_t)nargs, kwargs);
-    #else
-    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
-    #endif
-}
-
-/* PyObjectCallOneArg */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *args[2] = {NULL, arg};
-    return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
-}
-
-/* RaiseException */
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    __Pyx_PyThreadState_declare
-    CYTHON_UNUSED_VAR(cause);
-    Py_XINCREF(type);
-    if (!value || value == Py_None)
-        value = NULL;
-    else
-        Py_INCREF(value);
-    if (!tb || tb == Py_None)
-        tb = NULL;
-    else {
-        Py_INCREF(tb);
-        if (!PyTraceBack_Check(tb)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: arg 3 must be a traceback or None");
-            goto raise_error;
-        }
-    }
-    if (PyType_Check(type)) {
-#if CYTHON_COMPILING_IN_PYPY
-        if (!value) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
-#endif
-        PyErr_NormalizeException(&type, &value, &tb);
-    } else {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(type);
-        Py_INCREF(type);
-        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: exception class must be a subclass of BaseException");
-            goto raise_error;
-        }
-    }
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-#else
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    PyObject* owned_instance = NULL;
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (PyExceptionClass_Check(type)) {
-        PyObject *instance_class = NULL;
-        if (value && PyExceptionInstance_Check(value)) {
-            instance_class = (PyObject*) Py_TYPE(value);
-            if (instance_class != type) {
-                int is_subclass = PyObject_IsSubclass(instance_class, type);
-                if (!is_subclass) {
-                    instance_class = NULL;
-                } else if (unlikely(is_subclass == -1)) {
-                    goto bad;
-                } else {
-                    type = instance_class;
-                }
-            }
-        }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
-        }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-    PyErr_SetObject(type, value);
-    if (tb) {
-      #if PY_VERSION_HEX >= 0x030C00A6
-        PyException_SetTraceback(value, tb);
-      #elif CYTHON_FAST_THREAD_STATE
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-#else
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#endif
-    }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
+    return result;
 }
 #endif
 
-/* PyObjectSetAttrStr */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_setattro))
-        return tp->tp_setattro(obj, attr_name, value);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_setattr))
-        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
-#endif
-    return PyObject_SetAttr(obj, attr_name, value);
+/* PyObjectFastCall */
+#if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) < 0) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
 }
 #endif
-
-/* PyDictVersioning */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t _nargs, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
 #if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
-#else
-        dictptr = _PyObject_GetDictPtr(obj);
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
 #endif
+    #if PY_VERSION_HEX < 0x030800B1
+    #if CYTHON_FAST_PYCCALL
+    if (PyCFunction_Check(func)) {
+        if (kwargs) {
+            return _PyCFunction_FastCallDict(func, args, nargs, kwargs);
+        } else {
+            return _PyCFunction_FastCallKeywords(func, args, nargs, NULL);
+        }
     }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+    #if PY_VERSION_HEX >= 0x030700A1
+    if (!kwargs && __Pyx_IS_TYPE(func, &PyMethodDescr_Type)) {
+        return _PyMethodDescr_FastCallKeywords(func, args, nargs, NULL);
+    }
+    #endif
+    #endif
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs);
+    }
+    #endif
+    #endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+        #if PY_VERSION_HEX < 0x03090000
+        vectorcallfunc f = _PyVectorcall_Function(func);
+        #else
+        vectorcallfunc f = PyVectorcall_Function(func);
+        #endif
+        if (f) {
+            return f(func, args, (size_t)nargs, NULL);
+        }
+        #elif defined(__Pyx_CyFunction_USED) && CYTHON_BACKPORT_VECTORCALL
+        if (__Pyx_CyFunction_CheckExact(func)) {
+            __pyx_vectorcallfunc f = __Pyx_CyFunction_func_vectorcall(func);
+            if (f) return f(func, args, (size_t)nargs, NULL);
+        }
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_empty_tuple, kwargs);
+    }
+    #if PY_VERSION_HEX >= 0x03090000 && !CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_VectorcallDict(func, args, (size_t)nargs, kwargs);
+    #else
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #endif
 }
-#endif
 
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
 #else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
 #endif
 {
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && PY_VERSION_HEX < 0x030d0000
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#elif CYTHON_COMPILING_IN_LIMITED_API
-    if (unlikely(!__pyx_m)) {
-        return NULL;
-    }
-    result = PyObject_GetAttr(__pyx_m, name);
-    if (likely(result)) {
-        return result;
+    PyObject *local_type = NULL, *local_value, *local_tb = NULL;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if PY_VERSION_HEX >= 0x030C00A6
+    local_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    if (likely(local_value)) {
+        local_type = (PyObject*) Py_TYPE(local_value);
+        Py_INCREF(local_type);
+        local_tb = PyException_GetTraceback(local_value);
     }
+  #else
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+  #endif
 #else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
 #endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE && PY_VERSION_HEX >= 0x030C00A6
+    if (unlikely(tstate->current_exception))
+#elif CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
 #else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-    PyErr_Clear();
+    if (unlikely(PyErr_Occurred()))
 #endif
-    return __Pyx_GetBuiltinName(name);
-}
-
-/* PyIntCompare */
-static CYTHON_INLINE int __Pyx_PyInt_BoolEqObjC(PyObject *op1, PyObject *op2, long intval, long inplace) {
-    CYTHON_MAYBE_UNUSED_VAR(intval);
-    CYTHON_UNUSED_VAR(inplace);
-    if (op1 == op2) {
-        return 1;
-    }
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op1))) {
-        const long b = intval;
-        long a = PyInt_AS_LONG(op1);
-        return (a == b);
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
     }
     #endif
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op1))) {
-        int unequal;
-        unsigned long uintval;
-        Py_ssize_t size = __Pyx_PyLong_DigitCount(op1);
-        const digit* digits = __Pyx_PyLong_Digits(op1);
-        if (intval == 0) {
-            return (__Pyx_PyLong_IsZero(op1) == 1);
-        } else if (intval < 0) {
-            if (__Pyx_PyLong_IsNonNeg(op1))
-                return 0;
-            intval = -intval;
-        } else {
-            if (__Pyx_PyLong_IsNeg(op1))
-                return 0;
-        }
-        uintval = (unsigned long) intval;
-#if PyLong_SHIFT * 4 < SIZEOF_LONG*8
-        if (uintval >> (PyLong_SHIFT * 4)) {
-            unequal = (size != 5) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
-                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[4] != ((uintval >> (4 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
-        } else
-#endif
-#if PyLong_SHIFT * 3 < SIZEOF_LONG*8
-        if (uintval >> (PyLong_SHIFT * 3)) {
-            unequal = (size != 4) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
-                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
-        } else
-#endif
-#if PyLong_SHIFT * 2 < SIZEOF_LONG*8
-        if (uintval >> (PyLong_SHIFT * 2)) {
-            unequal = (size != 3) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
-                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
-        } else
-#endif
-#if PyLong_SHIFT * 1 < SIZEOF_LONG*8
-        if (uintval >> (PyLong_SHIFT * 1)) {
-            unequal = (size != 2) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
-                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
-        } else
-#endif
-            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
-        return (unequal == 0);
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+      #if PY_VERSION_HEX >= 0x030B00a4
+        tmp_value = exc_info->exc_value;
+        exc_info->exc_value = local_value;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+        Py_XDECREF(local_type);
+        Py_XDECREF(local_tb);
+      #else
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+      #endif
     }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
     #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-#if CYTHON_COMPILING_IN_LIMITED_API
-        double a = __pyx_PyFloat_AsDouble(op1);
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
 #else
-        double a = PyFloat_AS_DOUBLE(op1);
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
 #endif
-        return ((double)a == (double)b);
-    }
-    return __Pyx_PyObject_IsTrueAndDecref(
-        PyObject_RichCompare(op1, op2, Py_EQ));
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
 }
 
-/* PyIntBinop */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_MultiplyCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(intval);
-    CYTHON_MAYBE_UNUSED_VAR(inplace);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op2))) {
-        const long a = intval;
-        long b = PyInt_AS_LONG(op2);
-        
-#ifdef HAVE_LONG_LONG
-            if (sizeof(PY_LONG_LONG) > sizeof(long)) {
-                PY_LONG_LONG result = (PY_LONG_LONG)a * (PY_LONG_LONG)b;
-                return (result >= LONG_MIN && result <= LONG_MAX) ?
-                    PyInt_FromLong((long)result) : PyLong_FromLongLong(result);
-            }
-#endif
-#if CYTHON_USE_TYPE_SLOTS
-            return PyInt_Type.tp_as_number->nb_multiply(op1, op2);
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_value = exc_info->exc_value;
+    exc_info->exc_value = *value;
+    if (tmp_value == NULL || tmp_value == Py_None) {
+        Py_XDECREF(tmp_value);
+        tmp_value = NULL;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+    } else {
+        tmp_type = (PyObject*) Py_TYPE(tmp_value);
+        Py_INCREF(tmp_type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        tmp_tb = ((PyBaseExceptionObject*) tmp_value)->traceback;
+        Py_XINCREF(tmp_tb);
+        #else
+        tmp_tb = PyException_GetTraceback(tmp_value);
+        #endif
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+  #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+  #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
 #else
-            return PyNumber_Multiply(op1, op2);
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_value == NULL || exc_info->exc_value == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
 #endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    PyObject *exc_value = exc_info->exc_value;
+    if (exc_value == NULL || exc_value == Py_None) {
+        *value = NULL;
+        *type = NULL;
+        *tb = NULL;
+    } else {
+        *value = exc_value;
+        Py_INCREF(*value);
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        *tb = PyException_GetTraceback(exc_value);
     }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #endif
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    PyObject *tmp_value = exc_info->exc_value;
+    exc_info->exc_value = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+  #else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
     #endif
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op2))) {
-        const long a = intval;
-        long b, x;
-#ifdef HAVE_LONG_LONG
-        const PY_LONG_LONG lla = intval;
-        PY_LONG_LONG llb, llx;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+  #endif
+}
 #endif
-        if (unlikely(__Pyx_PyLong_IsZero(op2))) {
-            return __Pyx_NewRef(op2);
-        }
-        if (likely(__Pyx_PyLong_IsCompact(op2))) {
-            b = __Pyx_PyLong_CompactValue(op2);
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(op2);
-            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op2);
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT+30) {
-                        b = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT+30) {
-                        llb = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT+30) {
-                        b = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT+30) {
-                        llb = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT+30) {
-                        b = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT+30) {
-                        llb = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT+30) {
-                        b = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT+30) {
-                        llb = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT+30) {
-                        b = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT+30) {
-                        llb = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT+30) {
-                        b = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT+30) {
-                        llb = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                default: return PyLong_Type.tp_as_number->nb_multiply(op1, op2);
-            }
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    CYTHON_UNUSED_VAR(cause);
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
         }
-                CYTHON_UNUSED_VAR(a);
-                CYTHON_UNUSED_VAR(b);
-                #ifdef HAVE_LONG_LONG
-                llb = b;
-                goto long_long;
-                #else
-                return PyLong_Type.tp_as_number->nb_multiply(op1, op2);
-                #endif
-            return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-        long_long:
-                llx = lla * llb;
-            return PyLong_FromLongLong(llx);
-#endif
-        
-        
     }
-    #endif
-    if (PyFloat_CheckExact(op2)) {
-        const long a = intval;
-#if CYTHON_COMPILING_IN_LIMITED_API
-        double b = __pyx_PyFloat_AsDouble(op2);
-#else
-        double b = PyFloat_AS_DOUBLE(op2);
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
 #endif
-            double result;
-            
-            PyFPE_START_PROTECT("multiply", return NULL)
-            result = ((double)a) * (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
     }
-    return (inplace ? PyNumber_InPlaceMultiply : PyNumber_Multiply)(op1, op2);
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
 }
-#endif
-
-/* PyIntBinop */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_SubtractCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(intval);
-    CYTHON_MAYBE_UNUSED_VAR(inplace);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op2))) {
-        const long a = intval;
-        long x;
-        long b = PyInt_AS_LONG(op2);
-        
-            x = (long)((unsigned long)a - (unsigned long)b);
-            if (likely((x^a) >= 0 || (x^~b) >= 0))
-                return PyInt_FromLong(x);
-            return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
     }
-    #endif
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op2))) {
-        const long a = intval;
-        long b, x;
-#ifdef HAVE_LONG_LONG
-        const PY_LONG_LONG lla = intval;
-        PY_LONG_LONG llb, llx;
-#endif
-        if (unlikely(__Pyx_PyLong_IsZero(op2))) {
-            return __Pyx_NewRef(op1);
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
         }
-        if (likely(__Pyx_PyLong_IsCompact(op2))) {
-            b = __Pyx_PyLong_CompactValue(op2);
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(op2);
-            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op2);
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        b = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        llb = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        b = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        llb = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        b = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        llb = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        b = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        llb = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        b = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        llb = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        b = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        llb = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                default: return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
             }
         }
-                x = a - b;
-            return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-        long_long:
-                llx = lla - llb;
-            return PyLong_FromLongLong(llx);
-#endif
-        
-        
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
     }
-    #endif
-    if (PyFloat_CheckExact(op2)) {
-        const long a = intval;
-#if CYTHON_COMPILING_IN_LIMITED_API
-        double b = __pyx_PyFloat_AsDouble(op2);
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+      #if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+      #elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
 #else
-        double b = PyFloat_AS_DOUBLE(op2);
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
-            double result;
-            
-            PyFPE_START_PROTECT("subtract", return NULL)
-            result = ((double)a) - (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
     }
-    return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
 #endif
 
-/* PyIntBinop */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(intval);
-    CYTHON_MAYBE_UNUSED_VAR(inplace);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op2))) {
-        const long a = intval;
-        long x;
-        long b = PyInt_AS_LONG(op2);
-        
-            x = (long)((unsigned long)a + (unsigned long)b);
-            if (likely((x^a) >= 0 || (x^b) >= 0))
-                return PyInt_FromLong(x);
-            return PyLong_Type.tp_as_number->nb_add(op1, op2);
-    }
-    #endif
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op2))) {
-        const long a = intval;
-        long b, x;
-#ifdef HAVE_LONG_LONG
-        const PY_LONG_LONG lla = intval;
-        PY_LONG_LONG llb, llx;
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind, kind_shift;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+    CYTHON_MAYBE_UNUSED_VAR(max_char);
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    kind_shift = (result_ukind == PyUnicode_4BYTE_KIND) ? 2 : result_ukind - 1;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    kind_shift = (result_ukind == 4) ? 2 : result_ukind - 1;
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
 #endif
-        if (unlikely(__Pyx_PyLong_IsZero(op2))) {
-            return __Pyx_NewRef(op1);
-        }
-        if (likely(__Pyx_PyLong_IsCompact(op2))) {
-            b = __Pyx_PyLong_CompactValue(op2);
+    assert(kind_shift == 2 || kind_shift == 1 || kind_shift == 0);
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely((PY_SSIZE_T_MAX >> kind_shift) - ulength < char_pos))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + (char_pos << kind_shift), udata, (size_t) (ulength << kind_shift));
         } else {
-            const digit* digits = __Pyx_PyLong_Digits(op2);
-            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op2);
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        b = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        llb = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        b = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        llb = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        b = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        llb = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        b = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        llb = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        b = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        llb = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        b = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    #ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        llb = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    #endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            #if PY_VERSION_HEX >= 0x030d0000
+            if (unlikely(PyUnicode_CopyCharacters(result_uval, char_pos, uval, 0, ulength) < 0)) goto bad;
+            #elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
             }
+            #endif
         }
-                x = a + b;
-            return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-        long_long:
-                llx = lla + llb;
-            return PyLong_FromLongLong(llx);
-#endif
-        
-        
+        char_pos += ulength;
     }
-    #endif
-    if (PyFloat_CheckExact(op2)) {
-        const long a = intval;
-#if CYTHON_COMPILING_IN_LIMITED_API
-        double b = __pyx_PyFloat_AsDouble(op2);
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
 #else
-        double b = PyFloat_AS_DOUBLE(op2);
+    CYTHON_UNUSED_VAR(max_char);
+    CYTHON_UNUSED_VAR(result_ulength);
+    CYTHON_UNUSED_VAR(value_count);
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
 #endif
-            double result;
-            
-            PyFPE_START_PROTECT("add", return NULL)
-            result = ((double)a) + (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
-    }
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
 }
-#endif
+
+/* PyObjectCallOneArg */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *args[2] = {NULL, arg};
+    return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
 
 /* Import */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
@@ -12753,204 +15440,720 @@ bad:
     return module;
 }
 
-/* ImportDottedModule */
-#if PY_MAJOR_VERSION >= 3
-static PyObject *__Pyx__ImportDottedModule_Error(PyObject *name, PyObject *parts_tuple, Py_ssize_t count) {
-    PyObject *partial_name = NULL, *slice = NULL, *sep = NULL;
-    if (unlikely(PyErr_Occurred())) {
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
         PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__4);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if PY_VERSION_HEX < 0x030700A1 || (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400)
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
+    if (unlikely(!value)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kw,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kw, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kw))) {
+        Py_ssize_t kwsize;
+#if CYTHON_ASSUME_SAFE_MACROS
+        kwsize = PyTuple_GET_SIZE(kw);
+#else
+        kwsize = PyTuple_Size(kw);
+        if (kwsize < 0) return 0;
+#endif
+        if (unlikely(kwsize == 0))
+            return 1;
+        if (!kw_allowed) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kw, 0);
+#else
+            key = PyTuple_GetItem(kw, pos);
+            if (!key) return 0;
+#endif
+            goto invalid_keyword;
+        }
+#if PY_VERSION_HEX < 0x03090000
+        for (pos = 0; pos < kwsize; pos++) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kw, pos);
+#else
+            key = PyTuple_GetItem(kw, pos);
+            if (!key) return 0;
+#endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+        }
+#endif
+        return 1;
+    }
+    while (PyDict_Next(kw, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if (!kw_allowed && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* GetAttr3 */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d00A1
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+#endif
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d00A1
+    int res = PyObject_GetOptionalAttr(o, n, &r);
+    return (res != 0) ? r : __Pyx_NewRef(d);
+#else
+  #if CYTHON_USE_TYPE_SLOTS
+    if (likely(PyString_Check(n))) {
+        r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+        if (unlikely(!r) && likely(!PyErr_Occurred())) {
+            r = __Pyx_NewRef(d);
+        }
+        return r;
+    }
+  #endif
+    r = PyObject_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+#endif
+}
+
+/* RaiseUnexpectedTypeError */
+static int
+__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
+{
+    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
+                 expected, obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
     }
-    if (likely(PyTuple_GET_SIZE(parts_tuple) == count)) {
-        partial_name = name;
+    r = __Pyx_GetAttr(o, n);
+    if (!r) {
+        PyErr_Clear();
+        return 0;
     } else {
-        slice = PySequence_GetSlice(parts_tuple, 0, count);
-        if (unlikely(!slice))
-            goto bad;
-        sep = PyUnicode_FromStringAndSize(".", 1);
-        if (unlikely(!sep))
-            goto bad;
-        partial_name = PyUnicode_Join(sep, slice);
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* FixUpExtensionType */
+#if CYTHON_USE_TYPE_SPECS
+static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
+#if PY_VERSION_HEX > 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    CYTHON_UNUSED_VAR(spec);
+    CYTHON_UNUSED_VAR(type);
+#else
+    const PyType_Slot *slot = spec->slots;
+    while (slot && slot->slot && slot->slot != Py_tp_members)
+        slot++;
+    if (slot && slot->slot == Py_tp_members) {
+        int changed = 0;
+#if !(PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON)
+        const
+#endif
+            PyMemberDef *memb = (PyMemberDef*) slot->pfunc;
+        while (memb && memb->name) {
+            if (memb->name[0] == '_' && memb->name[1] == '_') {
+#if PY_VERSION_HEX < 0x030900b1
+                if (strcmp(memb->name, "__weaklistoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_weaklistoffset = memb->offset;
+                    changed = 1;
+                }
+                else if (strcmp(memb->name, "__dictoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_dictoffset = memb->offset;
+                    changed = 1;
+                }
+#if CYTHON_METH_FASTCALL
+                else if (strcmp(memb->name, "__vectorcalloffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+#if PY_VERSION_HEX >= 0x030800b4
+                    type->tp_vectorcall_offset = memb->offset;
+#else
+                    type->tp_print = (printfunc) memb->offset;
+#endif
+                    changed = 1;
+                }
+#endif
+#else
+                if ((0));
+#endif
+#if PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON
+                else if (strcmp(memb->name, "__module__") == 0) {
+                    PyObject *descr;
+                    assert(memb->type == T_OBJECT);
+                    assert(memb->flags == 0 || memb->flags == READONLY);
+                    descr = PyDescr_NewMember(type, memb);
+                    if (unlikely(!descr))
+                        return -1;
+                    if (unlikely(PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr) < 0)) {
+                        Py_DECREF(descr);
+                        return -1;
+                    }
+                    Py_DECREF(descr);
+                    changed = 1;
+                }
+#endif
+            }
+            memb++;
+        }
+        if (changed)
+            PyType_Modified(type);
+    }
+#endif
+    return 0;
+}
+#endif
+
+/* PyObjectCallNoArg */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+    PyObject *arg[2] = {NULL, NULL};
+    return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    __Pyx_TypeName type_name;
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if defined(Py_TPFLAGS_METHOD_DESCRIPTOR) && Py_TPFLAGS_METHOD_DESCRIPTOR
+        if (__Pyx_PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_METHOD_DESCRIPTOR))
+#elif PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
     }
-    PyErr_Format(
+    if (likely(descr != NULL)) {
+        *method = descr;
+        return 0;
+    }
+    type_name = __Pyx_PyType_GetName(tp);
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%U'",
+                 type_name, name);
+#else
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%.400s'",
+                 type_name, PyString_AS_STRING(name));
+#endif
+    __Pyx_DECREF_TypeName(type_name);
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* ValidateBasesTuple */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases) {
+    Py_ssize_t i, n;
+#if CYTHON_ASSUME_SAFE_MACROS
+    n = PyTuple_GET_SIZE(bases);
+#else
+    n = PyTuple_Size(bases);
+    if (n < 0) return -1;
+#endif
+    for (i = 1; i < n; i++)
+    {
+#if CYTHON_AVOID_BORROWED_REFS
+        PyObject *b0 = PySequence_GetItem(bases, i);
+        if (!b0) return -1;
+#elif CYTHON_ASSUME_SAFE_MACROS
+        PyObject *b0 = PyTuple_GET_ITEM(bases, i);
+#else
+        PyObject *b0 = PyTuple_GetItem(bases, i);
+        if (!b0) return -1;
+#endif
+        PyTypeObject *b;
 #if PY_MAJOR_VERSION < 3
-        PyExc_ImportError,
-        "No module named '%s'", PyString_AS_STRING(partial_name));
+        if (PyClass_Check(b0))
+        {
+            PyErr_Format(PyExc_TypeError, "base class '%.200s' is an old-style class",
+                         PyString_AS_STRING(((PyClassObject*)b0)->cl_name));
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_DECREF(b0);
+#endif
+            return -1;
+        }
+#endif
+        b = (PyTypeObject*) b0;
+        if (!__Pyx_PyType_HasFeature(b, Py_TPFLAGS_HEAPTYPE))
+        {
+            __Pyx_TypeName b_name = __Pyx_PyType_GetName(b);
+            PyErr_Format(PyExc_TypeError,
+                "base class '" __Pyx_FMT_TYPENAME "' is not a heap type", b_name);
+            __Pyx_DECREF_TypeName(b_name);
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_DECREF(b0);
+#endif
+            return -1;
+        }
+        if (dictoffset == 0)
+        {
+            Py_ssize_t b_dictoffset = 0;
+#if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+            b_dictoffset = b->tp_dictoffset;
+#else
+            PyObject *py_b_dictoffset = PyObject_GetAttrString((PyObject*)b, "__dictoffset__");
+            if (!py_b_dictoffset) goto dictoffset_return;
+            b_dictoffset = PyLong_AsSsize_t(py_b_dictoffset);
+            Py_DECREF(py_b_dictoffset);
+            if (b_dictoffset == -1 && PyErr_Occurred()) goto dictoffset_return;
+#endif
+            if (b_dictoffset) {
+                {
+                    __Pyx_TypeName b_name = __Pyx_PyType_GetName(b);
+                    PyErr_Format(PyExc_TypeError,
+                        "extension type '%.200s' has no __dict__ slot, "
+                        "but base type '" __Pyx_FMT_TYPENAME "' has: "
+                        "either add 'cdef dict __dict__' to the extension type "
+                        "or add '__slots__ = [...]' to the base type",
+                        type_name, b_name);
+                    __Pyx_DECREF_TypeName(b_name);
+                }
+#if !(CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY)
+              dictoffset_return:
+#endif
+#if CYTHON_AVOID_BORROWED_REFS
+                Py_DECREF(b0);
+#endif
+                return -1;
+            }
+        }
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(b0);
+#endif
+    }
+    return 0;
+}
+#endif
+
+/* PyType_Ready */
+static int __Pyx_PyType_Ready(PyTypeObject *t) {
+#if CYTHON_USE_TYPE_SPECS || !(CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API) || defined(PYSTON_MAJOR_VERSION)
+    (void)__Pyx_PyObject_CallMethod0;
+#if CYTHON_USE_TYPE_SPECS
+    (void)__Pyx_validate_bases_tuple;
+#endif
+    return PyType_Ready(t);
 #else
-#if PY_VERSION_HEX >= 0x030600B1
-        PyExc_ModuleNotFoundError,
+    int r;
+    PyObject *bases = __Pyx_PyType_GetSlot(t, tp_bases, PyObject*);
+    if (bases && unlikely(__Pyx_validate_bases_tuple(t->tp_name, t->tp_dictoffset, bases) == -1))
+        return -1;
+#if PY_VERSION_HEX >= 0x03050000 && !defined(PYSTON_MAJOR_VERSION)
+    {
+        int gc_was_enabled;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        gc_was_enabled = PyGC_Disable();
+        (void)__Pyx_PyObject_CallMethod0;
+    #else
+        PyObject *ret, *py_status;
+        PyObject *gc = NULL;
+        #if PY_VERSION_HEX >= 0x030700a1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM+0 >= 0x07030400)
+        gc = PyImport_GetModule(__pyx_kp_u_gc);
+        #endif
+        if (unlikely(!gc)) gc = PyImport_Import(__pyx_kp_u_gc);
+        if (unlikely(!gc)) return -1;
+        py_status = __Pyx_PyObject_CallMethod0(gc, __pyx_kp_u_isenabled);
+        if (unlikely(!py_status)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+        gc_was_enabled = __Pyx_PyObject_IsTrue(py_status);
+        Py_DECREF(py_status);
+        if (gc_was_enabled > 0) {
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_kp_u_disable);
+            if (unlikely(!ret)) {
+                Py_DECREF(gc);
+                return -1;
+            }
+            Py_DECREF(ret);
+        } else if (unlikely(gc_was_enabled == -1)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+    #endif
+        t->tp_flags |= Py_TPFLAGS_HEAPTYPE;
+#if PY_VERSION_HEX >= 0x030A0000
+        t->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
+#endif
 #else
-        PyExc_ImportError,
+        (void)__Pyx_PyObject_CallMethod0;
+#endif
+    r = PyType_Ready(t);
+#if PY_VERSION_HEX >= 0x03050000 && !defined(PYSTON_MAJOR_VERSION)
+        t->tp_flags &= ~Py_TPFLAGS_HEAPTYPE;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        if (gc_was_enabled)
+            PyGC_Enable();
+    #else
+        if (gc_was_enabled) {
+            PyObject *tp, *v, *tb;
+            PyErr_Fetch(&tp, &v, &tb);
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_kp_u_enable);
+            if (likely(ret || r == -1)) {
+                Py_XDECREF(ret);
+                PyErr_Restore(tp, v, tb);
+            } else {
+                Py_XDECREF(tp);
+                Py_XDECREF(v);
+                Py_XDECREF(tb);
+                r = -1;
+            }
+        }
+        Py_DECREF(gc);
+    #endif
+    }
 #endif
-        "No module named '%U'", partial_name);
+    return r;
 #endif
-bad:
-    Py_XDECREF(sep);
-    Py_XDECREF(slice);
-    Py_XDECREF(partial_name);
-    return NULL;
 }
-#endif
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetName(tp);
+    PyErr_Format(PyExc_AttributeError,
 #if PY_MAJOR_VERSION >= 3
-static PyObject *__Pyx__ImportDottedModule_Lookup(PyObject *name) {
-    PyObject *imported_module;
-#if PY_VERSION_HEX < 0x030700A1 || (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400)
-    PyObject *modules = PyImport_GetModuleDict();
-    if (unlikely(!modules))
-        return NULL;
-    imported_module = __Pyx_PyDict_GetItemStr(modules, name);
-    Py_XINCREF(imported_module);
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%U'",
+                 type_name, attr_name);
 #else
-    imported_module = PyImport_GetModule(name);
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%.400s'",
+                 type_name, PyString_AS_STRING(attr_name));
 #endif
-    return imported_module;
+    __Pyx_DECREF_TypeName(type_name);
+    return NULL;
 }
-#endif
-#if PY_MAJOR_VERSION >= 3
-static PyObject *__Pyx_ImportDottedModule_WalkParts(PyObject *module, PyObject *name, PyObject *parts_tuple) {
-    Py_ssize_t i, nparts;
-    nparts = PyTuple_GET_SIZE(parts_tuple);
-    for (i=1; i < nparts && module; i++) {
-        PyObject *part, *submodule;
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        part = PyTuple_GET_ITEM(parts_tuple, i);
-#else
-        part = PySequence_ITEM(parts_tuple, i);
-#endif
-        submodule = __Pyx_PyObject_GetAttrStrNoError(module, part);
-#if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
-        Py_DECREF(part);
-#endif
-        Py_DECREF(module);
-        module = submodule;
-    }
-    if (unlikely(!module)) {
-        return __Pyx__ImportDottedModule_Error(name, parts_tuple, i);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
     }
-    return module;
-}
-#endif
-static PyObject *__Pyx__ImportDottedModule(PyObject *name, PyObject *parts_tuple) {
-#if PY_MAJOR_VERSION < 3
-    PyObject *module, *from_list, *star = __pyx_n_s__4;
-    CYTHON_UNUSED_VAR(parts_tuple);
-    from_list = PyList_New(1);
-    if (unlikely(!from_list))
-        return NULL;
-    Py_INCREF(star);
-    PyList_SET_ITEM(from_list, 0, star);
-    module = __Pyx_Import(name, from_list, 0);
-    Py_DECREF(from_list);
-    return module;
-#else
-    PyObject *imported_module;
-    PyObject *module = __Pyx_Import(name, NULL, 0);
-    if (!parts_tuple || unlikely(!module))
-        return module;
-    imported_module = __Pyx__ImportDottedModule_Lookup(name);
-    if (likely(imported_module)) {
-        Py_DECREF(module);
-        return imported_module;
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
     }
-    PyErr_Clear();
-    return __Pyx_ImportDottedModule_WalkParts(module, name, parts_tuple);
-#endif
-}
-static PyObject *__Pyx_ImportDottedModule(PyObject *name, PyObject *parts_tuple) {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030400B1
-    PyObject *module = __Pyx__ImportDottedModule_Lookup(name);
-    if (likely(module)) {
-        PyObject *spec = __Pyx_PyObject_GetAttrStrNoError(module, __pyx_n_s_spec);
-        if (likely(spec)) {
-            PyObject *unsafe = __Pyx_PyObject_GetAttrStrNoError(spec, __pyx_n_s_initializing);
-            if (likely(!unsafe || !__Pyx_PyObject_IsTrue(unsafe))) {
-                Py_DECREF(spec);
-                spec = NULL;
-            }
-            Py_XDECREF(unsafe);
-        }
-        if (likely(!spec)) {
-            PyErr_Clear();
-            return module;
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
         }
-        Py_DECREF(spec);
-        Py_DECREF(module);
-    } else if (PyErr_Occurred()) {
-        PyErr_Clear();
     }
+    return descr;
+}
 #endif
-    return __Pyx__ImportDottedModule(name, parts_tuple);
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
 }
+#endif
 
-/* FixUpExtensionType */
-#if CYTHON_USE_TYPE_SPECS
-static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
-#if PY_VERSION_HEX > 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
-    CYTHON_UNUSED_VAR(spec);
-    CYTHON_UNUSED_VAR(type);
+/* SetupReduce */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStrNoError(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
 #else
-    const PyType_Slot *slot = spec->slots;
-    while (slot && slot->slot && slot->slot != Py_tp_members)
-        slot++;
-    if (slot && slot->slot == Py_tp_members) {
-        int changed = 0;
-#if !(PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON)
-        const
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
 #endif
-            PyMemberDef *memb = (PyMemberDef*) slot->pfunc;
-        while (memb && memb->name) {
-            if (memb->name[0] == '_' && memb->name[1] == '_') {
-#if PY_VERSION_HEX < 0x030900b1
-                if (strcmp(memb->name, "__weaklistoffset__") == 0) {
-                    assert(memb->type == T_PYSSIZET);
-                    assert(memb->flags == READONLY);
-                    type->tp_weaklistoffset = memb->offset;
-                    changed = 1;
-                }
-                else if (strcmp(memb->name, "__dictoffset__") == 0) {
-                    assert(memb->type == T_PYSSIZET);
-                    assert(memb->flags == READONLY);
-                    type->tp_dictoffset = memb->offset;
-                    changed = 1;
-                }
-#if CYTHON_METH_FASTCALL
-                else if (strcmp(memb->name, "__vectorcalloffset__") == 0) {
-                    assert(memb->type == T_PYSSIZET);
-                    assert(memb->flags == READONLY);
-#if PY_VERSION_HEX >= 0x030800b4
-                    type->tp_vectorcall_offset = memb->offset;
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
 #else
-                    type->tp_print = (printfunc) memb->offset;
-#endif
-                    changed = 1;
-                }
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
 #endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #else
-                if ((0));
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #endif
-#if PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON
-                else if (strcmp(memb->name, "__module__") == 0) {
-                    PyObject *descr;
-                    assert(memb->type == T_OBJECT);
-                    assert(memb->flags == 0 || memb->flags == READONLY);
-                    descr = PyDescr_NewMember(type, memb);
-                    if (unlikely(!descr))
-                        return -1;
-                    if (unlikely(PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr) < 0)) {
-                        Py_DECREF(descr);
-                        return -1;
-                    }
-                    Py_DECREF(descr);
-                    changed = 1;
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
                 }
-#endif
             }
-            memb++;
+            PyType_Modified((PyTypeObject*)type_obj);
         }
-        if (changed)
-            PyType_Modified(type);
     }
-#endif
-    return 0;
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred()) {
+        __Pyx_TypeName type_obj_name =
+            __Pyx_PyType_GetName((PyTypeObject*)type_obj);
+        PyErr_Format(PyExc_RuntimeError,
+            "Unable to initialize pickling for " __Pyx_FMT_TYPENAME, type_obj_name);
+        __Pyx_DECREF_TypeName(type_obj_name);
+    }
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
 }
 #endif
 
@@ -14072,353 +17275,66 @@ static PyTypeObject __pyx_CyFunctionType_type = {
 #if __PYX_NEED_TP_PRINT_SLOT
     0,
 #endif
-#if PY_VERSION_HEX >= 0x030C0000
-    0,
-#endif
-#if PY_VERSION_HEX >= 0x030d00A4
-    0,
-#endif
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
-    0,
-#endif
-};
-#endif
-static int __pyx_CyFunction_init(PyObject *module) {
-#if CYTHON_USE_TYPE_SPECS
-    __pyx_CyFunctionType = __Pyx_FetchCommonTypeFromSpec(module, &__pyx_CyFunctionType_spec, NULL);
-#else
-    CYTHON_UNUSED_VAR(module);
-    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
-#endif
-    if (unlikely(__pyx_CyFunctionType == NULL)) {
-        return -1;
-    }
-    return 0;
-}
-static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->defaults = PyObject_Malloc(size);
-    if (unlikely(!m->defaults))
-        return PyErr_NoMemory();
-    memset(m->defaults, 0, size);
-    m->defaults_pyobjects = pyobjects;
-    m->defaults_size = size;
-    return m->defaults;
-}
-static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->defaults_tuple = tuple;
-    Py_INCREF(tuple);
-}
-static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->defaults_kwdict = dict;
-    Py_INCREF(dict);
-}
-static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->func_annotations = dict;
-    Py_INCREF(dict);
-}
-
-/* CythonFunction */
-static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
-                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
-    PyObject *op = __Pyx_CyFunction_Init(
-        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
-        ml, flags, qualname, closure, module, globals, code
-    );
-    if (likely(op)) {
-        PyObject_GC_Track(op);
-    }
-    return op;
-}
-
-/* CalculateMetaclass */
-static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
-    Py_ssize_t i, nbases;
-#if CYTHON_ASSUME_SAFE_MACROS
-    nbases = PyTuple_GET_SIZE(bases);
-#else
-    nbases = PyTuple_Size(bases);
-    if (nbases < 0) return NULL;
-#endif
-    for (i=0; i < nbases; i++) {
-        PyTypeObject *tmptype;
-#if CYTHON_ASSUME_SAFE_MACROS
-        PyObject *tmp = PyTuple_GET_ITEM(bases, i);
-#else
-        PyObject *tmp = PyTuple_GetItem(bases, i);
-        if (!tmp) return NULL;
-#endif
-        tmptype = Py_TYPE(tmp);
-#if PY_MAJOR_VERSION < 3
-        if (tmptype == &PyClass_Type)
-            continue;
-#endif
-        if (!metaclass) {
-            metaclass = tmptype;
-            continue;
-        }
-        if (PyType_IsSubtype(metaclass, tmptype))
-            continue;
-        if (PyType_IsSubtype(tmptype, metaclass)) {
-            metaclass = tmptype;
-            continue;
-        }
-        PyErr_SetString(PyExc_TypeError,
-                        "metaclass conflict: "
-                        "the metaclass of a derived class "
-                        "must be a (non-strict) subclass "
-                        "of the metaclasses of all its bases");
-        return NULL;
-    }
-    if (!metaclass) {
-#if PY_MAJOR_VERSION < 3
-        metaclass = &PyClass_Type;
-#else
-        metaclass = &PyType_Type;
-#endif
-    }
-    Py_INCREF((PyObject*) metaclass);
-    return (PyObject*) metaclass;
-}
-
-/* PyObjectCall2Args */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
-    PyObject *args[3] = {NULL, arg1, arg2};
-    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
-}
-
-/* PyObjectLookupSpecial */
-#if CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx__PyObject_LookupSpecial(PyObject* obj, PyObject* attr_name, int with_error) {
-    PyObject *res;
-    PyTypeObject *tp = Py_TYPE(obj);
-#if PY_MAJOR_VERSION < 3
-    if (unlikely(PyInstance_Check(obj)))
-        return with_error ? __Pyx_PyObject_GetAttrStr(obj, attr_name) : __Pyx_PyObject_GetAttrStrNoError(obj, attr_name);
-#endif
-    res = _PyType_Lookup(tp, attr_name);
-    if (likely(res)) {
-        descrgetfunc f = Py_TYPE(res)->tp_descr_get;
-        if (!f) {
-            Py_INCREF(res);
-        } else {
-            res = f(res, obj, (PyObject *)tp);
-        }
-    } else if (with_error) {
-        PyErr_SetObject(PyExc_AttributeError, attr_name);
-    }
-    return res;
-}
-#endif
-
-/* Py3ClassCreate */
-static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
-                                           PyObject *qualname, PyObject *mkw, PyObject *modname, PyObject *doc) {
-    PyObject *ns;
-    if (metaclass) {
-        PyObject *prep = __Pyx_PyObject_GetAttrStrNoError(metaclass, __pyx_n_s_prepare);
-        if (prep) {
-            PyObject *pargs[3] = {NULL, name, bases};
-            ns = __Pyx_PyObject_FastCallDict(prep, pargs+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, mkw);
-            Py_DECREF(prep);
-        } else {
-            if (unlikely(PyErr_Occurred()))
-                return NULL;
-            ns = PyDict_New();
-        }
-    } else {
-        ns = PyDict_New();
-    }
-    if (unlikely(!ns))
-        return NULL;
-    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_module, modname) < 0)) goto bad;
-#if PY_VERSION_HEX >= 0x03030000
-    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_qualname, qualname) < 0)) goto bad;
-#else
-    CYTHON_MAYBE_UNUSED_VAR(qualname);
-#endif
-    if (unlikely(doc && PyObject_SetItem(ns, __pyx_n_s_doc, doc) < 0)) goto bad;
-    return ns;
-bad:
-    Py_DECREF(ns);
-    return NULL;
-}
-#if PY_VERSION_HEX < 0x030600A4 && CYTHON_PEP487_INIT_SUBCLASS
-static int __Pyx_SetNamesPEP487(PyObject *type_obj) {
-    PyTypeObject *type = (PyTypeObject*) type_obj;
-    PyObject *names_to_set, *key, *value, *set_name, *tmp;
-    Py_ssize_t i = 0;
-#if CYTHON_USE_TYPE_SLOTS
-    names_to_set = PyDict_Copy(type->tp_dict);
-#else
-    {
-        PyObject *d = PyObject_GetAttr(type_obj, __pyx_n_s_dict);
-        names_to_set = NULL;
-        if (likely(d)) {
-            PyObject *names_to_set = PyDict_New();
-            int ret = likely(names_to_set) ? PyDict_Update(names_to_set, d) : -1;
-            Py_DECREF(d);
-            if (unlikely(ret < 0))
-                Py_CLEAR(names_to_set);
-        }
-    }
-#endif
-    if (unlikely(names_to_set == NULL))
-        goto bad;
-    while (PyDict_Next(names_to_set, &i, &key, &value)) {
-        set_name = __Pyx_PyObject_LookupSpecialNoError(value, __pyx_n_s_set_name);
-        if (unlikely(set_name != NULL)) {
-            tmp = __Pyx_PyObject_Call2Args(set_name, type_obj, key);
-            Py_DECREF(set_name);
-            if (unlikely(tmp == NULL)) {
-                __Pyx_TypeName value_type_name =
-                    __Pyx_PyType_GetName(Py_TYPE(value));
-                __Pyx_TypeName type_name = __Pyx_PyType_GetName(type);
-                PyErr_Format(PyExc_RuntimeError,
-#if PY_MAJOR_VERSION >= 3
-                    "Error calling __set_name__ on '" __Pyx_FMT_TYPENAME "' instance %R " "in '" __Pyx_FMT_TYPENAME "'",
-                    value_type_name, key, type_name);
-#else
-                    "Error calling __set_name__ on '" __Pyx_FMT_TYPENAME "' instance %.100s in '" __Pyx_FMT_TYPENAME "'",
-                    value_type_name,
-                    PyString_Check(key) ? PyString_AS_STRING(key) : "?",
-                    type_name);
-#endif
-                goto bad;
-            } else {
-                Py_DECREF(tmp);
-            }
-        }
-        else if (unlikely(PyErr_Occurred())) {
-            goto bad;
-        }
-    }
-    Py_DECREF(names_to_set);
-    return 0;
-bad:
-    Py_XDECREF(names_to_set);
-    return -1;
-}
-static PyObject *__Pyx_InitSubclassPEP487(PyObject *type_obj, PyObject *mkw) {
-#if CYTHON_USE_TYPE_SLOTS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    PyTypeObject *type = (PyTypeObject*) type_obj;
-    PyObject *mro = type->tp_mro;
-    Py_ssize_t i, nbases;
-    if (unlikely(!mro)) goto done;
-    (void) &__Pyx_GetBuiltinName;
-    Py_INCREF(mro);
-    nbases = PyTuple_GET_SIZE(mro);
-    assert(PyTuple_GET_ITEM(mro, 0) == type_obj);
-    for (i = 1; i < nbases-1; i++) {
-        PyObject *base, *dict, *meth;
-        base = PyTuple_GET_ITEM(mro, i);
-        dict = ((PyTypeObject *)base)->tp_dict;
-        meth = __Pyx_PyDict_GetItemStrWithError(dict, __pyx_n_s_init_subclass);
-        if (unlikely(meth)) {
-            descrgetfunc f = Py_TYPE(meth)->tp_descr_get;
-            PyObject *res;
-            Py_INCREF(meth);
-            if (likely(f)) {
-                res = f(meth, NULL, type_obj);
-                Py_DECREF(meth);
-                if (unlikely(!res)) goto bad;
-                meth = res;
-            }
-            res = __Pyx_PyObject_FastCallDict(meth, NULL, 0, mkw);
-            Py_DECREF(meth);
-            if (unlikely(!res)) goto bad;
-            Py_DECREF(res);
-            goto done;
-        } else if (unlikely(PyErr_Occurred())) {
-            goto bad;
-        }
-    }
-done:
-    Py_XDECREF(mro);
-    return type_obj;
-bad:
-    Py_XDECREF(mro);
-    Py_DECREF(type_obj);
-    return NULL;
-#else
-    PyObject *super_type, *super, *func, *res;
-#if CYTHON_COMPILING_IN_PYPY && !defined(PySuper_Type)
-    super_type = __Pyx_GetBuiltinName(__pyx_n_s_super);
-#else
-    super_type = (PyObject*) &PySuper_Type;
-    (void) &__Pyx_GetBuiltinName;
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
 #endif
-    super = likely(super_type) ? __Pyx_PyObject_Call2Args(super_type, type_obj, type_obj) : NULL;
-#if CYTHON_COMPILING_IN_PYPY && !defined(PySuper_Type)
-    Py_XDECREF(super_type);
+#if PY_VERSION_HEX >= 0x030d00A4
+    0,
 #endif
-    if (unlikely(!super)) {
-        Py_CLEAR(type_obj);
-        goto done;
-    }
-    func = __Pyx_PyObject_GetAttrStrNoError(super, __pyx_n_s_init_subclass);
-    Py_DECREF(super);
-    if (likely(!func)) {
-        if (unlikely(PyErr_Occurred()))
-            Py_CLEAR(type_obj);
-        goto done;
-    }
-    res = __Pyx_PyObject_FastCallDict(func, NULL, 0, mkw);
-    Py_DECREF(func);
-    if (unlikely(!res))
-        Py_CLEAR(type_obj);
-    Py_XDECREF(res);
-done:
-    return type_obj;
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
 #endif
-}
+};
 #endif
-static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases,
-                                      PyObject *dict, PyObject *mkw,
-                                      int calculate_metaclass, int allow_py2_metaclass) {
-    PyObject *result;
-    PyObject *owned_metaclass = NULL;
-    PyObject *margs[4] = {NULL, name, bases, dict};
-    if (allow_py2_metaclass) {
-        owned_metaclass = PyObject_GetItem(dict, __pyx_n_s_metaclass);
-        if (owned_metaclass) {
-            metaclass = owned_metaclass;
-        } else if (likely(PyErr_ExceptionMatches(PyExc_KeyError))) {
-            PyErr_Clear();
-        } else {
-            return NULL;
-        }
-    }
-    if (calculate_metaclass && (!metaclass || PyType_Check(metaclass))) {
-        metaclass = __Pyx_CalculateMetaclass((PyTypeObject*) metaclass, bases);
-        Py_XDECREF(owned_metaclass);
-        if (unlikely(!metaclass))
-            return NULL;
-        owned_metaclass = metaclass;
-    }
-    result = __Pyx_PyObject_FastCallDict(metaclass, margs+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET,
-#if PY_VERSION_HEX < 0x030600A4
-        (metaclass == (PyObject*)&PyType_Type) ? NULL : mkw
+static int __pyx_CyFunction_init(PyObject *module) {
+#if CYTHON_USE_TYPE_SPECS
+    __pyx_CyFunctionType = __Pyx_FetchCommonTypeFromSpec(module, &__pyx_CyFunctionType_spec, NULL);
 #else
-        mkw
+    CYTHON_UNUSED_VAR(module);
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
 #endif
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
     );
-    Py_XDECREF(owned_metaclass);
-#if PY_VERSION_HEX < 0x030600A4 && CYTHON_PEP487_INIT_SUBCLASS
-    if (likely(result) && likely(PyType_Check(result))) {
-        if (unlikely(__Pyx_SetNamesPEP487(result) < 0)) {
-            Py_CLEAR(result);
-        } else {
-            result = __Pyx_InitSubclassPEP487(result, mkw);
-        }
+    if (likely(op)) {
+        PyObject_GC_Track(op);
     }
-#else
-    (void) &__Pyx_GetBuiltinName;
-#endif
-    return result;
+    return op;
 }
 
 /* CLineInTraceback */
@@ -14738,93 +17654,6 @@ bad:
 }
 #endif
 
-/* FormatTypeName */
-#if CYTHON_COMPILING_IN_LIMITED_API
-static __Pyx_TypeName
-__Pyx_PyType_GetName(PyTypeObject* tp)
-{
-    PyObject *name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
-                                               __pyx_n_s_name);
-    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
-        PyErr_Clear();
-        Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__36);
-    }
-    return name;
-}
-#endif
-
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        unsigned char *bytes = (unsigned char *)&value;
-#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
-        if (is_unsigned) {
-            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
-        } else {
-            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
-        }
-#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-#else
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        PyObject *from_bytes, *result = NULL;
-        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
-        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
-        if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
-        if (!py_bytes) goto limited_bad;
-        order_str = PyUnicode_FromString(little ? "little" : "big");
-        if (!order_str) goto limited_bad;
-        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
-        if (!arg_tuple) goto limited_bad;
-        if (!is_unsigned) {
-            kwds = PyDict_New();
-            if (!kwds) goto limited_bad;
-            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
-        }
-        result = PyObject_Call(from_bytes, arg_tuple, kwds);
-        limited_bad:
-        Py_XDECREF(kwds);
-        Py_XDECREF(arg_tuple);
-        Py_XDECREF(order_str);
-        Py_XDECREF(py_bytes);
-        Py_XDECREF(from_bytes);
-        return result;
-#endif
-    }
-}
-
 /* CIntFromPyVerify */
 #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
@@ -15114,6 +17943,93 @@ raise_neg_overflow:
     return (long) -1;
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* FormatTypeName */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static __Pyx_TypeName
+__Pyx_PyType_GetName(PyTypeObject* tp)
+{
+    PyObject *name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_n_s_name);
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
+        PyErr_Clear();
+        Py_XDECREF(name);
+        name = __Pyx_NewRef(__pyx_n_s__36);
+    }
+    return name;
+}
+#endif
+
 /* CIntFromPy */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -15544,6 +18460,39 @@ static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt
     }
 }
 
+/* FunctionExport */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(__pyx_m, (char *)"__pyx_capi__");
+    if (!d) {
+        PyErr_Clear();
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        Py_INCREF(d);
+        if (PyModule_AddObject(__pyx_m, (char *)"__pyx_capi__", d) < 0)
+            goto bad;
+    }
+    tmp.fp = f;
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(d, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    Py_XDECREF(d);
+    return -1;
+}
+
 /* InitStrings */
 #if PY_MAJOR_VERSION >= 3
 static int __Pyx_InitString(__Pyx_StringTabEntry t, PyObject **str) {
@@ -0,0 +1,160 @@
+# cython: language_level=3, cdivision=True
+"""
+C-level interface of `Dual_c` for other Cython extensions.
+
+``dual_t`` is a plain C struct holding a dual number, and every operator
+and elementary function of `Dual_c` is available as an inline ``nogil``
+function on it. Code that cimports this file does dual-number arithmetic
+at C speed, with no Python objects created in its inner loops; `as_dual`
+and `from_dual` convert to and from `Dual_c` at the boundary.
+
+The inline functions do not check their domains: dividing by zero or
+taking the logarithm of a non-positive number gives IEEE infinities and
+NaNs rather than raising, as there is no Python error state to raise into
+without the GIL. Check the operands first if that matters.
+
+Examples
+--------
+.. code-block:: cython
+
+    from DualNum_c.Dual_c cimport dual_t, make_dual, dual_mul, dual_sin
+
+    cdef double derivative(double x) noexcept nogil:
+        cdef dual_t u = make_dual(x, 1.0)
+        return dual_mul(dual_sin(u), u).dual
+"""
+from libc.math cimport sin, cos, tan, exp, log, sqrt, sinh, cosh, tanh, asin, acos, atan, pow
+
+
+ctypedef struct dual_t:
+    double real
+    double dual
+
+
+cdef class Dual_c:
+    cdef readonly double real
+    cdef readonly double dual
+
+
+cdef Dual_c from_dual(dual_t x)
+
+
+cdef inline dual_t make_dual(double real, double dual) noexcept nogil:
+    cdef dual_t result
+    result.real = real
+    result.dual = dual
+    return result
+
+
+cdef inline dual_t as_dual(Dual_c x) noexcept:
+    return make_dual(x.real, x.dual)
+
+
+# Arithmetic: dual op dual, and the scalar forms of Dual_c's reflected operators
+cdef inline dual_t dual_add(dual_t a, dual_t b) noexcept nogil:
+    return make_dual(a.real + b.real, a.dual + b.dual)
+
+cdef inline dual_t dual_add_scalar(dual_t a, double c) noexcept nogil:
+    return make_dual(a.real + c, a.dual)
+
+cdef inline dual_t dual_sub(dual_t a, dual_t b) noexcept nogil:
+    return make_dual(a.real - b.real, a.dual - b.dual)
+
+cdef inline dual_t dual_sub_scalar(dual_t a, double c) noexcept nogil:
+    return make_dual(a.real - c, a.dual)
+
+cdef inline dual_t dual_rsub_scalar(double c, dual_t a) noexcept nogil:
+    return make_dual(c - a.real, -a.dual)
+
+cdef inline dual_t dual_mul(dual_t a, dual_t b) noexcept nogil:
+    return make_dual(a.real * b.real, a.real * b.dual + a.dual * b.real)
+
+cdef inline dual_t dual_mul_scalar(dual_t a, double c) noexcept nogil:
+    return make_dual(a.real * c, a.dual * c)
+
+cdef inline dual_t dual_div(dual_t a, dual_t b) noexcept nogil:
+    cdef double q = a.real / b.real
+    return make_dual(q, (a.dual - q * b.dual) / b.real)
+
+cdef inline dual_t dual_div_scalar(dual_t a, double c) noexcept nogil:
+    return make_dual(a.real / c, a.dual / c)
+
+cdef inline dual_t dual_rdiv_scalar(double c, dual_t a) noexcept nogil:
+    cdef double q = c / a.real
+    return make_dual(q, -q * a.dual / a.real)
+
+cdef inline dual_t dual_pow(dual_t a, dual_t b) noexcept nogil:
+    cdef double p = pow(a.real, b.real)
+    return make_dual(p, p * (b.dual * log(a.real) + b.real * a.dual / a.real))
+
+cdef inline double int_pow(double x, long n) noexcept nogil:
+    # Repeated squaring: about log2(|n|) multiplications instead of a pow() call
+    cdef unsigned long m = <unsigned long>(-n) if n < 0 else <unsigned long>n
+    cdef double result = 1.0
+    while m:
+        if m & 1:
+            result *= x
+        x *= x
+        m >>= 1
+    return 1.0 / result if n < 0 else result
+
+cdef inline dual_t dual_pow_int(dual_t a, long n) noexcept nogil:
+    if n == 0:
+        return make_dual(1.0, 0.0)
+    cdef double p = int_pow(a.real, n - 1)
+    return make_dual(p * a.real, n * p * a.dual)
+
+cdef inline dual_t dual_pow_scalar(dual_t a, double c) noexcept nogil:
+    cdef double p = pow(a.real, c)
+    if a.real == 0:
+        return make_dual(p, c * pow(a.real, c - 1) * a.dual)
+    return make_dual(p, c * p / a.real * a.dual)
+
+cdef inline dual_t dual_rpow_scalar(double c, dual_t a) noexcept nogil:
+    cdef double p = pow(c, a.real)
+    return make_dual(p, p * log(c) * a.dual)
+
+cdef inline bint dual_eq(dual_t a, dual_t b) noexcept nogil:
+    return a.real == b.real and a.dual == b.dual
+
+
+# Elementary functions
+cdef inline dual_t dual_sin(dual_t a) noexcept nogil:
+    return make_dual(sin(a.real), a.dual * cos(a.real))
+
+cdef inline dual_t dual_cos(dual_t a) noexcept nogil:
+    return make_dual(cos(a.real), -a.dual * sin(a.real))
+
+cdef inline dual_t dual_tan(dual_t a) noexcept nogil:
+    cdef double t = tan(a.real)
+    return make_dual(t, a.dual * (1 + t * t))
+
+cdef inline dual_t dual_exp(dual_t a) noexcept nogil:
+    cdef double e = exp(a.real)
+    return make_dual(e, a.dual * e)
+
+cdef inline dual_t dual_log(dual_t a) noexcept nogil:
+    return make_dual(log(a.real), a.dual / a.real)
+
+cdef inline dual_t dual_sqrt(dual_t a) noexcept nogil:
+    cdef double s = sqrt(a.real)
+    return make_dual(s, a.dual / (2 * s))
+
+cdef inline dual_t dual_sinh(dual_t a) noexcept nogil:
+    return make_dual(sinh(a.real), a.dual * cosh(a.real))
+
+cdef inline dual_t dual_cosh(dual_t a) noexcept nogil:
+    return make_dual(cosh(a.real), a.dual * sinh(a.real))
+
+cdef inline dual_t dual_tanh(dual_t a) noexcept nogil:
+    cdef double c = cosh(a.real)
+    return make_dual(tanh(a.real), a.dual / (c * c))
+
+cdef inline dual_t dual_asin(dual_t a) noexcept nogil:
+    return make_dual(asin(a.real), a.dual / sqrt(1 - a.real * a.real))
+
+cdef inline dual_t dual_acos(dual_t a) noexcept nogil:
+    return make_dual(acos(a.real), -a.dual / sqrt(1 - a.real * a.real))
+
+cdef inline dual_t dual_atan(dual_t a) noexcept nogil:
+    return make_dual(atan(a.real), a.dual / (1 + a.real * a.real))
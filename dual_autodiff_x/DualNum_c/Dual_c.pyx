@@ -1,14 +1,98 @@
-import math
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
 
-class Dual_c:
+cimport cython
+from cpython.long cimport PyLong_AsLongAndOverflow
+from libc.limits cimport LONG_MAX
+from libc.math cimport fabs, floor
+
+from time import perf_counter_ns
+
+
+# Instrumentation state, driven by DualNum.Profiler through _set_profiler.
+# While no profiler is installed every primitive pays a single test of the
+# C flag _profiling; while one is installed the outermost primitive call is
+# timed and the objects built by _new during it are counted.
+cdef bint _profiling = False
+cdef bint _counting = False
+cdef object _profiler = None
+cdef Py_ssize_t _constructed = 0
+
+
+def _set_profiler(profiler):
+    """
+    Installs the profiler notified of every primitive call, or removes it if None.
+    """
+    global _profiler, _profiling, _counting
+    _profiler = profiler
+    _profiling = _counting = profiler is not None
+
+
+cdef object _profiled(str name, object method, tuple args):
+    """
+    Calls a primitive with profiling suspended and reports its time and allocations.
+    """
+    global _profiling, _constructed
+    _profiling = False
+    _constructed = 0
+    start = perf_counter_ns()
+    try:
+        return method(*args)
+    finally:
+        elapsed = perf_counter_ns() - start
+        _profiling = True
+        _profiler._record("Dual_c", name, elapsed, _constructed)
+
+
+cdef inline Dual_c _new(double real, double dual):
+    """
+    Builds a Dual_c without going through __init__ (no type checks).
+    """
+    global _constructed
+    cdef Dual_c result = Dual_c.__new__(Dual_c)
+    result.real = real
+    result.dual = dual
+    if _counting:
+        _constructed += 1
+    return result
+
+
+cdef inline Dual_c _box(dual_t x):
+    """
+    Builds a Dual_c holding a C dual number.
+    """
+    return _new(x.real, x.dual)
+
+
+cdef Dual_c from_dual(dual_t x):
+    """
+    Returns a Dual_c holding a C dual number; part of the C-level interface in Dual_c.pxd.
+    """
+    return _box(x)
+
+
+cdef Dual_c _pow_int(Dual_c x, long n):
+    """
+    Returns x ** n for an integer n.
+    """
+    if n < 0 and x.real == 0:
+        raise ZeroDivisionError("division by zero is undefined")
+    return _box(dual_pow_int(as_dual(x), n))
+
+
+@cython.freelist(64)
+cdef class Dual_c:
     """
     A class to represent a dual number for use in automatic differentiation.
-    
+
+    The real and dual parts are stored as C doubles and every operation is
+    evaluated with ``libc.math``, so no Python-level arithmetic is involved
+    once the operands have been unboxed.
+
     Attributes
     ----------
     real : float
         The real part of the dual number.
-        
+
     dual : float
         The dual part of the dual number.
 
@@ -19,19 +103,22 @@ class Dual_c:
     >>> z = x.sin() + y.log()
     >>> z
     Dual(real=2.0079097154937915, dual=-0.4161468365471424)
+
+    The struct, attributes and inline functions behind these methods are
+    declared in ``Dual_c.pxd`` for other Cython extensions to cimport.
     """
 
     # Special Methods
     def __init__(self, real, dual):
         """
         Constructs all the necessary attributes for the Dual object.
-        
+
         Parameters
         ----------
-        
+
         real : float
             The real part of the dual number.
-        
+
         dual : float
             The dual part of the dual number.
 
@@ -42,153 +129,291 @@ class Dual_c:
         """
         if not isinstance(real, (float, int)):
             raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
-    
+
         if not isinstance(dual, (float, int)):
             raise TypeError(f"Expected 'dual' to be of type float or int, got {type(dual).__name__} instead.")
-    
+
         self.real = real
         self.dual = dual
-    
-    def __add__(self, other):
+
+    def __add__(Dual_c self, other):
         """
         Adds a dual number and another dual number or scalar.
 
         Parameters
         ----------
-        other : Dual, int, or float
+        other : Dual_c, int, or float
             The value to add to the current dual number.
         """
+        if _profiling:
+            return _profiled("__add__", Dual_c.__add__, (self, other))
+        cdef Dual_c o
         if isinstance(other, Dual_c):
-            return Dual_c(self.real + other.real, self.dual + other.dual)
+            o = <Dual_c>other
+            return _box(dual_add(as_dual(self), as_dual(o)))
         if isinstance(other, (float, int)):
-            return Dual_c(self.real + other, self.dual)
-        raise TypeError("unsupported operand type(s) for +: '{}' and '{}'".format(type(self), type(other)))
-    
-    def __radd__(self, other):
+            return _box(dual_add_scalar(as_dual(self), other))
+        return NotImplemented
+
+    def __radd__(Dual_c self, other):
         """
         Adds a dual number and another dual number or scalar.
 
         Parameters
         ----------
-        other : Dual, int, or float
+        other : Dual_c, int, or float
             The value to add to the current dual number.
         """
+        if _profiling:
+            return _profiled("__radd__", Dual_c.__radd__, (self, other))
         return self.__add__(other)
-    
-    def __sub__(self, other):
+
+    def __sub__(Dual_c self, other):
         """
         Subtracts one dual number from another dual or int/float.
 
         Parameters
         ----------
-        other : Dual, int, or float
+        other : Dual_c, int, or float
             The value to subtract from the current dual number.
         """
+        if _profiling:
+            return _profiled("__sub__", Dual_c.__sub__, (self, other))
+        cdef Dual_c o
         if isinstance(other, Dual_c):
-            return Dual_c(self.real - other.real, self.dual - other.dual)
+            o = <Dual_c>other
+            return _box(dual_sub(as_dual(self), as_dual(o)))
         if isinstance(other, (float, int)):
-            return Dual_c(self.real - other, self.dual)
-        raise TypeError("unsupported operand type(s) for -: '{}' and '{}'".format(type(self), type(other)))
-    
-    def __rsub__(self, other):
+            return _box(dual_sub_scalar(as_dual(self), other))
+        return NotImplemented
+
+    def __rsub__(Dual_c self, other):
         """
-        Subtracts one dual number from another dual or int/float.
+        Subtracts the dual number from an int/float.
 
         Parameters
         ----------
-        other : Dual, int, or float
-            The value to subtract from the current dual number.
+        other : int, or float
+            The value the current dual number is subtracted from.
         """
-        return self.__sub__(other)
-    
-    def __mul__(self, other):
+        if _profiling:
+            return _profiled("__rsub__", Dual_c.__rsub__, (self, other))
+        if isinstance(other, (float, int)):
+            return _box(dual_rsub_scalar(other, as_dual(self)))
+        return NotImplemented
+
+    def __mul__(Dual_c self, other):
         """
         Multiplies a dual number with another dual number or an int/float.
 
         Parameters
         ----------
-        other : Dual, int, or float
+        other : Dual_c, int, or float
             The value to multiply with the current dual number.
         """
+        if _profiling:
+            return _profiled("__mul__", Dual_c.__mul__, (self, other))
+        cdef Dual_c o
+        cdef double c
         if isinstance(other, Dual_c):
-            return Dual_c(self.real * other.real, self.real * other.dual + self.dual * other.real)
+            o = <Dual_c>other
+            return _box(dual_mul(as_dual(self), as_dual(o)))
         if isinstance(other, (float, int)):
-            return Dual_c(self.real * other, self.dual * other)
-        raise TypeError("unsupported operand type(s) for *: '{}' and '{}'".format(type(self), type(other)))
-    
-    def __rmul__(self, other):
+            c = other
+            return _box(dual_mul_scalar(as_dual(self), c))
+        return NotImplemented
+
+    def __rmul__(Dual_c self, other):
         """
         Multiplies a dual number with another dual number or an int/float.
 
         Parameters
         ----------
-        other : Dual, int, or float
+        other : Dual_c, int, or float
             The value to multiply with the current dual number.
         """
+        if _profiling:
+            return _profiled("__rmul__", Dual_c.__rmul__, (self, other))
         return self.__mul__(other)
-    
-    def __truediv__(self, other):
+
+    def __truediv__(Dual_c self, other):
         """
         Divides one dual number by another dual number or an int/float.
 
         Parameters
         ----------
-        other : Dual, int, or float
+        other : Dual_c, int, or float
             The value to divide the current dual number by.
         """
-        if other.real == 0:
-            raise ZeroDivisionError("division by zero is undefined")
+        if _profiling:
+            return _profiled("__truediv__", Dual_c.__truediv__, (self, other))
+        cdef Dual_c o
+        cdef double c
         if isinstance(other, Dual_c):
-            return Dual_c(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real ** 2))
+            o = <Dual_c>other
+            if o.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return _box(dual_div(as_dual(self), as_dual(o)))
         if isinstance(other, (float, int)):
-            return Dual_c(self.real / other, self.dual / other)
-        raise TypeError("unsupported operand type(s) for /: '{}' and '{}'".format(type(self), type(other)))
-    
-    def __rtruediv__(self, other):
+            c = other
+            if c == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return _box(dual_div_scalar(as_dual(self), c))
+        return NotImplemented
+
+    def __rtruediv__(Dual_c self, other):
         """
-        Divides one dual number by another dual number or an int/float.
+        Divides an int/float by the dual number.
 
         Parameters
         ----------
-        other : Dual, int, or float
-            The value to divide the current dual number by.
+        other : int, or float
+            The value to divide by the current dual number.
         """
-        return self.__truediv__(other)
-    
-    def __pow__(self, other):
+        if _profiling:
+            return _profiled("__rtruediv__", Dual_c.__rtruediv__, (self, other))
+        cdef double c
+        if isinstance(other, (float, int)):
+            if self.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            c = other
+            return _box(dual_rdiv_scalar(c, as_dual(self)))
+        return NotImplemented
+
+    def __pow__(Dual_c self, other, modulo=None):
         """
-        Raises the dual number to the power of another dual number.
+        Raises the dual number to the power of another dual number or an int/float.
+
+        A constant exponent (or a dual one with zero dual part) uses
+        ``n * x ** (n - 1)`` without a logarithm, with integer powers
+        computed by repeated squaring, so negative bases are accepted with
+        integer exponents.
 
         Parameters
         ----------
-        other : Dual
-            The dual number to raise the current dual number to the power of.
-        """
+        other : Dual_c, int, or float
+            The exponent.
+
+        Raises
+        ------
+        ValueError
+            If a negative base is raised to a non-integer power, or a
+            non-positive base to a dual exponent with a non-zero dual part.
+
+        ZeroDivisionError
+            If zero is raised to a negative power, or to a non-integer power
+            below 1 (where the derivative is infinite).
+        """
+        if _profiling:
+            return _profiled("__pow__", Dual_c.__pow__, (self, other))
+        cdef Dual_c o
+        cdef double c
+        cdef long n
+        cdef int overflow
         if isinstance(other, Dual_c):
-            return Dual_c(self.real ** other.real, self.real ** other.real * (other.dual * math.log(self.real) + other.real * self.dual / self.real))
-        raise TypeError("unsupported operand type(s) for **: '{}' and '{}'".format(type(self), type(other)))
+            o = <Dual_c>other
+            if o.dual != 0:
+                if self.real <= 0:
+                    raise ValueError("math domain error")
+                return _box(dual_pow(as_dual(self), as_dual(o)))
+            c = o.real
+        elif isinstance(other, int):
+            n = PyLong_AsLongAndOverflow(other, &overflow)
+            if not overflow:
+                return _pow_int(self, n)
+            c = other
+        elif isinstance(other, float):
+            c = other
+        else:
+            return NotImplemented
+        if self.real <= 0:
+            if c == floor(c) and -<double>LONG_MAX < c < <double>LONG_MAX:
+                return _pow_int(self, <long>c)
+            if self.real < 0 and c != floor(c):
+                raise ValueError("math domain error")
+            if self.real == 0 and c < 1:
+                raise ZeroDivisionError("division by zero is undefined")
+        return _box(dual_pow_scalar(as_dual(self), c))
 
-    def __eq__(self, other):
+    def __rpow__(Dual_c self, other, modulo=None):
+        """
+        Raises an int/float to the power of the dual number.
+
+        Parameters
+        ----------
+        other : int, or float
+            The base, which must be positive.
+
+        Raises
+        ------
+        ValueError
+            If the base is not positive.
+        """
+        if _profiling:
+            return _profiled("__rpow__", Dual_c.__rpow__, (self, other))
+        cdef double c
+        if isinstance(other, (float, int)):
+            c = other
+            if c <= 0:
+                raise ValueError("math domain error")
+            return _box(dual_rpow_scalar(c, as_dual(self)))
+        return NotImplemented
+
+    def __eq__(Dual_c self, other):
         """
         Checks if two dual numbers are equal.
 
         Parameters
         ----------
-        other : Dual
+        other : Dual_c
             The dual number to compare with the current dual number.
         """
+        cdef Dual_c o
         if isinstance(other, Dual_c):
-            return self.real == other.real and self.dual == other.dual
+            o = <Dual_c>other
+            return dual_eq(as_dual(self), as_dual(o))
         return False
-    
 
+    def __ne__(Dual_c self, other):
+        """
+        Checks if two dual numbers differ.
+
+        Parameters
+        ----------
+        other : Dual_c
+            The dual number to compare with the current dual number.
+        """
+        return not self.__eq__(other)
 
     def __repr__(self):
         """
         Returns a string representation of the dual number.
         """
         return f'Dual(real={self.real}, dual={self.dual})'
-    
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Implements NumPy ufuncs (``np.sin``, ``np.add``, ...) with the
+        dual-number methods, returning a ``DualNum.DualArray`` when an
+        operand is an array. Needs the DualNum package.
+        """
+        try:
+            from DualNum.Dual import _scalar_array_ufunc
+        except ImportError:
+            return NotImplemented
+        return _scalar_array_ufunc(Dual_c, ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Implements the NumPy functions supported by ``DualNum.DualArray``
+        (``np.sum``, ``np.dot``, ``np.where``, ...). Needs the DualNum package.
+        """
+        try:
+            from DualNum.Dual import _scalar_array_function
+        except ImportError:
+            return NotImplemented
+        return _scalar_array_function(Dual_c, func, args, kwargs)
+
 
     # Class Methods
     def get_real(self):
@@ -207,76 +432,112 @@ class Dual_c:
         """
         Returns the sine of the dual number.
         """
-        return Dual_c(math.sin(self.real), self.dual * math.cos(self.real))
-    
+        if _profiling:
+            return _profiled("sin", Dual_c.sin, (self,))
+        return _box(dual_sin(as_dual(self)))
+
     def cos(self):
         """
         Returns the cosine of the dual number.
         """
-        return Dual_c(math.cos(self.real), -self.dual * math.sin(self.real))
-    
+        if _profiling:
+            return _profiled("cos", Dual_c.cos, (self,))
+        return _box(dual_cos(as_dual(self)))
+
     def tan(self):
         """
         Returns the tangent of the dual number.
         """
-        return Dual_c(math.tan(self.real), self.dual / (math.cos(self.real) ** 2))
-    
+        if _profiling:
+            return _profiled("tan", Dual_c.tan, (self,))
+        return _box(dual_tan(as_dual(self)))
+
     def exp(self):
         """
         Returns the exponential of the dual number.
         """
-        return Dual_c(math.exp(self.real), self.dual * math.exp(self.real))
-    
+        if _profiling:
+            return _profiled("exp", Dual_c.exp, (self,))
+        return _box(dual_exp(as_dual(self)))
+
     def log(self):
         """
         Returns the natural logarithm of the dual number.
         """
+        if _profiling:
+            return _profiled("log", Dual_c.log, (self,))
         if self.real <= 0:
             raise ValueError("Logarithm of a non-positive number is undefined.")
-        return Dual_c(math.log(self.real), self.dual / self.real)
-    
+        return _box(dual_log(as_dual(self)))
+
     def sqrt(self):
         """
         Returns the square root of the dual number.
         """
-        return Dual_c(math.sqrt(self.real), self.dual / (2 * math.sqrt(self.real)))
-    
+        if _profiling:
+            return _profiled("sqrt", Dual_c.sqrt, (self,))
+        if self.real < 0:
+            raise ValueError("math domain error")
+        if self.real == 0:
+            raise ZeroDivisionError("division by zero is undefined")
+        return _box(dual_sqrt(as_dual(self)))
+
     def sinh(self):
         """
         Returns the hyperbolic sine of the dual number.
         """
-        return Dual_c(math.sinh(self.real), self.dual * math.cosh(self.real))
+        if _profiling:
+            return _profiled("sinh", Dual_c.sinh, (self,))
+        return _box(dual_sinh(as_dual(self)))
 
     def cosh(self):
         """
         Returns the hyperbolic cosine of the dual number.
         """
-        return Dual_c(math.cosh(self.real), self.dual * math.sinh(self.real))
-    
+        if _profiling:
+            return _profiled("cosh", Dual_c.cosh, (self,))
+        return _box(dual_cosh(as_dual(self)))
+
     def tanh(self):
         """
         Returns the hyperbolic tangent of the dual number.
         """
-        return Dual_c(math.tanh(self.real), self.dual / (math.cosh(self.real) ** 2))
-    
+        if _profiling:
+            return _profiled("tanh", Dual_c.tanh, (self,))
+        return _box(dual_tanh(as_dual(self)))
+
     def asin(self):
         """
         Returns the arcsine of the dual number.
         """
-        return Dual_c(math.asin(self.real), self.dual / math.sqrt(1 - self.real ** 2))
-    
+        if _profiling:
+            return _profiled("asin", Dual_c.asin, (self,))
+        if self.real < -1 or self.real > 1:
+            raise ValueError("math domain error")
+        if fabs(self.real) == 1:
+            raise ZeroDivisionError("division by zero is undefined")
+        return _box(dual_asin(as_dual(self)))
+
     def acos(self):
         """
         Returns the arccosine of the dual number.
         """
-        return Dual_c(math.acos(self.real), -self.dual / math.sqrt(1 - self.real ** 2))
-    
+        if _profiling:
+            return _profiled("acos", Dual_c.acos, (self,))
+        if self.real < -1 or self.real > 1:
+            raise ValueError("math domain error")
+        if fabs(self.real) == 1:
+            raise ZeroDivisionError("division by zero is undefined")
+        return _box(dual_acos(as_dual(self)))
+
     def atan(self):
         """
         Returns the arctangent of the dual number.
         """
-        return Dual_c(math.atan(self.real), self.dual / (1 + self.real ** 2))
-    
+        if _profiling:
+            return _profiled("atan", Dual_c.atan, (self,))
+        return _box(dual_atan(as_dual(self)))
+
 
 
 def compute_derivative(func, x, dual_class):
@@ -287,10 +548,10 @@ def compute_derivative(func, x, dual_class):
     ----------
     func : function
         The function to compute the derivative of.
-    
+
     x : float
         The point at which to compute the derivative.
-    
+
     dual_class : Dual or Dual_c
         The class to use for dual numbers.
 
@@ -303,7 +564,7 @@ def compute_derivative(func, x, dual_class):
     --------
     >>> def f(x):
     ...     return x ** 2
-    >>> compute_derivative(f, 2, Dual_c)
+    >>> compute_derivative(f, 2, Dual)
     4.0
     """
-    return func(dual_class(x, 1)).dual
\ No newline at end of file
+    return func(dual_class(x, 1)).dual
@@ -0,0 +1,731 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Elementwise dual-number kernels over (real, dual) buffers.
+
+Every operator and elementary function of `Dual_c` is available as a
+function taking the real and dual parts of its operands as 1-D buffers
+(NumPy arrays, ``array.array``, ...) of float32, float64 or long double.
+Every kernel is compiled for each of the three precisions, and operands
+are promoted to a common one as NumPy arrays are: to the widest of their
+dtypes, with integers counting as float64. The loops release the GIL and
+run in parallel with OpenMP once the buffers hold at least
+`get_serial_threshold` elements; smaller inputs stay on the calling thread,
+where starting a thread team would cost more than it saves.
+
+Binary kernels broadcast an operand of length 1 against the other, and
+write into ``out_real``/``out_dual`` when given, otherwise into new
+buffers of the operands' precision (``array.array('f')`` or
+``array.array('d')``, NumPy arrays for long double). Every kernel returns
+``(out_real, out_dual)``.
+
+Examples
+--------
+>>> import numpy as np
+>>> from DualNum_c import Kernels_c
+>>> x = np.linspace(0.1, 1.0, 1_000_000)
+>>> real, dual = Kernels_c.sin(x, np.ones_like(x))
+>>> real, dual = Kernels_c.mul(real, dual, x, np.ones_like(x))
+>>> real, dual = Kernels_c.sin(x.astype(np.float32), np.ones(x.size, np.float32))  # single precision
+"""
+cimport cython
+from cpython cimport array
+from cpython.buffer cimport PyBUF_FORMAT, PyBuffer_Release, PyObject_GetBuffer
+from cython.parallel cimport prange
+from libc cimport math as cmath
+
+import array
+import os
+
+cdef extern from *:
+    """
+    #ifdef _OPENMP
+    #define DUALNUM_OPENMP 1
+    #else
+    #define DUALNUM_OPENMP 0
+    #endif
+    """
+    int DUALNUM_OPENMP
+
+cdef extern from *:
+    """
+    /* Sine and cosine of the same argument in one call where the compiler provides it */
+    #if defined(__GNUC__)
+    #define DUALNUM_SINCOS(x, s, c) __builtin_sincos(x, s, c)
+    #define DUALNUM_SINCOSF(x, s, c) __builtin_sincosf(x, s, c)
+    #define DUALNUM_SINCOSL(x, s, c) __builtin_sincosl(x, s, c)
+    #else
+    #define DUALNUM_SINCOS(x, s, c) (*(s) = sin(x), *(c) = cos(x))
+    #define DUALNUM_SINCOSF(x, s, c) (*(s) = sinf(x), *(c) = cosf(x))
+    #define DUALNUM_SINCOSL(x, s, c) (*(s) = sinl(x), *(c) = cosl(x))
+    #endif
+    """
+    void DUALNUM_SINCOS(double x, double* s, double* c) noexcept nogil
+    void DUALNUM_SINCOSF(float x, float* s, float* c) noexcept nogil
+    void DUALNUM_SINCOSL(long double x, long double* s, long double* c) noexcept nogil
+
+#: Whether the extension was compiled with OpenMP; without it every kernel runs serially.
+OPENMP = bool(DUALNUM_OPENMP)
+
+cdef array.array _FLOAT_TEMPLATE = array.array('f')
+cdef array.array _DOUBLE_TEMPLATE = array.array('d')
+
+ctypedef fused real_t:
+    float
+    double
+    long double
+
+# Error flags or-ed together by the kernels and raised once the loop is done.
+cdef enum:
+    _ZERO_DIVISION = 1
+    _LOG_DOMAIN = 2
+    _MATH_DOMAIN = 4
+
+# Kernel codes. The loops switch on them per element; the switch is loop
+# invariant, so the compiler hoists it out of the loop.
+cdef enum:
+    _ADD, _SUB, _MUL, _TRUEDIV, _POW
+    _SIN, _COS, _TAN, _EXP, _LOG, _SQRT, _SINH, _COSH, _TANH, _ASIN, _ACOS, _ATAN
+
+
+def _default_threads():
+    """
+    Returns ``$OMP_NUM_THREADS`` if set, otherwise the number of CPUs.
+    """
+    value = os.environ.get("OMP_NUM_THREADS", "")
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return os.cpu_count() or 1
+
+
+cdef int _num_threads = _default_threads()
+cdef Py_ssize_t _serial_threshold = 1 << 15
+
+
+def set_num_threads(int n):
+    """
+    Sets the number of threads used by the parallel kernels.
+
+    Parameters
+    ----------
+    n : int
+        The number of threads, or 0 for ``$OMP_NUM_THREADS`` or all CPUs.
+    """
+    global _num_threads
+    if n < 0:
+        raise ValueError(f"Expected a non-negative number of threads, got {n} instead.")
+    _num_threads = n if n > 0 else _default_threads()
+
+
+def get_num_threads():
+    """
+    Returns the number of threads used by the parallel kernels.
+    """
+    return _num_threads
+
+
+def set_serial_threshold(Py_ssize_t n):
+    """
+    Sets the buffer length below which the kernels run on the calling thread only.
+
+    Parameters
+    ----------
+    n : int
+        The threshold; 0 parallelises every call.
+    """
+    global _serial_threshold
+    if n < 0:
+        raise ValueError(f"Expected a non-negative threshold, got {n} instead.")
+    _serial_threshold = n
+
+
+def get_serial_threshold():
+    """
+    Returns the buffer length below which the kernels run on the calling thread only.
+    """
+    return _serial_threshold
+
+
+cdef inline int _threads_for(Py_ssize_t n):
+    """
+    Returns the number of threads to use for n elements.
+    """
+    return 1 if n < _serial_threshold else _num_threads
+
+
+cdef char _format(object x):
+    """
+    Returns the buffer format of x if it is a single character, otherwise 0.
+    """
+    cdef Py_buffer view
+    cdef char code = 0
+    try:
+        PyObject_GetBuffer(x, &view, PyBUF_FORMAT)
+    except (TypeError, BufferError):
+        return 0
+    if view.format != NULL and view.format[0] != 0 and view.format[1] == 0:
+        code = view.format[0]
+    PyBuffer_Release(&view)
+    return code
+
+
+cdef tuple _promote(tuple operands):
+    """
+    Returns the buffer format ('f', 'd' or 'g') of the precision the
+    operands are computed in, and the operands converted to it.
+    """
+    cdef char code = _format(operands[0])
+    for x in operands[1:]:
+        if _format(x) != code:
+            code = 0
+            break
+    if code == b'd':
+        return "d", operands
+    if code == b'f':
+        return "f", operands
+    if code == b'g':
+        return "g", operands
+    # Mixed or non-float operands: promote them as NumPy does
+    import numpy as np
+    arrays = [np.asarray(x) for x in operands]
+    dtype = np.result_type(*arrays)
+    if dtype.kind != "f":
+        dtype = np.dtype(np.float64)
+    elif dtype.itemsize < 4:
+        dtype = np.dtype(np.float32)
+    return dtype.char, tuple(np.ascontiguousarray(a, dtype=dtype) for a in arrays)
+
+
+cdef object _output(object out, Py_ssize_t n, str fmt):
+    """
+    Returns ``out``, or a new uninitialised buffer of n numbers of the given format if it is None.
+    """
+    if out is not None:
+        return out
+    if fmt == "f":
+        return array.clone(_FLOAT_TEMPLATE, n, zero=False)
+    if fmt == "d":
+        return array.clone(_DOUBLE_TEMPLATE, n, zero=False)
+    import numpy as np
+    return np.empty(n, dtype=np.longdouble)
+
+
+cdef void _raise(int flags) except *:
+    """
+    Raises the error recorded in the flags of a kernel, if any.
+    """
+    if flags & _ZERO_DIVISION:
+        raise ZeroDivisionError("division by zero is undefined")
+    if flags & _LOG_DOMAIN:
+        raise ValueError("Logarithm of a non-positive number is undefined.")
+    if flags & _MATH_DOMAIN:
+        raise ValueError("math domain error")
+
+
+cdef tuple _apply_unary(int op, real, dual, out_real, out_dual):
+    """
+    Applies a unary kernel elementwise in the precision of the operand.
+    """
+    fmt, (real, dual) = _promote((real, dual))
+    cdef Py_ssize_t n = len(real)
+    out_real = _output(out_real, n, fmt)
+    out_dual = _output(out_dual, n, fmt)
+    if fmt == "f":
+        _raise(_unary_loop[float](op, real, dual, out_real, out_dual))
+    elif fmt == "d":
+        _raise(_unary_loop[double](op, real, dual, out_real, out_dual))
+    else:
+        _raise(_unary_loop[cython.longdouble](op, real, dual, out_real, out_dual))
+    return out_real, out_dual
+
+
+cdef tuple _apply_binary(int op, a_real, a_dual, b_real, b_dual, out_real, out_dual):
+    """
+    Applies a binary kernel elementwise in the common precision of the operands.
+    """
+    fmt, (a_real, a_dual, b_real, b_dual) = _promote((a_real, a_dual, b_real, b_dual))
+    cdef Py_ssize_t n = len(a_real) if len(b_real) == 1 else len(b_real)
+    out_real = _output(out_real, n, fmt)
+    out_dual = _output(out_dual, n, fmt)
+    if fmt == "f":
+        _raise(_binary_loop[float](op, a_real, a_dual, b_real, b_dual, out_real, out_dual))
+    elif fmt == "d":
+        _raise(_binary_loop[double](op, a_real, a_dual, b_real, b_dual, out_real, out_dual))
+    else:
+        _raise(_binary_loop[cython.longdouble](op, a_real, a_dual, b_real, b_dual, out_real, out_dual))
+    return out_real, out_dual
+
+
+cdef int _unary_loop(int op, const real_t[::1] real, const real_t[::1] dual,
+                     real_t[::1] vr, real_t[::1] vd) except -1:
+    """
+    Applies unary kernel ``op`` elementwise and returns its error flags.
+    """
+    cdef Py_ssize_t i, n = real.shape[0]
+    if dual.shape[0] != n:
+        raise ValueError(f"real and dual parts differ in length: {n} and {dual.shape[0]}")
+    if vr.shape[0] != n or vd.shape[0] != n:
+        raise ValueError(f"Expected output buffers of length {n}.")
+    cdef int flags = 0
+    cdef int threads = _threads_for(n)
+    for i in prange(n, nogil=True, schedule="static", num_threads=threads):
+        flags |= _unary(op, real[i], dual[i], &vr[i], &vd[i])
+    return flags
+
+
+cdef int _binary_loop(int op, const real_t[::1] a_real, const real_t[::1] a_dual,
+                      const real_t[::1] b_real, const real_t[::1] b_dual,
+                      real_t[::1] vr, real_t[::1] vd) except -1:
+    """
+    Applies binary kernel ``op`` elementwise, broadcasting operands of length 1, and returns its error flags.
+    """
+    cdef Py_ssize_t na = a_real.shape[0], nb = b_real.shape[0]
+    if a_dual.shape[0] != na or b_dual.shape[0] != nb:
+        raise ValueError("real and dual parts of an operand differ in length")
+    cdef Py_ssize_t i, n = na if nb == 1 else nb
+    if (na != n and na != 1) or (nb != n and nb != 1):
+        raise ValueError(f"operands could not be broadcast together: {na} and {nb}")
+    cdef Py_ssize_t sa = na != 1, sb = nb != 1
+    if vr.shape[0] != n or vd.shape[0] != n:
+        raise ValueError(f"Expected output buffers of length {n}.")
+    cdef int flags = 0
+    cdef int threads = _threads_for(n)
+    for i in prange(n, nogil=True, schedule="static", num_threads=threads):
+        flags |= _binary(op, a_real[i * sa], a_dual[i * sa], b_real[i * sb], b_dual[i * sb], &vr[i], &vd[i])
+    return flags
+
+
+cdef inline int _unary(int op, real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    if op == _SIN:
+        return _sin(r, d, vr, vd)
+    if op == _COS:
+        return _cos(r, d, vr, vd)
+    if op == _TAN:
+        return _tan(r, d, vr, vd)
+    if op == _EXP:
+        return _exp(r, d, vr, vd)
+    if op == _LOG:
+        return _log(r, d, vr, vd)
+    if op == _SQRT:
+        return _sqrt(r, d, vr, vd)
+    if op == _SINH:
+        return _sinh(r, d, vr, vd)
+    if op == _COSH:
+        return _cosh(r, d, vr, vd)
+    if op == _TANH:
+        return _tanh(r, d, vr, vd)
+    if op == _ASIN:
+        return _asin(r, d, vr, vd)
+    if op == _ACOS:
+        return _acos(r, d, vr, vd)
+    return _atan(r, d, vr, vd)
+
+
+cdef inline int _binary(int op, real_t ar, real_t ad, real_t br, real_t bd, real_t* vr, real_t* vd) noexcept nogil:
+    if op == _ADD:
+        return _add(ar, ad, br, bd, vr, vd)
+    if op == _SUB:
+        return _sub(ar, ad, br, bd, vr, vd)
+    if op == _MUL:
+        return _mul(ar, ad, br, bd, vr, vd)
+    if op == _TRUEDIV:
+        return _truediv(ar, ad, br, bd, vr, vd)
+    return _pow(ar, ad, br, bd, vr, vd)
+
+
+# The C math library function of the precision of real_t.
+cdef inline real_t _m_sin(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.sinf(x)
+    elif real_t is double:
+        return cmath.sin(x)
+    else:
+        return cmath.sinl(x)
+
+cdef inline void _m_sincos(real_t x, real_t* s, real_t* c) noexcept nogil:
+    if real_t is float:
+        DUALNUM_SINCOSF(x, s, c)
+    elif real_t is double:
+        DUALNUM_SINCOS(x, s, c)
+    else:
+        DUALNUM_SINCOSL(x, s, c)
+
+cdef inline real_t _m_cos(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.cosf(x)
+    elif real_t is double:
+        return cmath.cos(x)
+    else:
+        return cmath.cosl(x)
+
+cdef inline real_t _m_tan(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.tanf(x)
+    elif real_t is double:
+        return cmath.tan(x)
+    else:
+        return cmath.tanl(x)
+
+cdef inline real_t _m_exp(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.expf(x)
+    elif real_t is double:
+        return cmath.exp(x)
+    else:
+        return cmath.expl(x)
+
+cdef inline real_t _m_log(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.logf(x)
+    elif real_t is double:
+        return cmath.log(x)
+    else:
+        return cmath.logl(x)
+
+cdef inline real_t _m_sqrt(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.sqrtf(x)
+    elif real_t is double:
+        return cmath.sqrt(x)
+    else:
+        return cmath.sqrtl(x)
+
+cdef inline real_t _m_sinh(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.sinhf(x)
+    elif real_t is double:
+        return cmath.sinh(x)
+    else:
+        return cmath.sinhl(x)
+
+cdef inline real_t _m_cosh(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.coshf(x)
+    elif real_t is double:
+        return cmath.cosh(x)
+    else:
+        return cmath.coshl(x)
+
+cdef inline real_t _m_tanh(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.tanhf(x)
+    elif real_t is double:
+        return cmath.tanh(x)
+    else:
+        return cmath.tanhl(x)
+
+cdef inline real_t _m_asin(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.asinf(x)
+    elif real_t is double:
+        return cmath.asin(x)
+    else:
+        return cmath.asinl(x)
+
+cdef inline real_t _m_acos(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.acosf(x)
+    elif real_t is double:
+        return cmath.acos(x)
+    else:
+        return cmath.acosl(x)
+
+cdef inline real_t _m_atan(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.atanf(x)
+    elif real_t is double:
+        return cmath.atan(x)
+    else:
+        return cmath.atanl(x)
+
+cdef inline real_t _m_pow(real_t x, real_t y) noexcept nogil:
+    if real_t is float:
+        return cmath.powf(x, y)
+    elif real_t is double:
+        return cmath.pow(x, y)
+    else:
+        return cmath.powl(x, y)
+
+cdef inline real_t _m_floor(real_t x) noexcept nogil:
+    if real_t is float:
+        return cmath.floorf(x)
+    elif real_t is double:
+        return cmath.floor(x)
+    else:
+        return cmath.floorl(x)
+
+
+# Per-element kernels: write f(a) (or f(a, b)) to (vr, vd) and return error flags.
+cdef inline int _add(real_t ar, real_t ad, real_t br, real_t bd, real_t* vr, real_t* vd) noexcept nogil:
+    vr[0] = ar + br
+    vd[0] = ad + bd
+    return 0
+
+cdef inline int _sub(real_t ar, real_t ad, real_t br, real_t bd, real_t* vr, real_t* vd) noexcept nogil:
+    vr[0] = ar - br
+    vd[0] = ad - bd
+    return 0
+
+cdef inline int _mul(real_t ar, real_t ad, real_t br, real_t bd, real_t* vr, real_t* vd) noexcept nogil:
+    vr[0] = ar * br
+    vd[0] = ad * br + ar * bd
+    return 0
+
+cdef inline int _truediv(real_t ar, real_t ad, real_t br, real_t bd, real_t* vr, real_t* vd) noexcept nogil:
+    if br == 0:
+        vr[0] = vd[0] = cmath.NAN
+        return _ZERO_DIVISION
+    vr[0] = ar / br
+    vd[0] = (ad * br - ar * bd) / (br * br)
+    return 0
+
+cdef inline int _pow(real_t ar, real_t ad, real_t br, real_t bd, real_t* vr, real_t* vd) noexcept nogil:
+    cdef real_t p
+    if bd != 0:
+        # A varying exponent differentiates through log(a), which needs a positive base
+        if ar <= 0:
+            vr[0] = vd[0] = cmath.NAN
+            return _MATH_DOMAIN
+        p = _m_pow(ar, br)
+        vr[0] = p
+        vd[0] = p * (bd * _m_log(ar) + br * ad / ar)
+        return 0
+    # A constant exponent takes the power rule, as in Dual.__pow__
+    if br == 0:
+        vr[0] = 1
+        vd[0] = 0
+        return 0
+    if ar < 0 and br != _m_floor(br):
+        vr[0] = vd[0] = cmath.NAN
+        return _MATH_DOMAIN
+    if ar == 0:
+        if br < 0 or (br < 1 and br != _m_floor(br)):
+            vr[0] = vd[0] = cmath.NAN
+            return _ZERO_DIVISION
+        vr[0] = 0
+        vd[0] = br * _m_pow(ar, br - 1) * ad
+        return 0
+    p = _m_pow(ar, br)
+    vr[0] = p
+    vd[0] = p * (br * ad / ar)
+    return 0
+
+cdef inline int _sin(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    cdef real_t s, c
+    _m_sincos(r, &s, &c)
+    vr[0] = s
+    vd[0] = d * c
+    return 0
+
+cdef inline int _cos(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    cdef real_t s, c
+    _m_sincos(r, &s, &c)
+    vr[0] = c
+    vd[0] = -d * s
+    return 0
+
+cdef inline int _tan(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    cdef real_t c = _m_cos(r)
+    vr[0] = _m_tan(r)
+    vd[0] = d / (c * c)
+    return 0
+
+cdef inline int _exp(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    cdef real_t e = _m_exp(r)
+    vr[0] = e
+    vd[0] = d * e
+    return 0
+
+cdef inline int _log(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    if r <= 0:
+        vr[0] = vd[0] = cmath.NAN
+        return _LOG_DOMAIN
+    vr[0] = _m_log(r)
+    vd[0] = d / r
+    return 0
+
+cdef inline int _sqrt(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    if r < 0:
+        vr[0] = vd[0] = cmath.NAN
+        return _MATH_DOMAIN
+    cdef real_t s = _m_sqrt(r)
+    vr[0] = s
+    vd[0] = d / (2 * s)
+    return 0
+
+cdef inline int _sinh(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    vr[0] = _m_sinh(r)
+    vd[0] = d * _m_cosh(r)
+    return 0
+
+cdef inline int _cosh(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    vr[0] = _m_cosh(r)
+    vd[0] = d * _m_sinh(r)
+    return 0
+
+cdef inline int _tanh(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    cdef real_t c = _m_cosh(r)
+    vr[0] = _m_tanh(r)
+    vd[0] = d / (c * c)
+    return 0
+
+cdef inline int _asin(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    if r < -1 or r > 1:
+        vr[0] = vd[0] = cmath.NAN
+        return _MATH_DOMAIN
+    vr[0] = _m_asin(r)
+    vd[0] = d / _m_sqrt(1 - r * r)
+    return 0
+
+cdef inline int _acos(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    if r < -1 or r > 1:
+        vr[0] = vd[0] = cmath.NAN
+        return _MATH_DOMAIN
+    vr[0] = _m_acos(r)
+    vd[0] = -d / _m_sqrt(1 - r * r)
+    return 0
+
+cdef inline int _atan(real_t r, real_t d, real_t* vr, real_t* vd) noexcept nogil:
+    vr[0] = _m_atan(r)
+    vd[0] = d / (1 + r * r)
+    return 0
+
+
+# Public kernels
+def add(a_real, a_dual, b_real, b_dual, out_real=None, out_dual=None):
+    """
+    Elementwise a + b of dual buffers.
+    """
+    return _apply_binary(_ADD, a_real, a_dual, b_real, b_dual, out_real, out_dual)
+
+def sub(a_real, a_dual, b_real, b_dual, out_real=None, out_dual=None):
+    """
+    Elementwise a - b of dual buffers.
+    """
+    return _apply_binary(_SUB, a_real, a_dual, b_real, b_dual, out_real, out_dual)
+
+def mul(a_real, a_dual, b_real, b_dual, out_real=None, out_dual=None):
+    """
+    Elementwise a * b of dual buffers.
+    """
+    return _apply_binary(_MUL, a_real, a_dual, b_real, b_dual, out_real, out_dual)
+
+def truediv(a_real, a_dual, b_real, b_dual, out_real=None, out_dual=None):
+    """
+    Elementwise a / b of dual buffers.
+
+    Raises
+    ------
+    ZeroDivisionError
+        If any element of b has a zero real part.
+    """
+    return _apply_binary(_TRUEDIV, a_real, a_dual, b_real, b_dual, out_real, out_dual)
+
+def pow(a_real, a_dual, b_real, b_dual, out_real=None, out_dual=None):
+    """
+    Elementwise a ** b of dual buffers.
+
+    As for `Dual`, where b's dual part is zero the exponent is a constant
+    and the power rule applies, so negative bases take integer exponents.
+
+    Raises
+    ------
+    ValueError
+        If a negative base has a non-integer exponent, or a non-positive
+        base an exponent with a non-zero dual part.
+
+    ZeroDivisionError
+        If a zero base has a negative exponent, or a non-integer one below 1.
+    """
+    return _apply_binary(_POW, a_real, a_dual, b_real, b_dual, out_real, out_dual)
+
+def sin(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise sine of a dual buffer.
+    """
+    return _apply_unary(_SIN, real, dual, out_real, out_dual)
+
+def cos(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise cosine of a dual buffer.
+    """
+    return _apply_unary(_COS, real, dual, out_real, out_dual)
+
+def tan(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise tangent of a dual buffer.
+    """
+    return _apply_unary(_TAN, real, dual, out_real, out_dual)
+
+def exp(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise exponential of a dual buffer.
+    """
+    return _apply_unary(_EXP, real, dual, out_real, out_dual)
+
+def log(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise natural logarithm of a dual buffer.
+
+    Raises
+    ------
+    ValueError
+        If any element has a non-positive real part.
+    """
+    return _apply_unary(_LOG, real, dual, out_real, out_dual)
+
+def sqrt(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise square root of a dual buffer.
+
+    Raises
+    ------
+    ValueError
+        If any element has a negative real part.
+    """
+    return _apply_unary(_SQRT, real, dual, out_real, out_dual)
+
+def sinh(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise hyperbolic sine of a dual buffer.
+    """
+    return _apply_unary(_SINH, real, dual, out_real, out_dual)
+
+def cosh(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise hyperbolic cosine of a dual buffer.
+    """
+    return _apply_unary(_COSH, real, dual, out_real, out_dual)
+
+def tanh(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise hyperbolic tangent of a dual buffer.
+    """
+    return _apply_unary(_TANH, real, dual, out_real, out_dual)
+
+def asin(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise arcsine of a dual buffer.
+
+    Raises
+    ------
+    ValueError
+        If any element has a real part outside [-1, 1].
+    """
+    return _apply_unary(_ASIN, real, dual, out_real, out_dual)
+
+def acos(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise arccosine of a dual buffer.
+
+    Raises
+    ------
+    ValueError
+        If any element has a real part outside [-1, 1].
+    """
+    return _apply_unary(_ACOS, real, dual, out_real, out_dual)
+
+def atan(real, dual, out_real=None, out_dual=None):
+    """
+    Elementwise arctangent of a dual buffer.
+    """
+    return _apply_unary(_ATAN, real, dual, out_real, out_dual)
@@ -0,0 +1,424 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+
+cimport cython
+from cpython cimport array
+from libc.math cimport sin, cos, tan, exp, log, sqrt, sinh, cosh, tanh, asin, acos, atan, pow, floor
+
+import array
+
+cdef array.array _TEMPLATE = array.array('d')
+
+
+cdef inline MultiDual_c _new(double real, Py_ssize_t n):
+    """
+    Builds a MultiDual_c with an uninitialised tangent of length n.
+    """
+    cdef MultiDual_c result = MultiDual_c.__new__(MultiDual_c)
+    result.real = real
+    result._dual = array.clone(_TEMPLATE, n, zero=False)
+    result._d = result._dual.data.as_doubles
+    result.n = n
+    return result
+
+
+cdef inline MultiDual_c _scale(MultiDual_c x, double value, double derivative):
+    """
+    Returns f(x) given f(x.real) and f'(x.real): every tangent component is scaled.
+    """
+    cdef MultiDual_c result = _new(value, x.n)
+    cdef Py_ssize_t i
+    for i in range(x.n):
+        result._d[i] = derivative * x._d[i]
+    return result
+
+
+cdef inline MultiDual_c _combine(double value, double ca, MultiDual_c a, double cb, MultiDual_c b):
+    """
+    Returns a result whose tangent is ca * a.dual + cb * b.dual.
+    """
+    if a.n != b.n:
+        raise ValueError(f"tangent lengths differ: {a.n} and {b.n}")
+    cdef MultiDual_c result = _new(value, a.n)
+    cdef Py_ssize_t i
+    for i in range(a.n):
+        result._d[i] = ca * a._d[i] + cb * b._d[i]
+    return result
+
+
+@cython.freelist(64)
+cdef class MultiDual_c:
+    """
+    A class to represent a dual number with several tangent components.
+
+    Compiled counterpart of `MultiDual`: the real part is a C double and the
+    tangent a contiguous buffer of C doubles updated with plain C loops.
+
+    Attributes
+    ----------
+    real : float
+        The real part of the dual number.
+
+    dual : array.array
+        A copy of the tangent components of the dual number.
+
+    Examples
+    --------
+    >>> x = MultiDual_c(2, [1, 0])
+    >>> y = MultiDual_c(3, [0, 1])
+    >>> z = x * y + x.sin()
+    >>> list(z.dual)
+    [2.5838531634528574, 2.0]
+    """
+
+    cdef readonly double real
+    cdef array.array _dual
+    cdef double* _d
+    cdef readonly Py_ssize_t n
+
+    # Special Methods
+    def __init__(self, real, dual):
+        """
+        Constructs all the necessary attributes for the MultiDual_c object.
+
+        Parameters
+        ----------
+        real : float
+            The real part of the dual number.
+
+        dual : sequence of float
+            The tangent components of the dual number.
+
+        Raises
+        ------
+        TypeError
+            If 'real' is not of type float or int.
+        """
+        if not isinstance(real, (float, int)):
+            raise TypeError(f"Expected 'real' to be of type float or int, got {type(real).__name__} instead.")
+
+        self.real = real
+        self._dual = array.array('d', dual)
+        self._d = self._dual.data.as_doubles
+        self.n = len(self._dual)
+
+    @property
+    def dual(self):
+        """
+        A copy of the tangent components of the dual number.
+        """
+        return array.copy(self._dual)
+
+    def __add__(MultiDual_c self, other):
+        """
+        Adds a multi-dual number and another multi-dual number or scalar.
+
+        Parameters
+        ----------
+        other : MultiDual_c, int, or float
+            The value to add to the current multi-dual number.
+        """
+        cdef MultiDual_c o
+        if isinstance(other, MultiDual_c):
+            o = <MultiDual_c>other
+            return _combine(self.real + o.real, 1.0, self, 1.0, o)
+        if isinstance(other, (float, int)):
+            return _scale(self, self.real + <double>other, 1.0)
+        return NotImplemented
+
+    def __radd__(MultiDual_c self, other):
+        """
+        Adds a multi-dual number and another multi-dual number or scalar.
+
+        Parameters
+        ----------
+        other : MultiDual_c, int, or float
+            The value to add to the current multi-dual number.
+        """
+        return self.__add__(other)
+
+    def __sub__(MultiDual_c self, other):
+        """
+        Subtracts a multi-dual number or scalar from the multi-dual number.
+
+        Parameters
+        ----------
+        other : MultiDual_c, int, or float
+            The value to subtract from the current multi-dual number.
+        """
+        cdef MultiDual_c o
+        if isinstance(other, MultiDual_c):
+            o = <MultiDual_c>other
+            return _combine(self.real - o.real, 1.0, self, -1.0, o)
+        if isinstance(other, (float, int)):
+            return _scale(self, self.real - <double>other, 1.0)
+        return NotImplemented
+
+    def __rsub__(MultiDual_c self, other):
+        """
+        Subtracts the multi-dual number from an int/float.
+
+        Parameters
+        ----------
+        other : int, or float
+            The value the current multi-dual number is subtracted from.
+        """
+        if isinstance(other, (float, int)):
+            return _scale(self, <double>other - self.real, -1.0)
+        return NotImplemented
+
+    def __mul__(MultiDual_c self, other):
+        """
+        Multiplies a multi-dual number with another multi-dual number or an int/float.
+
+        Parameters
+        ----------
+        other : MultiDual_c, int, or float
+            The value to multiply with the current multi-dual number.
+        """
+        cdef MultiDual_c o
+        cdef double c
+        if isinstance(other, MultiDual_c):
+            o = <MultiDual_c>other
+            return _combine(self.real * o.real, o.real, self, self.real, o)
+        if isinstance(other, (float, int)):
+            c = other
+            return _scale(self, self.real * c, c)
+        return NotImplemented
+
+    def __rmul__(MultiDual_c self, other):
+        """
+        Multiplies a multi-dual number with another multi-dual number or an int/float.
+
+        Parameters
+        ----------
+        other : MultiDual_c, int, or float
+            The value to multiply with the current multi-dual number.
+        """
+        return self.__mul__(other)
+
+    def __truediv__(MultiDual_c self, other):
+        """
+        Divides the multi-dual number by another multi-dual number or an int/float.
+
+        Parameters
+        ----------
+        other : MultiDual_c, int, or float
+            The value to divide the current multi-dual number by.
+        """
+        cdef MultiDual_c o
+        cdef double c
+        if isinstance(other, MultiDual_c):
+            o = <MultiDual_c>other
+            if o.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return _combine(self.real / o.real, 1.0 / o.real, self, -self.real / (o.real * o.real), o)
+        if isinstance(other, (float, int)):
+            c = other
+            if c == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            return _scale(self, self.real / c, 1.0 / c)
+        return NotImplemented
+
+    def __rtruediv__(MultiDual_c self, other):
+        """
+        Divides an int/float by the multi-dual number.
+
+        Parameters
+        ----------
+        other : int, or float
+            The value to divide by the current multi-dual number.
+        """
+        cdef double c
+        if isinstance(other, (float, int)):
+            if self.real == 0:
+                raise ZeroDivisionError("division by zero is undefined")
+            c = other
+            return _scale(self, c / self.real, -c / (self.real * self.real))
+        return NotImplemented
+
+    def __pow__(MultiDual_c self, other, modulo=None):
+        """
+        Raises the multi-dual number to the power of another multi-dual number or an int/float.
+
+        As for `MultiDual`, a constant exponent (or a multi-dual one whose
+        tangent is zero) uses ``n * x ** (n - 1)`` without a logarithm.
+
+        Parameters
+        ----------
+        other : MultiDual_c, int, or float
+            The exponent.
+
+        Raises
+        ------
+        ValueError
+            If a negative base is raised to a non-integer power.
+
+        ZeroDivisionError
+            If zero is raised to a negative power, or to a non-integer power
+            below 1 (where the derivative is infinite).
+        """
+        cdef MultiDual_c o
+        cdef double p, c
+        cdef Py_ssize_t i
+        if isinstance(other, MultiDual_c):
+            o = <MultiDual_c>other
+            if o.n != self.n:
+                raise ValueError(f"tangent lengths differ: {self.n} and {o.n}")
+            for i in range(o.n):
+                if o._d[i] != 0:
+                    if self.real <= 0:
+                        raise ValueError("math domain error")
+                    p = pow(self.real, o.real)
+                    return _combine(p, p * o.real / self.real, self, p * log(self.real), o)
+            c = o.real
+        elif isinstance(other, (float, int)):
+            c = other
+        else:
+            return NotImplemented
+        if c == 0:
+            return _scale(self, 1.0, 0.0)
+        if self.real <= 0:
+            if c != floor(c):
+                if self.real < 0:
+                    raise ValueError("math domain error")
+                if c < 1:
+                    raise ZeroDivisionError("division by zero is undefined")
+                return _scale(self, 0.0, 0.0)
+            if self.real == 0 and c < 0:
+                raise ZeroDivisionError("division by zero is undefined")
+        return _scale(self, pow(self.real, c), c * pow(self.real, c - 1))
+
+    def __eq__(MultiDual_c self, other):
+        """
+        Checks if two multi-dual numbers are equal.
+
+        Parameters
+        ----------
+        other : MultiDual_c
+            The multi-dual number to compare with the current multi-dual number.
+        """
+        cdef MultiDual_c o
+        cdef Py_ssize_t i
+        if not isinstance(other, MultiDual_c):
+            return False
+        o = <MultiDual_c>other
+        if self.real != o.real or self.n != o.n:
+            return False
+        for i in range(self.n):
+            if self._d[i] != o._d[i]:
+                return False
+        return True
+
+    def __ne__(MultiDual_c self, other):
+        """
+        Checks if two multi-dual numbers differ.
+
+        Parameters
+        ----------
+        other : MultiDual_c
+            The multi-dual number to compare with the current multi-dual number.
+        """
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the multi-dual number.
+        """
+        return f'MultiDual_c(real={self.real}, dual={list(self._dual)})'
+
+    # Class Methods
+    def get_real(self):
+        """
+        Returns the real part of the multi-dual number.
+        """
+        return self.real
+
+    def get_dual(self):
+        """
+        Returns a copy of the tangent components of the multi-dual number.
+        """
+        return self.dual
+
+    def sin(self):
+        """
+        Returns the sine of the multi-dual number.
+        """
+        return _scale(self, sin(self.real), cos(self.real))
+
+    def cos(self):
+        """
+        Returns the cosine of the multi-dual number.
+        """
+        return _scale(self, cos(self.real), -sin(self.real))
+
+    def tan(self):
+        """
+        Returns the tangent of the multi-dual number.
+        """
+        cdef double c = cos(self.real)
+        return _scale(self, tan(self.real), 1.0 / (c * c))
+
+    def exp(self):
+        """
+        Returns the exponential of the multi-dual number.
+        """
+        cdef double e = exp(self.real)
+        return _scale(self, e, e)
+
+    def log(self):
+        """
+        Returns the natural logarithm of the multi-dual number.
+        """
+        if self.real <= 0:
+            raise ValueError("Logarithm of a non-positive number is undefined.")
+        return _scale(self, log(self.real), 1.0 / self.real)
+
+    def sqrt(self):
+        """
+        Returns the square root of the multi-dual number.
+        """
+        if self.real < 0:
+            raise ValueError("math domain error")
+        cdef double s = sqrt(self.real)
+        return _scale(self, s, 1.0 / (2 * s))
+
+    def sinh(self):
+        """
+        Returns the hyperbolic sine of the multi-dual number.
+        """
+        return _scale(self, sinh(self.real), cosh(self.real))
+
+    def cosh(self):
+        """
+        Returns the hyperbolic cosine of the multi-dual number.
+        """
+        return _scale(self, cosh(self.real), sinh(self.real))
+
+    def tanh(self):
+        """
+        Returns the hyperbolic tangent of the multi-dual number.
+        """
+        cdef double c = cosh(self.real)
+        return _scale(self, tanh(self.real), 1.0 / (c * c))
+
+    def asin(self):
+        """
+        Returns the arcsine of the multi-dual number.
+        """
+        if self.real < -1 or self.real > 1:
+            raise ValueError("math domain error")
+        return _scale(self, asin(self.real), 1.0 / sqrt(1 - self.real * self.real))
+
+    def acos(self):
+        """
+        Returns the arccosine of the multi-dual number.
+        """
+        if self.real < -1 or self.real > 1:
+            raise ValueError("math domain error")
+        return _scale(self, acos(self.real), -1.0 / sqrt(1 - self.real * self.real))
+
+    def atan(self):
+        """
+        Returns the arctangent of the multi-dual number.
+        """
+        return _scale(self, atan(self.real), 1.0 / (1 + self.real * self.real))
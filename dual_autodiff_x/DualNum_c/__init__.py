@@ -1 +1,2 @@
-from .Dual_c import Dual_c
\ No newline at end of file
+from .Dual_c import Dual_c
+from .MultiDual_c import MultiDual_c
\ No newline at end of file
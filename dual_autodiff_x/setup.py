@@ -1,6 +1,7 @@
 from setuptools import setup, Extension
 from Cython.Build import cythonize
 import sysconfig
+import sys
 import os
 
 # Correctly detect Python's include directory
@@ -8,13 +9,42 @@ python_include_dir = os.path.join(
     os.path.dirname(sysconfig.get_paths()["include"]), "include"
 )
 
+
+def openmp_flags():
+    """
+    Returns the (compile, link) flags enabling OpenMP, empty if unavailable.
+
+    Apple clang ships without OpenMP, and DUALNUM_NO_OPENMP=1 opts out; the
+    parallel kernels then compile to serial loops.
+    """
+    if os.environ.get("DUALNUM_NO_OPENMP") or sys.platform == "darwin":
+        return [], []
+    if sys.platform == "win32":
+        return ["/openmp"], []
+    return ["-fopenmp"], ["-fopenmp"]
+
+
+openmp_compile_args, openmp_link_args = openmp_flags()
+
 # Define the extension module
 extensions = [
     Extension(
         "DualNum_c.Dual_c",  # Module path
         ["DualNum_c/Dual_c.pyx"],  # Source file
         include_dirs=[python_include_dir],  # Include directories
-    )
+    ),
+    Extension(
+        "DualNum_c.MultiDual_c",
+        ["DualNum_c/MultiDual_c.pyx"],
+        include_dirs=[python_include_dir],
+    ),
+    Extension(
+        "DualNum_c.Kernels_c",
+        ["DualNum_c/Kernels_c.pyx"],
+        include_dirs=[python_include_dir],
+        extra_compile_args=openmp_compile_args,
+        extra_link_args=openmp_link_args,
+    ),
 ]
 
 # Setup configuration
@@ -26,6 +56,7 @@ setup(
     ),
     packages=["DualNum_c"],  # List the package
     package_dir={"DualNum_c": "DualNum_c"},  # Ensure mapping is correct
+    package_data={"DualNum_c": ["*.pxd"]},  # Ship the C-level interface for cimport
     include_package_data=True,  # Include non-Python files
     zip_safe=False,  # Avoid zip-safe issues with .so files
 )
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+import numpy as np
+import pytest
+from DualNum import Dual, compute_derivative, compute_derivative_async
+from DualNum_c import Dual_c
+
+def f(x):
+    return x.sin() * x.exp() + x * x
+
+@pytest.mark.parametrize("cls", [Dual, Dual_c])
+def test_coroutine_results_in_input_order(cls):
+    xs = np.linspace(-1.0, 1.0, 40)
+    state = {"active": 0, "peak": 0}
+
+    async def g(x):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        # Later points finish first
+        await asyncio.sleep(0.001 * (1.0 - x.real))
+        state["active"] -= 1
+        return f(x)
+
+    values, derivatives = asyncio.run(compute_derivative_async(g, xs, cls, max_concurrency=5, return_values=True))
+    assert derivatives.tolist() == [compute_derivative(f, x, cls) for x in xs.tolist()]
+    assert values.tolist() == [f(cls(x, 1)).real for x in xs.tolist()]
+    assert state["peak"] == 5
+
+def test_sync_function_runs_on_threads():
+    threads = set()
+
+    def g(x):
+        threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return f(x)
+
+    xs = np.linspace(0.0, 1.0, 16).reshape(4, 4)
+    start = time.perf_counter()
+    derivatives = asyncio.run(compute_derivative_async(g, xs, max_concurrency=8))
+    assert time.perf_counter() - start < 0.16
+    assert derivatives.shape == (4, 4) and len(threads) > 1
+    np.testing.assert_array_equal(derivatives.ravel(), [compute_derivative(f, x, Dual) for x in xs.ravel().tolist()])
+
+    async def constant(x):
+        return 2.0
+    np.testing.assert_array_equal(asyncio.run(compute_derivative_async(constant, [1.0, 2.0])), [0.0, 0.0])
+
+def test_timeout_failure_and_cancellation_stop_pending_evaluations():
+    cancelled = []
+
+    async def g(x):
+        if x.real == 0:
+            raise ValueError("boom")
+        try:
+            await asyncio.sleep(10 if x.real >= 3 else 0.001)
+        except asyncio.CancelledError:
+            cancelled.append(x.real)
+            raise
+        return x
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(compute_derivative_async(g, [1.0, 3.0, 4.0, 2.0], max_concurrency=2, timeout=0.05))
+    assert sorted(cancelled) == [3.0, 4.0]
+
+    cancelled.clear()
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(compute_derivative_async(g, [3.0, 4.0, 0.0]))
+    assert sorted(cancelled) == [3.0, 4.0]
+
+    async def cancel_caller():
+        task = asyncio.ensure_future(compute_derivative_async(g, [3.0, 4.0, 5.0]))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    cancelled.clear()
+    asyncio.run(cancel_caller())
+    assert sorted(cancelled) == [3.0, 4.0, 5.0]
+    with pytest.raises(ValueError):
+        asyncio.run(compute_derivative_async(g, [1.0], max_concurrency=0))
@@ -0,0 +1,57 @@
+import pytest
+import copy
+import importlib.util
+import json
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location("bench_suite", os.path.join(ROOT, "benchmarks", "bench_suite.py"))
+bench_suite = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench_suite)
+
+@pytest.fixture(scope="module")
+def document():
+    return bench_suite.run(sizes=[1, 10], backends=["python", "compiled", "vectorized"], pattern="sin+log",
+                           repeat=3, min_time=0.0, verbose=False)
+
+def test_run_reports_every_backend_and_size(document):
+    ids = {result["id"] for result in document["results"]}
+    assert ids == {f"workload/sin+log/{backend}/{size}" for backend in ("python", "compiled", "vectorized") for size in (1, 10)}
+    for result in document["results"]:
+        low, high = result["ci95"]
+        assert 0 < result["ops_per_sec"] and low <= result["ops_per_sec"] <= high
+        assert result["peak_bytes"] >= 0
+    json.dumps(document)
+    assert set(bench_suite.winners(document)["workload/sin+log"]) == {1, 10}
+
+def test_every_primitive_runs_on_every_backend():
+    for backend in bench_suite.BACKENDS.values():
+        if backend.name == "native" or not backend.available():
+            continue
+        for name in bench_suite.PRIMITIVES:
+            backend.primitive(name, 3)()
+
+def test_compare_flags_regressions(document, tmp_path):
+    assert bench_suite.compare(document, document) == []
+
+    slower = copy.deepcopy(document)
+    slower["results"][0]["ops_per_sec"] *= 0.5
+    regressions = bench_suite.compare(slower, document, threshold=0.1)
+    assert [entry["id"] for entry in regressions] == [document["results"][0]["id"]]
+    assert regressions[0]["change"] == pytest.approx(-0.5)
+
+    (tmp_path / "current.json").write_text(json.dumps(slower))
+    (tmp_path / "baseline.json").write_text(json.dumps(document))
+    assert bench_suite.main(["compare", str(tmp_path / "current.json"), str(tmp_path / "baseline.json")]) == 1
+    assert bench_suite.main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "baseline.json")]) == 0
+
+def test_allocations_are_reported(document):
+    allocations = {result["backend"]: result["allocations"] for result in document["results"] if result["size"] == 10}
+    assert allocations["python"] == 30 and allocations["vectorized"] == 6
+    if "compiled" in allocations:
+        assert allocations["compiled"] == 30
+
+    workspace = bench_suite.BACKENDS["workspace"]
+    assert workspace.allocations(workspace.workload(bench_suite.WORKLOADS["composite"], 10)) == 0
+    assert workspace.allocations(workspace.primitive("pow", 10)) == 0
+    assert bench_suite.BACKENDS["kernels"].allocations(lambda: None) is None
@@ -1,7 +1,7 @@
 import pytest
-import time
-from DualNum import Dual
-from DualNum_c import Dual_c
+import numpy as np
+from DualNum import Dual, DualArray, HyperDual, HyperDualArray, KernelCache, compile_tape, trace
+from DualNum_c import Dual_c, Kernels_c
 
 def test_functional_equivalence():
     d1 = Dual(3, 2)
@@ -18,35 +18,20 @@ def test_functional_equivalence():
 
 
 def test_performance_comparison():
-    # Define a function for derivative computation
+    # Timings live in benchmarks/bench_suite.py; a single wall-clock comparison
+    # inside the test suite is too noisy to assert on.
     def f(x):
         return x.sin() + x.log()
 
     x_values = [i / 10 for i in range(1, 1000)]
 
-    # Using Dual
-    start_dual = time.time()
     derivatives_dual = [f(Dual(x, 1)).dual for x in x_values]
-    end_dual = time.time()
-
-    # Using Dual_c
-    start_dual_c = time.time()
     derivatives_dual_c = [f(Dual_c(x, 1)).dual for x in x_values]
-    end_dual_c = time.time()
 
     # Ensure results are equivalent
     for d_dual, d_dual_c in zip(derivatives_dual, derivatives_dual_c):
         assert pytest.approx(d_dual, 1e-6) == pytest.approx(d_dual_c, 1e-6)
 
-    # Compare performance
-    time_dual = end_dual - start_dual
-    time_dual_c = end_dual_c - start_dual_c
-
-    print(f"Time using Dual: {time_dual:.4f}s")
-    print(f"Time using Dual_c: {time_dual_c:.4f}s")
-    print(f"Speedup: {100 * (time_dual - time_dual_c) / time_dual:.2f}%")
-    assert time_dual_c < time_dual  # Ensure Dual_c is faster
-
 def test_stress_test():
     # Large range for derivative computation
     def f(x):
@@ -64,3 +49,77 @@ def test_stress_test():
     # Compare derivatives
     assert all(pytest.approx(d1, rel=1e-6) == d2 for d1, d2 in zip(derivatives_dual, derivatives_dual_c))
 
+
+
+# (exponent, dual part of the exponent or None for a plain constant)
+POWERS = [(2, None), (3.0, None), (0, None), (-1, None), (0.5, None), (1.5, None), (2.0, 0.0), (0.5, 0.0), (2.0, 1.0), (-1.0, 1.0)]
+
+def scalar_power(cls, exponent, e_dual):
+    """
+    Returns x -> (real, dual) of x ** exponent with a scalar dual class.
+    """
+    def evaluate(x):
+        y = cls(x, 1.0) ** (exponent if e_dual is None else cls(float(exponent), e_dual))
+        return y.real, y.dual
+    return evaluate
+
+def power_backends(exponent, e_dual):
+    """
+    Returns x -> (real, dual) of x ** exponent on the backends compared with Dual.
+    """
+    def vectorized(x):
+        y = DualArray([x], 1.0) ** (exponent if e_dual is None else DualArray([float(exponent)], e_dual))
+        return y.real[0], y.dual[0]
+
+    def hyper_vectorized(x):
+        y = HyperDualArray([x], 1.0) ** (exponent if e_dual is None else HyperDualArray([float(exponent)], e_dual))
+        return y.real[0], y.eps1[0]
+
+    def tape(x):
+        if e_dual is None:
+            values, derivatives = trace(lambda u: u ** exponent).evaluate([x])
+        else:
+            values, derivatives = trace(lambda u: u[0] ** u[1], n_inputs=2).evaluate([[x], [float(exponent)]], [1.0, e_dual])
+        return values[0], derivatives[0]
+
+    def kernels(x):
+        real, dual = Kernels_c.pow(np.array([x]), np.ones(1), np.array([float(exponent)]), np.array([e_dual or 0.0]))
+        return real[0], dual[0]
+
+    return {
+        "Dual_c": scalar_power(Dual_c, exponent, e_dual), "HyperDual": scalar_power(HyperDual, exponent, e_dual),
+        "DualArray": vectorized, "HyperDualArray": hyper_vectorized, "Tape": tape, "Kernels_c": kernels,
+    }
+
+def outcome(evaluate, x):
+    """
+    Returns the (real, dual) result of a backend, or the type of the error it raises.
+    """
+    try:
+        return tuple(float(v) for v in evaluate(x))
+    except (ValueError, ZeroDivisionError) as error:
+        return type(error)
+
+def assert_same_outcome(result, expected, name):
+    if isinstance(expected, type):
+        assert result is expected, name
+    else:
+        assert result == pytest.approx(expected, rel=1e-14), name
+
+@pytest.mark.parametrize("exponent, e_dual", POWERS)
+@pytest.mark.parametrize("x", [-2.0, 0.0, 3.0])
+def test_powers_agree_across_backends(x, exponent, e_dual):
+    # Every backend follows Dual: a constant or zero-dual exponent uses the power rule
+    expected = outcome(scalar_power(Dual, exponent, e_dual), x)
+    for name, evaluate in power_backends(exponent, e_dual).items():
+        assert_same_outcome(outcome(evaluate, x), expected, name)
+
+def test_compiled_powers_agree_with_dual(tmp_path):
+    pytest.importorskip("Cython")
+    kernel = compile_tape(trace(lambda u: u[0] ** u[1], n_inputs=2), KernelCache(str(tmp_path)))
+    for x in (-2.0, 0.0, 3.0):
+        for exponent, e_dual in POWERS:
+            e_dual = e_dual or 0.0
+            expected = outcome(scalar_power(Dual, exponent, e_dual), x)
+            result = outcome(lambda u: kernel.evaluate([u, float(exponent)], [1.0, e_dual]), x)
+            assert_same_outcome(result, expected, (x, exponent, e_dual))
@@ -0,0 +1,220 @@
+import pytest
+import numpy as np
+from DualNum import Dual, DualArray, compute_derivative, compute_derivative_batch
+import math
+
+def test_init():
+    d = DualArray([1.0, 2.0], [3.0, 4.0])
+    assert d.real.dtype == np.float64
+    assert d.real.flags["C_CONTIGUOUS"] and d.dual.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(d.real, [1.0, 2.0])
+    np.testing.assert_array_equal(d.dual, [3.0, 4.0])
+
+    # The dual part defaults to zeros and broadcasts to the real part
+    np.testing.assert_array_equal(DualArray([1.0, 2.0]).dual, [0.0, 0.0])
+    np.testing.assert_array_equal(DualArray([1.0, 2.0], 1).dual, [1.0, 1.0])
+
+    with pytest.raises(ValueError):
+        DualArray([1.0, 2.0], [1.0, 2.0, 3.0])
+
+def test_arithmetic_matches_dual():
+    a_vals = [(2.0, 1.0), (3.0, 4.0), (0.5, -2.0)]
+    b_vals = [(4.0, 5.0), (1.5, 0.5), (2.0, 1.0)]
+    a = DualArray(*zip(*a_vals))
+    b = DualArray(*zip(*b_vals))
+    for op in (lambda x, y: x + y, lambda x, y: x - y, lambda x, y: x * y,
+               lambda x, y: x / y, lambda x, y: x ** y):
+        result = op(a, b)
+        for i, ((ar, ad), (br, bd)) in enumerate(zip(a_vals, b_vals)):
+            expected = op(Dual(ar, ad), Dual(br, bd))
+            assert result.real[i] == pytest.approx(expected.real, rel=1e-12)
+            assert result.dual[i] == pytest.approx(expected.dual, rel=1e-12)
+
+def test_broadcasting():
+    x = DualArray([1.0, 2.0, 3.0], 1.0)
+
+    result = 2 * x + 1
+    np.testing.assert_allclose(result.real, [3.0, 5.0, 7.0])
+    np.testing.assert_allclose(result.dual, [2.0, 2.0, 2.0])
+
+    result = 1 - x
+    np.testing.assert_allclose(result.real, [0.0, -1.0, -2.0])
+    np.testing.assert_allclose(result.dual, [-1.0, -1.0, -1.0])
+
+    result = 6 / x
+    np.testing.assert_allclose(result.real, [6.0, 3.0, 2.0])
+    np.testing.assert_allclose(result.dual, [-6.0, -1.5, -6.0 / 9])
+
+    result = np.array([1.0, 2.0, 3.0]) * x
+    np.testing.assert_allclose(result.real, [1.0, 4.0, 9.0])
+    np.testing.assert_allclose(result.dual, [1.0, 2.0, 3.0])
+
+    result = Dual(2, 1) * x
+    np.testing.assert_allclose(result.real, [2.0, 4.0, 6.0])
+    np.testing.assert_allclose(result.dual, [3.0, 4.0, 5.0])
+
+    result = x ** 2
+    np.testing.assert_allclose(result.real, [1.0, 4.0, 9.0])
+    np.testing.assert_allclose(result.dual, [2.0, 4.0, 6.0])
+
+    result = DualArray([[1.0], [2.0]], 1.0) + DualArray([1.0, 2.0, 3.0], 0.0)
+    assert result.shape == (2, 3)
+    np.testing.assert_allclose(result.dual, np.ones((2, 3)))
+
+    with pytest.raises(TypeError):
+        x + "5"
+
+def test_division_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        DualArray([1.0, 2.0], 1.0) / DualArray([1.0, 0.0], 0.0)
+    with pytest.raises(ZeroDivisionError):
+        DualArray([1.0, 2.0], 1.0) / 0
+
+@pytest.mark.parametrize("name, x", [
+    ("sin", 0.7), ("cos", 0.7), ("tan", 0.7), ("exp", 0.7), ("log", 0.7),
+    ("sqrt", 0.7), ("sinh", 0.7), ("cosh", 0.7), ("tanh", 0.7),
+    ("asin", 0.3), ("acos", 0.3), ("atan", 0.7),
+])
+def test_elementary_functions_match_dual(name, x):
+    xs = np.array([x, x / 2, x / 3])
+    result = getattr(DualArray(xs, 1.0), name)()
+    for i, xi in enumerate(xs):
+        expected = getattr(Dual(float(xi), 1.0), name)()
+        assert result.real[i] == pytest.approx(expected.real, rel=1e-12)
+        assert result.dual[i] == pytest.approx(expected.dual, rel=1e-12)
+
+def test_log():
+    with pytest.raises(ValueError):
+        DualArray([1.0, 0.0], 1.0).log()
+
+@pytest.mark.parametrize("exponent", [2, 3.0, 0, 0.0, -1, 0.5, 1.5, Dual(2.0, 0.0), Dual(0.0, 0.0), Dual(2.0, 1.0)])
+def test_power_matches_dual(exponent):
+    # Negative and zero bases follow Dual: a constant exponent needs no logarithm
+    bases = [-2.0, 0.0, 3.0]
+    expected = []
+    for b in bases:
+        try:
+            expected.append(Dual(b, 1.0) ** exponent)
+        except (ValueError, ZeroDivisionError) as error:
+            expected.append(type(error))
+    errors = [e for e in expected if isinstance(e, type)]
+    if errors:
+        with pytest.raises(tuple(errors)):
+            DualArray(bases, 1.0) ** exponent
+        result = DualArray(bases[2:], 1.0) ** exponent
+        assert (result.real[0], result.dual[0]) == pytest.approx((expected[2].real, expected[2].dual), rel=1e-12)
+        return
+    result = DualArray(bases, 1.0) ** exponent
+    for i, e in enumerate(expected):
+        assert result.real[i] == pytest.approx(e.real, rel=1e-12)
+        assert result.dual[i] == pytest.approx(e.dual, rel=1e-12)
+
+def test_power_with_mixed_exponents():
+    # Elements whose exponent has a zero dual part are constant powers
+    result = DualArray([-2.0, 0.0, 3.0], 1.0) ** DualArray([2.0, 2.0, 2.0], [0.0, 0.0, 1.0])
+    expected = [Dual(-2.0, 1.0) ** 2, Dual(0.0, 1.0) ** 2, Dual(3.0, 1.0) ** Dual(2.0, 1.0)]
+    np.testing.assert_allclose(result.real, [e.real for e in expected], rtol=1e-12)
+    np.testing.assert_allclose(result.dual, [e.dual for e in expected], rtol=1e-12)
+
+    result = Dual(-2.0, 1.0) ** DualArray([2.0, 3.0], 0.0)
+    np.testing.assert_allclose(result.dual, [-4.0, 12.0])
+    with pytest.raises(ValueError):
+        Dual(-2.0, 1.0) ** DualArray([2.0, 3.0], 1.0)
+    with pytest.raises(ValueError):
+        (-2.0) ** DualArray([2.0, 3.0], 0.0)
+    np.testing.assert_allclose((2.0 ** DualArray([1.0, 3.0], 1.0)).dual, [2 * math.log(2), 8 * math.log(2)])
+
+@pytest.mark.parametrize("name, x, error", [
+    ("sqrt", -1.0, ValueError), ("sqrt", 0.0, ZeroDivisionError),
+    ("asin", 1.5, ValueError), ("asin", 1.0, ZeroDivisionError), ("asin", -1.0, ZeroDivisionError),
+    ("acos", -1.5, ValueError), ("acos", 1.0, ZeroDivisionError), ("acos", -1.0, ZeroDivisionError),
+])
+def test_domain_errors_match_dual(name, x, error):
+    with pytest.raises(error):
+        getattr(Dual(x, 1.0), name)()
+    with pytest.raises(error):
+        getattr(DualArray([0.5, x], 1.0), name)()
+
+def test_indexing():
+    x = DualArray([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+    assert x[1] == Dual(2.0, 5.0)
+    assert len(x) == 3
+    assert isinstance(x[1:], DualArray)
+    np.testing.assert_array_equal(x[1:].real, [2.0, 3.0])
+    assert list(x)[2] == Dual(3.0, 6.0)
+
+def test_equality():
+    x = DualArray([1.0, 2.0], [3.0, 4.0])
+    np.testing.assert_array_equal(x == DualArray([1.0, 2.0], [3.0, 0.0]), [True, False])
+    np.testing.assert_array_equal(x == Dual(1.0, 3.0), [True, False])
+
+def test_same_function_as_dual():
+    def f(x):
+        return x.sin() * x.exp() + x.log() / x
+
+    xs = np.linspace(0.5, 3.0, 50)
+    derivatives = f(DualArray(xs, 1.0)).dual
+    expected = [f(Dual(float(x), 1)).dual for x in xs]
+    np.testing.assert_allclose(derivatives, expected, rtol=1e-12)
+
+def test_compute_derivative_batch_vectorized():
+    def f(x):
+        return x.sin() + x.log()
+
+    xs = np.linspace(0.5, 3.0, 20)
+    values, derivatives, backend = compute_derivative_batch(f, xs, return_values=True, return_backend=True)
+    assert backend == "vectorized"
+    np.testing.assert_allclose(values, np.sin(xs) + np.log(xs), rtol=1e-12)
+    np.testing.assert_allclose(derivatives, np.cos(xs) + 1 / xs, rtol=1e-12)
+
+    # Any iterable of points is accepted, and the shape of the input is kept
+    derivatives = compute_derivative_batch(f, (x for x in xs))
+    np.testing.assert_allclose(derivatives, np.cos(xs) + 1 / xs, rtol=1e-12)
+    assert compute_derivative_batch(f, xs.reshape(4, 5)).shape == (4, 5)
+
+def test_compute_derivative_batch_fallback():
+    def f(x):
+        if x.real > 1:
+            return x * x
+        return x.exp()
+
+    xs = [0.5, 1.5, 2.0]
+    derivatives, backend = compute_derivative_batch(f, xs, return_backend=True)
+    assert backend in ("compiled", "python")
+    expected = [compute_derivative(f, x, Dual) for x in xs]
+    np.testing.assert_allclose(derivatives, expected, rtol=1e-12)
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.longdouble])
+def test_precision(dtype):
+    def f(x):
+        return (x.sin() * x.exp() + 2) / (1 + x * x) - x.log() * x.sqrt() + x.atan() ** 2
+
+    x = DualArray(np.linspace(0.1, 0.9, 5, dtype=dtype), 1.0)
+    assert x.dtype == dtype and x.dual.dtype == dtype
+    y = f(x)
+    assert y.dtype == dtype
+    # The float64 reference limits the accuracy checked for long double
+    tolerance = max(10 * np.finfo(dtype).eps, 1e-13)
+    np.testing.assert_allclose(y.dual.astype(np.float64), f(x.astype(np.float64)).dual, rtol=tolerance)
+
+    assert compute_derivative_batch(lambda t: t.sin(), x.real).dtype == dtype
+
+def test_dtype_promotion():
+    # Python numbers and scalar dual numbers keep the precision, as in NumPy
+    x = DualArray(np.linspace(0.1, 0.9, 5, dtype=np.float32), 1.0)
+    for other in (2, 2.5, Dual(1.5, 1.0), np.float32(2), np.ones(5, dtype=np.float32)):
+        assert (x * other).dtype == np.float32 and (other - x).dtype == np.float32
+    assert (x * np.float64(2)).dtype == np.float64
+    assert (x + np.ones(5)).dtype == np.float64
+    assert (x / DualArray(np.ones(5))).dtype == np.float64
+    assert (x ** DualArray(np.ones(5), dtype=np.longdouble)).dtype == np.longdouble
+
+    # In place, the result keeps the precision of the target
+    x += np.ones(5)
+    assert x.dtype == np.float32
+
+    assert DualArray([1, 2]).dtype == np.float64
+    assert DualArray(np.ones(2, np.float32), np.ones(2)).dtype == np.float64
+    assert DualArray([1.0, 2.0], dtype=np.float32).dual.dtype == np.float32
+    with pytest.raises(ValueError):
+        DualArray([1.0, 2.0], dtype=np.int64)
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from DualNum import Dual, DualArray, DualBuffer
+from DualNum.DualBuffer import DUAL_DTYPE
+
+def test_interleaved_layout():
+    x = DualBuffer([1.0, 2.0, 3.0], 1.0)
+    raw = np.asarray(x)
+    assert raw.dtype == DUAL_DTYPE
+    assert np.shares_memory(raw, x.real)
+    np.testing.assert_array_equal(raw.view(np.float64), [1.0, 1.0, 2.0, 1.0, 3.0, 1.0])
+
+    # real and dual are strided views, not copies
+    assert x.real.strides == (16,) and x.dual.base is not None
+    x.real[0] = 5.0
+    assert x[0] == Dual(5.0, 1.0)
+
+    view = x.__buffer__(0)
+    assert view.itemsize == 16 and view.shape == (3,) and view.nbytes == 48
+    view.cast("B").cast("d")[1] = 7.0
+    assert x.dual[0] == 7.0
+
+def test_from_complex_and_float_pairs_share_memory():
+    z = np.array([[1 + 2j, 3 + 4j], [5 + 6j, 7 + 8j]])
+    x = DualBuffer.from_buffer(z)
+    assert x.shape == (2, 2)
+    np.testing.assert_array_equal(x.dual, z.imag)
+    x.dual[...] = 0.0
+    assert np.all(z.imag == 0.0)
+
+    pairs = np.arange(6.0).reshape(3, 2)
+    y = DualBuffer.from_buffer(pairs)
+    np.testing.assert_array_equal(y.real, [0.0, 2.0, 4.0])
+    y[1] = Dual(-1.0, -2.0)
+    np.testing.assert_array_equal(pairs[1], [-1.0, -2.0])
+
+    # Strided complex data is viewed as is
+    assert np.shares_memory(DualBuffer.from_buffer(z[:, ::-1]).real, z)
+
+    with pytest.raises(ValueError):
+        DualBuffer.from_buffer(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        DualBuffer.from_buffer(np.zeros((2, 3))[:, ::2])
+    with pytest.raises(TypeError):
+        DualBuffer.from_buffer(np.zeros(4, dtype=np.float32))
+
+def test_from_structured_skips_other_fields():
+    records = np.zeros(4, dtype=[("id", "i4"), ("x", "f8"), ("dx", "f8")])
+    records["x"] = [0.1, 0.2, 0.3, 0.4]
+    records["dx"] = 1.0
+    x = DualBuffer.from_structured(records, real="x", dual="dx")
+    assert np.shares_memory(x.real, records)
+
+    # Compute on views and write the result back in place
+    x[1:3] = x[1:3].to_dual_array().sin()
+    np.testing.assert_allclose(records["x"][1:3], np.sin([0.2, 0.3]))
+    np.testing.assert_allclose(records["dx"][1:3], np.cos([0.2, 0.3]))
+    assert np.all(records["id"] == 0)
+
+    copy = x.copy()
+    assert copy.__array_interface__["descr"] == DUAL_DTYPE.descr
+    assert not np.shares_memory(copy.real, records)
+
+    with pytest.raises(TypeError):
+        DualBuffer.from_structured(records)
+    with pytest.raises(TypeError):
+        DualBuffer.from_structured(records, real="id", dual="dx")
+
+def test_dual_array_round_trip():
+    a = DualArray([1.0, 2.0], [3.0, 4.0])
+    x = DualBuffer.from_dual_array(a)
+    assert [d for d in x] == [Dual(1.0, 3.0), Dual(2.0, 4.0)]
+    b = x.to_dual_array()
+    assert np.shares_memory(b.real, np.asarray(x))
+    assert np.all((b * b).dual == (a * a).dual)
@@ -22,8 +22,16 @@ def test_addition():
     assert result.real == 5
     assert result.dual == 5
 
+    result = d1 + 5
+    assert result.real == 7
+    assert result.dual == 1
+
+    result = 5 + d1
+    assert result.real == 7
+    assert result.dual == 1
+
     with pytest.raises(TypeError):
-        d1 + 5
+        d1 + "5"
 
 def test_subtraction():
     d1 = Dual(5, 3)
@@ -32,8 +40,16 @@ def test_subtraction():
     assert result.real == 3
     assert result.dual == 2
 
+    result = d1 - 2
+    assert result.real == 3
+    assert result.dual == 3
+
+    result = 2 - d1
+    assert result.real == -3
+    assert result.dual == -3
+
     with pytest.raises(TypeError):
-        d1 - 5
+        d1 - "5"
 
 def test_multiplication():
     d1 = Dual(2, 3)
@@ -42,8 +58,12 @@ def test_multiplication():
     assert result.real == 8
     assert result.dual == 22
 
+    result = 5 * d1
+    assert result.real == 10
+    assert result.dual == 15
+
     with pytest.raises(TypeError):
-        d1 * 5
+        d1 * "5"
 
 def test_division():
     d1 = Dual(10, 4)
@@ -52,12 +72,23 @@ def test_division():
     assert result.real == 5
     assert pytest.approx(result.dual, 1e-6) == -0.5
 
+    result = d1 / 4
+    assert result.real == 2.5
+    assert result.dual == 1
+
+    result = 4 / d2
+    assert result.real == 2
+    assert result.dual == -1
+
     with pytest.raises(TypeError):
-        d1 / 5
+        d1 / "5"
 
     with pytest.raises(ZeroDivisionError):
         d1 / Dual(0, 0)
 
+    with pytest.raises(ZeroDivisionError):
+        d1 / 0
+
 def test_power():
     d1 = Dual(2, 3)
     d2 = Dual(3, 4)
@@ -65,8 +96,39 @@ def test_power():
     assert pytest.approx(result.real, 1e-6) == 8
     assert pytest.approx(result.dual, 1e-6) == 58.18070977791825
 
+    assert d1 ** 5 == Dual(32, 240)
+    assert d1 ** 0 == Dual(1.0, 0.0)
+    assert Dual(-2, 1) ** 3 == Dual(-8, 12)
+    assert isinstance((Dual(3, 1) ** 3).real, float)
+    assert Dual(2, 1) ** 10**30 == Dual(math.inf, math.inf)
+    assert Dual(-2.0, 1.0) ** 1e30 == Dual(math.inf, -math.inf)
+    assert Dual(-2.0, 1.0) ** Dual(2.0, 0.0) == Dual(4.0, -4.0)
+    result = Dual(4.0, 1.0) ** -2
+    assert result.real == pytest.approx(1 / 16) and result.dual == pytest.approx(-2 / 64)
+    result = Dual(4.0, 1.0) ** 0.5
+    assert result.real == 2.0 and result.dual == pytest.approx(0.25)
+    assert Dual(0.0, 1.0) ** 2.5 == Dual(0.0, 0.0)
+
+    with pytest.raises(ValueError):
+        Dual(-2.0, 1.0) ** 0.5
+    with pytest.raises(ValueError):
+        Dual(-2.0, 1.0) ** Dual(2.0, 1.0)
+    with pytest.raises(ValueError):
+        Dual(0.0, 1.0) ** Dual(2.0, 1.0)
+    with pytest.raises(ValueError):
+        Dual(0.0, 1.0) ** Dual(-1.0, 1.0)
+    with pytest.raises(ZeroDivisionError):
+        Dual(0.0, 1.0) ** -1
+    with pytest.raises(ZeroDivisionError):
+        Dual(0.0, 1.0) ** 0.5
     with pytest.raises(TypeError):
-        d1 ** 5
+        d1 ** "2"
+
+def test_reflected_power():
+    result = 2 ** Dual(3.0, 1.0)
+    assert result.real == 8.0 and result.dual == pytest.approx(8 * math.log(2))
+    with pytest.raises(ValueError):
+        (-2.0) ** Dual(3.0, 1.0)
 
 def test_equality():
     d1 = Dual(2, 3)
@@ -0,0 +1,90 @@
+import math
+import pytest
+from DualNum_c import Dual_c
+
+pytest.importorskip("Cython")
+from DualNum.Kernel import _build, _load
+
+SOURCE = '''
+from DualNum_c.Dual_c cimport (Dual_c, dual_t, make_dual, as_dual, from_dual, dual_add, dual_add_scalar,
+    dual_sub, dual_rsub_scalar, dual_mul, dual_mul_scalar, dual_div, dual_rdiv_scalar, dual_pow, dual_eq,
+    dual_sin, dual_cos, dual_tan, dual_exp, dual_log, dual_sqrt, dual_sinh, dual_cosh, dual_tanh,
+    dual_asin, dual_acos, dual_atan)
+
+cdef dual_t model(dual_t x) noexcept nogil:
+    cdef dual_t y = dual_div(dual_mul(dual_sin(x), dual_exp(x)), dual_add_scalar(dual_mul(x, x), 1.0))
+    y = dual_add(y, dual_mul_scalar(dual_pow(dual_atan(x), x), 2.0))
+    y = dual_sub(y, dual_mul(dual_log(x), dual_sqrt(x)))
+    y = dual_add(y, dual_rdiv_scalar(3.0, dual_tanh(x)))
+    y = dual_add(y, dual_rsub_scalar(1.0, dual_mul(dual_sinh(x), dual_cosh(x))))
+    y = dual_add(y, dual_add(dual_cos(x), dual_tan(x)))
+    return dual_add(y, dual_add(dual_asin(dual_mul_scalar(x, 0.1)), dual_acos(dual_mul_scalar(x, 0.1))))
+
+def derivative(double x):
+    cdef double result
+    with nogil:
+        result = model(make_dual(x, 1.0)).dual
+    return result
+
+def apply(Dual_c x):
+    return from_dual(model(as_dual(x)))
+
+def real_part(Dual_c x):
+    return x.real
+
+def same(Dual_c a, Dual_c b):
+    return dual_eq(as_dual(a), as_dual(b))
+
+def edges(Dual_c x):
+    cdef dual_t u = as_dual(x)
+    return [from_dual(f) for f in (dual_sqrt(u), dual_asin(u), dual_acos(u), dual_log(u), dual_div(u, u))]
+'''
+
+def python_model(x):
+    y = x.sin() * x.exp() / (x * x + 1.0) + (x.atan() ** x) * 2.0 - x.log() * x.sqrt() + 3.0 / x.tanh()
+    y = y + (1.0 - x.sinh() * x.cosh()) + (x.cos() + x.tan())
+    return y + ((x * 0.1).asin() + (x * 0.1).acos())
+
+@pytest.fixture(scope="module")
+def module(tmp_path_factory):
+    build_dir = str(tmp_path_factory.mktemp("capi"))
+    return _load(_build(SOURCE, "dual_capi_user", build_dir), "dual_capi_user")
+
+def test_cimported_functions_match_methods(module):
+    for x in (0.3, 1.7, 4.2):
+        expected = python_model(Dual_c(x, 1.0))
+        result = module.apply(Dual_c(x, 1.0))
+        assert type(result) is Dual_c
+        assert result.real == pytest.approx(expected.real, rel=1e-14)
+        assert result.dual == pytest.approx(expected.dual, rel=1e-14)
+        assert module.derivative(x) == result.dual
+    assert module.real_part(Dual_c(2.5, 1.0)) == 2.5
+    assert module.same(Dual_c(1.0, 2.0), Dual_c(1.0, 2.0)) and not module.same(Dual_c(1.0, 2.0), Dual_c(1.0, 3.0))
+
+def test_domain_errors_are_left_to_the_caller(module):
+    # The inline functions never raise; the methods keep their checks
+    assert math.isnan(module.apply(Dual_c(-1.0, 1.0)).real)
+    with pytest.raises(ValueError):
+        Dual_c(-1.0, 1.0).log()
+
+def test_edges_of_the_domains_give_ieee_values(module):
+    # The inline functions are compiled with C division, in Dual_c and in the cimporting module
+    inf = math.inf
+    assert module.edges(Dual_c(0.0, 1.0))[0] == Dual_c(0.0, inf)
+    assert module.edges(Dual_c(0.0, 1.0))[3] == Dual_c(-inf, inf)
+    assert math.isnan(module.edges(Dual_c(0.0, 1.0))[4].real)
+    assert module.edges(Dual_c(1.0, 1.0))[1] == Dual_c(math.pi / 2, inf)
+    assert module.edges(Dual_c(-1.0, 1.0))[1] == Dual_c(-math.pi / 2, inf)
+    assert module.edges(Dual_c(1.0, 1.0))[2] == Dual_c(0.0, -inf)
+    assert module.edges(Dual_c(-1.0, 1.0))[2] == Dual_c(math.pi, -inf)
+    assert Dual_c(1e-200, 1.0) ** -2 == Dual_c(inf, -inf)
+    assert Dual_c(2.0, 1.0) ** -2 == Dual_c(0.25, -0.25)
+
+    # The methods raise at the same points as Dual
+    with pytest.raises(ZeroDivisionError):
+        Dual_c(0.0, 1.0).sqrt()
+    for x in (1.0, -1.0):
+        with pytest.raises(ZeroDivisionError):
+            Dual_c(x, 1.0).asin()
+        with pytest.raises(ZeroDivisionError):
+            Dual_c(x, 1.0).acos()
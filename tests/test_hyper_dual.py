@@ -0,0 +1,111 @@
+import pytest
+import numpy as np
+from DualNum import Dual, HyperDual, HyperDualArray, compute_derivative, compute_derivatives, compute_hessian, hessian_vector_product
+import math
+
+def test_init():
+    d = HyperDual(2, 1, 0, 3)
+    assert (d.real, d.eps1, d.eps2, d.eps12) == (2.0, 1.0, 0.0, 3.0)
+
+    with pytest.raises(TypeError):
+        HyperDual("2.0", 1.0)
+
+@pytest.mark.parametrize("name, x", [
+    ("sin", 0.7), ("cos", 0.7), ("tan", 0.7), ("exp", 0.7), ("log", 0.7),
+    ("sqrt", 0.7), ("sinh", 0.7), ("cosh", 0.7), ("tanh", 0.7),
+    ("asin", 0.3), ("acos", 0.3), ("atan", 0.7),
+])
+def test_second_derivatives(name, x):
+    expected = compute_derivatives(lambda t: getattr(t, name)(), x, order=2)
+    result = getattr(HyperDual(x, 1, 1), name)()
+    assert result.real == pytest.approx(expected[0], rel=1e-12)
+    assert result.eps1 == pytest.approx(expected[1], rel=1e-12)
+    assert result.eps2 == pytest.approx(expected[1], rel=1e-12)
+    assert result.eps12 == pytest.approx(expected[2], rel=1e-12)
+
+    batched = getattr(HyperDualArray([x, x / 2], 1.0, 1.0), name)()
+    assert batched.eps12[0] == pytest.approx(expected[2], rel=1e-12)
+
+def test_arithmetic():
+    def f(t):
+        return (t * t + 1) / (3 - t) + t ** 2.5 + 2 ** t - 1 / t + (t ** (t * 0 + 1.5)) * 2
+
+    expected = compute_derivatives(f, 1.2, order=2)
+    result = f(HyperDual(1.2, 1, 1))
+    assert result.real == pytest.approx(expected[0], rel=1e-12)
+    assert result.eps1 == pytest.approx(expected[1], rel=1e-12)
+    assert result.eps12 == pytest.approx(expected[2], rel=1e-12)
+
+    # First derivatives agree with Dual through the usual entry point
+    assert compute_derivative(f, 1.2, HyperDual) == pytest.approx(expected[1], rel=1e-12)
+    assert (HyperDual(0.0, 1, 1) ** 1).eps1 == 1.0
+
+    with pytest.raises(ZeroDivisionError):
+        HyperDual(1.0, 1, 1) / HyperDual(0.0)
+    with pytest.raises(ValueError):
+        HyperDual(0.0, 1, 1).log()
+    with pytest.raises(TypeError):
+        HyperDual(1.0) + "5"
+
+def test_power_follows_dual():
+    # Constant exponents, and hyper-dual ones with zero infinitesimal parts, take the power rule
+    for exponent in (3, 3.0, HyperDual(3.0)):
+        result = HyperDual(-2.0, 1, 1) ** exponent
+        assert (result.real, result.eps1, result.eps12) == (-8.0, 12.0, -12.0)
+    result = HyperDualArray([-2.0, 3.0], 1.0, 1.0) ** HyperDualArray([2.0, 2.0], [0.0, 1.0])
+    np.testing.assert_allclose(result.eps1, [-4.0, 6.0 + 9.0 * math.log(3.0)], rtol=1e-14)
+    np.testing.assert_allclose(result.eps2, [-4.0, 6.0], rtol=1e-14)
+
+    with pytest.raises(ValueError):
+        HyperDual(-2.0, 1, 1) ** 0.5
+    with pytest.raises(ValueError):
+        HyperDual(-2.0, 1, 1) ** HyperDual(2.0, 1)
+    with pytest.raises(ValueError):
+        HyperDualArray([1.0, -2.0], 1.0) ** 0.5
+    with pytest.raises(ZeroDivisionError):
+        HyperDual(0.0, 1, 1) ** -1
+    with pytest.raises(ValueError):
+        (-2.0) ** HyperDual(1.0, 1)
+
+def rosenbrock(x):
+    total = 0
+    for i in range(len(x) - 1):
+        a = x[i + 1] - x[i] * x[i]
+        b = 1 - x[i]
+        total = total + 100 * a * a + b * b
+    return total
+
+def rosenbrock_hessian(x):
+    n = len(x)
+    h = np.zeros((n, n))
+    for i in range(n - 1):
+        h[i, i] += 1200 * x[i] ** 2 - 400 * x[i + 1] + 2
+        h[i + 1, i + 1] += 200
+        h[i, i + 1] -= 400 * x[i]
+        h[i + 1, i] -= 400 * x[i]
+    return h
+
+def test_compute_hessian():
+    xs = np.array([0.3, -1.2, 0.8, 1.5])
+    value, gradient, hessian = compute_hessian(rosenbrock, xs, return_gradient=True)
+    np.testing.assert_allclose(hessian, rosenbrock_hessian(xs), rtol=1e-12, atol=1e-12)
+    assert value == pytest.approx(rosenbrock(list(xs)))
+    for i in range(len(xs)):
+        def partial(t, i=i):
+            args = [Dual(float(x), 0) for x in xs]
+            args[i] = t
+            return rosenbrock(args)
+        assert gradient[i] == pytest.approx(compute_derivative(partial, float(xs[i]), Dual), rel=1e-12)
+
+    # Lanes can be evaluated in batches to bound memory
+    np.testing.assert_allclose(compute_hessian(rosenbrock, xs, batch_size=3), hessian)
+    with pytest.raises(ValueError):
+        compute_hessian(rosenbrock, xs, batch_size=0)
+
+def test_hessian_vector_product():
+    xs = np.array([0.3, -1.2, 0.8, 1.5])
+    v = np.array([1.0, -2.0, 0.5, 3.0])
+    np.testing.assert_allclose(hessian_vector_product(rosenbrock, xs, v), rosenbrock_hessian(xs) @ v, rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        hessian_vector_product(rosenbrock, xs, v[:2])
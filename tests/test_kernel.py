@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+from DualNum import Dual, KernelCache, compile_tape, trace
+import os
+
+pytest.importorskip("Cython")
+
+def f(x):
+    return (x.sin() * x.exp() + 2) / (1 + x * x) - x.log() * x.sqrt() + x.atan() ** x + x.sin() * x.cos()
+
+@pytest.fixture(scope="module")
+def cache(tmp_path_factory):
+    return KernelCache(str(tmp_path_factory.mktemp("kernels")))
+
+def test_kernel_matches_tape(cache):
+    tape = trace(f).optimize()
+    kernel = compile_tape(tape, cache)
+    assert kernel.source == "compiled"
+    assert kernel.timings["compile"] > 0
+
+    xs = np.linspace(1.1, 4.0, 1000).reshape(10, 100)
+    for result, expected in zip(kernel.evaluate(xs), tape.evaluate(xs)):
+        assert result.shape == (10, 100)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+    assert kernel.evaluate(2.0) == pytest.approx(tape.evaluate(2.0), rel=1e-12)
+
+    with pytest.raises(ValueError):
+        kernel.evaluate([1.0, -1.0])
+
+def test_warm_start_from_disk(cache):
+    tape = trace(f).optimize()
+    assert compile_tape(tape, cache).source == "memory"
+
+    restarted = KernelCache(cache.directory)
+    kernel = restarted.get(tape)
+    assert kernel.source == "disk"
+    assert kernel.timings["compile"] == 0.0
+    assert kernel.key == cache.key(tape) != cache.key(trace(lambda x: x.cos()))
+    assert len(restarted) == 1
+
+def test_multi_input_constants_and_eviction(cache):
+    tape = trace(lambda xs: [xs[0] / xs[1] + 1.5, xs[1].cos() * 2], n_inputs=2)
+    kernel = compile_tape(tape, cache)
+    inputs, seeds = [np.array([1.0, 2.0]), 3.0], [1.0, 0.0]
+    for result, expected in zip(kernel.evaluate(inputs, seeds), tape.evaluate(inputs, seeds)):
+        np.testing.assert_allclose(result, expected, rtol=1e-14)
+    with pytest.raises(ZeroDivisionError):
+        kernel.evaluate([1.0, 0.0], seeds)
+
+    # The most recently compiled kernel is kept, older ones are evicted first
+    paths = sorted(os.listdir(cache.directory))
+    assert len(paths) == 2
+    cache.max_bytes = os.path.getsize(cache.path(kernel.key))
+    assert cache.evict(keep=cache.path(kernel.key)) == 1
+    assert os.listdir(cache.directory) == [os.path.basename(cache.path(kernel.key))]
+
+def test_powers_follow_dual(tmp_path):
+    # Constant exponents take the power rule, so negative and zero bases work as with Dual
+    cache = KernelCache(str(tmp_path))
+    g = lambda x: x ** 2 + 1 / x - x ** 0 + x ** 3.0
+    kernel = compile_tape(trace(g), cache)
+    values, derivatives = kernel.evaluate([-2.0, 0.5, 3.0])
+    expected = [g(Dual(x, 1.0)) for x in (-2.0, 0.5, 3.0)]
+    np.testing.assert_allclose(values, [e.real for e in expected], rtol=1e-14)
+    np.testing.assert_allclose(derivatives, [e.dual for e in expected], rtol=1e-14)
+    assert compile_tape(trace(lambda x: x ** 2 - x ** 0), cache).evaluate(0.0) == (-1.0, 0.0)
+
+    with pytest.raises(ValueError):
+        compile_tape(trace(lambda x: x ** 0.5), cache).evaluate([1.0, -1.0])
+    with pytest.raises(ZeroDivisionError):
+        compile_tape(trace(lambda x: x ** -1), cache).evaluate([1.0, 0.0])
+    with pytest.raises(ValueError):
+        compile_tape(trace(lambda x: x ** x), cache).evaluate([1.0, -1.0])
+
+    # An exponent whose dual part is zero at run time is a constant too
+    kernel = compile_tape(trace(lambda xs: xs[0] ** xs[1], n_inputs=2), cache)
+    assert kernel.evaluate([-2.0, 3.0], [1.0, 0.0]) == (-8.0, 12.0)
+    assert kernel.evaluate([0.0, 0.0], [1.0, 0.0]) == (1.0, 0.0)
+    with pytest.raises(ValueError):
+        kernel.evaluate([-2.0, 3.0], [1.0, 1.0])
+
+@pytest.mark.parametrize("name, x, error", [
+    ("sqrt", -1.0, ValueError), ("sqrt", 0.0, ZeroDivisionError),
+    ("asin", 2.0, ValueError), ("asin", -1.0, ZeroDivisionError),
+    ("acos", -2.0, ValueError), ("acos", 1.0, ZeroDivisionError),
+])
+def test_domain_errors_match_tape(cache, name, x, error):
+    tape = trace(lambda u: getattr(u, name)())
+    for evaluate in (tape.evaluate, compile_tape(tape, cache).evaluate):
+        with pytest.raises(error):
+            evaluate([0.5, x])
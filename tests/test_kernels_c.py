@@ -0,0 +1,112 @@
+import pytest
+import numpy as np
+from DualNum import DualArray
+from DualNum_c import Kernels_c
+
+UNARY = ["sin", "cos", "tan", "exp", "log", "sqrt", "sinh", "cosh", "tanh", "asin", "acos", "atan"]
+BINARY = {"add": "__add__", "sub": "__sub__", "mul": "__mul__", "truediv": "__truediv__", "pow": "__pow__"}
+
+@pytest.fixture(params=[10 ** 6, 0], ids=["serial", "parallel"])
+def threshold(request):
+    previous = Kernels_c.get_serial_threshold()
+    Kernels_c.set_serial_threshold(request.param)
+    yield request.param
+    Kernels_c.set_serial_threshold(previous)
+
+@pytest.mark.parametrize("name", UNARY)
+def test_unary_kernels_match_dual_array(name, threshold):
+    real = np.linspace(0.1, 0.9, 1001)
+    dual = np.linspace(-1.0, 2.0, 1001)
+    expected = getattr(DualArray(real, dual), name)()
+    out_real, out_dual = getattr(Kernels_c, name)(real, dual)
+    np.testing.assert_allclose(np.asarray(out_real), expected.real, rtol=1e-14)
+    np.testing.assert_allclose(np.asarray(out_dual), expected.dual, rtol=1e-14)
+
+@pytest.mark.parametrize("name", BINARY)
+def test_binary_kernels_match_dual_array(name, threshold):
+    a = DualArray(np.linspace(0.5, 2.0, 1001), np.linspace(-1.0, 1.0, 1001))
+    b = DualArray(np.linspace(1.0, 3.0, 1001), np.linspace(2.0, 0.0, 1001))
+    expected = getattr(a, BINARY[name])(b)
+    out_real, out_dual = getattr(Kernels_c, name)(a.real, a.dual, b.real, b.dual)
+    np.testing.assert_allclose(np.asarray(out_real), expected.real, rtol=1e-14)
+    np.testing.assert_allclose(np.asarray(out_dual), expected.dual, rtol=1e-14)
+
+def test_broadcast_and_out_buffers():
+    x = np.linspace(1.0, 2.0, 5)
+    out_real, out_dual = np.empty(5), np.empty(5)
+    result = Kernels_c.mul(x, np.ones(5), np.array([3.0]), np.array([0.0]), out_real, out_dual)
+    assert result[0] is out_real and result[1] is out_dual
+    np.testing.assert_allclose(out_real, 3 * x)
+    np.testing.assert_allclose(out_dual, 3.0)
+
+    with pytest.raises(ValueError):
+        Kernels_c.add(x, np.ones(5), np.ones(3), np.ones(3))
+    with pytest.raises(ValueError):
+        Kernels_c.sin(x, np.ones(4))
+
+def test_domain_errors(threshold):
+    with pytest.raises(ZeroDivisionError):
+        Kernels_c.truediv(np.ones(3), np.ones(3), np.array([1.0, 0.0, 2.0]), np.zeros(3))
+    with pytest.raises(ValueError):
+        Kernels_c.log(np.array([1.0, -1.0]), np.ones(2))
+    with pytest.raises(ValueError):
+        Kernels_c.asin(np.array([0.5, 1.5]), np.ones(2))
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.longdouble])
+def test_pow_follows_dual(dtype, threshold):
+    # A constant exponent (zero dual part) takes the power rule at negative and zero bases
+    base = np.array([-2.0, 0.0, 3.0], dtype=dtype)
+    for exponent, expected in [(2.0, [-4.0, 0.0, 6.0]), (3.0, [12.0, 0.0, 27.0]), (0.0, [0.0, 0.0, 0.0])]:
+        out_real, out_dual = Kernels_c.pow(base, np.ones(3, dtype), np.array([exponent], dtype), np.zeros(1, dtype))
+        np.testing.assert_allclose(np.asarray(out_real), base.astype(np.float64) ** exponent)
+        np.testing.assert_allclose(np.asarray(out_dual), expected)
+    for dual in (0.0, 1.0):
+        expected = DualArray(np.array([-2.0, 0.0, 3.0, 0.5]), 1.0) ** DualArray(np.array([2.0, 2.0, 2.0, 1.5]), [0.0, 0.0, dual, dual])
+        out_real, out_dual = Kernels_c.pow(np.array([-2.0, 0.0, 3.0, 0.5]), np.ones(4),
+                                           np.array([2.0, 2.0, 2.0, 1.5]), np.array([0.0, 0.0, dual, dual]))
+        np.testing.assert_allclose(np.asarray(out_dual), expected.dual, rtol=1e-14)
+
+    with pytest.raises(ValueError):
+        Kernels_c.pow(np.array([1.0, -2.0]), np.ones(2), np.array([0.5]), np.zeros(1))
+    with pytest.raises(ValueError):
+        Kernels_c.pow(np.array([1.0, 0.0]), np.ones(2), np.array([2.0]), np.ones(1))
+    with pytest.raises(ZeroDivisionError):
+        Kernels_c.pow(np.array([1.0, 0.0]), np.ones(2), np.array([-1.0]), np.zeros(1))
+    with pytest.raises(ZeroDivisionError):
+        Kernels_c.pow(np.array([1.0, 0.0]), np.ones(2), np.array([0.5]), np.zeros(1))
+
+def test_thread_settings():
+    previous = Kernels_c.get_num_threads()
+    Kernels_c.set_num_threads(3)
+    assert Kernels_c.get_num_threads() == 3
+    Kernels_c.set_num_threads(0)
+    assert Kernels_c.get_num_threads() >= 1
+    Kernels_c.set_num_threads(previous)
+    with pytest.raises(ValueError):
+        Kernels_c.set_num_threads(-1)
+    with pytest.raises(ValueError):
+        Kernels_c.set_serial_threshold(-1)
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.longdouble])
+@pytest.mark.parametrize("name", UNARY + list(BINARY))
+def test_kernels_in_every_precision(name, dtype):
+    x = DualArray(np.linspace(0.1, 0.9, 101), np.linspace(-1.0, 2.0, 101), dtype=dtype)
+    y = DualArray(np.linspace(1.1, 1.9, 101), 0.5, dtype=dtype)
+    if name in BINARY:
+        expected = getattr(x, BINARY[name])(y)
+        out_real, out_dual = getattr(Kernels_c, name)(x.real, x.dual, y.real, y.dual)
+    else:
+        expected = getattr(x, name)()
+        out_real, out_dual = getattr(Kernels_c, name)(x.real, x.dual)
+    assert np.asarray(out_real).dtype == dtype and np.asarray(out_dual).dtype == dtype
+    rtol = 8 * np.finfo(dtype).eps
+    np.testing.assert_allclose(np.asarray(out_real), expected.real, rtol=rtol)
+    np.testing.assert_allclose(np.asarray(out_dual), expected.dual, rtol=rtol)
+
+def test_kernel_promotion():
+    x32, x64 = np.linspace(1.0, 2.0, 5, dtype=np.float32), np.linspace(1.0, 2.0, 5)
+    assert np.asarray(Kernels_c.mul(x32, x32, x32, x32)[0]).dtype == np.float32
+    assert np.asarray(Kernels_c.mul(x32, x32, x64, x64)[0]).dtype == np.float64
+    assert np.asarray(Kernels_c.add(np.arange(5), np.ones(5, dtype=int), x32, x32)[0]).dtype == np.float64
+    with pytest.raises(ValueError):
+        Kernels_c.sin(x32, x32, np.empty(5), np.empty(5))
@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+from DualNum import Dual, MultiDual, compute_derivative, compute_gradient, compute_jacobian
+from DualNum_c import MultiDual_c
+import math
+
+CLASSES = [MultiDual, MultiDual_c]
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_init(cls):
+    d = cls(2.0, [1.0, 0.0, 3.0])
+    assert d.real == 2.0
+    np.testing.assert_array_equal(np.asarray(d.dual), [1.0, 0.0, 3.0])
+
+    with pytest.raises(TypeError):
+        cls("2.0", [1.0])
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_arithmetic(cls):
+    x = cls(2, [1, 0])
+    y = cls(4, [0, 1])
+
+    result = x * y + x / y - 3 * x + 1
+    assert result.real == pytest.approx(8 + 0.5 - 6 + 1)
+    np.testing.assert_allclose(np.asarray(result.dual), [4 + 1 / 4 - 3, 2 - 2 / 16])
+
+    result = x ** y
+    assert result.real == pytest.approx(16)
+    np.testing.assert_allclose(np.asarray(result.dual), [4 * 2 ** 3, 16 * math.log(2)])
+
+    result = 1 / x - x ** 3
+    np.testing.assert_allclose(np.asarray(result.dual), [-1 / 4 - 12, 0])
+
+    with pytest.raises(ValueError):
+        x + cls(1, [1, 0, 0])
+
+    with pytest.raises(ZeroDivisionError):
+        x / cls(0, [1, 0])
+
+    with pytest.raises(TypeError):
+        x + "5"
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("base", [-2.0, 0.0, 3.0])
+@pytest.mark.parametrize("exponent", [0, 0.0, 2, 3.0, -1, 0.5, 1.5, "constant", "variable"])
+def test_power_matches_dual(cls, base, exponent):
+    # Zero and negative bases follow Dual, including a multi-dual exponent with a zero tangent
+    x = cls(base, [1.0, 2.0])
+    if exponent == "constant":
+        exponent, dual_exponent = cls(2.0, [0.0, 0.0]), Dual(2.0, 0.0)
+    elif exponent == "variable":
+        exponent, dual_exponent = cls(2.0, [1.0, 2.0]), Dual(2.0, 1.0)
+    else:
+        dual_exponent = exponent
+    try:
+        expected = Dual(base, 1.0) ** dual_exponent
+    except (ValueError, ZeroDivisionError) as error:
+        with pytest.raises(type(error)):
+            x ** exponent
+        return
+    result = x ** exponent
+    assert result.real == pytest.approx(expected.real, rel=1e-12)
+    assert np.asarray(result.dual)[1] == pytest.approx(2 * expected.dual, rel=1e-12)
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("name, x", [
+    ("sin", 0.7), ("cos", 0.7), ("tan", 0.7), ("exp", 0.7), ("log", 0.7),
+    ("sqrt", 0.7), ("sinh", 0.7), ("cosh", 0.7), ("tanh", 0.7),
+    ("asin", 0.3), ("acos", 0.3), ("atan", 0.7),
+])
+def test_elementary_functions_match_dual(cls, name, x):
+    result = getattr(cls(x, [1.0, -2.0]), name)()
+    expected = getattr(Dual(x, 1.0), name)()
+    assert result.real == pytest.approx(expected.real, rel=1e-12)
+    np.testing.assert_allclose(np.asarray(result.dual), [expected.dual, -2 * expected.dual], rtol=1e-12)
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_compute_gradient(cls):
+    def f(x):
+        return x[0] * x[1].sin() + (x[2] * x[0]).exp() / x[1]
+
+    xs = [0.3, 1.2, -0.5]
+    value, gradient = compute_gradient(f, xs, dual_class=cls, return_values=True)
+
+    assert value == pytest.approx(0.3 * math.sin(1.2) + math.exp(-0.15) / 1.2)
+    for i in range(3):
+        def partial(t, i=i):
+            args = [Dual(x, 0) for x in xs]
+            args[i] = t
+            return f(args)
+        assert gradient[i] == pytest.approx(compute_derivative(partial, xs[i], Dual), rel=1e-12)
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_compute_jacobian(cls):
+    def f(x):
+        return [x[0] * x[1], x[0].sin() + x[1], 2.0]
+
+    values, jacobian = compute_jacobian(f, [2, 3], dual_class=cls, return_values=True)
+    np.testing.assert_allclose(values, [6, math.sin(2) + 3, 2])
+    np.testing.assert_allclose(jacobian, [[3, 2], [math.cos(2), 1], [0, 0]])
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from DualNum import (Dual, DualArray, DualBuffer, HyperDual, HyperDualArray, Taylor, TaylorArray, compute_derivative,
+                     compute_derivative_batch, compute_hessian)
+from DualNum_c import Dual_c
+
+def model(x):
+    # Plain NumPy model code, unaware of dual numbers
+    return np.sqrt(np.exp(np.sin(x)) + np.log(np.add(x, 1.0))) * np.multiply(x, 2.0) / 3.0
+
+def reference(x):
+    return ((x.sin().exp() + (x + 1.0).log()).sqrt()) * (x * 2.0) / 3.0
+
+@pytest.mark.parametrize("cls", [Dual, Dual_c])
+def test_scalar_ufuncs(cls):
+    x = cls(0.7, 1.0)
+    for ufunc, method in [(np.sin, "sin"), (np.cos, "cos"), (np.tan, "tan"), (np.exp, "exp"), (np.log, "log"),
+                          (np.sqrt, "sqrt"), (np.sinh, "sinh"), (np.cosh, "cosh"), (np.tanh, "tanh"),
+                          (np.arcsin, "asin"), (np.arccos, "acos"), (np.arctan, "atan")]:
+        result = ufunc(x)
+        assert type(result) is cls and result == getattr(x, method)()
+    assert np.add(x, 2) == x + 2 and np.subtract(2, x) == 2 - x
+    assert np.multiply(np.float64(3.0), x) == 3.0 * x and np.divide(x, x) == x / x
+    assert compute_derivative(model, 0.7, cls) == pytest.approx(compute_derivative(reference, 0.7, cls), rel=1e-15)
+
+@pytest.mark.parametrize("cls", [Dual, Dual_c])
+def test_scalar_with_arrays_gives_dual_arrays(cls):
+    x = cls(2.0, 1.0)
+    y = np.array([1.0, 2.0, 3.0]) * np.sin(x)
+    assert isinstance(y, DualArray)
+    np.testing.assert_allclose(y.dual, np.array([1.0, 2.0, 3.0]) * np.cos(2.0))
+    assert type(np.sum(x)) is cls and np.where(True, x, 0.0) == x
+    assert np.dot(x, 3.0) == x * 3.0
+
+def test_dual_array_ufuncs_and_operators():
+    x = DualArray(np.linspace(0.1, 2.0, 50), 1.0)
+    y = model(x)
+    assert isinstance(y, DualArray)
+    np.testing.assert_allclose(y.dual, reference(x).dual, rtol=1e-15)
+    np.testing.assert_array_equal(compute_derivative_batch(model, x.real), y.dual)
+
+    # ndarray operators defer to the dual array instead of building object arrays
+    z = np.arange(50.0) + x
+    assert isinstance(z, DualArray) and z.dual.dtype == np.float64
+    assert isinstance(np.arange(50.0) * x, DualArray)
+    assert (x.real == x).tolist() == [False] * 50
+    with pytest.raises(TypeError):
+        np.maximum(x, 1.0)
+    with pytest.raises(TypeError):
+        np.sin(x, out=np.empty(50))
+
+def test_array_functions():
+    x = DualArray([[1.0, 2.0], [3.0, 4.0]], [[1.0, 0.0], [0.0, 1.0]])
+    total = np.sum(x)
+    assert type(total) is Dual and total == Dual(10.0, 2.0)
+    np.testing.assert_array_equal(np.sum(x, axis=0).dual, [1.0, 1.0])
+    assert np.add.reduce(x, axis=None) == total
+    assert np.mean(x) == Dual(2.5, 0.5)
+
+    v = DualArray([1.0, 2.0], [1.0, -1.0])
+    product = np.dot(x, v)
+    np.testing.assert_array_equal(product.real, x.real @ v.real)
+    np.testing.assert_array_equal(product.dual, x.dual @ v.real + x.real @ v.dual)
+    assert np.dot(v, v) == Dual(5.0, -2.0)
+    np.testing.assert_array_equal(np.dot(np.eye(2), v).dual, v.dual)
+
+    chosen = np.where(x.real > 2.0, x, 0.0)
+    np.testing.assert_array_equal(chosen.real, [[0.0, 0.0], [3.0, 4.0]])
+    np.testing.assert_array_equal(chosen.dual, [[0.0, 0.0], [0.0, 1.0]])
+    with pytest.raises(TypeError):
+        np.where(x, x, 0.0)
+    assert np.shape(x) == (2, 2) and np.ndim(x) == 2 and np.size(x) == 4
+    with pytest.raises(TypeError):
+        np.cumsum(x)
+
+def test_dual_buffer_dispatches_through_its_view():
+    buffer = DualBuffer([1.0, 2.0], 1.0)
+    y = np.exp(buffer)
+    assert isinstance(y, DualArray)
+    np.testing.assert_array_equal(y.dual, np.exp([1.0, 2.0]))
+    assert np.sum(buffer) == Dual(3.0, 2.0)
+    # Functions without a dual implementation still see the records
+    assert np.copy(buffer).dtype.names == ("real", "dual")
+
+def test_hyper_dual_array_ufuncs_and_functions():
+    x = HyperDualArray(np.linspace(0.1, 0.9, 20), 1.0, 1.0)
+    for name in ("real", "eps1", "eps2", "eps12"):
+        np.testing.assert_allclose(getattr(model(x), name), getattr(reference(x), name), rtol=1e-15)
+    np.testing.assert_array_equal(np.arcsin(x).eps12, x.asin().eps12)
+    assert isinstance(np.arange(20.0) * x, HyperDualArray)
+
+    total = np.sum(x)
+    assert type(total) is HyperDual and total == HyperDual(10.0, 20.0, 20.0, 0.0)
+    np.testing.assert_allclose(np.mean(x).real, 0.5)
+    assert np.shape(x) == (20,) and np.ndim(x) == 1 and np.size(x) == 20
+    with pytest.raises(TypeError):
+        np.maximum(x, 1.0)
+    with pytest.raises(TypeError):
+        np.dot(x, x)
+
+    # Hessians of functions written with NumPy
+    hessian = compute_hessian(lambda v: np.sin(v[0]) * np.exp(v[1]), [0.3, 0.7])
+    np.testing.assert_allclose(hessian, [[-np.sin(0.3) * np.exp(0.7), np.cos(0.3) * np.exp(0.7)],
+                                         [np.cos(0.3) * np.exp(0.7), np.sin(0.3) * np.exp(0.7)]], rtol=1e-14)
+
+def test_taylor_array_ufuncs_and_functions():
+    x = TaylorArray.variable(np.linspace(0.1, 0.9, 12).reshape(3, 4), order=3)
+    np.testing.assert_allclose(model(x).coeffs, reference(x).coeffs, rtol=1e-14)
+    np.testing.assert_array_equal(np.arctan(x).coeffs, x.atan().coeffs)
+    assert isinstance(np.ones((3, 4)) + x, TaylorArray)
+
+    total = np.sum(x)
+    assert type(total) is Taylor
+    np.testing.assert_allclose(total.derivatives(), [6.0, 12.0, 0.0, 0.0])
+    np.testing.assert_allclose(np.sum(x, axis=-1).coeffs, x.coeffs.sum(axis=2))
+    assert np.mean(x, axis=0, keepdims=True).shape == (1, 4)
+    assert np.shape(x) == (3, 4) and np.ndim(x) == 2 and np.size(x) == 12 and np.size(x, 0) == 3
+    with pytest.raises(np.exceptions.AxisError):
+        np.sum(x, axis=2)
+    with pytest.raises(TypeError):
+        np.cumsum(x)
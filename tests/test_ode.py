@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from DualNum import Dual, DualArray, compute_sensitivities, integrate
+from DualNum_c import Dual_c
+
+def decay(t, y, k):
+    return [-1.0 * k * y[0]]
+
+def lotka_volterra(t, y, a, b, c, d):
+    return [a * y[0] - b * y[0] * y[1], d * y[0] * y[1] - c * y[1]]
+
+def final(rhs, y0, t_span, args=(), **options):
+    for t, y in integrate(rhs, y0, t_span, args=args, t_eval=[t_span[1]], **options):
+        pass
+    return t, y
+
+@pytest.mark.parametrize("cls", [Dual, Dual_c])
+@pytest.mark.parametrize("options", [{"method": "rk4", "step": 0.01}, {"rtol": 1e-10, "atol": 1e-12}])
+def test_decay_rate_sensitivity(cls, options):
+    t, (y,) = final(decay, [1.0], (0.0, 2.0), args=(cls(0.5, 1.0),), **options)
+    assert t == 2.0
+    assert y.real == pytest.approx(np.exp(-1.0), rel=1e-9)
+    assert y.dual == pytest.approx(-2.0 * np.exp(-1.0), rel=1e-8)
+
+def test_streams_every_step_and_t_eval():
+    steps = list(integrate(decay, [1.0], (0.0, 1.0), args=(0.5,), method="rk4", step=0.25))
+    assert [t for t, _ in steps] == [0.0, 0.25, 0.5, 0.75, 1.0]
+    times = np.linspace(0.0, 3.0, 7)
+    outputs = list(integrate(decay, [1.0], (0.0, 3.0), args=(0.5,), t_eval=times, rtol=1e-10))
+    assert [t for t, _ in outputs] == times.tolist()
+    np.testing.assert_allclose([y[0] for _, y in outputs], np.exp(-0.5 * times), rtol=1e-8)
+    # Backwards in time
+    t, (y,) = final(decay, [1.0], (2.0, 0.0), args=(0.5,), rtol=1e-10)
+    assert t == 0.0 and y == pytest.approx(np.e, rel=1e-8)
+
+def test_batched_states():
+    # One DualArray lane per initial condition, all sharing the adaptive steps
+    y0 = DualArray([1.0, 2.0, 3.0], 1.0)
+    t, (y,) = final(decay, [y0], (0.0, 1.0), args=(0.7,), rtol=1e-10)
+    np.testing.assert_allclose(y.real, y0.real * np.exp(-0.7), rtol=1e-8)
+    np.testing.assert_allclose(y.dual, np.exp(-0.7), rtol=1e-8)
+
+def test_sensitivities_match_finite_differences():
+    params = np.array([1.1, 0.4, 0.4, 0.1])
+    options = {"rtol": 1e-10, "atol": 1e-12, "t_eval": np.linspace(0.0, 5.0, 11)}
+    t, y, s = compute_sensitivities(lotka_volterra, [10.0, 5.0], (0.0, 5.0), params, wrt="both", **options)
+    assert t.shape == (11,) and y.shape == (11, 2) and s.shape == (11, 2, 6)
+    np.testing.assert_array_equal(s[0, :, :4], 0.0)
+    np.testing.assert_array_equal(s[0, :, 4:], np.eye(2))
+    for l in range(4):
+        step = np.zeros(4)
+        step[l] = 1e-6
+        up = compute_sensitivities(lotka_volterra, [10.0, 5.0], (0.0, 5.0), params + step, **options)[1]
+        down = compute_sensitivities(lotka_volterra, [10.0, 5.0], (0.0, 5.0), params - step, **options)[1]
+        np.testing.assert_allclose(s[:, :, l], (up - down) / 2e-6, rtol=1e-5, atol=1e-6)
+    _, _, s_y0 = compute_sensitivities(lotka_volterra, [10.0, 5.0], (0.0, 5.0), params, wrt="y0", **options)
+    np.testing.assert_allclose(s_y0, s[:, :, 4:])
+
+def test_errors():
+    with pytest.raises(ValueError):
+        list(integrate(decay, [1.0], (0.0, 1.0), args=(0.5,), method="rk4"))
+    with pytest.raises(ValueError):
+        list(integrate(decay, [1.0], (0.0, 1.0), args=(0.5,), method="euler"))
+    with pytest.raises(ValueError):
+        list(integrate(decay, [1.0], (0.0, 1.0), args=(0.5,), t_eval=[0.5, 0.2]))
+    with pytest.raises(ValueError):
+        list(integrate(decay, [1.0], (0.0, 100.0), args=(0.5,), max_steps=3))
+    with pytest.raises(ValueError):
+        compute_sensitivities(decay, [1.0], (0.0, 1.0), [0.5], wrt="t")
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from DualNum import Dual, ParallelExecutor, compute_derivative, compute_jacobian
+from DualNum.Dual import _new
+
+def f(x):
+    return x.sin() * x.exp() + x * x
+
+def constant(x):
+    return 3.0
+
+def log(x):
+    return x.log()
+
+def g(x):
+    return [x[0] * x[1].sin(), x[0] + x[2].exp(), 2.0, x[1] / x[2]]
+
+@pytest.fixture(scope="module")
+def executor():
+    with ParallelExecutor(processes=2) as executor:
+        yield executor
+
+def test_derivative_identical_to_serial(executor):
+    xs = np.linspace(-2.0, 2.0, 101).reshape(1, 101)
+    values, derivatives = executor.derivative(f, xs, return_values=True)
+    assert derivatives.shape == xs.shape
+    expected = [compute_derivative(f, x, Dual) for x in xs.ravel().tolist()]
+    assert derivatives.ravel().tolist() == expected
+    assert values.ravel().tolist() == [f(_new(x, 1.0)).real for x in xs.ravel().tolist()]
+    np.testing.assert_array_equal(executor.derivative(constant, [1.0, 2.0]), [0.0, 0.0])
+
+def test_workers_reused_and_chunking(executor):
+    xs = np.linspace(0.0, 1.0, 37)
+    expected = executor.derivative(f, xs)
+    pool = executor._pool
+    for chunk_size in (1, 5, 100):
+        np.testing.assert_array_equal(executor.derivative(f, xs, chunk_size=chunk_size), expected)
+    assert executor._pool is pool
+    static = ParallelExecutor(processes=2, chunks_per_worker=1)
+    try:
+        np.testing.assert_array_equal(static.derivative(f, xs), expected)
+    finally:
+        static.close()
+    assert static._pool is None
+
+def test_jacobian_matches_compute_jacobian(executor):
+    xs = [0.5, 1.5, -0.3]
+    values, jacobian = executor.jacobian(g, xs, return_values=True, chunk_size=1)
+    expected_values, expected = compute_jacobian(g, xs, return_values=True)
+    assert jacobian.shape == (4, 3)
+    np.testing.assert_allclose(jacobian, expected, rtol=1e-15)
+    np.testing.assert_allclose(values, expected_values)
+
+def test_errors(executor):
+    with pytest.raises(ValueError):
+        ParallelExecutor(chunks_per_worker=0)
+    with pytest.raises(ValueError):
+        executor.derivative(log, [1.0, -1.0])
+    # The pool survives a failing function
+    np.testing.assert_array_equal(executor.derivative(log, [1.0, 2.0]), [1.0, 0.5])
@@ -0,0 +1,53 @@
+import pytest
+from DualNum import Dual, Profiler, compute_derivative
+from DualNum_c import Dual_c
+
+def f(x):
+    return x.sin() * x.exp() + 2 * x + (1 - x).atan() / x
+
+@pytest.mark.parametrize("cls", [Dual, Dual_c])
+def test_counts_primitives(cls):
+    label = cls.__name__
+    with Profiler() as profiler:
+        for _ in range(10):
+            result = compute_derivative(f, 0.5, cls)
+    assert result == pytest.approx(compute_derivative(f, 0.5, cls))
+
+    stats = profiler.to_dict()
+    for name in ("sin", "exp", "__mul__", "__rmul__", "__add__", "__rsub__", "atan", "__truediv__"):
+        assert stats[f"{label}.{name}"]["calls"] == (20 if name == "__add__" else 10)
+        assert stats[f"{label}.{name}"]["constructed"] == stats[f"{label}.{name}"]["calls"]
+        assert stats[f"{label}.{name}"]["time"] > 0
+    # __rmul__ delegates to __mul__, which is not counted a second time
+    assert stats[f"{label}.__mul__"]["calls"] == 10
+
+    times = [row["time"] for row in stats.values()]
+    assert times == sorted(times, reverse=True)
+    report = profiler.report().splitlines()
+    assert report[0].split()[0] == "primitive" and len(report) == len(stats) + 1
+
+def test_disabled_profiler_leaves_classes_untouched():
+    originals = dict(Dual.__dict__)
+    with Profiler() as profiler:
+        assert Dual.__dict__["sin"] is not originals["sin"]
+        with pytest.raises(RuntimeError):
+            with Profiler():
+                pass
+    assert all(Dual.__dict__[name] is originals[name] for name in originals)
+
+    Dual(1.0, 1.0).sin()
+    Dual_c(1.0, 1.0).sin()
+    assert profiler.stats == {}
+    with pytest.raises(TypeError):
+        Dual("1", 0)
+
+def test_errors_are_recorded_and_propagate():
+    with Profiler() as profiler:
+        with pytest.raises(ValueError):
+            Dual_c(-1.0, 1.0).log()
+        with pytest.raises(ValueError):
+            Dual(-1.0, 1.0).log()
+    assert profiler.to_dict()["Dual_c.log"]["calls"] == 1
+    assert profiler.to_dict()["Dual.log"]["constructed"] == 0
+    profiler.reset()
+    assert profiler.to_dict() == {}
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from DualNum import Dual, RootResults, compute_derivative, find_roots
+
+def kepler(E, M, e):
+    return E - e * E.sin() - M
+
+def newton_loop(func, x, tol=1e-12):
+    for i in range(1, 51):
+        step = func(Dual(x, 1)).real / compute_derivative(func, x, Dual)
+        x -= step
+        if abs(step) <= tol:
+            return x, i
+    return x, 50
+
+@pytest.mark.parametrize("method", ["newton", "halley"])
+def test_kepler_batch(method):
+    M = np.linspace(0.0, 2 * np.pi, 20_001).reshape(3, -1)
+    result = find_roots(kepler, M, args=(M, 0.7), method=method)
+    assert isinstance(result, RootResults) and result.roots.shape == M.shape
+    assert result.converged.all() and result.iterations.dtype == np.int64
+    np.testing.assert_allclose(result.roots - 0.7 * np.sin(result.roots), M, atol=1e-13)
+    if method == "halley":
+        newton = find_roots(kepler, M, args=(M, 0.7))
+        assert result.iterations.max() < newton.iterations.max()
+
+def test_matches_scalar_newton_and_masks_finished_lanes():
+    calls = []
+
+    def f(x):
+        calls.append(x.real.size)
+        return x * x * x - 2 * x - 5
+
+    starts = np.array([2.0, 2.1, 10.0, 100.0])
+    result = find_roots(f, starts)
+    for x0, root, iterations in zip(starts, result.roots, result.iterations):
+        expected, count = newton_loop(lambda x: x * x * x - 2 * x - 5, x0)
+        assert root == pytest.approx(expected, rel=1e-14) and iterations == count
+    # Every call only sees the lanes still iterating
+    assert calls == [int((result.iterations > k).sum()) for k in range(result.iterations.max())]
+    np.testing.assert_allclose(result.values, 0.0, atol=1e-12)
+
+def test_bracket_safeguard():
+    # Newton diverges from x0 = 3 for atan; the bracket forces bisection steps
+    with np.errstate(over="ignore"):
+        unsafe = find_roots(lambda x: x.atan(), [3.0])
+    safe = find_roots(lambda x: x.atan(), [3.0], bracket=(-1.0, 5.0))
+    assert not unsafe.converged[0]
+    assert safe.converged[0] and abs(safe.roots[0]) < 1e-12
+
+    # A vanishing derivative stops the element unless it is bracketed
+    result = find_roots(lambda x: x * x - 2.0, [0.0, 0.0, 3.0], bracket=([-1.0, 0.0, 0.0], [1.0, 2.0, 2.0]))
+    assert result.converged.tolist() == [False, True, True]
+    np.testing.assert_allclose(result.roots[1:], np.sqrt(2.0))
+
+def test_maxiter_and_errors():
+    result = find_roots(lambda x: x.exp() - 1.0, [30.0], maxiter=3)
+    assert result.iterations[0] == 3 and not result.converged[0]
+    with pytest.raises(ValueError):
+        find_roots(lambda x: x, [1.0], method="secant")
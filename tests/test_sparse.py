@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+import scipy.sparse
+from DualNum import Dual, color_columns, compute_jacobian, compute_sparse_jacobian, jacobian_sparsity
+from DualNum_c import Dual_c
+
+def laplacian(x):
+    return [x[i - 1] - 2 * x[i] * x[i].sin() + x[i + 1].exp() for i in range(1, len(x) - 1)]
+
+def blocks(x):
+    # Two outputs per 3-input block, plus one constant output
+    out = []
+    for k in range(0, len(x), 3):
+        out += [x[k] * x[k + 1], x[k + 2].log() / x[k]]
+    return out + [1.0]
+
+def test_sparsity_detection():
+    rows, cols, shape = jacobian_sparsity(laplacian, 6)
+    assert shape == (4, 6)
+    assert list(zip(rows.tolist(), cols.tolist())) == [(i, i + k) for i in range(4) for k in range(3)]
+    rows, cols, shape = jacobian_sparsity(blocks, 6)
+    assert shape == (5, 6) and 4 not in rows.tolist()
+
+def test_colouring_is_structurally_orthogonal():
+    rows, cols, _ = jacobian_sparsity(laplacian, 200)
+    colors = color_columns(rows, cols, 200)
+    assert colors.max() + 1 == 3
+    for i in range(198):
+        assert len(set(colors[cols[rows == i]].tolist())) == len(cols[rows == i])
+
+@pytest.mark.parametrize("cls", [Dual, Dual_c])
+@pytest.mark.parametrize("func", [laplacian, blocks])
+def test_matches_dense_jacobian(cls, func):
+    xs = np.linspace(0.5, 2.0, 30)
+    values, jacobian = compute_sparse_jacobian(func, xs, dual_class=cls, return_values=True)
+    expected_values, expected = compute_jacobian(func, xs, return_values=True)
+    assert isinstance(jacobian, scipy.sparse.csr_matrix)
+    np.testing.assert_allclose(jacobian.toarray(), expected, rtol=1e-14)
+    np.testing.assert_allclose(values, expected_values)
+
+def test_formats_and_supplied_patterns():
+    xs = np.linspace(0.5, 2.0, 12)
+    expected = compute_jacobian(laplacian, xs)
+    rows, cols, data = compute_sparse_jacobian(laplacian, xs, format="coo")
+    assert np.all(np.diff(rows) >= 0)
+    np.testing.assert_allclose(scipy.sparse.coo_matrix((data, (rows, cols)), shape=expected.shape).toarray(), expected)
+    pattern = expected != 0
+    for sparsity in (pattern, scipy.sparse.csr_matrix(pattern), np.nonzero(pattern)):
+        jacobian = compute_sparse_jacobian(laplacian, xs, sparsity=sparsity, format="csc")
+        assert isinstance(jacobian, scipy.sparse.csc_matrix)
+        np.testing.assert_allclose(jacobian.toarray(), expected)
+    with pytest.raises(ValueError):
+        compute_sparse_jacobian(laplacian, xs, format="dense")
@@ -0,0 +1,67 @@
+import json
+import os
+import numpy as np
+import pytest
+from DualNum import compute_derivative_batch, compute_derivative_stream, iter_derivative_chunks
+
+def f(x):
+    return x.sin() * x.exp() + x * x
+
+@pytest.fixture
+def points(tmp_path):
+    xs = np.linspace(0.1, 3.0, 10_000).reshape(100, 100)
+    path = tmp_path / "points.npy"
+    np.save(path, xs)
+    return xs, path
+
+def test_stream_matches_batch(points, tmp_path):
+    xs, path = points
+    values, derivatives = compute_derivative_stream(f, path, tmp_path / "v.npy", tmp_path / "d.npy", chunk_size=999)
+    expected_values, expected_derivatives = compute_derivative_batch(f, xs, return_values=True)
+    np.testing.assert_allclose(values, expected_values)
+    np.testing.assert_allclose(np.load(tmp_path / "d.npy"), expected_derivatives)
+    assert isinstance(derivatives, np.memmap) and derivatives.shape == xs.shape
+    assert not os.path.exists(str(tmp_path / "d.npy") + ".progress.json")
+
+def test_chunk_size_follows_memory_budget(points):
+    xs, path = points
+    small = [len(d) for _, d in iter_derivative_chunks(f, path, memory_budget=2 ** 16)]
+    large = [len(d) for _, d in iter_derivative_chunks(f, path, memory_budget=2 ** 30)]
+    assert sum(small) == sum(large) == xs.size
+    # The first chunk is the probe; the rest are sized from the budget
+    assert len(small) > 2 and max(small[1:]) < 2 ** 16 // 16
+    assert len(large) == 2
+
+def test_resume_after_interruption(points, tmp_path):
+    xs, path = points
+    calls = []
+
+    def interrupted(done, total):
+        calls.append(done)
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        compute_derivative_stream(f, path, None, tmp_path / "d.npy", chunk_size=1000, progress=interrupted)
+    checkpoint = str(tmp_path / "d.npy") + ".progress.json"
+    with open(checkpoint) as fp:
+        assert json.load(fp) == {"done": 3000, "total": xs.size}
+
+    seen = []
+    _, derivatives = compute_derivative_stream(f, path, None, tmp_path / "d.npy", chunk_size=1000,
+                                               progress=lambda done, total: seen.append(done))
+    assert seen[0] == 4000 and seen[-1] == xs.size
+    np.testing.assert_allclose(derivatives, compute_derivative_batch(f, xs))
+
+def test_in_memory_outputs_and_validation():
+    xs = np.linspace(0.0, 1.0, 50)
+    out = np.empty(50)
+    values, derivatives = compute_derivative_stream(lambda x: x * x, xs, None, out, chunk_size=7)
+    assert values is None and derivatives is out
+    np.testing.assert_allclose(out, 2 * xs)
+    with pytest.raises(TypeError):
+        list(iter_derivative_chunks(f, xs.astype(np.float32)))
+    with pytest.raises(ValueError):
+        list(iter_derivative_chunks(f, np.ones((10, 10))[:, ::2]))
+    with pytest.raises(ValueError):
+        compute_derivative_stream(f, xs, None, np.empty(10))
@@ -0,0 +1,128 @@
+import pytest
+import numpy as np
+from DualNum import Dual, DualArray, Tape, TracingError, compute_jacobian, trace
+import math
+
+def f(x):
+    return (x.sin() * x.exp() + 2) / (1 + x * x) - x.log() * x.sqrt() + x.atan() ** x
+
+def test_trace_records_flat_tape():
+    tape = trace(lambda x: x.sin() * x + 1)
+    assert isinstance(tape, Tape)
+    assert tape.opcodes.dtype == np.uint8
+    assert tape.args.shape == (len(tape), 2)
+    assert len(tape) == 5
+    assert tape.listing().splitlines()[-1] == "return %4"
+
+def test_replay_matches_dual():
+    tape = trace(f)
+    xs = np.linspace(1.1, 4.0, 1000)
+    values, derivatives = tape.evaluate(xs)
+    for x, value, derivative in zip(xs[::97], values[::97], derivatives[::97]):
+        expected = f(Dual(float(x), 1.0))
+        assert value == pytest.approx(expected.real, rel=1e-12)
+        assert derivative == pytest.approx(expected.dual, rel=1e-12)
+
+    # The tape is reusable and keeps the batch shape
+    values, derivatives = tape.evaluate(xs.reshape(10, 100))
+    assert values.shape == derivatives.shape == (10, 100)
+
+def test_constant_operands_match_dual_array():
+    def g(x):
+        return x ** 2.5 + 3 ** x - 1 / x + (2 - x) * 4
+
+    xs = np.linspace(0.5, 2.0, 7)
+    values, derivatives = trace(g).evaluate(xs)
+    expected = g(DualArray(xs, 1.0))
+    np.testing.assert_allclose(values, expected.real, rtol=1e-12)
+    np.testing.assert_allclose(derivatives, expected.dual, rtol=1e-12)
+
+def test_constant_powers_of_negative_and_zero_inputs():
+    # A constant exponent uses the power rule, as Dual does, before and after optimisation
+    g = lambda x: x ** 2 + x ** 3 - x ** 0 + 2 * x ** 4.0
+    tape = trace(g)
+    xs = [-2.0, 0.0, 3.0]
+    expected = [g(Dual(x, 1.0)) for x in xs]
+    for t in (tape, tape.optimize()):
+        values, derivatives = t.evaluate(xs)
+        np.testing.assert_allclose(values, [e.real for e in expected], rtol=1e-12)
+        np.testing.assert_allclose(derivatives, [e.dual for e in expected], rtol=1e-12)
+    with pytest.raises(ValueError):
+        trace(lambda x: x ** 0.5).evaluate([-1.0, 1.0])
+
+def test_multi_input_and_output():
+    def g(x):
+        return [x[0] * x[1].sin(), x[0] + 1, 4.0]
+
+    tape = trace(g, n_inputs=2)
+    xs = [np.array([1.0, 2.0]), np.array([0.5, 0.25])]
+    values, derivatives = tape.evaluate(xs, seeds=[0.0, 1.0])
+    assert values.shape == (3, 2)
+    np.testing.assert_allclose(values[0], xs[0] * np.sin(xs[1]))
+    np.testing.assert_allclose(derivatives[0], xs[0] * np.cos(xs[1]))
+    np.testing.assert_allclose(derivatives[1], [0.0, 0.0])
+    np.testing.assert_allclose(values[2], [4.0, 4.0])
+
+    jacobian = compute_jacobian(g, [1.0, 0.5])
+    values, derivatives = tape.evaluate([1.0, 0.5], seeds=[1.0, 0.0])
+    np.testing.assert_allclose(derivatives, jacobian[:, 0])
+
+    with pytest.raises(ValueError):
+        tape.evaluate(xs)
+
+@pytest.mark.parametrize("branch", [
+    lambda x: x * 2 if x.real > 0 else x,
+    lambda x: x if x else -x,
+    lambda x: x * float(x),
+    lambda x: x if x > 1 else x,
+    lambda x: x if x == 1 else x,
+    lambda x: Dual(math.sin(x.get_real()), 0),
+])
+def test_data_dependent_branch_raises(branch):
+    with pytest.raises(TracingError):
+        trace(branch)
+
+def test_errors_propagate_on_replay():
+    tape = trace(lambda x: x.log())
+    with pytest.raises(ValueError):
+        tape.evaluate([1.0, -1.0])
+    with pytest.raises(TypeError):
+        trace(lambda x: "x")
+
+def test_optimize_merges_and_fuses():
+    g = lambda x: x.sin() * x.sin() + x.cos() + (x * x.sin()).exp() + (x.sin() * x).exp()
+    tape = trace(g)
+    optimized, stats = tape.optimize(return_stats=True)
+    assert stats["nodes_before"] == len(tape)
+    assert stats["nodes_after"] == len(optimized) < len(tape)
+    assert stats["merged"] == 5
+    assert stats["sincos_fused"] == 1
+    names = [line.split()[2] for line in optimized.listing().splitlines()[:-1]]
+    assert names.count("sincos") == 1 and "sin" not in names and "cos" not in names
+
+    xs = np.linspace(0.1, 3.0, 50)
+    for result, expected in zip(optimized.evaluate(xs), tape.evaluate(xs)):
+        np.testing.assert_allclose(result, expected, rtol=1e-14)
+    assert optimized.evaluate(0.7) == pytest.approx(tape.evaluate(0.7), rel=1e-14)
+
+def test_optimize_folds_constants_and_drops_dead_nodes():
+    # %2 = 2 + 3 is a constant subtree, %3 and %4 never reach the output
+    tape = Tape([1, 1, 2, 0, 10, 4, 7], [(0, -1), (1, -1), (0, 1), (0, -1), (3, -1), (2, 3), (5, -1)], [2.0, 3.0], [6], 1)
+    optimized, stats = tape.optimize(return_stats=True)
+    assert stats["folded"] == 1
+    assert stats["dead"] == 3
+    assert optimized.listing().splitlines()[0] == "%0 = const 5.0"
+    xs = np.linspace(0.1, 1.0, 10)
+    np.testing.assert_allclose(optimized.evaluate(xs), tape.evaluate(xs))
+
+    # Constants that fail to fold are kept so the error surfaces on replay
+    tape = Tape([1, 11], [(0, -1), (0, -1)], [-1.0], [1], 1)
+    assert len(tape.optimize()) == 2
+    with pytest.raises(ValueError):
+        tape.optimize().evaluate([1.0])
+
+def test_optimize_multi_output():
+    tape = trace(lambda xs: [xs[0] * xs[1], xs[1] * xs[0], xs[0].cos()], n_inputs=2)
+    optimized = tape.optimize()
+    assert len(optimized) == 4
+    np.testing.assert_allclose(optimized.evaluate([1.0, 2.0], [1.0, 0.0]), tape.evaluate([1.0, 2.0], [1.0, 0.0]))
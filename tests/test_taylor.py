@@ -0,0 +1,121 @@
+import pytest
+import numpy as np
+from DualNum import Dual, Taylor, TaylorArray, compute_derivative, compute_derivatives
+import math
+
+ORDER = 6
+
+def test_init():
+    t = Taylor([2.0, 1.0, 0.5])
+    assert t.order == 2
+    assert t.real == 2.0
+    assert t.dual == 1.0
+
+    with pytest.raises(ValueError):
+        Taylor([])
+
+    # Order 0 carries the value only
+    assert Taylor([2.0]).real == 2.0
+    with pytest.raises(ValueError):
+        Taylor([2.0]).dual
+    with pytest.raises(ValueError):
+        TaylorArray.variable([0.0, 1.0], order=0).dual
+
+@pytest.mark.parametrize("name, expected", [
+    ("exp", [1, 1, 1, 1, 1, 1, 1]),
+    ("sin", [0, 1, 0, -1, 0, 1, 0]),
+    ("cos", [1, 0, -1, 0, 1, 0, -1]),
+    ("sinh", [0, 1, 0, 1, 0, 1, 0]),
+    ("cosh", [1, 0, 1, 0, 1, 0, 1]),
+    ("tan", [0, 1, 0, 2, 0, 16, 0]),
+    ("tanh", [0, 1, 0, -2, 0, 16, 0]),
+    ("atan", [0, 1, 0, -2, 0, 24, 0]),
+    ("asin", [0, 1, 0, 1, 0, 9, 0]),
+    ("acos", [math.pi / 2, -1, 0, -1, 0, -9, 0]),
+])
+def test_series_at_zero(name, expected):
+    result = getattr(Taylor.variable(0.0, ORDER), name)()
+    np.testing.assert_allclose(result.derivatives(), expected, atol=1e-12)
+
+def test_log_and_power_derivatives():
+    x = 1.7
+    derivatives = compute_derivatives(lambda t: t.log(), x, order=ORDER)
+    expected = [math.log(x)] + [(-1) ** (k - 1) * math.factorial(k - 1) / x ** k for k in range(1, ORDER + 1)]
+    np.testing.assert_allclose(derivatives, expected, rtol=1e-12)
+
+    r = 2.5
+    derivatives = compute_derivatives(lambda t: t ** r, x, order=ORDER)
+    expected = [math.prod(r - i for i in range(k)) * x ** (r - k) for k in range(ORDER + 1)]
+    np.testing.assert_allclose(derivatives, expected, rtol=1e-12)
+
+    derivatives = compute_derivatives(lambda t: t.sqrt(), x, order=ORDER)
+    expected = [math.prod(0.5 - i for i in range(k)) * x ** (0.5 - k) for k in range(ORDER + 1)]
+    np.testing.assert_allclose(derivatives, expected, rtol=1e-12)
+
+    # Integer powers are exact at zero, where the general recurrence would divide by zero
+    np.testing.assert_allclose(compute_derivatives(lambda t: t ** 3, 0.0, order=4), [0, 0, 0, 6, 0])
+
+@pytest.mark.parametrize("f, g", [
+    (lambda t: t.log().exp(), lambda t: t),
+    (lambda t: t.sin() * t.sin() + t.cos() * t.cos(), lambda t: 1 + 0 * t),
+    (lambda t: t.tan(), lambda t: t.sin() / t.cos()),
+    (lambda t: t.tanh(), lambda t: t.sinh() / t.cosh()),
+    (lambda t: t.sqrt() * t.sqrt(), lambda t: t),
+    (lambda t: (t * 0.3).asin().sin(), lambda t: t * 0.3),
+    (lambda t: (t * 0.3).acos().cos(), lambda t: t * 0.3),
+    (lambda t: t.tan().atan(), lambda t: t),
+    (lambda t: t ** Taylor.variable(0.7, ORDER), lambda t: (t.log() * Taylor.variable(0.7, ORDER)).exp()),
+    (lambda t: 2 ** t, lambda t: (t * math.log(2)).exp()),
+    (lambda t: 3 / t - 1, lambda t: (3 - t) / t),
+])
+def test_identities(f, g):
+    t = Taylor.variable(1.1, ORDER)
+    np.testing.assert_allclose(f(t).coeffs, g(t).coeffs, rtol=1e-10, atol=1e-12)
+
+def test_first_derivative_matches_dual():
+    def f(x):
+        return (x.sin() * x.exp()).log() / (x * x + 1)
+
+    derivatives = compute_derivatives(f, 1.3, order=3)
+    assert derivatives[1] == pytest.approx(compute_derivative(f, 1.3, Dual), rel=1e-12)
+
+def test_errors():
+    with pytest.raises(ValueError):
+        Taylor.variable(0.0, 3).log()
+    with pytest.raises(ZeroDivisionError):
+        Taylor.variable(1.0, 3) / 0
+    with pytest.raises(ValueError):
+        Taylor.variable(1.0, 3) + Taylor.variable(1.0, 2)
+    with pytest.raises(TypeError):
+        Taylor.variable(1.0, 3) + "5"
+
+def test_domain_errors_match_dual():
+    for f in (lambda t: t.sqrt(), lambda t: t ** 0.5, lambda t: (-2.0) ** t):
+        with pytest.raises(ValueError):
+            f(Taylor.variable(-1.0, 3))
+        with pytest.raises(ValueError):
+            f(TaylorArray.variable([1.0, -1.0], 3))
+    for f in (lambda t: t.sqrt(), lambda t: t ** 0.5, lambda t: t ** -1, lambda t: t ** 2.5):
+        with pytest.raises(ZeroDivisionError):
+            f(Taylor.variable(0.0, 3))
+        with pytest.raises(ZeroDivisionError):
+            f(TaylorArray.variable([1.0, 0.0], 3))
+
+    # Integer powers of negative numbers, and powers above the order at zero, are defined
+    np.testing.assert_allclose((Taylor.variable(-2.0, 3) ** 3.0).coeffs, [-8, 12, -6, 1])
+    np.testing.assert_allclose((TaylorArray.variable([0.0, 4.0], 2) ** 3.5).coeffs[:, 0], [0, 0, 0])
+
+def test_taylor_array_matches_scalar():
+    def f(x):
+        return (x * x).sin() / x.exp() + x ** 3 + 2 * x.atan()
+
+    xs = np.array([[0.2, 0.9], [1.4, 2.3]])
+    batched = compute_derivatives(f, xs, order=ORDER)
+    assert batched.shape == (ORDER + 1, 2, 2)
+    for index in np.ndindex(xs.shape):
+        np.testing.assert_allclose(batched[(slice(None),) + index], compute_derivatives(f, xs[index], order=ORDER), rtol=1e-12)
+
+def test_taylor_array_constants():
+    x = TaylorArray.variable([1.0, 2.0], order=2)
+    result = np.array([3.0, 4.0]) * x + 1
+    np.testing.assert_allclose(result.derivatives(), [[4.0, 9.0], [3.0, 4.0], [0.0, 0.0]])
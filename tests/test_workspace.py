@@ -0,0 +1,139 @@
+import pytest
+import numpy as np
+from DualNum import DualArray, Workspace, compute_derivative_batch, find_roots
+
+FUNCTIONS = ["sin", "cos", "tan", "exp", "log", "sqrt", "sinh", "cosh", "tanh", "asin", "acos", "atan"]
+
+def sample():
+    return DualArray(np.linspace(0.1, 0.9, 7), np.linspace(-1.0, 2.0, 7))
+
+@pytest.mark.parametrize("name", FUNCTIONS)
+def test_out_matches_new_result(name):
+    x = sample()
+    expected = getattr(x, name)()
+
+    out = DualArray(np.empty(7), np.empty(7))
+    assert getattr(x, name)(out=out) is out
+    np.testing.assert_array_equal(out.real, expected.real)
+    np.testing.assert_array_equal(out.dual, expected.dual)
+
+    # In place, and through the NumPy ufunc
+    assert getattr(x, name)(out=x) is x
+    np.testing.assert_array_equal(x.real, expected.real)
+    np.testing.assert_array_equal(x.dual, expected.dual)
+    ufunc = {"asin": np.arcsin, "acos": np.arccos, "atan": np.arctan}.get(name, getattr(np, name, None))
+    y = sample()
+    assert ufunc(y, out=(y,)) is y
+    np.testing.assert_array_equal(y.dual, expected.dual)
+
+def test_out_validation():
+    x = sample()
+    with pytest.raises(ValueError):
+        x.sin(out=DualArray(np.zeros(3)))
+    with pytest.raises(ValueError):
+        x.sin(out=DualArray._from_parts(x.real[::-1], np.empty(7)))
+    with pytest.raises(ValueError):
+        x.sin(out=np.empty(7))
+
+@pytest.mark.parametrize("op, iop", [("__add__", "__iadd__"), ("__sub__", "__isub__"),
+                                     ("__mul__", "__imul__"), ("__truediv__", "__itruediv__")])
+def test_in_place_operators(op, iop):
+    for other in (DualArray(np.linspace(1.0, 2.0, 7), 0.5), DualArray(np.linspace(1.0, 2.0, 7))[3],
+                  2.5, np.linspace(1.0, 2.0, 7)):
+        x = sample()
+        expected = getattr(x, op)(other)
+        real = x.real
+        result = getattr(x, iop)(other)
+        assert result is x and x.real is real
+        np.testing.assert_allclose(x.real, expected.real, rtol=1e-15)
+        np.testing.assert_allclose(x.dual, expected.dual, rtol=1e-15)
+
+    # Aliased operands
+    x = sample()
+    expected = x * x
+    x *= x
+    np.testing.assert_allclose(x.dual, expected.dual, rtol=1e-15)
+
+    with pytest.raises(ValueError):
+        getattr(sample(), iop)(DualArray(np.ones((2, 7))))
+    with pytest.raises(ZeroDivisionError):
+        x /= 0.0
+
+def test_workspace_reaches_zero_allocations():
+    state = DualArray(np.linspace(0.1, 0.9, 100), 1.0)
+    expected = DualArray(state.real.copy(), state.dual.copy())
+    workspace = Workspace()
+    for step in range(5):
+        with workspace:
+            state += (state.sin() * state.exp() + 2) / (1 + state * state) * 0.01
+        expected = expected + (expected.sin() * expected.exp() + 2) / (1 + expected * expected) * 0.01
+        if step == 0:
+            first = workspace.allocations
+    assert first > 0 and workspace.allocations == first
+    assert workspace.requests == 5 * first and workspace.nbytes == first * 100 * 8
+    np.testing.assert_array_equal(state.real, expected.real)
+    np.testing.assert_array_equal(state.dual, expected.dual)
+
+    # Results are overwritten by the next entry
+    with workspace:
+        a = state.sin()
+    with workspace:
+        state.cos()
+    np.testing.assert_array_equal(a.real, np.cos(state.real))
+
+    # Reading a result of an earlier entry raises instead of using overwritten buffers
+    with workspace:
+        a = state * 3
+    b = a + 1
+    with workspace:
+        state.sin()
+        for read in (lambda: a / state, lambda: state / a, lambda: a.exp(), lambda: state.sin(out=a), lambda: a[1:]):
+            with pytest.raises(RuntimeError):
+                read()
+        with pytest.raises(RuntimeError):
+            a += 1
+    np.testing.assert_array_equal(b.real, state.real * 3 + 1)
+
+    # Larger arrays grow the buffers; smaller ones reuse them
+    with workspace:
+        DualArray(np.ones(1000)).exp()
+    assert workspace.allocations == first + 2
+    with workspace:
+        DualArray(np.ones(10)).exp()
+    assert workspace.allocations == first + 2
+
+def test_workspace_nesting():
+    outer, inner = Workspace(), Workspace()
+    x = sample()
+    with outer:
+        with pytest.raises(RuntimeError):
+            outer.__enter__()
+        with inner:
+            x.exp()
+        x.exp()
+        with pytest.raises(RuntimeError):
+            outer.reset()
+    x.exp()
+    assert inner.allocations == 2 and outer.allocations == 2
+    outer.reset()
+    assert outer.allocations == 0 and outer.nbytes == 0
+
+def test_seeds_are_read_only():
+    xs = np.linspace(1.0, 2.0, 5)
+
+    def f(x):
+        x *= 2
+        return x * x
+
+    # The in-place update is rejected on the seed and the points are evaluated one by one
+    derivatives, backend = compute_derivative_batch(f, xs, return_backend=True)
+    assert backend != "vectorized"
+    np.testing.assert_allclose(derivatives, 8 * xs)
+    np.testing.assert_array_equal(xs, np.linspace(1.0, 2.0, 5))
+
+    # The identity returns the seed's values, which stay writeable for the caller
+    values, _ = compute_derivative_batch(lambda x: x, xs, return_values=True)
+    assert values.flags.writeable
+
+    result = find_roots(lambda x: x * x - 2.0, np.full(3, 1.0))
+    np.testing.assert_allclose(result.roots, np.sqrt(2.0))